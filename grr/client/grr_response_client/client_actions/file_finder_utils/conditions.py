@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import abc
 import collections
+import heapq
 
 
 from future.utils import with_metaclass
@@ -151,11 +152,15 @@ class ContentCondition(with_metaclass(abc.ABCMeta, object)):
     pass
 
   @staticmethod
-  def Parse(conditions):
+  def Parse(conditions, combine_literals=True):
     """Parses the file finder condition types into the condition objects.
 
+    Literal conditions that search the same range of the file are combined into
+    a single `MultiLiteralMatchCondition` so that the file is read only once.
+
     Args:
       conditions: An iterator over `FileFinderCondition` objects.
+      combine_literals: Whether literal conditions should be combined.
 
     Yields:
       `ContentCondition` objects that correspond to the file-finder conditions.
@@ -166,7 +171,23 @@ class ContentCondition(with_metaclass(abc.ABCMeta, object)):
         kind.CONTENTS_REGEX_MATCH: RegexMatchCondition,
     }
 
+    conditions = list(conditions)
+
+    groups = collections.OrderedDict()
+    if combine_literals:
+      for condition in conditions:
+        key = _LiteralGroupKey(condition)
+        if key is not None:
+          groups.setdefault(key, []).append(condition)
+
     for condition in conditions:
+      group = groups.get(_LiteralGroupKey(condition))
+      if group is not None and len(group) > 1:
+        # The whole group is yielded in place of its first member.
+        if group[0] is condition:
+          yield MultiLiteralMatchCondition(group)
+        continue
+
       try:
         yield classes[condition.condition_type](condition)
       except KeyError:
@@ -190,21 +211,39 @@ class ContentCondition(with_metaclass(abc.ABCMeta, object)):
 
     offset = self.params.start_offset
     amount = self.params.length
-    for chunk in streamer.StreamFilePath(path, offset=offset, amount=amount):
+    chunks = streamer.StreamFilePath(
+        path, offset=offset, amount=amount, reuse_buffer=True)
+    for chunk in chunks:
       for span in chunk.Scan(matcher):
-        ctx_begin = max(span.begin - self.params.bytes_before, 0)
-        ctx_end = min(span.end + self.params.bytes_after, len(chunk.data))
-        ctx_data = chunk.data[ctx_begin:ctx_end]
-
-        yield rdf_client.BufferReference(
-            offset=chunk.offset + ctx_begin,
-            length=len(ctx_data),
-            data=ctx_data)
+        yield _BufferReference(chunk, span, self.params)
 
         if self.params.mode == self.params.Mode.FIRST_HIT:
           return
 
 
+def _BufferReference(chunk, span, params):
+  """Creates a buffer reference to a match together with its context."""
+  ctx_begin = max(span.begin - params.bytes_before, 0)
+  ctx_end = min(span.end + params.bytes_after, len(chunk.data))
+  ctx_data = bytes(chunk.data[ctx_begin:ctx_end])
+
+  return rdf_client.BufferReference(
+      offset=chunk.offset + ctx_begin, length=len(ctx_data), data=ctx_data)
+
+
+def _LiteralGroupKey(condition):
+  """Returns a key grouping literal conditions that can be searched together."""
+  kind = rdf_file_finder.FileFinderCondition.Type
+  if condition.condition_type != kind.CONTENTS_LITERAL_MATCH:
+    return None
+
+  params = condition.contents_literal_match
+  if not params.literal:
+    return None
+
+  return (params.start_offset, params.length)
+
+
 class LiteralMatchCondition(ContentCondition):
   """A content condition that lookups a literal pattern."""
 
@@ -218,6 +257,98 @@ class LiteralMatchCondition(ContentCondition):
       yield match
 
 
+class MultiLiteralMatchCondition(ContentCondition):
+  """A content condition that lookups many literal patterns in a single pass.
+
+  The condition is met only if every one of the combined literal conditions is
+  met, in which case hits are reported in the order of the conditions.
+
+  Args:
+    conditions: A list of `FileFinderCondition` objects with literal matches
+      that have the same start offset and length.
+  """
+
+  def __init__(self, conditions):
+    super(MultiLiteralMatchCondition, self).__init__()
+    self.conditions = [
+        LiteralMatchCondition(condition) for condition in conditions
+    ]
+    # The searched range is the same for all the conditions.
+    self.params = self.conditions[0].params
+
+    literals = []
+    self.indices = []
+    for index, condition in enumerate(self.conditions):
+      literal = utils.SmartStr(condition.params.literal)
+      if literal in literals:
+        self.indices[literals.index(literal)].append(index)
+      else:
+        literals.append(literal)
+        self.indices.append([index])
+
+    self.matcher = MultiLiteralMatcher(literals)
+
+  def Search(self, path):
+    results = self.SearchByCondition(path)
+    if not all(results):
+      return
+
+    for matches in results:
+      for match in matches:
+        yield match
+
+  def SearchByCondition(self, path):
+    """Searches specified file for all the literals at once.
+
+    Args:
+      path: A path to the file that is going to be searched.
+
+    Returns:
+      A list with a list of `BufferReference` objects for every condition.
+    """
+    results = [[] for _ in self.conditions]
+    pending = set(range(len(self.conditions)))
+
+    streamer = streaming.Streamer(
+        chunk_size=self.CHUNK_SIZE, overlap_size=self.OVERLAP_SIZE)
+
+    offset = self.params.start_offset
+    amount = self.params.length
+    chunks = streamer.StreamFilePath(
+        path, offset=offset, amount=amount, reuse_buffer=True)
+    for chunk in chunks:
+      for index, span in self._ScanChunk(chunk):
+        for condition_index in self.indices[index]:
+          if condition_index not in pending:
+            continue
+
+          params = self.conditions[condition_index].params
+          results[condition_index].append(_BufferReference(chunk, span, params))
+
+          if params.mode == params.Mode.FIRST_HIT:
+            pending.remove(condition_index)
+
+        if not pending:
+          return results
+
+    return results
+
+  def _ScanChunk(self, chunk):
+    """Yields spans of all literals within the chunk.
+
+    For every literal, the hits are exactly the ones `Chunk.Scan` yields for a
+    `LiteralMatcher` of that literal.
+
+    Args:
+      chunk: A `streaming.Chunk` to search.
+
+    Yields:
+      Tuples with the literal index and a `Matcher.Span` object.
+    """
+    for index, begin, end in self.matcher.Scan(chunk.data, chunk.overlap):
+      yield index, Matcher.Span(begin=begin, end=end)
+
+
 class RegexMatchCondition(ContentCondition):
   """A content condition that lookups regular expressions."""
 
@@ -241,7 +372,7 @@ class Matcher(with_metaclass(abc.ABCMeta, object)):
     """Matches the given data object starting at specified position.
 
     Args:
-      data: A byte string to pattern match on.
+      data: A byte string or `bytearray` to pattern match on.
       position: First position at which the search is started on.
 
     Returns:
@@ -265,12 +396,12 @@ class RegexMatcher(Matcher):
     self.regex = regex
 
   def Match(self, data, position):
-    match = self.regex.Search(data[position:])
+    match = self.regex.Search(data, position)
     if not match:
       return None
 
     begin, end = match.span()
-    return Matcher.Span(begin=position + begin, end=position + end)
+    return Matcher.Span(begin=begin, end=end)
 
 
 class LiteralMatcher(Matcher):
@@ -290,3 +421,69 @@ class LiteralMatcher(Matcher):
       return None
 
     return Matcher.Span(begin=offset, end=offset + len(self.literal))
+
+
+class MultiLiteralMatcher(object):
+  """A matcher looking up many byte strings in a single pass over the data.
+
+  Every literal is searched with `find`, so the data is scanned in C, and the
+  occurrences of all the literals are merged in the order of their positions.
+
+  Args:
+    literals: A list of non-empty byte string patterns.
+  """
+
+  def __init__(self, literals):
+    super(MultiLiteralMatcher, self).__init__()
+    self.literals = list(literals)
+
+    for literal in self.literals:
+      if not literal:
+        raise ValueError("literal must not be empty")
+
+  def Scan(self, data, overlap=0):
+    """Yields occurrences of the literals in the given data.
+
+    For every literal, the occurrences are exactly the ones `Chunk.Scan` yields
+    for a `LiteralMatcher` of that literal: occurrences of the same literal do
+    not overlap and the ones lying completely within the first `overlap` bytes
+    are skipped.
+
+    Args:
+      data: A byte string or `bytearray` to search.
+      overlap: A number of leading bytes that were searched already.
+
+    Yields:
+      Tuples with the literal index, the beginning and the end of occurrence,
+      ordered by the beginning of occurrence.
+    """
+    heap = []
+    for index, literal in enumerate(self.literals):
+      begin = _FindLiteral(data, literal, 0, overlap)
+      if begin is not None:
+        heap.append((begin, index))
+    heapq.heapify(heap)
+
+    while heap:
+      begin, index = heap[0]
+      end = begin + len(self.literals[index])
+      yield index, begin, end
+
+      begin = _FindLiteral(data, self.literals[index], end, overlap)
+      if begin is None:
+        heapq.heappop(heap)
+      else:
+        heapq.heapreplace(heap, (begin, index))
+
+
+def _FindLiteral(data, literal, position, overlap):
+  """Finds the first occurrence of the literal not within the overlap."""
+  while True:
+    begin = data.find(literal, position)
+    if begin == -1:
+      return None
+
+    if begin + len(literal) > overlap:
+      return begin
+
+    position = begin + 1
@@ -8,6 +8,7 @@ import subprocess
 import unittest
 
 from absl.testing import absltest
+from grr_response_client import streaming
 from grr_response_client.client_actions.file_finder_utils import conditions
 from grr_response_core.lib import flags
 from grr_response_core.lib import rdfvalue
@@ -109,6 +110,45 @@ class LiteralMatcherTest(absltest.TestCase):
     self.assertFalse(span)
 
 
+class MultiLiteralMatcherTest(absltest.TestCase):
+
+  def testMatchAll(self):
+    matcher = conditions.MultiLiteralMatcher([b"he", b"she", b"his", b"hers"])
+    matches = list(matcher.Scan(b"ushers"))
+    self.assertEqual(matches, [(1, 1, 4), (0, 2, 4), (3, 2, 6)])
+
+  def testOccurrencesOfOneLiteralDoNotOverlap(self):
+    matcher = conditions.MultiLiteralMatcher([b"aa"])
+    matches = list(matcher.Scan(bytearray(b"aaaaa")))
+    self.assertEqual(matches, [(0, 0, 2), (0, 2, 4)])
+
+  def testOccurrencesWithinOverlapAreSkipped(self):
+    matcher = conditions.MultiLiteralMatcher([b"foo", b"ofo"])
+    matches = list(matcher.Scan(b"foofoofoo", overlap=4))
+    self.assertEqual(matches, [(1, 2, 5), (0, 3, 6), (1, 5, 8), (0, 6, 9)])
+
+  def testMatchesLiteralMatcher(self):
+    data = b"abcabcab" * 100
+    literals = [b"abca", b"bcab", b"cab", b"xyz"]
+    matcher = conditions.MultiLiteralMatcher(literals)
+    matches = list(matcher.Scan(data, overlap=10))
+
+    for index, literal in enumerate(literals):
+      chunk = streaming.Chunk(offset=0, data=data, overlap=10)
+      expected = [(span.begin, span.end)
+                  for span in chunk.Scan(conditions.LiteralMatcher(literal))]
+      spans = [(begin, end) for i, begin, end in matches if i == index]
+      self.assertEqual(spans, expected)
+
+  def testNoMatch(self):
+    matcher = conditions.MultiLiteralMatcher([b"foo", b"bar"])
+    self.assertEqual(list(matcher.Scan(b"quux norf")), [])
+
+  def testEmptyLiteral(self):
+    with self.assertRaises(ValueError):
+      conditions.MultiLiteralMatcher([b"foo", b""])
+
+
 class ConditionTestMixin(object):
 
   def setUp(self):
@@ -467,6 +507,91 @@ class LiteralMatchConditionTest(ConditionTestMixin, absltest.TestCase):
     self.assertEqual(results[1].length, 3)
 
 
+class MultiLiteralMatchConditionTest(ConditionTestMixin, absltest.TestCase):
+
+  @staticmethod
+  def _Params(literal, mode="ALL_HITS", **kwargs):
+    params = rdf_file_finder.FileFinderCondition(
+        condition_type="CONTENTS_LITERAL_MATCH")
+    params.contents_literal_match.literal = literal
+    params.contents_literal_match.mode = mode
+    for name, value in kwargs.items():
+      setattr(params.contents_literal_match, name, value)
+    return params
+
+  def testHitsAreAttributedToConditions(self):
+    with open(self.temp_filepath, "wb") as fd:
+      fd.write("foo bar foo baz")
+
+    condition = conditions.MultiLiteralMatchCondition(
+        [self._Params(b"foo"), self._Params(b"baz", bytes_before=2)])
+
+    results = condition.SearchByCondition(self.temp_filepath)
+    self.assertEqual(len(results), 2)
+    self.assertEqual([_.offset for _ in results[0]], [0, 8])
+    self.assertEqual([_.data for _ in results[0]], ["foo", "foo"])
+    self.assertEqual(len(results[1]), 1)
+    self.assertEqual(results[1][0].data, "o baz")
+    self.assertEqual(results[1][0].offset, 10)
+
+  def testSameResultsAsSeparateConditions(self):
+    with open(self.temp_filepath, "wb") as fd:
+      fd.write("oooooooo xoxo oox")
+
+    params = [
+        self._Params(b"ooo", start_offset=1),
+        self._Params(b"ox", mode="FIRST_HIT", start_offset=1),
+        self._Params(b"ooo", bytes_after=1, start_offset=1),
+    ]
+    condition = conditions.MultiLiteralMatchCondition(params)
+
+    results = list(condition.Search(self.temp_filepath))
+
+    expected = []
+    for param in params:
+      literal_condition = conditions.LiteralMatchCondition(param)
+      expected.extend(literal_condition.Search(self.temp_filepath))
+    self.assertEqual(results, expected)
+
+  def testAllConditionsMustMatch(self):
+    with open(self.temp_filepath, "wb") as fd:
+      fd.write("foo bar")
+
+    condition = conditions.MultiLiteralMatchCondition(
+        [self._Params(b"foo"), self._Params(b"baz")])
+
+    self.assertFalse(list(condition.Search(self.temp_filepath)))
+
+  def testParseCombinesLiterals(self):
+    regex = rdf_file_finder.FileFinderCondition(
+        condition_type="CONTENTS_REGEX_MATCH")
+    regex.contents_regex_match.regex = b"f.o"
+
+    parsed = list(
+        conditions.ContentCondition.Parse([
+            self._Params(b"foo"),
+            regex,
+            self._Params(b"bar"),
+            self._Params(b"baz", start_offset=10),
+        ]))
+
+    self.assertEqual(len(parsed), 3)
+    self.assertIsInstance(parsed[0], conditions.MultiLiteralMatchCondition)
+    self.assertEqual(len(parsed[0].conditions), 2)
+    self.assertIsInstance(parsed[1], conditions.RegexMatchCondition)
+    self.assertIsInstance(parsed[2], conditions.LiteralMatchCondition)
+
+  def testParseWithoutCombining(self):
+    parsed = list(
+        conditions.ContentCondition.Parse(
+            [self._Params(b"foo"), self._Params(b"bar")],
+            combine_literals=False))
+
+    self.assertEqual(len(parsed), 2)
+    self.assertIsInstance(parsed[0], conditions.LiteralMatchCondition)
+    self.assertIsInstance(parsed[1], conditions.LiteralMatchCondition)
+
+
 class RegexMatchCondition(ConditionTestMixin, absltest.TestCase):
 
   def testNoHits(self):
@@ -138,6 +138,9 @@ class DownloadAction(Action):
     chunk_size = self.opts.chunk_size
 
     uploader = uploading.TransferStoreUploader(self.flow, chunk_size=chunk_size)
+    if self.opts.dedup_chunks:
+      # The server requests the chunks it does not have yet separately.
+      return uploader.HashFilePath(filepath, amount=max_size)
     return uploader.UploadFilePath(filepath, amount=max_size)
 
 
@@ -58,6 +58,32 @@ class TransferStoreUploader(object):
     return rdf_client_fs.BlobImageDescriptor(
         chunks=chunks, chunk_size=self._streamer.chunk_size)
 
+  def HashFilePath(self, filepath, offset=0, amount=None):
+    """Describes chunks of a file on a given path without uploading them.
+
+    The server checks which of the chunks it already has and only asks the
+    client to upload the missing ones.
+
+    Args:
+      filepath: A path to the file to describe.
+      offset: An integer offset at which the file description should start on.
+      amount: An upper bound on number of bytes to stream. If it is `None` then
+          the whole file is described.
+
+    Returns:
+      A `BlobImageDescriptor` object.
+    """
+    chunk_stream = self._streamer.StreamFilePath(
+        filepath, offset=offset, amount=amount)
+
+    chunks = []
+    for chunk in chunk_stream:
+      self._action.Progress()
+      chunks.append(_ChunkDescriptor(chunk))
+
+    return rdf_client_fs.BlobImageDescriptor(
+        chunks=chunks, chunk_size=self._streamer.chunk_size)
+
   def UploadChunk(self, chunk):
     """Uploads a single chunk to the transfer store flow.
 
@@ -72,10 +98,14 @@ class TransferStoreUploader(object):
     self._action.ChargeBytesToSession(len(chunk.data))
     self._action.SendReply(blob, session_id=self._TRANSFER_STORE_SESSION_ID)
 
-    return rdf_client_fs.BlobImageChunkDescriptor(
-        digest=hashlib.sha256(chunk.data).digest(),
-        offset=chunk.offset,
-        length=len(chunk.data))
+    return _ChunkDescriptor(chunk)
+
+
+def _ChunkDescriptor(chunk):
+  return rdf_client_fs.BlobImageChunkDescriptor(
+      digest=hashlib.sha256(chunk.data).digest(),
+      offset=chunk.offset,
+      length=len(chunk.data))
 
 
 def _CompressedDataBlob(chunk):
@@ -80,7 +80,9 @@ class YaraProcessScan(actions.ActionPlugin):
 
       time_left = deadline - rdfvalue.RDFDatetime.Now()
 
-      for m in rules.match(data=chunk.data, timeout=int(time_left)):
+      # Yara only accepts immutable strings.
+      data = bytes(chunk.data)
+      for m in rules.match(data=data, timeout=int(time_left)):
         # Note that for regexps in general it might be possible to
         # specify characters at the end of the string that are not
         # part of the returned match. In that case, this algorithm
@@ -112,7 +114,8 @@ class YaraProcessScan(actions.ActionPlugin):
 
       try:
         for start, length in client_utils.MemoryRegions(process, args):
-          chunks = streamer.StreamMemory(process, offset=start, amount=length)
+          chunks = streamer.StreamMemory(
+              process, offset=start, amount=length, reuse_buffer=True)
           for m in self._ScanRegion(rules, chunks, deadline):
             matches.append(m)
             if (args.max_results_per_process > 0 and
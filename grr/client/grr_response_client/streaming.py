@@ -7,6 +7,8 @@ import abc
 import os
 from future.utils import with_metaclass
 
+from grr_response_core.lib import utils
+
 
 class Streamer(object):
   """An utility class for buffered processing.
@@ -30,55 +32,63 @@ class Streamer(object):
     self.chunk_size = chunk_size
     self.overlap_size = overlap_size
 
-  def StreamFile(self, filedesc, offset=0, amount=None):
+  def StreamFile(self, filedesc, offset=0, amount=None, reuse_buffer=False):
     """Streams chunks of a given file starting at given offset.
 
     Args:
       filedesc: A `file` object to stream.
       offset: An integer offset at which the file stream should start on.
       amount: An upper bound on number of bytes to read.
+      reuse_buffer: See `Stream`.
 
     Returns:
       Generator over `Chunk` instances.
     """
     reader = FileReader(filedesc, offset=offset)
-    return self.Stream(reader, amount=amount)
+    return self.Stream(reader, amount=amount, reuse_buffer=reuse_buffer)
 
-  def StreamFilePath(self, filepath, offset=0, amount=None):
+  def StreamFilePath(self, filepath, offset=0, amount=None, reuse_buffer=False):
     """Streams chunks of a file located at given path starting at given offset.
 
     Args:
       filepath: A path to the file to stream.
       offset: An integer offset at which the file stream should start on.
       amount: An upper bound on number of bytes to read.
+      reuse_buffer: See `Stream`.
 
     Yields:
       `Chunk` instances.
     """
     with open(filepath, "rb") as filedesc:
-      for chunk in self.StreamFile(filedesc, offset=offset, amount=amount):
+      for chunk in self.StreamFile(
+          filedesc, offset=offset, amount=amount, reuse_buffer=reuse_buffer):
         yield chunk
 
-  def StreamMemory(self, process, offset=0, amount=None):
+  def StreamMemory(self, process, offset=0, amount=None, reuse_buffer=False):
     """Streams chunks of memory of a given process starting at given offset.
 
     Args:
       process: A platform-specific `Process` instance.
       offset: An integer offset at which the memory stream should start on.
       amount: An upper bound on number of bytes to read.
+      reuse_buffer: See `Stream`.
 
     Returns:
       Generator over `Chunk` instances.
     """
     reader = MemoryReader(process, offset=offset)
-    return self.Stream(reader, amount=amount)
+    return self.Stream(reader, amount=amount, reuse_buffer=reuse_buffer)
 
-  def Stream(self, reader, amount=None):
+  def Stream(self, reader, amount=None, reuse_buffer=False):
     """Streams chunks of a given file starting at given offset.
 
     Args:
       reader: A `Reader` instance.
       amount: An upper bound on number of bytes to read.
+      reuse_buffer: If set, all chunks share a single `bytearray` that the
+        reader reads into directly, and only the overlap is copied between
+        chunks. The data of a chunk is only valid until the next chunk is
+        requested.
 
     Yields:
       `Chunk` instances.
@@ -86,6 +96,11 @@ class Streamer(object):
     if amount is None:
       amount = float("inf")
 
+    if reuse_buffer:
+      for chunk in self._StreamIntoBuffer(reader, amount):
+        yield chunk
+      return
+
     data = reader.Read(min(self.chunk_size, amount))
     if not data:
       return
@@ -108,6 +123,39 @@ class Streamer(object):
       offset = reader.offset - len(data)
       yield Chunk(offset=offset, data=data, overlap=len(overlap))
 
+  def _StreamIntoBuffer(self, reader, amount):
+    """Streams chunks whose data is a single, reused `bytearray`."""
+    buf = bytearray()
+    length = 0
+
+    while amount > 0:
+      # The suffix of the previous chunk becomes the prefix of the next one.
+      overlap = min(self.overlap_size, length)
+      # The previous chunk has to stay intact if nothing more can be read, so
+      # the part of it that is overwritten by the overlap is kept.
+      prefix = bytes(buf[:overlap])
+      if overlap:
+        buf[:overlap] = buf[length - overlap:length]
+
+      size = min(self.chunk_size - overlap, amount)
+      if len(buf) < overlap + size:
+        buf.extend(bytearray(overlap + size - len(buf)))
+
+      count = reader.ReadInto(buf, overlap, size)
+      if not count:
+        buf[:overlap] = prefix
+        del buf[length:]
+        return
+
+      length = overlap + count
+      # Consumers use the length of the data, so the buffer is shrunk for short
+      # reads.
+      if len(buf) > length:
+        del buf[length:]
+
+      amount -= count
+      yield Chunk(offset=reader.offset - length, data=buf, overlap=overlap)
+
 
 class Chunk(object):
   """A class representing part of a file.
@@ -146,6 +194,8 @@ class Chunk(object):
     Yields:
       `Matcher.Span` object corresponding to the positions of the pattern.
     """
+    # Matchers search the data from a given position, so the data is never
+    # copied.
 
     position = 0
     while True:
@@ -185,8 +235,23 @@ class Reader(with_metaclass(abc.ABCMeta, object)):
       Bytes that have been read.
     """
 
+  def ReadInto(self, buf, start, amount):
+    """Reads bytes into a given buffer.
 
-class FileReader(object):
+    Args:
+      buf: A `bytearray` to read into.
+      start: A position in `buf` at which the read bytes are stored.
+      amount: A number of bytes to read.
+
+    Returns:
+      A number of bytes that have been read.
+    """
+    data = self.Read(amount)
+    buf[start:start + len(data)] = data
+    return len(data)
+
+
+class FileReader(Reader):
   """A reader implementation that wraps ordinary file objects.
 
   Args:
@@ -208,8 +273,24 @@ class FileReader(object):
     self._offset += len(result)
     return result
 
+  def ReadInto(self, buf, start, amount):
+    readinto = getattr(self._filedesc, "readinto", None)
+    if readinto is None:
+      return super(FileReader, self).ReadInto(buf, start, amount)
+
+    view = memoryview(buf)[start:start + amount]
+    count = 0
+    while count < amount:
+      read = readinto(view[count:])
+      if not read:
+        break
+      count += read
+
+    self._offset += count
+    return count
 
-class MemoryReader(object):
+
+class MemoryReader(Reader):
   """A reader implementation that reads from process memory.
 
   Args:
@@ -229,3 +310,8 @@ class MemoryReader(object):
     result = self._process.ReadBytes(self._offset, amount)
     self._offset += len(result)
     return result
+
+  def ReadInto(self, buf, start, amount):
+    data = utils.SmartStr(self.Read(amount))
+    buf[start:start + len(data)] = data
+    return len(data)
@@ -144,6 +144,32 @@ class StreamerTestMixin(with_metaclass(abc.ABCMeta, object)):
     self.assertEqual(chunks[2].overlap, 2)
     self.assertEqual(chunks[3].overlap, 2)
 
+  def testReuseBufferYieldsSameChunks(self):
+    data = "abcdefghijklmnopqrstuvwxyz"
+
+    def Collect(**kwargs):
+      streamer = streaming.Streamer(chunk_size=7, overlap_size=3)
+      method = self.Stream(streamer, data)
+      # With a reused buffer the chunk data is only valid until the next chunk
+      # is requested, so it has to be copied while iterating.
+      return [(chunk.offset, bytes(chunk.data), chunk.overlap)
+              for chunk in method(offset=2, amount=20, **kwargs)]
+
+    self.assertEqual(Collect(reuse_buffer=True), Collect())
+
+  def testReuseBufferSharesStorage(self):
+    streamer = streaming.Streamer(chunk_size=4, overlap_size=1)
+    method = self.Stream(streamer, "abcdefghij")
+
+    chunks = list(method(reuse_buffer=True))
+
+    self.assertEqual(len(chunks), 3)
+    self.assertIs(chunks[0].data, chunks[1].data)
+    self.assertIs(chunks[1].data, chunks[2].data)
+    self.assertEqual(bytes(chunks[2].data), "ghij")
+    self.assertEqual(chunks[2].offset, 6)
+    self.assertEqual(chunks[2].overlap, 1)
+
 
 class StreamFilePathTest(StreamerTestMixin, absltest.TestCase):
 
@@ -16,6 +16,23 @@ config_lib.DEFINE_string("Datastore.implementation", "FakeDataStore",
 config_lib.DEFINE_string("Blobstore.implementation", "MemoryStreamBlobStore",
                          "Blob storage subsystem to use.")
 
+config_lib.DEFINE_string(
+    "PackFileBlobStore.path",
+    default="%(Config.prefix)/var/grr-blobs",
+    help="Directory the PackFileBlobStore keeps its pack files in.")
+
+config_lib.DEFINE_integer(
+    "PackFileBlobStore.max_pack_size",
+    default=4 * 1024 * 1024 * 1024,
+    help="Size (in bytes) after which the PackFileBlobStore starts a new pack "
+    "file.")
+
+config_lib.DEFINE_integer(
+    "PackFileBlobStore.max_journal_entries",
+    default=100000,
+    help="Number of recently written blobs after which the PackFileBlobStore "
+    "merges its journal into the sorted index.")
+
 config_lib.DEFINE_string("Database.implementation", "",
                          "Relational database system to use.")
 
@@ -59,6 +76,17 @@ config_lib.DEFINE_bool(
 config_lib.DEFINE_bool("Database.useForReads.stats", False,
                        "Read server metrics from the relational database.")
 
+config_lib.DEFINE_string(
+    "SqliteDB.path",
+    default="%(Config.prefix)/var/grr-db.sqlite",
+    help="Database file used by the SqliteDB relational database.")
+
+config_lib.DEFINE_integer(
+    "SqliteDB.busy_timeout",
+    default=30,
+    help="Number of seconds SqliteDB waits for a lock held by another "
+    "connection before retrying the transaction.")
+
 DATASTORE_PATHING = [
     r"%{(?P<path>files/hash/generic/sha256/...).*}",
     r"%{(?P<path>files/hash/generic/sha1/...).*}",
@@ -36,3 +36,8 @@ config_lib.DEFINE_integer("BigQuery.retry_multiplier", 2,
 config_lib.DEFINE_integer_list("BigQuery.retry_status_codes",
                                [404, 500, 502, 503, 504],
                                "HTTP status codes on which we should retry.")
+
+config_lib.DEFINE_integer(
+    "Export.conversion_processes", 0,
+    "Number of worker processes used to convert flow and hunt results to "
+    "exported values. If 0, values are converted in the calling thread.")
@@ -120,6 +120,86 @@ config_lib.DEFINE_integer(
     "Maximum time messages remain valid within the "
     "system.")
 
+config_lib.DEFINE_choice(
+    name="Frontend.server_mode",
+    default="threading",
+    choices=["threading", "async"],
+    help="How the frontend serves client connections. 'threading' uses a "
+    "thread per connection, 'async' (Unix only) holds all connections on an "
+    "event loop and handles requests on a bounded set of threads.")
+
+config_lib.DEFINE_integer(
+    "Frontend.async_handler_threads", 50,
+    "Number of threads handling requests when Frontend.server_mode is "
+    "'async'.")
+
+config_lib.DEFINE_integer(
+    "Frontend.async_max_queued_requests", 1000,
+    "Number of requests waiting for a handler thread when "
+    "Frontend.server_mode is 'async'. Further requests are answered with a "
+    "503.")
+
+config_lib.DEFINE_integer(
+    "Frontend.async_max_request_size", 100000000,
+    "Maximum size in bytes of a request body when Frontend.server_mode is "
+    "'async'. Larger requests are answered with a 413 before their body is "
+    "read.")
+
+config_lib.DEFINE_integer(
+    "Frontend.async_connection_timeout", 300,
+    "Number of seconds a connection may be idle while its request is read or "
+    "its response is sent when Frontend.server_mode is 'async'. Idle "
+    "connections are closed.")
+
+config_lib.DEFINE_integer(
+    "Frontend.decoding_processes", 0,
+    "Number of worker processes used to decrypt and decompress client "
+    "messages whose cipher is not cached. If 0, messages are decoded in the "
+    "request handler threads.")
+
+config_lib.DEFINE_integer(
+    "Frontend.decoding_batch_size", 50,
+    "Maximum number of client messages sent to a decoding process at once.")
+
+config_lib.DEFINE_float(
+    "Frontend.decoding_timeout", 10.0,
+    "Number of seconds a request waits for a decoding process to pick up its "
+    "messages before they are decoded in the request handler thread instead.")
+
+config_lib.DEFINE_string(
+    "Frontend.shared_cache_path", "",
+    "If set, client public keys and ping times are cached in an SQLite "
+    "database at this path which is shared by all frontend processes on the "
+    "host. Use a memory backed file system, e.g. "
+    "/dev/shm/grr_frontend_cache.sqlite.")
+
+config_lib.DEFINE_string(
+    "Frontend.shared_cache_snapshot_path", "",
+    "If set, the shared frontend cache is periodically written to this file "
+    "and restored from it when the cache is missing, e.g. after a reboot.")
+
+config_lib.DEFINE_semantic_value(
+    rdfvalue.Duration,
+    "Frontend.shared_cache_snapshot_interval",
+    default="10m",
+    help="How often the shared frontend cache is written to its snapshot "
+    "file.")
+
+config_lib.DEFINE_semantic_value(
+    rdfvalue.Duration,
+    "Frontend.shared_cache_flush_interval",
+    default="1s",
+    help="How often client ping times buffered by a frontend process are "
+    "written to the shared frontend cache.")
+
+config_lib.DEFINE_semantic_value(
+    rdfvalue.Duration,
+    "Frontend.shared_cache_max_ping_age",
+    default="10m",
+    help="Client clocks in the shared frontend cache are only used for replay "
+    "checks if the client was seen this recently. Older ones are read from "
+    "the data store.")
+
 config_lib.DEFINE_bool(
     "Server.initialized", False, "True once config_updater initialize has been "
     "run at least once.")
@@ -133,6 +213,22 @@ config_lib.DEFINE_string("Server.ip_resolver_class", "IPResolver",
 config_lib.DEFINE_string("Server.email_alerter_class", "SMTPEmailAlerter",
                          "The email alerter class to use.")
 
+config_lib.DEFINE_semantic_value(
+    rdfvalue.Duration,
+    "Server.foreman_rule_cache_ttl",
+    default="10s",
+    help="How long the foreman may use cached foreman rules. Rules modified "
+    "by the same process are picked up immediately, rules modified by other "
+    "processes after at most this long.")
+
+config_lib.DEFINE_choice(
+    name="Server.rdf_struct_codec",
+    default="python",
+    choices=["python", "compiled"],
+    help="The codec backend used to parse and serialize semantic protobufs. "
+    "The compiled backend uses per-class decode tables and produces exactly "
+    "the same bytes as the python one.")
+
 config_lib.DEFINE_string(
     "Rekall.profile_repository",
     "https://github.com/google/rekall-profiles/raw/master",
@@ -212,6 +308,19 @@ config_lib.DEFINE_integer(
     help="The number of bytes allowed for unbounded "
     "reads from a file object")
 
+config_lib.DEFINE_integer(
+    "Server.blob_stream_read_ahead",
+    16,
+    help="The number of blobs read from the blob store at once when reading "
+    "files from the file store. The next batch is fetched in the background "
+    "while the current one is being read.")
+
+config_lib.DEFINE_integer(
+    "Server.blob_stream_cache_size",
+    32,
+    help="The number of blobs cached by every open file store file. At least "
+    "twice Server.blob_stream_read_ahead blobs are cached.")
+
 # Data retention policies.
 config_lib.DEFINE_semantic_value(
     rdfvalue.Duration,
@@ -166,6 +166,31 @@ class ReceivedCipher(Cipher):
     except (rdf_crypto.InvalidSignature, rdf_crypto.CipherError) as e:
       raise DecryptionError(e)
 
+  @classmethod
+  def FromDecryptedCipher(cls, response_comms, private_key, serialized_cipher,
+                          serialized_metadata):
+    """Recreates a cipher that was already decrypted by another process.
+
+    Args:
+      response_comms: The ClientCommunication the cipher was received in.
+      private_key: Our private key.
+      serialized_cipher: The decrypted, serialized CipherProperties.
+      serialized_metadata: The decrypted, serialized CipherMetadata.
+
+    Returns:
+      A ReceivedCipher equivalent to ReceivedCipher(response_comms,
+      private_key), without repeating the RSA decryption.
+    """
+    result = cls.__new__(cls)
+    result.private_key = private_key
+    result.response_comms = response_comms
+    result.serialized_cipher = serialized_cipher
+    result.cipher = rdf_flows.CipherProperties.FromSerializedString(
+        serialized_cipher)
+    result.cipher_metadata = rdf_flows.CipherMetadata.FromSerializedString(
+        serialized_metadata)
+    return result
+
   def GetSource(self):
     return self.cipher_metadata.source
 
@@ -454,6 +479,52 @@ class Communicator(with_metaclass(abc.ABCMeta, object)):
 
     return result
 
+  @classmethod
+  def DecryptMessageList(cls, cipher, response_comms):
+    """Decrypts and decompresses the messages in response_comms.
+
+    Args:
+      cipher: The ReceivedCipher belonging to response_comms.
+      response_comms: A ClientCommunication rdfvalue.
+
+    Returns:
+      A tuple of the PackedMessageList and the MessageList it contains.
+
+    Raises:
+      DecryptionError: If the message failed to decrypt properly.
+      DecodingError: If the message failed to decompress.
+    """
+    # Decrypt the message with the per packet IV.
+    plain = cipher.Decrypt(response_comms.encrypted, response_comms.packet_iv)
+    try:
+      packed_message_list = rdf_flows.PackedMessageList.FromSerializedString(
+          plain)
+    except rdfvalue.DecodeError as e:
+      raise DecryptionError(str(e))
+
+    return packed_message_list, cls.DecompressMessageList(packed_message_list)
+
+  def DecodeUncachedMessages(self, response_comms):
+    """Decodes messages whose cipher is not in the encrypted cipher cache.
+
+    This is where the bulk of the work happens: the encrypted cipher has to be
+    RSA decrypted before the messages can be decrypted and decompressed.
+    Subclasses can override this to do the work elsewhere.
+
+    Args:
+      response_comms: A ClientCommunication rdfvalue.
+
+    Returns:
+      A tuple of the ReceivedCipher, the PackedMessageList and the MessageList.
+
+    Raises:
+      DecryptionError: If the message failed to decrypt properly.
+    """
+    cipher = ReceivedCipher(response_comms, self.private_key)
+    packed_message_list, message_list = self.DecryptMessageList(
+        cipher, response_comms)
+    return cipher, packed_message_list, message_list
+
   def DecodeMessages(self, response_comms):
     """Extract and verify server message.
 
@@ -470,22 +541,11 @@ class Communicator(with_metaclass(abc.ABCMeta, object)):
     cipher_verified = False
     try:
       cipher = self.encrypted_cipher_cache.Get(response_comms.encrypted_cipher)
-      stats_collector_instance.Get().IncrementCounter(
-          "grr_encrypted_cipher_cache", fields=["hits"])
-
-      # Even though we have seen this encrypted cipher already, we should still
-      # make sure that all the other fields are sane and verify the HMAC.
-      cipher.VerifyReceivedHMAC(response_comms)
-      cipher_verified = True
-
-      # If we have the cipher in the cache, we know the source and
-      # should have a corresponding public key.
-      source = cipher.GetSource()
-      remote_public_key = self._GetRemotePublicKey(source)
     except KeyError:
       stats_collector_instance.Get().IncrementCounter(
           "grr_encrypted_cipher_cache", fields=["misses"])
-      cipher = ReceivedCipher(response_comms, self.private_key)
+      cipher, packed_message_list, message_list = self.DecodeUncachedMessages(
+          response_comms)
 
       source = cipher.GetSource()
       try:
@@ -499,16 +559,22 @@ class Communicator(with_metaclass(abc.ABCMeta, object)):
       except UnknownClientCert:
         # We don't know who we are talking to.
         remote_public_key = None
+    else:
+      stats_collector_instance.Get().IncrementCounter(
+          "grr_encrypted_cipher_cache", fields=["hits"])
 
-    # Decrypt the message with the per packet IV.
-    plain = cipher.Decrypt(response_comms.encrypted, response_comms.packet_iv)
-    try:
-      packed_message_list = rdf_flows.PackedMessageList.FromSerializedString(
-          plain)
-    except rdfvalue.DecodeError as e:
-      raise DecryptionError(str(e))
+      # Even though we have seen this encrypted cipher already, we should still
+      # make sure that all the other fields are sane and verify the HMAC.
+      cipher.VerifyReceivedHMAC(response_comms)
+      cipher_verified = True
+
+      # If we have the cipher in the cache, we know the source and
+      # should have a corresponding public key.
+      source = cipher.GetSource()
+      remote_public_key = self._GetRemotePublicKey(source)
 
-    message_list = self.DecompressMessageList(packed_message_list)
+      packed_message_list, message_list = self.DecryptMessageList(
+          cipher, response_comms)
 
     # Are these messages authenticated?
     # pyformat: disable
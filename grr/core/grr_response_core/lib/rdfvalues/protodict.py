@@ -180,6 +180,10 @@ class Dict(rdf_structs.RDFProtoStruct):
 
   _values = None
 
+  # The values are kept in self._values, which is rebuilt by SetRawData(), so
+  # embedded Dicts have to be decoded right away.
+  lazy_decode = False
+
   def __init__(self, initializer=None, age=None, **kwarg):
     super(Dict, self).__init__(initializer=None, age=age)
 
@@ -24,12 +24,12 @@ class RegularExpression(rdfvalue.RDFString):
     super(RegularExpression, self).__init__(initializer=initializer, age=age)
     self._regex = re.compile(self._value, flags=re.I | re.S | re.M)
 
-  def Search(self, text):
-    """Search the text for our value."""
+  def Search(self, text, pos=0):
+    """Search the text for our value, starting at the given position."""
     if isinstance(text, rdfvalue.RDFString):
       text = str(text)
 
-    return self._regex.search(text)
+    return self._regex.search(text, pos)
 
   def Match(self, text):
     if isinstance(text, rdfvalue.RDFString):
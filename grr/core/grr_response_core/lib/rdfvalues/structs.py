@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import base64
 import copy
 import struct
+import threading
 
 
 from builtins import chr  # pylint: disable=redefined-builtin
@@ -265,6 +266,136 @@ def ReadIntoObject(buff, index, value_obj, length=0):
   value_obj.SetRawData(raw_data)
 
 
+def _IsStructDirty(proto):
+  """Checks if the struct or any of its decoded fields were modified."""
+  if proto.dirty:
+    return True
+
+  # Structs which were never decoded can not have been modified.
+  if proto._lazy_data is not None:  # pylint: disable=protected-access
+    return False
+
+  for python_format, _, type_descriptor in itervalues(proto.GetRawData()):
+    if python_format is not None and type_descriptor.IsDirty(python_format):
+      proto.dirty = True
+      return True
+
+  return False
+
+
+def _SerializeRawData(raw_data):
+  """Serializes the raw data of a struct in sorted keys order."""
+  return _SerializeEntries(utils.IterValuesInSortedKeysOrder(raw_data))
+
+
+# This function is HOT.
+def _CompiledReadIntoObject(buff, index, value_obj, length=0):
+  """A drop-in replacement for ReadIntoObject() using compiled decode tables.
+
+  Instead of going through the SplitBuffer() generator and inspecting the type
+  descriptor of each field, this function splits the buffer inline and looks
+  each tag up in a table which is compiled once per class (see
+  RDFStruct.GetDecodeTable()). The resulting raw data is exactly the same as the
+  one produced by ReadIntoObject(), so the serialized form does not change.
+
+  Args:
+    buff: The buffer to parse.
+    index: The position to start parsing.
+    value_obj: The RDFStruct to read fields into.
+    length: Optional length to parse until.
+
+  Raises:
+    ValueError: If a tag can not be read.
+    rdfvalue.DecodeError: If the buffer contains an unsupported wire type.
+  """
+  decode_table = value_obj.GetDecodeTable()
+  raw_data = value_obj.GetRawData()
+  repeated_fields = {}
+  count = 0
+
+  buffer_len = length or len(buff)
+  while index < buffer_len:
+    # Read the tag, this is an inlined ReadTag().
+    start = index
+    try:
+      while ORD_MAP_AND_0X80[buff[index]]:
+        index += 1
+    except IndexError:
+      raise ValueError("Invalid tag")
+    index += 1
+    encoded_tag = buff[start:index]
+
+    field = decode_table.get(encoded_tag)
+    if field is None:
+      tag_type = ORD_MAP[encoded_tag[0]] & TAG_TYPE_MASK
+    else:
+      tag_type = field[3]
+
+    if tag_type == WIRETYPE_LENGTH_DELIMITED:
+      data_length, data_index = VarintReader(buff, index)
+      wire_format = (encoded_tag, buff[index:data_index],
+                     buff[data_index:data_index + data_length])
+      index = data_index + data_length
+
+    elif tag_type == WIRETYPE_VARINT:
+      _, data_index = VarintReader(buff, index)
+      wire_format = (encoded_tag, b"", buff[index:data_index])
+      index = data_index
+
+    elif tag_type == WIRETYPE_FIXED64:
+      wire_format = (encoded_tag, b"", buff[index:index + 8])
+      index += 8
+
+    elif tag_type == WIRETYPE_FIXED32:
+      wire_format = (encoded_tag, b"", buff[index:index + 4])
+      index += 4
+
+    else:
+      raise rdfvalue.DecodeError("Unexpected Tag.")
+
+    # Unknown fields are preserved exactly like ReadIntoObject() does.
+    if field is None:
+      raw_data[count] = (None, wire_format, None)
+      count += 1
+      continue
+
+    name, type_info_obj, delegate, _ = field
+    if delegate is None:
+      raw_data[name] = (None, wire_format, type_info_obj)
+      continue
+
+    # Repeated fields: find the list to append to only once per parse.
+    wrapped_list = repeated_fields.get(name)
+    if wrapped_list is None:
+      entry = raw_data.get(name)
+      if entry is None:
+        helper = RepeatedFieldHelper(type_descriptor=delegate)
+        raw_data[name] = (helper, None, type_info_obj)
+      else:
+        helper = value_obj.Get(name)
+
+      wrapped_list = repeated_fields[name] = helper.wrapped_list
+
+    wrapped_list.append((None, wire_format))
+
+  value_obj.SetRawData(raw_data)
+
+
+def _CompiledSerializeRawData(raw_data):
+  """A drop-in replacement for _SerializeRawData() without per-entry checks."""
+  output = []
+  for key in sorted(raw_data):
+    python_format, wire_format, type_descriptor = raw_data[key]
+
+    if wire_format is None or (python_format and
+                               type_descriptor.IsDirty(python_format)):
+      wire_format = type_descriptor.ConvertToWireFormat(python_format)
+
+    output.extend(wire_format)
+
+  return b"".join(output)
+
+
 # pylint: disable=invalid-name
 if _semantic:
   VarintEncode = _semantic.varint_encode
@@ -272,6 +403,34 @@ if _semantic:
   SplitBuffer = _semantic.split_buffer
 # pylint: enable=invalid-name
 
+# Available codec backends, mapping a name to a (decoder, encoder) pair. The
+# "python" backend is the reference implementation, the "compiled" backend uses
+# per-class decode tables. Both produce exactly the same serialized bytes.
+CODEC_BACKENDS = {
+    "python": (ReadIntoObject, _SerializeRawData),
+    "compiled": (_CompiledReadIntoObject, _CompiledSerializeRawData),
+}
+
+# The codec currently in use. Use SetCodecBackend() to change it.
+_decode_into_object, _encode_raw_data = CODEC_BACKENDS["python"]
+
+
+def SetCodecBackend(name):
+  """Selects the codec backend used to parse and serialize RDFStructs.
+
+  Args:
+    name: One of the keys of CODEC_BACKENDS.
+
+  Raises:
+    ValueError: If the backend is not known.
+  """
+  global _decode_into_object, _encode_raw_data
+
+  try:
+    _decode_into_object, _encode_raw_data = CODEC_BACKENDS[name]
+  except KeyError:
+    raise ValueError("Unknown codec backend: %s" % name)
+
 
 class ProtoType(type_info.TypeInfoObject):
   """A specific type descriptor for protobuf fields.
@@ -884,16 +1043,30 @@ class ProtoEmbedded(ProtoType):
           "Only RDFProtoStructs can be nested, not %s" % nested.__name__)
 
   def ConvertFromWireFormat(self, value, container=None):
-    """The wire format is simply a string."""
+    """The wire format is simply a string.
+
+    The nested protobuf is only decoded when one of its fields is accessed, see
+    RDFStruct.ParseFromStringLazily().
+
+    Args:
+      value: The wire format tuple of the nested protobuf.
+      container: The protobuf that contains this field.
+
+    Returns:
+      An instance of the nested RDFProtoStruct.
+    """
     result = self.type()
-    ReadIntoObject(value[2], 0, result)
+    result.ParseFromStringLazily(value[2])
 
     return result
 
   def ConvertToWireFormat(self, value):
     """Encode the nested protobuf into wire format."""
-    output = _SerializeEntries(
-        utils.IterValuesInSortedKeysOrder(value.GetRawData()))
+    # A nested protobuf which was never decoded is written back unchanged.
+    output = value._lazy_data  # pylint: disable=protected-access
+    if output is None:
+      output = _encode_raw_data(value.GetRawData())
+
     return (self.encoded_tag, VarintEncode(len(output)), output)
 
   def LateBind(self, target=None):
@@ -923,15 +1096,7 @@ class ProtoEmbedded(ProtoType):
 
   def IsDirty(self, proto):
     """Return and clear the dirty state of the python object."""
-    if proto.dirty:
-      return True
-
-    for python_format, _, type_descriptor in itervalues(proto.GetRawData()):
-      if python_format is not None and type_descriptor.IsDirty(python_format):
-        proto.dirty = True
-        return True
-
-    return False
+    return _IsStructDirty(proto)
 
   def GetDefault(self, container=None):
     """When a nested proto is accessed, default to an empty one."""
@@ -1045,7 +1210,7 @@ class ProtoDynamicAnyValueEmbedded(ProtoDynamicEmbedded):
   def ConvertFromWireFormat(self, value, container=None):
     """The wire format is an AnyValue message."""
     result = AnyValue()
-    ReadIntoObject(value[2], 0, result)
+    _decode_into_object(value[2], 0, result)
     if self._type is not None:
       converted_value = self._type(container)
     else:
@@ -1097,8 +1262,7 @@ class ProtoDynamicAnyValueEmbedded(ProtoDynamicEmbedded):
           "Can't convert value %s to an protobuf.Any value." % value)
 
     any_value = AnyValue(type_url=type_name, value=data)
-    output = _SerializeEntries(
-        utils.IterValuesInSortedKeysOrder(any_value.GetRawData()))
+    output = _encode_raw_data(any_value.GetRawData())
 
     return (self.encoded_tag, VarintEncode(len(output)), output)
 
@@ -1168,7 +1332,6 @@ class RepeatedFieldHelper(object):
     if rdf_value is utils.NotAValue:
       if wire_format is None:
         rdf_value = self.type_descriptor.type(**kwargs)
-        self.dirty = True
       else:
         rdf_value = None
     else:
@@ -1182,12 +1345,14 @@ class RepeatedFieldHelper(object):
                                        type(rdf_value), e))
 
     self.wrapped_list.append((rdf_value, wire_format))
+    self.dirty = True
 
     return rdf_value
 
   def Pop(self, item):
     result = self[item]
     self.wrapped_list.pop(item)
+    self.dirty = True
     return result
 
   def Extend(self, iterable):
@@ -1523,6 +1688,26 @@ class ProtoRDFValue(ProtoType):
         self.name, self.proto_type_name, self.owner.__name__, self.field_number)
 
 
+# Serializes decoding of lazily parsed structs.
+_LAZY_DECODE_LOCK = threading.RLock()
+
+
+class _LazyRawData(object):
+  """A descriptor which decodes lazily parsed structs on first access.
+
+  RDFStruct instances keep their raw data in the instance dict, which takes
+  precedence over this non-data descriptor. Structs parsed with
+  RDFStruct.ParseFromStringLazily() drop their raw data, so the first access to
+  it ends up here and triggers the actual parsing.
+  """
+
+  def __get__(self, instance, owner):
+    if instance is None:
+      return None
+
+    return instance._DecodeLazyData()  # pylint: disable=protected-access
+
+
 class RDFStructMetaclass(rdfvalue.RDFValueMetaclass):
   """A metaclass which registers new RDFProtoStruct instances."""
 
@@ -1544,6 +1729,10 @@ class RDFStructMetaclass(rdfvalue.RDFValueMetaclass):
     cls.type_infos_by_field_number = {}
     cls.type_infos_by_encoded_tag = {}
 
+    # The decode table is compiled on first use by the "compiled" codec backend
+    # and reset whenever a descriptor is added (e.g. by late binding).
+    cls.decode_table = None
+
     # Build the class by parsing an existing protobuf class.
     if cls.protobuf is not None:
       rdf_proto2.DefineFromProtobuf(cls, cls.protobuf)
@@ -1602,7 +1791,15 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
   dirty = False
 
   # Stores the raw data here.
-  _data = None
+  _data = _LazyRawData()
+
+  # The serialized data of a lazily parsed struct, until it is decoded.
+  _lazy_data = None
+
+  # Whether embedded structs of this class are only decoded on first access.
+  # Classes which keep derived state outside of the raw data (e.g. by overriding
+  # SetRawData()) must disable this.
+  lazy_decode = True
 
   def __init__(self, initializer=None, age=None, **kwargs):
     # Maintain the order so that parsing and serializing a proto does not change
@@ -1645,6 +1842,7 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
     Args:
       other: An instance of the same type of this class.
     """
+    self._lazy_data = None
     self._data = {}
     for name, (obj, serialized, t_info) in iteritems(other.GetRawData()):
       if serialized is None:
@@ -1654,6 +1852,7 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
 
   def Clear(self):
     """Clear all the fields."""
+    self._lazy_data = None
     self._data = {}
 
   def HasField(self, field_name):
@@ -1713,6 +1912,35 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
     """
     return self._data
 
+  @classmethod
+  def GetDecodeTable(cls):
+    """Returns the compiled decode table of this class.
+
+    The table maps an encoded tag to a tuple of (field name, type descriptor,
+    delegate descriptor for repeated fields or None, wire type) and is used by
+    the "compiled" codec backend to dispatch fields without inspecting their
+    type descriptors.
+
+    Returns:
+      A dict keyed by encoded tags.
+    """
+    decode_table = cls.decode_table
+    if decode_table is None:
+      decode_table = {}
+      for encoded_tag, type_descriptor in iteritems(
+          cls.type_infos_by_encoded_tag):
+        delegate = None
+        if type_descriptor.__class__ is ProtoList:
+          delegate = type_descriptor.delegate
+
+        wire_type = ORD_MAP[encoded_tag[0]] & TAG_TYPE_MASK
+        decode_table[encoded_tag] = (type_descriptor.name, type_descriptor,
+                                     delegate, wire_type)
+
+      cls.decode_table = decode_table
+
+    return decode_table
+
   def ListSetFields(self):
     """Iterates over the fields which are actually set.
 
@@ -1724,16 +1952,61 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
         yield type_descriptor, self.Get(type_descriptor.name)
 
   def SetRawData(self, data):
+    self._lazy_data = None
     self._data = data
     self.dirty = True
 
   def SerializeToString(self):
-    return _SerializeEntries(utils.IterValuesInSortedKeysOrder(self._data))
+    # A struct which was never decoded serializes to its original bytes.
+    if self._lazy_data is not None:
+      return self._lazy_data
+
+    return _encode_raw_data(self._data)
 
   def ParseFromString(self, string):
-    ReadIntoObject(string, 0, self)
+    _decode_into_object(string, 0, self)
     self.dirty = True
 
+  def ParseFromStringLazily(self, string):
+    """Parses the string only when a field is accessed for the first time.
+
+    Until then the struct holds on to the serialized string, which is returned
+    unchanged if the struct is serialized again. Note that decoding errors are
+    only raised on first access.
+
+    Args:
+      string: The serialized struct.
+    """
+    if not self.lazy_decode or self._data:
+      _decode_into_object(string, 0, self)
+      return
+
+    self._lazy_data = string
+    del self._data
+
+  def _DecodeLazyData(self):
+    """Decodes the data passed to ParseFromStringLazily() and returns it."""
+    with _LAZY_DECODE_LOCK:
+      # Another thread might have decoded the data while we were waiting.
+      data = self.__dict__.get("_data")
+      if data is not None:
+        return data
+
+      data = {}
+      lazy_data = self._lazy_data
+      if lazy_data:
+        # The data is decoded into a separate struct, so other threads never
+        # see a partially decoded one. If decoding fails, this struct stays
+        # undecoded and every access raises, like eager decoding would.
+        decoded = self.__class__()
+        decoded.Clear()
+        _decode_into_object(lazy_data, 0, decoded)
+        data = decoded.GetRawData()
+
+      self._data = data
+      self._lazy_data = None
+      return data
+
   def ParseFromDatastore(self, value):
     precondition.AssertType(value, bytes)
     self.ParseFromString(value)
@@ -1860,6 +2133,7 @@ class RDFStruct(with_metaclass(RDFStructMetaclass, rdfvalue.RDFValue)):
 
     cls.type_infos_by_field_number[field_desc.field_number] = field_desc
     cls.type_infos.Append(field_desc)
+    cls.decode_table = None
 
 
 class EnumContainer(object):
@@ -2005,6 +2279,9 @@ class RDFProtoStruct(RDFStruct):
         return value
 
   def __nonzero__(self):
+    if self._lazy_data is not None:
+      return bool(self._lazy_data)
+
     return bool(self._data)
 
   @classmethod
@@ -2223,6 +2500,7 @@ class RDFProtoStruct(RDFStruct):
 
     cls.type_infos.Append(field_desc)
     cls.late_bound_type_infos.pop(field_desc.name, None)
+    cls.decode_table = None
 
     # Add direct accessors only if the class does not already have them.
     if not hasattr(cls, field_desc.name):
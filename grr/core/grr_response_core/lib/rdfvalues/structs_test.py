@@ -6,6 +6,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import random
+import threading
 
 from builtins import range  # pylint: disable=redefined-builtin
 
@@ -390,6 +391,135 @@ class RDFStructsTest(rdf_test_base.RDFValueTestMixin, test_lib.GRRBaseTest):
     self.assertEqual(len(sliced), 2)
     self.assertEqual(sliced[0].foobar, "Nest3")
 
+  def testCompiledCodecRoundTripsSameBytes(self):
+    tested = TestStruct(foobar="hello", int=5, float=2.5, type="SECOND")
+    tested.nested.foobar = "goodbye"
+    tested.repeated.Append("Good")
+    tested.repeated.Append("Bye")
+    for i in range(10):
+      tested.repeat_nested.Append(foobar="Nest%s" % i, int=i)
+
+    data = tested.SerializeToString()
+    # Unknown fields must survive a parse/serialize cycle as well.
+    reduced_data = PartialTest1.FromSerializedString(data).SerializeToString()
+
+    self.addCleanup(rdf_structs.SetCodecBackend, "python")
+    rdf_structs.SetCodecBackend("compiled")
+
+    decoded = TestStruct.FromSerializedString(data)
+    self.assertEqual(decoded, tested)
+    self.assertEqual(decoded.repeat_nested[7].foobar, "Nest7")
+    self.assertEqual(decoded.repeat_nested[7].int, 7)
+    self.assertEqual(list(decoded.repeated), ["Good", "Bye"])
+    self.assertEqual(decoded.SerializeToString(), data)
+
+    reduced = PartialTest1.FromSerializedString(data)
+    self.assertEqual(reduced.int, 5)
+    self.assertEqual(reduced.SerializeToString(), reduced_data)
+
+    decoded.nested.foobar = "changed"
+    rdf_structs.SetCodecBackend("python")
+    self.assertEqual(
+        TestStruct.FromSerializedString(decoded.SerializeToString()),
+        decoded)
+
+  def testNestedStructsAreDecodedOnFirstAccess(self):
+    tested = TestStruct(foobar="outer")
+    tested.nested.foobar = "inner"
+    tested.nested.repeated = ["a", "b"]
+    data = tested.SerializeToString()
+
+    decoded = TestStruct.FromSerializedString(data)
+    nested = decoded.nested
+    self.assertIsNotNone(nested._lazy_data)
+    self.assertEqual(nested.SerializeToString(),
+                     tested.nested.SerializeToString())
+
+    self.assertEqual(nested.foobar, "inner")
+    self.assertIsNone(nested._lazy_data)
+
+    # Reading fields does not modify the struct, so the original bytes are
+    # written back.
+    self.assertFalse(nested.dirty)
+    self.assertEqual(decoded.SerializeToString(), data)
+
+  def testModificationsOfLazilyDecodedStructsAreSerialized(self):
+    tested = TestStruct(foobar="outer")
+    tested.nested.repeated = ["a", "b"]
+    tested.repeat_nested.Append(foobar="first")
+    data = tested.SerializeToString()
+
+    decoded = TestStruct.FromSerializedString(data)
+    self.assertEqual(list(decoded.nested.repeated), ["a", "b"])
+    decoded.nested.repeated.Append("c")
+    decoded.repeat_nested[0].repeated.Append("d")
+
+    reparsed = TestStruct.FromSerializedString(decoded.SerializeToString())
+    self.assertEqual(list(reparsed.nested.repeated), ["a", "b", "c"])
+    self.assertEqual(list(reparsed.repeat_nested[0].repeated), ["d"])
+
+  def testClearingLazilyDecodedStructs(self):
+    tested = TestStruct(foobar="outer")
+    tested.nested.foobar = "inner"
+
+    decoded = TestStruct.FromSerializedString(tested.SerializeToString())
+    nested = decoded.nested
+    self.assertIsNotNone(nested._lazy_data)
+    nested.Clear()
+
+    self.assertFalse(nested)
+    self.assertFalse(nested.HasField("foobar"))
+    self.assertEqual(nested.SerializeToString(), b"")
+
+    nested.int = 5
+    self.assertEqual(nested.SerializeToString(),
+                     TestStruct(int=5).SerializeToString())
+
+  def testCopyingIntoLazilyDecodedStructs(self):
+    tested = TestStruct(foobar="outer")
+    tested.nested.foobar = "inner"
+
+    decoded = TestStruct.FromSerializedString(tested.SerializeToString())
+    nested = decoded.nested
+    nested.CopyConstructor(TestStruct(foobar="copied"))
+
+    self.assertEqual(nested.foobar, "copied")
+    self.assertEqual(nested.SerializeToString(),
+                     TestStruct(foobar="copied").SerializeToString())
+
+  def testLazyDecodingErrorsAreRaisedOnAccess(self):
+    # A nested struct (field 4) containing a truncated tag.
+    decoded = TestStruct.FromSerializedString(b"\x22\x01\xff")
+    nested = decoded.nested
+
+    self.assertRaises(ValueError, getattr, nested, "foobar")
+    self.assertRaises(ValueError, getattr, nested, "foobar")
+
+  def testConcurrentAccessSeesFullyDecodedStructs(self):
+    tested = TestStruct(foobar="outer")
+    tested.nested.foobar = "inner"
+    tested.nested.repeated = [str(i) for i in range(100)]
+    data = tested.SerializeToString()
+
+    for _ in range(20):
+      nested = TestStruct.FromSerializedString(data).nested
+      results = []
+
+      def Read():
+        results.append((nested.foobar, len(nested.repeated)))
+
+      threads = [threading.Thread(target=Read) for _ in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+
+      self.assertEqual(results, [("inner", 100)] * 8)
+
+  def testSetCodecBackendRaisesOnUnknownBackend(self):
+    with self.assertRaises(ValueError):
+      rdf_structs.SetCodecBackend("foo")
+
   def testUnknownFields(self):
     """Test that unknown fields are preserved across decode/encode cycle."""
     tested = TestStruct(foobar="hello", int=5)
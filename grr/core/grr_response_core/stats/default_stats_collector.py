@@ -15,6 +15,13 @@ from grr_response_core.stats import stats_collector
 from grr_response_core.stats import stats_utils
 
 
+# Distribution buckets used by event metrics registered without bins.
+DEFAULT_EVENT_BINS = [
+    0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.75, 1, 1.5, 2, 2.5, 3, 4, 5, 6, 7, 8, 9, 10,
+    15, 20, 50, 100
+]
+
+
 def _FieldsToKey(fields):
   """Converts a list of field values to a metric key."""
   return tuple(fields) if fields else ()
@@ -100,10 +107,7 @@ class _EventMetric(_Metric):
 
   def __init__(self, bins, fields):
     super(_EventMetric, self).__init__(fields)
-    self._bins = bins or [
-        0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.75, 1, 1.5, 2, 2.5, 3, 4, 5, 6, 7, 8, 9,
-        10, 15, 20, 50, 100
-    ]
+    self._bins = bins or DEFAULT_EVENT_BINS
 
   def _DefaultValue(self):
     return rdf_stats.Distribution(bins=self._bins)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+"""A stats-collector that keeps per-thread shards of counters and events.
+
+Counters and event metrics are updated on every message processed by the
+frontend and the workers, so updating them should not involve any locking.
+ShardedStatsCollector gives every thread its own shard of plain ints and
+list-backed histograms, which only the owning thread ever writes to. The
+shards are merged whenever a metric value is read.
+
+Reads rely on copying a shard's dictionaries being atomic under the GIL, so a
+reader never sees a dictionary that is being resized. A value read while it is
+being updated may lag behind by the in-flight update, which is fine for
+monitoring.
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import bisect
+import threading
+
+from future.utils import iteritems
+
+from grr_response_core.lib.rdfvalues import stats as rdf_stats
+from grr_response_core.stats import default_stats_collector
+
+
+def _FieldsToKey(fields):
+  """Converts a list of field values to a metric key."""
+  return tuple(fields) if fields else ()
+
+
+class _Histogram(object):
+  """A list-backed equivalent of rdf_stats.Distribution."""
+
+  __slots__ = ("bins", "heights", "sum", "count")
+
+  def __init__(self, bins):
+    # bins is shared between all histograms of a metric and is never mutated.
+    self.bins = bins
+    self.heights = [0] * len(bins)
+    self.sum = 0
+    self.count = 0
+
+  def Record(self, value):
+    """Records given value (see rdf_stats.Distribution.Record)."""
+    pos = bisect.bisect(self.bins, value) - 1
+    if pos < 0:
+      pos = 0
+    self.heights[pos] += 1
+    self.sum += value
+    self.count += 1
+
+  def Merge(self, other):
+    """Adds all the values recorded in another histogram to this one."""
+    heights = self.heights
+    for i, height in enumerate(list(other.heights)):
+      heights[i] += height
+    self.sum += other.sum
+    self.count += other.count
+
+  def ToDistribution(self):
+    result = rdf_stats.Distribution(bins=self.bins[1:])
+    result.heights = self.heights
+    result.sum = self.sum
+    result.count = self.count
+    return result
+
+
+class _Shard(object):
+  """Counter and event values written by a single thread."""
+
+  __slots__ = ("counters", "events")
+
+  def __init__(self):
+    # Both dictionaries are keyed by (metric name, field values) tuples.
+    self.counters = {}
+    self.events = {}
+
+  def Merge(self, other):
+    """Adds all the values of another shard to this one."""
+    for key, value in iteritems(dict(other.counters)):
+      self.counters[key] = self.counters.get(key, 0) + value
+
+    for key, histogram in iteritems(dict(other.events)):
+      own_histogram = self.events.get(key)
+      if own_histogram is None:
+        own_histogram = _Histogram(histogram.bins)
+        self.events[key] = own_histogram
+      own_histogram.Merge(histogram)
+
+
+class ShardedStatsCollector(default_stats_collector.DefaultStatsCollector):
+  """A stats-collector with lock-free counter and event metric updates.
+
+  Gauges are handled like in the DefaultStatsCollector, with the difference
+  that setting them doesn't take the collector-wide lock either: gauges are
+  set in a single dictionary assignment, which is atomic.
+  """
+
+  def __init__(self, metadata_list):
+    self._event_bins = {}
+    # The number of fields of every metric, so that updates can be validated
+    # without looking at the field definitions.
+    self._field_counts = {}
+    self._local = threading.local()
+    # (thread, shard) tuples of all threads that have updated a metric.
+    self._shards = []
+    # Values written by threads that don't exist anymore.
+    self._retired_shard = _Shard()
+    self._shards_lock = threading.Lock()
+
+    super(ShardedStatsCollector, self).__init__(metadata_list)
+
+  def _InitializeMetric(self, metadata):
+    """See base class."""
+    super(ShardedStatsCollector, self)._InitializeMetric(metadata)
+
+    self._field_counts[metadata.varname] = len(metadata.fields_defs)
+    if metadata.metric_type == rdf_stats.MetricMetadata.MetricType.EVENT:
+      bins = list(metadata.bins) or default_stats_collector.DEFAULT_EVENT_BINS
+      self._event_bins[metadata.varname] = [-float("inf")] + bins
+
+  def _CheckFields(self, metric_name, fields):
+    """Raises if fields don't match the field definitions of the metric."""
+    field_count = len(fields) if fields else 0
+    if field_count != self._field_counts[metric_name]:
+      raise ValueError(
+          "Metric %s was registered with %d fields, but %d fields were "
+          "provided (%s)." % (metric_name, self._field_counts[metric_name],
+                              field_count, fields))
+
+  def _GetShard(self):
+    """Returns the shard of the current thread, creating it if needed."""
+    try:
+      return self._local.shard
+    except AttributeError:
+      shard = _Shard()
+      with self._shards_lock:
+        self._shards.append((threading.current_thread(), shard))
+      self._local.shard = shard
+      return shard
+
+  def _GetShards(self):
+    """Returns all the shards, folding the ones of finished threads."""
+    with self._shards_lock:
+      live_shards = []
+      for thread, shard in self._shards:
+        if thread.is_alive():
+          live_shards.append((thread, shard))
+        else:
+          self._retired_shard.Merge(shard)
+      self._shards = live_shards
+
+      return [self._retired_shard] + [shard for _, shard in live_shards]
+
+  def IncrementCounter(self, metric_name, delta=1, fields=None):
+    """See base class."""
+    if delta < 0:
+      raise ValueError("Invalid increment for counter: %d." % delta)
+    if metric_name not in self._counter_metrics:
+      raise KeyError(metric_name)
+    self._CheckFields(metric_name, fields)
+
+    counters = self._GetShard().counters
+    key = (metric_name, _FieldsToKey(fields))
+    counters[key] = counters.get(key, 0) + delta
+
+  def RecordEvent(self, metric_name, value, fields=None):
+    """See base class."""
+    self._CheckFields(metric_name, fields)
+
+    events = self._GetShard().events
+    key = (metric_name, _FieldsToKey(fields))
+    histogram = events.get(key)
+    if histogram is None:
+      histogram = _Histogram(self._event_bins[metric_name])
+      events[key] = histogram
+    histogram.Record(value)
+
+  def SetGaugeValue(self, metric_name, value, fields=None):
+    """See base class."""
+    self._gauge_metrics[metric_name].Set(value, fields)
+
+  def SetGaugeCallback(self, metric_name, callback, fields=None):
+    """See base class."""
+    self._gauge_metrics[metric_name].SetCallback(callback, fields)
+
+  def GetMetricFields(self, metric_name):
+    """See base class."""
+    metric = self._GetMetric(metric_name)
+    if metric_name in self._gauge_metrics:
+      return metric.ListFieldsValues()
+    if not metric._field_defs:  # pylint: disable=protected-access
+      return []
+
+    result = set()
+    for shard in self._GetShards():
+      if metric_name in self._counter_metrics:
+        keys = list(shard.counters)
+      else:
+        keys = list(shard.events)
+      result.update(fields for name, fields in keys if name == metric_name)
+    return list(result)
+
+  def GetMetricValue(self, metric_name, fields=None):
+    """See base class."""
+    # Validates the fields and provides the default value.
+    value = self._GetMetric(metric_name).Get(fields)
+    if metric_name in self._gauge_metrics:
+      return value
+
+    key = (metric_name, _FieldsToKey(fields))
+    if metric_name in self._counter_metrics:
+      return sum(shard.counters.get(key, 0) for shard in self._GetShards())
+
+    result = _Histogram(self._event_bins[metric_name])
+    for shard in self._GetShards():
+      histogram = shard.events.get(key)
+      if histogram is not None:
+        result.Merge(histogram)
+    return result.ToDistribution()
+
+  def GetShardsCount(self):
+    """Returns the number of shards of threads that are still alive."""
+    return len(self._GetShards()) - 1
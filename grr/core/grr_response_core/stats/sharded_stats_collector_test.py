@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Tests for the ShardedStatsCollector."""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_core.stats import sharded_stats_collector
+from grr_response_core.stats import stats_test_utils
+from grr_response_core.stats import stats_utils
+from grr.test_lib import test_lib
+
+
+class ShardedStatsCollectorTest(stats_test_utils.StatsCollectorTest):
+
+  def _CreateStatsCollector(self, metadata_list):
+    return sharded_stats_collector.ShardedStatsCollector(metadata_list)
+
+  def _RunInThreads(self, target, num_threads):
+    threads = [threading.Thread(target=target) for _ in range(num_threads)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+  def testCountersAreMergedAcrossThreads(self):
+    counter_name = "testCountersAreMergedAcrossThreads_counter"
+    collector = self._CreateStatsCollector([
+        stats_utils.CreateCounterMetadata(
+            counter_name, fields=[("dimension", str)])
+    ])
+
+    def Increment():
+      for i in range(100):
+        collector.IncrementCounter(counter_name, fields=["dim%d" % (i % 2)])
+
+    self._RunInThreads(Increment, 8)
+
+    self.assertEqual(
+        collector.GetMetricValue(counter_name, fields=["dim0"]), 400)
+    self.assertEqual(
+        collector.GetMetricValue(counter_name, fields=["dim1"]), 400)
+    self.assertItemsEqual(
+        collector.GetMetricFields(counter_name), [("dim0",), ("dim1",)])
+
+  def testEventsAreMergedAcrossThreads(self):
+    event_metric_name = "testEventsAreMergedAcrossThreads_event_metric"
+    collector = self._CreateStatsCollector([
+        stats_utils.CreateEventMetadata(event_metric_name, bins=[0.0, 1.0])
+    ])
+
+    def Record():
+      for _ in range(10):
+        collector.RecordEvent(event_metric_name, 0.5)
+        collector.RecordEvent(event_metric_name, 1.5)
+
+    self._RunInThreads(Record, 4)
+
+    data = collector.GetMetricValue(event_metric_name)
+    self.assertEqual(data.count, 80)
+    self.assertAlmostEqual(data.sum, 80.0)
+    self.assertEqual(data.bins_heights, {
+        -float("inf"): 0,
+        0.0: 40,
+        1.0: 40
+    })
+
+  def testValuesOfFinishedThreadsAreKept(self):
+    counter_name = "testValuesOfFinishedThreadsAreKept_counter"
+    collector = self._CreateStatsCollector(
+        [stats_utils.CreateCounterMetadata(counter_name)])
+
+    self._RunInThreads(lambda: collector.IncrementCounter(counter_name), 5)
+    self.assertEqual(collector.GetMetricValue(counter_name), 5)
+    self.assertEqual(collector.GetShardsCount(), 0)
+
+    collector.IncrementCounter(counter_name, delta=2)
+    self._RunInThreads(lambda: collector.IncrementCounter(counter_name), 3)
+    self.assertEqual(collector.GetMetricValue(counter_name), 10)
+    self.assertEqual(collector.GetShardsCount(), 1)
+
+  def testIncrementingUnknownCounterRaises(self):
+    collector = self._CreateStatsCollector([])
+    with self.assertRaises(KeyError):
+      collector.IncrementCounter("testIncrementingUnknownCounterRaises")
+
+  def testUpdatingMetricsWithWrongFieldsRaises(self):
+    counter_name = "testUpdatingMetricsWithWrongFieldsRaises_counter"
+    event_metric_name = "testUpdatingMetricsWithWrongFieldsRaises_event_metric"
+
+    collector = self._CreateStatsCollector([
+        stats_utils.CreateCounterMetadata(
+            counter_name, fields=[("dimension", str)]),
+        stats_utils.CreateEventMetadata(event_metric_name)
+    ])
+
+    with self.assertRaises(ValueError):
+      collector.IncrementCounter(counter_name)
+    with self.assertRaises(ValueError):
+      collector.IncrementCounter(counter_name, fields=["a", "b"])
+    with self.assertRaises(ValueError):
+      collector.RecordEvent(event_metric_name, 0.1, fields=["a"])
+
+    collector.IncrementCounter(counter_name, fields=["a"])
+    collector.RecordEvent(event_metric_name, 0.1)
+    self.assertEqual(collector.GetMetricValue(counter_name, fields=["a"]), 1)
+    self.assertEqual(collector.GetMetricValue(event_metric_name).count, 1)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmarks for stats-collector implementations under contention."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import threading
+import time
+
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_core.stats import default_stats_collector
+from grr_response_core.stats import sharded_stats_collector
+from grr_response_core.stats import stats_utils
+from grr.test_lib import benchmark_test_lib
+from grr.test_lib import test_lib
+
+
+class StatsCollectorBenchmarks(benchmark_test_lib.MicroBenchmarks):
+  """Measures metric updates done concurrently by many threads."""
+
+  units = "s"
+
+  NUM_THREADS = 64
+  UPDATES_PER_THREAD = 10000
+
+  COLLECTOR_CLASSES = [
+      default_stats_collector.DefaultStatsCollector,
+      sharded_stats_collector.ShardedStatsCollector,
+  ]
+
+  def _TimeInThreads(self, name, target):
+    """Runs target in NUM_THREADS threads at once, records the time taken."""
+    start_event = threading.Event()
+
+    def Run():
+      start_event.wait()
+      target()
+
+    threads = [threading.Thread(target=Run) for _ in range(self.NUM_THREADS)]
+    for thread in threads:
+      thread.start()
+
+    start = time.time()
+    start_event.set()
+    for thread in threads:
+      thread.join()
+
+    elapsed = time.time() - start
+    self.AddResult(name, elapsed, self.NUM_THREADS * self.UPDATES_PER_THREAD)
+
+  def testCounterIncrements(self):
+    """Increments a counter with fields from 64 threads."""
+    for cls in self.COLLECTOR_CLASSES:
+      collector = cls([
+          stats_utils.CreateCounterMetadata(
+              "benchmark_counter", fields=[("dimension", str)])
+      ])
+
+      def Increment(collector=collector):
+        for _ in range(self.UPDATES_PER_THREAD):
+          collector.IncrementCounter("benchmark_counter", fields=["foo"])
+
+      self._TimeInThreads(cls.__name__, Increment)
+      self.assertEqual(
+          collector.GetMetricValue("benchmark_counter", fields=["foo"]),
+          self.NUM_THREADS * self.UPDATES_PER_THREAD)
+
+  def testEventRecording(self):
+    """Records events from 64 threads."""
+    for cls in self.COLLECTOR_CLASSES:
+      collector = cls([stats_utils.CreateEventMetadata("benchmark_event")])
+
+      def Record(collector=collector):
+        for i in range(self.UPDATES_PER_THREAD):
+          collector.RecordEvent("benchmark_event", i % 10)
+
+      self._TimeInThreads(cls.__name__, Record)
+      self.assertEqual(
+          collector.GetMetricValue("benchmark_event").count,
+          self.NUM_THREADS * self.UPDATES_PER_THREAD)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -0,0 +1,368 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/analysis.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/analysis.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n!grr_response_proto/analysis.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"9\n\x06Sample\x12\r\n\x05label\x18\x01 \x01(\t\x12\x0f\n\x07x_value\x18\x02 \x01(\x04\x12\x0f\n\x07y_value\x18\x03 \x01(\x04\">\n\x0bSampleFloat\x12\r\n\x05label\x18\x01 \x01(\t\x12\x0f\n\x07x_value\x18\x02 \x01(\x02\x12\x0f\n\x07y_value\x18\x03 \x01(\x02\"u\n\x05Graph\x12\r\n\x05title\x18\x01 \x01(\t\x12\x0e\n\x06xtitle\x18\x02 \x01(\t\x12\x0e\n\x06ytitle\x18\x03 \x01(\t\x12\x15\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x07.Sample\x12\x12\n\x07x_scale\x18\x05 \x01(\r:\x01\x31\x12\x12\n\x07y_scale\x18\x06 \x01(\r:\x01\x31\"\x7f\n\nGraphFloat\x12\r\n\x05title\x18\x01 \x01(\t\x12\x0e\n\x06xtitle\x18\x02 \x01(\t\x12\x0e\n\x06ytitle\x18\x03 \x01(\t\x12\x1a\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x0c.SampleFloat\x12\x12\n\x07x_scale\x18\x05 \x01(\r:\x01\x31\x12\x12\n\x07y_scale\x18\x06 \x01(\r:\x01\x31\"\xdd\x01\n\x05\x45vent\x12<\n\ttimestamp\x18\x01 \x01(\x04\x42)\xe2\xfc\xe3\xc4\x01#\n\x0bRDFDatetime\x12\x14The event timestamp.\x12Q\n\x06source\x18\x02 \x01(\tBA\xe2\xfc\xe3\xc4\x01;\n\x06RDFURN\x12\x31The urn of the originating object for this event.\x12\x0f\n\x07subject\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x18\n\x04stat\x18\x05 \x01(\x0b\x32\n.StatEntry\x12\n\n\x02id\x18\x06 \x01(\r')
+  ,
+  dependencies=[grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_SAMPLE = _descriptor.Descriptor(
+  name='Sample',
+  full_name='Sample',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='label', full_name='Sample.label', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='x_value', full_name='Sample.x_value', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='y_value', full_name='Sample.y_value', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=103,
+  serialized_end=160,
+)
+
+
+_SAMPLEFLOAT = _descriptor.Descriptor(
+  name='SampleFloat',
+  full_name='SampleFloat',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='label', full_name='SampleFloat.label', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='x_value', full_name='SampleFloat.x_value', index=1,
+      number=2, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='y_value', full_name='SampleFloat.y_value', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=162,
+  serialized_end=224,
+)
+
+
+_GRAPH = _descriptor.Descriptor(
+  name='Graph',
+  full_name='Graph',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='title', full_name='Graph.title', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='xtitle', full_name='Graph.xtitle', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='ytitle', full_name='Graph.ytitle', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='Graph.data', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='x_scale', full_name='Graph.x_scale', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=True, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='y_scale', full_name='Graph.y_scale', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=True, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=226,
+  serialized_end=343,
+)
+
+
+_GRAPHFLOAT = _descriptor.Descriptor(
+  name='GraphFloat',
+  full_name='GraphFloat',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='title', full_name='GraphFloat.title', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='xtitle', full_name='GraphFloat.xtitle', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='ytitle', full_name='GraphFloat.ytitle', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='GraphFloat.data', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='x_scale', full_name='GraphFloat.x_scale', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=True, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='y_scale', full_name='GraphFloat.y_scale', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=True, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=345,
+  serialized_end=472,
+)
+
+
+_EVENT = _descriptor.Descriptor(
+  name='Event',
+  full_name='Event',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='Event.timestamp', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\n\013RDFDatetime\022\024The event timestamp.'))),
+    _descriptor.FieldDescriptor(
+      name='source', full_name='Event.source', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\n\006RDFURN\0221The urn of the originating object for this event.'))),
+    _descriptor.FieldDescriptor(
+      name='subject', full_name='Event.subject', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='Event.type', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='stat', full_name='Event.stat', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='Event.id', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=475,
+  serialized_end=696,
+)
+
+_GRAPH.fields_by_name['data'].message_type = _SAMPLE
+_GRAPHFLOAT.fields_by_name['data'].message_type = _SAMPLEFLOAT
+_EVENT.fields_by_name['stat'].message_type = grr__response__proto_dot_jobs__pb2._STATENTRY
+DESCRIPTOR.message_types_by_name['Sample'] = _SAMPLE
+DESCRIPTOR.message_types_by_name['SampleFloat'] = _SAMPLEFLOAT
+DESCRIPTOR.message_types_by_name['Graph'] = _GRAPH
+DESCRIPTOR.message_types_by_name['GraphFloat'] = _GRAPHFLOAT
+DESCRIPTOR.message_types_by_name['Event'] = _EVENT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Sample = _reflection.GeneratedProtocolMessageType('Sample', (_message.Message,), dict(
+  DESCRIPTOR = _SAMPLE,
+  __module__ = 'grr_response_proto.analysis_pb2'
+  # @@protoc_insertion_point(class_scope:Sample)
+  ))
+_sym_db.RegisterMessage(Sample)
+
+SampleFloat = _reflection.GeneratedProtocolMessageType('SampleFloat', (_message.Message,), dict(
+  DESCRIPTOR = _SAMPLEFLOAT,
+  __module__ = 'grr_response_proto.analysis_pb2'
+  # @@protoc_insertion_point(class_scope:SampleFloat)
+  ))
+_sym_db.RegisterMessage(SampleFloat)
+
+Graph = _reflection.GeneratedProtocolMessageType('Graph', (_message.Message,), dict(
+  DESCRIPTOR = _GRAPH,
+  __module__ = 'grr_response_proto.analysis_pb2'
+  # @@protoc_insertion_point(class_scope:Graph)
+  ))
+_sym_db.RegisterMessage(Graph)
+
+GraphFloat = _reflection.GeneratedProtocolMessageType('GraphFloat', (_message.Message,), dict(
+  DESCRIPTOR = _GRAPHFLOAT,
+  __module__ = 'grr_response_proto.analysis_pb2'
+  # @@protoc_insertion_point(class_scope:GraphFloat)
+  ))
+_sym_db.RegisterMessage(GraphFloat)
+
+Event = _reflection.GeneratedProtocolMessageType('Event', (_message.Message,), dict(
+  DESCRIPTOR = _EVENT,
+  __module__ = 'grr_response_proto.analysis_pb2'
+  # @@protoc_insertion_point(class_scope:Event)
+  ))
+_sym_db.RegisterMessage(Event)
+
+
+_EVENT.fields_by_name['timestamp'].has_options = True
+_EVENT.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\n\013RDFDatetime\022\024The event timestamp.'))
+_EVENT.fields_by_name['source'].has_options = True
+_EVENT.fields_by_name['source']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\n\006RDFURN\0221The urn of the originating object for this event.'))
+# @@protoc_insertion_point(module_scope)
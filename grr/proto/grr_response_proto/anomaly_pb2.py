@@ -0,0 +1,222 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/anomaly.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/anomaly.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n grr_response_proto/anomaly.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"\xd0\x08\n\x07\x41nomaly\x12L\n\x04type\x18\x01 \x01(\x0e\x32\x14.Anomaly.AnomalyTypeB(\xe2\xfc\xe3\xc4\x01\"\x12 Type of anomaly this represents.\x12\x62\n\x08severity\x18\x02 \x01(\x0e\x32\x15.Anomaly.AnomalyLevelB9\xe2\xfc\xe3\xc4\x01\x33\x12\x31Severity of the anomaly if it is a true positive.\x12\x62\n\nconfidence\x18\x03 \x01(\x0e\x32\x15.Anomaly.AnomalyLevelB7\xe2\xfc\xe3\xc4\x01\x31\x12/Confidence that the anomaly is a true positive.\x12<\n\x07symptom\x18\x04 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#A description of what is anomalous.\x12{\n\x0b\x65xplanation\x18\x05 \x01(\tBf\xe2\xfc\xe3\xc4\x01`\x12^A description of possible explanations for the anomaly if additional information is available.\x12~\n\x0cgenerated_by\x18\x06 \x01(\tBh\xe2\xfc\xe3\xc4\x01\x62\x12`String describing what generated the anomaly, this is normally the name of a parser or artifact.\x12m\n\x12reference_pathspec\x18\x07 \x01(\x0b\x32\t.PathSpecBF\xe2\xfc\xe3\xc4\x01@\x12>A pathspec pointing to the object where the anomaly was found.\x12\x65\n\x14\x61nomaly_reference_id\x18\x08 \x03(\tBG\xe2\xfc\xe3\xc4\x01\x41\x12?A string used to reference the anomaly in the Anomaly database.\x12P\n\x07\x66inding\x18\t \x03(\tB?\xe2\xfc\xe3\xc4\x01\x39\x12\x37String descriptions of data that triggered the Anomaly.\"e\n\x0c\x41nomalyLevel\x12\x19\n\x15UNKNOWN_ANOMALY_LEVEL\x10\x00\x12\x0c\n\x08VERY_LOW\x10\x01\x12\x07\n\x03LOW\x10\x02\x12\n\n\x06MEDIUM\x10\x03\x12\x08\n\x04HIGH\x10\x04\x12\r\n\tVERY_HIGH\x10\x05\"e\n\x0b\x41nomalyType\x12\x18\n\x14UNKNOWN_ANOMALY_TYPE\x10\x00\x12\x12\n\x0ePARSER_ANOMALY\x10\x01\x12\x14\n\x10\x41NALYSIS_ANOMALY\x10\x02\x12\x12\n\x0eMANUAL_ANOMALY\x10\x03')
+  ,
+  dependencies=[grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_ANOMALY_ANOMALYLEVEL = _descriptor.EnumDescriptor(
+  name='AnomalyLevel',
+  full_name='Anomaly.AnomalyLevel',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN_ANOMALY_LEVEL', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='VERY_LOW', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LOW', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MEDIUM', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='HIGH', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='VERY_HIGH', index=5, number=5,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1003,
+  serialized_end=1104,
+)
+_sym_db.RegisterEnumDescriptor(_ANOMALY_ANOMALYLEVEL)
+
+_ANOMALY_ANOMALYTYPE = _descriptor.EnumDescriptor(
+  name='AnomalyType',
+  full_name='Anomaly.AnomalyType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN_ANOMALY_TYPE', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PARSER_ANOMALY', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ANALYSIS_ANOMALY', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MANUAL_ANOMALY', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1106,
+  serialized_end=1207,
+)
+_sym_db.RegisterEnumDescriptor(_ANOMALY_ANOMALYTYPE)
+
+
+_ANOMALY = _descriptor.Descriptor(
+  name='Anomaly',
+  full_name='Anomaly',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='Anomaly.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 Type of anomaly this represents.'))),
+    _descriptor.FieldDescriptor(
+      name='severity', full_name='Anomaly.severity', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221Severity of the anomaly if it is a true positive.'))),
+    _descriptor.FieldDescriptor(
+      name='confidence', full_name='Anomaly.confidence', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\022/Confidence that the anomaly is a true positive.'))),
+    _descriptor.FieldDescriptor(
+      name='symptom', full_name='Anomaly.symptom', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#A description of what is anomalous.'))),
+    _descriptor.FieldDescriptor(
+      name='explanation', full_name='Anomaly.explanation', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^A description of possible explanations for the anomaly if additional information is available.'))),
+    _descriptor.FieldDescriptor(
+      name='generated_by', full_name='Anomaly.generated_by', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001b\022`String describing what generated the anomaly, this is normally the name of a parser or artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='reference_pathspec', full_name='Anomaly.reference_pathspec', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001@\022>A pathspec pointing to the object where the anomaly was found.'))),
+    _descriptor.FieldDescriptor(
+      name='anomaly_reference_id', full_name='Anomaly.anomaly_reference_id', index=7,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001A\022?A string used to reference the anomaly in the Anomaly database.'))),
+    _descriptor.FieldDescriptor(
+      name='finding', full_name='Anomaly.finding', index=8,
+      number=9, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227String descriptions of data that triggered the Anomaly.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _ANOMALY_ANOMALYLEVEL,
+    _ANOMALY_ANOMALYTYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=103,
+  serialized_end=1207,
+)
+
+_ANOMALY.fields_by_name['type'].enum_type = _ANOMALY_ANOMALYTYPE
+_ANOMALY.fields_by_name['severity'].enum_type = _ANOMALY_ANOMALYLEVEL
+_ANOMALY.fields_by_name['confidence'].enum_type = _ANOMALY_ANOMALYLEVEL
+_ANOMALY.fields_by_name['reference_pathspec'].message_type = grr__response__proto_dot_jobs__pb2._PATHSPEC
+_ANOMALY_ANOMALYLEVEL.containing_type = _ANOMALY
+_ANOMALY_ANOMALYTYPE.containing_type = _ANOMALY
+DESCRIPTOR.message_types_by_name['Anomaly'] = _ANOMALY
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Anomaly = _reflection.GeneratedProtocolMessageType('Anomaly', (_message.Message,), dict(
+  DESCRIPTOR = _ANOMALY,
+  __module__ = 'grr_response_proto.anomaly_pb2'
+  # @@protoc_insertion_point(class_scope:Anomaly)
+  ))
+_sym_db.RegisterMessage(Anomaly)
+
+
+_ANOMALY.fields_by_name['type'].has_options = True
+_ANOMALY.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 Type of anomaly this represents.'))
+_ANOMALY.fields_by_name['severity'].has_options = True
+_ANOMALY.fields_by_name['severity']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221Severity of the anomaly if it is a true positive.'))
+_ANOMALY.fields_by_name['confidence'].has_options = True
+_ANOMALY.fields_by_name['confidence']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\022/Confidence that the anomaly is a true positive.'))
+_ANOMALY.fields_by_name['symptom'].has_options = True
+_ANOMALY.fields_by_name['symptom']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#A description of what is anomalous.'))
+_ANOMALY.fields_by_name['explanation'].has_options = True
+_ANOMALY.fields_by_name['explanation']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^A description of possible explanations for the anomaly if additional information is available.'))
+_ANOMALY.fields_by_name['generated_by'].has_options = True
+_ANOMALY.fields_by_name['generated_by']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001b\022`String describing what generated the anomaly, this is normally the name of a parser or artifact.'))
+_ANOMALY.fields_by_name['reference_pathspec'].has_options = True
+_ANOMALY.fields_by_name['reference_pathspec']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001@\022>A pathspec pointing to the object where the anomaly was found.'))
+_ANOMALY.fields_by_name['anomaly_reference_id'].has_options = True
+_ANOMALY.fields_by_name['anomaly_reference_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001A\022?A string used to reference the anomaly in the Anomaly database.'))
+_ANOMALY.fields_by_name['finding'].has_options = True
+_ANOMALY.fields_by_name['finding']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227String descriptions of data that triggered the Anomaly.'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,483 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/config.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/config.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n#grr_response_proto/api/config.proto\x1a\x19google/protobuf/any.proto\x1a!grr_response_proto/semantic.proto\"\xcd\x03\n\x0c\x41piGrrBinary\x12\x63\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeBA\xe2\xfc\xe3\xc4\x01;\x12\x39\x42inary type. Together with path it identifies the binary.\x12V\n\x04path\x18\x02 \x01(\tBH\xe2\xfc\xe3\xc4\x01\x42\x12@Binary path. Together with binary type it identifies the binary.\x12,\n\x04size\x18\x03 \x01(\x04\x42\x1e\xe2\xfc\xe3\xc4\x01\x18\n\x08\x42yteSize\x12\x0c\x42inary size.\x12@\n\ttimestamp\x18\x04 \x01(\x04\x42-\xe2\xfc\xe3\xc4\x01\'\n\x0bRDFDatetime\x12\x18\x42inary upload timestamp.\x12M\n\x13has_valid_signature\x18\x05 \x01(\x08\x42\x30\xe2\xfc\xe3\xc4\x01*\x12(True, if the binary is correctly signed.\"A\n\x04Type\x12\x0f\n\x0bPYTHON_HACK\x10\x01\x12\x0e\n\nEXECUTABLE\x10\x02\x12\x18\n\x14\x43OMPONENT_DEPRECATED\x10\x03\"\xaa\x02\n\x0f\x41piConfigOption\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bis_redacted\x18\x02 \x01(\x08\x12P\n\x05value\x18\x03 \x01(\x0b\x32\x14.google.protobuf.AnyB+\xe2\xfc\xe3\xc4\x01%\x12\x14\x43onfig option value.*\rGetValueClass\x12,\n\x04type\x18\x04 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16The type of the value.\x12t\n\nis_invalid\x18\x05 \x01(\x08\x42`\xe2\xfc\xe3\xc4\x01Z\x12XWhether the value could be successfully serialized to the protobuf serialization format.\"C\n\x10\x41piConfigSection\x12\x0c\n\x04name\x18\x01 \x01(\t\x12!\n\x07options\x18\x02 \x03(\x0b\x32\x10.ApiConfigOption\"9\n\x12\x41piGetConfigResult\x12#\n\x08sections\x18\x01 \x03(\x0b\x32\x11.ApiConfigSection\"S\n\x16\x41piGetConfigOptionArgs\x12\x39\n\x04name\x18\x01 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Name of the config option to fetch.\"8\n\x18\x41piListGrrBinariesResult\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.ApiGrrBinary\"q\n\x13\x41piGetGrrBinaryArgs\x12\x36\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary type.\x12\"\n\x04path\x18\x02 \x01(\tB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary path.\"u\n\x17\x41piGetGrrBinaryBlobArgs\x12\x36\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary type.\x12\"\n\x04path\x18\x02 \x01(\tB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary path.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIGRRBINARY_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='ApiGrrBinary.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PYTHON_HACK', index=0, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EXECUTABLE', index=1, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMPONENT_DEPRECATED', index=2, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=498,
+  serialized_end=563,
+)
+_sym_db.RegisterEnumDescriptor(_APIGRRBINARY_TYPE)
+
+
+_APIGRRBINARY = _descriptor.Descriptor(
+  name='ApiGrrBinary',
+  full_name='ApiGrrBinary',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGrrBinary.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiGrrBinary.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='ApiGrrBinary.size', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\n\010ByteSize\022\014Binary size.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGrrBinary.timestamp', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\n\013RDFDatetime\022\030Binary upload timestamp.'))),
+    _descriptor.FieldDescriptor(
+      name='has_valid_signature', full_name='ApiGrrBinary.has_valid_signature', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(True, if the binary is correctly signed.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGRRBINARY_TYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=102,
+  serialized_end=563,
+)
+
+
+_APICONFIGOPTION = _descriptor.Descriptor(
+  name='ApiConfigOption',
+  full_name='ApiConfigOption',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiConfigOption.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_redacted', full_name='ApiConfigOption.is_redacted', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiConfigOption.value', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022\024Config option value.*\rGetValueClass'))),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiConfigOption.type', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026The type of the value.'))),
+    _descriptor.FieldDescriptor(
+      name='is_invalid', full_name='ApiConfigOption.is_invalid', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001Z\022XWhether the value could be successfully serialized to the protobuf serialization format.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=566,
+  serialized_end=864,
+)
+
+
+_APICONFIGSECTION = _descriptor.Descriptor(
+  name='ApiConfigSection',
+  full_name='ApiConfigSection',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiConfigSection.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='ApiConfigSection.options', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=866,
+  serialized_end=933,
+)
+
+
+_APIGETCONFIGRESULT = _descriptor.Descriptor(
+  name='ApiGetConfigResult',
+  full_name='ApiGetConfigResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sections', full_name='ApiGetConfigResult.sections', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=935,
+  serialized_end=992,
+)
+
+
+_APIGETCONFIGOPTIONARGS = _descriptor.Descriptor(
+  name='ApiGetConfigOptionArgs',
+  full_name='ApiGetConfigOptionArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiGetConfigOptionArgs.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Name of the config option to fetch.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=994,
+  serialized_end=1077,
+)
+
+
+_APILISTGRRBINARIESRESULT = _descriptor.Descriptor(
+  name='ApiListGrrBinariesResult',
+  full_name='ApiListGrrBinariesResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListGrrBinariesResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1079,
+  serialized_end=1135,
+)
+
+
+_APIGETGRRBINARYARGS = _descriptor.Descriptor(
+  name='ApiGetGrrBinaryArgs',
+  full_name='ApiGetGrrBinaryArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGetGrrBinaryArgs.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary type.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiGetGrrBinaryArgs.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary path.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1137,
+  serialized_end=1250,
+)
+
+
+_APIGETGRRBINARYBLOBARGS = _descriptor.Descriptor(
+  name='ApiGetGrrBinaryBlobArgs',
+  full_name='ApiGetGrrBinaryBlobArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGetGrrBinaryBlobArgs.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary type.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiGetGrrBinaryBlobArgs.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary path.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1252,
+  serialized_end=1369,
+)
+
+_APIGRRBINARY.fields_by_name['type'].enum_type = _APIGRRBINARY_TYPE
+_APIGRRBINARY_TYPE.containing_type = _APIGRRBINARY
+_APICONFIGOPTION.fields_by_name['value'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APICONFIGSECTION.fields_by_name['options'].message_type = _APICONFIGOPTION
+_APIGETCONFIGRESULT.fields_by_name['sections'].message_type = _APICONFIGSECTION
+_APILISTGRRBINARIESRESULT.fields_by_name['items'].message_type = _APIGRRBINARY
+_APIGETGRRBINARYARGS.fields_by_name['type'].enum_type = _APIGRRBINARY_TYPE
+_APIGETGRRBINARYBLOBARGS.fields_by_name['type'].enum_type = _APIGRRBINARY_TYPE
+DESCRIPTOR.message_types_by_name['ApiGrrBinary'] = _APIGRRBINARY
+DESCRIPTOR.message_types_by_name['ApiConfigOption'] = _APICONFIGOPTION
+DESCRIPTOR.message_types_by_name['ApiConfigSection'] = _APICONFIGSECTION
+DESCRIPTOR.message_types_by_name['ApiGetConfigResult'] = _APIGETCONFIGRESULT
+DESCRIPTOR.message_types_by_name['ApiGetConfigOptionArgs'] = _APIGETCONFIGOPTIONARGS
+DESCRIPTOR.message_types_by_name['ApiListGrrBinariesResult'] = _APILISTGRRBINARIESRESULT
+DESCRIPTOR.message_types_by_name['ApiGetGrrBinaryArgs'] = _APIGETGRRBINARYARGS
+DESCRIPTOR.message_types_by_name['ApiGetGrrBinaryBlobArgs'] = _APIGETGRRBINARYBLOBARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiGrrBinary = _reflection.GeneratedProtocolMessageType('ApiGrrBinary', (_message.Message,), dict(
+  DESCRIPTOR = _APIGRRBINARY,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGrrBinary)
+  ))
+_sym_db.RegisterMessage(ApiGrrBinary)
+
+ApiConfigOption = _reflection.GeneratedProtocolMessageType('ApiConfigOption', (_message.Message,), dict(
+  DESCRIPTOR = _APICONFIGOPTION,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiConfigOption)
+  ))
+_sym_db.RegisterMessage(ApiConfigOption)
+
+ApiConfigSection = _reflection.GeneratedProtocolMessageType('ApiConfigSection', (_message.Message,), dict(
+  DESCRIPTOR = _APICONFIGSECTION,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiConfigSection)
+  ))
+_sym_db.RegisterMessage(ApiConfigSection)
+
+ApiGetConfigResult = _reflection.GeneratedProtocolMessageType('ApiGetConfigResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETCONFIGRESULT,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetConfigResult)
+  ))
+_sym_db.RegisterMessage(ApiGetConfigResult)
+
+ApiGetConfigOptionArgs = _reflection.GeneratedProtocolMessageType('ApiGetConfigOptionArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETCONFIGOPTIONARGS,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetConfigOptionArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetConfigOptionArgs)
+
+ApiListGrrBinariesResult = _reflection.GeneratedProtocolMessageType('ApiListGrrBinariesResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTGRRBINARIESRESULT,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListGrrBinariesResult)
+  ))
+_sym_db.RegisterMessage(ApiListGrrBinariesResult)
+
+ApiGetGrrBinaryArgs = _reflection.GeneratedProtocolMessageType('ApiGetGrrBinaryArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETGRRBINARYARGS,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetGrrBinaryArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetGrrBinaryArgs)
+
+ApiGetGrrBinaryBlobArgs = _reflection.GeneratedProtocolMessageType('ApiGetGrrBinaryBlobArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETGRRBINARYBLOBARGS,
+  __module__ = 'grr_response_proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetGrrBinaryBlobArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetGrrBinaryBlobArgs)
+
+
+_APIGRRBINARY.fields_by_name['type'].has_options = True
+_APIGRRBINARY.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))
+_APIGRRBINARY.fields_by_name['path'].has_options = True
+_APIGRRBINARY.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))
+_APIGRRBINARY.fields_by_name['size'].has_options = True
+_APIGRRBINARY.fields_by_name['size']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\n\010ByteSize\022\014Binary size.'))
+_APIGRRBINARY.fields_by_name['timestamp'].has_options = True
+_APIGRRBINARY.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\n\013RDFDatetime\022\030Binary upload timestamp.'))
+_APIGRRBINARY.fields_by_name['has_valid_signature'].has_options = True
+_APIGRRBINARY.fields_by_name['has_valid_signature']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(True, if the binary is correctly signed.'))
+_APICONFIGOPTION.fields_by_name['value'].has_options = True
+_APICONFIGOPTION.fields_by_name['value']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022\024Config option value.*\rGetValueClass'))
+_APICONFIGOPTION.fields_by_name['type'].has_options = True
+_APICONFIGOPTION.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026The type of the value.'))
+_APICONFIGOPTION.fields_by_name['is_invalid'].has_options = True
+_APICONFIGOPTION.fields_by_name['is_invalid']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001Z\022XWhether the value could be successfully serialized to the protobuf serialization format.'))
+_APIGETCONFIGOPTIONARGS.fields_by_name['name'].has_options = True
+_APIGETCONFIGOPTIONARGS.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Name of the config option to fetch.'))
+_APIGETGRRBINARYARGS.fields_by_name['type'].has_options = True
+_APIGETGRRBINARYARGS.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary type.'))
+_APIGETGRRBINARYARGS.fields_by_name['path'].has_options = True
+_APIGETGRRBINARYARGS.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary path.'))
+_APIGETGRRBINARYBLOBARGS.fields_by_name['type'].has_options = True
+_APIGETGRRBINARYBLOBARGS.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary type.'))
+_APIGETGRRBINARYBLOBARGS.fields_by_name['path'].has_options = True
+_APIGETGRRBINARYBLOBARGS.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Binary path.'))
+# @@protoc_insertion_point(module_scope)
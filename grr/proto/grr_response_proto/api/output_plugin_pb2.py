@@ -0,0 +1,105 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/output_plugin.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr_response_proto import output_plugin_pb2 as grr__response__proto_dot_output__plugin__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/output_plugin.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n*grr_response_proto/api/output_plugin.proto\x1a\x19google/protobuf/any.proto\x1a&grr_response_proto/output_plugin.proto\x1a!grr_response_proto/semantic.proto\"\xd7\x05\n\x0f\x41piOutputPlugin\x12\x39\n\x02id\x18\x01 \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%String identifying the output plugin.\x12\\\n\x11plugin_descriptor\x18\x02 \x01(\x0b\x32\x17.OutputPluginDescriptorB(\xe2\xfc\xe3\xc4\x01\"\x12 Descriptor of the output plugin.\x12P\n\x05state\x18\x03 \x01(\x0b\x32\x14.google.protobuf.AnyB+\xe2\xfc\xe3\xc4\x01%\x12\x14State of the plugin.*\rGetStateClass\x12\xd8\x03\n\x18last_verification_result\x18\x04 \x01(\x0b\x32\x1f.OutputPluginVerificationResultB\x94\x03\xe2\xfc\xe3\xc4\x01\x8d\x03\x12\x8a\x03Results of the last verification check done on the output of this plugin. Verification checks check that expected output exists and that it\'s complete. Not all output plugins support verification. For example CSV and Email plugins output can\'t be verified. On the other hand, BigQuery output can be verified, as BigQuery service can be queried for the results that were supposed to be uploaded.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr__response__proto_dot_output__plugin__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_APIOUTPUTPLUGIN = _descriptor.Descriptor(
+  name='ApiOutputPlugin',
+  full_name='ApiOutputPlugin',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='ApiOutputPlugin.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%String identifying the output plugin.'))),
+    _descriptor.FieldDescriptor(
+      name='plugin_descriptor', full_name='ApiOutputPlugin.plugin_descriptor', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 Descriptor of the output plugin.'))),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ApiOutputPlugin.state', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022\024State of the plugin.*\rGetStateClass'))),
+    _descriptor.FieldDescriptor(
+      name='last_verification_result', full_name='ApiOutputPlugin.last_verification_result', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\215\003\022\212\003Results of the last verification check done on the output of this plugin. Verification checks check that expected output exists and that it\'s complete. Not all output plugins support verification. For example CSV and Email plugins output can\'t be verified. On the other hand, BigQuery output can be verified, as BigQuery service can be queried for the results that were supposed to be uploaded.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=149,
+  serialized_end=876,
+)
+
+_APIOUTPUTPLUGIN.fields_by_name['plugin_descriptor'].message_type = grr__response__proto_dot_output__plugin__pb2._OUTPUTPLUGINDESCRIPTOR
+_APIOUTPUTPLUGIN.fields_by_name['state'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIOUTPUTPLUGIN.fields_by_name['last_verification_result'].message_type = grr__response__proto_dot_output__plugin__pb2._OUTPUTPLUGINVERIFICATIONRESULT
+DESCRIPTOR.message_types_by_name['ApiOutputPlugin'] = _APIOUTPUTPLUGIN
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiOutputPlugin = _reflection.GeneratedProtocolMessageType('ApiOutputPlugin', (_message.Message,), dict(
+  DESCRIPTOR = _APIOUTPUTPLUGIN,
+  __module__ = 'grr_response_proto.api.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:ApiOutputPlugin)
+  ))
+_sym_db.RegisterMessage(ApiOutputPlugin)
+
+
+_APIOUTPUTPLUGIN.fields_by_name['id'].has_options = True
+_APIOUTPUTPLUGIN.fields_by_name['id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%String identifying the output plugin.'))
+_APIOUTPUTPLUGIN.fields_by_name['plugin_descriptor'].has_options = True
+_APIOUTPUTPLUGIN.fields_by_name['plugin_descriptor']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 Descriptor of the output plugin.'))
+_APIOUTPUTPLUGIN.fields_by_name['state'].has_options = True
+_APIOUTPUTPLUGIN.fields_by_name['state']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022\024State of the plugin.*\rGetStateClass'))
+_APIOUTPUTPLUGIN.fields_by_name['last_verification_result'].has_options = True
+_APIOUTPUTPLUGIN.fields_by_name['last_verification_result']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\215\003\022\212\003Results of the last verification check done on the output of this plugin. Verification checks check that expected output exists and that it\'s complete. Not all output plugins support verification. For example CSV and Email plugins output can\'t be verified. On the other hand, BigQuery output can be verified, as BigQuery service can be queried for the results that were supposed to be uploaded.'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,819 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/reflection.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/reflection.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n\'grr_response_proto/api/reflection.proto\x1a\x19google/protobuf/any.proto\x1a!grr_response_proto/semantic.proto\"\xdf\x01\n ApiRDFAllowedEnumValueDescriptor\x12&\n\x04name\x18\x01 \x01(\tB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10\x45num value name.\x12(\n\x05value\x18\x02 \x01(\x03\x42\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11\x45num value value.\x12*\n\x03\x64oc\x18\x03 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15\x44ocumentation string.\x12=\n\x06labels\x18\x04 \x03(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%List of labels applied to this value.\"\xd7\x06\n\x1a\x41piRDFValueFieldDescriptor\x12!\n\x04name\x18\x01 \x01(\tB\x13\xe2\xfc\xe3\xc4\x01\r\x12\x0b\x46ield name.\x12\x39\n\x04type\x18\x02 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Field type (an RDFValue type name).\x12#\n\x05index\x18\x03 \x01(\rB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x46ield index.\x12:\n\x08repeated\x18\x04 \x01(\x08\x42(\xe2\xfc\xe3\xc4\x01\"\x12 If the field is repeated or not.\x12M\n\x07\x64ynamic\x18\x05 \x01(\x08\x42<\xe2\xfc\xe3\xc4\x01\x36\x12\x34If the field has a dynamically changing type or not.\x12*\n\x03\x64oc\x18\x06 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15\x44ocumentation string.\x12P\n\rfriendly_name\x18\x07 \x01(\tB9\xe2\xfc\xe3\xc4\x01\x33\x12\x31\x46riendly name of the field to be shown in the UI.\x12I\n\x10\x63ontext_help_url\x18\x08 \x01(\tB/\xe2\xfc\xe3\xc4\x01)\x12\'Context help URL to be shown in the UI.\x12_\n\x07\x64\x65\x66\x61ult\x18\t \x01(\x0b\x32\x14.google.protobuf.AnyB8\xe2\xfc\xe3\xc4\x01\x32\x12\x1aRecommended default value.*\x14GetDefaultValueClass\x12=\n\x06labels\x18\n \x03(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%List of labels applied to this field.\x12\xc1\x01\n\x0e\x61llowed_values\x18\x0b \x03(\x0b\x32!.ApiRDFAllowedEnumValueDescriptorB\x85\x01\xe2\xfc\xe3\xc4\x01\x7f\x12}Allowed enum values. Applicable only to enum fields. If this list is not empty, then this descriptor describes an enum field.\"\xce\x05\n\x15\x41piRDFValueDescriptor\x12 \n\x04name\x18\x01 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nType name.\x12=\n\x03\x64oc\x18\x02 \x01(\tB0\xe2\xfc\xe3\xc4\x01*\x12(Human-readable description of this type.\x12t\n\x04kind\x18\x03 \x01(\x0e\x32\x1b.ApiRDFValueDescriptor.KindBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41Indicates whether the value is a primitive value, or a structure.\x12_\n\x07\x64\x65\x66\x61ult\x18\x04 \x01(\x0b\x32\x14.google.protobuf.AnyB8\xe2\xfc\xe3\xc4\x01\x32\x12\x1aRecommended default value.*\x14GetDefaultValueClass\x12\x38\n\x07parents\x18\x05 \x03(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fInheritance chain of this type.\x12\x8b\x01\n\x06\x66ields\x18\x06 \x03(\x0b\x32\x1b.ApiRDFValueFieldDescriptorB^\xe2\xfc\xe3\xc4\x01X\x12VDescriptors of all the fields of this type. Only applicable to types with kind=STRUCT.\x12\x91\x01\n\x10union_field_name\x18\x07 \x01(\tBw\xe2\xfc\xe3\xc4\x01q\x12oIf this structure is a union, union_field identifies the field that determines which part of the union is used.\"!\n\x04Kind\x12\r\n\tPRIMITIVE\x10\x00\x12\n\n\x06STRUCT\x10\x01\"\xb2\x02\n\tApiMethod\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0b\n\x03\x64oc\x18\x03 \x01(\t\x12\x12\n\nhttp_route\x18\x04 \x01(\t\x12\x14\n\x0chttp_methods\x18\x05 \x03(\t\x12\x34\n\x14\x61rgs_type_descriptor\x18\x06 \x01(\x0b\x32\x16.ApiRDFValueDescriptor\x12*\n\x0bresult_kind\x18\x07 \x01(\x0e\x32\x15.ApiMethod.ResultKind\x12\x36\n\x16result_type_descriptor\x18\x08 \x01(\x0b\x32\x16.ApiRDFValueDescriptor\"4\n\nResultKind\x12\x08\n\x04NONE\x10\x00\x12\t\n\x05VALUE\x10\x01\x12\x11\n\rBINARY_STREAM\x10\x02\"\x9b\x03\n\x19\x41piOutputPluginDescriptor\x12:\n\x0bplugin_type\x18\x04 \x01(\x0e\x32%.ApiOutputPluginDescriptor.PluginType\x12+\n\x04name\x18\x01 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Output plugin\'s name.\x12J\n\rfriendly_name\x18\x05 \x01(\tB3\xe2\xfc\xe3\xc4\x01-\x12+Human readable output plugin\'s description.\x12H\n\x0b\x64\x65scription\x18\x02 \x01(\tB3\xe2\xfc\xe3\xc4\x01-\x12+Human readable output plugin\'s description.\x12N\n\targs_type\x18\x03 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\x12\x33RDF type of the arguments that output plugin takes.\"/\n\nPluginType\x12\n\n\x06LEGACY\x10\x00\x12\x0b\n\x07INSTANT\x10\x01\x12\x08\n\x04LIVE\x10\x02\"I\n\x1c\x41piGetRDFValueDescriptorArgs\x12)\n\x04type\x18\x01 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13RDFValue type name.\"I\n ApiListRDFValueDescriptorsResult\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ApiRDFValueDescriptor\"*\n\x1a\x41piAff4AttributeDescriptor\x12\x0c\n\x04name\x18\x01 \x01(\t\"S\n%ApiListAff4AttributeDescriptorsResult\x12*\n\x05items\x18\x01 \x03(\x0b\x32\x1b.ApiAff4AttributeDescriptor\"Q\n$ApiListOutputPluginDescriptorsResult\x12)\n\x05items\x18\x01 \x03(\x0b\x32\x1a.ApiOutputPluginDescriptor\"4\n\x17\x41piListApiMethodsResult\x12\x19\n\x05items\x18\x01 \x03(\x0b\x32\n.ApiMethod')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIRDFVALUEDESCRIPTOR_KIND = _descriptor.EnumDescriptor(
+  name='Kind',
+  full_name='ApiRDFValueDescriptor.Kind',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PRIMITIVE', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STRUCT', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1875,
+  serialized_end=1908,
+)
+_sym_db.RegisterEnumDescriptor(_APIRDFVALUEDESCRIPTOR_KIND)
+
+_APIMETHOD_RESULTKIND = _descriptor.EnumDescriptor(
+  name='ResultKind',
+  full_name='ApiMethod.ResultKind',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NONE', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='VALUE', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BINARY_STREAM', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2165,
+  serialized_end=2217,
+)
+_sym_db.RegisterEnumDescriptor(_APIMETHOD_RESULTKIND)
+
+_APIOUTPUTPLUGINDESCRIPTOR_PLUGINTYPE = _descriptor.EnumDescriptor(
+  name='PluginType',
+  full_name='ApiOutputPluginDescriptor.PluginType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='LEGACY', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INSTANT', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LIVE', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2584,
+  serialized_end=2631,
+)
+_sym_db.RegisterEnumDescriptor(_APIOUTPUTPLUGINDESCRIPTOR_PLUGINTYPE)
+
+
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiRDFAllowedEnumValueDescriptor',
+  full_name='ApiRDFAllowedEnumValueDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiRDFAllowedEnumValueDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Enum value name.'))),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiRDFAllowedEnumValueDescriptor.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021Enum value value.'))),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ApiRDFAllowedEnumValueDescriptor.doc', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Documentation string.'))),
+    _descriptor.FieldDescriptor(
+      name='labels', full_name='ApiRDFAllowedEnumValueDescriptor.labels', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%List of labels applied to this value.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=106,
+  serialized_end=329,
+)
+
+
+_APIRDFVALUEFIELDDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiRDFValueFieldDescriptor',
+  full_name='ApiRDFValueFieldDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiRDFValueFieldDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\022\013Field name.'))),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiRDFValueFieldDescriptor.type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Field type (an RDFValue type name).'))),
+    _descriptor.FieldDescriptor(
+      name='index', full_name='ApiRDFValueFieldDescriptor.index', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Field index.'))),
+    _descriptor.FieldDescriptor(
+      name='repeated', full_name='ApiRDFValueFieldDescriptor.repeated', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 If the field is repeated or not.'))),
+    _descriptor.FieldDescriptor(
+      name='dynamic', full_name='ApiRDFValueFieldDescriptor.dynamic', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224If the field has a dynamically changing type or not.'))),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ApiRDFValueFieldDescriptor.doc', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Documentation string.'))),
+    _descriptor.FieldDescriptor(
+      name='friendly_name', full_name='ApiRDFValueFieldDescriptor.friendly_name', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221Friendly name of the field to be shown in the UI.'))),
+    _descriptor.FieldDescriptor(
+      name='context_help_url', full_name='ApiRDFValueFieldDescriptor.context_help_url', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'Context help URL to be shown in the UI.'))),
+    _descriptor.FieldDescriptor(
+      name='default', full_name='ApiRDFValueFieldDescriptor.default', index=8,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\022\032Recommended default value.*\024GetDefaultValueClass'))),
+    _descriptor.FieldDescriptor(
+      name='labels', full_name='ApiRDFValueFieldDescriptor.labels', index=9,
+      number=10, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%List of labels applied to this field.'))),
+    _descriptor.FieldDescriptor(
+      name='allowed_values', full_name='ApiRDFValueFieldDescriptor.allowed_values', index=10,
+      number=11, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\177\022}Allowed enum values. Applicable only to enum fields. If this list is not empty, then this descriptor describes an enum field.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=332,
+  serialized_end=1187,
+)
+
+
+_APIRDFVALUEDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiRDFValueDescriptor',
+  full_name='ApiRDFValueDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiRDFValueDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nType name.'))),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ApiRDFValueDescriptor.doc', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(Human-readable description of this type.'))),
+    _descriptor.FieldDescriptor(
+      name='kind', full_name='ApiRDFValueDescriptor.kind', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022AIndicates whether the value is a primitive value, or a structure.'))),
+    _descriptor.FieldDescriptor(
+      name='default', full_name='ApiRDFValueDescriptor.default', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\022\032Recommended default value.*\024GetDefaultValueClass'))),
+    _descriptor.FieldDescriptor(
+      name='parents', full_name='ApiRDFValueDescriptor.parents', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037Inheritance chain of this type.'))),
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='ApiRDFValueDescriptor.fields', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001X\022VDescriptors of all the fields of this type. Only applicable to types with kind=STRUCT.'))),
+    _descriptor.FieldDescriptor(
+      name='union_field_name', full_name='ApiRDFValueDescriptor.union_field_name', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001q\022oIf this structure is a union, union_field identifies the field that determines which part of the union is used.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIRDFVALUEDESCRIPTOR_KIND,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1190,
+  serialized_end=1908,
+)
+
+
+_APIMETHOD = _descriptor.Descriptor(
+  name='ApiMethod',
+  full_name='ApiMethod',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiMethod.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='category', full_name='ApiMethod.category', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ApiMethod.doc', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='http_route', full_name='ApiMethod.http_route', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='http_methods', full_name='ApiMethod.http_methods', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='args_type_descriptor', full_name='ApiMethod.args_type_descriptor', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='result_kind', full_name='ApiMethod.result_kind', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='result_type_descriptor', full_name='ApiMethod.result_type_descriptor', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIMETHOD_RESULTKIND,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1911,
+  serialized_end=2217,
+)
+
+
+_APIOUTPUTPLUGINDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiOutputPluginDescriptor',
+  full_name='ApiOutputPluginDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='plugin_type', full_name='ApiOutputPluginDescriptor.plugin_type', index=0,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiOutputPluginDescriptor.name', index=1,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Output plugin\'s name.'))),
+    _descriptor.FieldDescriptor(
+      name='friendly_name', full_name='ApiOutputPluginDescriptor.friendly_name', index=2,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022+Human readable output plugin\'s description.'))),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='ApiOutputPluginDescriptor.description', index=3,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022+Human readable output plugin\'s description.'))),
+    _descriptor.FieldDescriptor(
+      name='args_type', full_name='ApiOutputPluginDescriptor.args_type', index=4,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223RDF type of the arguments that output plugin takes.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIOUTPUTPLUGINDESCRIPTOR_PLUGINTYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2220,
+  serialized_end=2631,
+)
+
+
+_APIGETRDFVALUEDESCRIPTORARGS = _descriptor.Descriptor(
+  name='ApiGetRDFValueDescriptorArgs',
+  full_name='ApiGetRDFValueDescriptorArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGetRDFValueDescriptorArgs.type', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023RDFValue type name.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2633,
+  serialized_end=2706,
+)
+
+
+_APILISTRDFVALUEDESCRIPTORSRESULT = _descriptor.Descriptor(
+  name='ApiListRDFValueDescriptorsResult',
+  full_name='ApiListRDFValueDescriptorsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListRDFValueDescriptorsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2708,
+  serialized_end=2781,
+)
+
+
+_APIAFF4ATTRIBUTEDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiAff4AttributeDescriptor',
+  full_name='ApiAff4AttributeDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiAff4AttributeDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2783,
+  serialized_end=2825,
+)
+
+
+_APILISTAFF4ATTRIBUTEDESCRIPTORSRESULT = _descriptor.Descriptor(
+  name='ApiListAff4AttributeDescriptorsResult',
+  full_name='ApiListAff4AttributeDescriptorsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListAff4AttributeDescriptorsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2827,
+  serialized_end=2910,
+)
+
+
+_APILISTOUTPUTPLUGINDESCRIPTORSRESULT = _descriptor.Descriptor(
+  name='ApiListOutputPluginDescriptorsResult',
+  full_name='ApiListOutputPluginDescriptorsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListOutputPluginDescriptorsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2912,
+  serialized_end=2993,
+)
+
+
+_APILISTAPIMETHODSRESULT = _descriptor.Descriptor(
+  name='ApiListApiMethodsResult',
+  full_name='ApiListApiMethodsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListApiMethodsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2995,
+  serialized_end=3047,
+)
+
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['default'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['allowed_values'].message_type = _APIRDFALLOWEDENUMVALUEDESCRIPTOR
+_APIRDFVALUEDESCRIPTOR.fields_by_name['kind'].enum_type = _APIRDFVALUEDESCRIPTOR_KIND
+_APIRDFVALUEDESCRIPTOR.fields_by_name['default'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIRDFVALUEDESCRIPTOR.fields_by_name['fields'].message_type = _APIRDFVALUEFIELDDESCRIPTOR
+_APIRDFVALUEDESCRIPTOR_KIND.containing_type = _APIRDFVALUEDESCRIPTOR
+_APIMETHOD.fields_by_name['args_type_descriptor'].message_type = _APIRDFVALUEDESCRIPTOR
+_APIMETHOD.fields_by_name['result_kind'].enum_type = _APIMETHOD_RESULTKIND
+_APIMETHOD.fields_by_name['result_type_descriptor'].message_type = _APIRDFVALUEDESCRIPTOR
+_APIMETHOD_RESULTKIND.containing_type = _APIMETHOD
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['plugin_type'].enum_type = _APIOUTPUTPLUGINDESCRIPTOR_PLUGINTYPE
+_APIOUTPUTPLUGINDESCRIPTOR_PLUGINTYPE.containing_type = _APIOUTPUTPLUGINDESCRIPTOR
+_APILISTRDFVALUEDESCRIPTORSRESULT.fields_by_name['items'].message_type = _APIRDFVALUEDESCRIPTOR
+_APILISTAFF4ATTRIBUTEDESCRIPTORSRESULT.fields_by_name['items'].message_type = _APIAFF4ATTRIBUTEDESCRIPTOR
+_APILISTOUTPUTPLUGINDESCRIPTORSRESULT.fields_by_name['items'].message_type = _APIOUTPUTPLUGINDESCRIPTOR
+_APILISTAPIMETHODSRESULT.fields_by_name['items'].message_type = _APIMETHOD
+DESCRIPTOR.message_types_by_name['ApiRDFAllowedEnumValueDescriptor'] = _APIRDFALLOWEDENUMVALUEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiRDFValueFieldDescriptor'] = _APIRDFVALUEFIELDDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiRDFValueDescriptor'] = _APIRDFVALUEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiMethod'] = _APIMETHOD
+DESCRIPTOR.message_types_by_name['ApiOutputPluginDescriptor'] = _APIOUTPUTPLUGINDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiGetRDFValueDescriptorArgs'] = _APIGETRDFVALUEDESCRIPTORARGS
+DESCRIPTOR.message_types_by_name['ApiListRDFValueDescriptorsResult'] = _APILISTRDFVALUEDESCRIPTORSRESULT
+DESCRIPTOR.message_types_by_name['ApiAff4AttributeDescriptor'] = _APIAFF4ATTRIBUTEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiListAff4AttributeDescriptorsResult'] = _APILISTAFF4ATTRIBUTEDESCRIPTORSRESULT
+DESCRIPTOR.message_types_by_name['ApiListOutputPluginDescriptorsResult'] = _APILISTOUTPUTPLUGINDESCRIPTORSRESULT
+DESCRIPTOR.message_types_by_name['ApiListApiMethodsResult'] = _APILISTAPIMETHODSRESULT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiRDFAllowedEnumValueDescriptor = _reflection.GeneratedProtocolMessageType('ApiRDFAllowedEnumValueDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIRDFALLOWEDENUMVALUEDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiRDFAllowedEnumValueDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiRDFAllowedEnumValueDescriptor)
+
+ApiRDFValueFieldDescriptor = _reflection.GeneratedProtocolMessageType('ApiRDFValueFieldDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIRDFVALUEFIELDDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiRDFValueFieldDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiRDFValueFieldDescriptor)
+
+ApiRDFValueDescriptor = _reflection.GeneratedProtocolMessageType('ApiRDFValueDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIRDFVALUEDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiRDFValueDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiRDFValueDescriptor)
+
+ApiMethod = _reflection.GeneratedProtocolMessageType('ApiMethod', (_message.Message,), dict(
+  DESCRIPTOR = _APIMETHOD,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiMethod)
+  ))
+_sym_db.RegisterMessage(ApiMethod)
+
+ApiOutputPluginDescriptor = _reflection.GeneratedProtocolMessageType('ApiOutputPluginDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIOUTPUTPLUGINDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiOutputPluginDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiOutputPluginDescriptor)
+
+ApiGetRDFValueDescriptorArgs = _reflection.GeneratedProtocolMessageType('ApiGetRDFValueDescriptorArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETRDFVALUEDESCRIPTORARGS,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetRDFValueDescriptorArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetRDFValueDescriptorArgs)
+
+ApiListRDFValueDescriptorsResult = _reflection.GeneratedProtocolMessageType('ApiListRDFValueDescriptorsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTRDFVALUEDESCRIPTORSRESULT,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListRDFValueDescriptorsResult)
+  ))
+_sym_db.RegisterMessage(ApiListRDFValueDescriptorsResult)
+
+ApiAff4AttributeDescriptor = _reflection.GeneratedProtocolMessageType('ApiAff4AttributeDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIAFF4ATTRIBUTEDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAff4AttributeDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiAff4AttributeDescriptor)
+
+ApiListAff4AttributeDescriptorsResult = _reflection.GeneratedProtocolMessageType('ApiListAff4AttributeDescriptorsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTAFF4ATTRIBUTEDESCRIPTORSRESULT,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListAff4AttributeDescriptorsResult)
+  ))
+_sym_db.RegisterMessage(ApiListAff4AttributeDescriptorsResult)
+
+ApiListOutputPluginDescriptorsResult = _reflection.GeneratedProtocolMessageType('ApiListOutputPluginDescriptorsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTOUTPUTPLUGINDESCRIPTORSRESULT,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListOutputPluginDescriptorsResult)
+  ))
+_sym_db.RegisterMessage(ApiListOutputPluginDescriptorsResult)
+
+ApiListApiMethodsResult = _reflection.GeneratedProtocolMessageType('ApiListApiMethodsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTAPIMETHODSRESULT,
+  __module__ = 'grr_response_proto.api.reflection_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListApiMethodsResult)
+  ))
+_sym_db.RegisterMessage(ApiListApiMethodsResult)
+
+
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['name'].has_options = True
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Enum value name.'))
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['value'].has_options = True
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['value']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021Enum value value.'))
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['doc'].has_options = True
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['doc']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Documentation string.'))
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['labels'].has_options = True
+_APIRDFALLOWEDENUMVALUEDESCRIPTOR.fields_by_name['labels']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%List of labels applied to this value.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['name'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\022\013Field name.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['type'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Field type (an RDFValue type name).'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['index'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['index']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\016\022\014Field index.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['repeated'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['repeated']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 If the field is repeated or not.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['dynamic'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['dynamic']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224If the field has a dynamically changing type or not.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['doc'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['doc']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Documentation string.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['friendly_name'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['friendly_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221Friendly name of the field to be shown in the UI.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['context_help_url'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['context_help_url']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'Context help URL to be shown in the UI.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['default'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['default']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\022\032Recommended default value.*\024GetDefaultValueClass'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['labels'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['labels']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%List of labels applied to this field.'))
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['allowed_values'].has_options = True
+_APIRDFVALUEFIELDDESCRIPTOR.fields_by_name['allowed_values']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\177\022}Allowed enum values. Applicable only to enum fields. If this list is not empty, then this descriptor describes an enum field.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['name'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nType name.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['doc'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['doc']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(Human-readable description of this type.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['kind'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['kind']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022AIndicates whether the value is a primitive value, or a structure.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['default'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['default']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\022\032Recommended default value.*\024GetDefaultValueClass'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['parents'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['parents']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037Inheritance chain of this type.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['fields'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['fields']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001X\022VDescriptors of all the fields of this type. Only applicable to types with kind=STRUCT.'))
+_APIRDFVALUEDESCRIPTOR.fields_by_name['union_field_name'].has_options = True
+_APIRDFVALUEDESCRIPTOR.fields_by_name['union_field_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001q\022oIf this structure is a union, union_field identifies the field that determines which part of the union is used.'))
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['name'].has_options = True
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025Output plugin\'s name.'))
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['friendly_name'].has_options = True
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['friendly_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022+Human readable output plugin\'s description.'))
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['description'].has_options = True
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['description']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022+Human readable output plugin\'s description.'))
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['args_type'].has_options = True
+_APIOUTPUTPLUGINDESCRIPTOR.fields_by_name['args_type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223RDF type of the arguments that output plugin takes.'))
+_APIGETRDFVALUEDESCRIPTORARGS.fields_by_name['type'].has_options = True
+_APIGETRDFVALUEDESCRIPTORARGS.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023RDFValue type name.'))
+# @@protoc_insertion_point(module_scope)
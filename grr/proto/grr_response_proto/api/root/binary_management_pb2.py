@@ -0,0 +1,146 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/root/binary_management.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto.api import config_pb2 as grr__response__proto_dot_api_dot_config__pb2
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/root/binary_management.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n3grr_response_proto/api/root/binary_management.proto\x1a#grr_response_proto/api/config.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"\xa0\x02\n\x16\x41piUploadGrrBinaryArgs\x12\x63\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeBA\xe2\xfc\xe3\xc4\x01;\x12\x39\x42inary type. Together with path it identifies the binary.\x12V\n\x04path\x18\x02 \x01(\tBH\xe2\xfc\xe3\xc4\x01\x42\x12@Binary path. Together with binary type it identifies the binary.\x12I\n\x05\x62lobs\x18\x03 \x03(\x0b\x32\x0b.SignedBlobB-\xe2\xfc\xe3\xc4\x01\'\x12%Signed blobs representing the binary.\"\xd5\x01\n\x16\x41piDeleteGrrBinaryArgs\x12\x63\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeBA\xe2\xfc\xe3\xc4\x01;\x12\x39\x42inary type. Together with path it identifies the binary.\x12V\n\x04path\x18\x02 \x01(\tBH\xe2\xfc\xe3\xc4\x01\x42\x12@Binary path. Together with binary type it identifies the binary.')
+  ,
+  dependencies=[grr__response__proto_dot_api_dot_config__pb2.DESCRIPTOR,grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_APIUPLOADGRRBINARYARGS = _descriptor.Descriptor(
+  name='ApiUploadGrrBinaryArgs',
+  full_name='ApiUploadGrrBinaryArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiUploadGrrBinaryArgs.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiUploadGrrBinaryArgs.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))),
+    _descriptor.FieldDescriptor(
+      name='blobs', full_name='ApiUploadGrrBinaryArgs.blobs', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%Signed blobs representing the binary.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=159,
+  serialized_end=447,
+)
+
+
+_APIDELETEGRRBINARYARGS = _descriptor.Descriptor(
+  name='ApiDeleteGrrBinaryArgs',
+  full_name='ApiDeleteGrrBinaryArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiDeleteGrrBinaryArgs.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiDeleteGrrBinaryArgs.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=450,
+  serialized_end=663,
+)
+
+_APIUPLOADGRRBINARYARGS.fields_by_name['type'].enum_type = grr__response__proto_dot_api_dot_config__pb2._APIGRRBINARY_TYPE
+_APIUPLOADGRRBINARYARGS.fields_by_name['blobs'].message_type = grr__response__proto_dot_jobs__pb2._SIGNEDBLOB
+_APIDELETEGRRBINARYARGS.fields_by_name['type'].enum_type = grr__response__proto_dot_api_dot_config__pb2._APIGRRBINARY_TYPE
+DESCRIPTOR.message_types_by_name['ApiUploadGrrBinaryArgs'] = _APIUPLOADGRRBINARYARGS
+DESCRIPTOR.message_types_by_name['ApiDeleteGrrBinaryArgs'] = _APIDELETEGRRBINARYARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiUploadGrrBinaryArgs = _reflection.GeneratedProtocolMessageType('ApiUploadGrrBinaryArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIUPLOADGRRBINARYARGS,
+  __module__ = 'grr_response_proto.api.root.binary_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiUploadGrrBinaryArgs)
+  ))
+_sym_db.RegisterMessage(ApiUploadGrrBinaryArgs)
+
+ApiDeleteGrrBinaryArgs = _reflection.GeneratedProtocolMessageType('ApiDeleteGrrBinaryArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIDELETEGRRBINARYARGS,
+  __module__ = 'grr_response_proto.api.root.binary_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiDeleteGrrBinaryArgs)
+  ))
+_sym_db.RegisterMessage(ApiDeleteGrrBinaryArgs)
+
+
+_APIUPLOADGRRBINARYARGS.fields_by_name['type'].has_options = True
+_APIUPLOADGRRBINARYARGS.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))
+_APIUPLOADGRRBINARYARGS.fields_by_name['path'].has_options = True
+_APIUPLOADGRRBINARYARGS.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))
+_APIUPLOADGRRBINARYARGS.fields_by_name['blobs'].has_options = True
+_APIUPLOADGRRBINARYARGS.fields_by_name['blobs']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%Signed blobs representing the binary.'))
+_APIDELETEGRRBINARYARGS.fields_by_name['type'].has_options = True
+_APIDELETEGRRBINARYARGS.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'))
+_APIDELETEGRRBINARYARGS.fields_by_name['path'].has_options = True
+_APIDELETEGRRBINARYARGS.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'))
+# @@protoc_insertion_point(module_scope)
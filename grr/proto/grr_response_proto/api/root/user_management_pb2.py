@@ -0,0 +1,320 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/root/user_management.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto.api import user_pb2 as grr__response__proto_dot_api_dot_user__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/root/user_management.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n1grr_response_proto/api/root/user_management.proto\x1a!grr_response_proto/api/user.proto\x1a!grr_response_proto/semantic.proto\"c\n\x14\x41piCreateGrrUserArgs\x12\x10\n\x08username\x18\x01 \x01(\t\x12\'\n\tuser_type\x18\x02 \x01(\x0e\x32\x14.ApiGrrUser.UserType\x12\x10\n\x08password\x18\x03 \x01(\t\"(\n\x14\x41piDeleteGrrUserArgs\x12\x10\n\x08username\x18\x01 \x01(\t\"c\n\x14\x41piModifyGrrUserArgs\x12\x10\n\x08username\x18\x01 \x01(\t\x12\'\n\tuser_type\x18\x02 \x01(\x0e\x32\x14.ApiGrrUser.UserType\x12\x10\n\x08password\x18\x03 \x01(\t\"%\n\x11\x41piGetGrrUserArgs\x12\x10\n\x08username\x18\x01 \x01(\t\"u\n\x13\x41piListGrrUsersArgs\x12(\n\x06offset\x18\x01 \x01(\x03\x42\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Starting offset.\x12\x34\n\x05\x63ount\x18\x02 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dMax number of items to fetch.\"\x84\x01\n\x15\x41piListGrrUsersResult\x12\x36\n\x05items\x18\x01 \x03(\x0b\x32\x0b.ApiGrrUserB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12List of GRR users.\x12\x33\n\x0btotal_count\x18\x02 \x01(\x03\x42\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16Total number of users.')
+  ,
+  dependencies=[grr__response__proto_dot_api_dot_user__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_APICREATEGRRUSERARGS = _descriptor.Descriptor(
+  name='ApiCreateGrrUserArgs',
+  full_name='ApiCreateGrrUserArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='ApiCreateGrrUserArgs.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='user_type', full_name='ApiCreateGrrUserArgs.user_type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='password', full_name='ApiCreateGrrUserArgs.password', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=123,
+  serialized_end=222,
+)
+
+
+_APIDELETEGRRUSERARGS = _descriptor.Descriptor(
+  name='ApiDeleteGrrUserArgs',
+  full_name='ApiDeleteGrrUserArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='ApiDeleteGrrUserArgs.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=224,
+  serialized_end=264,
+)
+
+
+_APIMODIFYGRRUSERARGS = _descriptor.Descriptor(
+  name='ApiModifyGrrUserArgs',
+  full_name='ApiModifyGrrUserArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='ApiModifyGrrUserArgs.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='user_type', full_name='ApiModifyGrrUserArgs.user_type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='password', full_name='ApiModifyGrrUserArgs.password', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=266,
+  serialized_end=365,
+)
+
+
+_APIGETGRRUSERARGS = _descriptor.Descriptor(
+  name='ApiGetGrrUserArgs',
+  full_name='ApiGetGrrUserArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='ApiGetGrrUserArgs.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=367,
+  serialized_end=404,
+)
+
+
+_APILISTGRRUSERSARGS = _descriptor.Descriptor(
+  name='ApiListGrrUsersArgs',
+  full_name='ApiListGrrUsersArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListGrrUsersArgs.offset', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListGrrUsersArgs.count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of items to fetch.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=406,
+  serialized_end=523,
+)
+
+
+_APILISTGRRUSERSRESULT = _descriptor.Descriptor(
+  name='ApiListGrrUsersResult',
+  full_name='ApiListGrrUsersResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListGrrUsersResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022List of GRR users.'))),
+    _descriptor.FieldDescriptor(
+      name='total_count', full_name='ApiListGrrUsersResult.total_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026Total number of users.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=526,
+  serialized_end=658,
+)
+
+_APICREATEGRRUSERARGS.fields_by_name['user_type'].enum_type = grr__response__proto_dot_api_dot_user__pb2._APIGRRUSER_USERTYPE
+_APIMODIFYGRRUSERARGS.fields_by_name['user_type'].enum_type = grr__response__proto_dot_api_dot_user__pb2._APIGRRUSER_USERTYPE
+_APILISTGRRUSERSRESULT.fields_by_name['items'].message_type = grr__response__proto_dot_api_dot_user__pb2._APIGRRUSER
+DESCRIPTOR.message_types_by_name['ApiCreateGrrUserArgs'] = _APICREATEGRRUSERARGS
+DESCRIPTOR.message_types_by_name['ApiDeleteGrrUserArgs'] = _APIDELETEGRRUSERARGS
+DESCRIPTOR.message_types_by_name['ApiModifyGrrUserArgs'] = _APIMODIFYGRRUSERARGS
+DESCRIPTOR.message_types_by_name['ApiGetGrrUserArgs'] = _APIGETGRRUSERARGS
+DESCRIPTOR.message_types_by_name['ApiListGrrUsersArgs'] = _APILISTGRRUSERSARGS
+DESCRIPTOR.message_types_by_name['ApiListGrrUsersResult'] = _APILISTGRRUSERSRESULT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiCreateGrrUserArgs = _reflection.GeneratedProtocolMessageType('ApiCreateGrrUserArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APICREATEGRRUSERARGS,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiCreateGrrUserArgs)
+  ))
+_sym_db.RegisterMessage(ApiCreateGrrUserArgs)
+
+ApiDeleteGrrUserArgs = _reflection.GeneratedProtocolMessageType('ApiDeleteGrrUserArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIDELETEGRRUSERARGS,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiDeleteGrrUserArgs)
+  ))
+_sym_db.RegisterMessage(ApiDeleteGrrUserArgs)
+
+ApiModifyGrrUserArgs = _reflection.GeneratedProtocolMessageType('ApiModifyGrrUserArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIMODIFYGRRUSERARGS,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiModifyGrrUserArgs)
+  ))
+_sym_db.RegisterMessage(ApiModifyGrrUserArgs)
+
+ApiGetGrrUserArgs = _reflection.GeneratedProtocolMessageType('ApiGetGrrUserArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETGRRUSERARGS,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetGrrUserArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetGrrUserArgs)
+
+ApiListGrrUsersArgs = _reflection.GeneratedProtocolMessageType('ApiListGrrUsersArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTGRRUSERSARGS,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListGrrUsersArgs)
+  ))
+_sym_db.RegisterMessage(ApiListGrrUsersArgs)
+
+ApiListGrrUsersResult = _reflection.GeneratedProtocolMessageType('ApiListGrrUsersResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTGRRUSERSRESULT,
+  __module__ = 'grr_response_proto.api.root.user_management_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListGrrUsersResult)
+  ))
+_sym_db.RegisterMessage(ApiListGrrUsersResult)
+
+
+_APILISTGRRUSERSARGS.fields_by_name['offset'].has_options = True
+_APILISTGRRUSERSARGS.fields_by_name['offset']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))
+_APILISTGRRUSERSARGS.fields_by_name['count'].has_options = True
+_APILISTGRRUSERSARGS.fields_by_name['count']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of items to fetch.'))
+_APILISTGRRUSERSRESULT.fields_by_name['items'].has_options = True
+_APILISTGRRUSERSRESULT.fields_by_name['items']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022List of GRR users.'))
+_APILISTGRRUSERSRESULT.fields_by_name['total_count'].has_options = True
+_APILISTGRRUSERSRESULT.fields_by_name['total_count']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026Total number of users.'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,1219 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/stats.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/stats.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n\"grr_response_proto/api/stats.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"\xa2\x01\n\x1c\x41piStatsStoreMetricDataPoint\x12\x44\n\ttimestamp\x18\x01 \x01(\x04\x42\x31\xe2\xfc\xe3\xc4\x01+\n\x0bRDFDatetime\x12\x1cTimestamp of the data point.\x12<\n\x05value\x18\x02 \x01(\x01\x42-\xe2\xfc\xe3\xc4\x01\'\x12%Value corresponding to the timestamp.\"\xa4\x01\n\x13\x41piStatsStoreMetric\x12\x13\n\x0bmetric_name\x18\x01 \x01(\t\x12\"\n\x05start\x18\x02 \x01(\x04\x42\x13\xe2\xfc\xe3\xc4\x01\r\n\x0bRDFDatetime\x12 \n\x03\x65nd\x18\x03 \x01(\x04\x42\x13\xe2\xfc\xe3\xc4\x01\r\n\x0bRDFDatetime\x12\x32\n\x0b\x64\x61ta_points\x18\x04 \x03(\x0b\x32\x1d.ApiStatsStoreMetricDataPoint\"\xec\x04\n\x13\x41piReportDescriptor\x12\x64\n\x04type\x18\x01 \x01(\x0e\x32\x1f.ApiReportDescriptor.ReportTypeB5\xe2\xfc\xe3\xc4\x01/\x12-Top-level identifier in the report hierarchy.\x12\xaa\x01\n\x04name\x18\x02 \x01(\tB\x9b\x01\xe2\xfc\xe3\xc4\x01\x94\x01\x12\x91\x01Second-level identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.\x12\x33\n\x05title\x18\x03 \x01(\tB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1cUI-friendly displayed title.\x12R\n\x07summary\x18\x04 \x01(\tBA\xe2\xfc\xe3\xc4\x01;\x12\x39UI-friendly displayed summary of what the report reports.\x12U\n\x13requires_time_range\x18\x05 \x01(\x08\x42\x38\xe2\xfc\xe3\xc4\x01\x32\x12\x30Indicates whether the report needs a time range.\"b\n\nReportType\x12\x18\n\x06\x43LIENT\x10\x00\x1a\x0c\xea\xb9\xcb\xb9\x01\x06\x43lient\x12 \n\nFILE_STORE\x10\x01\x1a\x10\xea\xb9\xcb\xb9\x01\nFile store\x12\x18\n\x06SERVER\x10\x02\x1a\x0c\xea\xb9\xcb\xb9\x01\x06Server\"M\n\tApiReport\x12\"\n\x04\x64\x65sc\x18\x01 \x01(\x0b\x32\x14.ApiReportDescriptor\x12\x1c\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x0e.ApiReportData\"\xc3\x03\n\rApiReportData\x12>\n\x13representation_type\x18\x01 \x01(\x0e\x32!.ApiReportData.RepresentationType\x12-\n\x0bstack_chart\x18\x02 \x01(\x0b\x32\x18.ApiStackChartReportData\x12)\n\tpie_chart\x18\x03 \x01(\x0b\x32\x16.ApiPieChartReportData\x12+\n\nline_chart\x18\x04 \x01(\x0b\x32\x17.ApiLineChartReportData\x12-\n\x0b\x61udit_chart\x18\x05 \x01(\x0b\x32\x18.ApiAuditChartReportData\"\x9e\x01\n\x12RepresentationType\x12\"\n\x0bSTACK_CHART\x10\x00\x1a\x11\xea\xb9\xcb\xb9\x01\x0bStack chart\x12\x1e\n\tPIE_CHART\x10\x01\x1a\x0f\xea\xb9\xcb\xb9\x01\tPie chart\x12 \n\nLINE_CHART\x10\x02\x1a\x10\xea\xb9\xcb\xb9\x01\nLine chart\x12\"\n\x0b\x41UDIT_CHART\x10\x03\x1a\x11\xea\xb9\xcb\xb9\x01\x0b\x41udit chart:\x1b\xda\xfc\xe3\xc4\x01\x15\x12\x13representation_type\"\x84\x03\n\x17\x41piStackChartReportData\x12G\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x16.ApiReportDataSeries2DB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19What the report contains.\x12l\n\x07x_ticks\x18\x02 \x03(\x0b\x32\x17.ApiReportTickSpecifierBB\xe2\xfc\xe3\xc4\x01<\x12:X axis ticks. See: github.com/flot/flot/blob/master/API.md\x12l\n\x07y_ticks\x18\x03 \x03(\x0b\x32\x17.ApiReportTickSpecifierBB\xe2\xfc\xe3\xc4\x01<\x12:Y axis ticks. See: github.com/flot/flot/blob/master/API.md\x12\x44\n\tbar_width\x18\x04 \x01(\x02\x42\x31\xe2\xfc\xe3\xc4\x01+\x12)Width of the bars displayed on the chart.\"_\n\x15\x41piPieChartReportData\x12\x46\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x15.ApiReportDataPoint1DB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19What the report contains.\"a\n\x16\x41piLineChartReportData\x12G\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x16.ApiReportDataSeries2DB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19What the report contains.\"\xad\x01\n\x17\x41piAuditChartReportData\x12O\n\x0bused_fields\x18\x01 \x03(\tB:\xe2\xfc\xe3\xc4\x01\x34\x12\x32Names of the AuditEvent fields used by the report.\x12\x41\n\x04rows\x18\x02 \x03(\x0b\x32\x0b.AuditEventB&\xe2\xfc\xe3\xc4\x01 \x12\x1e\x44\x61ta to be shown in the chart.\"a\n\x14\x41piReportDataPoint1D\x12\t\n\x01x\x18\x01 \x01(\x02\x12>\n\x05label\x18\x02 \x01(\tB/\xe2\xfc\xe3\xc4\x01)\x12\'The series is labeled with this string.\"~\n\x15\x41piReportDataSeries2D\x12>\n\x05label\x18\x01 \x01(\tB/\xe2\xfc\xe3\xc4\x01)\x12\'The series is labeled with this string.\x12%\n\x06points\x18\x02 \x03(\x0b\x32\x15.ApiReportDataPoint2D\",\n\x14\x41piReportDataPoint2D\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\"2\n\x16\x41piReportTickSpecifier\x12\t\n\x01x\x18\x01 \x01(\x02\x12\r\n\x05label\x18\x02 \x01(\t\"\x9f\x01\n$ApiListStatsStoreMetricsMetadataArgs\x12\x42\n\tcomponent\x18\x01 \x01(\x0e\x32/.ApiListStatsStoreMetricsMetadataArgs.Component\"3\n\tComponent\x12\n\n\x06WORKER\x10\x00\x12\x0c\n\x08\x46RONTEND\x10\x01\x12\x0c\n\x08\x41\x44MIN_UI\x10\x02\"H\n&ApiListStatsStoreMetricsMetadataResult\x12\x1e\n\x05items\x18\x01 \x03(\x0b\x32\x0f.MetricMetadata\"\x88\n\n\x1a\x41piGetStatsStoreMetricArgs\x12\x38\n\tcomponent\x18\x01 \x01(\x0e\x32%.ApiGetStatsStoreMetricArgs.Component\x12\x13\n\x0bmetric_name\x18\x02 \x01(\t\x12|\n\x05start\x18\x03 \x01(\x04\x42m\xe2\xfc\xe3\xc4\x01g\n\x0bRDFDatetime\x12XFetch metrics data starting from this timestamp. If not set, will default to 1 hour ago.\x12\x91\x01\n\x03\x65nd\x18\x04 \x01(\x04\x42\x83\x01\xe2\xfc\xe3\xc4\x01}\n\x0bRDFDatetime\x12nFetch metrics data from the interval ending with this timestamp. If not set, will default to the current time.\x12q\n\x04rate\x18\x07 \x01(\x04\x42\x63\xe2\xfc\xe3\xc4\x01]\n\x08\x44uration\x12QIf set, metric\'s rate over given window will be returned instead of plain values.\x12\xa3\x01\n\x1a\x64istribution_handling_mode\x18\x05 \x01(\x0e\x32\x34.ApiGetStatsStoreMetricArgs.DistributionHandlingModeBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41\x44\x65termines which values to fetch when dealing with distributions.\x12\xcc\x01\n\x10\x61ggregation_mode\x18\x06 \x01(\x0e\x32+.ApiGetStatsStoreMetricArgs.AggregationModeB\x84\x01\xe2\xfc\xe3\xc4\x01~\x12|Aggregation method. As metrics are usually collected across multiple processes, most of the time they have to be aggregated.\"3\n\tComponent\x12\n\n\x06WORKER\x10\x00\x12\x0c\n\x08\x46RONTEND\x10\x01\x12\x0c\n\x08\x41\x44MIN_UI\x10\x02\"\xc1\x01\n\x18\x44istributionHandlingMode\x12O\n\x06\x44H_SUM\x10\x00\x1a\x43\xea\xb9\xcb\xb9\x01=Sum of all values recorded in a distribution will be fetched.\x12T\n\x08\x44H_COUNT\x10\x01\x1a\x46\xea\xb9\xcb\xb9\x01@Number of all values recorded in a distribution will be fetched.\"\xa7\x01\n\x0f\x41ggregationMode\x12)\n\x07\x41GG_SUM\x10\x00\x1a\x1c\xea\xb9\xcb\xb9\x01\x16Values will be summed.\x12\x32\n\x08\x41GG_MEAN\x10\x01\x1a$\xea\xb9\xcb\xb9\x01\x1eMean value will be calculated.\x12\x35\n\x08\x41GG_NONE\x10\x02\x1a\'\xea\xb9\xcb\xb9\x01!No aggregation will be performed.\"\xa2\x04\n\x10\x41piGetReportArgs\x12\x9d\x01\n\x04name\x18\x01 \x01(\tB\x8e\x01\xe2\xfc\xe3\xc4\x01\x87\x01\x12\x84\x01Identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.\x12\x91\x01\n\nstart_time\x18\x02 \x01(\x04\x42}\xe2\xfc\xe3\xc4\x01w\n\x0bRDFDatetime\x12hEarliest timestamp of data points to consider. Ignored by reports with requires_time_range set to false.\x12\x83\x01\n\x08\x64uration\x18\x03 \x01(\x04\x42q\xe2\xfc\xe3\xc4\x01k\n\x08\x44uration\x12_Length of the time range to consider. Ignored by reports with requires_time_range set to false.\x12T\n\x0c\x63lient_label\x18\x04 \x01(\tB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36\x43lient label used by label-specific reports. Optional.\"M\n\x14\x41piListReportsResult\x12\x35\n\x07reports\x18\x01 \x03(\x0b\x32\n.ApiReportB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10The report list.')
+  ,
+  dependencies=[grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIREPORTDESCRIPTOR_REPORTTYPE = _descriptor.EnumDescriptor(
+  name='ReportType',
+  full_name='ApiReportDescriptor.ReportType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='CLIENT', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\006Client')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_STORE', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\nFile store')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVER', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\006Server')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=959,
+  serialized_end=1057,
+)
+_sym_db.RegisterEnumDescriptor(_APIREPORTDESCRIPTOR_REPORTTYPE)
+
+_APIREPORTDATA_REPRESENTATIONTYPE = _descriptor.EnumDescriptor(
+  name='RepresentationType',
+  full_name='ApiReportData.RepresentationType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='STACK_CHART', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\013Stack chart')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PIE_CHART', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\tPie chart')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LINE_CHART', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\nLine chart')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='AUDIT_CHART', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\013Audit chart')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1403,
+  serialized_end=1561,
+)
+_sym_db.RegisterEnumDescriptor(_APIREPORTDATA_REPRESENTATIONTYPE)
+
+_APILISTSTATSSTOREMETRICSMETADATAARGS_COMPONENT = _descriptor.EnumDescriptor(
+  name='Component',
+  full_name='ApiListStatsStoreMetricsMetadataArgs.Component',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='WORKER', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FRONTEND', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ADMIN_UI', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2789,
+  serialized_end=2840,
+)
+_sym_db.RegisterEnumDescriptor(_APILISTSTATSSTOREMETRICSMETADATAARGS_COMPONENT)
+
+_APIGETSTATSSTOREMETRICARGS_COMPONENT = _descriptor.EnumDescriptor(
+  name='Component',
+  full_name='ApiGetStatsStoreMetricArgs.Component',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='WORKER', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FRONTEND', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ADMIN_UI', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2789,
+  serialized_end=2840,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETSTATSSTOREMETRICARGS_COMPONENT)
+
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE = _descriptor.EnumDescriptor(
+  name='DistributionHandlingMode',
+  full_name='ApiGetStatsStoreMetricArgs.DistributionHandlingMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='DH_SUM', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001=Sum of all values recorded in a distribution will be fetched.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DH_COUNT', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001@Number of all values recorded in a distribution will be fetched.')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3842,
+  serialized_end=4035,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE)
+
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE = _descriptor.EnumDescriptor(
+  name='AggregationMode',
+  full_name='ApiGetStatsStoreMetricArgs.AggregationMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='AGG_SUM', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\026Values will be summed.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='AGG_MEAN', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\036Mean value will be calculated.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='AGG_NONE', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001!No aggregation will be performed.')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=4038,
+  serialized_end=4205,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE)
+
+
+_APISTATSSTOREMETRICDATAPOINT = _descriptor.Descriptor(
+  name='ApiStatsStoreMetricDataPoint',
+  full_name='ApiStatsStoreMetricDataPoint',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiStatsStoreMetricDataPoint.timestamp', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\n\013RDFDatetime\022\034Timestamp of the data point.'))),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiStatsStoreMetricDataPoint.value', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%Value corresponding to the timestamp.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=105,
+  serialized_end=267,
+)
+
+
+_APISTATSSTOREMETRIC = _descriptor.Descriptor(
+  name='ApiStatsStoreMetric',
+  full_name='ApiStatsStoreMetric',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metric_name', full_name='ApiStatsStoreMetric.metric_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='start', full_name='ApiStatsStoreMetric.start', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\n\013RDFDatetime'))),
+    _descriptor.FieldDescriptor(
+      name='end', full_name='ApiStatsStoreMetric.end', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\n\013RDFDatetime'))),
+    _descriptor.FieldDescriptor(
+      name='data_points', full_name='ApiStatsStoreMetric.data_points', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=270,
+  serialized_end=434,
+)
+
+
+_APIREPORTDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiReportDescriptor',
+  full_name='ApiReportDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiReportDescriptor.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Top-level identifier in the report hierarchy.'))),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiReportDescriptor.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\224\001\022\221\001Second-level identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.'))),
+    _descriptor.FieldDescriptor(
+      name='title', full_name='ApiReportDescriptor.title', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034UI-friendly displayed title.'))),
+    _descriptor.FieldDescriptor(
+      name='summary', full_name='ApiReportDescriptor.summary', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229UI-friendly displayed summary of what the report reports.'))),
+    _descriptor.FieldDescriptor(
+      name='requires_time_range', full_name='ApiReportDescriptor.requires_time_range', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\0220Indicates whether the report needs a time range.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIREPORTDESCRIPTOR_REPORTTYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=437,
+  serialized_end=1057,
+)
+
+
+_APIREPORT = _descriptor.Descriptor(
+  name='ApiReport',
+  full_name='ApiReport',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='desc', full_name='ApiReport.desc', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ApiReport.data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1059,
+  serialized_end=1136,
+)
+
+
+_APIREPORTDATA = _descriptor.Descriptor(
+  name='ApiReportData',
+  full_name='ApiReportData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='representation_type', full_name='ApiReportData.representation_type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='stack_chart', full_name='ApiReportData.stack_chart', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='pie_chart', full_name='ApiReportData.pie_chart', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='line_chart', full_name='ApiReportData.line_chart', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='audit_chart', full_name='ApiReportData.audit_chart', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIREPORTDATA_REPRESENTATIONTYPE,
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('\332\374\343\304\001\025\022\023representation_type')),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1139,
+  serialized_end=1590,
+)
+
+
+_APISTACKCHARTREPORTDATA = _descriptor.Descriptor(
+  name='ApiStackChartReportData',
+  full_name='ApiStackChartReportData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ApiStackChartReportData.data', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))),
+    _descriptor.FieldDescriptor(
+      name='x_ticks', full_name='ApiStackChartReportData.x_ticks', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:X axis ticks. See: github.com/flot/flot/blob/master/API.md'))),
+    _descriptor.FieldDescriptor(
+      name='y_ticks', full_name='ApiStackChartReportData.y_ticks', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:Y axis ticks. See: github.com/flot/flot/blob/master/API.md'))),
+    _descriptor.FieldDescriptor(
+      name='bar_width', full_name='ApiStackChartReportData.bar_width', index=3,
+      number=4, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022)Width of the bars displayed on the chart.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1593,
+  serialized_end=1981,
+)
+
+
+_APIPIECHARTREPORTDATA = _descriptor.Descriptor(
+  name='ApiPieChartReportData',
+  full_name='ApiPieChartReportData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ApiPieChartReportData.data', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1983,
+  serialized_end=2078,
+)
+
+
+_APILINECHARTREPORTDATA = _descriptor.Descriptor(
+  name='ApiLineChartReportData',
+  full_name='ApiLineChartReportData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ApiLineChartReportData.data', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2080,
+  serialized_end=2177,
+)
+
+
+_APIAUDITCHARTREPORTDATA = _descriptor.Descriptor(
+  name='ApiAuditChartReportData',
+  full_name='ApiAuditChartReportData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='used_fields', full_name='ApiAuditChartReportData.used_fields', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\0222Names of the AuditEvent fields used by the report.'))),
+    _descriptor.FieldDescriptor(
+      name='rows', full_name='ApiAuditChartReportData.rows', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036Data to be shown in the chart.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2180,
+  serialized_end=2353,
+)
+
+
+_APIREPORTDATAPOINT1D = _descriptor.Descriptor(
+  name='ApiReportDataPoint1D',
+  full_name='ApiReportDataPoint1D',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='ApiReportDataPoint1D.x', index=0,
+      number=1, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='ApiReportDataPoint1D.label', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'The series is labeled with this string.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2355,
+  serialized_end=2452,
+)
+
+
+_APIREPORTDATASERIES2D = _descriptor.Descriptor(
+  name='ApiReportDataSeries2D',
+  full_name='ApiReportDataSeries2D',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='label', full_name='ApiReportDataSeries2D.label', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'The series is labeled with this string.'))),
+    _descriptor.FieldDescriptor(
+      name='points', full_name='ApiReportDataSeries2D.points', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2454,
+  serialized_end=2580,
+)
+
+
+_APIREPORTDATAPOINT2D = _descriptor.Descriptor(
+  name='ApiReportDataPoint2D',
+  full_name='ApiReportDataPoint2D',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='ApiReportDataPoint2D.x', index=0,
+      number=1, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='y', full_name='ApiReportDataPoint2D.y', index=1,
+      number=2, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2582,
+  serialized_end=2626,
+)
+
+
+_APIREPORTTICKSPECIFIER = _descriptor.Descriptor(
+  name='ApiReportTickSpecifier',
+  full_name='ApiReportTickSpecifier',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='ApiReportTickSpecifier.x', index=0,
+      number=1, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='ApiReportTickSpecifier.label', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2628,
+  serialized_end=2678,
+)
+
+
+_APILISTSTATSSTOREMETRICSMETADATAARGS = _descriptor.Descriptor(
+  name='ApiListStatsStoreMetricsMetadataArgs',
+  full_name='ApiListStatsStoreMetricsMetadataArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='component', full_name='ApiListStatsStoreMetricsMetadataArgs.component', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APILISTSTATSSTOREMETRICSMETADATAARGS_COMPONENT,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2681,
+  serialized_end=2840,
+)
+
+
+_APILISTSTATSSTOREMETRICSMETADATARESULT = _descriptor.Descriptor(
+  name='ApiListStatsStoreMetricsMetadataResult',
+  full_name='ApiListStatsStoreMetricsMetadataResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListStatsStoreMetricsMetadataResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2842,
+  serialized_end=2914,
+)
+
+
+_APIGETSTATSSTOREMETRICARGS = _descriptor.Descriptor(
+  name='ApiGetStatsStoreMetricArgs',
+  full_name='ApiGetStatsStoreMetricArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='component', full_name='ApiGetStatsStoreMetricArgs.component', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='metric_name', full_name='ApiGetStatsStoreMetricArgs.metric_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='start', full_name='ApiGetStatsStoreMetricArgs.start', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001g\n\013RDFDatetime\022XFetch metrics data starting from this timestamp. If not set, will default to 1 hour ago.'))),
+    _descriptor.FieldDescriptor(
+      name='end', full_name='ApiGetStatsStoreMetricArgs.end', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001}\n\013RDFDatetime\022nFetch metrics data from the interval ending with this timestamp. If not set, will default to the current time.'))),
+    _descriptor.FieldDescriptor(
+      name='rate', full_name='ApiGetStatsStoreMetricArgs.rate', index=4,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001]\n\010Duration\022QIf set, metric\'s rate over given window will be returned instead of plain values.'))),
+    _descriptor.FieldDescriptor(
+      name='distribution_handling_mode', full_name='ApiGetStatsStoreMetricArgs.distribution_handling_mode', index=5,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022ADetermines which values to fetch when dealing with distributions.'))),
+    _descriptor.FieldDescriptor(
+      name='aggregation_mode', full_name='ApiGetStatsStoreMetricArgs.aggregation_mode', index=6,
+      number=6, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001~\022|Aggregation method. As metrics are usually collected across multiple processes, most of the time they have to be aggregated.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETSTATSSTOREMETRICARGS_COMPONENT,
+    _APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE,
+    _APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2917,
+  serialized_end=4205,
+)
+
+
+_APIGETREPORTARGS = _descriptor.Descriptor(
+  name='ApiGetReportArgs',
+  full_name='ApiGetReportArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiGetReportArgs.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\207\001\022\204\001Identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.'))),
+    _descriptor.FieldDescriptor(
+      name='start_time', full_name='ApiGetReportArgs.start_time', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001w\n\013RDFDatetime\022hEarliest timestamp of data points to consider. Ignored by reports with requires_time_range set to false.'))),
+    _descriptor.FieldDescriptor(
+      name='duration', full_name='ApiGetReportArgs.duration', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001k\n\010Duration\022_Length of the time range to consider. Ignored by reports with requires_time_range set to false.'))),
+    _descriptor.FieldDescriptor(
+      name='client_label', full_name='ApiGetReportArgs.client_label', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226Client label used by label-specific reports. Optional.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4208,
+  serialized_end=4754,
+)
+
+
+_APILISTREPORTSRESULT = _descriptor.Descriptor(
+  name='ApiListReportsResult',
+  full_name='ApiListReportsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='reports', full_name='ApiListReportsResult.reports', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The report list.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4756,
+  serialized_end=4833,
+)
+
+_APISTATSSTOREMETRIC.fields_by_name['data_points'].message_type = _APISTATSSTOREMETRICDATAPOINT
+_APIREPORTDESCRIPTOR.fields_by_name['type'].enum_type = _APIREPORTDESCRIPTOR_REPORTTYPE
+_APIREPORTDESCRIPTOR_REPORTTYPE.containing_type = _APIREPORTDESCRIPTOR
+_APIREPORT.fields_by_name['desc'].message_type = _APIREPORTDESCRIPTOR
+_APIREPORT.fields_by_name['data'].message_type = _APIREPORTDATA
+_APIREPORTDATA.fields_by_name['representation_type'].enum_type = _APIREPORTDATA_REPRESENTATIONTYPE
+_APIREPORTDATA.fields_by_name['stack_chart'].message_type = _APISTACKCHARTREPORTDATA
+_APIREPORTDATA.fields_by_name['pie_chart'].message_type = _APIPIECHARTREPORTDATA
+_APIREPORTDATA.fields_by_name['line_chart'].message_type = _APILINECHARTREPORTDATA
+_APIREPORTDATA.fields_by_name['audit_chart'].message_type = _APIAUDITCHARTREPORTDATA
+_APIREPORTDATA_REPRESENTATIONTYPE.containing_type = _APIREPORTDATA
+_APISTACKCHARTREPORTDATA.fields_by_name['data'].message_type = _APIREPORTDATASERIES2D
+_APISTACKCHARTREPORTDATA.fields_by_name['x_ticks'].message_type = _APIREPORTTICKSPECIFIER
+_APISTACKCHARTREPORTDATA.fields_by_name['y_ticks'].message_type = _APIREPORTTICKSPECIFIER
+_APIPIECHARTREPORTDATA.fields_by_name['data'].message_type = _APIREPORTDATAPOINT1D
+_APILINECHARTREPORTDATA.fields_by_name['data'].message_type = _APIREPORTDATASERIES2D
+_APIAUDITCHARTREPORTDATA.fields_by_name['rows'].message_type = grr__response__proto_dot_jobs__pb2._AUDITEVENT
+_APIREPORTDATASERIES2D.fields_by_name['points'].message_type = _APIREPORTDATAPOINT2D
+_APILISTSTATSSTOREMETRICSMETADATAARGS.fields_by_name['component'].enum_type = _APILISTSTATSSTOREMETRICSMETADATAARGS_COMPONENT
+_APILISTSTATSSTOREMETRICSMETADATAARGS_COMPONENT.containing_type = _APILISTSTATSSTOREMETRICSMETADATAARGS
+_APILISTSTATSSTOREMETRICSMETADATARESULT.fields_by_name['items'].message_type = grr__response__proto_dot_jobs__pb2._METRICMETADATA
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['component'].enum_type = _APIGETSTATSSTOREMETRICARGS_COMPONENT
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['distribution_handling_mode'].enum_type = _APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['aggregation_mode'].enum_type = _APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE
+_APIGETSTATSSTOREMETRICARGS_COMPONENT.containing_type = _APIGETSTATSSTOREMETRICARGS
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE.containing_type = _APIGETSTATSSTOREMETRICARGS
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.containing_type = _APIGETSTATSSTOREMETRICARGS
+_APILISTREPORTSRESULT.fields_by_name['reports'].message_type = _APIREPORT
+DESCRIPTOR.message_types_by_name['ApiStatsStoreMetricDataPoint'] = _APISTATSSTOREMETRICDATAPOINT
+DESCRIPTOR.message_types_by_name['ApiStatsStoreMetric'] = _APISTATSSTOREMETRIC
+DESCRIPTOR.message_types_by_name['ApiReportDescriptor'] = _APIREPORTDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiReport'] = _APIREPORT
+DESCRIPTOR.message_types_by_name['ApiReportData'] = _APIREPORTDATA
+DESCRIPTOR.message_types_by_name['ApiStackChartReportData'] = _APISTACKCHARTREPORTDATA
+DESCRIPTOR.message_types_by_name['ApiPieChartReportData'] = _APIPIECHARTREPORTDATA
+DESCRIPTOR.message_types_by_name['ApiLineChartReportData'] = _APILINECHARTREPORTDATA
+DESCRIPTOR.message_types_by_name['ApiAuditChartReportData'] = _APIAUDITCHARTREPORTDATA
+DESCRIPTOR.message_types_by_name['ApiReportDataPoint1D'] = _APIREPORTDATAPOINT1D
+DESCRIPTOR.message_types_by_name['ApiReportDataSeries2D'] = _APIREPORTDATASERIES2D
+DESCRIPTOR.message_types_by_name['ApiReportDataPoint2D'] = _APIREPORTDATAPOINT2D
+DESCRIPTOR.message_types_by_name['ApiReportTickSpecifier'] = _APIREPORTTICKSPECIFIER
+DESCRIPTOR.message_types_by_name['ApiListStatsStoreMetricsMetadataArgs'] = _APILISTSTATSSTOREMETRICSMETADATAARGS
+DESCRIPTOR.message_types_by_name['ApiListStatsStoreMetricsMetadataResult'] = _APILISTSTATSSTOREMETRICSMETADATARESULT
+DESCRIPTOR.message_types_by_name['ApiGetStatsStoreMetricArgs'] = _APIGETSTATSSTOREMETRICARGS
+DESCRIPTOR.message_types_by_name['ApiGetReportArgs'] = _APIGETREPORTARGS
+DESCRIPTOR.message_types_by_name['ApiListReportsResult'] = _APILISTREPORTSRESULT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiStatsStoreMetricDataPoint = _reflection.GeneratedProtocolMessageType('ApiStatsStoreMetricDataPoint', (_message.Message,), dict(
+  DESCRIPTOR = _APISTATSSTOREMETRICDATAPOINT,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiStatsStoreMetricDataPoint)
+  ))
+_sym_db.RegisterMessage(ApiStatsStoreMetricDataPoint)
+
+ApiStatsStoreMetric = _reflection.GeneratedProtocolMessageType('ApiStatsStoreMetric', (_message.Message,), dict(
+  DESCRIPTOR = _APISTATSSTOREMETRIC,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiStatsStoreMetric)
+  ))
+_sym_db.RegisterMessage(ApiStatsStoreMetric)
+
+ApiReportDescriptor = _reflection.GeneratedProtocolMessageType('ApiReportDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTDESCRIPTOR,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportDescriptor)
+  ))
+_sym_db.RegisterMessage(ApiReportDescriptor)
+
+ApiReport = _reflection.GeneratedProtocolMessageType('ApiReport', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORT,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReport)
+  ))
+_sym_db.RegisterMessage(ApiReport)
+
+ApiReportData = _reflection.GeneratedProtocolMessageType('ApiReportData', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTDATA,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportData)
+  ))
+_sym_db.RegisterMessage(ApiReportData)
+
+ApiStackChartReportData = _reflection.GeneratedProtocolMessageType('ApiStackChartReportData', (_message.Message,), dict(
+  DESCRIPTOR = _APISTACKCHARTREPORTDATA,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiStackChartReportData)
+  ))
+_sym_db.RegisterMessage(ApiStackChartReportData)
+
+ApiPieChartReportData = _reflection.GeneratedProtocolMessageType('ApiPieChartReportData', (_message.Message,), dict(
+  DESCRIPTOR = _APIPIECHARTREPORTDATA,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiPieChartReportData)
+  ))
+_sym_db.RegisterMessage(ApiPieChartReportData)
+
+ApiLineChartReportData = _reflection.GeneratedProtocolMessageType('ApiLineChartReportData', (_message.Message,), dict(
+  DESCRIPTOR = _APILINECHARTREPORTDATA,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiLineChartReportData)
+  ))
+_sym_db.RegisterMessage(ApiLineChartReportData)
+
+ApiAuditChartReportData = _reflection.GeneratedProtocolMessageType('ApiAuditChartReportData', (_message.Message,), dict(
+  DESCRIPTOR = _APIAUDITCHARTREPORTDATA,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAuditChartReportData)
+  ))
+_sym_db.RegisterMessage(ApiAuditChartReportData)
+
+ApiReportDataPoint1D = _reflection.GeneratedProtocolMessageType('ApiReportDataPoint1D', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTDATAPOINT1D,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportDataPoint1D)
+  ))
+_sym_db.RegisterMessage(ApiReportDataPoint1D)
+
+ApiReportDataSeries2D = _reflection.GeneratedProtocolMessageType('ApiReportDataSeries2D', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTDATASERIES2D,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportDataSeries2D)
+  ))
+_sym_db.RegisterMessage(ApiReportDataSeries2D)
+
+ApiReportDataPoint2D = _reflection.GeneratedProtocolMessageType('ApiReportDataPoint2D', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTDATAPOINT2D,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportDataPoint2D)
+  ))
+_sym_db.RegisterMessage(ApiReportDataPoint2D)
+
+ApiReportTickSpecifier = _reflection.GeneratedProtocolMessageType('ApiReportTickSpecifier', (_message.Message,), dict(
+  DESCRIPTOR = _APIREPORTTICKSPECIFIER,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiReportTickSpecifier)
+  ))
+_sym_db.RegisterMessage(ApiReportTickSpecifier)
+
+ApiListStatsStoreMetricsMetadataArgs = _reflection.GeneratedProtocolMessageType('ApiListStatsStoreMetricsMetadataArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTSTATSSTOREMETRICSMETADATAARGS,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListStatsStoreMetricsMetadataArgs)
+  ))
+_sym_db.RegisterMessage(ApiListStatsStoreMetricsMetadataArgs)
+
+ApiListStatsStoreMetricsMetadataResult = _reflection.GeneratedProtocolMessageType('ApiListStatsStoreMetricsMetadataResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTSTATSSTOREMETRICSMETADATARESULT,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListStatsStoreMetricsMetadataResult)
+  ))
+_sym_db.RegisterMessage(ApiListStatsStoreMetricsMetadataResult)
+
+ApiGetStatsStoreMetricArgs = _reflection.GeneratedProtocolMessageType('ApiGetStatsStoreMetricArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETSTATSSTOREMETRICARGS,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetStatsStoreMetricArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetStatsStoreMetricArgs)
+
+ApiGetReportArgs = _reflection.GeneratedProtocolMessageType('ApiGetReportArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETREPORTARGS,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetReportArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetReportArgs)
+
+ApiListReportsResult = _reflection.GeneratedProtocolMessageType('ApiListReportsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTREPORTSRESULT,
+  __module__ = 'grr_response_proto.api.stats_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListReportsResult)
+  ))
+_sym_db.RegisterMessage(ApiListReportsResult)
+
+
+_APISTATSSTOREMETRICDATAPOINT.fields_by_name['timestamp'].has_options = True
+_APISTATSSTOREMETRICDATAPOINT.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\n\013RDFDatetime\022\034Timestamp of the data point.'))
+_APISTATSSTOREMETRICDATAPOINT.fields_by_name['value'].has_options = True
+_APISTATSSTOREMETRICDATAPOINT.fields_by_name['value']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%Value corresponding to the timestamp.'))
+_APISTATSSTOREMETRIC.fields_by_name['start'].has_options = True
+_APISTATSSTOREMETRIC.fields_by_name['start']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\n\013RDFDatetime'))
+_APISTATSSTOREMETRIC.fields_by_name['end'].has_options = True
+_APISTATSSTOREMETRIC.fields_by_name['end']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\r\n\013RDFDatetime'))
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["CLIENT"].has_options = True
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["CLIENT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\006Client'))
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["FILE_STORE"].has_options = True
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["FILE_STORE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\nFile store'))
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["SERVER"].has_options = True
+_APIREPORTDESCRIPTOR_REPORTTYPE.values_by_name["SERVER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\006Server'))
+_APIREPORTDESCRIPTOR.fields_by_name['type'].has_options = True
+_APIREPORTDESCRIPTOR.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Top-level identifier in the report hierarchy.'))
+_APIREPORTDESCRIPTOR.fields_by_name['name'].has_options = True
+_APIREPORTDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\224\001\022\221\001Second-level identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.'))
+_APIREPORTDESCRIPTOR.fields_by_name['title'].has_options = True
+_APIREPORTDESCRIPTOR.fields_by_name['title']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034UI-friendly displayed title.'))
+_APIREPORTDESCRIPTOR.fields_by_name['summary'].has_options = True
+_APIREPORTDESCRIPTOR.fields_by_name['summary']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229UI-friendly displayed summary of what the report reports.'))
+_APIREPORTDESCRIPTOR.fields_by_name['requires_time_range'].has_options = True
+_APIREPORTDESCRIPTOR.fields_by_name['requires_time_range']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0012\0220Indicates whether the report needs a time range.'))
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["STACK_CHART"].has_options = True
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["STACK_CHART"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\013Stack chart'))
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["PIE_CHART"].has_options = True
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["PIE_CHART"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\tPie chart'))
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["LINE_CHART"].has_options = True
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["LINE_CHART"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\nLine chart'))
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["AUDIT_CHART"].has_options = True
+_APIREPORTDATA_REPRESENTATIONTYPE.values_by_name["AUDIT_CHART"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\013Audit chart'))
+_APIREPORTDATA.has_options = True
+_APIREPORTDATA._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('\332\374\343\304\001\025\022\023representation_type'))
+_APISTACKCHARTREPORTDATA.fields_by_name['data'].has_options = True
+_APISTACKCHARTREPORTDATA.fields_by_name['data']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))
+_APISTACKCHARTREPORTDATA.fields_by_name['x_ticks'].has_options = True
+_APISTACKCHARTREPORTDATA.fields_by_name['x_ticks']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:X axis ticks. See: github.com/flot/flot/blob/master/API.md'))
+_APISTACKCHARTREPORTDATA.fields_by_name['y_ticks'].has_options = True
+_APISTACKCHARTREPORTDATA.fields_by_name['y_ticks']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:Y axis ticks. See: github.com/flot/flot/blob/master/API.md'))
+_APISTACKCHARTREPORTDATA.fields_by_name['bar_width'].has_options = True
+_APISTACKCHARTREPORTDATA.fields_by_name['bar_width']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022)Width of the bars displayed on the chart.'))
+_APIPIECHARTREPORTDATA.fields_by_name['data'].has_options = True
+_APIPIECHARTREPORTDATA.fields_by_name['data']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))
+_APILINECHARTREPORTDATA.fields_by_name['data'].has_options = True
+_APILINECHARTREPORTDATA.fields_by_name['data']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031What the report contains.'))
+_APIAUDITCHARTREPORTDATA.fields_by_name['used_fields'].has_options = True
+_APIAUDITCHARTREPORTDATA.fields_by_name['used_fields']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\0222Names of the AuditEvent fields used by the report.'))
+_APIAUDITCHARTREPORTDATA.fields_by_name['rows'].has_options = True
+_APIAUDITCHARTREPORTDATA.fields_by_name['rows']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036Data to be shown in the chart.'))
+_APIREPORTDATAPOINT1D.fields_by_name['label'].has_options = True
+_APIREPORTDATAPOINT1D.fields_by_name['label']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'The series is labeled with this string.'))
+_APIREPORTDATASERIES2D.fields_by_name['label'].has_options = True
+_APIREPORTDATASERIES2D.fields_by_name['label']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'The series is labeled with this string.'))
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE.values_by_name["DH_SUM"].has_options = True
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE.values_by_name["DH_SUM"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001=Sum of all values recorded in a distribution will be fetched.'))
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE.values_by_name["DH_COUNT"].has_options = True
+_APIGETSTATSSTOREMETRICARGS_DISTRIBUTIONHANDLINGMODE.values_by_name["DH_COUNT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001@Number of all values recorded in a distribution will be fetched.'))
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_SUM"].has_options = True
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_SUM"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\026Values will be summed.'))
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_MEAN"].has_options = True
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_MEAN"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001\036Mean value will be calculated.'))
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_NONE"].has_options = True
+_APIGETSTATSSTOREMETRICARGS_AGGREGATIONMODE.values_by_name["AGG_NONE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\352\271\313\271\001!No aggregation will be performed.'))
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['start'].has_options = True
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['start']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001g\n\013RDFDatetime\022XFetch metrics data starting from this timestamp. If not set, will default to 1 hour ago.'))
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['end'].has_options = True
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['end']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001}\n\013RDFDatetime\022nFetch metrics data from the interval ending with this timestamp. If not set, will default to the current time.'))
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['rate'].has_options = True
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['rate']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001]\n\010Duration\022QIf set, metric\'s rate over given window will be returned instead of plain values.'))
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['distribution_handling_mode'].has_options = True
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['distribution_handling_mode']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022ADetermines which values to fetch when dealing with distributions.'))
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['aggregation_mode'].has_options = True
+_APIGETSTATSSTOREMETRICARGS.fields_by_name['aggregation_mode']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001~\022|Aggregation method. As metrics are usually collected across multiple processes, most of the time they have to be aggregated.'))
+_APIGETREPORTARGS.fields_by_name['name'].has_options = True
+_APIGETREPORTARGS.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\207\001\022\204\001Identifier in the report hierarchy. Also the name of the corresponding class in report_plugins.py. Eg \'ClientsActivityReportPlugin\'.'))
+_APIGETREPORTARGS.fields_by_name['start_time'].has_options = True
+_APIGETREPORTARGS.fields_by_name['start_time']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001w\n\013RDFDatetime\022hEarliest timestamp of data points to consider. Ignored by reports with requires_time_range set to false.'))
+_APIGETREPORTARGS.fields_by_name['duration'].has_options = True
+_APIGETREPORTARGS.fields_by_name['duration']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001k\n\010Duration\022_Length of the time range to consider. Ignored by reports with requires_time_range set to false.'))
+_APIGETREPORTARGS.fields_by_name['client_label'].has_options = True
+_APIGETREPORTARGS.fields_by_name['client_label']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226Client label used by label-specific reports. Optional.'))
+_APILISTREPORTSRESULT.fields_by_name['reports'].has_options = True
+_APILISTREPORTSRESULT.fields_by_name['reports']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The report list.'))
+# @@protoc_insertion_point(module_scope)
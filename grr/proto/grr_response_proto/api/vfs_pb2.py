@@ -0,0 +1,2171 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/api/vfs.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/api/vfs.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n grr_response_proto/api/vfs.proto\x1a\x19google/protobuf/any.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"\x84\x05\n\x07\x41piFile\x12 \n\x04name\x18\x01 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile name.\x12;\n\x04path\x18\x02 \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%File path starting from the VFS root.\x12 \n\x04type\x18\x03 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile type.\x12\x35\n\x04stat\x18\x0b \x01(\x0b\x32\n.StatEntryB\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13\x46ile creation time.\x12Q\n\x03\x61ge\x18\x05 \x01(\x04\x42\x44\xe2\xfc\xe3\xc4\x01>\n\x0bRDFDatetime\x12/File age (when file object was updated in GRR).\x12>\n\x0cis_directory\x18\x06 \x01(\x08\x42(\xe2\xfc\xe3\xc4\x01\"\x12 True if the file is a directory.\x12\x35\n\x04hash\x18\x07 \x01(\x0b\x32\x05.HashB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Hash values of the file.\x12Z\n\x0elast_collected\x18\x08 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-Last time file was collected from the client.\x12Q\n\x13last_collected_size\x18\n \x01(\x04\x42\x34\xe2\xfc\xe3\xc4\x01.\x12,Size of the file last time it was collected.\x12H\n\x07\x64\x65tails\x18\t \x01(\x0b\x32\x1c.ApiAff4ObjectRepresentationB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11The file details.\"\\\n\x1b\x41piAff4ObjectRepresentation\x12=\n\x05types\x18\x01 \x03(\x0b\x32\x12.ApiAff4ObjectTypeB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12The list of types.\"\x92\x01\n\x11\x41piAff4ObjectType\x12/\n\x04name\x18\x01 \x01(\tB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19The name of the category.\x12L\n\nattributes\x18\x02 \x03(\x0b\x32\x17.ApiAff4ObjectAttributeB\x1f\xe2\xfc\xe3\xc4\x01\x19\x12\x17The list of attributes.\"\x9e\x01\n\x16\x41piAff4ObjectAttribute\x12\x30\n\x04name\x18\x01 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aThe name of the attribute.\x12R\n\x06values\x18\x02 \x03(\x0b\x32\x1c.ApiAff4ObjectAttributeValueB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1cThe values of the attribute.\"\xe6\x01\n\x1b\x41piAff4ObjectAttributeValue\x12\x30\n\x04type\x18\x01 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aThe type of the attribute.\x12;\n\x03\x61ge\x18\x02 \x01(\x04\x42.\xe2\xfc\xe3\xc4\x01(\n\x0bRDFDatetime\x12\x19The age of the attribute.\x12X\n\x05value\x18\x03 \x01(\x0b\x32\x14.google.protobuf.AnyB3\xe2\xfc\xe3\xc4\x01-\x12\x1cThe value of the attributes.*\rGetValueClass\"\x8e\x02\n\x12\x41piVfsTimelineItem\x12<\n\ttimestamp\x18\x01 \x01(\x04\x42)\xe2\xfc\xe3\xc4\x01#\n\x0bRDFDatetime\x12\x14The event timestamp.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12M\n\x06\x61\x63tion\x18\x03 \x01(\x0e\x32\".ApiVfsTimelineItem.FileActionTypeB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11\x46ile action type.\"D\n\x0e\x46ileActionType\x12\x10\n\x0cMODIFICATION\x10\x00\x12\n\n\x06\x41\x43\x43\x45SS\x10\x01\x12\x14\n\x10METADATA_CHANGED\x10\x02\"\xc9\x01\n\x15\x41piGetFileDetailsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12U\n\ttimestamp\x18\x03 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-The age specifying which version to retrieve.\"e\n\x17\x41piGetFileDetailsResult\x12J\n\x04\x66ile\x18\x01 \x01(\x0b\x32\x08.ApiFileB2\xe2\xfc\xe3\xc4\x01,\x12*The file containing including all details.\"\xd2\x03\n\x10\x41piListFilesArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12(\n\x06offset\x18\x03 \x01(\x03\x42\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Starting offset.\x12\x34\n\x05\x63ount\x18\x04 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dMax number of items to fetch.\x12\x61\n\x06\x66ilter\x18\x05 \x01(\tBQ\xe2\xfc\xe3\xc4\x01K\x12IReturn only results whose string representation contains given substring.\x12I\n\x10\x64irectories_only\x18\x06 \x01(\x08\x42/\xe2\xfc\xe3\xc4\x01)\x12\'If true, only directories are returned.\x12U\n\ttimestamp\x18\x07 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-The age specifying which version to retrieve.\"I\n\x12\x41piListFilesResult\x12\x33\n\x05items\x18\x01 \x03(\x0b\x32\x08.ApiFileB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12The list of files.\"\xcd\x01\n\x19\x41piGetVfsFilesArchiveArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12U\n\ttimestamp\x18\x03 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-The age specifying which version to retrieve.\"\x81\x08\n\x12\x41piGetFileTextArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12\x32\n\x06offset\x18\x03 \x01(\x03\x42\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aThe offset from the start.\x12\x35\n\x06length\x18\x04 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dThe number of bytes returned.\x12Q\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32\x1c.ApiGetFileTextArgs.EncodingB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19The encoding of the file.\x12U\n\ttimestamp\x18\x06 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-The age specifying which version to retrieve.\"\xfa\x04\n\x08\x45ncoding\x12\x10\n\x0c\x42\x41SE64_CODEC\x10\x00\x12\x08\n\x04\x42IG5\x10\x01\x12\r\n\tBIG5HKSCS\x10\x02\x12\t\n\x05\x43P037\x10\x03\x12\n\n\x06\x43P1006\x10\x04\x12\n\n\x06\x43P1026\x10\x05\x12\n\n\x06\x43P1140\x10\x06\x12\n\n\x06\x43P1250\x10\x07\x12\n\n\x06\x43P1251\x10\x08\x12\n\n\x06\x43P1252\x10\t\x12\n\n\x06\x43P1253\x10\n\x12\n\n\x06\x43P1254\x10\x0b\x12\n\n\x06\x43P1255\x10\x0c\x12\n\n\x06\x43P1256\x10\r\x12\n\n\x06\x43P1257\x10\x0e\x12\n\n\x06\x43P1258\x10\x0f\x12\t\n\x05\x43P424\x10\x10\x12\t\n\x05\x43P437\x10\x11\x12\t\n\x05\x43P500\x10\x12\x12\t\n\x05\x43P737\x10\x13\x12\t\n\x05\x43P775\x10\x14\x12\t\n\x05\x43P850\x10\x15\x12\t\n\x05\x43P852\x10\x16\x12\t\n\x05\x43P855\x10\x17\x12\t\n\x05\x43P856\x10\x18\x12\t\n\x05\x43P857\x10\x19\x12\t\n\x05\x43P860\x10\x1a\x12\t\n\x05\x43P861\x10\x1b\x12\t\n\x05\x43P862\x10\x1c\x12\t\n\x05\x43P863\x10\x1d\x12\t\n\x05\x43P864\x10\x1e\x12\t\n\x05\x43P865\x10\x1f\x12\t\n\x05\x43P866\x10 \x12\t\n\x05\x43P869\x10!\x12\t\n\x05\x43P874\x10\"\x12\t\n\x05\x43P875\x10#\x12\t\n\x05\x43P932\x10$\x12\t\n\x05\x43P949\x10%\x12\t\n\x05\x43P950\x10&\x12\x08\n\x04IDNA\x10\'\x12\n\n\x06ROT_13\x10(\x12\n\n\x06UTF_16\x10)\x12\r\n\tUTF_16_BE\x10*\x12\r\n\tUTF_16_LE\x10+\x12\n\n\x06UTF_32\x10,\x12\r\n\tUTF_32_BE\x10-\x12\r\n\tUTF_32_LE\x10.\x12\t\n\x05UTF_7\x10/\x12\t\n\x05UTF_8\x10\x30\x12\r\n\tUTF_8_SIG\x10\x31\x12\x0c\n\x08UU_CODEC\x10\x32\x12\x0e\n\nZLIB_CODEC\x10\x33\"\x8a\x01\n\x14\x41piGetFileTextResult\x12\x31\n\x07\x63ontent\x18\x01 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18The content of the file.\x12?\n\ntotal_size\x18\x02 \x01(\x03\x42+\xe2\xfc\xe3\xc4\x01%\x12#The total size of the file in byte.\"\xb1\x02\n\x12\x41piGetFileBlobArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12\x32\n\x06offset\x18\x03 \x01(\x03\x42\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aThe offset from the start.\x12\x35\n\x06length\x18\x04 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dThe number of bytes returned.\x12U\n\ttimestamp\x18\x05 \x01(\x04\x42\x42\xe2\xfc\xe3\xc4\x01<\n\x0bRDFDatetime\x12-The age specifying which version to retrieve.\"w\n\x1a\x41piGetFileVersionTimesArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\"^\n\x1c\x41piGetFileVersionTimesResult\x12>\n\x05times\x18\x01 \x03(\x04\x42/\xe2\xfc\xe3\xc4\x01)\n\x0bRDFDatetime\x12\x1aThe list of version times.\"z\n\x1d\x41piGetFileDownloadCommandArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\"^\n\x1f\x41piGetFileDownloadCommandResult\x12;\n\x07\x63ommand\x18\x01 \x01(\tB*\xe2\xfc\xe3\xc4\x01$\x12\"The command to download this file.\"\xa5\x02\n ApiCreateVfsRefreshOperationArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12\x45\n\tfile_path\x18\x02 \x01(\tB2\xe2\xfc\xe3\xc4\x01,\x12*AFF4 path of a VFS folder to be refreshed.\x12\x33\n\tmax_depth\x18\x03 \x01(\x04\x42 \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Maximum recursion depth.\x12Q\n\x0bnotify_user\x18\x04 \x01(\x08\x42<\xe2\xfc\xe3\xc4\x01\x36\x12\x34Whether the operation should notify the user or not.\"r\n\x15\x41piGetVfsTimelineArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\"W\n\x17\x41piGetVfsTimelineResult\x12<\n\x05items\x18\x01 \x03(\x0b\x32\x13.ApiVfsTimelineItemB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10The event items.\"\xf7\x01\n\x1a\x41piGetVfsTimelineAsCsvArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12%\n\tfile_path\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFile path.\x12V\n\x06\x66ormat\x18\x03 \x01(\x0e\x32\".ApiGetVfsTimelineAsCsvArgs.FormatB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aGenerated timeline format.\"&\n\x06\x46ormat\x12\t\n\x05UNSET\x10\x00\x12\x07\n\x03GRR\x10\x01\x12\x08\n\x04\x42ODY\x10\x02\"d\n\"ApiCreateVfsRefreshOperationResult\x12>\n\x0coperation_id\x18\x01 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 The id of the refresh operation.\"\x98\x01\n\"ApiGetVfsRefreshOperationStateArgs\x12\x32\n\tclient_id\x18\x02 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12>\n\x0coperation_id\x18\x01 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 The id of the refresh operation.\"\xb3\x01\n$ApiGetVfsRefreshOperationStateResult\x12g\n\x05state\x18\x01 \x01(\x0e\x32+.ApiGetVfsRefreshOperationStateResult.StateB+\xe2\xfc\xe3\xc4\x01%\x12#The state of the refresh operation.\"\"\n\x05State\x12\x0b\n\x07RUNNING\x10\x00\x12\x0c\n\x08\x46INISHED\x10\x01\"\x96\x01\n\x1b\x41piUpdateVfsFileContentArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12\x43\n\tfile_path\x18\x02 \x01(\tB0\xe2\xfc\xe3\xc4\x01*\x12(AFF4 path of a VFS file to be refreshed.\"^\n\x1d\x41piUpdateVfsFileContentResult\x12=\n\x0coperation_id\x18\x01 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fThe id of the update operation.\"\x98\x01\n#ApiGetVfsFileContentUpdateStateArgs\x12\x32\n\tclient_id\x18\x02 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12=\n\x0coperation_id\x18\x01 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fThe id of the update operation.\"\xb4\x01\n%ApiGetVfsFileContentUpdateStateResult\x12g\n\x05state\x18\x01 \x01(\x0e\x32,.ApiGetVfsFileContentUpdateStateResult.StateB*\xe2\xfc\xe3\xc4\x01$\x12\"The state of the update operation.\"\"\n\x05State\x12\x0b\n\x07RUNNING\x10\x00\x12\x0c\n\x08\x46INISHED\x10\x01\"U\n\x1b\x41piListKnownEncodingsResult\x12\x36\n\tencodings\x18\x01 \x03(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bThe list of file encodings.\"\xd2\x01\n\x16\x41piGetFileDecodersArgs\x12\x61\n\tclient_id\x18\x01 \x01(\tBN\xe2\xfc\xe3\xc4\x01H\n\x0b\x41piClientId\x12\x39\x41n id of the client to which the encoded file belongs to.\x12U\n\tfile_path\x18\x02 \x01(\tBB\xe2\xfc\xe3\xc4\x01<\x12:A path to the encrypted file to get the decoder names for.\"q\n\x18\x41piGetFileDecodersResult\x12U\n\rdecoder_names\x18\x01 \x03(\tB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36Names of the decoders that are applicable to the file.\"\x9b\x02\n\x15\x41piGetDecodedFileArgs\x12\x61\n\tclient_id\x18\x01 \x01(\tBN\xe2\xfc\xe3\xc4\x01H\n\x0b\x41piClientId\x12\x39\x41n id of the client to which the encoded file belongs to.\x12N\n\tfile_path\x18\x02 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\x12\x33\x41 path to the encrypted file to do the decoding on.\x12O\n\x0c\x64\x65\x63oder_name\x18\x03 \x01(\tB9\xe2\xfc\xe3\xc4\x01\x33\x12\x31\x41 name of the decoder to use to decoder the file.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIVFSTIMELINEITEM_FILEACTIONTYPE = _descriptor.EnumDescriptor(
+  name='FileActionType',
+  full_name='ApiVfsTimelineItem.FileActionType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='MODIFICATION', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ACCESS', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='METADATA_CHANGED', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1616,
+  serialized_end=1684,
+)
+_sym_db.RegisterEnumDescriptor(_APIVFSTIMELINEITEM_FILEACTIONTYPE)
+
+_APIGETFILETEXTARGS_ENCODING = _descriptor.EnumDescriptor(
+  name='Encoding',
+  full_name='ApiGetFileTextArgs.Encoding',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='BASE64_CODEC', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BIG5', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BIG5HKSCS', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP037', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1006', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1026', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1140', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1250', index=7, number=7,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1251', index=8, number=8,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1252', index=9, number=9,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1253', index=10, number=10,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1254', index=11, number=11,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1255', index=12, number=12,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1256', index=13, number=13,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1257', index=14, number=14,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP1258', index=15, number=15,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP424', index=16, number=16,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP437', index=17, number=17,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP500', index=18, number=18,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP737', index=19, number=19,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP775', index=20, number=20,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP850', index=21, number=21,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP852', index=22, number=22,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP855', index=23, number=23,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP856', index=24, number=24,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP857', index=25, number=25,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP860', index=26, number=26,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP861', index=27, number=27,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP862', index=28, number=28,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP863', index=29, number=29,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP864', index=30, number=30,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP865', index=31, number=31,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP866', index=32, number=32,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP869', index=33, number=33,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP874', index=34, number=34,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP875', index=35, number=35,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP932', index=36, number=36,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP949', index=37, number=37,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CP950', index=38, number=38,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='IDNA', index=39, number=39,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ROT_13', index=40, number=40,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_16', index=41, number=41,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_16_BE', index=42, number=42,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_16_LE', index=43, number=43,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_32', index=44, number=44,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_32_BE', index=45, number=45,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_32_LE', index=46, number=46,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_7', index=47, number=47,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_8', index=48, number=48,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UTF_8_SIG', index=49, number=49,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UU_CODEC', index=50, number=50,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ZLIB_CODEC', index=51, number=51,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3137,
+  serialized_end=3771,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETFILETEXTARGS_ENCODING)
+
+_APIGETVFSTIMELINEASCSVARGS_FORMAT = _descriptor.EnumDescriptor(
+  name='Format',
+  full_name='ApiGetVfsTimelineAsCsvArgs.Format',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSET', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GRR', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BODY', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=5370,
+  serialized_end=5408,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETVFSTIMELINEASCSVARGS_FORMAT)
+
+_APIGETVFSREFRESHOPERATIONSTATERESULT_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='ApiGetVfsRefreshOperationStateResult.State',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='RUNNING', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FINISHED', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=5813,
+  serialized_end=5847,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETVFSREFRESHOPERATIONSTATERESULT_STATE)
+
+_APIGETVFSFILECONTENTUPDATESTATERESULT_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='ApiGetVfsFileContentUpdateStateResult.State',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='RUNNING', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FINISHED', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=5813,
+  serialized_end=5847,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETVFSFILECONTENTUPDATESTATERESULT_STATE)
+
+
+_APIFILE = _descriptor.Descriptor(
+  name='ApiFile',
+  full_name='ApiFile',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiFile.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile name.'))),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiFile.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%File path starting from the VFS root.'))),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiFile.type', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile type.'))),
+    _descriptor.FieldDescriptor(
+      name='stat', full_name='ApiFile.stat', index=3,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023File creation time.'))),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='ApiFile.age', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\n\013RDFDatetime\022/File age (when file object was updated in GRR).'))),
+    _descriptor.FieldDescriptor(
+      name='is_directory', full_name='ApiFile.is_directory', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 True if the file is a directory.'))),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='ApiFile.hash', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Hash values of the file.'))),
+    _descriptor.FieldDescriptor(
+      name='last_collected', full_name='ApiFile.last_collected', index=7,
+      number=8, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-Last time file was collected from the client.'))),
+    _descriptor.FieldDescriptor(
+      name='last_collected_size', full_name='ApiFile.last_collected_size', index=8,
+      number=10, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,Size of the file last time it was collected.'))),
+    _descriptor.FieldDescriptor(
+      name='details', full_name='ApiFile.details', index=9,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021The file details.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=130,
+  serialized_end=774,
+)
+
+
+_APIAFF4OBJECTREPRESENTATION = _descriptor.Descriptor(
+  name='ApiAff4ObjectRepresentation',
+  full_name='ApiAff4ObjectRepresentation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='types', full_name='ApiAff4ObjectRepresentation.types', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022The list of types.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=776,
+  serialized_end=868,
+)
+
+
+_APIAFF4OBJECTTYPE = _descriptor.Descriptor(
+  name='ApiAff4ObjectType',
+  full_name='ApiAff4ObjectType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiAff4ObjectType.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The name of the category.'))),
+    _descriptor.FieldDescriptor(
+      name='attributes', full_name='ApiAff4ObjectType.attributes', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\022\027The list of attributes.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=871,
+  serialized_end=1017,
+)
+
+
+_APIAFF4OBJECTATTRIBUTE = _descriptor.Descriptor(
+  name='ApiAff4ObjectAttribute',
+  full_name='ApiAff4ObjectAttribute',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiAff4ObjectAttribute.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The name of the attribute.'))),
+    _descriptor.FieldDescriptor(
+      name='values', full_name='ApiAff4ObjectAttribute.values', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034The values of the attribute.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1020,
+  serialized_end=1178,
+)
+
+
+_APIAFF4OBJECTATTRIBUTEVALUE = _descriptor.Descriptor(
+  name='ApiAff4ObjectAttributeValue',
+  full_name='ApiAff4ObjectAttributeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiAff4ObjectAttributeValue.type', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The type of the attribute.'))),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='ApiAff4ObjectAttributeValue.age', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001(\n\013RDFDatetime\022\031The age of the attribute.'))),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiAff4ObjectAttributeValue.value', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022\034The value of the attributes.*\rGetValueClass'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1181,
+  serialized_end=1411,
+)
+
+
+_APIVFSTIMELINEITEM = _descriptor.Descriptor(
+  name='ApiVfsTimelineItem',
+  full_name='ApiVfsTimelineItem',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiVfsTimelineItem.timestamp', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\n\013RDFDatetime\022\024The event timestamp.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiVfsTimelineItem.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='action', full_name='ApiVfsTimelineItem.action', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021File action type.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIVFSTIMELINEITEM_FILEACTIONTYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1414,
+  serialized_end=1684,
+)
+
+
+_APIGETFILEDETAILSARGS = _descriptor.Descriptor(
+  name='ApiGetFileDetailsArgs',
+  full_name='ApiGetFileDetailsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileDetailsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileDetailsArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGetFileDetailsArgs.timestamp', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1687,
+  serialized_end=1888,
+)
+
+
+_APIGETFILEDETAILSRESULT = _descriptor.Descriptor(
+  name='ApiGetFileDetailsResult',
+  full_name='ApiGetFileDetailsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='file', full_name='ApiGetFileDetailsResult.file', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001,\022*The file containing including all details.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1890,
+  serialized_end=1991,
+)
+
+
+_APILISTFILESARGS = _descriptor.Descriptor(
+  name='ApiListFilesArgs',
+  full_name='ApiListFilesArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFilesArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiListFilesArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFilesArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFilesArgs.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of items to fetch.'))),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='ApiListFilesArgs.filter', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001K\022IReturn only results whose string representation contains given substring.'))),
+    _descriptor.FieldDescriptor(
+      name='directories_only', full_name='ApiListFilesArgs.directories_only', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'If true, only directories are returned.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiListFilesArgs.timestamp', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1994,
+  serialized_end=2460,
+)
+
+
+_APILISTFILESRESULT = _descriptor.Descriptor(
+  name='ApiListFilesResult',
+  full_name='ApiListFilesResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFilesResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022The list of files.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2462,
+  serialized_end=2535,
+)
+
+
+_APIGETVFSFILESARCHIVEARGS = _descriptor.Descriptor(
+  name='ApiGetVfsFilesArchiveArgs',
+  full_name='ApiGetVfsFilesArchiveArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetVfsFilesArchiveArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetVfsFilesArchiveArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGetVfsFilesArchiveArgs.timestamp', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2538,
+  serialized_end=2743,
+)
+
+
+_APIGETFILETEXTARGS = _descriptor.Descriptor(
+  name='ApiGetFileTextArgs',
+  full_name='ApiGetFileTextArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileTextArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileTextArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiGetFileTextArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The offset from the start.'))),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='ApiGetFileTextArgs.length', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035The number of bytes returned.'))),
+    _descriptor.FieldDescriptor(
+      name='encoding', full_name='ApiGetFileTextArgs.encoding', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The encoding of the file.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGetFileTextArgs.timestamp', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETFILETEXTARGS_ENCODING,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2746,
+  serialized_end=3771,
+)
+
+
+_APIGETFILETEXTRESULT = _descriptor.Descriptor(
+  name='ApiGetFileTextResult',
+  full_name='ApiGetFileTextResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='content', full_name='ApiGetFileTextResult.content', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030The content of the file.'))),
+    _descriptor.FieldDescriptor(
+      name='total_size', full_name='ApiGetFileTextResult.total_size', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The total size of the file in byte.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3774,
+  serialized_end=3912,
+)
+
+
+_APIGETFILEBLOBARGS = _descriptor.Descriptor(
+  name='ApiGetFileBlobArgs',
+  full_name='ApiGetFileBlobArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileBlobArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileBlobArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiGetFileBlobArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The offset from the start.'))),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='ApiGetFileBlobArgs.length', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035The number of bytes returned.'))),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGetFileBlobArgs.timestamp', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3915,
+  serialized_end=4220,
+)
+
+
+_APIGETFILEVERSIONTIMESARGS = _descriptor.Descriptor(
+  name='ApiGetFileVersionTimesArgs',
+  full_name='ApiGetFileVersionTimesArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileVersionTimesArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileVersionTimesArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4222,
+  serialized_end=4341,
+)
+
+
+_APIGETFILEVERSIONTIMESRESULT = _descriptor.Descriptor(
+  name='ApiGetFileVersionTimesResult',
+  full_name='ApiGetFileVersionTimesResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='times', full_name='ApiGetFileVersionTimesResult.times', index=0,
+      number=1, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\013RDFDatetime\022\032The list of version times.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4343,
+  serialized_end=4437,
+)
+
+
+_APIGETFILEDOWNLOADCOMMANDARGS = _descriptor.Descriptor(
+  name='ApiGetFileDownloadCommandArgs',
+  full_name='ApiGetFileDownloadCommandArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileDownloadCommandArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileDownloadCommandArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4439,
+  serialized_end=4561,
+)
+
+
+_APIGETFILEDOWNLOADCOMMANDRESULT = _descriptor.Descriptor(
+  name='ApiGetFileDownloadCommandResult',
+  full_name='ApiGetFileDownloadCommandResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='command', full_name='ApiGetFileDownloadCommandResult.command', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"The command to download this file.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4563,
+  serialized_end=4657,
+)
+
+
+_APICREATEVFSREFRESHOPERATIONARGS = _descriptor.Descriptor(
+  name='ApiCreateVfsRefreshOperationArgs',
+  full_name='ApiCreateVfsRefreshOperationArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiCreateVfsRefreshOperationArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiCreateVfsRefreshOperationArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001,\022*AFF4 path of a VFS folder to be refreshed.'))),
+    _descriptor.FieldDescriptor(
+      name='max_depth', full_name='ApiCreateVfsRefreshOperationArgs.max_depth', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Maximum recursion depth.'))),
+    _descriptor.FieldDescriptor(
+      name='notify_user', full_name='ApiCreateVfsRefreshOperationArgs.notify_user', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224Whether the operation should notify the user or not.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4660,
+  serialized_end=4953,
+)
+
+
+_APIGETVFSTIMELINEARGS = _descriptor.Descriptor(
+  name='ApiGetVfsTimelineArgs',
+  full_name='ApiGetVfsTimelineArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetVfsTimelineArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetVfsTimelineArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4955,
+  serialized_end=5069,
+)
+
+
+_APIGETVFSTIMELINERESULT = _descriptor.Descriptor(
+  name='ApiGetVfsTimelineResult',
+  full_name='ApiGetVfsTimelineResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiGetVfsTimelineResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The event items.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5071,
+  serialized_end=5158,
+)
+
+
+_APIGETVFSTIMELINEASCSVARGS = _descriptor.Descriptor(
+  name='ApiGetVfsTimelineAsCsvArgs',
+  full_name='ApiGetVfsTimelineAsCsvArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetVfsTimelineAsCsvArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetVfsTimelineAsCsvArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))),
+    _descriptor.FieldDescriptor(
+      name='format', full_name='ApiGetVfsTimelineAsCsvArgs.format', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032Generated timeline format.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETVFSTIMELINEASCSVARGS_FORMAT,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5161,
+  serialized_end=5408,
+)
+
+
+_APICREATEVFSREFRESHOPERATIONRESULT = _descriptor.Descriptor(
+  name='ApiCreateVfsRefreshOperationResult',
+  full_name='ApiCreateVfsRefreshOperationResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiCreateVfsRefreshOperationResult.operation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 The id of the refresh operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5410,
+  serialized_end=5510,
+)
+
+
+_APIGETVFSREFRESHOPERATIONSTATEARGS = _descriptor.Descriptor(
+  name='ApiGetVfsRefreshOperationStateArgs',
+  full_name='ApiGetVfsRefreshOperationStateArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetVfsRefreshOperationStateArgs.client_id', index=0,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiGetVfsRefreshOperationStateArgs.operation_id', index=1,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 The id of the refresh operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5513,
+  serialized_end=5665,
+)
+
+
+_APIGETVFSREFRESHOPERATIONSTATERESULT = _descriptor.Descriptor(
+  name='ApiGetVfsRefreshOperationStateResult',
+  full_name='ApiGetVfsRefreshOperationStateResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ApiGetVfsRefreshOperationStateResult.state', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The state of the refresh operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETVFSREFRESHOPERATIONSTATERESULT_STATE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5668,
+  serialized_end=5847,
+)
+
+
+_APIUPDATEVFSFILECONTENTARGS = _descriptor.Descriptor(
+  name='ApiUpdateVfsFileContentArgs',
+  full_name='ApiUpdateVfsFileContentArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiUpdateVfsFileContentArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiUpdateVfsFileContentArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(AFF4 path of a VFS file to be refreshed.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5850,
+  serialized_end=6000,
+)
+
+
+_APIUPDATEVFSFILECONTENTRESULT = _descriptor.Descriptor(
+  name='ApiUpdateVfsFileContentResult',
+  full_name='ApiUpdateVfsFileContentResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiUpdateVfsFileContentResult.operation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The id of the update operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6002,
+  serialized_end=6096,
+)
+
+
+_APIGETVFSFILECONTENTUPDATESTATEARGS = _descriptor.Descriptor(
+  name='ApiGetVfsFileContentUpdateStateArgs',
+  full_name='ApiGetVfsFileContentUpdateStateArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetVfsFileContentUpdateStateArgs.client_id', index=0,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))),
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiGetVfsFileContentUpdateStateArgs.operation_id', index=1,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The id of the update operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6099,
+  serialized_end=6251,
+)
+
+
+_APIGETVFSFILECONTENTUPDATESTATERESULT = _descriptor.Descriptor(
+  name='ApiGetVfsFileContentUpdateStateResult',
+  full_name='ApiGetVfsFileContentUpdateStateResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ApiGetVfsFileContentUpdateStateResult.state', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"The state of the update operation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETVFSFILECONTENTUPDATESTATERESULT_STATE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6254,
+  serialized_end=6434,
+)
+
+
+_APILISTKNOWNENCODINGSRESULT = _descriptor.Descriptor(
+  name='ApiListKnownEncodingsResult',
+  full_name='ApiListKnownEncodingsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='encodings', full_name='ApiListKnownEncodingsResult.encodings', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033The list of file encodings.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6436,
+  serialized_end=6521,
+)
+
+
+_APIGETFILEDECODERSARGS = _descriptor.Descriptor(
+  name='ApiGetFileDecodersArgs',
+  full_name='ApiGetFileDecodersArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFileDecodersArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001H\n\013ApiClientId\0229An id of the client to which the encoded file belongs to.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetFileDecodersArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:A path to the encrypted file to get the decoder names for.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6524,
+  serialized_end=6734,
+)
+
+
+_APIGETFILEDECODERSRESULT = _descriptor.Descriptor(
+  name='ApiGetFileDecodersResult',
+  full_name='ApiGetFileDecodersResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='decoder_names', full_name='ApiGetFileDecodersResult.decoder_names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226Names of the decoders that are applicable to the file.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6736,
+  serialized_end=6849,
+)
+
+
+_APIGETDECODEDFILEARGS = _descriptor.Descriptor(
+  name='ApiGetDecodedFileArgs',
+  full_name='ApiGetDecodedFileArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetDecodedFileArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001H\n\013ApiClientId\0229An id of the client to which the encoded file belongs to.'))),
+    _descriptor.FieldDescriptor(
+      name='file_path', full_name='ApiGetDecodedFileArgs.file_path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223A path to the encrypted file to do the decoding on.'))),
+    _descriptor.FieldDescriptor(
+      name='decoder_name', full_name='ApiGetDecodedFileArgs.decoder_name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221A name of the decoder to use to decoder the file.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6852,
+  serialized_end=7135,
+)
+
+_APIFILE.fields_by_name['stat'].message_type = grr__response__proto_dot_jobs__pb2._STATENTRY
+_APIFILE.fields_by_name['hash'].message_type = grr__response__proto_dot_jobs__pb2._HASH
+_APIFILE.fields_by_name['details'].message_type = _APIAFF4OBJECTREPRESENTATION
+_APIAFF4OBJECTREPRESENTATION.fields_by_name['types'].message_type = _APIAFF4OBJECTTYPE
+_APIAFF4OBJECTTYPE.fields_by_name['attributes'].message_type = _APIAFF4OBJECTATTRIBUTE
+_APIAFF4OBJECTATTRIBUTE.fields_by_name['values'].message_type = _APIAFF4OBJECTATTRIBUTEVALUE
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['value'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIVFSTIMELINEITEM.fields_by_name['action'].enum_type = _APIVFSTIMELINEITEM_FILEACTIONTYPE
+_APIVFSTIMELINEITEM_FILEACTIONTYPE.containing_type = _APIVFSTIMELINEITEM
+_APIGETFILEDETAILSRESULT.fields_by_name['file'].message_type = _APIFILE
+_APILISTFILESRESULT.fields_by_name['items'].message_type = _APIFILE
+_APIGETFILETEXTARGS.fields_by_name['encoding'].enum_type = _APIGETFILETEXTARGS_ENCODING
+_APIGETFILETEXTARGS_ENCODING.containing_type = _APIGETFILETEXTARGS
+_APIGETVFSTIMELINERESULT.fields_by_name['items'].message_type = _APIVFSTIMELINEITEM
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['format'].enum_type = _APIGETVFSTIMELINEASCSVARGS_FORMAT
+_APIGETVFSTIMELINEASCSVARGS_FORMAT.containing_type = _APIGETVFSTIMELINEASCSVARGS
+_APIGETVFSREFRESHOPERATIONSTATERESULT.fields_by_name['state'].enum_type = _APIGETVFSREFRESHOPERATIONSTATERESULT_STATE
+_APIGETVFSREFRESHOPERATIONSTATERESULT_STATE.containing_type = _APIGETVFSREFRESHOPERATIONSTATERESULT
+_APIGETVFSFILECONTENTUPDATESTATERESULT.fields_by_name['state'].enum_type = _APIGETVFSFILECONTENTUPDATESTATERESULT_STATE
+_APIGETVFSFILECONTENTUPDATESTATERESULT_STATE.containing_type = _APIGETVFSFILECONTENTUPDATESTATERESULT
+DESCRIPTOR.message_types_by_name['ApiFile'] = _APIFILE
+DESCRIPTOR.message_types_by_name['ApiAff4ObjectRepresentation'] = _APIAFF4OBJECTREPRESENTATION
+DESCRIPTOR.message_types_by_name['ApiAff4ObjectType'] = _APIAFF4OBJECTTYPE
+DESCRIPTOR.message_types_by_name['ApiAff4ObjectAttribute'] = _APIAFF4OBJECTATTRIBUTE
+DESCRIPTOR.message_types_by_name['ApiAff4ObjectAttributeValue'] = _APIAFF4OBJECTATTRIBUTEVALUE
+DESCRIPTOR.message_types_by_name['ApiVfsTimelineItem'] = _APIVFSTIMELINEITEM
+DESCRIPTOR.message_types_by_name['ApiGetFileDetailsArgs'] = _APIGETFILEDETAILSARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileDetailsResult'] = _APIGETFILEDETAILSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFilesArgs'] = _APILISTFILESARGS
+DESCRIPTOR.message_types_by_name['ApiListFilesResult'] = _APILISTFILESRESULT
+DESCRIPTOR.message_types_by_name['ApiGetVfsFilesArchiveArgs'] = _APIGETVFSFILESARCHIVEARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileTextArgs'] = _APIGETFILETEXTARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileTextResult'] = _APIGETFILETEXTRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFileBlobArgs'] = _APIGETFILEBLOBARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileVersionTimesArgs'] = _APIGETFILEVERSIONTIMESARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileVersionTimesResult'] = _APIGETFILEVERSIONTIMESRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFileDownloadCommandArgs'] = _APIGETFILEDOWNLOADCOMMANDARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileDownloadCommandResult'] = _APIGETFILEDOWNLOADCOMMANDRESULT
+DESCRIPTOR.message_types_by_name['ApiCreateVfsRefreshOperationArgs'] = _APICREATEVFSREFRESHOPERATIONARGS
+DESCRIPTOR.message_types_by_name['ApiGetVfsTimelineArgs'] = _APIGETVFSTIMELINEARGS
+DESCRIPTOR.message_types_by_name['ApiGetVfsTimelineResult'] = _APIGETVFSTIMELINERESULT
+DESCRIPTOR.message_types_by_name['ApiGetVfsTimelineAsCsvArgs'] = _APIGETVFSTIMELINEASCSVARGS
+DESCRIPTOR.message_types_by_name['ApiCreateVfsRefreshOperationResult'] = _APICREATEVFSREFRESHOPERATIONRESULT
+DESCRIPTOR.message_types_by_name['ApiGetVfsRefreshOperationStateArgs'] = _APIGETVFSREFRESHOPERATIONSTATEARGS
+DESCRIPTOR.message_types_by_name['ApiGetVfsRefreshOperationStateResult'] = _APIGETVFSREFRESHOPERATIONSTATERESULT
+DESCRIPTOR.message_types_by_name['ApiUpdateVfsFileContentArgs'] = _APIUPDATEVFSFILECONTENTARGS
+DESCRIPTOR.message_types_by_name['ApiUpdateVfsFileContentResult'] = _APIUPDATEVFSFILECONTENTRESULT
+DESCRIPTOR.message_types_by_name['ApiGetVfsFileContentUpdateStateArgs'] = _APIGETVFSFILECONTENTUPDATESTATEARGS
+DESCRIPTOR.message_types_by_name['ApiGetVfsFileContentUpdateStateResult'] = _APIGETVFSFILECONTENTUPDATESTATERESULT
+DESCRIPTOR.message_types_by_name['ApiListKnownEncodingsResult'] = _APILISTKNOWNENCODINGSRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFileDecodersArgs'] = _APIGETFILEDECODERSARGS
+DESCRIPTOR.message_types_by_name['ApiGetFileDecodersResult'] = _APIGETFILEDECODERSRESULT
+DESCRIPTOR.message_types_by_name['ApiGetDecodedFileArgs'] = _APIGETDECODEDFILEARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiFile = _reflection.GeneratedProtocolMessageType('ApiFile', (_message.Message,), dict(
+  DESCRIPTOR = _APIFILE,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiFile)
+  ))
+_sym_db.RegisterMessage(ApiFile)
+
+ApiAff4ObjectRepresentation = _reflection.GeneratedProtocolMessageType('ApiAff4ObjectRepresentation', (_message.Message,), dict(
+  DESCRIPTOR = _APIAFF4OBJECTREPRESENTATION,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAff4ObjectRepresentation)
+  ))
+_sym_db.RegisterMessage(ApiAff4ObjectRepresentation)
+
+ApiAff4ObjectType = _reflection.GeneratedProtocolMessageType('ApiAff4ObjectType', (_message.Message,), dict(
+  DESCRIPTOR = _APIAFF4OBJECTTYPE,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAff4ObjectType)
+  ))
+_sym_db.RegisterMessage(ApiAff4ObjectType)
+
+ApiAff4ObjectAttribute = _reflection.GeneratedProtocolMessageType('ApiAff4ObjectAttribute', (_message.Message,), dict(
+  DESCRIPTOR = _APIAFF4OBJECTATTRIBUTE,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAff4ObjectAttribute)
+  ))
+_sym_db.RegisterMessage(ApiAff4ObjectAttribute)
+
+ApiAff4ObjectAttributeValue = _reflection.GeneratedProtocolMessageType('ApiAff4ObjectAttributeValue', (_message.Message,), dict(
+  DESCRIPTOR = _APIAFF4OBJECTATTRIBUTEVALUE,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiAff4ObjectAttributeValue)
+  ))
+_sym_db.RegisterMessage(ApiAff4ObjectAttributeValue)
+
+ApiVfsTimelineItem = _reflection.GeneratedProtocolMessageType('ApiVfsTimelineItem', (_message.Message,), dict(
+  DESCRIPTOR = _APIVFSTIMELINEITEM,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiVfsTimelineItem)
+  ))
+_sym_db.RegisterMessage(ApiVfsTimelineItem)
+
+ApiGetFileDetailsArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileDetailsArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDETAILSARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDetailsArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDetailsArgs)
+
+ApiGetFileDetailsResult = _reflection.GeneratedProtocolMessageType('ApiGetFileDetailsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDETAILSRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDetailsResult)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDetailsResult)
+
+ApiListFilesArgs = _reflection.GeneratedProtocolMessageType('ApiListFilesArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTFILESARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFilesArgs)
+  ))
+_sym_db.RegisterMessage(ApiListFilesArgs)
+
+ApiListFilesResult = _reflection.GeneratedProtocolMessageType('ApiListFilesResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTFILESRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFilesResult)
+  ))
+_sym_db.RegisterMessage(ApiListFilesResult)
+
+ApiGetVfsFilesArchiveArgs = _reflection.GeneratedProtocolMessageType('ApiGetVfsFilesArchiveArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSFILESARCHIVEARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsFilesArchiveArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsFilesArchiveArgs)
+
+ApiGetFileTextArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileTextArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILETEXTARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileTextArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileTextArgs)
+
+ApiGetFileTextResult = _reflection.GeneratedProtocolMessageType('ApiGetFileTextResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILETEXTRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileTextResult)
+  ))
+_sym_db.RegisterMessage(ApiGetFileTextResult)
+
+ApiGetFileBlobArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileBlobArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEBLOBARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileBlobArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileBlobArgs)
+
+ApiGetFileVersionTimesArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileVersionTimesArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEVERSIONTIMESARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileVersionTimesArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileVersionTimesArgs)
+
+ApiGetFileVersionTimesResult = _reflection.GeneratedProtocolMessageType('ApiGetFileVersionTimesResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEVERSIONTIMESRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileVersionTimesResult)
+  ))
+_sym_db.RegisterMessage(ApiGetFileVersionTimesResult)
+
+ApiGetFileDownloadCommandArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileDownloadCommandArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDOWNLOADCOMMANDARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDownloadCommandArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDownloadCommandArgs)
+
+ApiGetFileDownloadCommandResult = _reflection.GeneratedProtocolMessageType('ApiGetFileDownloadCommandResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDOWNLOADCOMMANDRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDownloadCommandResult)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDownloadCommandResult)
+
+ApiCreateVfsRefreshOperationArgs = _reflection.GeneratedProtocolMessageType('ApiCreateVfsRefreshOperationArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APICREATEVFSREFRESHOPERATIONARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiCreateVfsRefreshOperationArgs)
+  ))
+_sym_db.RegisterMessage(ApiCreateVfsRefreshOperationArgs)
+
+ApiGetVfsTimelineArgs = _reflection.GeneratedProtocolMessageType('ApiGetVfsTimelineArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSTIMELINEARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsTimelineArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsTimelineArgs)
+
+ApiGetVfsTimelineResult = _reflection.GeneratedProtocolMessageType('ApiGetVfsTimelineResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSTIMELINERESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsTimelineResult)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsTimelineResult)
+
+ApiGetVfsTimelineAsCsvArgs = _reflection.GeneratedProtocolMessageType('ApiGetVfsTimelineAsCsvArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSTIMELINEASCSVARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsTimelineAsCsvArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsTimelineAsCsvArgs)
+
+ApiCreateVfsRefreshOperationResult = _reflection.GeneratedProtocolMessageType('ApiCreateVfsRefreshOperationResult', (_message.Message,), dict(
+  DESCRIPTOR = _APICREATEVFSREFRESHOPERATIONRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiCreateVfsRefreshOperationResult)
+  ))
+_sym_db.RegisterMessage(ApiCreateVfsRefreshOperationResult)
+
+ApiGetVfsRefreshOperationStateArgs = _reflection.GeneratedProtocolMessageType('ApiGetVfsRefreshOperationStateArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSREFRESHOPERATIONSTATEARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsRefreshOperationStateArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsRefreshOperationStateArgs)
+
+ApiGetVfsRefreshOperationStateResult = _reflection.GeneratedProtocolMessageType('ApiGetVfsRefreshOperationStateResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSREFRESHOPERATIONSTATERESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsRefreshOperationStateResult)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsRefreshOperationStateResult)
+
+ApiUpdateVfsFileContentArgs = _reflection.GeneratedProtocolMessageType('ApiUpdateVfsFileContentArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIUPDATEVFSFILECONTENTARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiUpdateVfsFileContentArgs)
+  ))
+_sym_db.RegisterMessage(ApiUpdateVfsFileContentArgs)
+
+ApiUpdateVfsFileContentResult = _reflection.GeneratedProtocolMessageType('ApiUpdateVfsFileContentResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIUPDATEVFSFILECONTENTRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiUpdateVfsFileContentResult)
+  ))
+_sym_db.RegisterMessage(ApiUpdateVfsFileContentResult)
+
+ApiGetVfsFileContentUpdateStateArgs = _reflection.GeneratedProtocolMessageType('ApiGetVfsFileContentUpdateStateArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSFILECONTENTUPDATESTATEARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsFileContentUpdateStateArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsFileContentUpdateStateArgs)
+
+ApiGetVfsFileContentUpdateStateResult = _reflection.GeneratedProtocolMessageType('ApiGetVfsFileContentUpdateStateResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETVFSFILECONTENTUPDATESTATERESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetVfsFileContentUpdateStateResult)
+  ))
+_sym_db.RegisterMessage(ApiGetVfsFileContentUpdateStateResult)
+
+ApiListKnownEncodingsResult = _reflection.GeneratedProtocolMessageType('ApiListKnownEncodingsResult', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTKNOWNENCODINGSRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListKnownEncodingsResult)
+  ))
+_sym_db.RegisterMessage(ApiListKnownEncodingsResult)
+
+ApiGetFileDecodersArgs = _reflection.GeneratedProtocolMessageType('ApiGetFileDecodersArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDECODERSARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDecodersArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDecodersArgs)
+
+ApiGetFileDecodersResult = _reflection.GeneratedProtocolMessageType('ApiGetFileDecodersResult', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETFILEDECODERSRESULT,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFileDecodersResult)
+  ))
+_sym_db.RegisterMessage(ApiGetFileDecodersResult)
+
+ApiGetDecodedFileArgs = _reflection.GeneratedProtocolMessageType('ApiGetDecodedFileArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETDECODEDFILEARGS,
+  __module__ = 'grr_response_proto.api.vfs_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetDecodedFileArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetDecodedFileArgs)
+
+
+_APIFILE.fields_by_name['name'].has_options = True
+_APIFILE.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile name.'))
+_APIFILE.fields_by_name['path'].has_options = True
+_APIFILE.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%File path starting from the VFS root.'))
+_APIFILE.fields_by_name['type'].has_options = True
+_APIFILE.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile type.'))
+_APIFILE.fields_by_name['stat'].has_options = True
+_APIFILE.fields_by_name['stat']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023File creation time.'))
+_APIFILE.fields_by_name['age'].has_options = True
+_APIFILE.fields_by_name['age']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\n\013RDFDatetime\022/File age (when file object was updated in GRR).'))
+_APIFILE.fields_by_name['is_directory'].has_options = True
+_APIFILE.fields_by_name['is_directory']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 True if the file is a directory.'))
+_APIFILE.fields_by_name['hash'].has_options = True
+_APIFILE.fields_by_name['hash']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Hash values of the file.'))
+_APIFILE.fields_by_name['last_collected'].has_options = True
+_APIFILE.fields_by_name['last_collected']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-Last time file was collected from the client.'))
+_APIFILE.fields_by_name['last_collected_size'].has_options = True
+_APIFILE.fields_by_name['last_collected_size']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,Size of the file last time it was collected.'))
+_APIFILE.fields_by_name['details'].has_options = True
+_APIFILE.fields_by_name['details']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021The file details.'))
+_APIAFF4OBJECTREPRESENTATION.fields_by_name['types'].has_options = True
+_APIAFF4OBJECTREPRESENTATION.fields_by_name['types']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022The list of types.'))
+_APIAFF4OBJECTTYPE.fields_by_name['name'].has_options = True
+_APIAFF4OBJECTTYPE.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The name of the category.'))
+_APIAFF4OBJECTTYPE.fields_by_name['attributes'].has_options = True
+_APIAFF4OBJECTTYPE.fields_by_name['attributes']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\022\027The list of attributes.'))
+_APIAFF4OBJECTATTRIBUTE.fields_by_name['name'].has_options = True
+_APIAFF4OBJECTATTRIBUTE.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The name of the attribute.'))
+_APIAFF4OBJECTATTRIBUTE.fields_by_name['values'].has_options = True
+_APIAFF4OBJECTATTRIBUTE.fields_by_name['values']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034The values of the attribute.'))
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['type'].has_options = True
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The type of the attribute.'))
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['age'].has_options = True
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['age']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001(\n\013RDFDatetime\022\031The age of the attribute.'))
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['value'].has_options = True
+_APIAFF4OBJECTATTRIBUTEVALUE.fields_by_name['value']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001-\022\034The value of the attributes.*\rGetValueClass'))
+_APIVFSTIMELINEITEM.fields_by_name['timestamp'].has_options = True
+_APIVFSTIMELINEITEM.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\n\013RDFDatetime\022\024The event timestamp.'))
+_APIVFSTIMELINEITEM.fields_by_name['file_path'].has_options = True
+_APIVFSTIMELINEITEM.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIVFSTIMELINEITEM.fields_by_name['action'].has_options = True
+_APIVFSTIMELINEITEM.fields_by_name['action']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\021File action type.'))
+_APIGETFILEDETAILSARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILEDETAILSARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETFILEDETAILSARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILEDETAILSARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETFILEDETAILSARGS.fields_by_name['timestamp'].has_options = True
+_APIGETFILEDETAILSARGS.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))
+_APIGETFILEDETAILSRESULT.fields_by_name['file'].has_options = True
+_APIGETFILEDETAILSRESULT.fields_by_name['file']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001,\022*The file containing including all details.'))
+_APILISTFILESARGS.fields_by_name['client_id'].has_options = True
+_APILISTFILESARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APILISTFILESARGS.fields_by_name['file_path'].has_options = True
+_APILISTFILESARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APILISTFILESARGS.fields_by_name['offset'].has_options = True
+_APILISTFILESARGS.fields_by_name['offset']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))
+_APILISTFILESARGS.fields_by_name['count'].has_options = True
+_APILISTFILESARGS.fields_by_name['count']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of items to fetch.'))
+_APILISTFILESARGS.fields_by_name['filter'].has_options = True
+_APILISTFILESARGS.fields_by_name['filter']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001K\022IReturn only results whose string representation contains given substring.'))
+_APILISTFILESARGS.fields_by_name['directories_only'].has_options = True
+_APILISTFILESARGS.fields_by_name['directories_only']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\022\'If true, only directories are returned.'))
+_APILISTFILESARGS.fields_by_name['timestamp'].has_options = True
+_APILISTFILESARGS.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))
+_APILISTFILESRESULT.fields_by_name['items'].has_options = True
+_APILISTFILESRESULT.fields_by_name['items']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\024\022\022The list of files.'))
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['client_id'].has_options = True
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['file_path'].has_options = True
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['timestamp'].has_options = True
+_APIGETVFSFILESARCHIVEARGS.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))
+_APIGETFILETEXTARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETFILETEXTARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETFILETEXTARGS.fields_by_name['offset'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['offset']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The offset from the start.'))
+_APIGETFILETEXTARGS.fields_by_name['length'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['length']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035The number of bytes returned.'))
+_APIGETFILETEXTARGS.fields_by_name['encoding'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['encoding']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The encoding of the file.'))
+_APIGETFILETEXTARGS.fields_by_name['timestamp'].has_options = True
+_APIGETFILETEXTARGS.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))
+_APIGETFILETEXTRESULT.fields_by_name['content'].has_options = True
+_APIGETFILETEXTRESULT.fields_by_name['content']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030The content of the file.'))
+_APIGETFILETEXTRESULT.fields_by_name['total_size'].has_options = True
+_APIGETFILETEXTRESULT.fields_by_name['total_size']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The total size of the file in byte.'))
+_APIGETFILEBLOBARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILEBLOBARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETFILEBLOBARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILEBLOBARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETFILEBLOBARGS.fields_by_name['offset'].has_options = True
+_APIGETFILEBLOBARGS.fields_by_name['offset']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032The offset from the start.'))
+_APIGETFILEBLOBARGS.fields_by_name['length'].has_options = True
+_APIGETFILEBLOBARGS.fields_by_name['length']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035The number of bytes returned.'))
+_APIGETFILEBLOBARGS.fields_by_name['timestamp'].has_options = True
+_APIGETFILEBLOBARGS.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\n\013RDFDatetime\022-The age specifying which version to retrieve.'))
+_APIGETFILEVERSIONTIMESARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILEVERSIONTIMESARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETFILEVERSIONTIMESARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILEVERSIONTIMESARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETFILEVERSIONTIMESRESULT.fields_by_name['times'].has_options = True
+_APIGETFILEVERSIONTIMESRESULT.fields_by_name['times']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\013RDFDatetime\022\032The list of version times.'))
+_APIGETFILEDOWNLOADCOMMANDARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILEDOWNLOADCOMMANDARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETFILEDOWNLOADCOMMANDARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILEDOWNLOADCOMMANDARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETFILEDOWNLOADCOMMANDRESULT.fields_by_name['command'].has_options = True
+_APIGETFILEDOWNLOADCOMMANDRESULT.fields_by_name['command']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"The command to download this file.'))
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['client_id'].has_options = True
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['file_path'].has_options = True
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001,\022*AFF4 path of a VFS folder to be refreshed.'))
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['max_depth'].has_options = True
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['max_depth']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Maximum recursion depth.'))
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['notify_user'].has_options = True
+_APICREATEVFSREFRESHOPERATIONARGS.fields_by_name['notify_user']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224Whether the operation should notify the user or not.'))
+_APIGETVFSTIMELINEARGS.fields_by_name['client_id'].has_options = True
+_APIGETVFSTIMELINEARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETVFSTIMELINEARGS.fields_by_name['file_path'].has_options = True
+_APIGETVFSTIMELINEARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETVFSTIMELINERESULT.fields_by_name['items'].has_options = True
+_APIGETVFSTIMELINERESULT.fields_by_name['items']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The event items.'))
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['client_id'].has_options = True
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['file_path'].has_options = True
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\014\022\nFile path.'))
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['format'].has_options = True
+_APIGETVFSTIMELINEASCSVARGS.fields_by_name['format']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\022\032Generated timeline format.'))
+_APICREATEVFSREFRESHOPERATIONRESULT.fields_by_name['operation_id'].has_options = True
+_APICREATEVFSREFRESHOPERATIONRESULT.fields_by_name['operation_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 The id of the refresh operation.'))
+_APIGETVFSREFRESHOPERATIONSTATEARGS.fields_by_name['client_id'].has_options = True
+_APIGETVFSREFRESHOPERATIONSTATEARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETVFSREFRESHOPERATIONSTATEARGS.fields_by_name['operation_id'].has_options = True
+_APIGETVFSREFRESHOPERATIONSTATEARGS.fields_by_name['operation_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\"\022 The id of the refresh operation.'))
+_APIGETVFSREFRESHOPERATIONSTATERESULT.fields_by_name['state'].has_options = True
+_APIGETVFSREFRESHOPERATIONSTATERESULT.fields_by_name['state']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The state of the refresh operation.'))
+_APIUPDATEVFSFILECONTENTARGS.fields_by_name['client_id'].has_options = True
+_APIUPDATEVFSFILECONTENTARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIUPDATEVFSFILECONTENTARGS.fields_by_name['file_path'].has_options = True
+_APIUPDATEVFSFILECONTENTARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(AFF4 path of a VFS file to be refreshed.'))
+_APIUPDATEVFSFILECONTENTRESULT.fields_by_name['operation_id'].has_options = True
+_APIUPDATEVFSFILECONTENTRESULT.fields_by_name['operation_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The id of the update operation.'))
+_APIGETVFSFILECONTENTUPDATESTATEARGS.fields_by_name['client_id'].has_options = True
+_APIGETVFSFILECONTENTUPDATESTATEARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'))
+_APIGETVFSFILECONTENTUPDATESTATEARGS.fields_by_name['operation_id'].has_options = True
+_APIGETVFSFILECONTENTUPDATESTATEARGS.fields_by_name['operation_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The id of the update operation.'))
+_APIGETVFSFILECONTENTUPDATESTATERESULT.fields_by_name['state'].has_options = True
+_APIGETVFSFILECONTENTUPDATESTATERESULT.fields_by_name['state']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"The state of the update operation.'))
+_APILISTKNOWNENCODINGSRESULT.fields_by_name['encodings'].has_options = True
+_APILISTKNOWNENCODINGSRESULT.fields_by_name['encodings']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033The list of file encodings.'))
+_APIGETFILEDECODERSARGS.fields_by_name['client_id'].has_options = True
+_APIGETFILEDECODERSARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001H\n\013ApiClientId\0229An id of the client to which the encoded file belongs to.'))
+_APIGETFILEDECODERSARGS.fields_by_name['file_path'].has_options = True
+_APIGETFILEDECODERSARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001<\022:A path to the encrypted file to get the decoder names for.'))
+_APIGETFILEDECODERSRESULT.fields_by_name['decoder_names'].has_options = True
+_APIGETFILEDECODERSRESULT.fields_by_name['decoder_names']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226Names of the decoders that are applicable to the file.'))
+_APIGETDECODEDFILEARGS.fields_by_name['client_id'].has_options = True
+_APIGETDECODEDFILEARGS.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001H\n\013ApiClientId\0229An id of the client to which the encoded file belongs to.'))
+_APIGETDECODEDFILEARGS.fields_by_name['file_path'].has_options = True
+_APIGETDECODEDFILEARGS.fields_by_name['file_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223A path to the encrypted file to do the decoding on.'))
+_APIGETDECODEDFILEARGS.fields_by_name['decoder_name'].has_options = True
+_APIGETDECODEDFILEARGS.fields_by_name['decoder_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0013\0221A name of the decoder to use to decoder the file.'))
+# @@protoc_insertion_point(module_scope)
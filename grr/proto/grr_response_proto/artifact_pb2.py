@@ -0,0 +1,843 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/artifact.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import knowledge_base_pb2 as grr__response__proto_dot_knowledge__base__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+from grr_response_proto import sysinfo_pb2 as grr__response__proto_dot_sysinfo__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/artifact.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n!grr_response_proto/artifact.proto\x1a\x19google/protobuf/any.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a\'grr_response_proto/knowledge_base.proto\x1a!grr_response_proto/semantic.proto\x1a grr_response_proto/sysinfo.proto\"\x9c\x06\n\x0e\x41rtifactSource\x12\x45\n\x04type\x18\x01 \x01(\x0e\x32\x1a.ArtifactSource.SourceTypeB\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13The type of source.\x12\\\n\nattributes\x18\x02 \x01(\x0b\x32\x05.DictBA\xe2\xfc\xe3\xc4\x01;\x12\x39The attributes that describe the source. e.g. file paths.\x12j\n\nconditions\x18\x03 \x03(\tBV\xe2\xfc\xe3\xc4\x01P\x12NObject filter conditions that decide if this source applies to a given system.\x12\x91\x01\n\x0ereturned_types\x18\x04 \x03(\tBy\xe2\xfc\xe3\xc4\x01s\x12qA list of types that may be returned by this source. Anything returned that is not in this list will be filtered.\x12\x61\n\x0csupported_os\x18\x05 \x03(\tBK\xe2\xfc\xe3\xc4\x01\x45\x12\x43\x41 list of operating systems to which this source should be applied.\"\x81\x02\n\nSourceType\x12\x1a\n\x16\x43OLLECTOR_TYPE_UNKNOWN\x10\x00\x12\x08\n\x04\x46ILE\x10\x01\x12\x10\n\x0cREGISTRY_KEY\x10\x02\x12\x12\n\x0eREGISTRY_VALUE\x10\x03\x12\x07\n\x03WMI\x10\x04\x12\x0c\n\x08\x41RTIFACT\x10\x05\x12\x08\n\x04PATH\x10\x06\x12\r\n\tDIRECTORY\x10\x07\x12\x12\n\x0e\x41RTIFACT_GROUP\x10\x08\x12\x15\n\x11GRR_CLIENT_ACTION\x10(\x12\x0e\n\nLIST_FILES\x10)\x12\x12\n\x0e\x41RTIFACT_FILES\x10*\x12\x08\n\x04GREP\x10+\x12\x0b\n\x07\x43OMMAND\x10-\x12\x11\n\rREKALL_PLUGIN\x10.\"\xaf\x05\n\x08\x41rtifact\x12I\n\x04name\x18\x01 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\n\x0c\x41rtifactName\x12%Globally unique name of the artifact.\x12X\n\nconditions\x18\x02 \x03(\tBD\xe2\xfc\xe3\xc4\x01>\x12<A list of conditions that decide if the artifact should run.\x12\x31\n\x03\x64oc\x18\x03 \x01(\tB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1c\x44oc string for the artifact.\x12\x41\n\x06labels\x18\x04 \x03(\tB1\xe2\xfc\xe3\xc4\x01+\x12)A list of labels the artifact belongs to.\x12P\n\x0csupported_os\x18\x05 \x03(\tB:\xe2\xfc\xe3\xc4\x01\x34\x12\x32\x41 list of operating systems the artifact supports.\x12\x45\n\x04urls\x18\x06 \x03(\tB7\xe2\xfc\xe3\xc4\x01\x31\x12/A list of urls that help document the artifact.\x12P\n\x08provides\x18\x08 \x03(\tB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36\x41 list of knowledgebase values this artifact provides.\x12\x45\n\x07sources\x18\t \x03(\x0b\x32\x0f.ArtifactSourceB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1b\x41 list of artifact sources.\x12V\n\rerror_message\x18\n \x01(\tB?\xe2\xfc\xe3\xc4\x01\x39\x12\x37The error message for artifacts that failed validation.\"\xf1\x01\n\x1b\x41rtifactProcessorDescriptor\x12<\n\x04name\x18\x01 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&Processor\'s name as registered in GRR.\x12;\n\x0b\x64\x65scription\x18\x02 \x01(\tB&\xe2\xfc\xe3\xc4\x01 \x12\x1e\x44\x65scription of this processor.\x12W\n\x0coutput_types\x18\x03 \x03(\tBA\xe2\xfc\xe3\xc4\x01;\x12\x39The semantic types that can be produced by the processor.\"\x87\x04\n\x12\x41rtifactDescriptor\x12\x35\n\x08\x61rtifact\x18\x01 \x01(\x0b\x32\t.ArtifactB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10\x41rtifact itself.\x12J\n\x0c\x64\x65pendencies\x18\x02 \x03(\tB4\xe2\xfc\xe3\xc4\x01.\x12,Names of artifacts this artifact depends on.\x12P\n\x11path_dependencies\x18\x03 \x03(\tB5\xe2\xfc\xe3\xc4\x01/\x12-Names of KB objects this artifact depends on.\x12n\n\nprocessors\x18\x05 \x03(\x0b\x32\x1c.ArtifactProcessorDescriptorB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34Processors that will process this artifact\'s output.\x12T\n\tis_custom\x18\x06 \x01(\x08\x42\x41\xe2\xfc\xe3\xc4\x01;\x12\x39If True, this artifact was manually uploaded by the user.\x12V\n\rerror_message\x18\x07 \x01(\tB?\xe2\xfc\xe3\xc4\x01\x39\x12\x37The error message for artifacts that failed validation.\"\xf8\x06\n\x1b\x43lientArtifactCollectorArgs\x12\x42\n\tartifacts\x18\x01 \x03(\x0b\x32\x11.ExpandedArtifactB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14\x41 list of artifacts.\x12k\n\x0eknowledge_base\x18\x02 \x01(\x0b\x32\x0e.KnowledgeBaseBC\xe2\xfc\xe3\xc4\x01=\x12;The knowledge base containing information about the client.\x12M\n\x07use_tsk\x18\x03 \x01(\x08:\x05\x66\x61lseB5\xe2\xfc\xe3\xc4\x01/\x12-Whether raw filesystem access should be used.\x12\xa6\x01\n\rapply_parsers\x18\x06 \x01(\x08:\x04trueB\x88\x01\xe2\xfc\xe3\xc4\x01\x81\x01\x12}If True, apply any relevant parser to the collected data. If False, return the raw collected data e.g Files or Registry Keys.\x18\x01\x12\xb1\x02\n\x1bignore_interpolation_errors\x18\x07 \x01(\x08:\x05\x66\x61lseB\x84\x02\xe2\xfc\xe3\xc4\x01\xfd\x01\x12\xfa\x01If true, don\'t die if %%users.homedir%% and similar fail to expand. It\'s common on windows for some user attributes to be missing if users have never logged in. Enable this when you have multiple artifacts or paths and want to report partial results.\x12|\n\rmax_file_size\x18\x08 \x01(\x04:\t500000000BZ\xe2\xfc\xe3\xc4\x01T\n\x08\x42yteSize\x12\x46The maximum size of files we will download in bytes, 500MB by default.\x18\x01\"\x87\x03\n\x10\x45xpandedArtifact\x12=\n\x04name\x18\x01 \x02(\tB/\xe2\xfc\xe3\xc4\x01)\n\x0c\x41rtifactName\x12\x19The name of the artifact.\x12N\n\x07sources\x18\x02 \x03(\x0b\x32\x0f.ExpandedSourceB,\xe2\xfc\xe3\xc4\x01&\x12$The sources and what they depend on.\x12P\n\x08provides\x18\x03 \x03(\tB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36\x41 list of knowledgebase values this artifact provides.\x12\x91\x01\n\x11requested_by_user\x18\x04 \x01(\x08:\x04trueBp\xe2\xfc\xe3\xc4\x01j\x12hWhether the artifact is requested by the user or scheduled for collection as a KnowledgeBase dependency.\"\xcf\x03\n\x0e\x45xpandedSource\x12>\n\x0b\x62\x61se_source\x18\x01 \x02(\x0b\x32\x0f.ArtifactSourceB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10The base source.\x12\x38\n\tpath_type\x18\x06 \x01(\x0e\x32\x12.PathSpec.PathTypeB\x11\xe2\xfc\xe3\xc4\x01\x0b\x12\tPath Type\x12|\n\x0cmax_bytesize\x18\x07 \x01(\x04\x42\x66\xe2\xfc\xe3\xc4\x01`\n\x08\x42yteSize\x12TFile Finder Download Action Option: The maximum byte size of files we will download.\x12\x62\n\x10max_number_files\x18\x08 \x01(\x05\x42H\xe2\xfc\xe3\xc4\x01\x42\x12@File Finder Action Option: The maximum number of results to get.\x12\x61\n\x10\x61rtifact_sources\x18\t \x03(\x0b\x32\x0f.ExpandedSourceB6\xe2\xfc\xe3\xc4\x01\x30\x12.Extended sources for ArtifactFiles collection.\"\xf5\x01\n\x1d\x43lientArtifactCollectorResult\x12g\n\x13\x63ollected_artifacts\x18\x01 \x03(\x0b\x32\x12.CollectedArtifactB6\xe2\xfc\xe3\xc4\x01\x30\x12.The results of the single collected artifacts.\x12k\n\x0eknowledge_base\x18\x02 \x01(\x0b\x32\x0e.KnowledgeBaseBC\xe2\xfc\xe3\xc4\x01=\x12;The knowledge base containing information about the client.\"\xb7\x01\n\x11\x43ollectedArtifact\x12=\n\x04name\x18\x01 \x02(\tB/\xe2\xfc\xe3\xc4\x01)\n\x0c\x41rtifactName\x12\x19The name of the artifact.\x12\x63\n\x0e\x61\x63tion_results\x18\x02 \x03(\x0b\x32\x13.ClientActionResultB6\xe2\xfc\xe3\xc4\x01\x30\x12.The results from the performed client actions.\"\xa9\x01\n\x12\x43lientActionResult\x12;\n\x04type\x18\x0b \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%The type of the client action result.\x12V\n\x05value\x18\x0c \x01(\x0b\x32\x14.google.protobuf.AnyB1\xe2\xfc\xe3\xc4\x01+\x12\x1aThe value of the response.*\rGetValueClass')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_knowledge__base__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,grr__response__proto_dot_sysinfo__pb2.DESCRIPTOR,])
+
+
+
+_ARTIFACTSOURCE_SOURCETYPE = _descriptor.EnumDescriptor(
+  name='SourceType',
+  full_name='ArtifactSource.SourceType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='COLLECTOR_TYPE_UNKNOWN', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REGISTRY_KEY', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REGISTRY_VALUE', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WMI', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ARTIFACT', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PATH', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DIRECTORY', index=7, number=7,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ARTIFACT_GROUP', index=8, number=8,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GRR_CLIENT_ACTION', index=9, number=40,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LIST_FILES', index=10, number=41,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ARTIFACT_FILES', index=11, number=42,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GREP', index=12, number=43,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMMAND', index=13, number=45,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REKALL_PLUGIN', index=14, number=46,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=745,
+  serialized_end=1002,
+)
+_sym_db.RegisterEnumDescriptor(_ARTIFACTSOURCE_SOURCETYPE)
+
+
+_ARTIFACTSOURCE = _descriptor.Descriptor(
+  name='ArtifactSource',
+  full_name='ArtifactSource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ArtifactSource.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023The type of source.'))),
+    _descriptor.FieldDescriptor(
+      name='attributes', full_name='ArtifactSource.attributes', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229The attributes that describe the source. e.g. file paths.'))),
+    _descriptor.FieldDescriptor(
+      name='conditions', full_name='ArtifactSource.conditions', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001P\022NObject filter conditions that decide if this source applies to a given system.'))),
+    _descriptor.FieldDescriptor(
+      name='returned_types', full_name='ArtifactSource.returned_types', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qA list of types that may be returned by this source. Anything returned that is not in this list will be filtered.'))),
+    _descriptor.FieldDescriptor(
+      name='supported_os', full_name='ArtifactSource.supported_os', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001E\022CA list of operating systems to which this source should be applied.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _ARTIFACTSOURCE_SOURCETYPE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=206,
+  serialized_end=1002,
+)
+
+
+_ARTIFACT = _descriptor.Descriptor(
+  name='Artifact',
+  full_name='Artifact',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='Artifact.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\n\014ArtifactName\022%Globally unique name of the artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='conditions', full_name='Artifact.conditions', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\022<A list of conditions that decide if the artifact should run.'))),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='Artifact.doc', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034Doc string for the artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='labels', full_name='Artifact.labels', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022)A list of labels the artifact belongs to.'))),
+    _descriptor.FieldDescriptor(
+      name='supported_os', full_name='Artifact.supported_os', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\0222A list of operating systems the artifact supports.'))),
+    _descriptor.FieldDescriptor(
+      name='urls', full_name='Artifact.urls', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\022/A list of urls that help document the artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='provides', full_name='Artifact.provides', index=6,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226A list of knowledgebase values this artifact provides.'))),
+    _descriptor.FieldDescriptor(
+      name='sources', full_name='Artifact.sources', index=7,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033A list of artifact sources.'))),
+    _descriptor.FieldDescriptor(
+      name='error_message', full_name='Artifact.error_message', index=8,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The error message for artifacts that failed validation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1005,
+  serialized_end=1692,
+)
+
+
+_ARTIFACTPROCESSORDESCRIPTOR = _descriptor.Descriptor(
+  name='ArtifactProcessorDescriptor',
+  full_name='ArtifactProcessorDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ArtifactProcessorDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001(\022&Processor\'s name as registered in GRR.'))),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='ArtifactProcessorDescriptor.description', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036Description of this processor.'))),
+    _descriptor.FieldDescriptor(
+      name='output_types', full_name='ArtifactProcessorDescriptor.output_types', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229The semantic types that can be produced by the processor.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1695,
+  serialized_end=1936,
+)
+
+
+_ARTIFACTDESCRIPTOR = _descriptor.Descriptor(
+  name='ArtifactDescriptor',
+  full_name='ArtifactDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact', full_name='ArtifactDescriptor.artifact', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Artifact itself.'))),
+    _descriptor.FieldDescriptor(
+      name='dependencies', full_name='ArtifactDescriptor.dependencies', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,Names of artifacts this artifact depends on.'))),
+    _descriptor.FieldDescriptor(
+      name='path_dependencies', full_name='ArtifactDescriptor.path_dependencies', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Names of KB objects this artifact depends on.'))),
+    _descriptor.FieldDescriptor(
+      name='processors', full_name='ArtifactDescriptor.processors', index=3,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224Processors that will process this artifact\'s output.'))),
+    _descriptor.FieldDescriptor(
+      name='is_custom', full_name='ArtifactDescriptor.is_custom', index=4,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229If True, this artifact was manually uploaded by the user.'))),
+    _descriptor.FieldDescriptor(
+      name='error_message', full_name='ArtifactDescriptor.error_message', index=5,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The error message for artifacts that failed validation.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1939,
+  serialized_end=2458,
+)
+
+
+_CLIENTARTIFACTCOLLECTORARGS = _descriptor.Descriptor(
+  name='ClientArtifactCollectorArgs',
+  full_name='ClientArtifactCollectorArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifacts', full_name='ClientArtifactCollectorArgs.artifacts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\026\022\024A list of artifacts.'))),
+    _descriptor.FieldDescriptor(
+      name='knowledge_base', full_name='ClientArtifactCollectorArgs.knowledge_base', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001=\022;The knowledge base containing information about the client.'))),
+    _descriptor.FieldDescriptor(
+      name='use_tsk', full_name='ClientArtifactCollectorArgs.use_tsk', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Whether raw filesystem access should be used.'))),
+    _descriptor.FieldDescriptor(
+      name='apply_parsers', full_name='ClientArtifactCollectorArgs.apply_parsers', index=3,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=True,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\201\001\022}If True, apply any relevant parser to the collected data. If False, return the raw collected data e.g Files or Registry Keys.\030\001'))),
+    _descriptor.FieldDescriptor(
+      name='ignore_interpolation_errors', full_name='ClientArtifactCollectorArgs.ignore_interpolation_errors', index=4,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\375\001\022\372\001If true, don\'t die if %%users.homedir%% and similar fail to expand. It\'s common on windows for some user attributes to be missing if users have never logged in. Enable this when you have multiple artifacts or paths and want to report partial results.'))),
+    _descriptor.FieldDescriptor(
+      name='max_file_size', full_name='ClientArtifactCollectorArgs.max_file_size', index=5,
+      number=8, type=4, cpp_type=4, label=1,
+      has_default_value=True, default_value=500000000,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001T\n\010ByteSize\022FThe maximum size of files we will download in bytes, 500MB by default.\030\001'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2461,
+  serialized_end=3349,
+)
+
+
+_EXPANDEDARTIFACT = _descriptor.Descriptor(
+  name='ExpandedArtifact',
+  full_name='ExpandedArtifact',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ExpandedArtifact.name', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\014ArtifactName\022\031The name of the artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='sources', full_name='ExpandedArtifact.sources', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$The sources and what they depend on.'))),
+    _descriptor.FieldDescriptor(
+      name='provides', full_name='ExpandedArtifact.provides', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226A list of knowledgebase values this artifact provides.'))),
+    _descriptor.FieldDescriptor(
+      name='requested_by_user', full_name='ExpandedArtifact.requested_by_user', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=True,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022hWhether the artifact is requested by the user or scheduled for collection as a KnowledgeBase dependency.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3352,
+  serialized_end=3743,
+)
+
+
+_EXPANDEDSOURCE = _descriptor.Descriptor(
+  name='ExpandedSource',
+  full_name='ExpandedSource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='base_source', full_name='ExpandedSource.base_source', index=0,
+      number=1, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The base source.'))),
+    _descriptor.FieldDescriptor(
+      name='path_type', full_name='ExpandedSource.path_type', index=1,
+      number=6, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=-1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\013\022\tPath Type'))),
+    _descriptor.FieldDescriptor(
+      name='max_bytesize', full_name='ExpandedSource.max_bytesize', index=2,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\n\010ByteSize\022TFile Finder Download Action Option: The maximum byte size of files we will download.'))),
+    _descriptor.FieldDescriptor(
+      name='max_number_files', full_name='ExpandedSource.max_number_files', index=3,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@File Finder Action Option: The maximum number of results to get.'))),
+    _descriptor.FieldDescriptor(
+      name='artifact_sources', full_name='ExpandedSource.artifact_sources', index=4,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.Extended sources for ArtifactFiles collection.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3746,
+  serialized_end=4209,
+)
+
+
+_CLIENTARTIFACTCOLLECTORRESULT = _descriptor.Descriptor(
+  name='ClientArtifactCollectorResult',
+  full_name='ClientArtifactCollectorResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='collected_artifacts', full_name='ClientArtifactCollectorResult.collected_artifacts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.The results of the single collected artifacts.'))),
+    _descriptor.FieldDescriptor(
+      name='knowledge_base', full_name='ClientArtifactCollectorResult.knowledge_base', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001=\022;The knowledge base containing information about the client.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4212,
+  serialized_end=4457,
+)
+
+
+_COLLECTEDARTIFACT = _descriptor.Descriptor(
+  name='CollectedArtifact',
+  full_name='CollectedArtifact',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='CollectedArtifact.name', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\014ArtifactName\022\031The name of the artifact.'))),
+    _descriptor.FieldDescriptor(
+      name='action_results', full_name='CollectedArtifact.action_results', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.The results from the performed client actions.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4460,
+  serialized_end=4643,
+)
+
+
+_CLIENTACTIONRESULT = _descriptor.Descriptor(
+  name='ClientActionResult',
+  full_name='ClientActionResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ClientActionResult.type', index=0,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%The type of the client action result.'))),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ClientActionResult.value', index=1,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022\032The value of the response.*\rGetValueClass'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4646,
+  serialized_end=4815,
+)
+
+_ARTIFACTSOURCE.fields_by_name['type'].enum_type = _ARTIFACTSOURCE_SOURCETYPE
+_ARTIFACTSOURCE.fields_by_name['attributes'].message_type = grr__response__proto_dot_jobs__pb2._DICT
+_ARTIFACTSOURCE_SOURCETYPE.containing_type = _ARTIFACTSOURCE
+_ARTIFACT.fields_by_name['sources'].message_type = _ARTIFACTSOURCE
+_ARTIFACTDESCRIPTOR.fields_by_name['artifact'].message_type = _ARTIFACT
+_ARTIFACTDESCRIPTOR.fields_by_name['processors'].message_type = _ARTIFACTPROCESSORDESCRIPTOR
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['artifacts'].message_type = _EXPANDEDARTIFACT
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['knowledge_base'].message_type = grr__response__proto_dot_knowledge__base__pb2._KNOWLEDGEBASE
+_EXPANDEDARTIFACT.fields_by_name['sources'].message_type = _EXPANDEDSOURCE
+_EXPANDEDSOURCE.fields_by_name['base_source'].message_type = _ARTIFACTSOURCE
+_EXPANDEDSOURCE.fields_by_name['path_type'].enum_type = grr__response__proto_dot_jobs__pb2._PATHSPEC_PATHTYPE
+_EXPANDEDSOURCE.fields_by_name['artifact_sources'].message_type = _EXPANDEDSOURCE
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['collected_artifacts'].message_type = _COLLECTEDARTIFACT
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['knowledge_base'].message_type = grr__response__proto_dot_knowledge__base__pb2._KNOWLEDGEBASE
+_COLLECTEDARTIFACT.fields_by_name['action_results'].message_type = _CLIENTACTIONRESULT
+_CLIENTACTIONRESULT.fields_by_name['value'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+DESCRIPTOR.message_types_by_name['ArtifactSource'] = _ARTIFACTSOURCE
+DESCRIPTOR.message_types_by_name['Artifact'] = _ARTIFACT
+DESCRIPTOR.message_types_by_name['ArtifactProcessorDescriptor'] = _ARTIFACTPROCESSORDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ArtifactDescriptor'] = _ARTIFACTDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ClientArtifactCollectorArgs'] = _CLIENTARTIFACTCOLLECTORARGS
+DESCRIPTOR.message_types_by_name['ExpandedArtifact'] = _EXPANDEDARTIFACT
+DESCRIPTOR.message_types_by_name['ExpandedSource'] = _EXPANDEDSOURCE
+DESCRIPTOR.message_types_by_name['ClientArtifactCollectorResult'] = _CLIENTARTIFACTCOLLECTORRESULT
+DESCRIPTOR.message_types_by_name['CollectedArtifact'] = _COLLECTEDARTIFACT
+DESCRIPTOR.message_types_by_name['ClientActionResult'] = _CLIENTACTIONRESULT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ArtifactSource = _reflection.GeneratedProtocolMessageType('ArtifactSource', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTSOURCE,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ArtifactSource)
+  ))
+_sym_db.RegisterMessage(ArtifactSource)
+
+Artifact = _reflection.GeneratedProtocolMessageType('Artifact', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACT,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:Artifact)
+  ))
+_sym_db.RegisterMessage(Artifact)
+
+ArtifactProcessorDescriptor = _reflection.GeneratedProtocolMessageType('ArtifactProcessorDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTPROCESSORDESCRIPTOR,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ArtifactProcessorDescriptor)
+  ))
+_sym_db.RegisterMessage(ArtifactProcessorDescriptor)
+
+ArtifactDescriptor = _reflection.GeneratedProtocolMessageType('ArtifactDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTDESCRIPTOR,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ArtifactDescriptor)
+  ))
+_sym_db.RegisterMessage(ArtifactDescriptor)
+
+ClientArtifactCollectorArgs = _reflection.GeneratedProtocolMessageType('ClientArtifactCollectorArgs', (_message.Message,), dict(
+  DESCRIPTOR = _CLIENTARTIFACTCOLLECTORARGS,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ClientArtifactCollectorArgs)
+  ))
+_sym_db.RegisterMessage(ClientArtifactCollectorArgs)
+
+ExpandedArtifact = _reflection.GeneratedProtocolMessageType('ExpandedArtifact', (_message.Message,), dict(
+  DESCRIPTOR = _EXPANDEDARTIFACT,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ExpandedArtifact)
+  ))
+_sym_db.RegisterMessage(ExpandedArtifact)
+
+ExpandedSource = _reflection.GeneratedProtocolMessageType('ExpandedSource', (_message.Message,), dict(
+  DESCRIPTOR = _EXPANDEDSOURCE,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ExpandedSource)
+  ))
+_sym_db.RegisterMessage(ExpandedSource)
+
+ClientArtifactCollectorResult = _reflection.GeneratedProtocolMessageType('ClientArtifactCollectorResult', (_message.Message,), dict(
+  DESCRIPTOR = _CLIENTARTIFACTCOLLECTORRESULT,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ClientArtifactCollectorResult)
+  ))
+_sym_db.RegisterMessage(ClientArtifactCollectorResult)
+
+CollectedArtifact = _reflection.GeneratedProtocolMessageType('CollectedArtifact', (_message.Message,), dict(
+  DESCRIPTOR = _COLLECTEDARTIFACT,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:CollectedArtifact)
+  ))
+_sym_db.RegisterMessage(CollectedArtifact)
+
+ClientActionResult = _reflection.GeneratedProtocolMessageType('ClientActionResult', (_message.Message,), dict(
+  DESCRIPTOR = _CLIENTACTIONRESULT,
+  __module__ = 'grr_response_proto.artifact_pb2'
+  # @@protoc_insertion_point(class_scope:ClientActionResult)
+  ))
+_sym_db.RegisterMessage(ClientActionResult)
+
+
+_ARTIFACTSOURCE.fields_by_name['type'].has_options = True
+_ARTIFACTSOURCE.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\022\023The type of source.'))
+_ARTIFACTSOURCE.fields_by_name['attributes'].has_options = True
+_ARTIFACTSOURCE.fields_by_name['attributes']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229The attributes that describe the source. e.g. file paths.'))
+_ARTIFACTSOURCE.fields_by_name['conditions'].has_options = True
+_ARTIFACTSOURCE.fields_by_name['conditions']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001P\022NObject filter conditions that decide if this source applies to a given system.'))
+_ARTIFACTSOURCE.fields_by_name['returned_types'].has_options = True
+_ARTIFACTSOURCE.fields_by_name['returned_types']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qA list of types that may be returned by this source. Anything returned that is not in this list will be filtered.'))
+_ARTIFACTSOURCE.fields_by_name['supported_os'].has_options = True
+_ARTIFACTSOURCE.fields_by_name['supported_os']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001E\022CA list of operating systems to which this source should be applied.'))
+_ARTIFACT.fields_by_name['name'].has_options = True
+_ARTIFACT.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\n\014ArtifactName\022%Globally unique name of the artifact.'))
+_ARTIFACT.fields_by_name['conditions'].has_options = True
+_ARTIFACT.fields_by_name['conditions']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\022<A list of conditions that decide if the artifact should run.'))
+_ARTIFACT.fields_by_name['doc'].has_options = True
+_ARTIFACT.fields_by_name['doc']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\036\022\034Doc string for the artifact.'))
+_ARTIFACT.fields_by_name['labels'].has_options = True
+_ARTIFACT.fields_by_name['labels']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022)A list of labels the artifact belongs to.'))
+_ARTIFACT.fields_by_name['supported_os'].has_options = True
+_ARTIFACT.fields_by_name['supported_os']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\0222A list of operating systems the artifact supports.'))
+_ARTIFACT.fields_by_name['urls'].has_options = True
+_ARTIFACT.fields_by_name['urls']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\022/A list of urls that help document the artifact.'))
+_ARTIFACT.fields_by_name['provides'].has_options = True
+_ARTIFACT.fields_by_name['provides']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226A list of knowledgebase values this artifact provides.'))
+_ARTIFACT.fields_by_name['sources'].has_options = True
+_ARTIFACT.fields_by_name['sources']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033A list of artifact sources.'))
+_ARTIFACT.fields_by_name['error_message'].has_options = True
+_ARTIFACT.fields_by_name['error_message']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The error message for artifacts that failed validation.'))
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['name'].has_options = True
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001(\022&Processor\'s name as registered in GRR.'))
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['description'].has_options = True
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['description']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036Description of this processor.'))
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['output_types'].has_options = True
+_ARTIFACTPROCESSORDESCRIPTOR.fields_by_name['output_types']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229The semantic types that can be produced by the processor.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['artifact'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['artifact']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Artifact itself.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['dependencies'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['dependencies']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,Names of artifacts this artifact depends on.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['path_dependencies'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['path_dependencies']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Names of KB objects this artifact depends on.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['processors'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['processors']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224Processors that will process this artifact\'s output.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['is_custom'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['is_custom']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001;\0229If True, this artifact was manually uploaded by the user.'))
+_ARTIFACTDESCRIPTOR.fields_by_name['error_message'].has_options = True
+_ARTIFACTDESCRIPTOR.fields_by_name['error_message']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The error message for artifacts that failed validation.'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['artifacts'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['artifacts']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\026\022\024A list of artifacts.'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['knowledge_base'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['knowledge_base']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001=\022;The knowledge base containing information about the client.'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['use_tsk'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['use_tsk']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Whether raw filesystem access should be used.'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['apply_parsers'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['apply_parsers']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\201\001\022}If True, apply any relevant parser to the collected data. If False, return the raw collected data e.g Files or Registry Keys.\030\001'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['ignore_interpolation_errors'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['ignore_interpolation_errors']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\375\001\022\372\001If true, don\'t die if %%users.homedir%% and similar fail to expand. It\'s common on windows for some user attributes to be missing if users have never logged in. Enable this when you have multiple artifacts or paths and want to report partial results.'))
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['max_file_size'].has_options = True
+_CLIENTARTIFACTCOLLECTORARGS.fields_by_name['max_file_size']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001T\n\010ByteSize\022FThe maximum size of files we will download in bytes, 500MB by default.\030\001'))
+_EXPANDEDARTIFACT.fields_by_name['name'].has_options = True
+_EXPANDEDARTIFACT.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\014ArtifactName\022\031The name of the artifact.'))
+_EXPANDEDARTIFACT.fields_by_name['sources'].has_options = True
+_EXPANDEDARTIFACT.fields_by_name['sources']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$The sources and what they depend on.'))
+_EXPANDEDARTIFACT.fields_by_name['provides'].has_options = True
+_EXPANDEDARTIFACT.fields_by_name['provides']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0018\0226A list of knowledgebase values this artifact provides.'))
+_EXPANDEDARTIFACT.fields_by_name['requested_by_user'].has_options = True
+_EXPANDEDARTIFACT.fields_by_name['requested_by_user']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022hWhether the artifact is requested by the user or scheduled for collection as a KnowledgeBase dependency.'))
+_EXPANDEDSOURCE.fields_by_name['base_source'].has_options = True
+_EXPANDEDSOURCE.fields_by_name['base_source']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020The base source.'))
+_EXPANDEDSOURCE.fields_by_name['path_type'].has_options = True
+_EXPANDEDSOURCE.fields_by_name['path_type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\013\022\tPath Type'))
+_EXPANDEDSOURCE.fields_by_name['max_bytesize'].has_options = True
+_EXPANDEDSOURCE.fields_by_name['max_bytesize']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\n\010ByteSize\022TFile Finder Download Action Option: The maximum byte size of files we will download.'))
+_EXPANDEDSOURCE.fields_by_name['max_number_files'].has_options = True
+_EXPANDEDSOURCE.fields_by_name['max_number_files']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001B\022@File Finder Action Option: The maximum number of results to get.'))
+_EXPANDEDSOURCE.fields_by_name['artifact_sources'].has_options = True
+_EXPANDEDSOURCE.fields_by_name['artifact_sources']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.Extended sources for ArtifactFiles collection.'))
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['collected_artifacts'].has_options = True
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['collected_artifacts']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.The results of the single collected artifacts.'))
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['knowledge_base'].has_options = True
+_CLIENTARTIFACTCOLLECTORRESULT.fields_by_name['knowledge_base']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001=\022;The knowledge base containing information about the client.'))
+_COLLECTEDARTIFACT.fields_by_name['name'].has_options = True
+_COLLECTEDARTIFACT.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\014ArtifactName\022\031The name of the artifact.'))
+_COLLECTEDARTIFACT.fields_by_name['action_results'].has_options = True
+_COLLECTEDARTIFACT.fields_by_name['action_results']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.The results from the performed client actions.'))
+_CLIENTACTIONRESULT.fields_by_name['type'].has_options = True
+_CLIENTACTIONRESULT.fields_by_name['type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%The type of the client action result.'))
+_CLIENTACTIONRESULT.fields_by_name['value'].has_options = True
+_CLIENTACTIONRESULT.fields_by_name['value']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001+\022\032The value of the response.*\rGetValueClass'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,264 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/deprecated.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/deprecated.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n#grr_response_proto/deprecated.proto\x1a!grr_response_proto/semantic.proto\"\x85\x01\n\x1f\x43ollectArtifactDependenciesArgs\x12\x62\n\rartifact_list\x18\x01 \x03(\tBK\xe2\xfc\xe3\xc4\x01\x45\n\x0c\x41rtifactName\x12\x35\x41 list of Artifact names to collect dependencies for.\"s\n!ApiNotificationDiscoveryReference\x12N\n\tclient_id\x18\x01 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\n\x0b\x41piClientId\x12&The client this notification is about.\"e\n$ApiNotificationFileDownloadReference\x12=\n\x04path\x18\x01 \x01(\tB/\xe2\xfc\xe3\xc4\x01)\n\x06RDFURN\x12\x1fThe download path for the file.\"\xb2\x01\n\x17\x41piListCronJobFlowsArgs\x12\x37\n\x0b\x63ron_job_id\x18\x01 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\n\x0c\x41piCronJobId\x12\x0c\x43ron job id.\x12(\n\x06offset\x18\x02 \x01(\x03\x42\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Starting offset.\x12\x34\n\x05\x63ount\x18\x03 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dMax number of flows to fetch.\"~\n\x15\x41piGetCronJobFlowArgs\x12\x37\n\x0b\x63ron_job_id\x18\x01 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\n\x0c\x41piCronJobId\x12\x0c\x43ron job id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.')
+  ,
+  dependencies=[grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_COLLECTARTIFACTDEPENDENCIESARGS = _descriptor.Descriptor(
+  name='CollectArtifactDependenciesArgs',
+  full_name='CollectArtifactDependenciesArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact_list', full_name='CollectArtifactDependenciesArgs.artifact_list', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001E\n\014ArtifactName\0225A list of Artifact names to collect dependencies for.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=75,
+  serialized_end=208,
+)
+
+
+_APINOTIFICATIONDISCOVERYREFERENCE = _descriptor.Descriptor(
+  name='ApiNotificationDiscoveryReference',
+  full_name='ApiNotificationDiscoveryReference',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiNotificationDiscoveryReference.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\n\013ApiClientId\022&The client this notification is about.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=210,
+  serialized_end=325,
+)
+
+
+_APINOTIFICATIONFILEDOWNLOADREFERENCE = _descriptor.Descriptor(
+  name='ApiNotificationFileDownloadReference',
+  full_name='ApiNotificationFileDownloadReference',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiNotificationFileDownloadReference.path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\006RDFURN\022\037The download path for the file.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=327,
+  serialized_end=428,
+)
+
+
+_APILISTCRONJOBFLOWSARGS = _descriptor.Descriptor(
+  name='ApiListCronJobFlowsArgs',
+  full_name='ApiListCronJobFlowsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='cron_job_id', full_name='ApiListCronJobFlowsArgs.cron_job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\n\014ApiCronJobId\022\014Cron job id.'))),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListCronJobFlowsArgs.offset', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListCronJobFlowsArgs.count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of flows to fetch.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=431,
+  serialized_end=609,
+)
+
+
+_APIGETCRONJOBFLOWARGS = _descriptor.Descriptor(
+  name='ApiGetCronJobFlowArgs',
+  full_name='ApiGetCronJobFlowArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='cron_job_id', full_name='ApiGetCronJobFlowArgs.cron_job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\n\014ApiCronJobId\022\014Cron job id.'))),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiGetCronJobFlowArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=611,
+  serialized_end=737,
+)
+
+DESCRIPTOR.message_types_by_name['CollectArtifactDependenciesArgs'] = _COLLECTARTIFACTDEPENDENCIESARGS
+DESCRIPTOR.message_types_by_name['ApiNotificationDiscoveryReference'] = _APINOTIFICATIONDISCOVERYREFERENCE
+DESCRIPTOR.message_types_by_name['ApiNotificationFileDownloadReference'] = _APINOTIFICATIONFILEDOWNLOADREFERENCE
+DESCRIPTOR.message_types_by_name['ApiListCronJobFlowsArgs'] = _APILISTCRONJOBFLOWSARGS
+DESCRIPTOR.message_types_by_name['ApiGetCronJobFlowArgs'] = _APIGETCRONJOBFLOWARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+CollectArtifactDependenciesArgs = _reflection.GeneratedProtocolMessageType('CollectArtifactDependenciesArgs', (_message.Message,), dict(
+  DESCRIPTOR = _COLLECTARTIFACTDEPENDENCIESARGS,
+  __module__ = 'grr_response_proto.deprecated_pb2'
+  # @@protoc_insertion_point(class_scope:CollectArtifactDependenciesArgs)
+  ))
+_sym_db.RegisterMessage(CollectArtifactDependenciesArgs)
+
+ApiNotificationDiscoveryReference = _reflection.GeneratedProtocolMessageType('ApiNotificationDiscoveryReference', (_message.Message,), dict(
+  DESCRIPTOR = _APINOTIFICATIONDISCOVERYREFERENCE,
+  __module__ = 'grr_response_proto.deprecated_pb2'
+  # @@protoc_insertion_point(class_scope:ApiNotificationDiscoveryReference)
+  ))
+_sym_db.RegisterMessage(ApiNotificationDiscoveryReference)
+
+ApiNotificationFileDownloadReference = _reflection.GeneratedProtocolMessageType('ApiNotificationFileDownloadReference', (_message.Message,), dict(
+  DESCRIPTOR = _APINOTIFICATIONFILEDOWNLOADREFERENCE,
+  __module__ = 'grr_response_proto.deprecated_pb2'
+  # @@protoc_insertion_point(class_scope:ApiNotificationFileDownloadReference)
+  ))
+_sym_db.RegisterMessage(ApiNotificationFileDownloadReference)
+
+ApiListCronJobFlowsArgs = _reflection.GeneratedProtocolMessageType('ApiListCronJobFlowsArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APILISTCRONJOBFLOWSARGS,
+  __module__ = 'grr_response_proto.deprecated_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListCronJobFlowsArgs)
+  ))
+_sym_db.RegisterMessage(ApiListCronJobFlowsArgs)
+
+ApiGetCronJobFlowArgs = _reflection.GeneratedProtocolMessageType('ApiGetCronJobFlowArgs', (_message.Message,), dict(
+  DESCRIPTOR = _APIGETCRONJOBFLOWARGS,
+  __module__ = 'grr_response_proto.deprecated_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetCronJobFlowArgs)
+  ))
+_sym_db.RegisterMessage(ApiGetCronJobFlowArgs)
+
+
+_COLLECTARTIFACTDEPENDENCIESARGS.fields_by_name['artifact_list'].has_options = True
+_COLLECTARTIFACTDEPENDENCIESARGS.fields_by_name['artifact_list']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001E\n\014ArtifactName\0225A list of Artifact names to collect dependencies for.'))
+_APINOTIFICATIONDISCOVERYREFERENCE.fields_by_name['client_id'].has_options = True
+_APINOTIFICATIONDISCOVERYREFERENCE.fields_by_name['client_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\n\013ApiClientId\022&The client this notification is about.'))
+_APINOTIFICATIONFILEDOWNLOADREFERENCE.fields_by_name['path'].has_options = True
+_APINOTIFICATIONFILEDOWNLOADREFERENCE.fields_by_name['path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001)\n\006RDFURN\022\037The download path for the file.'))
+_APILISTCRONJOBFLOWSARGS.fields_by_name['cron_job_id'].has_options = True
+_APILISTCRONJOBFLOWSARGS.fields_by_name['cron_job_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\n\014ApiCronJobId\022\014Cron job id.'))
+_APILISTCRONJOBFLOWSARGS.fields_by_name['offset'].has_options = True
+_APILISTCRONJOBFLOWSARGS.fields_by_name['offset']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Starting offset.'))
+_APILISTCRONJOBFLOWSARGS.fields_by_name['count'].has_options = True
+_APILISTCRONJOBFLOWSARGS.fields_by_name['count']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\037\022\035Max number of flows to fetch.'))
+_APIGETCRONJOBFLOWARGS.fields_by_name['cron_job_id'].has_options = True
+_APIGETCRONJOBFLOWARGS.fields_by_name['cron_job_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\034\n\014ApiCronJobId\022\014Cron job id.'))
+_APIGETCRONJOBFLOWARGS.fields_by_name['flow_id'].has_options = True
+_APIGETCRONJOBFLOWARGS.fields_by_name['flow_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,82 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/file_store.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/file_store.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n#grr_response_proto/file_store.proto\x1a!grr_response_proto/semantic.proto\"\x9e\x01\n\x11\x46ileStoreAddEvent\x12;\n\x07hash_id\x18\x01 \x01(\x0c\x42*\xe2\xfc\xe3\xc4\x01$\n\x0cSHA256HashID\x12\x14Hash ID of the file.\x12L\n\x08\x62lob_ids\x18\x02 \x03(\x0c\x42:\xe2\xfc\xe3\xc4\x01\x34\n\x06\x42lobID\x12*IDs of blobs corresponding to the hash id.')
+  ,
+  dependencies=[grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_FILESTOREADDEVENT = _descriptor.Descriptor(
+  name='FileStoreAddEvent',
+  full_name='FileStoreAddEvent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='hash_id', full_name='FileStoreAddEvent.hash_id', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\n\014SHA256HashID\022\024Hash ID of the file.'))),
+    _descriptor.FieldDescriptor(
+      name='blob_ids', full_name='FileStoreAddEvent.blob_ids', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\n\006BlobID\022*IDs of blobs corresponding to the hash id.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=75,
+  serialized_end=233,
+)
+
+DESCRIPTOR.message_types_by_name['FileStoreAddEvent'] = _FILESTOREADDEVENT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+FileStoreAddEvent = _reflection.GeneratedProtocolMessageType('FileStoreAddEvent', (_message.Message,), dict(
+  DESCRIPTOR = _FILESTOREADDEVENT,
+  __module__ = 'grr_response_proto.file_store_pb2'
+  # @@protoc_insertion_point(class_scope:FileStoreAddEvent)
+  ))
+_sym_db.RegisterMessage(FileStoreAddEvent)
+
+
+_FILESTOREADDEVENT.fields_by_name['hash_id'].has_options = True
+_FILESTOREADDEVENT.fields_by_name['hash_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\n\014SHA256HashID\022\024Hash ID of the file.'))
+_FILESTOREADDEVENT.fields_by_name['blob_ids'].has_options = True
+_FILESTOREADDEVENT.fields_by_name['blob_ids']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0014\n\006BlobID\022*IDs of blobs corresponding to the hash id.'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,712 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/knowledge_base.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/knowledge_base.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n\'grr_response_proto/knowledge_base.proto\x1a!grr_response_proto/semantic.proto\"\xda\x03\n\x07PwEntry\x12T\n\x05store\x18\x01 \x01(\x0e\x32\x10.PwEntry.PwStore:\x07UNKNOWNB*\xe2\xfc\xe3\xc4\x01$\x12\"Where the user password is stored.\x12G\n\thash_type\x18\x02 \x01(\x0e\x32\x0f.PwEntry.PwHashB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bHow the password is hashed.\x12.\n\x03\x61ge\x18\x03 \x01(\rB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19The password age in days.\x12:\n\x07max_age\x18\x04 \x01(\rB)\xe2\xfc\xe3\xc4\x01#\x12!The maximum password age in days.\"F\n\x07PwStore\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06PASSWD\x10\x01\x12\n\n\x06SHADOW\x10\x02\x12\t\n\x05GROUP\x10\x03\x12\x0b\n\x07GSHADOW\x10\x04\"|\n\x06PwHash\x12\x07\n\x03\x44\x45S\x10\x00\x12\x07\n\x03MD5\x10\x01\x12\x0c\n\x08\x42LOWFISH\x10\x02\x12\n\n\x06NTHASH\x10\x03\x12\n\n\x06UNUSED\x10\x04\x12\n\n\x06SHA256\x10\x05\x12\n\n\x06SHA512\x10\x06\x12\t\n\x05UNSET\x10\r\x12\x0c\n\x08\x44ISABLED\x10\x0e\x12\t\n\x05\x45MPTY\x10\x0f\"\x90\x02\n\x05Group\x12-\n\x04name\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\x12\x17The name of the group. \x12\x41\n\x07members\x18\x02 \x03(\tB0\xe2\xfc\xe3\xc4\x01*\x12(The members of the group, as usernames. \x12:\n\x03gid\x18\x03 \x01(\rB-\xe2\xfc\xe3\xc4\x01\'\x12%The gid of the the group, e.g.: 1001.\x12Y\n\x08pw_entry\x18\x04 \x01(\x0b\x32\x08.PwEntryB=\xe2\xfc\xe3\xc4\x01\x37\x12\x35The password state of the group, e.g.: shadow+sha512.\"\xc3\x10\n\x04User\x12/\n\x08username\x18\x01 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15The name of the user.\x12\x37\n\x04temp\x18\x02 \x01(\tB)\xe2\xfc\xe3\xc4\x01#\x12!Temporary directory for the user.\x12\x66\n\x07\x64\x65sktop\x18\x04 \x01(\tBU\xe2\xfc\xe3\xc4\x01O\x12MThe desktop directory of the user. E.g. c:\\Documents and Settings\\foo\\Desktop\x12K\n\nlast_logon\x18\x05 \x01(\x04\x42\x37\xe2\xfc\xe3\xc4\x01\x31\n\x0bRDFDatetime\x12\"The last logon time for this user.\x12\x31\n\tfull_name\x18\x06 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16\x46ull name of the user.\x12H\n\nuserdomain\x18\n \x01(\tB4\xe2\xfc\xe3\xc4\x01.\x12,The domain name of the user. E.g. MICROSOFT.\x12\x85\x01\n\x03sid\x18\x0c \x01(\tBx\xe2\xfc\xe3\xc4\x01r\x12pThe SID of the user as reported by the system. E.g. S-1-5-80-859482183-879914841-863379149-1145462774-2388618682\x12\x62\n\x0buserprofile\x18\r \x01(\tBM\xe2\xfc\xe3\xc4\x01G\x12\x45The profile directory of the user. E.g.c:\\Documents and Settings\\foo.\x12\x8a\x01\n\x07\x61ppdata\x18\x0e \x01(\tBy\xe2\xfc\xe3\xc4\x01s\x12qThe %APPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Roaming\x12\x92\x01\n\x0clocalappdata\x18\x0f \x01(\tB|\xe2\xfc\xe3\xc4\x01v\x12tThe %LOCALAPPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\x12\x8b\x01\n\x0einternet_cache\x18\x10 \x01(\tBs\xe2\xfc\xe3\xc4\x01m\x12kThe cache directory of the user. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\\Temporary Internet Files.\x12\x66\n\x07\x63ookies\x18\x11 \x01(\tBU\xe2\xfc\xe3\xc4\x01O\x12MThe cookies directory of the user. E.g. c:\\Documents and Settings\\foo\\Cookies\x12\x64\n\x06recent\x18\x12 \x01(\tBT\xe2\xfc\xe3\xc4\x01N\x12LThe recent directory of the user. E.g. c:\\Documents and Settings\\foo\\Recent.\x12k\n\x08personal\x18\x13 \x01(\tBY\xe2\xfc\xe3\xc4\x01S\x12QThe Personal directory of the user. E.g. c:\\Documents and Settings\\foo\\Documents.\x12g\n\x07startup\x18\x15 \x01(\tBV\xe2\xfc\xe3\xc4\x01P\x12NThe Startup directory of the user. E.g. c:\\Documents and Settings\\foo\\Startup.\x12\xae\x01\n\x10localappdata_low\x18\x16 \x01(\tB\x93\x01\xe2\xfc\xe3\xc4\x01\x8c\x01\x12\x89\x01The LocalLow application data directory for data that doesn\'t roam with the user.  E.g. %USERPROFILE%\\AppData\\LocalLow.  Vista and above.\x12Z\n\x07homedir\x18\x1e \x01(\tBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41The homedir of the user as reported by the system. E.g. /home/foo\x12\x38\n\x03uid\x18\x1f \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The uid of the of the user. E.g. 0.\x12\x38\n\x03gid\x18  \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The gid of the the user. E.g. 5001.\x12?\n\x05shell\x18! \x01(\tB0\xe2\xfc\xe3\xc4\x01*\x12(The shell of the the user. E.g. /bin/sh.\x12X\n\x08pw_entry\x18\" \x01(\x0b\x32\x08.PwEntryB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34The password state of the user, e.g.: shadow+sha512.\x12\x43\n\x04gids\x18# \x03(\rB5\xe2\xfc\xe3\xc4\x01/\x12-Additional group ids the user is a member of.\"\xd6\x10\n\rKnowledgeBase\x12\x14\n\x05users\x18  \x03(\x0b\x32\x05.User\x12_\n\x04\x66qdn\x18\x02 \x01(\tBQ\xe2\xfc\xe3\xc4\x01K\x12IThe fully qualified domain name reported by the OS. E.g. host1.ad.foo.com\x12y\n\ttime_zone\x18\x03 \x01(\tBf\xe2\xfc\xe3\xc4\x01`\x12^The timezone in Olson format E.g. Pacific/Galapagos. http://en.wikipedia.org/wiki/Tz_database.\x12w\n\x02os\x18\x04 \x01(\tBk\xe2\xfc\xe3\xc4\x01\x65\x12\x63The operating system. Case is important, must be one of Windows Linux Darwin FreeBSD OpenBSD NetBSD\x12\x45\n\x10os_major_version\x18\x05 \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The major version of the OS, e.g. 7\x12\x45\n\x10os_minor_version\x18\x06 \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The minor version of the OS, e.g. 7\x12\x42\n\x0c\x65nviron_path\x18\x07 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$The system configured path variable.\x12=\n\x0c\x65nviron_temp\x18\x08 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fThe system temporary directory.\x12\x34\n\nos_release\x18\t \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Linux distribution name.\x12\\\n\x12\x65nviron_systemroot\x18\x14 \x01(\tB@\xe2\xfc\xe3\xc4\x01:\x12\x38The value of the %SystemRoot% parameter, E.g. c:\\Windows\x12g\n\x0e\x65nviron_windir\x18\x15 \x01(\tBO\xe2\xfc\xe3\xc4\x01I\x12GThe value of the %WINDIR% parameter. As returned by the system, e.g. C:\x12\x80\x01\n\x14\x65nviron_programfiles\x18\x16 \x01(\tBb\xe2\xfc\xe3\xc4\x01\\\x12ZThe value of the %PROGRAMFILES% parameter as returned by the system, e.g. C:\\Program Files\x12\x8e\x01\n\x17\x65nviron_programfilesx86\x18\x17 \x01(\tBm\xe2\xfc\xe3\xc4\x01g\x12\x65The value of the %PROGRAMFILES(X86)% parameter as returned by the system, e.g. C:\\Program Files (x86)\x12q\n\x13\x65nviron_systemdrive\x18\x18 \x01(\tBT\xe2\xfc\xe3\xc4\x01N\x12LThe value of the %SystemDrive% parameter. As returned by the system, e.g. C:\x12\x7f\n\x19\x65nviron_profilesdirectory\x18! \x01(\tB\\\xe2\xfc\xe3\xc4\x01V\x12TFolder that typically contains users\' profile directories; e.g \'%SystemDrive%\\Users\'\x12\x9a\x01\n\x17\x65nviron_allusersprofile\x18\x1a \x01(\tBy\xe2\xfc\xe3\xc4\x01s\x12qThe value of the %AllUsersProfile% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\x12\xaf\x01\n\x17\x65nviron_allusersappdata\x18\x1b \x01(\tB\x8d\x01\xe2\xfc\xe3\xc4\x01\x86\x01\x12\x83\x01The value of the %AllUsersAppData% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\\Application Data.\x12\x83\x01\n\x13\x63urrent_control_set\x18\x1c \x01(\tBf\xe2\xfc\xe3\xc4\x01`\x12^The current value of the system CurrentControlSet e.g. HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet001\x12\x83\x01\n\tcode_page\x18\x1e \x01(\tBp\xe2\xfc\xe3\xc4\x01j\x12hThe current code page of the system. Comes from HKLM\\CurrentControlSet\\Control\\Nls\\CodePage e.g. cp1252.\x12O\n\x06\x64omain\x18\x1f \x01(\tB?\xe2\xfc\xe3\xc4\x01\x39\x12\x37The domain the machine is connected to. E.g. MICROSOFT.\x12\x18\n\x10\x44\x45PRECATED_users\x18\x01 \x03(\x0c')
+  ,
+  dependencies=[grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_PWENTRY_PWSTORE = _descriptor.EnumDescriptor(
+  name='PwStore',
+  full_name='PwEntry.PwStore',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PASSWD', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHADOW', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GROUP', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GSHADOW', index=4, number=4,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=357,
+  serialized_end=427,
+)
+_sym_db.RegisterEnumDescriptor(_PWENTRY_PWSTORE)
+
+_PWENTRY_PWHASH = _descriptor.EnumDescriptor(
+  name='PwHash',
+  full_name='PwEntry.PwHash',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='DES', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MD5', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BLOWFISH', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NTHASH', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNUSED', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHA256', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHA512', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNSET', index=7, number=13,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DISABLED', index=8, number=14,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EMPTY', index=9, number=15,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=429,
+  serialized_end=553,
+)
+_sym_db.RegisterEnumDescriptor(_PWENTRY_PWHASH)
+
+
+_PWENTRY = _descriptor.Descriptor(
+  name='PwEntry',
+  full_name='PwEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='PwEntry.store', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"Where the user password is stored.'))),
+    _descriptor.FieldDescriptor(
+      name='hash_type', full_name='PwEntry.hash_type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033How the password is hashed.'))),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='PwEntry.age', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The password age in days.'))),
+    _descriptor.FieldDescriptor(
+      name='max_age', full_name='PwEntry.max_age', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\022!The maximum password age in days.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PWENTRY_PWSTORE,
+    _PWENTRY_PWHASH,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=79,
+  serialized_end=553,
+)
+
+
+_GROUP = _descriptor.Descriptor(
+  name='Group',
+  full_name='Group',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='Group.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\022\027The name of the group. '))),
+    _descriptor.FieldDescriptor(
+      name='members', full_name='Group.members', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(The members of the group, as usernames. '))),
+    _descriptor.FieldDescriptor(
+      name='gid', full_name='Group.gid', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%The gid of the the group, e.g.: 1001.'))),
+    _descriptor.FieldDescriptor(
+      name='pw_entry', full_name='Group.pw_entry', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0017\0225The password state of the group, e.g.: shadow+sha512.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=556,
+  serialized_end=828,
+)
+
+
+_USER = _descriptor.Descriptor(
+  name='User',
+  full_name='User',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='User.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025The name of the user.'))),
+    _descriptor.FieldDescriptor(
+      name='temp', full_name='User.temp', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\022!Temporary directory for the user.'))),
+    _descriptor.FieldDescriptor(
+      name='desktop', full_name='User.desktop', index=2,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001O\022MThe desktop directory of the user. E.g. c:\\Documents and Settings\\foo\\Desktop'))),
+    _descriptor.FieldDescriptor(
+      name='last_logon', full_name='User.last_logon', index=3,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\n\013RDFDatetime\022\"The last logon time for this user.'))),
+    _descriptor.FieldDescriptor(
+      name='full_name', full_name='User.full_name', index=4,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026Full name of the user.'))),
+    _descriptor.FieldDescriptor(
+      name='userdomain', full_name='User.userdomain', index=5,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,The domain name of the user. E.g. MICROSOFT.'))),
+    _descriptor.FieldDescriptor(
+      name='sid', full_name='User.sid', index=6,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001r\022pThe SID of the user as reported by the system. E.g. S-1-5-80-859482183-879914841-863379149-1145462774-2388618682'))),
+    _descriptor.FieldDescriptor(
+      name='userprofile', full_name='User.userprofile', index=7,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001G\022EThe profile directory of the user. E.g.c:\\Documents and Settings\\foo.'))),
+    _descriptor.FieldDescriptor(
+      name='appdata', full_name='User.appdata', index=8,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qThe %APPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Roaming'))),
+    _descriptor.FieldDescriptor(
+      name='localappdata', full_name='User.localappdata', index=9,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001v\022tThe %LOCALAPPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Local'))),
+    _descriptor.FieldDescriptor(
+      name='internet_cache', full_name='User.internet_cache', index=10,
+      number=16, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001m\022kThe cache directory of the user. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\\Temporary Internet Files.'))),
+    _descriptor.FieldDescriptor(
+      name='cookies', full_name='User.cookies', index=11,
+      number=17, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001O\022MThe cookies directory of the user. E.g. c:\\Documents and Settings\\foo\\Cookies'))),
+    _descriptor.FieldDescriptor(
+      name='recent', full_name='User.recent', index=12,
+      number=18, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001N\022LThe recent directory of the user. E.g. c:\\Documents and Settings\\foo\\Recent.'))),
+    _descriptor.FieldDescriptor(
+      name='personal', full_name='User.personal', index=13,
+      number=19, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001S\022QThe Personal directory of the user. E.g. c:\\Documents and Settings\\foo\\Documents.'))),
+    _descriptor.FieldDescriptor(
+      name='startup', full_name='User.startup', index=14,
+      number=21, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001P\022NThe Startup directory of the user. E.g. c:\\Documents and Settings\\foo\\Startup.'))),
+    _descriptor.FieldDescriptor(
+      name='localappdata_low', full_name='User.localappdata_low', index=15,
+      number=22, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\214\001\022\211\001The LocalLow application data directory for data that doesn\'t roam with the user.  E.g. %USERPROFILE%\\AppData\\LocalLow.  Vista and above.'))),
+    _descriptor.FieldDescriptor(
+      name='homedir', full_name='User.homedir', index=16,
+      number=30, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022AThe homedir of the user as reported by the system. E.g. /home/foo'))),
+    _descriptor.FieldDescriptor(
+      name='uid', full_name='User.uid', index=17,
+      number=31, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The uid of the of the user. E.g. 0.'))),
+    _descriptor.FieldDescriptor(
+      name='gid', full_name='User.gid', index=18,
+      number=32, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The gid of the the user. E.g. 5001.'))),
+    _descriptor.FieldDescriptor(
+      name='shell', full_name='User.shell', index=19,
+      number=33, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(The shell of the the user. E.g. /bin/sh.'))),
+    _descriptor.FieldDescriptor(
+      name='pw_entry', full_name='User.pw_entry', index=20,
+      number=34, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224The password state of the user, e.g.: shadow+sha512.'))),
+    _descriptor.FieldDescriptor(
+      name='gids', full_name='User.gids', index=21,
+      number=35, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Additional group ids the user is a member of.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=831,
+  serialized_end=2946,
+)
+
+
+_KNOWLEDGEBASE = _descriptor.Descriptor(
+  name='KnowledgeBase',
+  full_name='KnowledgeBase',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='users', full_name='KnowledgeBase.users', index=0,
+      number=32, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='fqdn', full_name='KnowledgeBase.fqdn', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001K\022IThe fully qualified domain name reported by the OS. E.g. host1.ad.foo.com'))),
+    _descriptor.FieldDescriptor(
+      name='time_zone', full_name='KnowledgeBase.time_zone', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^The timezone in Olson format E.g. Pacific/Galapagos. http://en.wikipedia.org/wiki/Tz_database.'))),
+    _descriptor.FieldDescriptor(
+      name='os', full_name='KnowledgeBase.os', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001e\022cThe operating system. Case is important, must be one of Windows Linux Darwin FreeBSD OpenBSD NetBSD'))),
+    _descriptor.FieldDescriptor(
+      name='os_major_version', full_name='KnowledgeBase.os_major_version', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The major version of the OS, e.g. 7'))),
+    _descriptor.FieldDescriptor(
+      name='os_minor_version', full_name='KnowledgeBase.os_minor_version', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The minor version of the OS, e.g. 7'))),
+    _descriptor.FieldDescriptor(
+      name='environ_path', full_name='KnowledgeBase.environ_path', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$The system configured path variable.'))),
+    _descriptor.FieldDescriptor(
+      name='environ_temp', full_name='KnowledgeBase.environ_temp', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The system temporary directory.'))),
+    _descriptor.FieldDescriptor(
+      name='os_release', full_name='KnowledgeBase.os_release', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Linux distribution name.'))),
+    _descriptor.FieldDescriptor(
+      name='environ_systemroot', full_name='KnowledgeBase.environ_systemroot', index=9,
+      number=20, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001:\0228The value of the %SystemRoot% parameter, E.g. c:\\Windows'))),
+    _descriptor.FieldDescriptor(
+      name='environ_windir', full_name='KnowledgeBase.environ_windir', index=10,
+      number=21, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001I\022GThe value of the %WINDIR% parameter. As returned by the system, e.g. C:'))),
+    _descriptor.FieldDescriptor(
+      name='environ_programfiles', full_name='KnowledgeBase.environ_programfiles', index=11,
+      number=22, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\\\022ZThe value of the %PROGRAMFILES% parameter as returned by the system, e.g. C:\\Program Files'))),
+    _descriptor.FieldDescriptor(
+      name='environ_programfilesx86', full_name='KnowledgeBase.environ_programfilesx86', index=12,
+      number=23, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001g\022eThe value of the %PROGRAMFILES(X86)% parameter as returned by the system, e.g. C:\\Program Files (x86)'))),
+    _descriptor.FieldDescriptor(
+      name='environ_systemdrive', full_name='KnowledgeBase.environ_systemdrive', index=13,
+      number=24, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001N\022LThe value of the %SystemDrive% parameter. As returned by the system, e.g. C:'))),
+    _descriptor.FieldDescriptor(
+      name='environ_profilesdirectory', full_name='KnowledgeBase.environ_profilesdirectory', index=14,
+      number=33, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001V\022TFolder that typically contains users\' profile directories; e.g \'%SystemDrive%\\Users\''))),
+    _descriptor.FieldDescriptor(
+      name='environ_allusersprofile', full_name='KnowledgeBase.environ_allusersprofile', index=15,
+      number=26, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qThe value of the %AllUsersProfile% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users'))),
+    _descriptor.FieldDescriptor(
+      name='environ_allusersappdata', full_name='KnowledgeBase.environ_allusersappdata', index=16,
+      number=27, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\206\001\022\203\001The value of the %AllUsersAppData% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\\Application Data.'))),
+    _descriptor.FieldDescriptor(
+      name='current_control_set', full_name='KnowledgeBase.current_control_set', index=17,
+      number=28, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^The current value of the system CurrentControlSet e.g. HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet001'))),
+    _descriptor.FieldDescriptor(
+      name='code_page', full_name='KnowledgeBase.code_page', index=18,
+      number=30, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022hThe current code page of the system. Comes from HKLM\\CurrentControlSet\\Control\\Nls\\CodePage e.g. cp1252.'))),
+    _descriptor.FieldDescriptor(
+      name='domain', full_name='KnowledgeBase.domain', index=19,
+      number=31, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The domain the machine is connected to. E.g. MICROSOFT.'))),
+    _descriptor.FieldDescriptor(
+      name='DEPRECATED_users', full_name='KnowledgeBase.DEPRECATED_users', index=20,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2949,
+  serialized_end=5083,
+)
+
+_PWENTRY.fields_by_name['store'].enum_type = _PWENTRY_PWSTORE
+_PWENTRY.fields_by_name['hash_type'].enum_type = _PWENTRY_PWHASH
+_PWENTRY_PWSTORE.containing_type = _PWENTRY
+_PWENTRY_PWHASH.containing_type = _PWENTRY
+_GROUP.fields_by_name['pw_entry'].message_type = _PWENTRY
+_USER.fields_by_name['pw_entry'].message_type = _PWENTRY
+_KNOWLEDGEBASE.fields_by_name['users'].message_type = _USER
+DESCRIPTOR.message_types_by_name['PwEntry'] = _PWENTRY
+DESCRIPTOR.message_types_by_name['Group'] = _GROUP
+DESCRIPTOR.message_types_by_name['User'] = _USER
+DESCRIPTOR.message_types_by_name['KnowledgeBase'] = _KNOWLEDGEBASE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PwEntry = _reflection.GeneratedProtocolMessageType('PwEntry', (_message.Message,), dict(
+  DESCRIPTOR = _PWENTRY,
+  __module__ = 'grr_response_proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:PwEntry)
+  ))
+_sym_db.RegisterMessage(PwEntry)
+
+Group = _reflection.GeneratedProtocolMessageType('Group', (_message.Message,), dict(
+  DESCRIPTOR = _GROUP,
+  __module__ = 'grr_response_proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:Group)
+  ))
+_sym_db.RegisterMessage(Group)
+
+User = _reflection.GeneratedProtocolMessageType('User', (_message.Message,), dict(
+  DESCRIPTOR = _USER,
+  __module__ = 'grr_response_proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:User)
+  ))
+_sym_db.RegisterMessage(User)
+
+KnowledgeBase = _reflection.GeneratedProtocolMessageType('KnowledgeBase', (_message.Message,), dict(
+  DESCRIPTOR = _KNOWLEDGEBASE,
+  __module__ = 'grr_response_proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:KnowledgeBase)
+  ))
+_sym_db.RegisterMessage(KnowledgeBase)
+
+
+_PWENTRY.fields_by_name['store'].has_options = True
+_PWENTRY.fields_by_name['store']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001$\022\"Where the user password is stored.'))
+_PWENTRY.fields_by_name['hash_type'].has_options = True
+_PWENTRY.fields_by_name['hash_type']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\035\022\033How the password is hashed.'))
+_PWENTRY.fields_by_name['age'].has_options = True
+_PWENTRY.fields_by_name['age']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\033\022\031The password age in days.'))
+_PWENTRY.fields_by_name['max_age'].has_options = True
+_PWENTRY.fields_by_name['max_age']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\022!The maximum password age in days.'))
+_GROUP.fields_by_name['name'].has_options = True
+_GROUP.fields_by_name['name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\031\022\027The name of the group. '))
+_GROUP.fields_by_name['members'].has_options = True
+_GROUP.fields_by_name['members']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(The members of the group, as usernames. '))
+_GROUP.fields_by_name['gid'].has_options = True
+_GROUP.fields_by_name['gid']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\'\022%The gid of the the group, e.g.: 1001.'))
+_GROUP.fields_by_name['pw_entry'].has_options = True
+_GROUP.fields_by_name['pw_entry']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0017\0225The password state of the group, e.g.: shadow+sha512.'))
+_USER.fields_by_name['username'].has_options = True
+_USER.fields_by_name['username']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\027\022\025The name of the user.'))
+_USER.fields_by_name['temp'].has_options = True
+_USER.fields_by_name['temp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001#\022!Temporary directory for the user.'))
+_USER.fields_by_name['desktop'].has_options = True
+_USER.fields_by_name['desktop']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001O\022MThe desktop directory of the user. E.g. c:\\Documents and Settings\\foo\\Desktop'))
+_USER.fields_by_name['last_logon'].has_options = True
+_USER.fields_by_name['last_logon']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0011\n\013RDFDatetime\022\"The last logon time for this user.'))
+_USER.fields_by_name['full_name'].has_options = True
+_USER.fields_by_name['full_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\030\022\026Full name of the user.'))
+_USER.fields_by_name['userdomain'].has_options = True
+_USER.fields_by_name['userdomain']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001.\022,The domain name of the user. E.g. MICROSOFT.'))
+_USER.fields_by_name['sid'].has_options = True
+_USER.fields_by_name['sid']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001r\022pThe SID of the user as reported by the system. E.g. S-1-5-80-859482183-879914841-863379149-1145462774-2388618682'))
+_USER.fields_by_name['userprofile'].has_options = True
+_USER.fields_by_name['userprofile']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001G\022EThe profile directory of the user. E.g.c:\\Documents and Settings\\foo.'))
+_USER.fields_by_name['appdata'].has_options = True
+_USER.fields_by_name['appdata']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qThe %APPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Roaming'))
+_USER.fields_by_name['localappdata'].has_options = True
+_USER.fields_by_name['localappdata']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001v\022tThe %LOCALAPPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Local'))
+_USER.fields_by_name['internet_cache'].has_options = True
+_USER.fields_by_name['internet_cache']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001m\022kThe cache directory of the user. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\\Temporary Internet Files.'))
+_USER.fields_by_name['cookies'].has_options = True
+_USER.fields_by_name['cookies']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001O\022MThe cookies directory of the user. E.g. c:\\Documents and Settings\\foo\\Cookies'))
+_USER.fields_by_name['recent'].has_options = True
+_USER.fields_by_name['recent']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001N\022LThe recent directory of the user. E.g. c:\\Documents and Settings\\foo\\Recent.'))
+_USER.fields_by_name['personal'].has_options = True
+_USER.fields_by_name['personal']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001S\022QThe Personal directory of the user. E.g. c:\\Documents and Settings\\foo\\Documents.'))
+_USER.fields_by_name['startup'].has_options = True
+_USER.fields_by_name['startup']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001P\022NThe Startup directory of the user. E.g. c:\\Documents and Settings\\foo\\Startup.'))
+_USER.fields_by_name['localappdata_low'].has_options = True
+_USER.fields_by_name['localappdata_low']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\214\001\022\211\001The LocalLow application data directory for data that doesn\'t roam with the user.  E.g. %USERPROFILE%\\AppData\\LocalLow.  Vista and above.'))
+_USER.fields_by_name['homedir'].has_options = True
+_USER.fields_by_name['homedir']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001C\022AThe homedir of the user as reported by the system. E.g. /home/foo'))
+_USER.fields_by_name['uid'].has_options = True
+_USER.fields_by_name['uid']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The uid of the of the user. E.g. 0.'))
+_USER.fields_by_name['gid'].has_options = True
+_USER.fields_by_name['gid']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The gid of the the user. E.g. 5001.'))
+_USER.fields_by_name['shell'].has_options = True
+_USER.fields_by_name['shell']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001*\022(The shell of the the user. E.g. /bin/sh.'))
+_USER.fields_by_name['pw_entry'].has_options = True
+_USER.fields_by_name['pw_entry']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0016\0224The password state of the user, e.g.: shadow+sha512.'))
+_USER.fields_by_name['gids'].has_options = True
+_USER.fields_by_name['gids']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Additional group ids the user is a member of.'))
+_KNOWLEDGEBASE.fields_by_name['fqdn'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['fqdn']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001K\022IThe fully qualified domain name reported by the OS. E.g. host1.ad.foo.com'))
+_KNOWLEDGEBASE.fields_by_name['time_zone'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['time_zone']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^The timezone in Olson format E.g. Pacific/Galapagos. http://en.wikipedia.org/wiki/Tz_database.'))
+_KNOWLEDGEBASE.fields_by_name['os'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['os']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001e\022cThe operating system. Case is important, must be one of Windows Linux Darwin FreeBSD OpenBSD NetBSD'))
+_KNOWLEDGEBASE.fields_by_name['os_major_version'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['os_major_version']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The major version of the OS, e.g. 7'))
+_KNOWLEDGEBASE.fields_by_name['os_minor_version'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['os_minor_version']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#The minor version of the OS, e.g. 7'))
+_KNOWLEDGEBASE.fields_by_name['environ_path'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_path']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$The system configured path variable.'))
+_KNOWLEDGEBASE.fields_by_name['environ_temp'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_temp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001!\022\037The system temporary directory.'))
+_KNOWLEDGEBASE.fields_by_name['os_release'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['os_release']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\032\022\030Linux distribution name.'))
+_KNOWLEDGEBASE.fields_by_name['environ_systemroot'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_systemroot']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001:\0228The value of the %SystemRoot% parameter, E.g. c:\\Windows'))
+_KNOWLEDGEBASE.fields_by_name['environ_windir'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_windir']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001I\022GThe value of the %WINDIR% parameter. As returned by the system, e.g. C:'))
+_KNOWLEDGEBASE.fields_by_name['environ_programfiles'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_programfiles']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\\\022ZThe value of the %PROGRAMFILES% parameter as returned by the system, e.g. C:\\Program Files'))
+_KNOWLEDGEBASE.fields_by_name['environ_programfilesx86'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_programfilesx86']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001g\022eThe value of the %PROGRAMFILES(X86)% parameter as returned by the system, e.g. C:\\Program Files (x86)'))
+_KNOWLEDGEBASE.fields_by_name['environ_systemdrive'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_systemdrive']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001N\022LThe value of the %SystemDrive% parameter. As returned by the system, e.g. C:'))
+_KNOWLEDGEBASE.fields_by_name['environ_profilesdirectory'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_profilesdirectory']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001V\022TFolder that typically contains users\' profile directories; e.g \'%SystemDrive%\\Users\''))
+_KNOWLEDGEBASE.fields_by_name['environ_allusersprofile'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_allusersprofile']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001s\022qThe value of the %AllUsersProfile% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users'))
+_KNOWLEDGEBASE.fields_by_name['environ_allusersappdata'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['environ_allusersappdata']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\206\001\022\203\001The value of the %AllUsersAppData% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\\Application Data.'))
+_KNOWLEDGEBASE.fields_by_name['current_control_set'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['current_control_set']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001`\022^The current value of the system CurrentControlSet e.g. HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet001'))
+_KNOWLEDGEBASE.fields_by_name['code_page'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['code_page']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022hThe current code page of the system. Comes from HKLM\\CurrentControlSet\\Control\\Nls\\CodePage e.g. cp1252.'))
+_KNOWLEDGEBASE.fields_by_name['domain'].has_options = True
+_KNOWLEDGEBASE.fields_by_name['domain']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0019\0227The domain the machine is connected to. E.g. MICROSOFT.'))
+# @@protoc_insertion_point(module_scope)
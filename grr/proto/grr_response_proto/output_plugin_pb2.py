@@ -0,0 +1,481 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr_response_proto/output_plugin.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr_response_proto import export_pb2 as grr__response__proto_dot_export__pb2
+from grr_response_proto import jobs_pb2 as grr__response__proto_dot_jobs__pb2
+from grr_response_proto import semantic_pb2 as grr__response__proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr_response_proto/output_plugin.proto',
+  package='',
+  syntax='proto2',
+  serialized_pb=_b('\n&grr_response_proto/output_plugin.proto\x1a\x1fgrr_response_proto/export.proto\x1a\x1dgrr_response_proto/jobs.proto\x1a!grr_response_proto/semantic.proto\"\xdd\x01\n\x16OutputPluginDescriptor\x12;\n\x0bplugin_name\x18\x01 \x01(\tB&\xe2\xfc\xe3\xc4\x01 \x12\x1eThe name of the output plugin.\x12\x85\x01\n\x0bplugin_args\x18\x02 \x01(\x0c\x42p\xe2\xfc\xe3\xc4\x01j\x12TThe parameters for this plugin. Must be an instance of the named plugin\'s args_type.*\x12GetPluginArgsClass\"n\n\x11OutputPluginState\x12\x32\n\x11plugin_descriptor\x18\x01 \x01(\x0b\x32\x17.OutputPluginDescriptor\x12%\n\x0cplugin_state\x18\x02 \x01(\x0b\x32\x0f.AttributedDict\"\xe9\x03\n!OutputPluginBatchProcessingStatus\x12y\n\x06status\x18\x01 \x01(\x0e\x32).OutputPluginBatchProcessingStatus.Status:\x07SUCCESSB5\xe2\xfc\xe3\xc4\x01/\x12-Was this batch successfully processed or not?\x12x\n\x11plugin_descriptor\x18\x06 \x01(\x0b\x32\x17.OutputPluginDescriptorBD\xe2\xfc\xe3\xc4\x01>\x12<Descriptor of the output plugin responsible for this result.\x12)\n\x07summary\x18\x03 \x01(\tB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Summary message.\x12\x41\n\x0b\x62\x61tch_index\x18\x04 \x01(\x04\x42,\xe2\xfc\xe3\xc4\x01&\x12$Number of the batch being processed.\x12?\n\nbatch_size\x18\x05 \x01(\x04\x42+\xe2\xfc\xe3\xc4\x01%\x12#Size of the batch beting processed.\" \n\x06Status\x12\x0b\n\x07SUCCESS\x10\x00\x12\t\n\x05\x45RROR\x10\x01\"\xa7\x03\n\x1eOutputPluginVerificationResult\x12N\n\tplugin_id\x18\x01 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\x12\x33String identifying the output plugin being checked.\x12j\n\x11plugin_descriptor\x18\x02 \x01(\x0b\x32\x17.OutputPluginDescriptorB6\xe2\xfc\xe3\xc4\x01\x30\x12.Descriptor of the plugin that\'s being checked.\x12\x36\n\x06status\x18\x03 \x01(\x0e\x32&.OutputPluginVerificationResult.Status\x12\x16\n\x0estatus_message\x18\x04 \x01(\t\x12?\n\ttimestamp\x18\x05 \x01(\x04\x42,\xe2\xfc\xe3\xc4\x01&\n\x0bRDFDatetime\x12\x17Timestamp of the check.\"8\n\x06Status\x12\x07\n\x03N_A\x10\x00\x12\x0b\n\x07SUCCESS\x10\x01\x12\x0b\n\x07WARNING\x10\x02\x12\x0b\n\x07\x46\x41ILURE\x10\x03\"W\n#OutputPluginVerificationResultsList\x12\x30\n\x07results\x18\x01 \x03(\x0b\x32\x1f.OutputPluginVerificationResult\"\x97\x01\n\x15\x45mailOutputPluginArgs\x12\x63\n\remail_address\x18\x01 \x01(\tBL\xe2\xfc\xe3\xc4\x01\x46\n\x12\x44omainEmailAddress\x12\x30The email address that messages will be sent to.\x12\x19\n\x0c\x65mails_limit\x18\x02 \x01(\x04:\x03\x31\x30\x30\"\xba\x01\n\x18\x42igQueryOutputPluginArgs\x12\x41\n\x0e\x65xport_options\x18\x02 \x01(\x0b\x32\x0e.ExportOptionsB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x0f\x45xport options.\x18\x01\x12[\n\x0e\x63onvert_values\x18\x03 \x01(\x08:\x04trueB=\xe2\xfc\xe3\xc4\x01\x37\x12\x33If true, convert values for export-friendly format.\x18\x02')
+  ,
+  dependencies=[grr__response__proto_dot_export__pb2.DESCRIPTOR,grr__response__proto_dot_jobs__pb2.DESCRIPTOR,grr__response__proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS_STATUS = _descriptor.EnumDescriptor(
+  name='Status',
+  full_name='OutputPluginBatchProcessingStatus.Status',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SUCCESS', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=935,
+  serialized_end=967,
+)
+_sym_db.RegisterEnumDescriptor(_OUTPUTPLUGINBATCHPROCESSINGSTATUS_STATUS)
+
+_OUTPUTPLUGINVERIFICATIONRESULT_STATUS = _descriptor.EnumDescriptor(
+  name='Status',
+  full_name='OutputPluginVerificationResult.Status',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='N_A', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SUCCESS', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WARNING', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FAILURE', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1337,
+  serialized_end=1393,
+)
+_sym_db.RegisterEnumDescriptor(_OUTPUTPLUGINVERIFICATIONRESULT_STATUS)
+
+
+_OUTPUTPLUGINDESCRIPTOR = _descriptor.Descriptor(
+  name='OutputPluginDescriptor',
+  full_name='OutputPluginDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='plugin_name', full_name='OutputPluginDescriptor.plugin_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036The name of the output plugin.'))),
+    _descriptor.FieldDescriptor(
+      name='plugin_args', full_name='OutputPluginDescriptor.plugin_args', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022TThe parameters for this plugin. Must be an instance of the named plugin\'s args_type.*\022GetPluginArgsClass'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=142,
+  serialized_end=363,
+)
+
+
+_OUTPUTPLUGINSTATE = _descriptor.Descriptor(
+  name='OutputPluginState',
+  full_name='OutputPluginState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='plugin_descriptor', full_name='OutputPluginState.plugin_descriptor', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='plugin_state', full_name='OutputPluginState.plugin_state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=365,
+  serialized_end=475,
+)
+
+
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS = _descriptor.Descriptor(
+  name='OutputPluginBatchProcessingStatus',
+  full_name='OutputPluginBatchProcessingStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='status', full_name='OutputPluginBatchProcessingStatus.status', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Was this batch successfully processed or not?'))),
+    _descriptor.FieldDescriptor(
+      name='plugin_descriptor', full_name='OutputPluginBatchProcessingStatus.plugin_descriptor', index=1,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\022<Descriptor of the output plugin responsible for this result.'))),
+    _descriptor.FieldDescriptor(
+      name='summary', full_name='OutputPluginBatchProcessingStatus.summary', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Summary message.'))),
+    _descriptor.FieldDescriptor(
+      name='batch_index', full_name='OutputPluginBatchProcessingStatus.batch_index', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$Number of the batch being processed.'))),
+    _descriptor.FieldDescriptor(
+      name='batch_size', full_name='OutputPluginBatchProcessingStatus.batch_size', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Size of the batch beting processed.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _OUTPUTPLUGINBATCHPROCESSINGSTATUS_STATUS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=478,
+  serialized_end=967,
+)
+
+
+_OUTPUTPLUGINVERIFICATIONRESULT = _descriptor.Descriptor(
+  name='OutputPluginVerificationResult',
+  full_name='OutputPluginVerificationResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='plugin_id', full_name='OutputPluginVerificationResult.plugin_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223String identifying the output plugin being checked.'))),
+    _descriptor.FieldDescriptor(
+      name='plugin_descriptor', full_name='OutputPluginVerificationResult.plugin_descriptor', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.Descriptor of the plugin that\'s being checked.'))),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='OutputPluginVerificationResult.status', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='status_message', full_name='OutputPluginVerificationResult.status_message', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='OutputPluginVerificationResult.timestamp', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\n\013RDFDatetime\022\027Timestamp of the check.'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _OUTPUTPLUGINVERIFICATIONRESULT_STATUS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=970,
+  serialized_end=1393,
+)
+
+
+_OUTPUTPLUGINVERIFICATIONRESULTSLIST = _descriptor.Descriptor(
+  name='OutputPluginVerificationResultsList',
+  full_name='OutputPluginVerificationResultsList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='OutputPluginVerificationResultsList.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1395,
+  serialized_end=1482,
+)
+
+
+_EMAILOUTPUTPLUGINARGS = _descriptor.Descriptor(
+  name='EmailOutputPluginArgs',
+  full_name='EmailOutputPluginArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='email_address', full_name='EmailOutputPluginArgs.email_address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001F\n\022DomainEmailAddress\0220The email address that messages will be sent to.'))),
+    _descriptor.FieldDescriptor(
+      name='emails_limit', full_name='EmailOutputPluginArgs.emails_limit', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=True, default_value=100,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1485,
+  serialized_end=1636,
+)
+
+
+_BIGQUERYOUTPUTPLUGINARGS = _descriptor.Descriptor(
+  name='BigQueryOutputPluginArgs',
+  full_name='BigQueryOutputPluginArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='export_options', full_name='BigQueryOutputPluginArgs.export_options', index=0,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\017Export options.\030\001'))),
+    _descriptor.FieldDescriptor(
+      name='convert_values', full_name='BigQueryOutputPluginArgs.convert_values', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=True,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0017\0223If true, convert values for export-friendly format.\030\002'))),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1639,
+  serialized_end=1825,
+)
+
+_OUTPUTPLUGINSTATE.fields_by_name['plugin_descriptor'].message_type = _OUTPUTPLUGINDESCRIPTOR
+_OUTPUTPLUGINSTATE.fields_by_name['plugin_state'].message_type = grr__response__proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['status'].enum_type = _OUTPUTPLUGINBATCHPROCESSINGSTATUS_STATUS
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['plugin_descriptor'].message_type = _OUTPUTPLUGINDESCRIPTOR
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS_STATUS.containing_type = _OUTPUTPLUGINBATCHPROCESSINGSTATUS
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['plugin_descriptor'].message_type = _OUTPUTPLUGINDESCRIPTOR
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['status'].enum_type = _OUTPUTPLUGINVERIFICATIONRESULT_STATUS
+_OUTPUTPLUGINVERIFICATIONRESULT_STATUS.containing_type = _OUTPUTPLUGINVERIFICATIONRESULT
+_OUTPUTPLUGINVERIFICATIONRESULTSLIST.fields_by_name['results'].message_type = _OUTPUTPLUGINVERIFICATIONRESULT
+_BIGQUERYOUTPUTPLUGINARGS.fields_by_name['export_options'].message_type = grr__response__proto_dot_export__pb2._EXPORTOPTIONS
+DESCRIPTOR.message_types_by_name['OutputPluginDescriptor'] = _OUTPUTPLUGINDESCRIPTOR
+DESCRIPTOR.message_types_by_name['OutputPluginState'] = _OUTPUTPLUGINSTATE
+DESCRIPTOR.message_types_by_name['OutputPluginBatchProcessingStatus'] = _OUTPUTPLUGINBATCHPROCESSINGSTATUS
+DESCRIPTOR.message_types_by_name['OutputPluginVerificationResult'] = _OUTPUTPLUGINVERIFICATIONRESULT
+DESCRIPTOR.message_types_by_name['OutputPluginVerificationResultsList'] = _OUTPUTPLUGINVERIFICATIONRESULTSLIST
+DESCRIPTOR.message_types_by_name['EmailOutputPluginArgs'] = _EMAILOUTPUTPLUGINARGS
+DESCRIPTOR.message_types_by_name['BigQueryOutputPluginArgs'] = _BIGQUERYOUTPUTPLUGINARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+OutputPluginDescriptor = _reflection.GeneratedProtocolMessageType('OutputPluginDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTPLUGINDESCRIPTOR,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:OutputPluginDescriptor)
+  ))
+_sym_db.RegisterMessage(OutputPluginDescriptor)
+
+OutputPluginState = _reflection.GeneratedProtocolMessageType('OutputPluginState', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTPLUGINSTATE,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:OutputPluginState)
+  ))
+_sym_db.RegisterMessage(OutputPluginState)
+
+OutputPluginBatchProcessingStatus = _reflection.GeneratedProtocolMessageType('OutputPluginBatchProcessingStatus', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTPLUGINBATCHPROCESSINGSTATUS,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:OutputPluginBatchProcessingStatus)
+  ))
+_sym_db.RegisterMessage(OutputPluginBatchProcessingStatus)
+
+OutputPluginVerificationResult = _reflection.GeneratedProtocolMessageType('OutputPluginVerificationResult', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTPLUGINVERIFICATIONRESULT,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:OutputPluginVerificationResult)
+  ))
+_sym_db.RegisterMessage(OutputPluginVerificationResult)
+
+OutputPluginVerificationResultsList = _reflection.GeneratedProtocolMessageType('OutputPluginVerificationResultsList', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTPLUGINVERIFICATIONRESULTSLIST,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:OutputPluginVerificationResultsList)
+  ))
+_sym_db.RegisterMessage(OutputPluginVerificationResultsList)
+
+EmailOutputPluginArgs = _reflection.GeneratedProtocolMessageType('EmailOutputPluginArgs', (_message.Message,), dict(
+  DESCRIPTOR = _EMAILOUTPUTPLUGINARGS,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:EmailOutputPluginArgs)
+  ))
+_sym_db.RegisterMessage(EmailOutputPluginArgs)
+
+BigQueryOutputPluginArgs = _reflection.GeneratedProtocolMessageType('BigQueryOutputPluginArgs', (_message.Message,), dict(
+  DESCRIPTOR = _BIGQUERYOUTPUTPLUGINARGS,
+  __module__ = 'grr_response_proto.output_plugin_pb2'
+  # @@protoc_insertion_point(class_scope:BigQueryOutputPluginArgs)
+  ))
+_sym_db.RegisterMessage(BigQueryOutputPluginArgs)
+
+
+_OUTPUTPLUGINDESCRIPTOR.fields_by_name['plugin_name'].has_options = True
+_OUTPUTPLUGINDESCRIPTOR.fields_by_name['plugin_name']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001 \022\036The name of the output plugin.'))
+_OUTPUTPLUGINDESCRIPTOR.fields_by_name['plugin_args'].has_options = True
+_OUTPUTPLUGINDESCRIPTOR.fields_by_name['plugin_args']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001j\022TThe parameters for this plugin. Must be an instance of the named plugin\'s args_type.*\022GetPluginArgsClass'))
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['status'].has_options = True
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['status']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001/\022-Was this batch successfully processed or not?'))
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['plugin_descriptor'].has_options = True
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['plugin_descriptor']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001>\022<Descriptor of the output plugin responsible for this result.'))
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['summary'].has_options = True
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['summary']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\022\022\020Summary message.'))
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['batch_index'].has_options = True
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['batch_index']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\022$Number of the batch being processed.'))
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['batch_size'].has_options = True
+_OUTPUTPLUGINBATCHPROCESSINGSTATUS.fields_by_name['batch_size']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001%\022#Size of the batch beting processed.'))
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['plugin_id'].has_options = True
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['plugin_id']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0015\0223String identifying the output plugin being checked.'))
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['plugin_descriptor'].has_options = True
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['plugin_descriptor']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0010\022.Descriptor of the plugin that\'s being checked.'))
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['timestamp'].has_options = True
+_OUTPUTPLUGINVERIFICATIONRESULT.fields_by_name['timestamp']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001&\n\013RDFDatetime\022\027Timestamp of the check.'))
+_EMAILOUTPUTPLUGINARGS.fields_by_name['email_address'].has_options = True
+_EMAILOUTPUTPLUGINARGS.fields_by_name['email_address']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001F\n\022DomainEmailAddress\0220The email address that messages will be sent to.'))
+_BIGQUERYOUTPUTPLUGINARGS.fields_by_name['export_options'].has_options = True
+_BIGQUERYOUTPUTPLUGINARGS.fields_by_name['export_options']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\001\023\022\017Export options.\030\001'))
+_BIGQUERYOUTPUTPLUGINARGS.fields_by_name['convert_values'].has_options = True
+_BIGQUERYOUTPUTPLUGINARGS.fields_by_name['convert_values']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\342\374\343\304\0017\0223If true, convert values for export-friendly format.\030\002'))
+# @@protoc_insertion_point(module_scope)
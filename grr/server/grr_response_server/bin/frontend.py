@@ -4,18 +4,25 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import cgi
+import asyncore
+import errno
+import fcntl
 import io
 import logging
+import os
 import pdb
 import socket
 import threading
+import time
 
 
 from builtins import range  # pylint: disable=redefined-builtin
+from future.moves.urllib import parse as urlparse
 from future.utils import iteritems
+from future.utils import itervalues
 from http import server as http_server
 import ipaddr
+import queue
 import socketserver
 
 from google.protobuf import json_format
@@ -47,7 +54,8 @@ class GRRHTTPServerHandler(http_server.BaseHTTPRequestHandler):
       200: "200 OK",
       404: "404 Not Found",
       406: "406 Not Acceptable",
-      500: "500 Internal Server Error"
+      500: "500 Internal Server Error",
+      503: "503 Service Unavailable",
   }
 
   active_counter_lock = threading.Lock()
@@ -72,6 +80,11 @@ class GRRHTTPServerHandler(http_server.BaseHTTPRequestHandler):
            additional_headers=None,
            last_modified=0):
     """Sends a response to the client."""
+    # Responses of the async server are written to in-memory files, which only
+    # accept bytes.
+    if not isinstance(data, bytes):
+      data = data.encode("utf-8")
+
     if additional_headers:
       additional_header_strings = [
           "%s: %s\r\n" % (name, val)
@@ -269,13 +282,13 @@ class GRRHTTPServerHandler(http_server.BaseHTTPRequestHandler):
 
     # Get the api version
     try:
-      api_version = int(cgi.parse_qs(self.path.split("?")[1])["api"][0])
+      api_version = int(urlparse.parse_qs(self.path.split("?")[1])["api"][0])
     except (ValueError, KeyError, IndexError):
       # The oldest api version we support if not specified.
       api_version = 3
 
     try:
-      content_length = self.headers.getheader("content-length")
+      content_length = self.headers.get("content-length")
       if not content_length:
         raise IOError("No content-length header provided.")
 
@@ -318,6 +331,16 @@ class GRRHTTPServerHandler(http_server.BaseHTTPRequestHandler):
       self.Send("Enrollment required", status=406)
 
 
+def _CreateFrontEndServer():
+  return frontend_lib.FrontEndServer(
+      certificate=config.CONFIG["Frontend.certificate"],
+      private_key=config.CONFIG["PrivateKeys.server_key"],
+      max_queue_size=config.CONFIG["Frontend.max_queue_size"],
+      message_expiry_time=config.CONFIG["Frontend.message_expiry_time"],
+      max_retransmission_time=config.CONFIG["Frontend.max_retransmission_time"],
+      decoding_processes=config.CONFIG["Frontend.decoding_processes"])
+
+
 class GRRHTTPServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
   """The GRR HTTP frontend server."""
 
@@ -330,16 +353,7 @@ class GRRHTTPServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
     stats_collector_instance.Get().SetGaugeValue("frontend_max_active_count",
                                                  self.request_queue_size)
 
-    if frontend:
-      self.frontend = frontend
-    else:
-      self.frontend = frontend_lib.FrontEndServer(
-          certificate=config.CONFIG["Frontend.certificate"],
-          private_key=config.CONFIG["PrivateKeys.server_key"],
-          max_queue_size=config.CONFIG["Frontend.max_queue_size"],
-          message_expiry_time=config.CONFIG["Frontend.message_expiry_time"],
-          max_retransmission_time=config
-          .CONFIG["Frontend.max_retransmission_time"])
+    self.frontend = frontend or _CreateFrontEndServer()
     self.server_cert = config.CONFIG["Frontend.certificate"]
 
     (address, _) = server_address
@@ -354,6 +368,341 @@ class GRRHTTPServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
 
   def Shutdown(self):
     self.shutdown()
+    self.frontend.Stop()
+
+
+class _BufferedRequestHandler(GRRHTTPServerHandler):
+  """Handles a request that was already read from the network in full."""
+
+  def __init__(self, request_data, client_address, server):
+    self.request_data = request_data
+    GRRHTTPServerHandler.__init__(self, None, client_address, server)
+
+  def setup(self):
+    self.rfile = io.BytesIO(self.request_data)
+    self.wfile = io.BytesIO()
+
+  def finish(self):
+    # The response is sent by the protocol, see GetResponse().
+    pass
+
+  def GetResponse(self):
+    return self.wfile.getvalue()
+
+
+# Sent when all handler threads are busy and the request queue is full.
+_SERVICE_UNAVAILABLE_RESPONSE = (b"HTTP/1.0 503 Service Unavailable\r\n"
+                                 b"Server: GRR Server\r\n"
+                                 b"Content-type: text/plain\r\n"
+                                 b"Content-Length: 11\r\n"
+                                 b"\r\n"
+                                 b"Server busy")
+
+# Sent when the body of a request is larger than the server accepts.
+_REQUEST_TOO_LARGE_RESPONSE = (b"HTTP/1.0 413 Request Entity Too Large\r\n"
+                               b"Server: GRR Server\r\n"
+                               b"Content-type: text/plain\r\n"
+                               b"Content-Length: 17\r\n"
+                               b"\r\n"
+                               b"Request too large")
+
+
+class _AsyncConnection(asyncore.dispatcher):
+  """A client connection of the GRRAsyncHTTPServer.
+
+  Requests are buffered on the event loop. Once a request is complete it is
+  handed to a GRRHTTPServerHandler. Only GETs of server.pem are answered on the
+  event loop. Everything else, including Rekall profiles and static files, is
+  queued for the server's handler threads and answered with a 503 if the queue
+  is full. Requests with a body larger than the server accepts are answered
+  with a 413 before the body is read. Like the threading server we only speak
+  HTTP/1.0, so the connection is closed after the response.
+  """
+
+  MAX_HEADER_SIZE = 64 * 1024
+  READ_SIZE = 64 * 1024
+
+  def __init__(self, sock, client_address, server):
+    asyncore.dispatcher.__init__(self, sock, map=server.socket_map)
+    self.server = server
+    self.client_address = client_address
+    self._buffer = bytearray()
+    self._request_length = None
+    self._dispatched = False
+    # Set once the response is ready, possibly by a handler thread. It is only
+    # sent by the event loop.
+    self._response = None
+    self.last_activity = time.time()
+
+  def readable(self):
+    return not self._dispatched
+
+  def writable(self):
+    return self._response is not None
+
+  def IsIdle(self, now):
+    """Whether the client has not sent or received anything for too long."""
+    # A request waiting for a handler thread is not the client's fault.
+    if self._dispatched and self._response is None:
+      return False
+    return now - self.last_activity > self.server.connection_timeout
+
+  def _ParseContentLength(self, header_data):
+    for line in header_data.split(b"\r\n")[1:]:
+      name, _, value = line.partition(b":")
+      if name.strip().lower() == b"content-length":
+        try:
+          return max(int(value.strip()), 0)
+        except ValueError:
+          return 0
+    return 0
+
+  def handle_read(self):
+    data = self.recv(self.READ_SIZE)
+    if not data:
+      # A client which stops sending before the request is complete does not
+      # get a response, recv() has already closed the connection.
+      return
+
+    self.last_activity = time.time()
+    self._buffer.extend(data)
+    if self._request_length is None:
+      header_end = self._buffer.find(b"\r\n\r\n")
+      if header_end == -1:
+        if len(self._buffer) > self.MAX_HEADER_SIZE:
+          self.close()
+        return
+
+      content_length = self._ParseContentLength(
+          bytes(self._buffer[:header_end]))
+      if content_length > self.server.max_request_size:
+        self._dispatched = True
+        self._buffer = None
+        self.SetResponse(_REQUEST_TOO_LARGE_RESPONSE)
+        return
+
+      self._request_length = header_end + 4 + content_length
+
+    if len(self._buffer) >= self._request_length:
+      self._dispatched = True
+      self._Dispatch(bytes(self._buffer[:self._request_length]))
+      self._buffer = None
+
+  def _Dispatch(self, request_data):
+    """Handles a complete request."""
+    # The server certificate is served straight from memory.
+    if request_data.startswith(b"GET /server.pem"):
+      self.SetResponse(
+          self.server.HandleRequest(request_data, self.client_address))
+      return
+
+    # Everything else may block on the data store.
+    if not self.server.QueueRequest(self, request_data):
+      self.SetResponse(_SERVICE_UNAVAILABLE_RESPONSE)
+
+  def SetResponse(self, response):
+    """Sets the response to send, an empty response closes the connection."""
+    self._response = response or b""
+
+  def handle_write(self):
+    if self._response:
+      sent = self.send(self._response)
+      self._response = self._response[sent:]
+      if sent:
+        self.last_activity = time.time()
+
+    if not self._response:
+      self.close()
+
+  def handle_close(self):
+    self.close()
+
+  def handle_error(self):
+    logging.exception("Error on connection from %s.", self.client_address)
+    self.close()
+
+
+class _Waker(asyncore.file_dispatcher):
+  """Wakes up the event loop when a handler thread has finished a request."""
+
+  def __init__(self, socket_map):
+    read_fd, self._write_fd = os.pipe()
+    asyncore.file_dispatcher.__init__(self, read_fd, map=socket_map)
+    # file_dispatcher keeps a duplicate of the read end.
+    os.close(read_fd)
+    fcntl.fcntl(self._write_fd, fcntl.F_SETFL,
+                fcntl.fcntl(self._write_fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+  def Wake(self):
+    try:
+      os.write(self._write_fd, b"\0")
+    except OSError as e:
+      # The pipe is full, so the event loop will wake up anyway.
+      if e.errno != errno.EAGAIN:
+        raise
+
+  def readable(self):
+    return True
+
+  def writable(self):
+    return False
+
+  def handle_read(self):
+    self.recv(4096)
+
+  def close(self):
+    asyncore.file_dispatcher.close(self)
+    os.close(self._write_fd)
+
+
+class GRRAsyncHTTPServer(asyncore.dispatcher):
+  """The GRR HTTP frontend server built on an asyncore event loop.
+
+  The threading GRRHTTPServer holds an OS thread for every open connection. This
+  server holds all connections on a single event loop and only uses one of
+  max_workers handler threads while a request does actual work, so a frontend
+  can keep many more clients connected. At most max_queued_requests complete
+  requests wait for a handler thread, further ones are answered with a 503.
+  Request bodies are limited to max_request_size bytes and connections which
+  are idle for more than connection_timeout seconds are closed, so slow or
+  stalled clients can't hold on to buffers and file descriptors.
+
+  The event loop uses poll(), which is only available on Unix.
+  """
+
+  request_queue_size = 500
+
+  # How often (in seconds) idle connections are looked for.
+  IDLE_CHECK_INTERVAL = 1
+
+  def __init__(self,
+               server_address,
+               frontend=None,
+               max_workers=50,
+               max_queued_requests=1000,
+               max_request_size=100000000,
+               connection_timeout=300):
+    # Connections of this server are kept separate from asyncore's global map.
+    self.socket_map = {}
+    asyncore.dispatcher.__init__(self, map=self.socket_map)
+
+    (address, _) = server_address
+    if ipaddr.IPAddress(address).version == 6:
+      address_family = socket.AF_INET6
+    else:
+      address_family = socket.AF_INET
+
+    logging.info("Will attempt to listen on %s", server_address)
+    self.create_socket(address_family, socket.SOCK_STREAM)
+    try:
+      self.set_reuse_addr()
+      self.bind(server_address)
+      self.listen(self.request_queue_size)
+    except socket.error:
+      self.close()
+      raise
+
+    stats_collector_instance.Get().SetGaugeValue("frontend_max_active_count",
+                                                 max_workers)
+
+    self.frontend = frontend or _CreateFrontEndServer()
+    self.server_cert = config.CONFIG["Frontend.certificate"]
+    self.max_request_size = max_request_size
+    self.connection_timeout = connection_timeout
+
+    self._stopped = False
+    self._last_idle_check = time.time()
+    self._waker = _Waker(self.socket_map)
+    self._requests = queue.Queue(maxsize=max_queued_requests)
+    self._handler_threads = []
+    for i in range(max_workers):
+      thread = threading.Thread(
+          name="GRRAsyncHTTPServerHandler%d" % i, target=self._HandlerLoop)
+      thread.daemon = True
+      thread.start()
+      self._handler_threads.append(thread)
+
+  def handle_accept(self):
+    pair = self.accept()
+    if pair is None:
+      return
+
+    sock, client_address = pair
+    _AsyncConnection(sock, client_address[:2], self)
+
+  def handle_error(self):
+    logging.exception("Error while accepting a connection.")
+
+  def HandleRequest(self, request_data, client_address):
+    """Runs a complete request through the frontend request handler."""
+    handler = _BufferedRequestHandler(request_data, client_address, self)
+    return handler.GetResponse()
+
+  def QueueRequest(self, connection, request_data):
+    """Queues a request of the given connection for the handler threads.
+
+    Args:
+      connection: The _AsyncConnection the request was read from.
+      request_data: The complete request as bytes.
+
+    Returns:
+      False if the queue is full and the request was not queued.
+    """
+    try:
+      self._requests.put_nowait((connection, request_data))
+    except queue.Full:
+      return False
+    return True
+
+  def _HandlerLoop(self):
+    while True:
+      item = self._requests.get()
+      if item is None:
+        return
+
+      connection, request_data = item
+      try:
+        response = self.HandleRequest(request_data, connection.client_address)
+      except Exception:  # pylint: disable=broad-except
+        logging.exception("Failed to handle request from %s.",
+                          connection.client_address)
+        response = b""
+
+      connection.SetResponse(response)
+      self._waker.Wake()
+
+  def _CloseIdleConnections(self):
+    now = time.time()
+    if now - self._last_idle_check < self.IDLE_CHECK_INTERVAL:
+      return
+    self._last_idle_check = now
+
+    for dispatcher in list(itervalues(self.socket_map)):
+      if isinstance(dispatcher, _AsyncConnection) and dispatcher.IsIdle(now):
+        logging.info("Closing idle connection from %s.",
+                     dispatcher.client_address)
+        dispatcher.close()
+
+  def serve_forever(self):  # pylint: disable=g-bad-name
+    try:
+      while not self._stopped:
+        asyncore.loop(
+            timeout=self.IDLE_CHECK_INTERVAL,
+            use_poll=True,
+            map=self.socket_map,
+            count=1)
+        self._CloseIdleConnections()
+    finally:
+      for _ in self._handler_threads:
+        self._requests.put(None)
+      for thread in self._handler_threads:
+        thread.join()
+      asyncore.close_all(map=self.socket_map)
+      self.frontend.Stop()
+
+  def Shutdown(self):
+    self._stopped = True
+    self._waker.Wake()
 
 
 def CreateServer(frontend=None):
@@ -365,8 +714,19 @@ def CreateServer(frontend=None):
 
     server_address = (config.CONFIG["Frontend.bind_address"], port)
     try:
-      httpd = GRRHTTPServer(
-          server_address, GRRHTTPServerHandler, frontend=frontend)
+      if config.CONFIG["Frontend.server_mode"] == "async":
+        httpd = GRRAsyncHTTPServer(
+            server_address,
+            frontend=frontend,
+            max_workers=config.CONFIG["Frontend.async_handler_threads"],
+            max_queued_requests=config
+            .CONFIG["Frontend.async_max_queued_requests"],
+            max_request_size=config.CONFIG["Frontend.async_max_request_size"],
+            connection_timeout=config
+            .CONFIG["Frontend.async_connection_timeout"])
+      else:
+        httpd = GRRHTTPServer(
+            server_address, GRRHTTPServerHandler, frontend=frontend)
       break
     except socket.error as e:
       if e.errno == socket.errno.EADDRINUSE and port < max_port:
@@ -399,6 +759,7 @@ def main(argv):
     httpd.serve_forever()
   except KeyboardInterrupt:
     print("Caught keyboard interrupt, stopping")
+    httpd.Shutdown()
 
 
 if __name__ == "__main__":
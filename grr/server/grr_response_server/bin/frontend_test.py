@@ -45,6 +45,9 @@ from grr.test_lib import worker_mocks
 class GRRHTTPServerTest(test_lib.GRRBaseTest):
   """Test the http server."""
 
+  # Whether the server is brought up for every test instead of once per class.
+  server_per_test = False
+
   @classmethod
   def setUpClass(cls):
     super(GRRHTTPServerTest, cls).setUpClass()
@@ -55,11 +58,15 @@ class GRRHTTPServerTest(test_lib.GRRBaseTest):
     })
     cls.config_overrider.Start()
 
-    # Bring up a local server for testing.
+    if not cls.server_per_test:
+      cls._StartServer()
+
+  @classmethod
+  def _StartServer(cls, **kwargs):
+    """Brings up a local server for testing."""
     port = portpicker.pick_unused_port()
     ip = utils.ResolveHostnameToIP("localhost", port)
-    cls.httpd = frontend.GRRHTTPServer((ip, port),
-                                       frontend.GRRHTTPServerHandler)
+    cls.httpd = cls._CreateServer((ip, port), **kwargs)
 
     if ipaddr.IPAddress(ip).version == 6:
       cls.address_family = socket.AF_INET6
@@ -74,13 +81,24 @@ class GRRHTTPServerTest(test_lib.GRRBaseTest):
     cls.httpd_thread.start()
 
   @classmethod
-  def tearDownClass(cls):
-    cls.config_overrider.Stop()
+  def _StopServer(cls):
     cls.httpd.Shutdown()
     cls.httpd_thread.join()
 
+  @classmethod
+  def _CreateServer(cls, server_address):
+    return frontend.GRRHTTPServer(server_address, frontend.GRRHTTPServerHandler)
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.config_overrider.Stop()
+    if not cls.server_per_test:
+      cls._StopServer()
+
   def setUp(self):
     super(GRRHTTPServerTest, self).setUp()
+    if self.server_per_test:
+      self._StartServer()
     self.client_id = self.SetupClient(0)
 
   def tearDown(self):
@@ -89,9 +107,13 @@ class GRRHTTPServerTest(test_lib.GRRBaseTest):
     # Wait until all pending http requests have been handled.
     for _ in range(100):
       if frontend.GRRHTTPServerHandler.active_counter == 0:
-        return
+        break
       time.sleep(0.01)
-    self.fail("HTTP server thread did not shut down in time.")
+    else:
+      self.fail("HTTP server thread did not shut down in time.")
+
+    if self.server_per_test:
+      self._StopServer()
 
   def testServerPem(self):
     req = requests.get(self.base_url + "server.pem")
@@ -315,6 +337,94 @@ class GRRHTTPServerTest(test_lib.GRRBaseTest):
     self.assertEqual(profile.data[:2], b"\x1f\x8b")
 
 
+@db_test_lib.DualDBTest
+class GRRAsyncHTTPServerTest(GRRHTTPServerTest):
+  """Runs the http server tests against the async frontend."""
+
+  # The handler threads live as long as the server, so they are stopped after
+  # every test.
+  server_per_test = True
+
+  @classmethod
+  def _CreateServer(cls, server_address, **kwargs):
+    return frontend.GRRAsyncHTTPServer(server_address, max_workers=1, **kwargs)
+
+  def testRequestsAreRejectedWhenQueueIsFull(self):
+    self._StopServer()
+    self._StartServer(max_queued_requests=1)
+
+    handler_started = threading.Event()
+    release_handler = threading.Event()
+    handle_request = self.httpd.HandleRequest
+
+    def BlockingHandleRequest(request_data, client_address):
+      handler_started.set()
+      release_handler.wait(10)
+      return handle_request(request_data, client_address)
+
+    status_codes = []
+
+    def Get():
+      status_codes.append(
+          requests.get(self.base_url + "static/test.txt").status_code)
+
+    threads = [threading.Thread(target=Get) for _ in range(2)]
+    with utils.Stubber(self.httpd, "HandleRequest", BlockingHandleRequest):
+      # The first request occupies the only handler thread.
+      threads[0].start()
+      self.assertTrue(handler_started.wait(10))
+
+      # The second one fills the queue.
+      threads[1].start()
+      for _ in range(1000):
+        if self.httpd._requests.full():
+          break
+        time.sleep(0.01)
+
+      req = requests.get(self.base_url + "static/test.txt")
+      self.assertEqual(req.status_code, 503)
+
+      release_handler.set()
+      for thread in threads:
+        thread.join()
+
+    self.assertEqual(status_codes, [404, 404])
+
+  def _Connect(self):
+    sock = socket.socket(self.address_family, socket.SOCK_STREAM)
+    sock.settimeout(10)
+    sock.connect(self.httpd.socket.getsockname()[:2])
+    self.addCleanup(sock.close)
+    return sock
+
+  def testLargeRequestsAreRejected(self):
+    self._StopServer()
+    self._StartServer(max_request_size=1024)
+
+    with test_lib.Instrument(self.httpd, "QueueRequest") as queue_request:
+      sock = self._Connect()
+      # The response is sent without waiting for the body.
+      sock.sendall(b"POST /control HTTP/1.0\r\nContent-Length: 4096\r\n\r\n")
+      response = b""
+      while True:
+        data = sock.recv(1024)
+        if not data:
+          break
+        response += data
+
+    self.assertTrue(response.startswith(b"HTTP/1.0 413 "))
+    self.assertEqual(queue_request.call_count, 0)
+
+  def testIdleConnectionsAreClosed(self):
+    self._StopServer()
+    self._StartServer(connection_timeout=0.5)
+
+    sock = self._Connect()
+    # The request is never completed.
+    sock.sendall(b"POST /control HTTP/1.0\r\nContent-Length: 100\r\n\r\n")
+    self.assertEqual(sock.recv(1024), b"")
+
+
 def main(args):
   test_lib.main(args)
 
@@ -0,0 +1,632 @@
+#!/usr/bin/env python
+"""A blob store keeping blobs in append-only pack files on a local disk.
+
+Blobs are appended to pack files of a limited size, each blob preceded by a
+small header. Locations of blobs are kept in an index that consists of two
+parts:
+
+  * A sorted file of fixed-size entries. It's memory-mapped and searched with
+    a binary search, so that the index of a multi-terabyte store doesn't have
+    to fit in memory.
+  * A journal of entries added since the sorted file was last rewritten. It's
+    appended to on every write and kept in memory as a dict. Once it grows over
+    a limit, a background thread merges it with the sorted file into a new
+    one. Writers are not blocked by the merge, they append to a fresh journal
+    in the meantime.
+
+Concurrent writes are grouped: every writer appends its blobs under a lock and
+a single fsync of the pack file and the journal then commits all the writes
+that were appended in the meantime.
+
+Pack files are memory-mapped for reading, so reading a blob from a mapped pack
+takes neither a system call nor a lock. Deleted blobs are recorded in the
+journal as tombstones and their space is reclaimed by `Compact`.
+
+The journal and the pack write offset are kept in memory, so the store can only
+be used by a single process. It takes an exclusive lock on its directory and
+refuses to open a directory another process (or another instance) holds.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import fcntl
+import io
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+
+from future.utils import iteritems
+
+from grr_response_core import config
+from grr_response_core.lib import utils
+from grr_response_server import blob_store
+
+# Header of a blob in a pack file: blob id and length of the blob data.
+_HEADER = struct.Struct("<32sQ")
+# Index entry: blob id, pack number, offset of the blob data and its length.
+_ENTRY = struct.Struct("<32sIQQ")
+_BLOB_ID_SIZE = 32
+
+# Pack number of index entries marking deleted blobs.
+_TOMBSTONE_PACK = 0xFFFFFFFF
+
+_PACK_FILENAME_RE = re.compile(r"^pack-(\d{8})$")
+_LOCK_FILENAME = "lock"
+_INDEX_FILENAME = "index"
+_JOURNAL_FILENAME = "journal"
+# The journal being merged into the sorted index.
+_MERGING_JOURNAL_FILENAME = "journal.merging"
+
+
+def _PackFilename(pack_number):
+  return "pack-%08d" % pack_number
+
+
+def _FindInIndex(index_map, blob_id):
+  """Binary-searches the sorted index for a location of the blob."""
+  lo = 0
+  hi = len(index_map) // _ENTRY.size
+  while lo < hi:
+    mid = (lo + hi) // 2
+    start = mid * _ENTRY.size
+    key = index_map[start:start + _BLOB_ID_SIZE]
+    if key < blob_id:
+      lo = mid + 1
+    elif key > blob_id:
+      hi = mid
+    else:
+      return _ENTRY.unpack_from(index_map, start)[1:]
+  return None
+
+
+def _IterIndex(index_map):
+  """Yields (blob id, location) tuples of all entries of the sorted index."""
+  if index_map is None:
+    return
+
+  for start in range(0, len(index_map), _ENTRY.size):
+    entry = _ENTRY.unpack_from(index_map, start)
+    yield entry[0], entry[1:]
+
+
+def _Fsync(fd):
+  """Flushes a file object and syncs it to the disk."""
+  fd.flush()
+  os.fsync(fd.fileno())
+
+
+class Error(Exception):
+  pass
+
+
+class StoreLockedError(Error):
+  """Raised when the store directory is used by another blob store."""
+
+
+class PackFileBlobStore(blob_store.BlobStore):
+  """A blob store writing blobs into append-only local pack files."""
+
+  def __init__(self, path=None, max_pack_size=None, max_journal_entries=None):
+    """Opens the blob store, creating it if needed.
+
+    Only one blob store can use a directory at a time, even across processes.
+
+    Args:
+      path: A directory the blob store is kept in. Defaults to the
+        `PackFileBlobStore.path` configuration option.
+      max_pack_size: A size (in bytes) after which a new pack file is started.
+      max_journal_entries: A number of journal entries after which the journal
+        is merged into the sorted index.
+
+    Raises:
+      StoreLockedError: The directory is used by another blob store.
+    """
+    super(PackFileBlobStore, self).__init__()
+
+    if path is None:
+      path = config.CONFIG["PackFileBlobStore.path"]
+    if max_pack_size is None:
+      max_pack_size = config.CONFIG["PackFileBlobStore.max_pack_size"]
+    if max_journal_entries is None:
+      max_journal_entries = config.CONFIG[
+          "PackFileBlobStore.max_journal_entries"]
+
+    self._path = path
+    self._max_pack_size = max_pack_size
+    self._max_journal_entries = max_journal_entries
+
+    # Guards appending to the pack and journal files.
+    self._write_lock = threading.Lock()
+    # Serializes fsyncs, so that concurrent writers are committed together.
+    self._sync_lock = threading.Lock()
+    # Guards swapping the index map and the journal dicts during merges.
+    self._index_lock = threading.Lock()
+    # Serializes merges of the journal into the sorted index.
+    self._merge_lock = threading.Lock()
+    self._maps_lock = threading.Lock()
+    self._compaction_lock = threading.Lock()
+
+    self._write_seq = 0
+    self._synced_seq = 0
+    # Maps pack numbers to read-only memory maps of the pack files.
+    self._pack_maps = {}
+
+    utils.EnsureDirExists(path)
+
+    self._lock_file = io.open(os.path.join(path, _LOCK_FILENAME), "ab")
+    try:
+      fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (IOError, OSError):
+      self._lock_file.close()
+      raise StoreLockedError(
+          "Blob store directory %s is used by another process." % path)
+
+    pack_numbers = self._ListPackNumbers()
+    self._pack_number = max(pack_numbers) if pack_numbers else 1
+    self._pack_file = io.open(self._PackPath(self._pack_number), "ab")
+    self._pack_offset = self._pack_file.seek(0, os.SEEK_END)
+
+    self._index_map = self._MapIndex()
+    # A merge interrupted by a crash is finished by the next merge.
+    self._merging_journal = None
+    if os.path.exists(os.path.join(self._path, _MERGING_JOURNAL_FILENAME)):
+      self._merging_journal = self._LoadJournal(_MERGING_JOURNAL_FILENAME)
+    self._journal = self._LoadJournal(_JOURNAL_FILENAME)
+    self._journal_file = io.open(
+        os.path.join(self._path, _JOURNAL_FILENAME), "ab")
+
+    self._closing = False
+    self._merge_requested = threading.Event()
+    self._merge_thread = threading.Thread(
+        name="PackFileBlobStoreMerger", target=self._MergeLoop)
+    self._merge_thread.daemon = True
+    self._merge_thread.start()
+
+  def _PackPath(self, pack_number):
+    return os.path.join(self._path, _PackFilename(pack_number))
+
+  def _ListPackNumbers(self):
+    result = []
+    for filename in os.listdir(self._path):
+      match = _PACK_FILENAME_RE.match(filename)
+      if match:
+        result.append(int(match.group(1)))
+    return result
+
+  def _MapIndex(self):
+    """Memory-maps the sorted index file, returns None if it's empty."""
+    index_path = os.path.join(self._path, _INDEX_FILENAME)
+    if not os.path.exists(index_path) or not os.path.getsize(index_path):
+      return None
+
+    with io.open(index_path, "rb") as fd:
+      return mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+
+  def _LoadJournal(self, filename):
+    """Reads all the valid entries of a journal file into a dict."""
+    journal_path = os.path.join(self._path, filename)
+    if not os.path.exists(journal_path):
+      return {}
+
+    with io.open(journal_path, "rb") as fd:
+      data = fd.read()
+
+    # A crash might have left a partially written entry at the end of the
+    # journal or entries of blobs whose data didn't make it to the disk.
+    valid_size = len(data) - len(data) % _ENTRY.size
+    if valid_size != len(data):
+      # Entries appended later have to stay aligned.
+      with io.open(journal_path, "r+b") as fd:
+        fd.truncate(valid_size)
+
+    journal = {}
+    pack_files = {}
+    try:
+      for start in range(0, valid_size, _ENTRY.size):
+        blob_id, pack_number, offset, length = _ENTRY.unpack_from(data, start)
+        if (pack_number == _TOMBSTONE_PACK or self._IsBlobInPack(
+            pack_files, blob_id, pack_number, offset, length)):
+          journal[blob_id] = (pack_number, offset, length)
+    finally:
+      for pack_file in pack_files.values():
+        if pack_file is not None:
+          pack_file.close()
+
+    return journal
+
+  def _IsBlobInPack(self, pack_files, blob_id, pack_number, offset, length):
+    """Checks that the pack contains the blob described by a journal entry."""
+    if pack_number not in pack_files:
+      try:
+        pack_files[pack_number] = io.open(self._PackPath(pack_number), "rb")
+      except (IOError, OSError):
+        pack_files[pack_number] = None
+
+    pack_file = pack_files[pack_number]
+    if pack_file is None or offset < _HEADER.size:
+      return False
+
+    pack_file.seek(0, os.SEEK_END)
+    if pack_file.tell() < offset + length:
+      return False
+
+    pack_file.seek(offset - _HEADER.size)
+    header = pack_file.read(_HEADER.size)
+    return _HEADER.unpack(header) == (blob_id, length)
+
+  def _Lookup(self, blob_id):
+    """Returns a (pack number, offset, length) tuple or None if not found."""
+    with self._index_lock:
+      journal = self._journal
+      merging_journal = self._merging_journal
+      index_map = self._index_map
+
+    location = journal.get(blob_id)
+    if location is None and merging_journal is not None:
+      location = merging_journal.get(blob_id)
+    if location is None and index_map is not None:
+      location = _FindInIndex(index_map, blob_id)
+
+    if location is None or location[0] == _TOMBSTONE_PACK:
+      return None
+    return location
+
+  def _GetPackMap(self, pack_number, min_size):
+    """Returns a memory map of the pack covering at least min_size bytes."""
+    pack_map = self._pack_maps.get(pack_number)
+    if pack_map is not None and len(pack_map) >= min_size:
+      return pack_map
+
+    with self._maps_lock:
+      pack_map = self._pack_maps.get(pack_number)
+      if pack_map is not None and len(pack_map) >= min_size:
+        return pack_map
+
+      try:
+        with io.open(self._PackPath(pack_number), "rb") as fd:
+          pack_map = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+      except (IOError, OSError):
+        # The pack was removed by a compaction.
+        return None
+
+      # Older maps are not closed, they might still be used by readers.
+      self._pack_maps[pack_number] = pack_map
+      return pack_map
+
+  def _ReadBlob(self, blob_id):
+    """Reads data of a single blob, returns None if it doesn't exist."""
+    # A compaction might move the blob between the lookup and the read, in
+    # which case the second lookup finds its new location.
+    for _ in range(2):
+      location = self._Lookup(blob_id)
+      if location is None:
+        return None
+
+      pack_number, offset, length = location
+      pack_map = self._GetPackMap(pack_number, offset + length)
+      if pack_map is not None:
+        return pack_map[offset:offset + length]
+
+    return None
+
+  def _RotatePack(self):
+    """Syncs and closes the current pack file and starts a new one."""
+    _Fsync(self._pack_file)
+    self._pack_file.close()
+
+    self._pack_number += 1
+    self._pack_file = io.open(self._PackPath(self._pack_number), "ab")
+    self._pack_offset = 0
+
+  def _AppendBlobs(self, blobs):
+    """Appends (blob id, data) pairs to the packs, must hold the write lock.
+
+    Args:
+      blobs: A list of (blob id bytes, blob data) tuples.
+
+    Returns:
+      A sequence number of the write to pass to `_Sync`.
+    """
+    entries = []
+    for blob_id, blob_data in blobs:
+      record_size = _HEADER.size + len(blob_data)
+      if (self._pack_offset > 0 and
+          self._pack_offset + record_size > self._max_pack_size):
+        self._RotatePack()
+
+      self._pack_file.write(_HEADER.pack(blob_id, len(blob_data)))
+      self._pack_file.write(blob_data)
+      entries.append((blob_id, self._pack_number,
+                      self._pack_offset + _HEADER.size, len(blob_data)))
+      self._pack_offset += record_size
+
+    # Data has to be visible to memory maps before the index points at it.
+    self._pack_file.flush()
+    return self._AppendJournal(entries)
+
+  def _AppendJournal(self, entries):
+    """Appends entries to the journal, must hold the write lock.
+
+    Args:
+      entries: A list of (blob id bytes, pack number, offset, length) tuples.
+
+    Returns:
+      A sequence number of the write to pass to `_Sync`.
+    """
+    for entry in entries:
+      self._journal_file.write(_ENTRY.pack(*entry))
+    self._journal_file.flush()
+
+    for blob_id, pack_number, offset, length in entries:
+      self._journal[blob_id] = (pack_number, offset, length)
+
+    self._write_seq += 1
+    return self._write_seq
+
+  def _Sync(self, seq):
+    """Makes sure that all the writes up to given sequence number are synced.
+
+    Writers arriving while another thread syncs wait for it to finish and
+    usually find that their writes were synced with it.
+
+    Args:
+      seq: A sequence number returned by `_AppendJournal`.
+    """
+    with self._sync_lock:
+      if self._synced_seq >= seq:
+        return
+
+      with self._write_lock:
+        seq = self._write_seq
+        # Files might get rotated or truncated while we sync, so we sync
+        # duplicates of their descriptors.
+        fds = [
+            os.dup(self._pack_file.fileno()),
+            os.dup(self._journal_file.fileno()),
+        ]
+
+      try:
+        # Data goes first, so that the journal never points at unsynced data.
+        for fd in fds:
+          os.fsync(fd)
+      finally:
+        for fd in fds:
+          os.close(fd)
+
+      self._synced_seq = seq
+
+  def _MaybeMergeJournal(self):
+    if len(self._journal) >= self._max_journal_entries:
+      self._merge_requested.set()
+
+  def _MergeLoop(self):
+    """Merges the journal whenever a writer asks for it, until closed."""
+    while True:
+      self._merge_requested.wait()
+      self._merge_requested.clear()
+
+      # Merges requested before closing are still done.
+      with self._merge_lock:
+        if len(self._journal) >= self._max_journal_entries:
+          try:
+            self._MergeJournal()
+          except Exception:  # pylint: disable=broad-except
+            logging.exception("Failed to merge the blob store journal.")
+
+      if self._closing:
+        return
+
+  def _RotateJournal(self):
+    """Starts a new journal for writes done while merging the current one."""
+    with self._write_lock:
+      # The merged index must not point at data that isn't on the disk.
+      _Fsync(self._pack_file)
+      _Fsync(self._journal_file)
+      self._journal_file.close()
+
+      journal_path = os.path.join(self._path, _JOURNAL_FILENAME)
+      os.rename(journal_path,
+                os.path.join(self._path, _MERGING_JOURNAL_FILENAME))
+      self._journal_file = io.open(journal_path, "ab")
+
+      with self._index_lock:
+        self._merging_journal = self._journal
+        self._journal = {}
+
+  def _MergeJournal(self):
+    """Merges the journal into a new sorted index, must hold the merge lock."""
+    if self._merging_journal is not None:
+      # Finish the merge interrupted by a crash first.
+      self._WriteIndex()
+    self._RotateJournal()
+    self._WriteIndex()
+
+  def _WriteIndex(self):
+    """Writes a new sorted index including the entries being merged."""
+    journal_entries = sorted(iteritems(self._merging_journal))
+    index_entries = _IterIndex(self._index_map)
+
+    index_path = os.path.join(self._path, _INDEX_FILENAME)
+    tmp_path = index_path + ".tmp"
+    with io.open(tmp_path, "wb") as fd:
+
+      def Write(blob_id, location):
+        if location[0] != _TOMBSTONE_PACK:
+          fd.write(_ENTRY.pack(blob_id, *location))
+
+      pos = 0
+      for blob_id, location in index_entries:
+        while pos < len(journal_entries) and journal_entries[pos][0] < blob_id:
+          Write(*journal_entries[pos])
+          pos += 1
+        if pos < len(journal_entries) and journal_entries[pos][0] == blob_id:
+          # Journal entries are newer than the ones in the index.
+          continue
+        Write(blob_id, location)
+
+      for blob_id, location in journal_entries[pos:]:
+        Write(blob_id, location)
+
+      _Fsync(fd)
+
+    os.rename(tmp_path, index_path)
+    index_map = self._MapIndex()
+    with self._index_lock:
+      # The old map is not closed, it might still be used by readers.
+      self._index_map = index_map
+      self._merging_journal = None
+
+    os.remove(os.path.join(self._path, _MERGING_JOURNAL_FILENAME))
+
+  def WriteBlobs(self, blob_id_data_map):
+    """Creates blobs, skipping the ones that already exist."""
+    existing = self.CheckBlobsExist(list(blob_id_data_map))
+    blobs = [(blob_id.AsBytes(), blob_data)
+             for blob_id, blob_data in iteritems(blob_id_data_map)
+             if not existing[blob_id]]
+    if not blobs:
+      return
+
+    with self._write_lock:
+      seq = self._AppendBlobs(blobs)
+
+    self._Sync(seq)
+    self._MaybeMergeJournal()
+
+  def ReadBlobs(self, blob_ids):
+    return {blob_id: self._ReadBlob(blob_id.AsBytes()) for blob_id in blob_ids}
+
+  def CheckBlobsExist(self, blob_ids):
+    return {
+        blob_id: self._Lookup(blob_id.AsBytes()) is not None
+        for blob_id in blob_ids
+    }
+
+  def DeleteBlobs(self, blob_ids):
+    """Deletes blobs, their space is reclaimed by a later compaction.
+
+    Args:
+      blob_ids: An iterable of rdf_objects.BlobID objects.
+    """
+    entries = [(blob_id.AsBytes(), _TOMBSTONE_PACK, 0, 0)
+               for blob_id in blob_ids]
+    if not entries:
+      return
+
+    with self._write_lock:
+      seq = self._AppendJournal(entries)
+
+    self._Sync(seq)
+    self._MaybeMergeJournal()
+
+  def Compact(self, min_live_fraction=0.5):
+    """Reclaims space of deleted blobs.
+
+    Live blobs of every pack (other than the one being written to) whose
+    fraction of live data dropped below `min_live_fraction` are appended to the
+    current pack and the old pack is removed.
+
+    Args:
+      min_live_fraction: A fraction of live data below which a pack is
+        compacted.
+
+    Returns:
+      A number of removed pack files.
+    """
+    with self._compaction_lock:
+      # Entries of all the packs before the current one are in the journal, so
+      # the merge puts them into the index.
+      with self._write_lock:
+        current_pack_number = self._pack_number
+      with self._merge_lock:
+        self._MergeJournal()
+
+      with self._index_lock:
+        index_map = self._index_map
+
+      live_sizes = {}
+      for _, (pack_number, _, length) in _IterIndex(index_map):
+        live_sizes[pack_number] = (
+            live_sizes.get(pack_number, 0) + _HEADER.size + length)
+
+      packs_to_compact = set()
+      for pack_number in self._ListPackNumbers():
+        if pack_number >= current_pack_number:
+          continue
+        pack_size = os.path.getsize(self._PackPath(pack_number))
+        if live_sizes.get(pack_number, 0) < pack_size * min_live_fraction:
+          packs_to_compact.add(pack_number)
+
+      if not packs_to_compact:
+        return 0
+
+      live_entries = {pack_number: [] for pack_number in packs_to_compact}
+      for blob_id, location in _IterIndex(index_map):
+        if location[0] in live_entries:
+          live_entries[location[0]].append((blob_id, location))
+
+      for pack_number in sorted(packs_to_compact):
+        self._CompactPack(pack_number, live_entries[pack_number])
+
+      with self._merge_lock:
+        self._MergeJournal()
+
+      with self._maps_lock:
+        for pack_number in packs_to_compact:
+          self._pack_maps.pop(pack_number, None)
+          os.remove(self._PackPath(pack_number))
+
+      return len(packs_to_compact)
+
+  def _CompactPack(self, pack_number, live_entries):
+    """Appends the live blobs of a pack to the current pack.
+
+    Args:
+      pack_number: A number of the pack to compact.
+      live_entries: A list of (blob id bytes, location) tuples of the index
+        entries pointing at the pack.
+    """
+    pack_map = self._GetPackMap(pack_number, 0)
+    if pack_map is None:
+      return
+
+    seq = None
+    for blob_id, location in live_entries:
+      _, offset, length = location
+      with self._write_lock:
+        # The blob might have been deleted since the index was read.
+        if self._Lookup(blob_id) != location:
+          continue
+        seq = self._AppendBlobs([(blob_id, pack_map[offset:offset + length])])
+
+    if seq is not None:
+      self._Sync(seq)
+
+  def Close(self):
+    """Syncs and closes all the files of the blob store."""
+    self._closing = True
+    self._merge_requested.set()
+    self._merge_thread.join()
+
+    with self._merge_lock, self._write_lock:
+      _Fsync(self._pack_file)
+      _Fsync(self._journal_file)
+      self._pack_file.close()
+      self._journal_file.close()
+
+    with self._maps_lock:
+      for pack_map in self._pack_maps.values():
+        pack_map.close()
+      self._pack_maps = {}
+
+    with self._index_lock:
+      if self._index_map is not None:
+        self._index_map.close()
+        self._index_map = None
+
+    # Releases the lock on the directory.
+    self._lock_file.close()
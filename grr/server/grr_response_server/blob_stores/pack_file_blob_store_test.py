@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+"""Tests for the pack file-based blob store."""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import os
+import threading
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_server import blob_store_test_mixin
+from grr_response_server.blob_stores import pack_file_blob_store
+from grr_response_server.rdfvalues import objects as rdf_objects
+from grr.test_lib import test_lib
+
+
+class PackFileBlobStoreTest(blob_store_test_mixin.BlobStoreTestMixin,
+                            test_lib.GRRBaseTest):
+
+  def CreateBlobStore(self):
+    bs = pack_file_blob_store.PackFileBlobStore(
+        path=os.path.join(self.temp_dir, "blobs"))
+    return (bs, bs.Close)
+
+
+class PackFileBlobStoreInternalsTest(test_lib.GRRBaseTest):
+
+  def setUp(self):
+    super(PackFileBlobStoreInternalsTest, self).setUp()
+    self.path = os.path.join(self.temp_dir, "blobs")
+    self.blob_store = self._Open()
+
+  def tearDown(self):
+    self.blob_store.Close()
+    super(PackFileBlobStoreInternalsTest, self).tearDown()
+
+  def _Open(self):
+    return pack_file_blob_store.PackFileBlobStore(
+        path=self.path, max_pack_size=4096, max_journal_entries=10)
+
+  def _Reopen(self):
+    self.blob_store.Close()
+    self.blob_store = self._Open()
+
+  def _Blobs(self, count):
+    blob_data = [(b"%03d" % i) * 100 for i in range(count)]
+    return {rdf_objects.BlobID.FromBlobData(data): data for data in blob_data}
+
+  def _PackFilenames(self):
+    return [name for name in os.listdir(self.path) if name.startswith("pack-")]
+
+  def testBlobsAreSplitIntoPacksAndIndexed(self):
+    blobs = self._Blobs(100)
+    self.blob_store.WriteBlobs(blobs)
+
+    self.assertGreater(len(self._PackFilenames()), 1)
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+    # Closing waits for the journal to be merged into the index.
+    self._Reopen()
+    self.assertTrue(os.path.exists(os.path.join(self.path, "index")))
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+  def testBlobsArePersisted(self):
+    blobs = self._Blobs(25)
+    self.blob_store.WriteBlobs(blobs)
+
+    self._Reopen()
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+  def testExistingBlobsAreNotWrittenAgain(self):
+    blobs = self._Blobs(5)
+    self.blob_store.WriteBlobs(blobs)
+    pack_size = os.path.getsize(os.path.join(self.path, "pack-00000001"))
+
+    self.blob_store.WriteBlobs(blobs)
+    self.assertEqual(
+        os.path.getsize(os.path.join(self.path, "pack-00000001")), pack_size)
+
+  def testConcurrentWritesAreAllCommitted(self):
+    blobs = self._Blobs(80)
+    blob_items = list(blobs.items())
+
+    def Write(i):
+      self.blob_store.WriteBlobs(dict(blob_items[i::8]))
+
+    threads = [threading.Thread(target=Write, args=(i,)) for i in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self._Reopen()
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+  def testTruncatedJournalEntryIsIgnored(self):
+    blobs = self._Blobs(3)
+    self.blob_store.WriteBlobs(blobs)
+    self.blob_store.Close()
+
+    with io.open(os.path.join(self.path, "journal"), "ab") as fd:
+      fd.write(b"\x00" * 7)
+
+    self.blob_store = self._Open()
+    other_blobs = self._Blobs(6)
+    self.blob_store.WriteBlobs(other_blobs)
+
+    self._Reopen()
+    self.assertEqual(self.blob_store.ReadBlobs(list(other_blobs)), other_blobs)
+
+  def testWritesAreNotBlockedByMerge(self):
+    blobs = self._Blobs(20)
+    blob_items = sorted(blobs.items())
+    self.blob_store.WriteBlobs(dict(blob_items[:9]))
+
+    merging = threading.Event()
+    release = threading.Event()
+    write_index = self.blob_store._WriteIndex
+
+    def BlockingWriteIndex():
+      merging.set()
+      self.assertTrue(release.wait(5))
+      write_index()
+
+    self.blob_store._WriteIndex = BlockingWriteIndex
+    # The tenth entry starts a merge.
+    merge_thread = threading.Thread(
+        target=self.blob_store.WriteBlobs, args=(dict(blob_items[9:10]),))
+    merge_thread.start()
+    self.assertTrue(merging.wait(5))
+
+    try:
+      self.blob_store.WriteBlobs(dict(blob_items[10:]))
+      self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+    finally:
+      release.set()
+      merge_thread.join()
+
+    self._Reopen()
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+  def testInterruptedMergeIsFinished(self):
+    blobs = self._Blobs(5)
+    self.blob_store.WriteBlobs(blobs)
+    self.blob_store.Close()
+
+    # A crash in the middle of a merge leaves the journal being merged behind.
+    os.rename(
+        os.path.join(self.path, "journal"),
+        os.path.join(self.path, "journal.merging"))
+
+    self.blob_store = self._Open()
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+    other_blobs = self._Blobs(20)
+    self.blob_store.WriteBlobs(other_blobs)
+
+    # Closing waits for the merge started by the write.
+    self._Reopen()
+    self.assertFalse(os.path.exists(os.path.join(self.path, "journal.merging")))
+    self.assertEqual(self.blob_store.ReadBlobs(list(other_blobs)), other_blobs)
+
+  def testJournalIsMergedOutsideOfWriters(self):
+    merge_threads = []
+    write_index = self.blob_store._WriteIndex
+
+    def RecordingWriteIndex():
+      merge_threads.append(threading.current_thread())
+      write_index()
+
+    self.blob_store._WriteIndex = RecordingWriteIndex
+    blobs = self._Blobs(20)
+    self.blob_store.WriteBlobs(blobs)
+
+    self._Reopen()
+    self.assertTrue(merge_threads)
+    self.assertNotIn(threading.current_thread(), merge_threads)
+    self.assertTrue(os.path.exists(os.path.join(self.path, "index")))
+    self.assertEqual(self.blob_store.ReadBlobs(list(blobs)), blobs)
+
+  def testDirectoryCannotBeOpenedTwice(self):
+    with self.assertRaises(pack_file_blob_store.StoreLockedError):
+      self._Open()
+
+    # The lock is released when the store is closed.
+    self._Reopen()
+    self.assertEqual(self.blob_store.CheckBlobsExist([]), {})
+
+  def testDeletedBlobsAreNotFound(self):
+    blobs = self._Blobs(25)
+    self.blob_store.WriteBlobs(blobs)
+
+    deleted_blob_ids = list(blobs)[:5]
+    self.blob_store.DeleteBlobs(deleted_blob_ids)
+    self._Reopen()
+
+    result = self.blob_store.CheckBlobsExist(list(blobs))
+    for blob_id in blobs:
+      self.assertEqual(result[blob_id], blob_id not in deleted_blob_ids)
+
+  def testCompactionReclaimsSpaceOfDeletedBlobs(self):
+    blobs = self._Blobs(100)
+    self.blob_store.WriteBlobs(blobs)
+    blob_ids = sorted(blobs)
+    self.blob_store.DeleteBlobs(blob_ids[:90])
+
+    def PacksSize():
+      return sum(
+          os.path.getsize(os.path.join(self.path, name))
+          for name in self._PackFilenames())
+
+    size_before = PacksSize()
+    self.assertGreater(self.blob_store.Compact(), 0)
+    self.assertLess(PacksSize(), size_before // 2)
+
+    self._Reopen()
+    live_blobs = {blob_id: blobs[blob_id] for blob_id in blob_ids[90:]}
+    self.assertEqual(self.blob_store.ReadBlobs(list(live_blobs)), live_blobs)
+    self.assertEqual(
+        self.blob_store.ReadBlobs(blob_ids[:90]),
+        {blob_id: None for blob_id in blob_ids[:90]})
+
+  def testCompactionWithoutDeletedBlobsDoesNothing(self):
+    self.blob_store.WriteBlobs(self._Blobs(100))
+    self.assertEqual(self.blob_store.Compact(), 0)
+
+
+if __name__ == "__main__":
+  flags.StartMain(test_lib.main)
@@ -7,6 +7,7 @@ from grr_response_core.lib.util import compatibility
 from grr_response_server import blob_store
 from grr_response_server.blob_stores import db_blob_store
 from grr_response_server.blob_stores import memory_stream_bs
+from grr_response_server.blob_stores import pack_file_blob_store
 
 
 def RegisterBlobStores():
@@ -15,3 +16,6 @@ def RegisterBlobStores():
   blob_store.REGISTRY[compatibility.GetName(
       memory_stream_bs
       .MemoryStreamBlobStore)] = memory_stream_bs.MemoryStreamBlobStore
+  blob_store.REGISTRY[compatibility.GetName(
+      pack_file_blob_store
+      .PackFileBlobStore)] = pack_file_blob_store.PackFileBlobStore
@@ -10,7 +10,6 @@ from __future__ import unicode_literals
 from builtins import map  # pylint: disable=redefined-builtin
 from builtins import range  # pylint: disable=redefined-builtin
 from future.utils import iteritems
-from future.utils import itervalues
 
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import utils
@@ -374,21 +373,10 @@ class ClientIndex(object):
 
     start_time, filtered_keywords = self._AnalyzeKeywords(keywords)
 
-    keyword_map = data_store.REL_DB.ListClientsForKeywords(
-        list(map(self._NormalizeKeyword, filtered_keywords)),
+    return data_store.REL_DB.ListClientsForAllKeywords(
+        set(map(self._NormalizeKeyword, filtered_keywords)),
         start_time=start_time)
 
-    results = itervalues(keyword_map)
-    relevant_set = set(next(results))
-
-    for hits in results:
-      relevant_set &= set(hits)
-
-      if not relevant_set:
-        return []
-
-    return sorted(relevant_set)
-
   def ReadClientPostingLists(self, keywords):
     """Looks up all clients associated with any of the given keywords.
 
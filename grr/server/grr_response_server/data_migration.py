@@ -4,10 +4,16 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import io
+import json
 from multiprocessing import pool
+import os
+import queue
 import sys
 import threading
+import time
 import traceback
+import zlib
 
 
 from future.utils import iteritems
@@ -98,9 +104,11 @@ def Migrate(thread_count=300):
   """Migrates clients from the legacy storage to the relational database.
 
   Args:
-    thread_count: A number of threads to execute thr migration with.
+    thread_count: A maximum number of threads to execute the migration with.
   """
-  ClientsMigrator().Execute(thread_count)
+  migration = ClientsShardedMigration()
+  migration.max_thread_count = thread_count
+  migration.Execute()
   UsersMigrator().Execute()
 
 
@@ -336,6 +344,78 @@ def ListVfses(client_urns):
   return vfs
 
 
+def _InitVfsUrns(vfs_urns, group_size):
+  """Writes initial path information for a list of VFS URNs."""
+  client_vfs_urns = dict()
+  for vfs_urn in vfs_urns:
+    client_id, _ = vfs_urn.Split(2)
+    client_vfs_urns.setdefault(client_id, []).append(vfs_urn)
+
+  groups = list()
+  groups.append([])
+  for urns in itervalues(client_vfs_urns):
+    if len(groups[-1]) + len(urns) > group_size:
+      groups.append([])
+    groups[-1].extend(urns)
+
+  for group in groups:
+    _InitVfsUrnGroup(group)
+
+
+def _InitVfsUrnGroup(vfs_urns):
+  """Writes initial path information for a group of VFS URNs."""
+  path_infos = dict()
+  for vfs_urn in vfs_urns:
+    client_id, vfs_path = vfs_urn.Split(2)
+    path_type, components = rdf_objects.ParseCategorizedPath(vfs_path)
+
+    path_info = rdf_objects.PathInfo(path_type=path_type, components=components)
+    path_infos.setdefault(client_id, []).append(path_info)
+
+  data_store.REL_DB.MultiInitPathInfos(path_infos)
+
+
+def _MigrateVfsUrns(vfs_urns, group_size):
+  """Migrates history of given list of VFS URNs."""
+  for group in collection.Batch(vfs_urns, group_size):
+    _MigrateVfsUrnGroup(group)
+
+
+def _MigrateVfsUrnGroup(vfs_urns):
+  """Migrates history of given group of VFS URNs."""
+  client_path_histories = dict()
+
+  for fd in aff4.FACTORY.MultiOpen(vfs_urns, age=aff4.ALL_TIMES):
+    client_id, vfs_path = fd.urn.Split(2)
+    path_type, components = rdf_objects.ParseCategorizedPath(vfs_path)
+
+    client_path = db.ClientPath(client_id, path_type, components)
+    client_path_history = db.ClientPathHistory()
+
+    for stat_entry in fd.GetValuesForAttribute(fd.Schema.STAT):
+      client_path_history.AddStatEntry(stat_entry.age, stat_entry)
+
+    for hash_entry in fd.GetValuesForAttribute(fd.Schema.HASH):
+      client_path_history.AddHashEntry(hash_entry.age, hash_entry)
+
+    client_path_histories[client_path] = client_path_history
+
+  data_store.REL_DB.MultiWritePathHistory(client_path_histories)
+
+
+def _MigrateBlobBatch(blob_urns):
+  """Migrates a batch of blobs."""
+  blobs = {}
+  for stream in aff4.FACTORY.MultiOpen(
+      blob_urns, mode="r", aff4_type=aff4.AFF4UnversionedMemoryStream):
+    if stream.size > 0:
+      content_bytes = stream.Read(stream.size)
+      bid = rdf_objects.BlobID.FromBlobData(content_bytes)
+      blobs[bid] = content_bytes
+
+  data_store.REL_DB.WriteBlobs(blobs)
+
+
 class ClientVfsMigrator(object):
   """A class used to migrate VFS to relational database.
 
@@ -422,11 +502,11 @@ class ClientVfsMigrator(object):
       list_vfs_duration = rdfvalue.RDFDatetime.Now() - now
 
       now = rdfvalue.RDFDatetime.Now()
-      self._InitVfsUrns(vfs_urns)
+      _InitVfsUrns(vfs_urns, self.init_vfs_group_size)
       init_vfs_duration = rdfvalue.RDFDatetime.Now() - now
 
       now = rdfvalue.RDFDatetime.Now()
-      self._MigrateVfsUrns(vfs_urns)
+      _MigrateVfsUrns(vfs_urns, self.history_vfs_group_size)
       migrate_vfs_duration = rdfvalue.RDFDatetime.Now() - now
 
       self._client_urns_migrated.extend(client_urns)
@@ -466,63 +546,6 @@ class ClientVfsMigrator(object):
         init_vfs_duration=init_vfs_duration,
         migrate_vfs_duration=migrate_vfs_duration))
 
-  def _InitVfsUrns(self, vfs_urns):
-    """Writes initial path information for a list of VFS URNs."""
-    client_vfs_urns = dict()
-    for vfs_urn in vfs_urns:
-      client_id, _ = vfs_urn.Split(2)
-      client_vfs_urns.setdefault(client_id, []).append(vfs_urn)
-
-    groups = list()
-    groups.append([])
-    for urns in itervalues(client_vfs_urns):
-      if len(groups[-1]) + len(urns) > self.init_vfs_group_size:
-        groups.append([])
-      groups[-1].extend(urns)
-
-    for group in groups:
-      self._InitVfsUrnGroup(group)
-
-  def _InitVfsUrnGroup(self, vfs_urns):
-    """Writes initial path information for a group of VFS URNs."""
-    path_infos = dict()
-    for vfs_urn in vfs_urns:
-      client_id, vfs_path = vfs_urn.Split(2)
-      path_type, components = rdf_objects.ParseCategorizedPath(vfs_path)
-
-      path_info = rdf_objects.PathInfo(
-          path_type=path_type, components=components)
-      path_infos.setdefault(client_id, []).append(path_info)
-
-    data_store.REL_DB.MultiInitPathInfos(path_infos)
-
-  def _MigrateVfsUrns(self, vfs_urns):
-    """Migrates history of given list of VFS URNs."""
-    for group in collection.Batch(vfs_urns, self.history_vfs_group_size):
-      self._MigrateVfsUrnGroup(group)
-
-  def _MigrateVfsUrnGroup(self, vfs_urns):
-    """Migrates history of given group of VFS URNs."""
-    client_path_histories = dict()
-
-    for fd in aff4.FACTORY.MultiOpen(vfs_urns, age=aff4.ALL_TIMES):
-      client_id, vfs_path = fd.urn.Split(2)
-      path_type, components = rdf_objects.ParseCategorizedPath(vfs_path)
-
-      client_path = db.ClientPath(client_id, path_type, components)
-      client_path_history = db.ClientPathHistory()
-
-      for stat_entry in fd.GetValuesForAttribute(fd.Schema.STAT):
-        client_path_history.AddStatEntry(stat_entry.age, stat_entry)
-
-      for hash_entry in fd.GetValuesForAttribute(fd.Schema.HASH):
-        client_path_history.AddHashEntry(hash_entry.age, hash_entry)
-
-      client_path_histories[client_path] = client_path_history
-
-    data_store.REL_DB.MultiWritePathHistory(client_path_histories)
-
-
 class BlobsMigrator(object):
   """Blob store migrator."""
 
@@ -535,16 +558,7 @@ class BlobsMigrator(object):
 
   def _MigrateBatch(self, batch):
     """Migrates a batch of blobs."""
-
-    blobs = {}
-    for stream in aff4.FACTORY.MultiOpen(
-        batch, mode="r", aff4_type=aff4.AFF4UnversionedMemoryStream):
-      if stream.size > 0:
-        content_bytes = stream.Read(stream.size)
-        bid = rdf_objects.BlobID.FromBlobData(content_bytes)
-        blobs[bid] = content_bytes
-
-    data_store.REL_DB.WriteBlobs(blobs)
+    _MigrateBlobBatch(batch)
 
     with self._lock:
       self._migrated_count += len(batch)
@@ -594,3 +608,414 @@ class BlobsMigrator(object):
       message = "Not all blobs have been migrated ({}/{})".format(
           self._migrated_count, self._total_count)
       raise AssertionError(message)
+
+
+class MigrationCheckpoint(object):
+  """Persisted progress of a single shard of a sharded migration.
+
+  Keys of a shard are migrated in sorted order. The watermark is the greatest
+  key such that it and all the smaller keys of the shard have been migrated,
+  so a resumed migration only has to process keys greater than it.
+
+  Attributes:
+    path: A path of the file the checkpoint is stored in or `None` if the
+      checkpoint should not be persisted.
+    watermark: The greatest migrated key or `None` if nothing was migrated.
+    migrated_count: A number of keys migrated up to the watermark.
+  """
+
+  def __init__(self, path=None):
+    self.path = path
+    self.watermark = None
+    self.migrated_count = 0
+
+  @classmethod
+  def Load(cls, path):
+    """Reads the checkpoint from given path, returns an empty one if absent."""
+    checkpoint = cls(path)
+    if path is not None and os.path.exists(path):
+      with io.open(path, "r", encoding="utf-8") as fd:
+        data = json.load(fd)
+      checkpoint.watermark = data["watermark"]
+      checkpoint.migrated_count = data["migrated_count"]
+    return checkpoint
+
+  def Save(self):
+    """Atomically writes the checkpoint to its file."""
+    if self.path is None:
+      return
+
+    data = json.dumps({
+        "watermark": self.watermark,
+        "migrated_count": self.migrated_count,
+    })
+
+    tmp_path = self.path + ".tmp"
+    with io.open(tmp_path, "w", encoding="utf-8") as fd:
+      fd.write(utils.SmartUnicode(data))
+      fd.flush()
+      os.fsync(fd.fileno())
+    os.rename(tmp_path, self.path)
+
+
+class AdaptiveConcurrencyLimiter(object):
+  """Limits the number of batches migrated concurrently based on latency.
+
+  The limit starts at the minimum and grows by one with every batch completed
+  in a time close to the best one seen so far. When the (smoothed) latency of
+  a batch exceeds `latency_tolerance` times the best one, the data stores are
+  assumed to be saturated and the limit is cut by a quarter.
+
+  Attributes:
+    limit: A current number of batches that can be migrated concurrently.
+  """
+
+  _SMOOTHING = 0.2
+
+  def __init__(self, min_limit, max_limit, latency_tolerance=2.0):
+    if min_limit < 1:
+      raise ValueError("Minimum limit must be positive: %d" % min_limit)
+    if max_limit < min_limit:
+      raise ValueError("Maximum limit %d is lower than the minimum %d" %
+                       (max_limit, min_limit))
+
+    self.limit = min_limit
+    self._min_limit = min_limit
+    self._max_limit = max_limit
+    self._latency_tolerance = latency_tolerance
+
+    self._active = 0
+    self._latency = None
+    self._best_latency = None
+    # Number of batches that were in flight at the moment of the last limit
+    # decrease. Their latencies still reflect the old limit.
+    self._cooldown = 0
+    self._condition = threading.Condition()
+
+  def Acquire(self):
+    """Blocks until another batch can be migrated."""
+    with self._condition:
+      while self._active >= self.limit:
+        self._condition.wait()
+      self._active += 1
+
+  def Release(self, latency):
+    """Marks a batch as done and adjusts the limit.
+
+    Args:
+      latency: Time (in seconds) it took to migrate a single key of the batch.
+    """
+    with self._condition:
+      self._active -= 1
+
+      if self._latency is None:
+        self._latency = latency
+      else:
+        self._latency += self._SMOOTHING * (latency - self._latency)
+      if self._best_latency is None or self._latency < self._best_latency:
+        self._best_latency = self._latency
+
+      if self._cooldown > 0:
+        self._cooldown -= 1
+      elif self._latency > self._best_latency * self._latency_tolerance:
+        self.limit = max(self._min_limit, self.limit * 3 // 4)
+        self._cooldown = self._active
+      else:
+        self.limit = min(self._max_limit, self.limit + 1)
+
+      self._condition.notify_all()
+
+
+class ShardedMigration(object):
+  """Base class for resumable migrations that can run in multiple processes.
+
+  Keys to migrate are split into `shard_count` shards, so that every shard can
+  be migrated by a separate process. Within a process keys of the shard are
+  migrated in batches by a pool of threads whose concurrency is controlled by
+  an `AdaptiveConcurrencyLimiter`. Progress of every shard is recorded in its
+  own checkpoint file, so that a failed or interrupted migration can be resumed
+  by running it again with the same shard parameters.
+
+  Subclasses have to define the `name` of the migration and implement
+  `_ListKeys` and `_MigrateBatch`. Migrating a batch has to be idempotent.
+
+  Attributes:
+    batch_size: A number of keys migrated together.
+    min_thread_count: A minimum number of batches migrated concurrently.
+    max_thread_count: A maximum number of batches migrated concurrently.
+    latency_tolerance: See `AdaptiveConcurrencyLimiter`.
+  """
+
+  name = None
+
+  def __init__(self, checkpoint_dir=None, shard_number=1, shard_count=1):
+    """Initializes the migration.
+
+    Args:
+      checkpoint_dir: A directory to store checkpoint files in. If `None`, the
+        progress is not persisted.
+      shard_number: A number (starting from 1) of the shard to migrate.
+      shard_count: A total number of shards.
+
+    Raises:
+      ValueError: If shard number is not within the shard count.
+    """
+    if not 1 <= shard_number <= shard_count:
+      raise ValueError("Invalid shard number %d (shard count: %d)" %
+                       (shard_number, shard_count))
+
+    self.batch_size = 200
+    self.min_thread_count = 4
+    self.max_thread_count = 300
+    self.latency_tolerance = 2.0
+
+    self._checkpoint_dir = checkpoint_dir
+    self._shard_number = shard_number
+    self._shard_count = shard_count
+
+    self._lock = threading.Lock()
+    self._batches = []
+    self._done_batch_indices = set()
+    self._next_batch_index = 0
+    self._failed_count = 0
+    self._checkpoint = None
+    self._limiter = None
+
+    self._total_count = 0
+    self._migrated_count = 0
+    self._start_time = None
+    self._last_progress_time = None
+
+  def _ListKeys(self):
+    """Returns all the keys (unicode strings) to migrate."""
+    raise NotImplementedError()
+
+  def _MigrateBatch(self, keys):
+    """Migrates a batch of keys to the relational database."""
+    raise NotImplementedError()
+
+  def _GetShardIndex(self, key):
+    """Returns a stable integer used to assign the key to a shard."""
+    return zlib.crc32(utils.SmartStr(key)) & 0xffffffff
+
+  def _CheckpointPath(self):
+    if self._checkpoint_dir is None:
+      return None
+    filename = "{}-{}-of-{}.json".format(self.name, self._shard_number,
+                                        self._shard_count)
+    return os.path.join(self._checkpoint_dir, filename)
+
+  def Execute(self):
+    """Migrates all the keys of the shard not migrated yet.
+
+    Raises:
+      RuntimeError: If some of the batches failed to migrate.
+      ValueError: If the relational database backend is not available.
+    """
+    if not data_store.RelationalDBWriteEnabled():
+      raise ValueError("No relational database available.")
+
+    self._checkpoint = MigrationCheckpoint.Load(self._CheckpointPath())
+    if self._checkpoint.watermark is not None:
+      sys.stdout.write("Resuming {} migration after {} migrated keys\n".format(
+          self.name, self._checkpoint.migrated_count))
+
+    sys.stdout.write("Collecting keys...\n")
+    keys = []
+    for key in self._ListKeys():
+      if self._GetShardIndex(key) % self._shard_count != self._shard_number - 1:
+        continue
+      if (self._checkpoint.watermark is not None and
+          key <= self._checkpoint.watermark):
+        continue
+      keys.append(key)
+    keys.sort()
+
+    self._batches = list(collection.Batch(keys, self.batch_size))
+    self._done_batch_indices = set()
+    self._next_batch_index = 0
+    self._failed_count = 0
+    self._limiter = AdaptiveConcurrencyLimiter(
+        min(self.min_thread_count, self.max_thread_count),
+        self.max_thread_count,
+        latency_tolerance=self.latency_tolerance)
+
+    self._total_count = len(keys)
+    self._migrated_count = 0
+    self._start_time = rdfvalue.RDFDatetime.Now()
+    self._last_progress_time = None
+
+    sys.stdout.write("Keys to migrate: {}\n".format(self._total_count))
+
+    batch_queue = queue.Queue()
+    for index in range(len(self._batches)):
+      batch_queue.put(index)
+
+    thread_count = min(self.max_thread_count, len(self._batches))
+    threads = [
+        threading.Thread(target=self._Run, args=(batch_queue,))
+        for _ in range(thread_count)
+    ]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    with self._lock:
+      self._Progress()
+
+    if self._failed_count:
+      message = "\nFailed to migrate {} batches ({}/{} keys migrated)".format(
+          self._failed_count, self._migrated_count, self._total_count)
+      raise RuntimeError(message)
+
+    message = "\nMigration has been finished (migrated {} keys).\n".format(
+        self._migrated_count)
+    sys.stdout.write(message)
+
+  def _Run(self, batch_queue):
+    """Migrates batches from the queue until it is empty."""
+    while True:
+      try:
+        index = batch_queue.get_nowait()
+      except queue.Empty:
+        return
+
+      batch = self._batches[index]
+      self._limiter.Acquire()
+      start = time.time()
+      try:
+        self._MigrateBatch(batch)
+      except Exception:  # pylint: disable=broad-except
+        sys.stderr.write("Failed to migrate batch: {}\n".format(batch))
+        traceback.print_exc()
+        with self._lock:
+          self._failed_count += 1
+        continue
+      finally:
+        self._limiter.Release((time.time() - start) / len(batch))
+
+      self._BatchDone(index)
+
+  def _BatchDone(self, index):
+    """Records a migrated batch and advances the checkpoint if possible."""
+    with self._lock:
+      self._migrated_count += len(self._batches[index])
+      self._done_batch_indices.add(index)
+
+      advanced = False
+      while self._next_batch_index in self._done_batch_indices:
+        self._done_batch_indices.remove(self._next_batch_index)
+        batch = self._batches[self._next_batch_index]
+        self._checkpoint.watermark = batch[-1]
+        self._checkpoint.migrated_count += len(batch)
+        self._next_batch_index += 1
+        advanced = True
+
+      if advanced:
+        self._checkpoint.Save()
+
+      if (self._last_progress_time is None or
+          rdfvalue.RDFDatetime.Now() - self._last_progress_time >=
+          _PROGRESS_INTERVAL):
+        self._Progress()
+
+  def _Progress(self):
+    """Prints the migration progress with the estimated time left."""
+    elapsed = rdfvalue.RDFDatetime.Now() - self._start_time
+    if elapsed.seconds > 0:
+      kps = self._migrated_count / elapsed.seconds
+    else:
+      kps = 0.0
+
+    if self._total_count:
+      fraction = self._migrated_count / self._total_count
+    else:
+      fraction = 1.0
+
+    if kps > 0:
+      remaining = self._total_count - self._migrated_count
+      eta = rdfvalue.Duration.FromSeconds(int(remaining / kps))
+    else:
+      eta = "unknown"
+
+    message = ("\rMigrating {}... {:>9}/{} ({:.2%}, kps: {:.2f}, threads: {}, "
+               "eta: {})".format(self.name, self._migrated_count,
+                                 self._total_count, fraction, kps,
+                                 self._limiter.limit, eta))
+    sys.stdout.write(message)
+    sys.stdout.flush()
+
+    self._last_progress_time = rdfvalue.RDFDatetime.Now()
+
+
+class ClientsShardedMigration(ShardedMigration):
+  """A resumable migration of all clients to the relational database.
+
+  Clients are assigned to shards the same way `ClientVfsShardedMigration` does
+  it, so that both migrations of a client run in the same shard.
+  """
+
+  name = "clients"
+
+  def __init__(self, *args, **kwargs):
+    super(ClientsShardedMigration, self).__init__(*args, **kwargs)
+    self.batch_size = _CLIENT_BATCH_SIZE
+
+  def _ListKeys(self):
+    return [client_urn.Basename() for client_urn in _GetClientUrns()]
+
+  def _GetShardIndex(self, key):
+    return int(key[2:], 16)
+
+  def _MigrateBatch(self, keys):
+    client_urns = [rdf_client.ClientURN(key) for key in keys]
+    for client in aff4.FACTORY.MultiOpen(
+        client_urns, mode="r", age=aff4.ALL_TIMES):
+      _WriteClient(client)
+
+
+class ClientVfsShardedMigration(ShardedMigration):
+  """A resumable migration of VFS of all clients to the relational database.
+
+  Clients are assigned to shards the same way `ClientVfsMigrator` does it.
+
+  Attributes:
+    init_vfs_group_size: See `ClientVfsMigrator`.
+    history_vfs_group_size: See `ClientVfsMigrator`.
+  """
+
+  name = "client_vfs"
+
+  def __init__(self, *args, **kwargs):
+    super(ClientVfsShardedMigration, self).__init__(*args, **kwargs)
+    self.init_vfs_group_size = 30000
+    self.history_vfs_group_size = 10000
+
+  def _ListKeys(self):
+    return [client_urn.Basename() for client_urn in _GetClientUrns()]
+
+  def _GetShardIndex(self, key):
+    return int(key[2:], 16)
+
+  def _MigrateBatch(self, keys):
+    vfs_urns = ListVfses([rdf_client.ClientURN(key) for key in keys])
+    _InitVfsUrns(vfs_urns, self.init_vfs_group_size)
+    _MigrateVfsUrns(vfs_urns, self.history_vfs_group_size)
+
+
+class BlobsShardedMigration(ShardedMigration):
+  """A resumable migration of the AFF4 blob store to the relational database."""
+
+  name = "blobs"
+
+  def __init__(self, *args, **kwargs):
+    super(BlobsShardedMigration, self).__init__(*args, **kwargs)
+    self.batch_size = _BLOB_BATCH_SIZE
+
+  def _ListKeys(self):
+    return [urn.Basename() for urn in aff4.FACTORY.ListChildren("aff4:/blobs")]
+
+  def _MigrateBatch(self, keys):
+    blobs_urn = rdfvalue.RDFURN("aff4:/blobs")
+    _MigrateBlobBatch([blobs_urn.Add(key) for key in keys])
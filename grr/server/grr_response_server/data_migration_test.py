@@ -2,8 +2,11 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import os
+import threading
 
 from future.builtins import map
+from future.utils import iteritems
 import mock
 
 from grr_response_core.lib import flags
@@ -376,5 +379,207 @@ class BlobStoreMigratorTest(test_lib.GRRBaseTest):
     self.assertEqual(contents, blob_contents_2)
 
 
+class MigrationCheckpointTest(test_lib.GRRBaseTest):
+
+  def testMissingFileGivesEmptyCheckpoint(self):
+    path = os.path.join(self.temp_dir, "missing.json")
+    checkpoint = data_migration.MigrationCheckpoint.Load(path)
+    self.assertIsNone(checkpoint.watermark)
+    self.assertEqual(checkpoint.migrated_count, 0)
+
+  def testSaveAndLoad(self):
+    path = os.path.join(self.temp_dir, "checkpoint.json")
+    checkpoint = data_migration.MigrationCheckpoint(path)
+    checkpoint.watermark = "C.0000000000000042"
+    checkpoint.migrated_count = 42
+    checkpoint.Save()
+
+    checkpoint = data_migration.MigrationCheckpoint.Load(path)
+    self.assertEqual(checkpoint.watermark, "C.0000000000000042")
+    self.assertEqual(checkpoint.migrated_count, 42)
+
+
+class AdaptiveConcurrencyLimiterTest(test_lib.GRRBaseTest):
+
+  def testLimitGrowsWhileLatencyIsStable(self):
+    limiter = data_migration.AdaptiveConcurrencyLimiter(2, 5)
+    for _ in range(10):
+      limiter.Acquire()
+      limiter.Release(1.0)
+    self.assertEqual(limiter.limit, 5)
+
+  def testLimitShrinksWhenLatencyGrows(self):
+    limiter = data_migration.AdaptiveConcurrencyLimiter(2, 8)
+    for _ in range(10):
+      limiter.Acquire()
+      limiter.Release(1.0)
+    self.assertEqual(limiter.limit, 8)
+
+    for _ in range(10):
+      limiter.Acquire()
+      limiter.Release(10.0)
+    self.assertEqual(limiter.limit, 2)
+
+  def testInvalidLimitsRaise(self):
+    with self.assertRaises(ValueError):
+      data_migration.AdaptiveConcurrencyLimiter(0, 5)
+    with self.assertRaises(ValueError):
+      data_migration.AdaptiveConcurrencyLimiter(5, 4)
+
+
+class _FakeShardedMigration(data_migration.ShardedMigration):
+
+  name = "fake"
+
+  def __init__(self, keys, failing_keys=(), *args, **kwargs):
+    super(_FakeShardedMigration, self).__init__(*args, **kwargs)
+    self.batch_size = 3
+    self.max_thread_count = 4
+
+    self.keys = keys
+    self.failing_keys = set(failing_keys)
+    self.migrated_keys = []
+    self._keys_lock = threading.Lock()
+
+  def _ListKeys(self):
+    return self.keys
+
+  def _MigrateBatch(self, keys):
+    if self.failing_keys.intersection(keys):
+      raise IOError("Failed to migrate {}".format(keys))
+    with self._keys_lock:
+      self.migrated_keys.extend(keys)
+
+
+class ShardedMigrationTest(test_lib.GRRBaseTest):
+
+  KEYS = ["key{:02d}".format(i) for i in range(20)]
+
+  def testMigratesAllKeys(self):
+    migration = _FakeShardedMigration(self.KEYS)
+    migration.Execute()
+    self.assertItemsEqual(migration.migrated_keys, self.KEYS)
+
+  def testShardsAreDisjoint(self):
+    migrated_keys = []
+    for i in range(3):
+      migration = _FakeShardedMigration(
+          self.KEYS, shard_number=(i + 1), shard_count=3)
+      migration.Execute()
+      migrated_keys.extend(migration.migrated_keys)
+
+    self.assertItemsEqual(migrated_keys, self.KEYS)
+
+  def testInvalidShardNumberRaises(self):
+    with self.assertRaises(ValueError):
+      _FakeShardedMigration(self.KEYS, shard_number=4, shard_count=3)
+
+  def testResumesAfterLastContiguousMigratedBatch(self):
+    migration = _FakeShardedMigration(
+        self.KEYS, failing_keys=["key07"], checkpoint_dir=self.temp_dir)
+    with self.assertRaises(RuntimeError):
+      migration.Execute()
+    self.assertNotIn("key07", migration.migrated_keys)
+
+    checkpoint = data_migration.MigrationCheckpoint.Load(
+        os.path.join(self.temp_dir, "fake-1-of-1.json"))
+    self.assertEqual(checkpoint.watermark, "key05")
+    self.assertEqual(checkpoint.migrated_count, 6)
+
+    migration = _FakeShardedMigration(self.KEYS, checkpoint_dir=self.temp_dir)
+    migration.Execute()
+    self.assertItemsEqual(migration.migrated_keys, self.KEYS[6:])
+
+    checkpoint = data_migration.MigrationCheckpoint.Load(
+        os.path.join(self.temp_dir, "fake-1-of-1.json"))
+    self.assertEqual(checkpoint.watermark, "key19")
+    self.assertEqual(checkpoint.migrated_count, 20)
+
+  def testCompletedMigrationIsNotRepeated(self):
+    migration = _FakeShardedMigration(self.KEYS, checkpoint_dir=self.temp_dir)
+    migration.Execute()
+
+    migration = _FakeShardedMigration(self.KEYS, checkpoint_dir=self.temp_dir)
+    migration.Execute()
+    self.assertEqual(migration.migrated_keys, [])
+
+
+class ClientsShardedMigrationTest(test_lib.GRRBaseTest):
+
+  def testMigratesAllShards(self):
+    client_ids = ["C.%016x" % i for i in range(13)]
+
+    for client_id in client_ids:
+      with aff4.FACTORY.Create(
+          client_id,
+          aff4_type=aff4_grr.VFSGRRClient,
+          mode="w",
+          token=self.token) as fd:
+        fd.Set(fd.Schema.OS_RELEASE("release-%s" % client_id))
+        fd.Set(fd.Schema.FIRST_SEEN(rdfvalue.RDFDatetime.FromSecondsSinceEpoch(
+            42)))
+
+    for i in range(2):
+      migration = data_migration.ClientsShardedMigration(
+          checkpoint_dir=self.temp_dir, shard_number=(i + 1), shard_count=2)
+      migration.batch_size = 4
+      migration.Execute()
+
+    for client_id in client_ids:
+      metadata = data_store.REL_DB.ReadClientMetadata(client_id)
+      self.assertEqual(metadata.first_seen,
+                       rdfvalue.RDFDatetime.FromSecondsSinceEpoch(42))
+
+      snapshot = data_store.REL_DB.ReadClientSnapshot(client_id)
+      self.assertEqual(snapshot.os_release, "release-%s" % client_id)
+
+
+class ClientVfsShardedMigrationTest(test_lib.GRRBaseTest):
+
+  def testMigratesAllShards(self):
+    client_urns = list(map(self.SetupClient, range(13)))
+
+    for client_urn in client_urns:
+      with aff4.FACTORY.Open(
+          client_urn.Add("fs/os").Add("foo/bar"),
+          aff4_type=aff4_grr.VFSFile,
+          mode="w",
+          token=self.token) as fd:
+        fd.Set(fd.Schema.HASH, rdf_crypto.Hash(md5=b"quux"))
+
+    for i in range(2):
+      migration = data_migration.ClientVfsShardedMigration(
+          checkpoint_dir=self.temp_dir, shard_number=(i + 1), shard_count=2)
+      migration.batch_size = 4
+      migration.Execute()
+
+    for client_urn in client_urns:
+      path_info = data_store.REL_DB.ReadPathInfo(
+          client_id=client_urn.Basename(),
+          path_type=rdf_objects.PathInfo.PathType.OS,
+          components=("foo", "bar"))
+      self.assertEqual(path_info.hash_entry.md5, b"quux")
+
+
+class BlobsShardedMigrationTest(test_lib.GRRBaseTest):
+
+  def testBlobsAreCorrectlyMigrated(self):
+    mem_bs = memory_stream_bs.MemoryStreamBlobStore()
+    db_bs = db_blob_store.DbBlobStore()
+
+    blob_hashes = {}
+    for i in range(5):
+      contents = (b"%d" % i) * 1024
+      blob_hashes[mem_bs.WriteBlobWithUnknownHash(contents)] = contents
+
+    migration = data_migration.BlobsShardedMigration(
+        checkpoint_dir=self.temp_dir)
+    migration.batch_size = 2
+    migration.Execute()
+
+    for blob_hash, contents in iteritems(blob_hashes):
+      self.assertEqual(db_bs.ReadBlob(blob_hash), contents)
+
+
 if __name__ == "__main__":
   flags.StartMain(test_lib.main)
@@ -284,6 +284,23 @@ class MutationPool(object):
         timestamp=timestamp,
         replace=True)
 
+  def CollectionAddOffsetIndex(self, collection_id, index, timestamp, suffix):
+    self.Set(
+        collection_id.Add(DataStore.COLLECTION_OFFSET_INDEX_SUBPATH).Add(
+            "%016x" % index),
+        DataStore.COLLECTION_OFFSET_INDEX_ATTRIBUTE,
+        "%06x" % suffix,
+        timestamp=timestamp,
+        replace=True)
+
+  def CollectionSetOffsetIndexLength(self, collection_id, length):
+    self.Set(
+        collection_id,
+        DataStore.COLLECTION_OFFSET_INDEX_LENGTH_ATTRIBUTE,
+        "%016x" % length,
+        timestamp=0,
+        replace=True)
+
   def CollectionAddStoredTypeIndex(self, collection_id, stored_type):
     self.Set(
         collection_id,
@@ -298,6 +315,15 @@ class MutationPool(object):
       if self.Size() > 50000:
         self.Flush()
 
+    for subject, _, _ in DB.ScanAttribute(
+        unicode(collection_id.Add(DataStore.COLLECTION_OFFSET_INDEX_SUBPATH)),
+        DataStore.COLLECTION_OFFSET_INDEX_ATTRIBUTE):
+      self.DeleteSubject(subject)
+      if self.Size() > 50000:
+        self.Flush()
+    self.DeleteAttributes(collection_id,
+                          [DataStore.COLLECTION_OFFSET_INDEX_LENGTH_ATTRIBUTE])
+
   def QueueAddItem(self, queue_id, item, timestamp):
     result_subject, timestamp, _ = DataStore.CollectionMakeURN(
         queue_id, timestamp, suffix=None, subpath="Records")
@@ -1350,6 +1376,15 @@ class DataStore(with_metaclass(registry.MetaclassRegistry, object)):
   # suffix is stored as the value.
   COLLECTION_INDEX_ATTRIBUTE_PREFIX = "index:sc_"
 
+  # Unlike the index above, the offset index has an entry for every record. The
+  # entry for record number i is stored in the subject
+  # <collection_id>/OffsetIndex/<i> at the timestamp of the record, with the
+  # timestamp suffix as the value. Its length, the number of leading records
+  # that have an entry, is stored in the collection itself.
+  COLLECTION_OFFSET_INDEX_SUBPATH = "OffsetIndex"
+  COLLECTION_OFFSET_INDEX_ATTRIBUTE = "index:offset"
+  COLLECTION_OFFSET_INDEX_LENGTH_ATTRIBUTE = "index:offset_length"
+
   # The attribute prefix to use when storing the index of stored types
   # for multi type collections.
   COLLECTION_VALUE_TYPE_PREFIX = "aff4:value_type_"
@@ -1383,6 +1418,32 @@ class DataStore(with_metaclass(registry.MetaclassRegistry, object)):
                           after_timestamp=None,
                           after_suffix=None,
                           limit=None):
+    for serialized_rdf_value, timestamp, suffix in self.CollectionScanRawItems(
+        collection_id,
+        after_timestamp=after_timestamp,
+        after_suffix=after_suffix,
+        limit=limit):
+      item = rdf_type.FromSerializedString(serialized_rdf_value)
+      item.age = timestamp
+      yield (item, timestamp, suffix)
+
+  def CollectionScanRawItems(self,
+                             collection_id,
+                             after_timestamp=None,
+                             after_suffix=None,
+                             limit=None):
+    """Scans collection items without decoding them.
+
+    Args:
+      collection_id: ID of the collection to scan.
+      after_timestamp: If set, only items stored after this timestamp are
+        returned.
+      after_suffix: The suffix refining after_timestamp.
+      limit: The maximum number of items to return.
+
+    Yields:
+      Tuples (serialized_rdf_value, timestamp, suffix).
+    """
     precondition.AssertType(collection_id, rdfvalue.RDFURN)
 
     after_urn = None
@@ -1398,11 +1459,9 @@ class DataStore(with_metaclass(registry.MetaclassRegistry, object)):
         self.COLLECTION_ATTRIBUTE,
         after_urn=after_urn,
         max_records=limit):
-      item = rdf_type.FromSerializedString(serialized_rdf_value)
-      item.age = timestamp
       # The urn is timestamp.suffix where suffix is 6 hex digits.
       suffix = int(str(subject)[-6:], 16)
-      yield (item, timestamp, suffix)
+      yield (serialized_rdf_value, timestamp, suffix)
 
   def CollectionReadIndex(self, collection_id):
     """Reads all index entries for the given collection.
@@ -1419,6 +1478,32 @@ class DataStore(with_metaclass(registry.MetaclassRegistry, object)):
       i = int(attr[len(self.COLLECTION_INDEX_ATTRIBUTE_PREFIX):], 16)
       yield (i, ts, int(value, 16))
 
+  def CollectionReadOffsetIndex(self, collection_id, index):
+    """Reads the offset index entry of a single record.
+
+    Args:
+      collection_id: ID of the collection.
+      index: The record number.
+
+    Returns:
+      A pair (timestamp, suffix) identifying the record or None if the offset
+      index has no entry for it.
+    """
+    value, ts = self.Resolve(
+        collection_id.Add(self.COLLECTION_OFFSET_INDEX_SUBPATH).Add(
+            "%016x" % index), self.COLLECTION_OFFSET_INDEX_ATTRIBUTE)
+    if value is None:
+      return None
+    return ts, int(value, 16)
+
+  def CollectionReadOffsetIndexLength(self, collection_id):
+    """Returns the number of leading records that have an offset index entry."""
+    value, _ = self.Resolve(collection_id,
+                            self.COLLECTION_OFFSET_INDEX_LENGTH_ATTRIBUTE)
+    if value is None:
+      return 0
+    return int(value, 16)
+
   def CollectionReadStoredTypes(self, collection_id):
     for attribute, _, _ in self.ResolveRow(collection_id):
       if attribute.startswith(self.COLLECTION_VALUE_TYPE_PREFIX):
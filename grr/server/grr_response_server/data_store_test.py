@@ -1329,8 +1329,11 @@ class DataStoreTestMixin(object):
     api = [
         "CheckRequestsForCompletion",
         "CollectionReadIndex",
+        "CollectionReadOffsetIndex",
+        "CollectionReadOffsetIndexLength",
         "CollectionReadStoredTypes",
         "CollectionScanItems",
+        "CollectionScanRawItems",
         "CreateNotifications",
         "DBSubjectLock",
         "DeleteAttributes",
@@ -1367,7 +1370,9 @@ class DataStoreTestMixin(object):
     pool_api = [
         "CollectionAddIndex",
         "CollectionAddItem",
+        "CollectionAddOffsetIndex",
         "CollectionAddStoredTypeIndex",
+        "CollectionSetOffsetIndexLength",
         "CreateNotifications",
         "DeleteAttributes",
         "DeleteSubject",
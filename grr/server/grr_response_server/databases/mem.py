@@ -10,6 +10,7 @@ import threading
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import utils
 from grr_response_server import db
+from grr_response_server import posting_lists
 from grr_response_server.databases import mem_artifacts
 from grr_response_server.databases import mem_blobs
 from grr_response_server.databases import mem_clients
@@ -54,7 +55,7 @@ class InMemoryDB(mem_artifacts.InMemoryDBArtifactsMixin,
     self.cronjobs = {}
     self.events = []
     self.foreman_rules = []
-    self.keywords = {}
+    self.keywords = posting_lists.KeywordIndex()
     self.labels = {}
     self.message_handler_leases = {}
     self.message_handler_requests = {}
@@ -184,33 +184,37 @@ class InMemoryDBClientMixin(object):
     if client_id not in self.metadatas:
       raise db.UnknownClientError(client_id)
 
-    keywords = [utils.SmartStr(k) for k in keywords]
-    for k in keywords:
-      self.keywords.setdefault(k, {})
-      self.keywords[k][client_id] = rdfvalue.RDFDatetime.Now()
+    now = rdfvalue.RDFDatetime.Now().AsMicrosecondsSinceEpoch()
+    self.keywords.Add(client_id, [utils.SmartUnicode(k) for k in keywords], now)
 
   @utils.Synchronized
   def ListClientsForKeywords(self, keywords, start_time=None):
     """Lists the clients associated with keywords."""
-    keywords = set(keywords)
-    keyword_mapping = {utils.SmartStr(kw): kw for kw in keywords}
+    min_timestamp = None
+    if start_time is not None:
+      min_timestamp = start_time.AsMicrosecondsSinceEpoch()
 
     res = {}
-    for k in keyword_mapping:
-      res.setdefault(keyword_mapping[k], [])
-      for client_id, timestamp in iteritems(self.keywords.get(k, {})):
-        if start_time is not None:
-          rdf_ts = timestamp
-          if rdf_ts < start_time:
-            continue
-        res[keyword_mapping[k]].append(client_id)
+    for kw in set(keywords):
+      res[kw] = self.keywords.Lookup(
+          utils.SmartUnicode(kw), min_timestamp=min_timestamp)
     return res
 
+  @utils.Synchronized
+  def ListClientsForAllKeywords(self, keywords, start_time=None):
+    """Lists the clients associated with all of the keywords."""
+    min_timestamp = None
+    if start_time is not None:
+      min_timestamp = start_time.AsMicrosecondsSinceEpoch()
+
+    return sorted(
+        self.keywords.LookupAll([utils.SmartUnicode(kw) for kw in keywords],
+                                min_timestamp=min_timestamp))
+
   @utils.Synchronized
   def RemoveClientKeyword(self, client_id, keyword):
     """Removes the association of a particular client to a keyword."""
-    if keyword in self.keywords and client_id in self.keywords[keyword]:
-      del self.keywords[keyword][client_id]
+    self.keywords.Remove(client_id, utils.SmartUnicode(keyword))
 
   @utils.Synchronized
   def AddClientLabels(self, client_id, owner, labels):
@@ -4,13 +4,13 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 
-from builtins import filter  # pylint: disable=redefined-builtin
+import bisect
+
 from future.utils import iteritems
 from future.utils import iterkeys
 
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import utils
-from grr_response_core.lib.util import collection
 from grr_response_server import db
 from grr_response_server.rdfvalues import objects as rdf_objects
 
@@ -28,23 +28,25 @@ class _PathRecord(object):
     self._components = components
 
     self._path_infos = {}
+    self._stat_entries = {}
+    self._hash_entries = {}
+    # Sorted timestamps of the entries above, used for point-in-time lookups.
+    self._path_info_timestamps = []
+    self._stat_entry_timestamps = []
+    self._hash_entry_timestamps = []
+    # Components of the child paths. Together with `path_records` this forms a
+    # per-client, per-path-type trie of all known paths.
     self._children = set()
 
-  @property
-  def _stat_entries(self):
-    return {
-        ts: pi.stat_entry
-        for ts, pi in iteritems(self._path_infos)
-        if pi.stat_entry
-    }
-
-  @property
-  def _hash_entries(self):
-    return {
-        ts: pi.hash_entry
-        for ts, pi in iteritems(self._path_infos)
-        if pi.hash_entry
-    }
+  def _SetStatEntry(self, stat_entry, timestamp):
+    if timestamp not in self._stat_entries:
+      bisect.insort(self._stat_entry_timestamps, timestamp)
+    self._stat_entries[timestamp] = stat_entry
+
+  def _SetHashEntry(self, hash_entry, timestamp):
+    if timestamp not in self._hash_entries:
+      bisect.insort(self._hash_entry_timestamps, timestamp)
+    self._hash_entries[timestamp] = hash_entry
 
   def AddStatEntry(self, stat_entry, timestamp):
     """Registers stat entry at a given timestamp."""
@@ -65,6 +67,7 @@ class _PathRecord(object):
       self.AddPathInfo(path_info)
     else:
       self._path_infos[timestamp].stat_entry = stat_entry
+      self._SetStatEntry(self._path_infos[timestamp].stat_entry, timestamp)
 
   def GetStatEntries(self):
     return self._stat_entries.items()
@@ -88,12 +91,18 @@ class _PathRecord(object):
       self.AddPathInfo(path_info)
     else:
       self._path_infos[timestamp].hash_entry = hash_entry
+      self._SetHashEntry(self._path_infos[timestamp].hash_entry, timestamp)
 
   def GetHashEntries(self):
     return self._hash_entries.items()
 
   def ClearHistory(self):
     self._path_infos = {}
+    self._stat_entries = {}
+    self._hash_entries = {}
+    self._path_info_timestamps = []
+    self._stat_entry_timestamps = []
+    self._hash_entry_timestamps = []
 
   def AddPathInfo(self, path_info):
     """Updates existing path information of the path record."""
@@ -113,6 +122,12 @@ class _PathRecord(object):
     if new_path_info.timestamp is None:
       new_path_info.timestamp = rdfvalue.RDFDatetime.Now()
     self._path_infos[new_path_info.timestamp] = new_path_info
+    bisect.insort(self._path_info_timestamps, new_path_info.timestamp)
+
+    if new_path_info.stat_entry:
+      self._SetStatEntry(new_path_info.stat_entry, new_path_info.timestamp)
+    if new_path_info.hash_entry:
+      self._SetHashEntry(new_path_info.hash_entry, new_path_info.timestamp)
 
   def AddChild(self, path_info):
     """Makes the path aware of some child."""
@@ -124,7 +139,7 @@ class _PathRecord(object):
       message = "Incompatible path components, expected `%s` but got `%s`"
       raise ValueError(message % (self._components, path_info.components[:-1]))
 
-    self._children.add(path_info.GetPathID())
+    self._children.add(tuple(path_info.components))
 
   def GetPathInfo(self, timestamp=None):
     """Generates a summary about the path record.
@@ -135,16 +150,17 @@ class _PathRecord(object):
     Returns:
       A `rdf_objects.PathInfo` instance.
     """
-    path_info_timestamp = self._LastEntryTimestamp(self._path_infos, timestamp)
+    path_info_timestamp = self._LastEntryTimestamp(self._path_info_timestamps,
+                                                   timestamp)
     result = self._path_infos[path_info_timestamp].Copy()
 
-    stat_entry_timestamp = self._LastEntryTimestamp(self._stat_entries,
-                                                    timestamp)
+    stat_entry_timestamp = self._LastEntryTimestamp(
+        self._stat_entry_timestamps, timestamp)
     result.last_stat_entry_timestamp = stat_entry_timestamp
     result.stat_entry = self._stat_entries.get(stat_entry_timestamp)
 
-    hash_entry_timestamp = self._LastEntryTimestamp(self._hash_entries,
-                                                    timestamp)
+    hash_entry_timestamp = self._LastEntryTimestamp(
+        self._hash_entry_timestamps, timestamp)
     result.last_hash_entry_timestamp = hash_entry_timestamp
     result.hash_entry = self._hash_entries.get(hash_entry_timestamp)
 
@@ -153,12 +169,15 @@ class _PathRecord(object):
   def GetChildren(self):
     return set(self._children)
 
+  def HasPathInfos(self):
+    return bool(self._path_infos)
+
   @staticmethod
-  def _LastEntryTimestamp(dct, upper_bound_timestamp):
+  def _LastEntryTimestamp(timestamps, upper_bound_timestamp):
     """Searches for greatest timestamp lower than the specified one.
 
     Args:
-      dct: A dictionary from timestamps to some items.
+      timestamps: A sorted list of timestamps.
       upper_bound_timestamp: An upper bound for timestamp to be returned.
 
     Returns:
@@ -166,14 +185,13 @@ class _PathRecord(object):
       exists, `None` is returned.
     """
     if upper_bound_timestamp is None:
-      upper_bound = lambda _: True
+      index = len(timestamps)
     else:
-      upper_bound = lambda key: key <= upper_bound_timestamp
+      index = bisect.bisect_right(timestamps, upper_bound_timestamp)
 
-    try:
-      return max(filter(upper_bound, iterkeys(dct)))
-    except ValueError:  # Thrown if `max` input (result of filtering) is empty.
+    if index == 0:
       return None
+    return timestamps[index - 1]
 
 
 class InMemoryDBPathMixin(object):
@@ -212,19 +230,23 @@ class InMemoryDBPathMixin(object):
     """Lists path info records that correspond to children of given path."""
     result = []
 
-    for path_idx, path_record in iteritems(self.path_records):
-      other_client_id, other_path_type, other_components = path_idx
-      if client_id != other_client_id or path_type != other_path_type:
-        continue
-      if len(other_components) == len(components):
+    # Walk the subtree rooted at the given path, so that only descendants are
+    # visited rather than every path record in the database.
+    stack = [(tuple(components), 0)]
+    while stack:
+      current, depth = stack.pop()
+      if max_depth is not None and depth >= max_depth:
         continue
-      if not collection.StartsWith(other_components, components):
-        continue
-      if (max_depth is not None and
-          len(other_components) - len(components) > max_depth):
+
+      path_record = self.path_records.get((client_id, path_type, current))
+      if path_record is None:
         continue
 
-      result.append(path_record.GetPathInfo())
+      for child in path_record.GetChildren():
+        child_record = self.path_records[(client_id, path_type, child)]
+        if child_record.HasPathInfos():
+          result.append(child_record.GetPathInfo())
+        stack.append((child, depth + 1))
 
     result.sort(key=lambda _: tuple(_.components))
     return result
@@ -275,8 +297,10 @@ class InMemoryDBPathMixin(object):
   def ClearPathHistory(self, client_id, path_infos):
     """Clears path history for specified paths of given client."""
     for path_info in path_infos:
-      path_record = self._GetPathRecord(client_id, path_info)
-      path_record.ClearHistory()
+      path_record = self._GetPathRecord(
+          client_id, path_info, set_default=False)
+      if path_record is not None:
+        path_record.ClearHistory()
 
   @utils.Synchronized
   def MultiWritePathHistory(self, client_path_histories):
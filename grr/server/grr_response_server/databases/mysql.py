@@ -104,9 +104,13 @@ class MysqlDB(mysql_artifacts.MySQLDBArtifactsMixin,
         self._InitializeSchema(cursor)
     self.handler_thread = None
     self.handler_stop = True
+    self.message_handler_notifier = mysql_flows.QueueNotifier(
+        mysql_flows.MESSAGE_HANDLER_QUEUE)
 
     self.flow_processing_request_handler_thread = None
     self.flow_processing_request_handler_stop = None
+    self.flow_processing_notifier = mysql_flows.QueueNotifier(
+        mysql_flows.FLOW_PROCESSING_QUEUE)
     self.flow_processing_request_handler_pool = (
         threadpool.ThreadPool.Factory(
             "flow_processing_pool", min_threads=2, max_threads=50))
@@ -449,6 +449,27 @@ class MySQLDBClientMixin(object):
       result[keyword_mapping[kw]].append(mysql_utils.IntToClientID(cid))
     return result
 
+  @mysql_utils.WithTransaction(readonly=True)
+  def ListClientsForAllKeywords(self, keywords, start_time=None, cursor=None):
+    """Lists the clients associated with all of the keywords."""
+    keywords = set(utils.SmartUnicode(kw) for kw in keywords)
+    if not keywords:
+      return []
+
+    # (client_id, keyword) is the primary key, so a client matches all keywords
+    # exactly when it has one row for every one of them.
+    query = ("SELECT client_id FROM client_keywords WHERE keyword IN ({})"
+             .format(",".join(["%s"] * len(keywords))))
+    args = list(keywords)
+    if start_time:
+      query += " AND timestamp >= %s"
+      args.append(mysql_utils.RDFDatetimeToMysqlString(start_time))
+    query += " GROUP BY client_id HAVING COUNT(*) = %s ORDER BY client_id"
+    args.append(len(keywords))
+
+    cursor.execute(query, args)
+    return [mysql_utils.IntToClientID(cid) for cid, in cursor.fetchall()]
+
   @mysql_utils.WithTransaction()
   def AddClientLabels(self, client_id, owner, labels, cursor=None):
     """Attaches a list of user labels to a client."""
@@ -199,5 +199,46 @@ CREATE TABLE IF NOT EXISTS flow_processing_requests(
     leased_by VARCHAR(128),
     PRIMARY KEY (client_id, flow_id, timestamp),
     FOREIGN KEY (client_id, flow_id) REFERENCES flows(client_id, flow_id)
+)""", """
+CREATE TABLE IF NOT EXISTS queue_notifications(
+    notification_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    queue VARCHAR(128) NOT NULL,
+    PRIMARY KEY (notification_id),
+    KEY queue_notification_id_idx (queue, notification_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_paths(
+    client_id BIGINT UNSIGNED NOT NULL,
+    path_type INT UNSIGNED NOT NULL,
+    path_id BINARY(32) NOT NULL,
+    path TEXT CHARACTER SET utf8 COLLATE utf8_bin NOT NULL,
+    depth INT UNSIGNED NOT NULL,
+    directory BOOL NOT NULL,
+    timestamp DATETIME(6) NOT NULL,
+    last_stat_entry_timestamp DATETIME(6),
+    last_hash_entry_timestamp DATETIME(6),
+    PRIMARY KEY (client_id, path_type, path_id),
+    KEY client_paths_prefix_idx (client_id, path_type, path(255)),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_path_stat_entries(
+    client_id BIGINT UNSIGNED NOT NULL,
+    path_type INT UNSIGNED NOT NULL,
+    path_id BINARY(32) NOT NULL,
+    timestamp DATETIME(6) NOT NULL,
+    stat_entry MEDIUMBLOB NOT NULL,
+    PRIMARY KEY (client_id, path_type, path_id, timestamp),
+    FOREIGN KEY (client_id, path_type, path_id)
+    REFERENCES client_paths(client_id, path_type, path_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_path_hash_entries(
+    client_id BIGINT UNSIGNED NOT NULL,
+    path_type INT UNSIGNED NOT NULL,
+    path_id BINARY(32) NOT NULL,
+    timestamp DATETIME(6) NOT NULL,
+    hash_entry MEDIUMBLOB NOT NULL,
+    sha256 BINARY(32),
+    PRIMARY KEY (client_id, path_type, path_id, timestamp),
+    FOREIGN KEY (client_id, path_type, path_id)
+    REFERENCES client_paths(client_id, path_type, path_id)
 )"""
 ]
@@ -20,11 +20,131 @@ from grr_response_server.rdfvalues import flow_objects as rdf_flow_objects
 from grr_response_server.rdfvalues import objects as rdf_objects
 
 
+# Queue names used in the queue_notifications table.
+MESSAGE_HANDLER_QUEUE = "message_handler_requests"
+FLOW_PROCESSING_QUEUE = "flow_processing_requests"
+
+# How often a waiting handler checks the notification table for writes made by
+# other processes.
+_NOTIFICATION_CHECK_INTERVAL = 0.1
+
+# The longest a handler waits before it polls the request table regardless of
+# notifications. This picks up requests whose delivery time has come and
+# expired leases.
+_MAX_NOTIFICATION_WAIT = 5
+
+# How often a waiting handler removes old notifications from the table so it
+# stays small.
+_NOTIFICATION_CLEANUP_INTERVAL = 60
+
+
+class QueueNotifier(object):
+  """Wakes up a handler waiting for new requests in a queue.
+
+  Writers in the same process wake the handler directly through an event once
+  their transaction is committed. Writers in other processes add a row to the
+  queue_notifications table in the same transaction that writes the requests.
+  Waiting handlers cheaply check that table for changes.
+  """
+
+  def __init__(self, queue):
+    self.queue = queue
+    self._event = threading.Event()
+    self._last_state = None
+    self._next_cleanup = time.time() + _NOTIFICATION_CLEANUP_INTERVAL
+
+  def Notify(self):
+    """Wakes up the handler of this process."""
+    self._event.set()
+
+  def Wait(self, read_state_fn, is_stopped_fn):
+    """Waits until the queue might have new requests.
+
+    Args:
+      read_state_fn: A function returning the current notification state of the
+        queue in the database.
+      is_stopped_fn: A function returning True if the handler was stopped.
+    """
+    deadline = time.time() + _MAX_NOTIFICATION_WAIT
+    while not is_stopped_fn() and time.time() < deadline:
+      if self._event.wait(_NOTIFICATION_CHECK_INTERVAL):
+        break
+
+      try:
+        state = read_state_fn()
+      except MySQLdb.Error as e:
+        logging.warning("Unable to read queue notifications: %s", e)
+        continue
+
+      if state != self._last_state:
+        self._last_state = state
+        break
+
+    self._event.clear()
+
+  def GetCleanupThreshold(self):
+    """Returns the id below which notifications can be removed, if it is time.
+
+    Returns:
+      The latest notification id seen by the handler if the last cleanup was
+      more than _NOTIFICATION_CLEANUP_INTERVAL ago, None otherwise.
+    """
+    if self._last_state is None or self._last_state[0] is None:
+      return None
+
+    now = time.time()
+    if now < self._next_cleanup:
+      return None
+
+    self._next_cleanup = now + _NOTIFICATION_CLEANUP_INTERVAL
+    return self._last_state[0]
+
+
 class MySQLDBFlowMixin(object):
   """MySQLDB mixin for flow handling."""
 
+  def _WriteQueueNotification(self, queue, cursor):
+    """Signals handlers of other processes that a queue has new requests."""
+    cursor.execute("INSERT INTO queue_notifications (queue) VALUES (%s)",
+                   [queue])
+
   @mysql_utils.WithTransaction()
-  def WriteMessageHandlerRequests(self, requests, cursor=None):
+  def _DeleteQueueNotifications(self, queue, max_notification_id,
+                                cursor=None):
+    """Removes notifications of a queue older than the given one."""
+    cursor.execute(
+        "DELETE FROM queue_notifications "
+        "WHERE queue=%s AND notification_id < %s",
+        [queue, max_notification_id])
+
+  @mysql_utils.WithTransaction(readonly=True)
+  def _ReadQueueNotificationState(self, queue, cursor=None):
+    """Returns a value that changes whenever a queue gets notified."""
+    # Notifications of concurrent transactions may be committed out of order,
+    # so the count is needed in addition to the maximum id.
+    cursor.execute(
+        "SELECT MAX(notification_id), COUNT(*) FROM queue_notifications "
+        "WHERE queue=%s", [queue])
+    return cursor.fetchone()
+
+  def _WaitForQueueNotification(self, notifier, is_stopped_fn):
+    notifier.Wait(lambda: self._ReadQueueNotificationState(notifier.queue),
+                  is_stopped_fn)
+
+    # Old notifications are removed in their own transaction so writers don't
+    # have to do it while holding their locks.
+    threshold = notifier.GetCleanupThreshold()
+    if threshold is not None:
+      self._DeleteQueueNotifications(notifier.queue, threshold)
+
+  def WriteMessageHandlerRequests(self, requests):
+    """Writes a list of message handler requests to the database."""
+    self._WriteMessageHandlerRequests(requests)
+    # The requests are only visible to the handler after the commit.
+    self.message_handler_notifier.Notify()
+
+  @mysql_utils.WithTransaction()
+  def _WriteMessageHandlerRequests(self, requests, cursor=None):
     """Writes a list of message handler requests to the database."""
     query = ("INSERT IGNORE INTO message_handler_requests "
              "(handlername, timestamp, request_id, request) VALUES ")
@@ -38,6 +158,7 @@ class MySQLDBFlowMixin(object):
 
     query += ",".join(value_templates)
     cursor.execute(query, args)
+    self._WriteQueueNotification(MESSAGE_HANDLER_QUEUE, cursor)
 
   @mysql_utils.WithTransaction(readonly=True)
   def ReadMessageHandlerRequests(self, cursor=None):
@@ -84,6 +205,7 @@ class MySQLDBFlowMixin(object):
     """Unregisters any registered message handler."""
     if self.handler_thread:
       self.handler_stop = True
+      self.message_handler_notifier.Notify()
       self.handler_thread.join()
       self.handler_thread = None
 
@@ -94,7 +216,8 @@ class MySQLDBFlowMixin(object):
         if msgs:
           handler(msgs)
         else:
-          time.sleep(5)
+          self._WaitForQueueNotification(self.message_handler_notifier,
+                                         lambda: self.handler_stop)
       except Exception as e:  # pylint: disable=broad-except
         logging.exception("_LeaseMessageHandlerRequests raised %s.", e)
 
@@ -477,14 +600,22 @@ class MySQLDBFlowMixin(object):
              "(client_id, flow_id, timestamp, request, delivery_time) VALUES ")
     query += ", ".join(templates)
     cursor.execute(query, args)
+    self._WriteQueueNotification(FLOW_PROCESSING_QUEUE, cursor)
 
-  @mysql_utils.WithTransaction()
-  def WriteFlowRequests(self, requests, cursor=None):
+  def WriteFlowRequests(self, requests):
     """Writes a list of flow requests to the database."""
+    if self._WriteFlowRequests(requests):
+      # The requests are only visible to the handler after the commit.
+      self.flow_processing_notifier.Notify()
+
+  @mysql_utils.WithTransaction()
+  def _WriteFlowRequests(self, requests, cursor=None):
+    """Writes flow requests, returns True if flow processing was requested."""
     args = []
     templates = []
     flow_keys = []
     needs_processing = {}
+    flow_processing_requests = []
     now_str = mysql_utils.RDFDatetimeToMysqlString(rdfvalue.RDFDatetime.Now())
     for r in requests:
       if r.needs_processing:
@@ -500,7 +631,6 @@ class MySQLDBFlowMixin(object):
       ])
 
     if needs_processing:
-      flow_processing_requests = []
       nr_conditions = []
       nr_args = []
       for client_id, flow_id in needs_processing:
@@ -535,6 +665,8 @@ class MySQLDBFlowMixin(object):
     except MySQLdb.IntegrityError as e:
       raise db.AtLeastOneUnknownFlowError(flow_keys, cause=e)
 
+    return bool(flow_processing_requests)
+
   def _ReadCurrentFlowInfo(self, responses, currently_available_requests,
                            next_request_by_flow, responses_expected_by_request,
                            current_responses_by_request, cursor):
@@ -701,12 +833,18 @@ class MySQLDBFlowMixin(object):
     query += " OR ".join(conditions)
     cursor.execute(query, args)
 
-  @mysql_utils.WithTransaction()
-  def WriteFlowResponses(self, responses, cursor=None):
+  def WriteFlowResponses(self, responses):
     """Writes a list of flow responses to the database."""
+    if self._WriteFlowResponses(responses):
+      # The requests are only visible to the handler after the commit.
+      self.flow_processing_notifier.Notify()
+
+  @mysql_utils.WithTransaction()
+  def _WriteFlowResponses(self, responses, cursor=None):
+    """Writes flow responses, returns True if flow processing was requested."""
 
     if not responses:
-      return
+      return False
 
     # In addition to just writing responses, this function needs to also
 
@@ -827,6 +965,8 @@ class MySQLDBFlowMixin(object):
     if flow_processing_requests:
       self._WriteFlowProcessingRequests(flow_processing_requests, cursor)
 
+    return bool(flow_processing_requests)
+
   @mysql_utils.WithTransaction()
   def DeleteFlowRequests(self, requests, cursor=None):
     """Deletes a list of flow requests from the database."""
@@ -990,9 +1130,14 @@ class MySQLDBFlowMixin(object):
 
     return True
 
-  @mysql_utils.WithTransaction()
-  def WriteFlowProcessingRequests(self, requests, cursor=None):
+  def WriteFlowProcessingRequests(self, requests):
     """Writes a list of flow processing requests to the database."""
+    self._WriteFlowProcessingRequestsInTransaction(requests)
+    # The requests are only visible to the handler after the commit.
+    self.flow_processing_notifier.Notify()
+
+  @mysql_utils.WithTransaction()
+  def _WriteFlowProcessingRequestsInTransaction(self, requests, cursor=None):
     self._WriteFlowProcessingRequests(requests, cursor)
 
   @mysql_utils.WithTransaction(readonly=True)
@@ -1080,7 +1225,9 @@ class MySQLDBFlowMixin(object):
             self.flow_processing_request_handler_pool.AddTask(
                 target=handler, args=(m,))
         else:
-          time.sleep(5)
+          self._WaitForQueueNotification(
+              self.flow_processing_notifier,
+              lambda: self.flow_processing_request_handler_stop)
 
       except Exception as e:  # pylint: disable=broad-except
         logging.exception("_FlowProcessingRequestHandlerLoop raised %s.", e)
@@ -1103,6 +1250,7 @@ class MySQLDBFlowMixin(object):
     """Unregisters any registered flow processing handler."""
     if self.flow_processing_request_handler_thread:
       self.flow_processing_request_handler_stop = True
+      self.flow_processing_notifier.Notify()
       self.flow_processing_request_handler_thread.join()
       self.flow_processing_request_handler_thread = None
 
@@ -1,5 +1,75 @@
 #!/usr/bin/env python
 """The MySQL database methods for path handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from future.utils import iteritems
+import MySQLdb
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_core.lib.rdfvalues import crypto as rdf_crypto
+from grr_response_server import db
+from grr_response_server.databases import mysql_utils
+from grr_response_server.rdfvalues import objects as rdf_objects
+
+# MySQL error codes:
+_ER_NO_REFERENCED_ROW_2 = 1452
+
+# Columns selected by all queries returning the latest state of a path. The
+# latest stat and hash entries are found through the `last_*_timestamp`
+# columns, so no aggregation over the history tables is needed.
+_PATH_INFO_COLUMNS = (
+    "p.path, p.directory, p.timestamp, "
+    "p.last_stat_entry_timestamp, s.stat_entry, "
+    "p.last_hash_entry_timestamp, h.hash_entry")
+
+_PATH_INFO_JOINS = """
+ LEFT JOIN client_path_stat_entries AS s
+        ON s.client_id = p.client_id
+       AND s.path_type = p.path_type
+       AND s.path_id = p.path_id
+       AND s.timestamp = p.last_stat_entry_timestamp
+ LEFT JOIN client_path_hash_entries AS h
+        ON h.client_id = p.client_id
+       AND h.path_type = p.path_type
+       AND h.path_id = p.path_id
+       AND h.timestamp = p.last_hash_entry_timestamp
+"""
+
+
+def _PathInfoFromRow(path_type, row):
+  """Builds a `rdf_objects.PathInfo` from a row of `_PATH_INFO_COLUMNS`."""
+  (path, directory, timestamp, last_stat_entry_timestamp, stat_entry,
+   last_hash_entry_timestamp, hash_entry) = row
+
+  return rdf_objects.PathInfo(
+      path_type=path_type,
+      components=mysql_utils.PathToComponents(path),
+      directory=bool(directory),
+      timestamp=mysql_utils.MysqlToRDFDatetime(timestamp),
+      last_stat_entry_timestamp=mysql_utils.MysqlToRDFDatetime(
+          last_stat_entry_timestamp),
+      stat_entry=mysql_utils.StringToRDFProto(rdf_client_fs.StatEntry,
+                                              stat_entry),
+      last_hash_entry_timestamp=mysql_utils.MysqlToRDFDatetime(
+          last_hash_entry_timestamp),
+      hash_entry=mysql_utils.StringToRDFProto(rdf_crypto.Hash, hash_entry))
+
+
+def _IsUnknownReference(error):
+  """Returns whether an integrity error is a foreign key violation."""
+  return bool(error.args) and error.args[0] == _ER_NO_REFERENCED_ROW_2
+
+
+def _PathIDBytes(components):
+  return rdf_objects.PathID.FromComponents(components).AsBytes()
+
+
+def _HashEntrySHA256(hash_entry):
+  if not hash_entry.HasField("sha256"):
+    return None
+  return hash_entry.sha256.AsBytes()
 
 
 class MySQLDBPathMixin(object):
@@ -7,45 +77,475 @@ class MySQLDBPathMixin(object):
 
   def ReadPathInfo(self, client_id, path_type, components, timestamp=None):
     """Retrieves a path info record for a given path."""
-    raise NotImplementedError()
+    if timestamp is None:
+      path_info = self.ReadPathInfos(client_id, path_type,
+                                     [components])[components]
+    else:
+      path_info = self._ReadPathInfoAtTimestamp(client_id, path_type,
+                                                components, timestamp)
+
+    if path_info is None:
+      raise db.UnknownPathError(
+          client_id=client_id, path_type=path_type, components=components)
+    return path_info
+
+  @mysql_utils.WithTransaction(readonly=True)
+  def _ReadPathInfoAtTimestamp(self,
+                               client_id,
+                               path_type,
+                               components,
+                               timestamp,
+                               cursor=None):
+    """Reads the state of a path as it was at the given timestamp."""
+    key = [
+        mysql_utils.ClientIDToInt(client_id),
+        int(path_type),
+        _PathIDBytes(components)
+    ]
+    timestamp_str = mysql_utils.RDFDatetimeToMysqlString(timestamp)
+
+    cursor.execute(
+        "SELECT directory, timestamp FROM client_paths "
+        "WHERE client_id = %s AND path_type = %s AND path_id = %s", key)
+    row = cursor.fetchone()
+    if row is None:
+      return None
+    directory, path_timestamp = row
+    path_timestamp = mysql_utils.MysqlToRDFDatetime(path_timestamp)
+
+    # Both history tables are keyed by timestamp within a path, so finding the
+    # latest entry before the given timestamp is a single index lookup.
+    cursor.execute(
+        "SELECT timestamp, stat_entry FROM client_path_stat_entries "
+        "WHERE client_id = %s AND path_type = %s AND path_id = %s "
+        "AND timestamp <= %s ORDER BY timestamp DESC LIMIT 1",
+        key + [timestamp_str])
+    stat_row = cursor.fetchone() or (None, None)
+
+    cursor.execute(
+        "SELECT timestamp, hash_entry FROM client_path_hash_entries "
+        "WHERE client_id = %s AND path_type = %s AND path_id = %s "
+        "AND timestamp <= %s ORDER BY timestamp DESC LIMIT 1",
+        key + [timestamp_str])
+    hash_row = cursor.fetchone() or (None, None)
 
-  def ReadPathInfos(self, client_id, path_type, components_list):
+    last_stat_entry_timestamp = mysql_utils.MysqlToRDFDatetime(stat_row[0])
+    last_hash_entry_timestamp = mysql_utils.MysqlToRDFDatetime(hash_row[0])
+
+    candidates = [last_stat_entry_timestamp, last_hash_entry_timestamp]
+    if path_timestamp <= timestamp:
+      candidates.append(path_timestamp)
+    candidates = [ts for ts in candidates if ts is not None]
+
+    return rdf_objects.PathInfo(
+        path_type=path_type,
+        components=components,
+        directory=bool(directory),
+        timestamp=max(candidates) if candidates else None,
+        last_stat_entry_timestamp=last_stat_entry_timestamp,
+        stat_entry=mysql_utils.StringToRDFProto(rdf_client_fs.StatEntry,
+                                                stat_row[1]),
+        last_hash_entry_timestamp=last_hash_entry_timestamp,
+        hash_entry=mysql_utils.StringToRDFProto(rdf_crypto.Hash, hash_row[1]))
+
+  @mysql_utils.WithTransaction(readonly=True)
+  def ReadPathInfos(self, client_id, path_type, components_list, cursor=None):
     """Retrieves path info records for given paths."""
-    raise NotImplementedError()
+    result = {components: None for components in components_list}
+    if not result:
+      return result
+
+    path_ids = [_PathIDBytes(components) for components in result]
+    query = ("SELECT {columns} FROM client_paths AS p {joins} "
+             "WHERE p.client_id = %s AND p.path_type = %s "
+             "AND p.path_id IN ({path_ids})").format(
+                 columns=_PATH_INFO_COLUMNS,
+                 joins=_PATH_INFO_JOINS,
+                 path_ids=", ".join(["%s"] * len(path_ids)))
+    cursor.execute(query,
+                   [mysql_utils.ClientIDToInt(client_id),
+                    int(path_type)] + path_ids)
+
+    for row in cursor.fetchall():
+      path_info = _PathInfoFromRow(path_type, row)
+      result[tuple(path_info.components)] = path_info
+
+    return result
 
   def WritePathInfos(self, client_id, path_infos):
     """Writes a collection of path_info records for a client."""
-    raise NotImplementedError()
+    try:
+      self._MultiWritePathInfos({client_id: path_infos})
+    except MySQLdb.IntegrityError as error:
+      if _IsUnknownReference(error):
+        raise db.UnknownClientError(client_id=client_id, cause=error)
+      raise db.Error("Duplicated path info write", cause=error)
 
   def MultiWritePathInfos(self, path_infos):
     """Writes a collection of path info records for specified clients."""
-    raise NotImplementedError()
+    try:
+      self._MultiWritePathInfos(path_infos)
+    except MySQLdb.IntegrityError as error:
+      if _IsUnknownReference(error):
+        client_ids = list(path_infos)
+        raise db.AtLeastOneUnknownClientError(
+            client_ids=client_ids, cause=error)
+      raise db.Error("Duplicated path info write", cause=error)
+
+  @mysql_utils.WithTransaction()
+  def _MultiWritePathInfos(self, path_infos, cursor=None):
+    """Writes path info records of many clients in a single transaction."""
+    now = mysql_utils.RDFDatetimeToMysqlString(rdfvalue.RDFDatetime.Now())
+
+    # Path rows are keyed by (client_id, path_type, path_id) so that ancestors
+    # shared by many of the written paths are only sent to the server once.
+    path_rows = {}
+    # History rows of a path share the timestamp, so only the last entry of
+    # every path is written.
+    stat_rows = {}
+    hash_rows = {}
+
+    def AddPathRow(cid, path_info, directory, stat_timestamp, hash_timestamp):
+      path_id = path_info.GetPathID().AsBytes()
+      key = (cid, int(path_info.path_type), path_id)
+
+      row = path_rows.get(key)
+      if row is not None:
+        row[5] = row[5] or directory
+        row[7] = row[7] or stat_timestamp
+        row[8] = row[8] or hash_timestamp
+        return key
+
+      components = tuple(path_info.components)
+      path_rows[key] = [
+          cid,
+          int(path_info.path_type), path_id,
+          mysql_utils.ComponentsToPath(components),
+          len(components), directory, now, stat_timestamp, hash_timestamp
+      ]
+      return key
+
+    for client_id, client_path_infos in iteritems(path_infos):
+      cid = mysql_utils.ClientIDToInt(client_id)
+
+      for path_info in client_path_infos:
+        stat_timestamp = None
+        hash_timestamp = None
+        if path_info.HasField("stat_entry"):
+          stat_timestamp = now
+        if path_info.HasField("hash_entry"):
+          hash_timestamp = now
+
+        key = AddPathRow(cid, path_info, bool(path_info.directory),
+                         stat_timestamp, hash_timestamp)
+
+        if stat_timestamp is not None:
+          stat_rows[key] = (
+              list(key) + [now, path_info.stat_entry.SerializeToString()])
+        if hash_timestamp is not None:
+          hash_rows[key] = list(key) + [
+              now,
+              path_info.hash_entry.SerializeToString(),
+              _HashEntrySHA256(path_info.hash_entry)
+          ]
+
+        for ancestor_path_info in path_info.GetAncestors():
+          AddPathRow(cid, ancestor_path_info, True, None, None)
+
+    if not path_rows:
+      return
+
+    # MySQLdb rewrites `executemany` of a single-row INSERT into one
+    # multi-row INSERT statement, so the whole batch is a single round trip.
+    cursor.executemany(
+        "INSERT INTO client_paths(client_id, path_type, path_id, path, depth, "
+        "directory, timestamp, last_stat_entry_timestamp, "
+        "last_hash_entry_timestamp) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE "
+        "directory = directory OR VALUES(directory), "
+        "timestamp = VALUES(timestamp), "
+        "last_stat_entry_timestamp = "
+        "COALESCE(VALUES(last_stat_entry_timestamp), "
+        "last_stat_entry_timestamp), "
+        "last_hash_entry_timestamp = "
+        "COALESCE(VALUES(last_hash_entry_timestamp), "
+        "last_hash_entry_timestamp)", list(path_rows.values()))
+
+    if stat_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_stat_entries(client_id, path_type, path_id, "
+          "timestamp, stat_entry) VALUES (%s, %s, %s, %s, %s)",
+          list(stat_rows.values()))
+
+    if hash_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_hash_entries(client_id, path_type, path_id, "
+          "timestamp, hash_entry, sha256) VALUES (%s, %s, %s, %s, %s, %s)",
+          list(hash_rows.values()))
 
   def ClearPathHistory(self, client_id, path_infos):
     """Clears path history for specified paths of given client."""
-    raise NotImplementedError()
+    self.MultiClearPathHistory({client_id: path_infos})
 
-  def MultiClearPathHistory(self, path_infos):
+  @mysql_utils.WithTransaction()
+  def MultiClearPathHistory(self, path_infos, cursor=None):
     """Clears path history for specified paths of given clients."""
-    raise NotImplementedError()
+    keys = []
+    for client_id, client_path_infos in iteritems(path_infos):
+      cid = mysql_utils.ClientIDToInt(client_id)
+      for path_info in client_path_infos:
+        keys.append(
+            [cid, int(path_info.path_type),
+             path_info.GetPathID().AsBytes()])
+
+    if not keys:
+      return
 
+    condition = "WHERE client_id = %s AND path_type = %s AND path_id = %s"
+    cursor.executemany("DELETE FROM client_path_stat_entries " + condition,
+                       keys)
+    cursor.executemany("DELETE FROM client_path_hash_entries " + condition,
+                       keys)
+    cursor.executemany(
+        "UPDATE client_paths SET last_stat_entry_timestamp = NULL, "
+        "last_hash_entry_timestamp = NULL " + condition, keys)
+
+  @mysql_utils.WithTransaction(readonly=True)
   def ListDescendentPathInfos(self,
                               client_id,
                               path_type,
                               components,
-                              max_depth=None):
+                              max_depth=None,
+                              cursor=None):
     """Lists path info records that correspond to descendants of given path."""
-    raise NotImplementedError()
+    path = mysql_utils.ComponentsToPath(components)
+
+    # Descendants share the path of their ancestor as a prefix, so the LIKE
+    # condition below is a range scan over `client_paths_prefix_idx`.
+    query = ("SELECT {columns} FROM client_paths AS p {joins} "
+             "WHERE p.client_id = %s AND p.path_type = %s "
+             "AND p.path LIKE %s").format(
+                 columns=_PATH_INFO_COLUMNS, joins=_PATH_INFO_JOINS)
+    values = [
+        mysql_utils.ClientIDToInt(client_id),
+        int(path_type),
+        mysql_utils.EscapeWildcards(path) + "/%"
+    ]
+
+    if max_depth is not None:
+      query += " AND p.depth <= %s"
+      values.append(len(components) + max_depth)
+
+    cursor.execute(query, values)
+
+    result = [_PathInfoFromRow(path_type, row) for row in cursor.fetchall()]
+    result.sort(key=lambda path_info: tuple(path_info.components))
+    return result
 
   def MultiWritePathHistory(self, client_path_histories):
-    raise NotImplementedError()
+    """Writes a collection of hash and stat entries observed for given paths."""
+    try:
+      self._MultiWritePathHistory(client_path_histories)
+    except MySQLdb.IntegrityError as error:
+      if _IsUnknownReference(error):
+        # TODO(hanuszczak): Provide more details about paths that caused that.
+        raise db.AtLeastOneUnknownPathError([], cause=error)
+      raise db.Error("Duplicated path history entry", cause=error)
+
+  @mysql_utils.WithTransaction()
+  def _MultiWritePathHistory(self, client_path_histories, cursor=None):
+    """Writes path histories in a single transaction."""
+    stat_rows = []
+    hash_rows = []
+    stat_updates = []
+    hash_updates = []
 
-  def ReadPathInfosHistories(self, client_id, path_type, components_list):
+    for client_path, client_path_history in iteritems(client_path_histories):
+      key = [
+          mysql_utils.ClientIDToInt(client_path.client_id),
+          int(client_path.path_type),
+          _PathIDBytes(client_path.components)
+      ]
+
+      stat_entries = client_path_history.stat_entries
+      for timestamp, stat_entry in iteritems(stat_entries):
+        stat_rows.append(key + [
+            mysql_utils.RDFDatetimeToMysqlString(timestamp),
+            stat_entry.SerializeToString()
+        ])
+      if stat_entries:
+        latest = mysql_utils.RDFDatetimeToMysqlString(max(stat_entries))
+        stat_updates.append([latest, latest] + key)
+
+      hash_entries = client_path_history.hash_entries
+      for timestamp, hash_entry in iteritems(hash_entries):
+        hash_rows.append(key + [
+            mysql_utils.RDFDatetimeToMysqlString(timestamp),
+            hash_entry.SerializeToString(),
+            _HashEntrySHA256(hash_entry)
+        ])
+      if hash_entries:
+        latest = mysql_utils.RDFDatetimeToMysqlString(max(hash_entries))
+        hash_updates.append([latest, latest] + key)
+
+    condition = "WHERE client_id = %s AND path_type = %s AND path_id = %s"
+
+    if stat_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_stat_entries(client_id, path_type, path_id, "
+          "timestamp, stat_entry) VALUES (%s, %s, %s, %s, %s)", stat_rows)
+      cursor.executemany(
+          "UPDATE client_paths SET last_stat_entry_timestamp = "
+          "GREATEST(COALESCE(last_stat_entry_timestamp, %s), %s) " + condition,
+          stat_updates)
+
+    if hash_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_hash_entries(client_id, path_type, path_id, "
+          "timestamp, hash_entry, sha256) VALUES (%s, %s, %s, %s, %s, %s)",
+          hash_rows)
+      cursor.executemany(
+          "UPDATE client_paths SET last_hash_entry_timestamp = "
+          "GREATEST(COALESCE(last_hash_entry_timestamp, %s), %s) " + condition,
+          hash_updates)
+
+  @mysql_utils.WithTransaction(readonly=True)
+  def ReadPathInfosHistories(self,
+                             client_id,
+                             path_type,
+                             components_list,
+                             cursor=None):
     """Reads a collection of hash and stat entries for given paths."""
-    raise NotImplementedError()
+    results = {components: [] for components in components_list}
+    if not results:
+      return results
+
+    components_by_path_id = {
+        _PathIDBytes(components): components for components in results
+    }
+    path_ids = list(components_by_path_id)
+
+    condition = ("WHERE client_id = %s AND path_type = %s "
+                 "AND path_id IN ({})").format(", ".join(["%s"] * len(path_ids)))
+    values = [mysql_utils.ClientIDToInt(client_id), int(path_type)] + path_ids
+
+    entries_by_key = {}
+
+    def GetPathInfo(path_id, timestamp):
+      key = (path_id, timestamp)
+      if key not in entries_by_key:
+        entries_by_key[key] = rdf_objects.PathInfo(
+            path_type=path_type,
+            components=components_by_path_id[path_id],
+            timestamp=mysql_utils.MysqlToRDFDatetime(timestamp))
+      return entries_by_key[key]
+
+    cursor.execute(
+        "SELECT path_id, timestamp, stat_entry "
+        "FROM client_path_stat_entries " + condition, values)
+    for path_id, timestamp, stat_entry in cursor.fetchall():
+      path_info = GetPathInfo(path_id, timestamp)
+      path_info.stat_entry = rdf_client_fs.StatEntry.FromSerializedString(
+          stat_entry)
+
+    cursor.execute(
+        "SELECT path_id, timestamp, hash_entry "
+        "FROM client_path_hash_entries " + condition, values)
+    for path_id, timestamp, hash_entry in cursor.fetchall():
+      path_info = GetPathInfo(path_id, timestamp)
+      path_info.hash_entry = rdf_crypto.Hash.FromSerializedString(hash_entry)
+
+    for (path_id, _), path_info in sorted(iteritems(entries_by_key)):
+      results[components_by_path_id[path_id]].append(path_info)
+
+    return results
 
   def ReadLatestPathInfosWithHashBlobReferences(self,
                                                 client_paths,
                                                 max_timestamp=None):
     """Returns PathInfos that have corresponding HashBlobReferences."""
-    raise NotImplementedError()
+    results = {client_path: None for client_path in client_paths}
+
+    candidates = self._ReadHashEntryCandidates(
+        client_paths, max_timestamp=max_timestamp)
+    hash_ids = set()
+    for path_infos in candidates.values():
+      for path_info in path_infos:
+        hash_ids.add(
+            rdf_objects.SHA256HashID.FromBytes(
+                path_info.hash_entry.sha256.AsBytes()))
+
+    if not hash_ids:
+      return results
+
+    blob_refs = self.ReadHashBlobReferences(list(hash_ids))
+    for client_path, path_infos in iteritems(candidates):
+      # Candidates are ordered from the newest to the oldest.
+      for path_info in path_infos:
+        hash_id = rdf_objects.SHA256HashID.FromBytes(
+            path_info.hash_entry.sha256.AsBytes())
+        if blob_refs.get(hash_id):
+          results[client_path] = path_info
+          break
+
+    return results
+
+  @mysql_utils.WithTransaction(readonly=True)
+  def _ReadHashEntryCandidates(self,
+                               client_paths,
+                               max_timestamp=None,
+                               cursor=None):
+    """Reads hash entries with a SHA-256 digest for given paths.
+
+    Args:
+      client_paths: A list of `db.ClientPath` instances.
+      max_timestamp: If set, only entries not newer than it are returned.
+      cursor: A MySQL cursor.
+
+    Returns:
+      A dictionary mapping client paths to lists of `rdf_objects.PathInfo`
+      ordered by timestamp in descending order. Each path info carries the
+      hash entry and the stat entry written at the same timestamp, if any.
+    """
+    client_paths_by_key = {}
+    for client_path in client_paths:
+      key = (mysql_utils.ClientIDToInt(client_path.client_id),
+             int(client_path.path_type), _PathIDBytes(client_path.components))
+      client_paths_by_key[key] = client_path
+
+    if not client_paths_by_key:
+      return {}
+
+    query = ("SELECT h.client_id, h.path_type, h.path_id, h.timestamp, "
+             "h.hash_entry, s.stat_entry "
+             "FROM client_path_hash_entries AS h "
+             "LEFT JOIN client_path_stat_entries AS s "
+             "ON s.client_id = h.client_id AND s.path_type = h.path_type "
+             "AND s.path_id = h.path_id AND s.timestamp = h.timestamp "
+             "WHERE (h.client_id, h.path_type, h.path_id) IN ({}) "
+             "AND h.sha256 IS NOT NULL").format(", ".join(
+                 ["(%s, %s, %s)"] * len(client_paths_by_key)))
+    values = [value for key in client_paths_by_key for value in key]
+
+    if max_timestamp is not None:
+      query += " AND h.timestamp <= %s"
+      values.append(mysql_utils.RDFDatetimeToMysqlString(max_timestamp))
+
+    query += " ORDER BY h.timestamp DESC"
+    cursor.execute(query, values)
+
+    result = {}
+    for (cid, path_type, path_id, timestamp, hash_entry,
+         stat_entry) in cursor.fetchall():
+      client_path = client_paths_by_key[(cid, path_type, path_id)]
+      path_info = rdf_objects.PathInfo(
+          path_type=client_path.path_type,
+          components=client_path.components,
+          timestamp=mysql_utils.MysqlToRDFDatetime(timestamp),
+          hash_entry=rdf_crypto.Hash.FromSerializedString(hash_entry),
+          stat_entry=mysql_utils.StringToRDFProto(rdf_client_fs.StatEntry,
+                                                  stat_entry))
+      result.setdefault(client_path, []).append(path_info)
+
+    return result
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Benchmarks for the MySQL path store.
+
+Requires a local MySQL server, configured the same way as for mysql_test.py
+through the MYSQL_TEST_* environment variables.
+"""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import os
+import random
+import string
+import unittest
+
+from builtins import range  # pylint: disable=redefined-builtin
+import MySQLdb  # TODO(hanuszczak): This should be imported conditionally.
+
+from grr_response_core.lib import flags
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_server.databases import mysql
+from grr_response_server.rdfvalues import objects as rdf_objects
+from grr.test_lib import benchmark_test_lib
+from grr.test_lib import test_lib
+
+_NUM_CLIENTS = 2
+# Every client gets _FANOUT ** 2 directories with _FILES_PER_DIRECTORY files
+# each, i.e. 1M files per client.
+_FANOUT = 100
+_FILES_PER_DIRECTORY = 100
+_BATCH_SIZE = 10000
+
+
+def _GetEnvironOrSkip(key):
+  value = os.environ.get(key)
+  if value is None:
+    raise unittest.SkipTest("'%s' variable is not set" % key)
+  return value
+
+
+def _GeneratePathInfos():
+  """Yields path infos of all files in the benchmark tree."""
+  for i in range(_FANOUT):
+    for j in range(_FANOUT):
+      for k in range(_FILES_PER_DIRECTORY):
+        components = ["dir%03d" % i, "dir%03d" % j, "file%03d" % k]
+        stat_entry = rdf_client_fs.StatEntry(st_size=k, st_mode=0o100644)
+        yield rdf_objects.PathInfo.OS(
+            components=components, stat_entry=stat_entry)
+
+
+class MySQLPathsBenchmark(benchmark_test_lib.AverageMicroBenchmarks):
+  """Measures writing and listing 1M paths per client."""
+
+  REPEATS = 1
+
+  def setUp(self):
+    super(MySQLPathsBenchmark, self).setUp()
+
+    user = _GetEnvironOrSkip("MYSQL_TEST_USER")
+    host = _GetEnvironOrSkip("MYSQL_TEST_HOST")
+    port = _GetEnvironOrSkip("MYSQL_TEST_PORT")
+    passwd = _GetEnvironOrSkip("MYSQL_TEST_PASS")
+    dbname = "".join(
+        random.choice(string.ascii_uppercase + string.digits)
+        for _ in range(10))
+
+    connection = MySQLdb.Connect(host=host, port=port, user=user, passwd=passwd)
+    cursor = connection.cursor()
+    cursor.execute("CREATE DATABASE " + dbname)
+
+    self.db = mysql.MysqlDB(
+        host=host, port=port, user=user, passwd=passwd, db=dbname)
+
+    def Fin():
+      self.db.Close()
+      cursor.execute("DROP DATABASE " + dbname)
+      cursor.close()
+      connection.close()
+
+    self.addCleanup(Fin)
+
+    self.client_ids = []
+    for i in range(_NUM_CLIENTS):
+      client_id = "C.%016x" % (i + 1)
+      self.db.WriteClientMetadata(client_id, fleetspeak_enabled=False)
+      self.client_ids.append(client_id)
+
+  def _WriteAllPaths(self):
+    batch = []
+    for path_info in _GeneratePathInfos():
+      batch.append(path_info)
+      if len(batch) >= _BATCH_SIZE:
+        self.db.MultiWritePathInfos(
+            {client_id: batch for client_id in self.client_ids})
+        batch = []
+
+    if batch:
+      self.db.MultiWritePathInfos(
+          {client_id: batch for client_id in self.client_ids})
+
+    return _NUM_CLIENTS * _FANOUT * _FANOUT * _FILES_PER_DIRECTORY
+
+  def testWriteAndList(self):
+    self.TimeIt(self._WriteAllPaths, "Write %d paths" %
+                (_NUM_CLIENTS * _FANOUT * _FANOUT * _FILES_PER_DIRECTORY))
+
+    client_id = self.client_ids[0]
+    path_type = rdf_objects.PathInfo.PathType.OS
+
+    self.TimeIt(
+        lambda: len(self.db.ListChildPathInfos(client_id, path_type, ())),
+        "List root children")
+    self.TimeIt(
+        lambda: len(
+            self.db.ListChildPathInfos(client_id, path_type, ("dir042",))),
+        "List children of a directory")
+    self.TimeIt(
+        lambda: len(
+            self.db.ListDescendentPathInfos(client_id, path_type, ("dir042",))),
+        "List descendants of a directory")
+    self.TimeIt(
+        lambda: len(
+            self.db.ReadPathInfos(client_id, path_type, [
+                ("dir%03d" % i, "dir042", "file042") for i in range(_FANOUT)
+            ])), "Read %d paths" % _FANOUT)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
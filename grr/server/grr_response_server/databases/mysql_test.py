@@ -14,8 +14,11 @@ from builtins import range  # pylint: disable=redefined-builtin
 import MySQLdb  # TODO(hanuszczak): This should be imported conditionally.
 
 from grr_response_core.lib import flags
+from grr_response_core.lib.rdfvalues import flows as rdf_flows
 from grr_response_server import db_test_mixin
 from grr_response_server.databases import mysql
+from grr_response_server.databases import mysql_flows
+from grr_response_server.rdfvalues import objects as rdf_objects
 from grr.test_lib import stats_test_lib
 from grr.test_lib import test_lib
 
@@ -167,6 +170,46 @@ class TestMysqlDB(stats_test_lib.StatsTestMixin,
         1, "db_request_latency", fields=["ReadAllGRRUsers"]):
       self.db.ReadAllGRRUsers()
 
+  def testQueueNotificationStateChangesOnWrite(self):
+    queue = mysql_flows.FLOW_PROCESSING_QUEUE
+    client_id, flow_id = self._SetupClientAndFlow()
+    state = self.db.delegate._ReadQueueNotificationState(queue)
+
+    self.db.WriteFlowProcessingRequests([
+        rdf_flows.FlowProcessingRequest(client_id=client_id, flow_id=flow_id)
+    ])
+
+    self.assertNotEqual(
+        self.db.delegate._ReadQueueNotificationState(queue), state)
+
+  def testOldQueueNotificationsAreDeleted(self):
+    queue = mysql_flows.MESSAGE_HANDLER_QUEUE
+    for i in range(3):
+      self.db.WriteMessageHandlerRequests([
+          rdf_objects.MessageHandlerRequest(
+              handler_name="Testhandler", request_id=i)
+      ])
+
+    max_id, count = self.db.delegate._ReadQueueNotificationState(queue)
+    self.assertGreaterEqual(count, 3)
+
+    self.db.delegate._DeleteQueueNotifications(queue, max_id)
+    self.assertEqual(
+        self.db.delegate._ReadQueueNotificationState(queue), (max_id, 1))
+
+  def testQueueNotifierWakesUpWaitingHandler(self):
+    notifier = mysql_flows.QueueNotifier(mysql_flows.FLOW_PROCESSING_QUEUE)
+    # Without a state change the waiting handler is only woken up by the
+    # notifier.
+    read_state_fn = lambda: None
+
+    thread = threading.Thread(
+        target=notifier.Wait, args=(read_state_fn, lambda: False))
+    thread.start()
+    notifier.Notify()
+    thread.join(2)
+    self.assertFalse(thread.is_alive())
+
   # Tests that we don't expect to pass yet.
 
   # TODO(hanuszczak): Remove these once artifacts are supported in MySQL.
@@ -217,135 +260,9 @@ class TestMysqlDB(stats_test_lib.StatsTestMixin,
   def testWritePathInfosRawValidates(self):
     pass
 
-  def testWritePathInfosValidatesClient(self):
-    pass
-
-  def testWritePathInfosMetadata(self):
-    pass
-
-  def testWritePathInfosMetadataTimestampUpdate(self):
-    pass
-
-  def testWritePathInfosStatEntry(self):
-    pass
-
-  def testWritePathInfosExpansion(self):
-    pass
-
-  def testWritePathInfosTypeSeparated(self):
-    pass
-
-  def testWritePathInfosUpdates(self):
-    pass
-
-  def testWritePathInfosUpdatesAncestors(self):
-    pass
-
-  def testMultiWritePathInfos(self):
-    pass
-
-  def testWriteStatHistory(self):
-    pass
-
-  def testWriteHashHistory(self):
-    pass
-
-  def testMultiWriteHistoryEmpty(self):
-    pass
-
-  def testMultiWriteHistoryStatAndHash(self):
-    pass
-
-  def testMultiWriteHistoryTwoPathTypes(self):
-    pass
-
-  def testMultiWriteHistoryTwoPaths(self):
-    pass
-
-  def testMultiWriteHistoryTwoClients(self):
-    pass
-
-  def testMultiWriteHistoryDoesNotAllowOverridingStat(self):
-    pass
-
-  def testMultiWriteHistoryDoesNotAllowOverridingHash(self):
-    pass
-
-  def testMultiWriteHistoryRaisesOnNonExistingPathsForStat(self):
-    pass
-
-  def testMultiWriteHistoryRaisesOnNonExistingPathForHash(self):
-    pass
-
-  def testReadPathInfosNonExistent(self):
-    pass
-
-  def testReadPathInfoNonExistent(self):
-    pass
-
-  def testReadPathInfoTimestampStatEntry(self):
-    pass
-
-  def testReadPathInfosMany(self):
-    pass
-
-  def testWritePathInfosDuplicatedData(self):
-    pass
-
-  def testWritePathInfosStoresCopy(self):
-    pass
-
-  def testListDescendentPathInfosEmptyResult(self):
-    pass
-
-  def testListDescendentPathInfosSingleResult(self):
-    pass
-
-  def testListDescendentPathInfosSingle(self):
-    pass
-
-  def testListDescendentPathInfosBranching(self):
-    pass
-
-  def testListDescendentPathInfosLimited(self):
-    pass
-
-  def testListDescendentPathInfosTypeSeparated(self):
-    pass
-
-  def testListDescendentPathInfosAll(self):
-    pass
-
-  def testListDescendentPathInfosLimitedDirectory(self):
-    pass
-
-  def testListChildPathInfosRoot(self):
-    pass
-
-  def testListChildPathInfosDetails(self):
-    pass
-
-  def testListChildPathInfosDeepSorted(self):
-    pass
-
   # TODO(hanuszczak): Remove these once support for storing file hashes in
   # the MySQL backend is ready.
 
-  def testWritePathInfosHashEntry(self):
-    pass
-
-  def testWritePathInfosHashAndStatEntry(self):
-    pass
-
-  def testWritePathInfoHashAndStatEntrySeparateWrites(self):
-    pass
-
-  def testReadPathInfoTimestampHashEntry(self):
-    pass
-
-  def testReadPathInfoTimestampStatAndHashEntry(self):
-    pass
-
   def testReadingNonExistentBlobReturnsNone(self):
     pass
 
@@ -373,78 +290,6 @@ class TestMysqlDB(stats_test_lib.StatsTestMixin,
   def testMultipleHashBlobReferencesCanBeWrittenAndReadBack(self):
     pass
 
-  def testReadPathInfoOlder(self):
-    pass
-
-  def testReadPathInfosHistoriesEmpty(self):
-    pass
-
-  def testReadPathInfosHistoriesDoesNotRaiseOnUnknownClient(self):
-    pass
-
-  def testReadPathInfosHistoriesWithSingleFileWithSingleHistoryItem(self):
-    pass
-
-  def testReadPathInfosHistoriesWithTwoFilesWithSingleHistoryItemEach(self):
-    pass
-
-  def testReadPathInfosHistoriesWithTwoFilesWithTwoHistoryItems(self):
-    pass
-
-  def testInitPathInfosValidatesClient(self):
-    pass
-
-  def testInitPathInfosEmpty(self):
-    pass
-
-  def testInitPathInfosWriteSingle(self):
-    pass
-
-  def testInitPathInfosWriteMany(self):
-    pass
-
-  def testInitPathInfosTree(self):
-    pass
-
-  def testInitPathInfosClearsStatHistory(self):
-    pass
-
-  def testInitPathInfosClearsHashHistory(self):
-    pass
-
-  def testInitPathInfosRetainsIndirectPathHistory(self):
-    pass
-
-  def testMultiInitPathInfos(self):
-    pass
-
-  def testMultiInitPathInfosEmptyDoesNotThrow(self):
-    pass
-
-  def testMultiInitPathInfosNoPathsDoesNotThrow(self):
-    pass
-
-  def testClearPathHistoryEmpty(self):
-    pass
-
-  def testClearPathHistorySingle(self):
-    pass
-
-  def testClearPathHistoryManyRecords(self):
-    pass
-
-  def testClearPathHistoryOnlyDirect(self):
-    pass
-
-  def testMultiClearPathHistoryEmptyDoesNotRaise(self):
-    pass
-
-  def testMultiClearPathHistoryNoPathsDoesNotRaise(self):
-    pass
-
-  def testMultiClearPathHistoryClearsMultipleHistories(self):
-    pass
-
   def testWritesAndReadsSingleFlowResultOfSingleType(self):
     pass
 
@@ -505,6 +350,8 @@ class TestMysqlDB(stats_test_lib.StatsTestMixin,
   def testCountFlowLogEntriesReturnsCorrectFlowLogEntriesCount(self):
     pass
 
+  # TODO(hanuszczak): These depend on hash blob references, remove them once
+  # blobs are supported in MySQL.
   def testReadLatestPathInfosReturnsNothingForNonExistingPaths(self):
     pass
 
@@ -29,6 +29,43 @@ def IntToFlowID(flow_id):
   return "%08X" % flow_id
 
 
+def ComponentsToPath(components):
+  """Converts a list of path components to a canonical path representation.
+
+  Args:
+    components: A sequence of path components.
+
+  Returns:
+    A canonical MySQL path representation, e.g. "/foo/bar" for ("foo", "bar")
+    and "" for the root path.
+
+  Raises:
+    ValueError: A path component contains a slash.
+  """
+  for component in components:
+    if "/" in component:
+      raise ValueError("Path component with '/' in: %s" % (components,))
+
+  if components:
+    return "/" + "/".join(components)
+  else:
+    return ""
+
+
+def PathToComponents(path):
+  """Converts a canonical path representation to a tuple of path components."""
+  if path:
+    return tuple(path.split("/")[1:])
+  else:
+    return ()
+
+
+def EscapeWildcards(string):
+  """Escapes wildcard characters of a string used in a LIKE expression."""
+  return string.replace("\\", "\\\\").replace("%", "\\%").replace(
+      "_", "\\_")
+
+
 def StringToRDFProto(proto_type, value):
   return value if value is None else proto_type.FromSerializedString(value)
 
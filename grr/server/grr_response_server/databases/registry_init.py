@@ -4,11 +4,13 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 from grr_response_server.databases import mem
+from grr_response_server.databases import sqlite
 
 # All available databases go into this registry.
 REGISTRY = {}
 
 REGISTRY["InMemoryDB"] = mem.InMemoryDB
+REGISTRY["SqliteDB"] = sqlite.SqliteDB
 
 # TODO(amoser): Import MySQL relational here.
 
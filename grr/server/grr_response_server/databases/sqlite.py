@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+"""SQLite implementation of the GRR relational database abstraction.
+
+See grr/server/db.py for interface.
+
+The database is kept in a single file in WAL mode, so that readers never block
+the single writer. Every thread uses its own connection to the file.
+"""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import logging
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core import config
+from grr_response_core.lib import utils
+from grr_response_server import db as db_module
+from grr_response_server import threadpool
+from grr_response_server.databases import sqlite_artifacts
+from grr_response_server.databases import sqlite_blobs
+from grr_response_server.databases import sqlite_clients
+from grr_response_server.databases import sqlite_cronjobs
+from grr_response_server.databases import sqlite_ddl
+from grr_response_server.databases import sqlite_events
+from grr_response_server.databases import sqlite_flows
+from grr_response_server.databases import sqlite_foreman_rules
+from grr_response_server.databases import sqlite_paths
+from grr_response_server.databases import sqlite_stats
+from grr_response_server.databases import sqlite_users
+
+# Maximum retry count:
+_MAX_RETRY_COUNT = 5
+
+
+def _IsRetryable(error):
+  """Returns whether error is likely to be retryable."""
+  if not isinstance(error, sqlite3.OperationalError):
+    return False
+  message = str(error)
+  return "database is locked" in message or "database is busy" in message
+
+
+# pyformat: disable
+class SqliteDB(sqlite_artifacts.SqliteDBArtifactsMixin,
+               sqlite_blobs.SqliteDBBlobsMixin,
+               sqlite_clients.SqliteDBClientMixin,
+               sqlite_cronjobs.SqliteDBCronJobMixin,
+               sqlite_events.SqliteDBEventMixin,
+               sqlite_flows.SqliteDBFlowMixin,
+               sqlite_foreman_rules.SqliteDBForemanRulesMixin,
+               sqlite_paths.SqliteDBPathMixin,
+               sqlite_stats.SqliteDBStatsMixin,
+               sqlite_users.SqliteDBUsersMixin,
+               db_module.Database):
+  """Implements db_module.Database using SQLite.
+  # pyformat: enable
+
+  See server/db.py for a full description of the interface.
+  """
+
+  def __init__(self, path=None, busy_timeout=None):
+    """Opens the database, creating it if needed.
+
+    Args:
+      path: A path of the database file. Defaults to the `SqliteDB.path`
+        configuration option. Since every thread opens its own connection, the
+        path has to refer to a file, in-memory databases are not supported.
+      busy_timeout: A number of seconds a transaction waits for a lock held by
+        another connection before it is retried. Defaults to the
+        `SqliteDB.busy_timeout` configuration option.
+    """
+    if path is None:
+      path = config.CONFIG["SqliteDB.path"]
+    if busy_timeout is None:
+      busy_timeout = config.CONFIG["SqliteDB.busy_timeout"]
+
+    self._path = path
+    self._busy_timeout = busy_timeout
+
+    # Holds the connection of each thread and whether the thread is in a
+    # transaction.
+    self._local = threading.local()
+    # Maps threads to their connections, so that connections of threads that
+    # have finished can be closed.
+    self._connections = {}
+    self._connections_lock = threading.Lock()
+
+    directory = os.path.dirname(path)
+    if directory:
+      utils.EnsureDirExists(directory)
+
+    connection = self._GetConnection()
+    # The journal mode is persistent, it only needs to be set once per file.
+    connection.execute("PRAGMA journal_mode = WAL")
+    self._InitializeSchema(connection)
+
+    self.handler_thread = None
+    self.handler_stop = True
+    self.message_handler_notifier = sqlite_flows.QueueNotifier()
+
+    self.flow_processing_request_handler_thread = None
+    self.flow_processing_request_handler_stop = None
+    self.flow_processing_notifier = sqlite_flows.QueueNotifier()
+    self.flow_processing_request_handler_pool = (
+        threadpool.ThreadPool.Factory(
+            "flow_processing_pool", min_threads=2, max_threads=50))
+    self.flow_processing_request_handler_pool.Start()
+
+  def Close(self):
+    """Stops the request handlers and closes all connections."""
+    self.UnregisterMessageHandler()
+    self.UnregisterFlowProcessingHandler()
+    self.flow_processing_request_handler_pool.Stop()
+
+    with self._connections_lock:
+      for connection in self._connections.values():
+        connection.close()
+      self._connections = {}
+    self._local = threading.local()
+
+  def _Connect(self):
+    connection = sqlite3.connect(
+        self._path,
+        timeout=self._busy_timeout,
+        # Transactions are started explicitly by _RunInTransaction.
+        isolation_level=None,
+        # Connections of finished threads are closed by other threads.
+        check_same_thread=False)
+    connection.execute("PRAGMA foreign_keys = ON")
+    # In WAL mode, this is safe against corruption. Only the transactions
+    # committed right before a power loss may get rolled back.
+    connection.execute("PRAGMA synchronous = NORMAL")
+    return connection
+
+  def _GetConnection(self):
+    """Returns the connection of the calling thread."""
+    connection = getattr(self._local, "connection", None)
+    if connection is not None:
+      return connection
+
+    connection = self._Connect()
+    self._local.connection = connection
+
+    with self._connections_lock:
+      for thread in list(self._connections):
+        if not thread.is_alive():
+          self._connections.pop(thread).close()
+      self._connections[threading.current_thread()] = connection
+
+    return connection
+
+  def _ReadDataVersion(self):
+    """Returns a value that changes when other connections commit changes."""
+    return self._GetConnection().execute("PRAGMA data_version").fetchone()[0]
+
+  def _InitializeSchema(self, connection):
+    """Initialize the database's schema."""
+    for command in sqlite_ddl.SCHEMA_SETUP:
+      try:
+        connection.execute(command)
+      except Exception:
+        logging.error("Failed to execute DDL: %s", command)
+        raise
+
+  def _RunInTransaction(self, function, readonly=False):
+    """Runs function within a transaction.
+
+    Begins a transaction on the connection of the calling thread and passes
+    the connection to function. If the thread is already in a transaction,
+    function joins it instead.
+
+    If function finishes without raising, the transaction is committed.
+
+    If function raises, the transaction will be rolled back, if the database
+    was locked by another connection, the operation may be repeated.
+
+    Args:
+      function: A function to be run, must accept a single sqlite3.Connection
+        parameter.
+      readonly: Indicates that only a readonly (snapshot) transaction is
+        required.
+
+    Returns:
+      The value returned by the last call to function.
+
+    Raises: Any exception raised by function.
+    """
+    connection = self._GetConnection()
+    if getattr(self._local, "in_transaction", False):
+      return function(connection)
+
+    # Write transactions take the write lock right away. Otherwise, upgrading
+    # a read transaction to a write transaction fails without waiting if
+    # another connection committed in the meantime.
+    start_query = "BEGIN" if readonly else "BEGIN IMMEDIATE"
+
+    for retry_count in range(_MAX_RETRY_COUNT):
+      try:
+        connection.execute(start_query)
+        self._local.in_transaction = True
+        try:
+          ret = function(connection)
+          connection.execute("COMMIT")
+          return ret
+        except:
+          try:
+            connection.execute("ROLLBACK")
+          except sqlite3.Error:
+            # The transaction was already rolled back by SQLite.
+            pass
+          raise
+        finally:
+          self._local.in_transaction = False
+      except sqlite3.OperationalError as e:
+        # Re-raise if this was the last attempt.
+        if retry_count + 1 >= _MAX_RETRY_COUNT or not _IsRetryable(e):
+          raise
+      # Simple delay, with jitter.
+      time.sleep(random.uniform(0.1, 0.2) * math.pow(1.5, retry_count))
+    # Shouldn't happen, because we should have re-raised whatever caused the
+    # last try to fail.
+    raise Exception("Looped ended early - last exception swallowed.")  # pylint: disable=g-doc-exception
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""The SQLite database methods for handling artifacts."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import sqlite3
+
+from grr_response_core.lib.rdfvalues import artifacts as rdf_artifacts
+from grr_response_server import db
+from grr_response_server.databases import sqlite_utils
+
+
+class SqliteDBArtifactsMixin(object):
+  """An SQLite database mixin with artifact-related methods."""
+
+  @sqlite_utils.WithTransaction()
+  def WriteArtifact(self, artifact, cursor=None):
+    """Writes new artifact to the database."""
+    name = unicode(artifact.name)
+
+    try:
+      cursor.execute("INSERT INTO artifacts (name, definition) VALUES (?, ?)",
+                     [name, sqlite_utils.Blob(artifact.SerializeToString())])
+    except sqlite3.IntegrityError as e:
+      raise db.DuplicatedArtifactError(name, cause=e)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadArtifact(self, name, cursor=None):
+    """Looks up an artifact with given name from the database."""
+    cursor.execute("SELECT definition FROM artifacts WHERE name = ?", [name])
+    row = cursor.fetchone()
+    if row is None:
+      raise db.UnknownArtifactError(name)
+
+    return sqlite_utils.BlobToRDFProto(rdf_artifacts.Artifact, row[0])
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadAllArtifacts(self, cursor=None):
+    """Lists all artifacts that are stored in the database."""
+    cursor.execute("SELECT definition FROM artifacts")
+    return [
+        sqlite_utils.BlobToRDFProto(rdf_artifacts.Artifact, definition)
+        for definition, in cursor.fetchall()
+    ]
+
+  @sqlite_utils.WithTransaction()
+  def DeleteArtifact(self, name, cursor=None):
+    """Deletes an artifact with given name from the database."""
+    cursor.execute("DELETE FROM artifacts WHERE name = ?", [name])
+    if cursor.rowcount == 0:
+      raise db.UnknownArtifactError(name)
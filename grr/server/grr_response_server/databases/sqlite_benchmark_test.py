@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Benchmarks comparing the SQLite database with the in-memory database."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import os
+import shutil
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_server.databases import mem
+from grr_response_server.databases import sqlite
+from grr_response_server.rdfvalues import flow_objects as rdf_flow_objects
+from grr_response_server.rdfvalues import objects as rdf_objects
+from grr.test_lib import benchmark_test_lib
+from grr.test_lib import temp
+from grr.test_lib import test_lib
+
+_CLIENT_ID = "C.0000000000000001"
+_FLOW_ID = "ABCDEF01"
+_BATCH_SIZE = 100
+
+
+class SqliteDBBenchmark(benchmark_test_lib.AverageMicroBenchmarks):
+  """Measures the throughput of common operations against InMemoryDB."""
+
+  REPEATS = 100
+
+  def setUp(self):
+    super(SqliteDBBenchmark, self).setUp()
+
+    temp_dir = temp.TempDirPath()
+    self.addCleanup(shutil.rmtree, temp_dir)
+
+    sqlite_db = sqlite.SqliteDB(path=os.path.join(temp_dir, "grr.sqlite"))
+    self.addCleanup(sqlite_db.Close)
+
+    self.dbs = [("InMemoryDB", mem.InMemoryDB()), ("SqliteDB", sqlite_db)]
+    for _, db in self.dbs:
+      db.WriteClientMetadata(_CLIENT_ID, fleetspeak_enabled=False)
+      db.WriteFlowObject(
+          rdf_flow_objects.Flow(client_id=_CLIENT_ID, flow_id=_FLOW_ID))
+
+  def _TimeAll(self, name, callback_fn):
+    """Times a callback returned by callback_fn(db) for every database."""
+    for db_name, db in self.dbs:
+      self.TimeIt(callback_fn(db), "%s: %s" % (db_name, name))
+
+  def testClientMetadata(self):
+    counter = [0]
+
+    def Write(db):
+
+      def Callback():
+        counter[0] += 1
+        db.WriteClientMetadata(
+            "C.%016x" % counter[0], fleetspeak_enabled=False)
+
+      return Callback
+
+    self._TimeAll("Write client metadata", Write)
+    self._TimeAll("Read client full info",
+                  lambda db: lambda: db.ReadClientFullInfo(_CLIENT_ID))
+
+  def testFlowObjects(self):
+    flow_obj = rdf_flow_objects.Flow(client_id=_CLIENT_ID, flow_id=_FLOW_ID)
+
+    self._TimeAll("Write flow object",
+                  lambda db: lambda: db.WriteFlowObject(flow_obj))
+    self._TimeAll("Read flow object",
+                  lambda db: lambda: db.ReadFlowObject(_CLIENT_ID, _FLOW_ID))
+
+  def testFlowResults(self):
+    results = [
+        rdf_flow_objects.FlowResult(
+            tag="tag", payload=rdf_client_fs.StatEntry(st_size=i))
+        for i in range(_BATCH_SIZE)
+    ]
+
+    self._TimeAll(
+        "Write %d flow results" % _BATCH_SIZE,
+        lambda db: lambda: db.WriteFlowResults(_CLIENT_ID, _FLOW_ID, results))
+    self._TimeAll(
+        "Read %d flow results" % _BATCH_SIZE, lambda db: lambda: len(
+            db.ReadFlowResults(_CLIENT_ID, _FLOW_ID, 0, _BATCH_SIZE)))
+    self._TimeAll(
+        "Count flow results with tag",
+        lambda db: lambda: db.CountFlowResults(
+            _CLIENT_ID, _FLOW_ID, with_tag="tag"))
+
+  def testPathInfos(self):
+    path_infos = []
+    for i in range(_BATCH_SIZE):
+      stat_entry = rdf_client_fs.StatEntry(st_size=i, st_mode=0o100644)
+      path_infos.append(
+          rdf_objects.PathInfo.OS(
+              components=["dir%03d" % (i % 10), "file%03d" % i],
+              stat_entry=stat_entry))
+    path_type = rdf_objects.PathInfo.PathType.OS
+
+    self._TimeAll(
+        "Write %d paths" % _BATCH_SIZE,
+        lambda db: lambda: db.WritePathInfos(_CLIENT_ID, path_infos))
+    self._TimeAll(
+        "List descendants of root", lambda db: lambda: len(
+            db.ListDescendentPathInfos(_CLIENT_ID, path_type, ())))
+    self._TimeAll(
+        "List children of a directory", lambda db: lambda: len(
+            db.ListChildPathInfos(_CLIENT_ID, path_type, ("dir005",))))
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""The SQLite database methods for blobs handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from future.utils import iteritems
+
+from grr_response_core.lib.util import collection
+from grr_response_server.databases import sqlite_utils
+from grr_response_server.rdfvalues import objects as rdf_objects
+
+
+class SqliteDBBlobsMixin(object):
+  """SqliteDB mixin for blobs related functions."""
+
+  @sqlite_utils.WithTransaction()
+  def WriteBlobs(self, blob_id_data_map, cursor=None):
+    """Writes given blobs."""
+    # Blobs are content-addressed, so an existing blob never needs updating.
+    cursor.executemany(
+        "INSERT OR IGNORE INTO blobs (blob_id, blob_data) VALUES (?, ?)",
+        [(sqlite_utils.Blob(blob_id.AsBytes()), sqlite_utils.Blob(blob_data))
+         for blob_id, blob_data in iteritems(blob_id_data_map)])
+
+  def _ReadBlobColumn(self, column, blob_ids, cursor):
+    """Yields (blob id, value of the given column) pairs of existing blobs."""
+    blob_ids_by_bytes = {blob_id.AsBytes(): blob_id for blob_id in blob_ids}
+    for batch in collection.Batch(
+        list(blob_ids_by_bytes), sqlite_utils.MAX_QUERY_PARAMETERS):
+      query = "SELECT blob_id, {} FROM blobs WHERE blob_id IN ({})".format(
+          column, sqlite_utils.Placeholders(len(batch)))
+      cursor.execute(query, [sqlite_utils.Blob(b) for b in batch])
+      for blob_id, value in cursor.fetchall():
+        yield blob_ids_by_bytes[bytes(blob_id)], value
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadBlobs(self, blob_ids, cursor=None):
+    """Reads given blobs."""
+    result = {blob_id: None for blob_id in blob_ids}
+    for blob_id, blob_data in self._ReadBlobColumn("blob_data", blob_ids,
+                                                   cursor):
+      result[blob_id] = bytes(blob_data)
+    return result
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def CheckBlobsExist(self, blob_ids, cursor=None):
+    """Checks if given blobs exist."""
+    result = {blob_id: False for blob_id in blob_ids}
+    for blob_id, _ in self._ReadBlobColumn("1", blob_ids, cursor):
+      result[blob_id] = True
+    return result
+
+  @sqlite_utils.WithTransaction()
+  def WriteHashBlobReferences(self, references_by_hash, cursor=None):
+    """Writes blob references for a given set of hashes."""
+    cursor.executemany(
+        "INSERT OR REPLACE INTO hash_blob_references "
+        "(hash_id, blob_references) VALUES (?, ?)", [
+            (sqlite_utils.Blob(hash_id.AsBytes()),
+             sqlite_utils.Blob(
+                 rdf_objects.BlobReferences(items=refs).SerializeToString()))
+            for hash_id, refs in iteritems(references_by_hash)
+        ])
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadHashBlobReferences(self, hashes, cursor=None):
+    """Reads blob references of a given set of hashes."""
+    result = {hash_id: None for hash_id in hashes}
+    hashes_by_bytes = {hash_id.AsBytes(): hash_id for hash_id in hashes}
+    for batch in collection.Batch(
+        list(hashes_by_bytes), sqlite_utils.MAX_QUERY_PARAMETERS):
+      query = ("SELECT hash_id, blob_references FROM hash_blob_references "
+               "WHERE hash_id IN ({})").format(
+                   sqlite_utils.Placeholders(len(batch)))
+      cursor.execute(query, [sqlite_utils.Blob(h) for h in batch])
+      for hash_id, blob_references in cursor.fetchall():
+        refs = sqlite_utils.BlobToRDFProto(rdf_objects.BlobReferences,
+                                           blob_references)
+        result[hashes_by_bytes[bytes(hash_id)]] = list(refs.items)
+    return result
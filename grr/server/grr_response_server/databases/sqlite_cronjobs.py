@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""The SQLite database methods for cron job handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import sqlite3
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib import utils
+from grr_response_core.lib.rdfvalues import protodict as rdf_protodict
+from grr_response_core.lib.util import collection
+from grr_response_server import db
+from grr_response_server.databases import sqlite_utils
+from grr_response_server.rdfvalues import cronjobs as rdf_cronjobs
+
+_CRON_JOB_COLUMNS = ("job, create_time, enabled, forced_run_requested, "
+                     "last_run_status, last_run_time, current_run_id, state, "
+                     "leased_until, leased_by")
+
+
+class SqliteDBCronJobMixin(object):
+  """SqliteDB mixin for cronjob related functions."""
+
+  @sqlite_utils.WithTransaction()
+  def WriteCronJob(self, cronjob, cursor=None):
+    """Writes a cronjob to the database."""
+    create_time = sqlite_utils.RDFDatetimeToInt(cronjob.created_at or
+                                                rdfvalue.RDFDatetime.Now())
+    cursor.execute(
+        "INSERT OR IGNORE INTO cron_jobs "
+        "(job_id, job, create_time, enabled) VALUES (?, ?, ?, ?)", [
+            cronjob.cron_job_id,
+            sqlite_utils.Blob(cronjob.SerializeToString()), create_time,
+            int(bool(cronjob.enabled))
+        ])
+    if not cursor.rowcount:
+      cursor.execute("UPDATE cron_jobs SET enabled = ? WHERE job_id = ?",
+                     [int(bool(cronjob.enabled)), cronjob.cron_job_id])
+
+  def _CronJobFromRow(self, row):
+    """Creates a cronjob object from a database result row."""
+    (job, create_time, enabled, forced_run_requested, last_run_status,
+     last_run_time, current_run_id, state, leased_until, leased_by) = row
+
+    job = sqlite_utils.BlobToRDFProto(rdf_cronjobs.CronJob, job)
+    job.current_run_id = current_run_id
+    job.enabled = bool(enabled)
+    if forced_run_requested is not None:
+      job.forced_run_requested = bool(forced_run_requested)
+    job.last_run_status = last_run_status
+    job.last_run_time = sqlite_utils.IntToRDFDatetime(last_run_time)
+    if state:
+      job.state = sqlite_utils.BlobToRDFProto(rdf_protodict.AttributedDict,
+                                              state)
+    job.created_at = sqlite_utils.IntToRDFDatetime(create_time)
+    job.leased_until = sqlite_utils.IntToRDFDatetime(leased_until)
+    job.leased_by = leased_by
+    return job
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadCronJobs(self, cronjob_ids=None, cursor=None):
+    """Reads all cronjobs from the database."""
+    query = "SELECT {} FROM cron_jobs".format(_CRON_JOB_COLUMNS)
+    if cronjob_ids is None:
+      cursor.execute(query)
+      return [self._CronJobFromRow(row) for row in cursor.fetchall()]
+
+    res = []
+    for batch in collection.Batch(cronjob_ids,
+                                  sqlite_utils.MAX_QUERY_PARAMETERS):
+      cursor.execute(
+          query + " WHERE job_id IN ({})".format(
+              sqlite_utils.Placeholders(len(batch))), batch)
+      res.extend(self._CronJobFromRow(row) for row in cursor.fetchall())
+
+    if len(res) != len(set(cronjob_ids)):
+      missing = set(cronjob_ids) - set([c.cron_job_id for c in res])
+      raise db.UnknownCronJobError(
+          "CronJob(s) with id(s) %s not found." % missing)
+    return res
+
+  def _SetCronEnabledBit(self, cronjob_id, enabled, cursor=None):
+    cursor.execute("UPDATE cron_jobs SET enabled = ? WHERE job_id = ?",
+                   [int(enabled), cronjob_id])
+    if cursor.rowcount != 1:
+      raise db.UnknownCronJobError("CronJob with id %s not found." % cronjob_id)
+
+  @sqlite_utils.WithTransaction()
+  def EnableCronJob(self, cronjob_id, cursor=None):
+    self._SetCronEnabledBit(cronjob_id, True, cursor=cursor)
+
+  @sqlite_utils.WithTransaction()
+  def DisableCronJob(self, cronjob_id, cursor=None):
+    self._SetCronEnabledBit(cronjob_id, False, cursor=cursor)
+
+  @sqlite_utils.WithTransaction()
+  def DeleteCronJob(self, cronjob_id, cursor=None):
+    # Runs of the job are deleted by the ON DELETE CASCADE clause.
+    cursor.execute("DELETE FROM cron_jobs WHERE job_id = ?", [cronjob_id])
+    if cursor.rowcount != 1:
+      raise db.UnknownCronJobError("CronJob with id %s not found." % cronjob_id)
+
+  @sqlite_utils.WithTransaction()
+  def UpdateCronJob(self,
+                    cronjob_id,
+                    last_run_status=db.Database.unchanged,
+                    last_run_time=db.Database.unchanged,
+                    current_run_id=db.Database.unchanged,
+                    state=db.Database.unchanged,
+                    forced_run_requested=db.Database.unchanged,
+                    cursor=None):
+    """Updates run information for an existing cron job."""
+    updates = []
+    args = []
+    if last_run_status != db.Database.unchanged:
+      updates.append("last_run_status = ?")
+      args.append(int(last_run_status))
+    if last_run_time != db.Database.unchanged:
+      updates.append("last_run_time = ?")
+      args.append(sqlite_utils.RDFDatetimeToInt(last_run_time))
+    if current_run_id != db.Database.unchanged:
+      updates.append("current_run_id = ?")
+      args.append(current_run_id)
+    if state != db.Database.unchanged:
+      updates.append("state = ?")
+      args.append(sqlite_utils.Blob(state.SerializeToString()))
+    if forced_run_requested != db.Database.unchanged:
+      updates.append("forced_run_requested = ?")
+      args.append(int(bool(forced_run_requested)))
+
+    if not updates:
+      return
+
+    query = "UPDATE cron_jobs SET "
+    query += ", ".join(updates)
+    query += " WHERE job_id = ?"
+    cursor.execute(query, args + [cronjob_id])
+    if cursor.rowcount != 1:
+      raise db.UnknownCronJobError("CronJob with id %s not found." % cronjob_id)
+
+  @sqlite_utils.WithTransaction()
+  def LeaseCronJobs(self, cronjob_ids=None, lease_time=None, cursor=None):
+    """Leases all available cron jobs."""
+    now = rdfvalue.RDFDatetime.Now()
+    now_int = sqlite_utils.RDFDatetimeToInt(now)
+    expiry_int = sqlite_utils.RDFDatetimeToInt(now + lease_time)
+    id_str = utils.ProcessIdString()
+
+    query = ("UPDATE cron_jobs SET leased_until = ?, leased_by = ? "
+             "WHERE (leased_until IS NULL OR leased_until < ?)")
+    args = [expiry_int, id_str, now_int]
+
+    if cronjob_ids:
+      query += " AND job_id IN ({})".format(
+          sqlite_utils.Placeholders(len(cronjob_ids)))
+      args += cronjob_ids
+
+    cursor.execute(query, args)
+    if cursor.rowcount == 0:
+      return []
+
+    cursor.execute(
+        "SELECT {} FROM cron_jobs WHERE leased_until = ? AND leased_by = ?"
+        .format(_CRON_JOB_COLUMNS), [expiry_int, id_str])
+    return [self._CronJobFromRow(row) for row in cursor.fetchall()]
+
+  @sqlite_utils.WithTransaction()
+  def ReturnLeasedCronJobs(self, jobs, cursor=None):
+    """Makes leased cron jobs available for leasing again."""
+    if not jobs:
+      return
+
+    unleased_jobs = []
+    returned = 0
+    for job in jobs:
+      if not job.leased_by or not job.leased_until:
+        unleased_jobs.append(job)
+        continue
+
+      cursor.execute(
+          "UPDATE cron_jobs SET leased_until = NULL, leased_by = NULL "
+          "WHERE job_id = ? AND leased_until = ? AND leased_by = ?", [
+              job.cron_job_id,
+              sqlite_utils.RDFDatetimeToInt(job.leased_until), job.leased_by
+          ])
+      returned += cursor.rowcount
+
+    if unleased_jobs:
+      raise ValueError("CronJobs to return are not leased: %s" % unleased_jobs)
+    if returned != len(jobs):
+      raise ValueError("%d cronjobs in %s could not be returned." % (
+          (len(jobs) - returned), jobs))
+
+  @sqlite_utils.WithTransaction()
+  def WriteCronJobRun(self, run_object, cursor=None):
+    """Stores a cron job run object in the database."""
+    write_time = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+    try:
+      cursor.execute(
+          "INSERT OR REPLACE INTO cron_job_runs "
+          "(job_id, run_id, write_time, run) VALUES (?, ?, ?, ?)", [
+              run_object.cron_job_id,
+              run_object.run_id,
+              write_time,
+              sqlite_utils.Blob(run_object.SerializeToString()),
+          ])
+    except sqlite3.IntegrityError as e:
+      raise db.UnknownCronJobError(
+          "CronJob with id %s not found." % run_object.cron_job_id, cause=e)
+
+  def _CronJobRunFromRow(self, row):
+    serialized_run, timestamp = row
+    res = sqlite_utils.BlobToRDFProto(rdf_cronjobs.CronJobRun, serialized_run)
+    res.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+    return res
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadCronJobRuns(self, job_id, cursor=None):
+    """Reads all cron job runs for a given job id."""
+    cursor.execute("SELECT run, write_time FROM cron_job_runs WHERE job_id = ?",
+                   [job_id])
+    runs = [self._CronJobRunFromRow(row) for row in cursor.fetchall()]
+    return sorted(runs, key=lambda run: run.started_at, reverse=True)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadCronJobRun(self, job_id, run_id, cursor=None):
+    """Reads a single cron job run from the db."""
+    cursor.execute(
+        "SELECT run, write_time FROM cron_job_runs "
+        "WHERE job_id = ? AND run_id = ?", [job_id, run_id])
+    row = cursor.fetchone()
+    if row is None:
+      raise db.UnknownCronJobRunError(
+          "Run with job id %s and run id %s not found." % (job_id, run_id))
+
+    return self._CronJobRunFromRow(row)
+
+  @sqlite_utils.WithTransaction()
+  def DeleteOldCronJobRuns(self, cutoff_timestamp, cursor=None):
+    """Deletes cron job runs that are older then the given timestamp."""
+    cursor.execute("DELETE FROM cron_job_runs WHERE write_time < ?",
+                   [sqlite_utils.RDFDatetimeToInt(cutoff_timestamp)])
+    return cursor.rowcount
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+"""A collection of DDL for use by the SQLite database implementation.
+
+The schema mirrors the MySQL one. Client, flow and approval ids are stored as
+text and timestamps as integer microseconds since epoch.
+"""
+
+from __future__ import absolute_import
+
+SCHEMA_SETUP = [
+    """
+CREATE TABLE IF NOT EXISTS clients(
+    client_id TEXT PRIMARY KEY,
+    last_client_timestamp INTEGER,
+    last_startup_timestamp INTEGER,
+    last_crash_timestamp INTEGER,
+    fleetspeak_enabled INTEGER,
+    certificate BLOB,
+    last_ping INTEGER,
+    last_clock INTEGER,
+    last_ip BLOB,
+    last_foreman INTEGER,
+    first_seen INTEGER
+)""", """
+CREATE TABLE IF NOT EXISTS client_labels(
+    client_id TEXT,
+    owner TEXT,
+    label TEXT,
+    PRIMARY KEY (client_id, owner, label),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+) WITHOUT ROWID""", """
+CREATE INDEX IF NOT EXISTS owner_label_idx ON client_labels(owner, label)
+""", """
+CREATE TABLE IF NOT EXISTS client_snapshot_history(
+    client_id TEXT,
+    timestamp INTEGER,
+    client_snapshot BLOB,
+    PRIMARY KEY (client_id, timestamp),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_startup_history(
+    client_id TEXT,
+    timestamp INTEGER,
+    startup_info BLOB,
+    PRIMARY KEY (client_id, timestamp),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_crash_history(
+    client_id TEXT,
+    timestamp INTEGER,
+    crash_info BLOB,
+    PRIMARY KEY (client_id, timestamp),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_keywords(
+    client_id TEXT,
+    keyword TEXT,
+    timestamp INTEGER,
+    PRIMARY KEY (client_id, keyword),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+) WITHOUT ROWID""", """
+CREATE INDEX IF NOT EXISTS keyword_client_idx
+ON client_keywords(keyword, timestamp)
+""", """
+CREATE TABLE IF NOT EXISTS grr_users(
+    username TEXT PRIMARY KEY,
+    password BLOB,
+    ui_mode INTEGER,
+    canary_mode INTEGER,
+    user_type INTEGER
+)""", """
+CREATE TABLE IF NOT EXISTS approval_request(
+    username TEXT,
+    approval_type INTEGER,
+    subject_id TEXT,
+    approval_id TEXT,
+    timestamp INTEGER,
+    expiration_time INTEGER,
+    approval_request BLOB,
+    PRIMARY KEY (username, approval_id),
+    FOREIGN KEY (username) REFERENCES grr_users (username)
+)""", """
+CREATE INDEX IF NOT EXISTS by_username_type_subject
+ON approval_request(username, approval_type, subject_id)
+""", """
+CREATE TABLE IF NOT EXISTS approval_grant(
+    username TEXT,
+    approval_id TEXT,
+    grantor_username TEXT,
+    timestamp INTEGER,
+    PRIMARY KEY (username, approval_id, grantor_username, timestamp),
+    FOREIGN KEY (username) REFERENCES grr_users (username)
+) WITHOUT ROWID""", """
+CREATE TABLE IF NOT EXISTS user_notification(
+    username TEXT,
+    timestamp INTEGER,
+    notification_state INTEGER,
+    notification BLOB,
+    PRIMARY KEY (username, timestamp),
+    FOREIGN KEY (username) REFERENCES grr_users (username)
+)""", """
+CREATE TABLE IF NOT EXISTS audit_event(
+    username TEXT,
+    urn TEXT,
+    client_id TEXT,
+    timestamp INTEGER,
+    details BLOB
+)""", """
+CREATE INDEX IF NOT EXISTS audit_event_timestamp_idx
+ON audit_event(timestamp)
+""", """
+CREATE TABLE IF NOT EXISTS message_handler_requests(
+    handlername TEXT,
+    timestamp INTEGER,
+    request_id INTEGER,
+    request BLOB,
+    leased_until INTEGER,
+    leased_by TEXT,
+    PRIMARY KEY (handlername, request_id)
+)""", """
+CREATE INDEX IF NOT EXISTS message_handler_requests_lease_idx
+ON message_handler_requests(leased_until)
+""", """
+CREATE TABLE IF NOT EXISTS foreman_rules(
+    hunt_id TEXT,
+    expiration_time INTEGER,
+    rule BLOB,
+    PRIMARY KEY (hunt_id)
+)""", """
+CREATE TABLE IF NOT EXISTS cron_jobs(
+    job_id TEXT,
+    job BLOB,
+    create_time INTEGER,
+    current_run_id TEXT,
+    enabled INTEGER,
+    forced_run_requested INTEGER,
+    last_run_time INTEGER,
+    last_run_status INTEGER,
+    state BLOB,
+    leased_until INTEGER,
+    leased_by TEXT,
+    PRIMARY KEY (job_id)
+)""", """
+CREATE TABLE IF NOT EXISTS cron_job_runs(
+    job_id TEXT,
+    run_id TEXT,
+    write_time INTEGER,
+    run BLOB,
+    PRIMARY KEY (job_id, run_id),
+    FOREIGN KEY (job_id) REFERENCES cron_jobs (job_id) ON DELETE CASCADE
+)""", """
+CREATE INDEX IF NOT EXISTS cron_job_runs_write_time_idx
+ON cron_job_runs(write_time)
+""", """
+CREATE TABLE IF NOT EXISTS client_messages(
+    client_id TEXT,
+    message_id INTEGER,
+    timestamp INTEGER,
+    message BLOB,
+    leased_until INTEGER,
+    leased_by TEXT,
+    PRIMARY KEY (client_id, message_id),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE TABLE IF NOT EXISTS flows(
+    client_id TEXT,
+    flow_id TEXT,
+    long_flow_id TEXT,
+    parent_flow_id TEXT,
+    flow BLOB,
+    client_crash_info BLOB,
+    next_request_to_process INTEGER,
+    pending_termination BLOB,
+    processing_deadline INTEGER,
+    processing_on TEXT,
+    processing_since INTEGER,
+    timestamp INTEGER,
+    last_update INTEGER,
+    PRIMARY KEY (client_id, flow_id),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE INDEX IF NOT EXISTS flows_parent_flow_idx
+ON flows(client_id, parent_flow_id)
+""", """
+CREATE TABLE IF NOT EXISTS flow_requests(
+    client_id TEXT,
+    flow_id TEXT,
+    request_id INTEGER,
+    needs_processing INTEGER,
+    responses_expected INTEGER,
+    request BLOB,
+    timestamp INTEGER,
+    PRIMARY KEY (client_id, flow_id, request_id),
+    FOREIGN KEY (client_id, flow_id) REFERENCES flows(client_id, flow_id)
+)""", """
+CREATE TABLE IF NOT EXISTS flow_responses(
+    client_id TEXT,
+    flow_id TEXT,
+    request_id INTEGER,
+    response_id INTEGER,
+    response BLOB,
+    status BLOB,
+    iterator BLOB,
+    timestamp INTEGER,
+    PRIMARY KEY (client_id, flow_id, request_id, response_id),
+    FOREIGN KEY (client_id, flow_id, request_id)
+    REFERENCES flow_requests(client_id, flow_id, request_id)
+)""", """
+CREATE TABLE IF NOT EXISTS flow_processing_requests(
+    client_id TEXT,
+    flow_id TEXT,
+    timestamp INTEGER,
+    request BLOB,
+    delivery_time INTEGER,
+    leased_until INTEGER,
+    leased_by TEXT,
+    PRIMARY KEY (client_id, flow_id, timestamp),
+    FOREIGN KEY (client_id, flow_id) REFERENCES flows(client_id, flow_id)
+)""", """
+CREATE INDEX IF NOT EXISTS flow_processing_requests_lease_idx
+ON flow_processing_requests(leased_until)
+""", """
+CREATE TABLE IF NOT EXISTS flow_results(
+    client_id TEXT NOT NULL,
+    flow_id TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    tag TEXT,
+    payload_type TEXT NOT NULL,
+    payload BLOB,
+    result BLOB NOT NULL
+)""", """
+CREATE INDEX IF NOT EXISTS flow_results_flow_idx
+ON flow_results(client_id, flow_id, timestamp)
+""", """
+CREATE INDEX IF NOT EXISTS flow_results_tag_idx
+ON flow_results(client_id, flow_id, tag, timestamp)
+""", """
+CREATE INDEX IF NOT EXISTS flow_results_type_idx
+ON flow_results(client_id, flow_id, payload_type, timestamp)
+""", """
+CREATE TABLE IF NOT EXISTS flow_log_entries(
+    client_id TEXT NOT NULL,
+    flow_id TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    message TEXT,
+    entry BLOB NOT NULL
+)""", """
+CREATE INDEX IF NOT EXISTS flow_log_entries_flow_idx
+ON flow_log_entries(client_id, flow_id, timestamp)
+""", """
+CREATE TABLE IF NOT EXISTS client_paths(
+    client_id TEXT NOT NULL,
+    path_type INTEGER NOT NULL,
+    path_id BLOB NOT NULL,
+    path TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    directory INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    last_stat_entry_timestamp INTEGER,
+    last_hash_entry_timestamp INTEGER,
+    PRIMARY KEY (client_id, path_type, path_id),
+    FOREIGN KEY (client_id) REFERENCES clients(client_id)
+)""", """
+CREATE INDEX IF NOT EXISTS client_paths_prefix_idx
+ON client_paths(client_id, path_type, path)
+""", """
+CREATE TABLE IF NOT EXISTS client_path_stat_entries(
+    client_id TEXT NOT NULL,
+    path_type INTEGER NOT NULL,
+    path_id BLOB NOT NULL,
+    timestamp INTEGER NOT NULL,
+    stat_entry BLOB NOT NULL,
+    PRIMARY KEY (client_id, path_type, path_id, timestamp),
+    FOREIGN KEY (client_id, path_type, path_id)
+    REFERENCES client_paths(client_id, path_type, path_id)
+)""", """
+CREATE TABLE IF NOT EXISTS client_path_hash_entries(
+    client_id TEXT NOT NULL,
+    path_type INTEGER NOT NULL,
+    path_id BLOB NOT NULL,
+    timestamp INTEGER NOT NULL,
+    hash_entry BLOB NOT NULL,
+    sha256 BLOB,
+    PRIMARY KEY (client_id, path_type, path_id, timestamp),
+    FOREIGN KEY (client_id, path_type, path_id)
+    REFERENCES client_paths(client_id, path_type, path_id)
+)""", """
+CREATE TABLE IF NOT EXISTS blobs(
+    blob_id BLOB PRIMARY KEY,
+    blob_data BLOB NOT NULL
+)""", """
+CREATE TABLE IF NOT EXISTS hash_blob_references(
+    hash_id BLOB PRIMARY KEY,
+    blob_references BLOB NOT NULL
+)""", """
+CREATE TABLE IF NOT EXISTS artifacts(
+    name TEXT PRIMARY KEY,
+    definition BLOB NOT NULL
+)""", """
+CREATE TABLE IF NOT EXISTS stats_store_entries(
+    entry_id BLOB PRIMARY KEY,
+    process_id TEXT NOT NULL,
+    metric_name TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    entry BLOB NOT NULL
+)""", """
+CREATE INDEX IF NOT EXISTS stats_store_entries_metric_idx
+ON stats_store_entries(metric_name, timestamp)
+""", """
+CREATE INDEX IF NOT EXISTS stats_store_entries_timestamp_idx
+ON stats_store_entries(timestamp)
+"""
+]
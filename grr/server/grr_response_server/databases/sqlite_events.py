@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""The SQLite database methods for event handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import client as rdf_client
+from grr_response_core.lib.rdfvalues import events as rdf_events
+from grr_response_server.databases import sqlite_utils
+
+
+class SqliteDBEventMixin(object):
+  """SqliteDB mixin for event handling."""
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadAllAuditEvents(self, cursor=None):
+    """Reads all audit events stored in the database."""
+    cursor.execute("""
+        SELECT username, urn, client_id, timestamp, details
+        FROM audit_event
+        ORDER BY timestamp, rowid
+    """)
+
+    result = []
+    for username, urn, client_id, timestamp, details in cursor.fetchall():
+      event = sqlite_utils.BlobToRDFProto(rdf_events.AuditEvent, details)
+      event.user = username
+      if urn:
+        event.urn = rdfvalue.RDFURN(urn)
+      if client_id is not None:
+        event.client = rdf_client.ClientURN(client_id)
+      event.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      result.append(event)
+
+    return result
+
+  @sqlite_utils.WithTransaction()
+  def WriteAuditEvent(self, event, cursor=None):
+    """Writes an audit event to the database."""
+    event = event.Copy()
+
+    if event.HasField("user"):
+      username = event.user
+      event.user = None
+    else:
+      username = None
+
+    if event.HasField("urn"):
+      urn = str(event.urn)
+      event.urn = None
+    else:
+      urn = None
+
+    if event.HasField("client"):
+      client_id = event.client.Basename()
+      event.client = None
+    else:
+      client_id = None
+
+    if event.HasField("timestamp"):
+      timestamp = sqlite_utils.RDFDatetimeToInt(event.timestamp)
+      event.timestamp = None
+    else:
+      timestamp = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    details = sqlite_utils.Blob(event.SerializeToString())
+
+    query = """
+    INSERT INTO audit_event (username, urn, client_id, timestamp, details)
+    VALUES (?, ?, ?, ?, ?)
+    """
+    cursor.execute(query, (username, urn, client_id, timestamp, details))
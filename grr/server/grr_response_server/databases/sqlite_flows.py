@@ -0,0 +1,1162 @@
+#!/usr/bin/env python
+"""The SQLite database methods for flow handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import logging
+import sqlite3
+import threading
+import time
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib import utils
+from grr_response_core.lib.rdfvalues import client as rdf_client
+from grr_response_core.lib.rdfvalues import flows as rdf_flows
+from grr_response_core.lib.util import collection
+from grr_response_core.lib.util import compatibility
+from grr_response_server import db
+from grr_response_server import db_utils
+from grr_response_server.databases import sqlite_utils
+from grr_response_server.rdfvalues import flow_objects as rdf_flow_objects
+from grr_response_server.rdfvalues import objects as rdf_objects
+
+# How often a waiting handler checks the database for commits made through
+# other connections.
+_NOTIFICATION_CHECK_INTERVAL = 0.1
+
+# The longest a handler waits before it polls the request table regardless of
+# notifications. This picks up requests whose delivery time has come and
+# expired leases.
+_MAX_NOTIFICATION_WAIT = 5
+
+# Every flow, request and response key contributes this many parameters to a
+# query. Batches of keys are sized so that queries stay below the SQLite
+# parameter limit.
+_MAX_FLOW_KEYS = sqlite_utils.MAX_QUERY_PARAMETERS // 2
+_MAX_REQUEST_KEYS = sqlite_utils.MAX_QUERY_PARAMETERS // 3
+
+_FLOW_CONDITION = "(client_id = ? AND flow_id = ?)"
+_REQUEST_CONDITION = "(client_id = ? AND flow_id = ? AND request_id = ?)"
+
+
+class QueueNotifier(object):
+  """Wakes up a handler waiting for new requests in a queue.
+
+  Writers in the same process wake the handler directly through an event.
+  Commits made by other processes are detected by polling SQLite's
+  `data_version`, which changes whenever another connection commits a change
+  to the database file.
+  """
+
+  def __init__(self):
+    self._event = threading.Event()
+
+  def Notify(self):
+    """Wakes up the handler of this process."""
+    self._event.set()
+
+  def Wait(self, read_state_fn, last_state, is_stopped_fn):
+    """Waits until the queue might have new requests.
+
+    Args:
+      read_state_fn: A function returning the current data version of the
+        database as seen by the handler's connection.
+      last_state: The data version read before the handler last checked the
+        queue.
+      is_stopped_fn: A function returning True if the handler was stopped.
+    """
+    deadline = time.time() + _MAX_NOTIFICATION_WAIT
+    while not is_stopped_fn() and time.time() < deadline:
+      if self._event.wait(_NOTIFICATION_CHECK_INTERVAL):
+        break
+
+      try:
+        if read_state_fn() != last_state:
+          break
+      except sqlite3.Error as e:
+        logging.warning("Unable to read database data version: %s", e)
+
+    self._event.clear()
+
+
+def _FlowKeysCondition(flow_keys, args):
+  """Returns a condition matching any of the given (client, flow) keys."""
+  for client_id, flow_id in flow_keys:
+    args.extend([client_id, flow_id])
+  return " OR ".join([_FLOW_CONDITION] * len(flow_keys))
+
+
+def _RequestKeysCondition(request_keys, args):
+  """Returns a condition matching any of the given request keys."""
+  for client_id, flow_id, request_id in request_keys:
+    args.extend([client_id, flow_id, request_id])
+  return " OR ".join([_REQUEST_CONDITION] * len(request_keys))
+
+
+def _ResponseFromRow(res, status, iterator, ts):
+  if status:
+    response = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowStatus, status)
+  elif iterator:
+    response = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowIterator,
+                                           iterator)
+  else:
+    response = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowResponse, res)
+  response.timestamp = sqlite_utils.IntToRDFDatetime(ts)
+  return response
+
+
+class SqliteDBFlowMixin(object):
+  """SqliteDB mixin for flow handling."""
+
+  def _WaitForQueueNotification(self, notifier, last_state, is_stopped_fn):
+    notifier.Wait(self._ReadDataVersion, last_state, is_stopped_fn)
+
+  @sqlite_utils.WithTransaction()
+  def WriteMessageHandlerRequests(self, requests, cursor=None):
+    """Writes a list of message handler requests to the database."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+    cursor.executemany(
+        "INSERT OR IGNORE INTO message_handler_requests "
+        "(handlername, timestamp, request_id, request) VALUES (?, ?, ?, ?)",
+        [(r.handler_name, now, r.request_id,
+          sqlite_utils.Blob(r.SerializeToString())) for r in requests])
+    self.message_handler_notifier.Notify()
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadMessageHandlerRequests(self, cursor=None):
+    """Reads all message handler requests from the database."""
+    cursor.execute("SELECT timestamp, request, leased_until, leased_by "
+                   "FROM message_handler_requests "
+                   "ORDER BY timestamp DESC")
+
+    res = []
+    for timestamp, request, leased_until, leased_by in cursor.fetchall():
+      req = sqlite_utils.BlobToRDFProto(rdf_objects.MessageHandlerRequest,
+                                        request)
+      req.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      req.leased_by = leased_by
+      req.leased_until = sqlite_utils.IntToRDFDatetime(leased_until)
+      res.append(req)
+    return res
+
+  @sqlite_utils.WithTransaction()
+  def DeleteMessageHandlerRequests(self, requests, cursor=None):
+    """Deletes a list of message handler requests from the database."""
+    request_ids = set([r.request_id for r in requests])
+    cursor.executemany(
+        "DELETE FROM message_handler_requests WHERE request_id = ?",
+        [(request_id,) for request_id in request_ids])
+
+  def RegisterMessageHandler(self, handler, lease_time, limit=1000):
+    """Leases a number of message handler requests up to the indicated limit."""
+    self.UnregisterMessageHandler()
+
+    if handler:
+      self.handler_stop = False
+      self.handler_thread = threading.Thread(
+          name="message_handler",
+          target=self._MessageHandlerLoop,
+          args=(handler, lease_time, limit))
+      self.handler_thread.daemon = True
+      self.handler_thread.start()
+
+  def UnregisterMessageHandler(self):
+    """Unregisters any registered message handler."""
+    if self.handler_thread:
+      self.handler_stop = True
+      self.message_handler_notifier.Notify()
+      self.handler_thread.join()
+      self.handler_thread = None
+
+  def _MessageHandlerLoop(self, handler, lease_time, limit):
+    while not self.handler_stop:
+      try:
+        # The data version has to be read before leasing, so that requests
+        # committed while leasing wake the handler up.
+        data_version = self._ReadDataVersion()
+        msgs = self._LeaseMessageHandlerRequests(lease_time, limit)
+        if msgs:
+          handler(msgs)
+        else:
+          self._WaitForQueueNotification(self.message_handler_notifier,
+                                         data_version,
+                                         lambda: self.handler_stop)
+      except Exception as e:  # pylint: disable=broad-except
+        logging.exception("_LeaseMessageHandlerRequests raised %s.", e)
+
+  @sqlite_utils.WithTransaction()
+  def _LeaseMessageHandlerRequests(self, lease_time, limit, cursor=None):
+    """Leases a number of message handler requests up to the indicated limit."""
+    now = rdfvalue.RDFDatetime.Now()
+    expiry = now + lease_time
+    expiry_int = sqlite_utils.RDFDatetimeToInt(expiry)
+    id_str = utils.ProcessIdString()
+
+    cursor.execute(
+        "UPDATE message_handler_requests "
+        "SET leased_until = ?, leased_by = ? "
+        "WHERE rowid IN (SELECT rowid FROM message_handler_requests "
+        "WHERE leased_until IS NULL OR leased_until < ? LIMIT ?)",
+        [expiry_int, id_str,
+         sqlite_utils.RDFDatetimeToInt(now), limit])
+    if cursor.rowcount == 0:
+      return []
+
+    cursor.execute(
+        "SELECT timestamp, request FROM message_handler_requests "
+        "WHERE leased_by = ? AND leased_until = ?", [id_str, expiry_int])
+    res = []
+    for timestamp, request in cursor.fetchall():
+      req = sqlite_utils.BlobToRDFProto(rdf_objects.MessageHandlerRequest,
+                                        request)
+      req.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      req.leased_until = expiry
+      req.leased_by = id_str
+      res.append(req)
+
+    return res
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadClientMessages(self, client_id, cursor=None):
+    """Reads all client messages available for a given client_id."""
+    cursor.execute(
+        "SELECT message, leased_until, leased_by FROM client_messages "
+        "WHERE client_id = ?", [client_id])
+
+    ret = []
+    for msg, leased_until, leased_by in cursor.fetchall():
+      message = sqlite_utils.BlobToRDFProto(rdf_flows.GrrMessage, msg)
+      if leased_until:
+        message.leased_by = leased_by
+        message.leased_until = sqlite_utils.IntToRDFDatetime(leased_until)
+      ret.append(message)
+
+    return sorted(ret, key=lambda msg: msg.task_id)
+
+  @sqlite_utils.WithTransaction()
+  def DeleteClientMessages(self, messages, cursor=None):
+    """Deletes a list of client messages from the db."""
+    if not messages:
+      return
+
+    to_delete = []
+    for m in messages:
+      to_delete.append((db_utils.ClientIdFromGrrMessage(m), m.task_id))
+
+    if len(set(to_delete)) != len(to_delete):
+      raise ValueError(
+          "Received multiple copies of the same message to delete.")
+
+    self._DeleteClientMessages(to_delete, cursor)
+
+  def _DeleteClientMessages(self, to_delete, cursor):
+    """Deletes client messages given as (client id, task id) pairs."""
+    cursor.executemany(
+        "DELETE FROM client_messages WHERE client_id = ? AND message_id = ?",
+        [(client_id, sqlite_utils.UInt64ToInt(task_id))
+         for client_id, task_id in to_delete])
+
+  @sqlite_utils.WithTransaction()
+  def LeaseClientMessages(self,
+                          client_id,
+                          lease_time=None,
+                          limit=None,
+                          cursor=None):
+    """Leases available client messages for the client with the given id."""
+    now = rdfvalue.RDFDatetime.Now()
+    expiry = now + lease_time
+    expiry_int = sqlite_utils.RDFDatetimeToInt(expiry)
+    proc_id_str = utils.ProcessIdString()
+
+    # A negative LIMIT means no limit in SQLite.
+    cursor.execute(
+        "UPDATE client_messages SET leased_until = ?, leased_by = ? "
+        "WHERE rowid IN (SELECT rowid FROM client_messages "
+        "WHERE client_id = ? AND "
+        "(leased_until IS NULL OR leased_until < ?) LIMIT ?)", [
+            expiry_int, proc_id_str, client_id,
+            sqlite_utils.RDFDatetimeToInt(now),
+            -1 if limit is None else limit
+        ])
+    if cursor.rowcount == 0:
+      return []
+
+    cursor.execute(
+        "SELECT message FROM client_messages "
+        "WHERE client_id = ? AND leased_until = ? AND leased_by = ?",
+        [client_id, expiry_int, proc_id_str])
+
+    ret = []
+    for msg, in cursor.fetchall():
+      message = sqlite_utils.BlobToRDFProto(rdf_flows.GrrMessage, msg)
+      message.leased_by = proc_id_str
+      message.leased_until = expiry
+      ret.append(message)
+    return sorted(ret, key=lambda msg: msg.task_id)
+
+  @sqlite_utils.WithTransaction()
+  def WriteClientMessages(self, messages, cursor=None):
+    """Writes messages that should go to the client to the db."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    client_ids = set()
+    rows = []
+    for m in messages:
+      client_id = db_utils.ClientIdFromGrrMessage(m)
+      client_ids.add(client_id)
+      rows.append((now, sqlite_utils.Blob(m.SerializeToString()), client_id,
+                   sqlite_utils.UInt64ToInt(m.task_id)))
+
+    # Messages that are written again keep their lease.
+    cursor.executemany(
+        "UPDATE client_messages SET timestamp = ?, message = ? "
+        "WHERE client_id = ? AND message_id = ?", rows)
+    try:
+      cursor.executemany(
+          "INSERT OR IGNORE INTO client_messages "
+          "(timestamp, message, client_id, message_id) VALUES (?, ?, ?, ?)",
+          rows)
+    except sqlite3.IntegrityError as e:
+      raise db.AtLeastOneUnknownClientError(client_ids=client_ids, cause=e)
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowObject(self, flow_obj, cursor=None):
+    """Writes a flow object to the database."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+    serialized_flow = sqlite_utils.Blob(flow_obj.SerializeToString())
+
+    try:
+      cursor.execute(
+          "INSERT OR IGNORE INTO flows "
+          "(client_id, flow_id, long_flow_id, parent_flow_id, flow, "
+          "next_request_to_process, timestamp, last_update) VALUES "
+          "(?, ?, ?, ?, ?, ?, ?, ?)", [
+              flow_obj.client_id, flow_obj.flow_id, flow_obj.long_flow_id,
+              flow_obj.parent_flow_id or None, serialized_flow,
+              flow_obj.next_request_to_process,
+              sqlite_utils.RDFDatetimeToInt(flow_obj.create_time), now
+          ])
+    except sqlite3.IntegrityError as e:
+      raise db.UnknownClientError(flow_obj.client_id, cause=e)
+
+    if not cursor.rowcount:
+      cursor.execute(
+          "UPDATE flows SET flow = ?, next_request_to_process = ?, "
+          "last_update = ? WHERE client_id = ? AND flow_id = ?", [
+              serialized_flow, flow_obj.next_request_to_process, now,
+              flow_obj.client_id, flow_obj.flow_id
+          ])
+
+  def _FlowObjectFromRow(self, row):
+    """Generates a flow object from a database row."""
+    flow, cci, pt, nr, pd, po, ps, ts, lut = row
+
+    flow_obj = sqlite_utils.BlobToRDFProto(rdf_flow_objects.Flow, flow)
+    if cci is not None:
+      flow_obj.client_crash_info = sqlite_utils.BlobToRDFProto(
+          rdf_client.ClientCrash, cci)
+    if pt is not None:
+      flow_obj.pending_termination = sqlite_utils.BlobToRDFProto(
+          rdf_flow_objects.PendingFlowTermination, pt)
+    if nr:
+      flow_obj.next_request_to_process = nr
+    if pd is not None:
+      flow_obj.processing_deadline = sqlite_utils.IntToRDFDatetime(pd)
+    if po is not None:
+      flow_obj.processing_on = po
+    if ps is not None:
+      flow_obj.processing_since = sqlite_utils.IntToRDFDatetime(ps)
+    flow_obj.timestamp = sqlite_utils.IntToRDFDatetime(ts)
+    flow_obj.last_update_time = sqlite_utils.IntToRDFDatetime(lut)
+
+    return flow_obj
+
+  FLOW_DB_FIELDS = ("flow, client_crash_info, pending_termination, "
+                    "next_request_to_process, processing_deadline, "
+                    "processing_on, processing_since, timestamp, last_update ")
+
+  def _ReadFlowRow(self, client_id, flow_id, cursor):
+    cursor.execute(
+        "SELECT " + self.FLOW_DB_FIELDS +
+        "FROM flows WHERE client_id = ? AND flow_id = ?", [client_id, flow_id])
+    row = cursor.fetchone()
+    if row is None:
+      raise db.UnknownFlowError(client_id, flow_id)
+    return row
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadFlowObject(self, client_id, flow_id, cursor=None):
+    """Reads a flow object from the database."""
+    return self._FlowObjectFromRow(
+        self._ReadFlowRow(client_id, flow_id, cursor))
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadAllFlowObjects(self, client_id, min_create_time=None, cursor=None):
+    """Reads all flow objects from the database for a given client."""
+    query = "SELECT " + self.FLOW_DB_FIELDS + "FROM flows WHERE client_id = ?"
+    args = [client_id]
+
+    if min_create_time is not None:
+      query += " AND timestamp >= ?"
+      args.append(sqlite_utils.RDFDatetimeToInt(min_create_time))
+
+    cursor.execute(query, args)
+    return [self._FlowObjectFromRow(row) for row in cursor.fetchall()]
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadChildFlowObjects(self, client_id, flow_id, cursor=None):
+    """Reads flows that were started by a given flow from the database."""
+    cursor.execute(
+        "SELECT " + self.FLOW_DB_FIELDS +
+        "FROM flows WHERE client_id = ? AND parent_flow_id = ?",
+        [client_id, flow_id])
+    return [self._FlowObjectFromRow(row) for row in cursor.fetchall()]
+
+  @sqlite_utils.WithTransaction()
+  def ReadFlowForProcessing(self,
+                            client_id,
+                            flow_id,
+                            processing_time,
+                            cursor=None):
+    """Marks a flow as being processed on this worker and returns it."""
+    rdf_flow = self._FlowObjectFromRow(
+        self._ReadFlowRow(client_id, flow_id, cursor))
+
+    now = rdfvalue.RDFDatetime.Now()
+    if rdf_flow.processing_on and rdf_flow.processing_deadline > now:
+      raise ValueError("Flow %s on client %s is already being processed." %
+                       (client_id, flow_id))
+    processing_deadline = now + processing_time
+    process_id_string = utils.ProcessIdString()
+
+    cursor.execute(
+        "UPDATE flows SET processing_on = ?, processing_since = ?, "
+        "processing_deadline = ? WHERE client_id = ? AND flow_id = ?", [
+            process_id_string,
+            sqlite_utils.RDFDatetimeToInt(now),
+            sqlite_utils.RDFDatetimeToInt(processing_deadline), client_id,
+            flow_id
+        ])
+
+    # This needs to happen after we are sure that the write has succeeded.
+    rdf_flow.processing_on = process_id_string
+    rdf_flow.processing_since = now
+    rdf_flow.processing_deadline = processing_deadline
+    return rdf_flow
+
+  @sqlite_utils.WithTransaction()
+  def UpdateFlow(self,
+                 client_id,
+                 flow_id,
+                 flow_obj=db.Database.unchanged,
+                 client_crash_info=db.Database.unchanged,
+                 pending_termination=db.Database.unchanged,
+                 processing_on=db.Database.unchanged,
+                 processing_since=db.Database.unchanged,
+                 processing_deadline=db.Database.unchanged,
+                 cursor=None):
+    """Updates flow objects in the database."""
+    updates = []
+    args = []
+    if flow_obj != db.Database.unchanged:
+      updates.append("flow = ?")
+      args.append(sqlite_utils.Blob(flow_obj.SerializeToString()))
+    if client_crash_info != db.Database.unchanged:
+      updates.append("client_crash_info = ?")
+      args.append(sqlite_utils.Blob(client_crash_info.SerializeToString()))
+    if pending_termination != db.Database.unchanged:
+      updates.append("pending_termination = ?")
+      args.append(sqlite_utils.Blob(pending_termination.SerializeToString()))
+    if processing_on != db.Database.unchanged:
+      updates.append("processing_on = ?")
+      args.append(processing_on)
+    if processing_since != db.Database.unchanged:
+      updates.append("processing_since = ?")
+      args.append(sqlite_utils.RDFDatetimeToInt(processing_since))
+    if processing_deadline != db.Database.unchanged:
+      updates.append("processing_deadline = ?")
+      args.append(sqlite_utils.RDFDatetimeToInt(processing_deadline))
+
+    if not updates:
+      return
+
+    query = "UPDATE flows SET "
+    query += ", ".join(updates)
+    query += " WHERE client_id = ? AND flow_id = ?"
+
+    cursor.execute(query, args + [client_id, flow_id])
+    if cursor.rowcount == 0:
+      raise db.UnknownFlowError(client_id, flow_id)
+
+  @sqlite_utils.WithTransaction()
+  def UpdateFlows(self,
+                  client_id_flow_id_pairs,
+                  pending_termination=db.Database.unchanged,
+                  cursor=None):
+    """Updates flow objects in the database."""
+    if pending_termination == db.Database.unchanged:
+      return
+
+    serialized_termination = sqlite_utils.Blob(
+        pending_termination.SerializeToString())
+    cursor.executemany(
+        "UPDATE flows SET pending_termination = ? "
+        "WHERE client_id = ? AND flow_id = ?",
+        [(serialized_termination, client_id, flow_id)
+         for client_id, flow_id in client_id_flow_id_pairs])
+
+  def _WriteFlowProcessingRequests(self, requests, cursor):
+    """Writes the given flow processing requests and notifies the handler."""
+    timestamp = rdfvalue.RDFDatetime.Now()
+    timestamp_int = sqlite_utils.RDFDatetimeToInt(timestamp)
+
+    rows = []
+    for req in requests:
+      req = req.Copy()
+      req.timestamp = timestamp
+      rows.append((req.client_id, req.flow_id, timestamp_int,
+                   sqlite_utils.Blob(req.SerializeToString()),
+                   sqlite_utils.RDFDatetimeToInt(req.delivery_time or None)))
+
+    # A single processing request per flow and timestamp is enough for the
+    # flow to get processed.
+    cursor.executemany(
+        "INSERT OR IGNORE INTO flow_processing_requests "
+        "(client_id, flow_id, timestamp, request, delivery_time) "
+        "VALUES (?, ?, ?, ?, ?)", rows)
+    # The requests only become visible once the transaction is committed. A
+    # handler woken up too early blocks on the write lock when leasing until
+    # this transaction is done.
+    self.flow_processing_notifier.Notify()
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowRequests(self, requests, cursor=None):
+    """Writes a list of flow requests to the database."""
+    rows = []
+    flow_keys = []
+    needs_processing = {}
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+    for r in requests:
+      if r.needs_processing:
+        needs_processing.setdefault((r.client_id, r.flow_id),
+                                    []).append(r.request_id)
+
+      flow_keys.append((r.client_id, r.flow_id))
+      rows.append((int(bool(r.needs_processing)),
+                   sqlite_utils.Blob(r.SerializeToString()), now, r.client_id,
+                   r.flow_id, r.request_id))
+
+    if needs_processing:
+      flow_processing_requests = []
+      for batch in collection.Batch(list(needs_processing), _MAX_FLOW_KEYS):
+        args = []
+        condition = _FlowKeysCondition(batch, args)
+        cursor.execute(
+            "SELECT client_id, flow_id, next_request_to_process "
+            "FROM flows WHERE " + condition, args)
+
+        for client_id, flow_id, next_request_to_process in cursor.fetchall():
+          if next_request_to_process in needs_processing[(client_id, flow_id)]:
+            flow_processing_requests.append(
+                rdf_flows.FlowProcessingRequest(
+                    client_id=client_id, flow_id=flow_id))
+
+      if flow_processing_requests:
+        self._WriteFlowProcessingRequests(flow_processing_requests, cursor)
+
+    # Requests that are written again are overwritten. Since responses
+    # reference their request, existing rows are updated in place instead of
+    # being replaced.
+    cursor.executemany(
+        "UPDATE flow_requests SET needs_processing = ?, request = ?, "
+        "timestamp = ? WHERE client_id = ? AND flow_id = ? AND request_id = ?",
+        rows)
+    try:
+      cursor.executemany(
+          "INSERT OR IGNORE INTO flow_requests "
+          "(needs_processing, request, timestamp, client_id, flow_id, "
+          "request_id) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    except sqlite3.IntegrityError as e:
+      raise db.AtLeastOneUnknownFlowError(flow_keys, cause=e)
+
+  def _ReadCurrentFlowInfo(self, responses, currently_available_requests,
+                           next_request_by_flow, responses_expected_by_request,
+                           current_responses_by_request, cursor):
+    """Reads stored data for flows we want to modify."""
+    flow_keys = set()
+    request_keys = set()
+    for r in responses:
+      flow_keys.add((r.client_id, r.flow_id))
+      request_keys.add((r.client_id, r.flow_id, r.request_id))
+
+    for batch in collection.Batch(list(flow_keys), _MAX_FLOW_KEYS):
+      args = []
+      condition = _FlowKeysCondition(batch, args)
+      cursor.execute(
+          "SELECT client_id, flow_id, next_request_to_process "
+          "FROM flows WHERE " + condition, args)
+      for client_id, flow_id, next_request_to_process in cursor.fetchall():
+        next_request_by_flow[(client_id, flow_id)] = next_request_to_process
+
+    for batch in collection.Batch(list(request_keys), _MAX_REQUEST_KEYS):
+      args = []
+      condition = _RequestKeysCondition(batch, args)
+
+      cursor.execute(
+          "SELECT client_id, flow_id, request_id, responses_expected "
+          "FROM flow_requests WHERE " + condition, args)
+      for client_id, flow_id, request_id, responses_expected in (
+          cursor.fetchall()):
+        request_key = (client_id, flow_id, request_id)
+        currently_available_requests.add(request_key)
+        if responses_expected:
+          responses_expected_by_request[request_key] = responses_expected
+
+      cursor.execute(
+          "SELECT client_id, flow_id, request_id, response_id "
+          "FROM flow_responses WHERE " + condition, args)
+      for client_id, flow_id, request_id, response_id in cursor.fetchall():
+        request_key = (client_id, flow_id, request_id)
+        current_responses_by_request.setdefault(request_key,
+                                                set()).add(response_id)
+
+  def _WriteResponses(self, responses, timestamp, cursor):
+    """Stores the given responses in the db."""
+    rows = []
+    for r in responses:
+      serialized = sqlite_utils.Blob(r.SerializeToString())
+      if isinstance(r, rdf_flow_objects.FlowResponse):
+        columns = (serialized, None, None)
+      elif isinstance(r, rdf_flow_objects.FlowStatus):
+        columns = (None, serialized, None)
+      elif isinstance(r, rdf_flow_objects.FlowIterator):
+        columns = (None, None, serialized)
+      else:
+        # This can't really happen due to db api type checking.
+        raise ValueError("Got unexpected response type: %s %s" % (type(r), r))
+      rows.append((r.client_id, r.flow_id, r.request_id, r.response_id) +
+                  columns + (timestamp,))
+
+    cursor.executemany(
+        "INSERT OR IGNORE INTO flow_responses "
+        "(client_id, flow_id, request_id, response_id, "
+        "response, status, iterator, timestamp) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+  def _UpdateRequests(self, needs_processing_update, needs_expected_update,
+                      cursor):
+    """Updates for a number of requests."""
+    if needs_expected_update:
+      cursor.executemany(
+          "UPDATE flow_requests SET responses_expected = ? "
+          "WHERE client_id = ? AND flow_id = ? AND request_id = ?",
+          [(responses_expected,) + request_key for request_key,
+           responses_expected in needs_expected_update.items()])
+
+    if needs_processing_update:
+      cursor.executemany(
+          "UPDATE flow_requests SET needs_processing = 1 "
+          "WHERE client_id = ? AND flow_id = ? AND request_id = ?",
+          list(needs_processing_update))
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowResponses(self, responses, cursor=None):
+    """Writes a list of flow responses to the database."""
+    if not responses:
+      return
+
+    # In addition to just writing responses, this function needs to also
+
+    # - Update the expected nr of response for each request that received a
+    #   status.
+    # - Set the needs_processing flag for all requests that now have all
+    #   responses.
+    # - Send FlowProcessingRequests for all flows that are waiting on a request
+    #   whose needs_processing flag was just set.
+
+    # To achieve this, we need to get the next request each flow is waiting for.
+    next_request_by_flow = {}
+
+    # And the number of responses each affected request is waiting for (if
+    # available).
+    responses_expected_by_request = {}
+
+    # As well as the ids of the currently available responses for each request.
+    current_responses_by_request = {}
+
+    # We also store all requests we have in the db so we can discard responses
+    # for unknown requests right away.
+    currently_available_requests = set()
+
+    self._ReadCurrentFlowInfo(
+        responses, currently_available_requests, next_request_by_flow,
+        responses_expected_by_request, current_responses_by_request, cursor)
+
+    # For some requests we will need to update the number of expected responses.
+    needs_expected_update = {}
+
+    # For some we will need to update the needs_processing flag.
+    needs_processing_update = set()
+
+    # Some completed requests will trigger a flow processing request, we collect
+    # them in:
+    flow_processing_requests = []
+
+    task_ids_by_request = {}
+
+    for r in responses:
+      request_key = (r.client_id, r.flow_id, r.request_id)
+
+      try:
+        # If this is a response coming from a client, a task_id will be set. We
+        # store it in case the request is complete and we can remove the client
+        # messages.
+        task_ids_by_request[request_key] = r.task_id
+      except AttributeError:
+        pass
+
+      if not isinstance(r, rdf_flow_objects.FlowStatus):
+        continue
+
+      current = responses_expected_by_request.get(request_key)
+      if current:
+        logging.error("Got duplicate status message for request %s/%s/%d",
+                      r.client_id, r.flow_id, r.request_id)
+        # If there is already responses_expected information, we need to make
+        # sure the current status doesn't disagree.
+        if current != r.response_id:
+          raise ValueError(
+              "Got conflicting status information for request %s: %s" %
+              (request_key, r))
+      else:
+        needs_expected_update[request_key] = r.response_id
+
+      responses_expected_by_request[request_key] = r.response_id
+
+    responses_to_write = []
+    client_messages_to_delete = []
+    for r in responses:
+      request_key = (r.client_id, r.flow_id, r.request_id)
+
+      if request_key not in currently_available_requests:
+        logging.info("Dropping response for unknown request %s/%s/%d",
+                     r.client_id, r.flow_id, r.request_id)
+        continue
+
+      responses_to_write.append(r)
+
+      current_responses = current_responses_by_request.setdefault(
+          request_key, set())
+      if r.response_id in current_responses:
+        # We have this response already, nothing further to do.
+        continue
+
+      current_responses.add(r.response_id)
+      expected_responses = responses_expected_by_request.get(request_key, 0)
+      if len(current_responses) == expected_responses:
+        # This response was the one that was missing, time to set the
+        # needs_processing flag.
+        needs_processing_update.add(request_key)
+        if r.request_id == next_request_by_flow[(r.client_id, r.flow_id)]:
+          # The request that is now ready for processing was also the one the
+          # flow was waiting for.
+          req = rdf_flows.FlowProcessingRequest(
+              client_id=r.client_id, flow_id=r.flow_id)
+          flow_processing_requests.append(req)
+
+        # Since this request is now complete, we can remove the corresponding
+        # client messages if there are any.
+        task_id = task_ids_by_request.get(request_key, None)
+        if task_id is not None:
+          client_messages_to_delete.append((r.client_id, task_id))
+
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    if responses_to_write:
+      self._WriteResponses(responses_to_write, now, cursor)
+
+    self._UpdateRequests(needs_processing_update, needs_expected_update, cursor)
+
+    if client_messages_to_delete:
+      self._DeleteClientMessages(client_messages_to_delete, cursor)
+
+    if flow_processing_requests:
+      self._WriteFlowProcessingRequests(flow_processing_requests, cursor)
+
+  @sqlite_utils.WithTransaction()
+  def DeleteFlowRequests(self, requests, cursor=None):
+    """Deletes a list of flow requests from the database."""
+    if not requests:
+      return
+
+    keys = [(r.client_id, r.flow_id, r.request_id) for r in requests]
+    condition = " WHERE client_id = ? AND flow_id = ? AND request_id = ?"
+    cursor.executemany("DELETE FROM flow_responses" + condition, keys)
+    cursor.executemany("DELETE FROM flow_requests" + condition, keys)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadAllFlowRequestsAndResponses(self, client_id, flow_id, cursor=None):
+    """Reads all requests and responses for a given flow from the database."""
+    args = [client_id, flow_id]
+    cursor.execute(
+        "SELECT request, needs_processing, responses_expected, timestamp "
+        "FROM flow_requests WHERE client_id = ? AND flow_id = ?", args)
+
+    requests = []
+    for req, needs_processing, resp_expected, ts in cursor.fetchall():
+      request = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowRequest, req)
+      request.needs_processing = bool(needs_processing)
+      request.nr_responses_expected = resp_expected
+      request.timestamp = sqlite_utils.IntToRDFDatetime(ts)
+      requests.append(request)
+
+    cursor.execute(
+        "SELECT response, status, iterator, timestamp "
+        "FROM flow_responses WHERE client_id = ? AND flow_id = ?", args)
+
+    responses = {}
+    for row in cursor.fetchall():
+      response = _ResponseFromRow(*row)
+      responses.setdefault(response.request_id,
+                           {})[response.response_id] = response
+
+    ret = []
+    for req in sorted(requests, key=lambda r: r.request_id):
+      ret.append((req, responses.get(req.request_id, {})))
+    return ret
+
+  @sqlite_utils.WithTransaction()
+  def DeleteAllFlowRequestsAndResponses(self, client_id, flow_id, cursor=None):
+    """Deletes all requests and responses for a given flow from the database."""
+    args = [client_id, flow_id]
+    cursor.execute(
+        "DELETE FROM flow_responses WHERE client_id = ? AND flow_id = ?", args)
+    cursor.execute(
+        "DELETE FROM flow_requests WHERE client_id = ? AND flow_id = ?", args)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadFlowRequestsReadyForProcessing(self,
+                                         client_id,
+                                         flow_id,
+                                         next_needed_request,
+                                         cursor=None):
+    """Reads all requests for a flow that can be processed by the worker."""
+    args = [client_id, flow_id, next_needed_request]
+    cursor.execute(
+        "SELECT request, timestamp FROM flow_requests "
+        "WHERE client_id = ? AND flow_id = ? AND request_id >= ? "
+        "AND needs_processing", args)
+
+    requests = {}
+    for req, ts in cursor.fetchall():
+      request = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowRequest, req)
+      request.needs_processing = True
+      request.timestamp = sqlite_utils.IntToRDFDatetime(ts)
+      requests[request.request_id] = request
+
+    cursor.execute(
+        "SELECT response, status, iterator, timestamp FROM flow_responses "
+        "WHERE client_id = ? AND flow_id = ? AND request_id >= ? "
+        "ORDER BY request_id, response_id", args)
+
+    responses = {}
+    for row in cursor.fetchall():
+      response = _ResponseFromRow(*row)
+      responses.setdefault(response.request_id, []).append(response)
+
+    res = {}
+    while next_needed_request in requests:
+      req = requests[next_needed_request]
+      res[req.request_id] = (req, responses.get(next_needed_request, []))
+      next_needed_request += 1
+
+    return res
+
+  @sqlite_utils.WithTransaction()
+  def ReturnProcessedFlow(self, flow_obj, cursor=None):
+    """Returns a flow that the worker was processing to the database."""
+    cursor.execute(
+        "SELECT needs_processing FROM flow_requests "
+        "WHERE client_id = ? AND flow_id = ? AND request_id = ?", [
+            flow_obj.client_id, flow_obj.flow_id,
+            flow_obj.next_request_to_process
+        ])
+    for needs_processing, in cursor.fetchall():
+      if needs_processing:
+        return False
+
+    clone = flow_obj.Copy()
+    clone.processing_on = None
+    clone.processing_since = None
+    clone.processing_deadline = None
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+    cursor.execute(
+        "UPDATE flows SET flow = ?, processing_on = NULL, "
+        "processing_since = NULL, processing_deadline = NULL, "
+        "next_request_to_process = ?, last_update = ? "
+        "WHERE client_id = ? AND flow_id = ?", [
+            sqlite_utils.Blob(clone.SerializeToString()),
+            flow_obj.next_request_to_process, now, flow_obj.client_id,
+            flow_obj.flow_id
+        ])
+
+    # This needs to happen after we are sure that the write has succeeded.
+    flow_obj.processing_on = None
+    flow_obj.processing_since = None
+    flow_obj.processing_deadline = None
+
+    return True
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowProcessingRequests(self, requests, cursor=None):
+    """Writes a list of flow processing requests to the database."""
+    self._WriteFlowProcessingRequests(requests, cursor)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadFlowProcessingRequests(self, cursor=None):
+    """Reads all flow processing requests from the database."""
+    cursor.execute("SELECT request, timestamp FROM flow_processing_requests")
+
+    res = []
+    for serialized_request, ts in cursor.fetchall():
+      req = sqlite_utils.BlobToRDFProto(rdf_flows.FlowProcessingRequest,
+                                        serialized_request)
+      req.timestamp = sqlite_utils.IntToRDFDatetime(ts)
+      res.append(req)
+    return res
+
+  @sqlite_utils.WithTransaction()
+  def AckFlowProcessingRequests(self, requests, cursor=None):
+    """Deletes a list of flow processing requests from the database."""
+    cursor.executemany(
+        "DELETE FROM flow_processing_requests "
+        "WHERE client_id = ? AND flow_id = ? AND timestamp = ?",
+        [(r.client_id, r.flow_id, sqlite_utils.RDFDatetimeToInt(r.timestamp))
+         for r in requests])
+
+  @sqlite_utils.WithTransaction()
+  def DeleteAllFlowProcessingRequests(self, cursor=None):
+    """Deletes all flow processing requests from the database."""
+    cursor.execute("DELETE FROM flow_processing_requests")
+
+  @sqlite_utils.WithTransaction()
+  def _LeaseFlowProcessingReqests(self, cursor=None):
+    """Leases a number of flow processing requests."""
+    now = rdfvalue.RDFDatetime.Now()
+    now_int = sqlite_utils.RDFDatetimeToInt(now)
+
+    expiry = now + rdfvalue.Duration("10m")
+    expiry_int = sqlite_utils.RDFDatetimeToInt(expiry)
+    id_str = utils.ProcessIdString()
+
+    cursor.execute(
+        "UPDATE flow_processing_requests "
+        "SET leased_until = ?, leased_by = ? "
+        "WHERE rowid IN (SELECT rowid FROM flow_processing_requests "
+        "WHERE (delivery_time IS NULL OR delivery_time <= ?) AND "
+        "(leased_until IS NULL OR leased_until < ?) LIMIT ?)",
+        [expiry_int, id_str, now_int, now_int, 50])
+    if cursor.rowcount == 0:
+      return []
+
+    cursor.execute(
+        "SELECT timestamp, request FROM flow_processing_requests "
+        "WHERE leased_by = ? AND leased_until = ?", [id_str, expiry_int])
+    res = []
+    for timestamp, request in cursor.fetchall():
+      req = sqlite_utils.BlobToRDFProto(rdf_flows.FlowProcessingRequest,
+                                        request)
+      req.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      req.leased_until = expiry
+      req.leased_by = id_str
+      res.append(req)
+
+    return res
+
+  def _FlowProcessingRequestHandlerLoop(self, handler):
+    """The main loop for the flow processing request queue."""
+    while not self.flow_processing_request_handler_stop:
+      try:
+        data_version = self._ReadDataVersion()
+        msgs = self._LeaseFlowProcessingReqests()
+        if msgs:
+          for m in msgs:
+            self.flow_processing_request_handler_pool.AddTask(
+                target=handler, args=(m,))
+        else:
+          self._WaitForQueueNotification(
+              self.flow_processing_notifier, data_version,
+              lambda: self.flow_processing_request_handler_stop)
+
+      except Exception as e:  # pylint: disable=broad-except
+        logging.exception("_FlowProcessingRequestHandlerLoop raised %s.", e)
+
+  def RegisterFlowProcessingHandler(self, handler):
+    """Registers a handler to receive flow processing messages."""
+    self.UnregisterFlowProcessingHandler()
+
+    if handler:
+      self.flow_processing_request_handler_stop = False
+      self.flow_processing_request_handler_thread = threading.Thread(
+          name="flow_processing_request_handler",
+          target=self._FlowProcessingRequestHandlerLoop,
+          args=(handler,))
+      self.flow_processing_request_handler_thread.daemon = True
+      self.flow_processing_request_handler_thread.start()
+
+  def UnregisterFlowProcessingHandler(self):
+    """Unregisters any registered flow processing handler."""
+    if self.flow_processing_request_handler_thread:
+      self.flow_processing_request_handler_stop = True
+      self.flow_processing_notifier.Notify()
+      self.flow_processing_request_handler_thread.join()
+      self.flow_processing_request_handler_thread = None
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowResults(self, client_id, flow_id, results, cursor=None):
+    """Writes flow results for a given flow."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    rows = []
+    for r in results:
+      # Payloads are stored separately from the result, so that results can
+      # be filtered by payload type and payload contents.
+      payload = r.payload
+      result = r.Copy()
+      result.payload = None
+      result.timestamp = None
+      rows.append((client_id, flow_id, now, r.tag,
+                   compatibility.GetName(payload.__class__),
+                   sqlite_utils.Blob(payload.SerializeToString()),
+                   sqlite_utils.Blob(result.SerializeToString())))
+
+    cursor.executemany(
+        "INSERT INTO flow_results "
+        "(client_id, flow_id, timestamp, tag, payload_type, payload, result) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+  def _FlowResultsCondition(self, client_id, flow_id, with_tag, with_type,
+                            with_substring, args):
+    """Returns an SQL condition selecting flow results, fills in args."""
+    query = "WHERE client_id = ? AND flow_id = ?"
+    args.extend([client_id, flow_id])
+
+    if with_tag is not None:
+      query += " AND tag = ?"
+      args.append(with_tag)
+
+    if with_type is not None:
+      query += " AND payload_type = ?"
+      args.append(with_type)
+
+    if with_substring is not None:
+      query += " AND instr(payload, ?) > 0"
+      args.append(sqlite_utils.Blob(with_substring.encode("utf-8")))
+
+    return query
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadFlowResults(self,
+                      client_id,
+                      flow_id,
+                      offset,
+                      count,
+                      with_tag=None,
+                      with_type=None,
+                      with_substring=None,
+                      cursor=None):
+    """Reads flow results of a given flow using given query options."""
+    args = []
+    query = ("SELECT timestamp, payload_type, payload, result "
+             "FROM flow_results ")
+    query += self._FlowResultsCondition(client_id, flow_id, with_tag,
+                                        with_type, with_substring, args)
+    query += " ORDER BY timestamp, rowid LIMIT ? OFFSET ?"
+    args += [count, offset]
+
+    cursor.execute(query, args)
+
+    ret = []
+    for timestamp, payload_type, payload, result in cursor.fetchall():
+      r = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowResult, result)
+      r.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      if payload_type in rdfvalue.RDFValue.classes:
+        r.payload = sqlite_utils.BlobToRDFProto(
+            rdfvalue.RDFValue.classes[payload_type], payload)
+      else:
+        r.payload = rdf_objects.SerializedValueOfUnrecognizedType(
+            type_name=payload_type, value=bytes(payload))
+      ret.append(r)
+
+    return ret
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def CountFlowResults(self,
+                       client_id,
+                       flow_id,
+                       with_tag=None,
+                       with_type=None,
+                       cursor=None):
+    """Counts flow results of a given flow using given query options."""
+    args = []
+    query = "SELECT COUNT(*) FROM flow_results "
+    query += self._FlowResultsCondition(client_id, flow_id, with_tag,
+                                        with_type, None, args)
+    cursor.execute(query, args)
+    return cursor.fetchone()[0]
+
+  @sqlite_utils.WithTransaction()
+  def WriteFlowLogEntries(self, client_id, flow_id, entries, cursor=None):
+    """Writes flow log entries for a given flow."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    rows = []
+    for e in entries:
+      entry = e.Copy()
+      entry.timestamp = None
+      rows.append((client_id, flow_id, now, e.message,
+                   sqlite_utils.Blob(entry.SerializeToString())))
+
+    cursor.executemany(
+        "INSERT INTO flow_log_entries "
+        "(client_id, flow_id, timestamp, message, entry) "
+        "VALUES (?, ?, ?, ?, ?)", rows)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadFlowLogEntries(self,
+                         client_id,
+                         flow_id,
+                         offset,
+                         count,
+                         with_substring=None,
+                         cursor=None):
+    """Reads flow log entries of a given flow using given query options."""
+    query = ("SELECT timestamp, entry FROM flow_log_entries "
+             "WHERE client_id = ? AND flow_id = ?")
+    args = [client_id, flow_id]
+
+    if with_substring is not None:
+      # Unlike LIKE, instr() is case-sensitive and has no wildcards.
+      query += " AND instr(message, ?) > 0"
+      args.append(with_substring)
+
+    query += " ORDER BY timestamp, rowid LIMIT ? OFFSET ?"
+    args += [count, offset]
+
+    cursor.execute(query, args)
+
+    ret = []
+    for timestamp, entry in cursor.fetchall():
+      e = sqlite_utils.BlobToRDFProto(rdf_flow_objects.FlowLogEntry, entry)
+      e.timestamp = sqlite_utils.IntToRDFDatetime(timestamp)
+      ret.append(e)
+
+    return ret
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def CountFlowLogEntries(self, client_id, flow_id, cursor=None):
+    """Returns number of flow log entries of a given flow."""
+    cursor.execute(
+        "SELECT COUNT(*) FROM flow_log_entries "
+        "WHERE client_id = ? AND flow_id = ?", [client_id, flow_id])
+    return cursor.fetchone()[0]
@@ -0,0 +1,546 @@
+#!/usr/bin/env python
+"""The SQLite database methods for path handling."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import sqlite3
+
+from future.utils import iteritems
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_core.lib.rdfvalues import crypto as rdf_crypto
+from grr_response_core.lib.util import collection
+from grr_response_server import db
+from grr_response_server.databases import sqlite_utils
+from grr_response_server.rdfvalues import objects as rdf_objects
+
+# Columns selected by all queries returning the latest state of a path. The
+# latest stat and hash entries are found through the `last_*_timestamp`
+# columns, so no aggregation over the history tables is needed.
+_PATH_INFO_COLUMNS = (
+    "p.path, p.directory, p.timestamp, "
+    "p.last_stat_entry_timestamp, s.stat_entry, "
+    "p.last_hash_entry_timestamp, h.hash_entry")
+
+_PATH_INFO_JOINS = """
+ LEFT JOIN client_path_stat_entries AS s
+        ON s.client_id = p.client_id
+       AND s.path_type = p.path_type
+       AND s.path_id = p.path_id
+       AND s.timestamp = p.last_stat_entry_timestamp
+ LEFT JOIN client_path_hash_entries AS h
+        ON h.client_id = p.client_id
+       AND h.path_type = p.path_type
+       AND h.path_id = p.path_id
+       AND h.timestamp = p.last_hash_entry_timestamp
+"""
+
+_PATH_KEY_CONDITION = "WHERE client_id = ? AND path_type = ? AND path_id = ?"
+
+
+def _PathInfoFromRow(path_type, row):
+  """Builds a `rdf_objects.PathInfo` from a row of `_PATH_INFO_COLUMNS`."""
+  (path, directory, timestamp, last_stat_entry_timestamp, stat_entry,
+   last_hash_entry_timestamp, hash_entry) = row
+
+  return rdf_objects.PathInfo(
+      path_type=path_type,
+      components=sqlite_utils.PathToComponents(path),
+      directory=bool(directory),
+      timestamp=sqlite_utils.IntToRDFDatetime(timestamp),
+      last_stat_entry_timestamp=sqlite_utils.IntToRDFDatetime(
+          last_stat_entry_timestamp),
+      stat_entry=sqlite_utils.BlobToRDFProto(rdf_client_fs.StatEntry,
+                                             stat_entry),
+      last_hash_entry_timestamp=sqlite_utils.IntToRDFDatetime(
+          last_hash_entry_timestamp),
+      hash_entry=sqlite_utils.BlobToRDFProto(rdf_crypto.Hash, hash_entry))
+
+
+def _PathIDBytes(components):
+  return rdf_objects.PathID.FromComponents(components).AsBytes()
+
+
+def _HashEntrySHA256(hash_entry):
+  if not hash_entry.HasField("sha256"):
+    return None
+  return sqlite_utils.Blob(hash_entry.sha256.AsBytes())
+
+
+class SqliteDBPathMixin(object):
+  """SqliteDB mixin for path related functions."""
+
+  def ReadPathInfo(self, client_id, path_type, components, timestamp=None):
+    """Retrieves a path info record for a given path."""
+    if timestamp is None:
+      path_info = self.ReadPathInfos(client_id, path_type,
+                                     [components])[components]
+    else:
+      path_info = self._ReadPathInfoAtTimestamp(client_id, path_type,
+                                                components, timestamp)
+
+    if path_info is None:
+      raise db.UnknownPathError(
+          client_id=client_id, path_type=path_type, components=components)
+    return path_info
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def _ReadPathInfoAtTimestamp(self,
+                               client_id,
+                               path_type,
+                               components,
+                               timestamp,
+                               cursor=None):
+    """Reads the state of a path as it was at the given timestamp."""
+    key = [
+        client_id,
+        int(path_type),
+        sqlite_utils.Blob(_PathIDBytes(components))
+    ]
+    timestamp_int = sqlite_utils.RDFDatetimeToInt(timestamp)
+
+    cursor.execute(
+        "SELECT directory, timestamp FROM client_paths " + _PATH_KEY_CONDITION,
+        key)
+    row = cursor.fetchone()
+    if row is None:
+      return None
+    directory, path_timestamp = row
+
+    # Both history tables are keyed by timestamp within a path, so finding the
+    # latest entry before the given timestamp is a single index lookup.
+    cursor.execute(
+        "SELECT timestamp, stat_entry FROM client_path_stat_entries " +
+        _PATH_KEY_CONDITION + " AND timestamp <= ? "
+        "ORDER BY timestamp DESC LIMIT 1", key + [timestamp_int])
+    stat_row = cursor.fetchone() or (None, None)
+
+    cursor.execute(
+        "SELECT timestamp, hash_entry FROM client_path_hash_entries " +
+        _PATH_KEY_CONDITION + " AND timestamp <= ? "
+        "ORDER BY timestamp DESC LIMIT 1", key + [timestamp_int])
+    hash_row = cursor.fetchone() or (None, None)
+
+    candidates = [stat_row[0], hash_row[0]]
+    if path_timestamp <= timestamp_int:
+      candidates.append(path_timestamp)
+    candidates = [ts for ts in candidates if ts is not None]
+
+    return rdf_objects.PathInfo(
+        path_type=path_type,
+        components=components,
+        directory=bool(directory),
+        timestamp=sqlite_utils.IntToRDFDatetime(
+            max(candidates) if candidates else None),
+        last_stat_entry_timestamp=sqlite_utils.IntToRDFDatetime(stat_row[0]),
+        stat_entry=sqlite_utils.BlobToRDFProto(rdf_client_fs.StatEntry,
+                                               stat_row[1]),
+        last_hash_entry_timestamp=sqlite_utils.IntToRDFDatetime(hash_row[0]),
+        hash_entry=sqlite_utils.BlobToRDFProto(rdf_crypto.Hash, hash_row[1]))
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadPathInfos(self, client_id, path_type, components_list, cursor=None):
+    """Retrieves path info records for given paths."""
+    result = {components: None for components in components_list}
+
+    path_ids = [
+        sqlite_utils.Blob(_PathIDBytes(components)) for components in result
+    ]
+    for batch in collection.Batch(path_ids, sqlite_utils.MAX_QUERY_PARAMETERS):
+      query = ("SELECT {columns} FROM client_paths AS p {joins} "
+               "WHERE p.client_id = ? AND p.path_type = ? "
+               "AND p.path_id IN ({path_ids})").format(
+                   columns=_PATH_INFO_COLUMNS,
+                   joins=_PATH_INFO_JOINS,
+                   path_ids=sqlite_utils.Placeholders(len(batch)))
+      cursor.execute(query, [client_id, int(path_type)] + batch)
+
+      for row in cursor.fetchall():
+        path_info = _PathInfoFromRow(path_type, row)
+        result[tuple(path_info.components)] = path_info
+
+    return result
+
+  def WritePathInfos(self, client_id, path_infos):
+    """Writes a collection of path_info records for a client."""
+    try:
+      self._MultiWritePathInfos({client_id: path_infos})
+    except sqlite3.IntegrityError as error:
+      if sqlite_utils.IsForeignKeyError(error):
+        raise db.UnknownClientError(client_id=client_id, cause=error)
+      raise db.Error("Duplicated path info write", cause=error)
+
+  def MultiWritePathInfos(self, path_infos):
+    """Writes a collection of path info records for specified clients."""
+    try:
+      self._MultiWritePathInfos(path_infos)
+    except sqlite3.IntegrityError as error:
+      if sqlite_utils.IsForeignKeyError(error):
+        client_ids = list(path_infos)
+        raise db.AtLeastOneUnknownClientError(
+            client_ids=client_ids, cause=error)
+      raise db.Error("Duplicated path info write", cause=error)
+
+  @sqlite_utils.WithTransaction()
+  def _MultiWritePathInfos(self, path_infos, cursor=None):
+    """Writes path info records of many clients in a single transaction."""
+    now = sqlite_utils.RDFDatetimeToInt(rdfvalue.RDFDatetime.Now())
+
+    # Path rows are keyed by (client_id, path_type, path_id) so that ancestors
+    # shared by many of the written paths are only written once.
+    path_rows = {}
+    # History rows of a path share the timestamp, so only the last entry of
+    # every path is written.
+    stat_rows = {}
+    hash_rows = {}
+
+    def AddPathRow(client_id, path_info, directory, stat_timestamp,
+                   hash_timestamp):
+      path_id = path_info.GetPathID().AsBytes()
+      key = (client_id, int(path_info.path_type), path_id)
+
+      row = path_rows.get(key)
+      if row is not None:
+        row[5] = row[5] or directory
+        row[7] = row[7] or stat_timestamp
+        row[8] = row[8] or hash_timestamp
+        return key
+
+      components = tuple(path_info.components)
+      path_rows[key] = [
+          client_id,
+          int(path_info.path_type),
+          sqlite_utils.Blob(path_id),
+          sqlite_utils.ComponentsToPath(components),
+          len(components), directory, now, stat_timestamp, hash_timestamp
+      ]
+      return key
+
+    for client_id, client_path_infos in iteritems(path_infos):
+      for path_info in client_path_infos:
+        stat_timestamp = None
+        hash_timestamp = None
+        if path_info.HasField("stat_entry"):
+          stat_timestamp = now
+        if path_info.HasField("hash_entry"):
+          hash_timestamp = now
+
+        key = AddPathRow(client_id, path_info, bool(path_info.directory),
+                         stat_timestamp, hash_timestamp)
+        row_key = [key[0], key[1], sqlite_utils.Blob(key[2])]
+
+        if stat_timestamp is not None:
+          stat_rows[key] = row_key + [
+              now,
+              sqlite_utils.Blob(path_info.stat_entry.SerializeToString())
+          ]
+        if hash_timestamp is not None:
+          hash_rows[key] = row_key + [
+              now,
+              sqlite_utils.Blob(path_info.hash_entry.SerializeToString()),
+              _HashEntrySHA256(path_info.hash_entry)
+          ]
+
+        for ancestor_path_info in path_info.GetAncestors():
+          AddPathRow(client_id, ancestor_path_info, True, None, None)
+
+    if not path_rows:
+      return
+
+    # Inserting rows that don't exist yet and updating the existing ones in
+    # two statements keeps this compatible with SQLite versions older than
+    # 3.24, which lack the UPSERT syntax. Re-applying the update to a freshly
+    # inserted row doesn't change it.
+    rows = list(path_rows.values())
+    cursor.executemany(
+        "INSERT OR IGNORE INTO client_paths(client_id, path_type, path_id, "
+        "path, depth, directory, timestamp, last_stat_entry_timestamp, "
+        "last_hash_entry_timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    cursor.executemany(
+        "UPDATE client_paths SET "
+        "directory = directory OR ?, "
+        "timestamp = ?, "
+        "last_stat_entry_timestamp = "
+        "COALESCE(?, last_stat_entry_timestamp), "
+        "last_hash_entry_timestamp = "
+        "COALESCE(?, last_hash_entry_timestamp) " + _PATH_KEY_CONDITION,
+        [row[5:9] + row[0:3] for row in rows])
+
+    if stat_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_stat_entries(client_id, path_type, path_id, "
+          "timestamp, stat_entry) VALUES (?, ?, ?, ?, ?)",
+          list(stat_rows.values()))
+
+    if hash_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_hash_entries(client_id, path_type, path_id, "
+          "timestamp, hash_entry, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+          list(hash_rows.values()))
+
+  def ClearPathHistory(self, client_id, path_infos):
+    """Clears path history for specified paths of given client."""
+    self.MultiClearPathHistory({client_id: path_infos})
+
+  @sqlite_utils.WithTransaction()
+  def MultiClearPathHistory(self, path_infos, cursor=None):
+    """Clears path history for specified paths of given clients."""
+    keys = []
+    for client_id, client_path_infos in iteritems(path_infos):
+      for path_info in client_path_infos:
+        keys.append([
+            client_id,
+            int(path_info.path_type),
+            sqlite_utils.Blob(path_info.GetPathID().AsBytes())
+        ])
+
+    if not keys:
+      return
+
+    cursor.executemany(
+        "DELETE FROM client_path_stat_entries " + _PATH_KEY_CONDITION, keys)
+    cursor.executemany(
+        "DELETE FROM client_path_hash_entries " + _PATH_KEY_CONDITION, keys)
+    cursor.executemany(
+        "UPDATE client_paths SET last_stat_entry_timestamp = NULL, "
+        "last_hash_entry_timestamp = NULL " + _PATH_KEY_CONDITION, keys)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ListDescendentPathInfos(self,
+                              client_id,
+                              path_type,
+                              components,
+                              max_depth=None,
+                              cursor=None):
+    """Lists path info records that correspond to descendants of given path."""
+    path = sqlite_utils.ComponentsToPath(components)
+
+    # Descendants are exactly the paths between "<path>/" and "<path>0" ("0"
+    # follows "/" in the binary collation). Unlike LIKE, which is
+    # case-insensitive, the range condition is also a range scan over the
+    # `client_paths_prefix_idx` index.
+    query = ("SELECT {columns} FROM client_paths AS p {joins} "
+             "WHERE p.client_id = ? AND p.path_type = ? "
+             "AND p.path >= ? AND p.path < ?").format(
+                 columns=_PATH_INFO_COLUMNS, joins=_PATH_INFO_JOINS)
+    values = [client_id, int(path_type), path + "/", path + "0"]
+
+    if max_depth is not None:
+      query += " AND p.depth <= ?"
+      values.append(len(components) + max_depth)
+
+    cursor.execute(query, values)
+
+    result = [_PathInfoFromRow(path_type, row) for row in cursor.fetchall()]
+    result.sort(key=lambda path_info: tuple(path_info.components))
+    return result
+
+  def MultiWritePathHistory(self, client_path_histories):
+    """Writes a collection of hash and stat entries observed for given paths."""
+    try:
+      self._MultiWritePathHistory(client_path_histories)
+    except sqlite3.IntegrityError as error:
+      if sqlite_utils.IsForeignKeyError(error):
+        raise db.AtLeastOneUnknownPathError([], cause=error)
+      raise db.Error("Duplicated path history entry", cause=error)
+
+  @sqlite_utils.WithTransaction()
+  def _MultiWritePathHistory(self, client_path_histories, cursor=None):
+    """Writes path histories in a single transaction."""
+    stat_rows = []
+    hash_rows = []
+    stat_updates = []
+    hash_updates = []
+
+    for client_path, client_path_history in iteritems(client_path_histories):
+      key = [
+          client_path.client_id,
+          int(client_path.path_type),
+          sqlite_utils.Blob(_PathIDBytes(client_path.components))
+      ]
+
+      stat_entries = client_path_history.stat_entries
+      for timestamp, stat_entry in iteritems(stat_entries):
+        stat_rows.append(key + [
+            sqlite_utils.RDFDatetimeToInt(timestamp),
+            sqlite_utils.Blob(stat_entry.SerializeToString())
+        ])
+      if stat_entries:
+        latest = sqlite_utils.RDFDatetimeToInt(max(stat_entries))
+        stat_updates.append([latest, latest] + key)
+
+      hash_entries = client_path_history.hash_entries
+      for timestamp, hash_entry in iteritems(hash_entries):
+        hash_rows.append(key + [
+            sqlite_utils.RDFDatetimeToInt(timestamp),
+            sqlite_utils.Blob(hash_entry.SerializeToString()),
+            _HashEntrySHA256(hash_entry)
+        ])
+      if hash_entries:
+        latest = sqlite_utils.RDFDatetimeToInt(max(hash_entries))
+        hash_updates.append([latest, latest] + key)
+
+    if stat_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_stat_entries(client_id, path_type, path_id, "
+          "timestamp, stat_entry) VALUES (?, ?, ?, ?, ?)", stat_rows)
+      cursor.executemany(
+          "UPDATE client_paths SET last_stat_entry_timestamp = "
+          "MAX(COALESCE(last_stat_entry_timestamp, ?), ?) " +
+          _PATH_KEY_CONDITION, stat_updates)
+
+    if hash_rows:
+      cursor.executemany(
+          "INSERT INTO client_path_hash_entries(client_id, path_type, path_id, "
+          "timestamp, hash_entry, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+          hash_rows)
+      cursor.executemany(
+          "UPDATE client_paths SET last_hash_entry_timestamp = "
+          "MAX(COALESCE(last_hash_entry_timestamp, ?), ?) " +
+          _PATH_KEY_CONDITION, hash_updates)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadPathInfosHistories(self,
+                             client_id,
+                             path_type,
+                             components_list,
+                             cursor=None):
+    """Reads a collection of hash and stat entries for given paths."""
+    results = {components: [] for components in components_list}
+
+    components_by_path_id = {
+        _PathIDBytes(components): components for components in results
+    }
+    entries_by_key = {}
+
+    def GetPathInfo(path_id, timestamp):
+      key = (path_id, timestamp)
+      if key not in entries_by_key:
+        entries_by_key[key] = rdf_objects.PathInfo(
+            path_type=path_type,
+            components=components_by_path_id[path_id],
+            timestamp=sqlite_utils.IntToRDFDatetime(timestamp))
+      return entries_by_key[key]
+
+    for batch in collection.Batch(
+        list(components_by_path_id), sqlite_utils.MAX_QUERY_PARAMETERS):
+      condition = ("WHERE client_id = ? AND path_type = ? "
+                   "AND path_id IN ({})").format(
+                       sqlite_utils.Placeholders(len(batch)))
+      values = [client_id, int(path_type)]
+      values += [sqlite_utils.Blob(path_id) for path_id in batch]
+
+      cursor.execute(
+          "SELECT path_id, timestamp, stat_entry "
+          "FROM client_path_stat_entries " + condition, values)
+      for path_id, timestamp, stat_entry in cursor.fetchall():
+        path_info = GetPathInfo(bytes(path_id), timestamp)
+        path_info.stat_entry = sqlite_utils.BlobToRDFProto(
+            rdf_client_fs.StatEntry, stat_entry)
+
+      cursor.execute(
+          "SELECT path_id, timestamp, hash_entry "
+          "FROM client_path_hash_entries " + condition, values)
+      for path_id, timestamp, hash_entry in cursor.fetchall():
+        path_info = GetPathInfo(bytes(path_id), timestamp)
+        path_info.hash_entry = sqlite_utils.BlobToRDFProto(
+            rdf_crypto.Hash, hash_entry)
+
+    for (path_id, _), path_info in sorted(iteritems(entries_by_key)):
+      results[components_by_path_id[path_id]].append(path_info)
+
+    return results
+
+  def ReadLatestPathInfosWithHashBlobReferences(self,
+                                                client_paths,
+                                                max_timestamp=None):
+    """Returns PathInfos that have corresponding HashBlobReferences."""
+    results = {client_path: None for client_path in client_paths}
+
+    candidates = self._ReadHashEntryCandidates(
+        client_paths, max_timestamp=max_timestamp)
+    hash_ids = set()
+    for path_infos in candidates.values():
+      for path_info in path_infos:
+        hash_ids.add(
+            rdf_objects.SHA256HashID.FromBytes(
+                path_info.hash_entry.sha256.AsBytes()))
+
+    if not hash_ids:
+      return results
+
+    blob_refs = self.ReadHashBlobReferences(list(hash_ids))
+    for client_path, path_infos in iteritems(candidates):
+      # Candidates are ordered from the newest to the oldest.
+      for path_info in path_infos:
+        hash_id = rdf_objects.SHA256HashID.FromBytes(
+            path_info.hash_entry.sha256.AsBytes())
+        if blob_refs.get(hash_id):
+          results[client_path] = path_info
+          break
+
+    return results
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def _ReadHashEntryCandidates(self,
+                               client_paths,
+                               max_timestamp=None,
+                               cursor=None):
+    """Reads hash entries with a SHA-256 digest for given paths.
+
+    Args:
+      client_paths: A list of `db.ClientPath` instances.
+      max_timestamp: If set, only entries not newer than it are returned.
+      cursor: An SQLite cursor.
+
+    Returns:
+      A dictionary mapping client paths to lists of `rdf_objects.PathInfo`
+      ordered by timestamp in descending order. Each path info carries the
+      hash entry and the stat entry written at the same timestamp, if any.
+    """
+    client_paths_by_key = {}
+    for client_path in client_paths:
+      key = (client_path.client_id, int(client_path.path_type),
+             _PathIDBytes(client_path.components))
+      client_paths_by_key[key] = client_path
+
+    result = {}
+    # Every path contributes three query parameters.
+    for batch in collection.Batch(
+        list(client_paths_by_key), sqlite_utils.MAX_QUERY_PARAMETERS // 3):
+      query = ("SELECT h.client_id, h.path_type, h.path_id, h.timestamp, "
+               "h.hash_entry, s.stat_entry "
+               "FROM client_path_hash_entries AS h "
+               "LEFT JOIN client_path_stat_entries AS s "
+               "ON s.client_id = h.client_id AND s.path_type = h.path_type "
+               "AND s.path_id = h.path_id AND s.timestamp = h.timestamp "
+               "WHERE ({}) AND h.sha256 IS NOT NULL").format(" OR ".join(
+                   ["(h.client_id = ? AND h.path_type = ? AND h.path_id = ?)"] *
+                   len(batch)))
+      values = []
+      for client_id, path_type, path_id in batch:
+        values += [client_id, path_type, sqlite_utils.Blob(path_id)]
+
+      if max_timestamp is not None:
+        query += " AND h.timestamp <= ?"
+        values.append(sqlite_utils.RDFDatetimeToInt(max_timestamp))
+
+      query += " ORDER BY h.timestamp DESC"
+      cursor.execute(query, values)
+
+      for (client_id, path_type, path_id, timestamp, hash_entry,
+           stat_entry) in cursor.fetchall():
+        client_path = client_paths_by_key[(client_id, path_type,
+                                           bytes(path_id))]
+        path_info = rdf_objects.PathInfo(
+            path_type=client_path.path_type,
+            components=client_path.components,
+            timestamp=sqlite_utils.IntToRDFDatetime(timestamp),
+            hash_entry=sqlite_utils.BlobToRDFProto(rdf_crypto.Hash,
+                                                   hash_entry),
+            stat_entry=sqlite_utils.BlobToRDFProto(rdf_client_fs.StatEntry,
+                                                   stat_entry))
+        result.setdefault(client_path, []).append(path_info)
+
+    return result
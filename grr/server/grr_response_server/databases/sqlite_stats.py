@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""SQLite implementation of DB methods for handling server metrics."""
+from __future__ import absolute_import
+
+from __future__ import unicode_literals
+
+import sqlite3
+
+from future.builtins import int
+
+from typing import Iterable, Optional, Text, Sequence, Tuple
+
+from grr_response_core.lib import rdfvalue
+from grr_response_server import db
+from grr_response_server import db_utils
+from grr_response_server import stats_values
+from grr_response_server.databases import sqlite_utils
+
+# Type alias representing a time-range.
+_TimeRange = Tuple[rdfvalue.RDFDatetime, rdfvalue.RDFDatetime]
+
+
+
+class SqliteDBStatsMixin(object):
+  """Mixin providing an SQLite implementation of stats-related DB logic."""
+
+  @sqlite_utils.WithTransaction()
+  def WriteStatsStoreEntries(
+      self, stats_entries, cursor=None):
+    """See db.Database."""
+    rows = []
+    for stats_entry in stats_entries:
+      rows.append((
+          sqlite_utils.Blob(db_utils.GenerateStatsEntryId(stats_entry)),
+          stats_entry.process_id,
+          stats_entry.metric_name,
+          sqlite_utils.RDFDatetimeToInt(stats_entry.timestamp),
+          sqlite_utils.Blob(stats_entry.SerializeToString()),
+      ))
+    try:
+      cursor.executemany(
+          "INSERT INTO stats_store_entries "
+          "(entry_id, process_id, metric_name, timestamp, entry) "
+          "VALUES (?, ?, ?, ?, ?)", rows)
+    except sqlite3.IntegrityError as e:
+      raise db.DuplicateMetricValueError(cause=e)
+
+  @sqlite_utils.WithTransaction(readonly=True)
+  def ReadStatsStoreEntries(
+      self,
+      process_id_prefix,
+      metric_name,
+      time_range = None,
+      max_results = 0,
+      cursor=None):
+    """See db.Database."""
+    # LIKE is case-insensitive and treats '%' and '_' in the prefix as
+    # wildcards, the prefix is compared explicitly instead.
+    query = ("SELECT entry FROM stats_store_entries "
+             "WHERE metric_name = ? AND substr(process_id, 1, ?) = ?")
+    args = [metric_name, len(process_id_prefix), process_id_prefix]
+    if time_range is not None:
+      query += " AND timestamp >= ? AND timestamp <= ?"
+      args += [
+          sqlite_utils.RDFDatetimeToInt(time_range[0]),
+          sqlite_utils.RDFDatetimeToInt(time_range[1])
+      ]
+    if max_results:
+      query += " LIMIT ?"
+      args.append(max_results)
+
+    cursor.execute(query, args)
+    return [
+        sqlite_utils.BlobToRDFProto(stats_values.StatsStoreEntry, entry)
+        for entry, in cursor.fetchall()
+    ]
+
+  @sqlite_utils.WithTransaction()
+  def DeleteStatsStoreEntriesOlderThan(self, cutoff,
+                                       cursor=None):
+    """See db.Database."""
+    cursor.execute("DELETE FROM stats_store_entries WHERE timestamp < ?",
+                   [sqlite_utils.RDFDatetimeToInt(cutoff)])
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sqlite3
+import threading
+
+from absl.testing import absltest
+import queue
+
+from grr_response_core.lib import flags
+from grr_response_core.lib import utils
+from grr_response_core.lib.rdfvalues import flows as rdf_flows
+from grr_response_server import db_test_mixin
+from grr_response_server.databases import sqlite
+from grr_response_server.databases import sqlite_flows
+from grr.test_lib import stats_test_lib
+from grr.test_lib import temp
+from grr.test_lib import test_lib
+
+
+class TestSqliteDB(stats_test_lib.StatsTestMixin,
+                   db_test_mixin.DatabaseTestMixin, absltest.TestCase):
+  """Test the sqlite.SqliteDB class.
+
+  Most of the tests in this suite are general blackbox tests of the db.Database
+  interface brought in by the db_test.DatabaseTestMixin.
+  """
+
+  flow_processing_req_func = "_WriteFlowProcessingRequests"
+
+  def CreateDatabase(self):
+    temp_dir = temp.TempDirPath()
+    self.db_path = os.path.join(temp_dir, "grr.sqlite")
+    conn = sqlite.SqliteDB(path=self.db_path)
+
+    def Fin():
+      conn.Close()
+      shutil.rmtree(temp_dir)
+
+    return conn, Fin
+
+  def testIsRetryable(self):
+    self.assertFalse(sqlite._IsRetryable(Exception("Some general error.")))
+    self.assertFalse(
+        sqlite._IsRetryable(sqlite3.OperationalError("no such table: foo")))
+    self.assertTrue(
+        sqlite._IsRetryable(sqlite3.OperationalError("database is locked")))
+
+  def AddUser(self, connection, user, passwd):
+    connection.execute(
+        "INSERT INTO grr_users (username, password) VALUES (?, ?)",
+        (user, sqlite3.Binary(passwd)))
+
+  def ListUsers(self, connection):
+    cursor = connection.execute(
+        "SELECT username, password FROM grr_users ORDER BY username")
+    return [(username, bytes(password)) for username, password in cursor]
+
+  def testUsesWriteAheadLog(self):
+    connection = sqlite3.connect(self.db_path)
+    try:
+      journal_mode, = connection.execute("PRAGMA journal_mode").fetchone()
+    finally:
+      connection.close()
+    self.assertEqual(journal_mode, "wal")
+
+  def testRunInTransaction(self):
+    self.db.delegate._RunInTransaction(
+        lambda con: self.AddUser(con, "AzureDiamond", b"hunter2"))
+
+    users = self.db.delegate._RunInTransaction(self.ListUsers, readonly=True)
+    self.assertEqual(users, [(u"AzureDiamond", b"hunter2")])
+
+  def testRunInTransactionRollsBackOnError(self):
+
+    def Transaction(connection):
+      self.AddUser(connection, "AzureDiamond", b"hunter2")
+      raise ValueError("Something went wrong.")
+
+    with self.assertRaises(ValueError):
+      self.db.delegate._RunInTransaction(Transaction)
+
+    users = self.db.delegate._RunInTransaction(self.ListUsers, readonly=True)
+    self.assertEqual(users, [])
+
+  def testNestedTransactionsAreJoined(self):
+
+    def Transaction(connection):
+      self.AddUser(connection, "user1", b"pw1")
+      # A nested transaction sees the uncommitted changes of the outer one.
+      return self.db.delegate._RunInTransaction(self.ListUsers, readonly=True)
+
+    users = self.db.delegate._RunInTransaction(Transaction)
+    self.assertEqual(users, [(u"user1", b"pw1")])
+
+  def testRunInTransactionLockedDatabase(self):
+    """A transaction blocked by another connection should be retried."""
+    # Connections opened from now on fail right away if the database is locked
+    # instead of waiting for the lock.
+    self.db.delegate._busy_timeout = 0
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    def LockingTransaction(connection):
+      self.AddUser(connection, "user1", b"pw1")
+      locked.set()
+      self.assertTrue(release.wait(5))
+
+    def BlockedTransaction(connection):
+      self.AddUser(connection, "user2", b"pw2")
+
+    errors = []
+
+    def RunBlockedTransaction():
+      try:
+        self.db.delegate._RunInTransaction(BlockedTransaction)
+      except sqlite3.Error as e:
+        errors.append(e)
+
+    locking_thread = threading.Thread(
+        target=lambda: self.db.delegate._RunInTransaction(LockingTransaction))
+    locking_thread.start()
+    self.assertTrue(locked.wait(5))
+
+    blocked_thread = threading.Thread(target=RunBlockedTransaction)
+    blocked_thread.start()
+    # Release the lock while the blocked transaction waits for its retry.
+    release.set()
+    locking_thread.join()
+    blocked_thread.join()
+
+    self.assertEqual(errors, [])
+    users = self.db.delegate._RunInTransaction(self.ListUsers, readonly=True)
+    self.assertEqual(users, [(u"user1", b"pw1"), (u"user2", b"pw2")])
+
+  def testConnectionsOfFinishedThreadsAreClosed(self):
+    thread = threading.Thread(target=self.db.ReadAllGRRUsers)
+    thread.start()
+    thread.join()
+
+    # Opening a connection on a new thread prunes the connections of threads
+    # that are no longer alive.
+    other_thread = threading.Thread(target=self.db.ReadAllGRRUsers)
+    other_thread.start()
+    other_thread.join()
+    self.assertNotIn(thread, self.db.delegate._connections)
+    self.assertIn(other_thread, self.db.delegate._connections)
+
+  def testSuccessfulCallsAreCorrectlyAccounted(self):
+    with self.assertStatsCounterDelta(
+        1, "db_request_latency", fields=["ReadAllGRRUsers"]):
+      self.db.ReadAllGRRUsers()
+
+  def testDataVersionChangesOnWriteFromOtherConnection(self):
+    client_id, flow_id = self._SetupClientAndFlow()
+    data_version = self.db.delegate._ReadDataVersion()
+
+    def Write():
+      self.db.WriteFlowProcessingRequests([
+          rdf_flows.FlowProcessingRequest(client_id=client_id, flow_id=flow_id)
+      ])
+
+    thread = threading.Thread(target=Write)
+    thread.start()
+    thread.join()
+
+    self.assertNotEqual(self.db.delegate._ReadDataVersion(), data_version)
+
+  def testFlowProcessingHandlerKeepsRunningAfterError(self):
+    client_id, flow_id = self._SetupClientAndFlow()
+
+    lease = self.db.delegate._LeaseFlowProcessingReqests
+    calls = []
+
+    def FailingLease():
+      calls.append(None)
+      if len(calls) == 1:
+        raise sqlite3.OperationalError("database is locked")
+      return lease()
+
+    handled = queue.Queue()
+    with utils.Stubber(self.db.delegate, "_LeaseFlowProcessingReqests",
+                       FailingLease):
+      self.db.RegisterFlowProcessingHandler(handled.put)
+      self.addCleanup(self.db.UnregisterFlowProcessingHandler)
+
+      self.db.WriteFlowProcessingRequests([
+          rdf_flows.FlowProcessingRequest(client_id=client_id, flow_id=flow_id)
+      ])
+      request = handled.get(timeout=10)
+
+    self.assertEqual(request.flow_id, flow_id)
+
+  def testQueueNotifierWakesUpWaitingHandler(self):
+    notifier = sqlite_flows.QueueNotifier()
+    # Without a state change the waiting handler is only woken up by the
+    # notifier.
+    read_state_fn = lambda: None
+
+    thread = threading.Thread(
+        target=notifier.Wait, args=(read_state_fn, None, lambda: False))
+    thread.start()
+    notifier.Notify()
+    thread.join(2)
+    self.assertFalse(thread.is_alive())
+
+  def testQueueNotifierWakesUpOnStateChange(self):
+    notifier = sqlite_flows.QueueNotifier()
+    state = [0]
+
+    thread = threading.Thread(
+        target=notifier.Wait, args=(lambda: state[0], 0, lambda: False))
+    thread.start()
+    state[0] = 1
+    thread.join(2)
+    self.assertFalse(thread.is_alive())
+
+
+if __name__ == "__main__":
+  flags.StartMain(test_lib.main)
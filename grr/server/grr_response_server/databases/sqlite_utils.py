@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Utilities used by the SQLite database."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import functools
+import sqlite3
+
+from grr_response_core.lib import rdfvalue
+from grr_response_server import db_utils
+
+# SQLite limits the number of host parameters in a single statement. The limit
+# is 999 in versions older than 3.32, queries with long IN (...) lists are
+# split into batches that stay below it.
+MAX_QUERY_PARAMETERS = 900
+
+
+def Placeholders(count):
+  """Returns a comma separated list of `count` parameter placeholders."""
+  return ", ".join(["?"] * count)
+
+
+def Blob(value):
+  """Wraps bytes to be stored in a BLOB column.
+
+  Plain byte strings are bound as TEXT by the Python 2 driver, which fails for
+  anything that isn't valid UTF-8.
+
+  Args:
+    value: Bytes to store or None.
+
+  Returns:
+    A value that is bound as BLOB or None.
+  """
+  return value if value is None else sqlite3.Binary(value)
+
+
+def BlobToBytes(value):
+  """Converts a value read from a BLOB column to bytes."""
+  return value if value is None else bytes(value)
+
+
+def BlobToRDFProto(proto_type, value):
+  if value is None:
+    return None
+  return proto_type.FromSerializedString(bytes(value))
+
+
+# Timestamps are stored as integer microseconds since epoch, so that they are
+# compared and ordered exactly and cheaply.
+def RDFDatetimeToInt(rdf):
+  if rdf is None:
+    return None
+  if not isinstance(rdf, rdfvalue.RDFDatetime):
+    raise ValueError(
+        "time value must be rdfvalue.RDFDatetime, got: %s" % type(rdf))
+  return rdf.AsMicrosecondsSinceEpoch()
+
+
+def IntToRDFDatetime(value):
+  return value if value is None else rdfvalue.RDFDatetime(value)
+
+
+# SQLite integers are signed 64-bit values. Unsigned 64-bit ids (e.g. task ids
+# of client messages) are stored in their two's complement representation.
+def UInt64ToInt(value):
+  return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def IntToUInt64(value):
+  return value + (1 << 64) if value < 0 else value
+
+
+def ComponentsToPath(components):
+  """Converts a list of path components to a canonical path representation.
+
+  Args:
+    components: A sequence of path components.
+
+  Returns:
+    A canonical path representation, e.g. "/foo/bar" for ("foo", "bar") and ""
+    for the root path.
+
+  Raises:
+    ValueError: A path component contains a slash.
+  """
+  for component in components:
+    if "/" in component:
+      raise ValueError("Path component with '/' in: %s" % (components,))
+
+  if components:
+    return "/" + "/".join(components)
+  else:
+    return ""
+
+
+def PathToComponents(path):
+  """Converts a canonical path representation to a tuple of path components."""
+  if path:
+    return tuple(path.split("/")[1:])
+  else:
+    return ()
+
+
+def IsForeignKeyError(error):
+  """Returns whether an integrity error is a foreign key violation."""
+  return "FOREIGN KEY" in str(error)
+
+
+class WithTransaction(object):
+  """Decorator that provides a cursor with transaction management.
+
+  Every function decorated @WithTransaction will receive a named 'cursor'
+  argument.
+
+  If the caller provides a cursor, it will be passed through without change.
+
+  Otherwise, a transaction is started on the connection of the calling thread
+  and the decorated function is called with a cursor of that connection.
+  Afterward, the transaction is committed. If the database is locked by
+  another process for longer than the busy timeout, the decorated function may
+  be called again after a short delay.
+  """
+
+  def __init__(self, readonly=False):
+    """Constructs a decorator.
+
+    Args:
+      readonly: Whether the decorated function only requires a readonly
+        transaction. Readonly transactions don't take the write lock.
+    """
+    self.readonly = readonly
+
+  def __call__(self, func):
+    readonly = self.readonly
+
+    @functools.wraps(func)
+    def Decorated(self, *args, **kw):
+      """A function decorated by WithTransaction to receive a cursor."""
+      cursor = kw.get("cursor", None)
+      if cursor:
+        return func(self, *args, **kw)
+
+      def Closure(connection):
+        cursor = connection.cursor()
+        try:
+          new_kw = kw.copy()
+          new_kw["cursor"] = cursor
+          return func(self, *args, **new_kw)
+        finally:
+          cursor.close()
+
+      return self._RunInTransaction(Closure, readonly)
+
+    return db_utils.CallLoggedAndAccounted(Decorated)
@@ -625,6 +625,19 @@ class Database(with_metaclass(abc.ABCMeta, object)):
         ids.
     """
 
+  @abc.abstractmethod
+  def ListClientsForAllKeywords(self, keywords, start_time=None):
+    """Lists the clients associated with all of the given keywords.
+
+    Args:
+      keywords: An iterable container of keyword strings to look for.
+      start_time: If set, should be an rdfvalue.RDFDatime and the function will
+        only consider keywords associated after this time.
+
+    Returns:
+      A sorted list of ids of clients that match every keyword.
+    """
+
   @abc.abstractmethod
   def RemoveClientKeyword(self, client_id, keyword):
     """Removes the association of a particular client to a keyword.
@@ -1847,6 +1860,9 @@ class DatabaseValidationWrapper(Database):
   def __init__(self, delegate):
     super(DatabaseValidationWrapper, self).__init__()
     self.delegate = delegate
+    # Counts modifications of the foreman rules so that cached rules can be
+    # invalidated, see foreman.ForemanRuleCache.
+    self.foreman_rules_version = 0
 
   def WriteArtifact(self, artifact):
     precondition.AssertType(artifact, rdf_artifacts.Artifact)
@@ -1988,6 +2004,18 @@ class DatabaseValidationWrapper(Database):
 
     return self.delegate.ListClientsForKeywords(keywords, start_time=start_time)
 
+  def ListClientsForAllKeywords(self, keywords, start_time=None):
+    keywords = set(keywords)
+    if len({utils.SmartStr(kw) for kw in keywords}) != len(keywords):
+      raise ValueError("Multiple keywords map to the same string "
+                       "representation.")
+
+    if start_time:
+      _ValidateTimestamp(start_time)
+
+    return self.delegate.ListClientsForAllKeywords(
+        keywords, start_time=start_time)
+
   def RemoveClientKeyword(self, client_id, keyword):
     _ValidateClientId(client_id)
 
@@ -2021,17 +2049,26 @@ class DatabaseValidationWrapper(Database):
     if not rule.hunt_id:
       raise ValueError("Foreman rule has no hunt_id: %s" % rule)
 
-    return self.delegate.WriteForemanRule(rule)
+    try:
+      return self.delegate.WriteForemanRule(rule)
+    finally:
+      self.foreman_rules_version += 1
 
   def RemoveForemanRule(self, hunt_id):
     _ValidateHuntId(hunt_id)
-    return self.delegate.RemoveForemanRule(hunt_id)
+    try:
+      return self.delegate.RemoveForemanRule(hunt_id)
+    finally:
+      self.foreman_rules_version += 1
 
   def ReadAllForemanRules(self):
     return self.delegate.ReadAllForemanRules()
 
   def RemoveExpiredForemanRules(self):
-    return self.delegate.RemoveExpiredForemanRules()
+    try:
+      return self.delegate.RemoveExpiredForemanRules()
+    finally:
+      self.foreman_rules_version += 1
 
   def WriteGRRUser(self,
                    username,
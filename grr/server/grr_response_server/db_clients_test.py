@@ -605,6 +605,44 @@ class DatabaseTestClientsMixin(object):
     self.assertEqual(res["hostname1"], [])
     self.assertEqual(res["hostname2"], [client_id])
 
+  def testListClientsForAllKeywords(self):
+    d = self.db
+    client_id_1 = self.InitializeClient()
+    client_id_2 = self.InitializeClient()
+    client_id_3 = self.InitializeClient()
+
+    d.AddClientKeywords(client_id_1, ["joe", "machine", "label:foo"])
+    d.AddClientKeywords(client_id_2, ["fred", "machine", "label:foo"])
+    d.AddClientKeywords(client_id_3, ["fred", "machine"])
+
+    self.assertEqual(
+        d.ListClientsForAllKeywords(["machine", "label:foo"]),
+        sorted([client_id_1, client_id_2]))
+    self.assertEqual(
+        d.ListClientsForAllKeywords(["fred", "label:foo"]), [client_id_2])
+    self.assertEqual(d.ListClientsForAllKeywords(["fred", "missing"]), [])
+    self.assertEqual(d.ListClientsForAllKeywords(["joe", "fred"]), [])
+
+  def testListClientsForAllKeywordsTimeRanges(self):
+    d = self.db
+    client_id_1 = self.InitializeClient()
+    client_id_2 = self.InitializeClient()
+
+    d.AddClientKeywords(client_id_1, ["machine", "hostname1"])
+    d.AddClientKeywords(client_id_2, ["machine", "hostname1"])
+    change_time = rdfvalue.RDFDatetime.Now()
+    d.AddClientKeywords(client_id_2, ["machine"])
+
+    self.assertEqual(
+        d.ListClientsForAllKeywords(["machine"], start_time=change_time),
+        [client_id_2])
+    self.assertEqual(
+        d.ListClientsForAllKeywords(["machine", "hostname1"],
+                                    start_time=change_time), [])
+    self.assertEqual(
+        d.ListClientsForAllKeywords(["machine", "hostname1"]),
+        sorted([client_id_1, client_id_2]))
+
   def testRemoveClientKeyword(self):
     d = self.db
     client_id = self.InitializeClient()
@@ -236,6 +236,28 @@ class DatabaseTestPathsMixin(object):
     self.assertEqual(result.stat_entry, stat_entry)
     self.assertEqual(result.hash_entry, hash_entry)
 
+  def testWritePathInfosDuplicatedHashAndStatEntries(self):
+    client_id = self.InitializeClient()
+
+    stat_entry = rdf_client_fs.StatEntry(st_mode=1337)
+    hash_entry = rdf_crypto.Hash(md5=hashlib.md5("foo").digest())
+
+    # The validation wrapper rejects such writes, but the databases must not
+    # fail on them.
+    self.db.delegate.WritePathInfos(client_id, [
+        rdf_objects.PathInfo.OS(
+            components=["foo"],
+            stat_entry=rdf_client_fs.StatEntry(st_mode=42),
+            hash_entry=rdf_crypto.Hash(md5=hashlib.md5("bar").digest())),
+        rdf_objects.PathInfo.OS(
+            components=["foo"], stat_entry=stat_entry, hash_entry=hash_entry),
+    ])
+
+    result = self.db.ReadPathInfo(
+        client_id, rdf_objects.PathInfo.PathType.OS, components=("foo",))
+    self.assertEqual(result.stat_entry, stat_entry)
+    self.assertEqual(result.hash_entry, hash_entry)
+
   def testWritePathInfoHashAndStatEntrySeparateWrites(self):
     client_id = self.InitializeClient()
 
@@ -1079,6 +1101,57 @@ class DatabaseTestPathsMixin(object):
     self.assertEqual(len(tsk_results), 1)
     self.assertEqual(tsk_results[0].components, ("usr", "bin", "gdb"))
 
+  def testListDescendentPathInfosClientSeparated(self):
+    client_a_id = self.InitializeClient()
+    client_b_id = self.InitializeClient()
+
+    self.db.WritePathInfos(client_a_id, [
+        rdf_objects.PathInfo.OS(components=["usr", "bin", "javac"]),
+    ])
+    self.db.WritePathInfos(client_b_id, [
+        rdf_objects.PathInfo.OS(components=["usr", "bin", "gdb"]),
+        rdf_objects.PathInfo.OS(components=["usr", "lib", "libc.so"]),
+    ])
+
+    results = self.db.ListDescendentPathInfos(
+        client_a_id, rdf_objects.PathInfo.PathType.OS, components=("usr",))
+    self.assertEqual(len(results), 2)
+    self.assertEqual(results[0].components, ("usr", "bin"))
+    self.assertEqual(results[1].components, ("usr", "bin", "javac"))
+
+  def testReadPathInfoTimestampBeforeAndAfterHistory(self):
+    datetime = rdfvalue.RDFDatetime.FromHumanReadable
+
+    client_id = self.InitializeClient()
+    self.db.WritePathInfos(client_id,
+                           [rdf_objects.PathInfo.OS(components=["foo"])])
+
+    client_path = db.ClientPath.OS(client_id, components=("foo",))
+    self.db.WritePathStatHistory(
+        client_path, {
+            datetime("2010-01-01"): rdf_client_fs.StatEntry(st_size=1),
+            datetime("2011-01-01"): rdf_client_fs.StatEntry(st_size=2),
+            datetime("2012-01-01"): rdf_client_fs.StatEntry(st_size=3),
+        })
+
+    path_info = self.db.ReadPathInfo(
+        client_id,
+        rdf_objects.PathInfo.PathType.OS,
+        components=("foo",),
+        timestamp=datetime("2011-01-01"))
+    self.assertEqual(path_info.stat_entry.st_size, 2)
+    self.assertEqual(path_info.last_stat_entry_timestamp,
+                     datetime("2011-01-01"))
+
+    path_info = self.db.ReadPathInfo(
+        client_id,
+        rdf_objects.PathInfo.PathType.OS,
+        components=("foo",),
+        timestamp=datetime("2011-06-01"))
+    self.assertEqual(path_info.stat_entry.st_size, 2)
+    self.assertEqual(path_info.last_stat_entry_timestamp,
+                     datetime("2011-01-01"))
+
   def testListDescendentPathInfosAll(self):
     client_id = self.InitializeClient()
 
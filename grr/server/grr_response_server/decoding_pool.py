@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+"""Decodes client messages in a pool of processes.
+
+Decoding a ClientCommunication whose cipher is not cached requires an RSA
+decryption followed by AES decryption and zlib decompression of the payload.
+Done in the frontend's HTTP handler threads this work is serialized on the GIL,
+so under a poll storm a single frontend can only use a single core.
+
+The CommsDecodingPool collects the uncached messages from all handler threads
+into batches and sends the batches to worker processes which hold a copy of the
+server private key. The signature verification, which needs the client's
+public key from the data store, stays in the frontend process.
+
+The workers are spawned processes rather than forked from the frontend, which
+already runs many threads when the pool is created.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+import threading
+import time
+
+from builtins import range  # pylint: disable=redefined-builtin
+from builtins import zip  # pylint: disable=redefined-builtin
+import queue
+
+from grr_response_core.lib import communicator
+from grr_response_core.lib.rdfvalues import crypto as rdf_crypto
+from grr_response_core.lib.rdfvalues import flows as rdf_flows
+from grr_response_core.stats import default_stats_collector
+from grr_response_core.stats import stats_collector_instance
+from grr_response_server import spawned_process
+
+# The server private key, only set in the worker processes.
+_worker_private_key = None
+
+
+def _InitWorker(serialized_private_key):
+  """Initializes a worker process."""
+  global _worker_private_key
+
+  # Decoding errors are counted when they are created. The worker counts are
+  # never exported, the errors are counted again in the frontend process.
+  stats_collector_instance.Set(
+      default_stats_collector.DefaultStatsCollector(
+          communicator.GetMetricMetadata()))
+
+  _worker_private_key = rdf_crypto.RSAPrivateKey(serialized_private_key)
+
+
+def _DecodeBatch(batch):
+  """Decodes a batch of serialized ClientCommunications in a worker process.
+
+  Args:
+    batch: A list of serialized ClientCommunication protos.
+
+  Returns:
+    A list with one (error, result, decoding_time) tuple per input. If decoding
+    failed, error is an (exception class, message) tuple and result is None.
+    Otherwise error is None and result is a tuple of the serialized
+    CipherProperties, CipherMetadata, PackedMessageList and MessageList.
+  """
+  results = []
+  for serialized_comms in batch:
+    start_time = time.time()
+    try:
+      response_comms = rdf_flows.ClientCommunication.FromSerializedString(
+          serialized_comms)
+      cipher = communicator.ReceivedCipher(response_comms, _worker_private_key)
+      packed_message_list, message_list = (
+          communicator.Communicator.DecryptMessageList(cipher, response_comms))
+      result = (cipher.serialized_cipher,
+                cipher.cipher_metadata.SerializeToString(),
+                packed_message_list.SerializeToString(),
+                message_list.SerializeToString())
+      results.append((None, result, time.time() - start_time))
+    except communicator.DecodingError as e:
+      results.append(((e.__class__, str(e)), None, time.time() - start_time))
+    # One bad message must not fail the other messages in the batch.
+    except Exception as e:  # pylint: disable=broad-except
+      results.append(((communicator.DecodingError,
+                       "Error while decrypting messages: %s" % e), None,
+                      time.time() - start_time))
+
+  return results
+
+
+class PoolUnavailableError(Exception):
+  """Raised when messages could not be decoded by the worker processes."""
+
+
+# States of a _PendingMessages.
+_QUEUED = "queued"
+_RUNNING = "running"
+_CANCELLED = "cancelled"
+
+
+class _PendingMessages(object):
+  """Uncached messages waiting to be decoded."""
+
+  def __init__(self, serialized_comms):
+    self.serialized_comms = serialized_comms
+    self.queued_time = time.time()
+    self.done = threading.Event()
+    # An (error, result, decoding_time) tuple, see _DecodeBatch. None if the
+    # worker process failed.
+    self.result = None
+
+    self._state = _QUEUED
+    self._lock = threading.Lock()
+
+  def _Transition(self, new_state):
+    with self._lock:
+      if self._state != _QUEUED:
+        return False
+      self._state = new_state
+      return True
+
+  def Claim(self):
+    """Returns True if a worker may decode the messages."""
+    return self._Transition(_RUNNING)
+
+  def Cancel(self):
+    """Returns True if the messages will not be decoded by a worker."""
+    return self._Transition(_CANCELLED)
+
+  def SetResult(self, result):
+    self.result = result
+    self.done.set()
+
+
+class CommsDecodingPool(object):
+  """Decodes batches of uncached client messages in worker processes."""
+
+  def __init__(self, private_key, num_processes, max_batch_size=50,
+               timeout=None):
+    """Constructor.
+
+    Args:
+      private_key: The server private key, an rdf_crypto.RSAPrivateKey.
+      num_processes: The number of worker processes to start.
+      max_batch_size: The maximum number of messages sent to a worker at once.
+      timeout: The maximum number of seconds Decode waits for a worker to pick
+        up the messages. If None, Decode waits indefinitely.
+    """
+    self.private_key = private_key
+    self.max_batch_size = max_batch_size
+    self.timeout = timeout
+
+    self._stopped = False
+    self._serialized_private_key = private_key.SerializeToString()
+
+    self._queue = queue.Queue()
+    self._workers = [self._StartWorker() for _ in range(num_processes)]
+
+    # Every worker process is fed by its own dispatcher thread.
+    self._dispatchers = []
+    for i in range(num_processes):
+      dispatcher = threading.Thread(
+          name="CommsDecodingPoolDispatcher%d" % i,
+          target=self._DispatchLoop,
+          args=(i,))
+      dispatcher.daemon = True
+      dispatcher.start()
+      self._dispatchers.append(dispatcher)
+
+  def _StartWorker(self):
+    worker = spawned_process.SpawnedProcess()
+    worker.Call(_InitWorker, self._serialized_private_key)
+    return worker
+
+  def _UpdateQueueDepth(self):
+    stats_collector_instance.Get().SetGaugeValue(
+        "frontend_decoding_queue_depth", self._queue.qsize())
+
+  def _NextBatch(self):
+    """Returns the next batch of claimed messages, None once stopped."""
+    while True:
+      item = self._queue.get()
+      if item is None:
+        return None
+
+      # We never wait for a batch to fill up: under low load every message is
+      # dispatched immediately, under high load messages queue up while the
+      # workers are busy and get sent in larger batches.
+      batch = [item]
+      while len(batch) < self.max_batch_size:
+        try:
+          item = self._queue.get_nowait()
+        except queue.Empty:
+          break
+        if item is None:
+          self._queue.put(None)
+          break
+        batch.append(item)
+
+      self._UpdateQueueDepth()
+
+      # Messages whose callers gave up waiting are skipped.
+      batch = [pending for pending in batch if pending.Claim()]
+      if batch:
+        return batch
+
+  def _DispatchLoop(self, index):
+    """Sends batches of queued messages to one worker process."""
+    while True:
+      batch = self._NextBatch()
+      if batch is None:
+        self._workers[index].Stop()
+        return
+
+      now = time.time()
+      for pending in batch:
+        stats_collector_instance.Get().RecordEvent(
+            "frontend_decoding_latency",
+            now - pending.queued_time,
+            fields=["queue"])
+
+      try:
+        results = self._workers[index].Call(
+            _DecodeBatch, [pending.serialized_comms for pending in batch])
+      except spawned_process.ProcessDiedError as e:
+        logging.exception("Decoding process failed: %s", e)
+        results = [None] * len(batch)
+        self._RestartWorker(index)
+
+      for pending, result in zip(batch, results):
+        pending.SetResult(result)
+
+  def _RestartWorker(self, index):
+    self._workers[index].Stop()
+    try:
+      self._workers[index] = self._StartWorker()
+    except (EnvironmentError, spawned_process.Error) as e:
+      logging.exception("Unable to restart decoding process: %s", e)
+
+  def Decode(self, response_comms):
+    """Decodes messages whose cipher is not in the encrypted cipher cache.
+
+    Args:
+      response_comms: A ClientCommunication rdfvalue.
+
+    Returns:
+      A tuple of the ReceivedCipher, the PackedMessageList and the MessageList.
+
+    Raises:
+      DecodingError: If the messages could not be decoded.
+      PoolUnavailableError: If the pool is stopped, no worker picked up the
+        messages in time or the worker process failed. The messages were not
+        decoded in this case.
+    """
+    if self._stopped:
+      raise PoolUnavailableError("Decoding pool is stopped.")
+
+    start_time = time.time()
+    pending = _PendingMessages(response_comms.SerializeToString())
+    self._queue.put(pending)
+    self._UpdateQueueDepth()
+
+    if not pending.done.wait(self.timeout):
+      if pending.Cancel():
+        raise PoolUnavailableError("Timed out waiting for a decoding process.")
+      # A worker is already decoding the messages. Waiting for it is cheaper
+      # than decoding them a second time.
+      pending.done.wait()
+
+    if pending.result is None:
+      raise PoolUnavailableError("Decoding process failed.")
+    error, result, decoding_time = pending.result
+
+    stats_collector = stats_collector_instance.Get()
+    stats_collector.RecordEvent(
+        "frontend_decoding_latency", decoding_time, fields=["decrypt"])
+    stats_collector.RecordEvent(
+        "frontend_decoding_latency",
+        time.time() - start_time,
+        fields=["total"])
+
+    if error is not None:
+      error_cls, message = error
+      raise error_cls(message)
+
+    (serialized_cipher, serialized_metadata, serialized_packed_message_list,
+     serialized_message_list) = result
+    cipher = communicator.ReceivedCipher.FromDecryptedCipher(
+        response_comms, self.private_key, serialized_cipher,
+        serialized_metadata)
+    packed_message_list = rdf_flows.PackedMessageList.FromSerializedString(
+        serialized_packed_message_list)
+    message_list = rdf_flows.MessageList.FromSerializedString(
+        serialized_message_list)
+    return cipher, packed_message_list, message_list
+
+  def Stop(self):
+    """Stops the dispatcher threads and the worker processes."""
+    if self._stopped:
+      return
+    self._stopped = True
+    for _ in self._dispatchers:
+      self._queue.put(None)
+    for dispatcher in self._dispatchers:
+      dispatcher.join()
+
+    # Messages queued after the dispatchers stopped are decoded by the callers.
+    while True:
+      try:
+        pending = self._queue.get_nowait()
+      except queue.Empty:
+        break
+      if pending is not None and pending.Cancel():
+        pending.SetResult(None)
+
@@ -8,10 +8,13 @@ easily be written to a relational database or just to a set of files.
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import collections
 import hashlib
 import json
+import importlib
 import logging
 import re
+import threading
 import time
 
 
@@ -19,7 +22,9 @@ from future.utils import iteritems
 from future.utils import iterkeys
 from future.utils import itervalues
 from future.utils import with_metaclass
+import queue
 
+from grr_response_core import config
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import registry
 from grr_response_core.lib import utils
@@ -36,6 +41,7 @@ from grr_response_server import data_store
 from grr_response_server import data_store_utils
 from grr_response_server import db
 from grr_response_server import file_store
+from grr_response_server import spawned_process
 from grr_response_server.aff4_objects import filestore
 from grr_response_server.flows.general import collectors as flow_collectors
 
@@ -229,6 +235,11 @@ class ExportConverter(with_metaclass(registry.MetaclassRegistry, object)):
   # Cache used for GetConvertersByValue() lookups.
   converters_cache = {}
 
+  # Converters that only look at the values passed to them (i.e. don't use the
+  # data store or the token) can be run by an ExportConversionPool in worker
+  # processes.
+  multiprocessing_safe = False
+
   def __init__(self, options=None):
     """Constructor.
 
@@ -328,6 +339,8 @@ class DataAgnosticExportConverter(ExportConverter):
   # Cache used for generated classes.
   classes_cache = {}
 
+  multiprocessing_safe = True
+
   def ExportedClassNameForValue(self, value):
     return utils.SmartStr("AutoExported" + value.__class__.__name__)
 
@@ -338,11 +351,9 @@ class DataAgnosticExportConverter(ExportConverter):
       if metadata:
         self.metadata = metadata
 
-      for desc in value_to_flatten.type_infos:
-        if desc.name == "metadata":
-          continue
-        if hasattr(self, desc.name) and value_to_flatten.HasField(desc.name):
-          setattr(self, desc.name, getattr(value_to_flatten, desc.name))
+      for name in self.flattened_field_names:
+        if value_to_flatten.HasField(name):
+          self.Set(name, value_to_flatten.Get(name))
 
     descriptors = []
     enums = {}
@@ -376,7 +387,9 @@ class DataAgnosticExportConverter(ExportConverter):
     # metaclass registry, we need to make sure there are no problems.
     output_class = type(
         self.ExportedClassNameForValue(value), (AutoExportedProtoStruct,),
-        dict(Flatten=Flatten))
+        dict(
+            Flatten=Flatten,
+            flattened_field_names=[desc.name for desc in descriptors[1:]]))
 
     for descriptor in descriptors:
       output_class.AddDescriptor(descriptor)
@@ -386,22 +399,34 @@ class DataAgnosticExportConverter(ExportConverter):
 
     return output_class
 
-  def Convert(self, metadata, value, token=None):
+  def GetFlatRDFClass(self, value):
+    """Returns the (cached) flattened RDFValue class for the given value."""
     class_name = self.ExportedClassNameForValue(value)
     try:
-      cls = DataAgnosticExportConverter.classes_cache[class_name]
+      return DataAgnosticExportConverter.classes_cache[class_name]
     except KeyError:
       cls = self.MakeFlatRDFClass(value)
       DataAgnosticExportConverter.classes_cache[class_name] = cls
+      return cls
 
-    result_obj = cls()
+  def Convert(self, metadata, value, token=None):
+    result_obj = self.GetFlatRDFClass(value)()
     result_obj.Flatten(metadata, value)
     yield result_obj
 
   def BatchConvert(self, metadata_value_pairs, token=None):
+    # Batches are normally homogeneous, so the flat class is only looked up
+    # when the type of values changes.
+    value_cls = None
+    flat_cls = None
     for metadata, value in metadata_value_pairs:
-      for result in self.Convert(metadata, value, token=token):
-        yield result
+      if value.__class__ is not value_cls:
+        value_cls = value.__class__
+        flat_cls = self.GetFlatRDFClass(value)
+
+      result_obj = flat_cls()
+      result_obj.Flatten(metadata, value)
+      yield result_obj
 
 
 class StatEntryToExportedFileConverter(ExportConverter):
@@ -686,6 +711,7 @@ class NetworkConnectionToExportedNetworkConnectionConverter(ExportConverter):
   """Converts NetworkConnection to ExportedNetworkConnection."""
 
   input_rdf_type = "NetworkConnection"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, conn, token=None):
     """Converts NetworkConnection to ExportedNetworkConnection."""
@@ -706,6 +732,7 @@ class ProcessToExportedProcessConverter(ExportConverter):
   """Converts Process to ExportedProcess."""
 
   input_rdf_type = "Process"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, process, token=None):
     """Converts Process to ExportedProcess."""
@@ -743,6 +770,7 @@ class ProcessToExportedNetworkConnectionConverter(ExportConverter):
   """Converts Process to ExportedNetworkConnection."""
 
   input_rdf_type = "Process"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, process, token=None):
     """Converts Process to ExportedNetworkConnection."""
@@ -757,6 +785,7 @@ class ProcessToExportedOpenFileConverter(ExportConverter):
   """Converts Process to ExportedOpenFile."""
 
   input_rdf_type = "Process"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, process, token=None):
     """Converts Process to ExportedOpenFile."""
@@ -767,6 +796,7 @@ class ProcessToExportedOpenFileConverter(ExportConverter):
 
 class InterfaceToExportedNetworkInterfaceConverter(ExportConverter):
   input_rdf_type = "Interface"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, interface, token=None):
     """Converts Interface to ExportedNetworkInterfaces."""
@@ -794,6 +824,7 @@ class InterfaceToExportedNetworkInterfaceConverter(ExportConverter):
 
 class DNSClientConfigurationToExportedDNSClientConfiguration(ExportConverter):
   input_rdf_type = "DNSClientConfiguration"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, config, token=None):
     """Converts DNSClientConfiguration to ExportedDNSClientConfiguration."""
@@ -818,6 +849,7 @@ class ClientSummaryToExportedNetworkInterfaceConverter(
 
 class ClientSummaryToExportedClientConverter(ExportConverter):
   input_rdf_type = "ClientSummary"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, unused_client_summary, token=None):
     return [ExportedClient(metadata=metadata)]
@@ -827,6 +859,7 @@ class BufferReferenceToExportedMatchConverter(ExportConverter):
   """Export converter for BufferReference instances."""
 
   input_rdf_type = "BufferReference"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, buffer_reference, token=None):
     yield ExportedMatch(
@@ -1022,6 +1055,7 @@ class VFSFileToExportedFileConverter(ExportConverter):
 class RDFBytesToExportedBytesConverter(ExportConverter):
 
   input_rdf_type = "RDFBytes"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, data, token=None):
     result = ExportedBytes(
@@ -1032,6 +1066,7 @@ class RDFBytesToExportedBytesConverter(ExportConverter):
 class RDFStringToExportedStringConverter(ExportConverter):
 
   input_rdf_type = "RDFString"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, data, token=None):
     return [ExportedString(metadata=metadata, data=data.SerializeToString())]
@@ -1041,6 +1076,7 @@ class DictToExportedDictItemsConverter(ExportConverter):
   """Export converter that converts Dict to ExportedDictItems."""
 
   input_rdf_type = "Dict"
+  multiprocessing_safe = True
 
   def _IterateDict(self, d, key=""):
     if isinstance(d, (list, tuple)):
@@ -1100,8 +1136,23 @@ class GrrMessageConverter(ExportConverter):
   input_rdf_type = "GrrMessage"
 
   def __init__(self, *args, **kw):
+    conversion_pool = kw.pop("conversion_pool", None)
     super(GrrMessageConverter, self).__init__(*args, **kw)
+    self.conversion_pool = conversion_pool
     self.cached_metadata = {}
+    self.cached_converters = {}
+
+  def _GetConverters(self, value_cls):
+    """Returns converter instances for the given payload type."""
+    try:
+      return self.cached_converters[value_cls]
+    except KeyError:
+      converters = [
+          cls(self.options)
+          for cls in ExportConverter.GetConvertersByClass(value_cls)
+      ]
+      self.cached_converters[value_cls] = converters
+      return converters
 
   def Convert(self, metadata, grr_message, token=None):
     """Converts GrrMessage into a set of RDFValues.
@@ -1129,77 +1180,47 @@ class GrrMessageConverter(ExportConverter):
       Resulting RDFValues. Empty list is a valid result and means that
       conversion wasn't possible.
     """
+    metadata_value_pairs = list(metadata_value_pairs)
 
-    # Group messages by source (i.e. by client urn).
-    msg_dict = {}
-    for metadata, msg in metadata_value_pairs:
-      msg_dict.setdefault(msg.source, []).append((metadata, msg))
-
-    metadata_objects = []
-    metadata_to_fetch = []
-
-    # Open the clients we don't have metadata for and fetch metadata.
-    for client_urn in msg_dict:
-      try:
-        metadata_objects.append(self.cached_metadata[client_urn])
-      except KeyError:
-        metadata_to_fetch.append(client_urn)
-
+    # Metadata of all the clients we haven't seen yet is fetched at once.
+    metadata_to_fetch = set(
+        msg.source
+        for _, msg in metadata_value_pairs
+        if msg.source not in self.cached_metadata)
     if metadata_to_fetch:
-      if data_store.RelationalDBReadEnabled():
-        client_ids = set(urn.Basename() for urn in metadata_to_fetch)
-        infos = data_store.REL_DB.MultiReadClientFullInfo(client_ids)
-
-        fetched_metadata = [
-            GetMetadata(client_id, info) for client_id, info in infos.items()
-        ]
-      else:
-        client_fds = aff4.FACTORY.MultiOpen(
-            metadata_to_fetch, mode="r", token=token)
-
-        fetched_metadata = [
-            GetMetadataLegacy(client_fd, token=token)
-            for client_fd in client_fds
-        ]
-
-      for metadata in fetched_metadata:
+      for metadata in FetchMetadataForClients(metadata_to_fetch, token=token):
         self.cached_metadata[metadata.client_urn] = metadata
-      metadata_objects.extend(fetched_metadata)
 
-    data_by_type = {}
-    for metadata in metadata_objects:
+    # Group the payloads by type, so that every converter gets a single
+    # homogeneous batch.
+    data_by_type = collections.OrderedDict()
+    for original_metadata, message in metadata_value_pairs:
       try:
-        for original_metadata, message in msg_dict[metadata.client_urn]:
-          # Get source_urn and annotations from the original metadata
-          # provided and original_timestamp from the payload age.
-          new_metadata = ExportedMetadata(metadata)
-          new_metadata.source_urn = original_metadata.source_urn
-          new_metadata.annotations = original_metadata.annotations
-          new_metadata.original_timestamp = message.payload.age
-          cls_name = message.payload.__class__.__name__
-
-          # Create a dict of values for conversion keyed by type, so we can
-          # apply the right converters to the right object types
-          if cls_name not in data_by_type:
-            converters_classes = ExportConverter.GetConvertersByValue(
-                message.payload)
-            data_by_type[cls_name] = {
-                "converters": [cls(self.options) for cls in converters_classes],
-                "batch_data": [(new_metadata, message.payload)]
-            }
-          else:
-            data_by_type[cls_name]["batch_data"].append((new_metadata,
-                                                         message.payload))
-
+        metadata = self.cached_metadata[message.source]
       except KeyError:
-        pass
+        continue
+
+      # Get source_urn and annotations from the original metadata
+      # provided and original_timestamp from the payload age.
+      new_metadata = ExportedMetadata(metadata)
+      new_metadata.source_urn = original_metadata.source_urn
+      new_metadata.annotations = original_metadata.annotations
+      new_metadata.original_timestamp = message.payload.age
+
+      payload = message.payload
+      data_by_type.setdefault(payload.__class__, []).append((new_metadata,
+                                                             payload))
 
     # Run all converters against all objects of the relevant type
     converted_batch = []
-    for dataset in itervalues(data_by_type):
-      for converter in dataset["converters"]:
+    for value_cls, batch_data in iteritems(data_by_type):
+      for converter in self._GetConverters(value_cls):
         converted_batch.extend(
-            converter.BatchConvert(dataset["batch_data"], token=token))
+            BatchConvert(
+                converter,
+                batch_data,
+                token=token,
+                conversion_pool=self.conversion_pool))
 
     return converted_batch
 
@@ -1239,6 +1260,7 @@ class FileStoreHashConverter(ExportConverter):
 
 class CheckResultConverter(ExportConverter):
   input_rdf_type = "CheckResult"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, checkresult, token=None):
     """Converts a single CheckResult.
@@ -1395,6 +1417,7 @@ class ArtifactFilesDownloaderResultConverter(ExportConverter):
 
 class YaraProcessScanResponseConverter(ExportConverter):
   input_rdf_type = "YaraProcessScanMatch"
+  multiprocessing_safe = True
 
   def Convert(self, metadata, yara_match, token=None):
     """Convert a single YaraProcessScanMatch."""
@@ -2031,6 +2054,31 @@ def GetMetadata(client_id, client_full_info):
   return metadata
 
 
+def FetchMetadataForClients(client_urns, token=None):
+  """Builds ExportedMetadata objects for the given clients.
+
+  Data of all the clients is read with a single bulk read.
+
+  Args:
+    client_urns: An iterable of client RDFURNs.
+    token: Security token.
+
+  Returns:
+    A list of ExportedMetadata objects. Clients that don't exist are skipped.
+  """
+  if data_store.RelationalDBReadEnabled():
+    client_ids = set(urn.Basename() for urn in client_urns)
+    infos = data_store.REL_DB.MultiReadClientFullInfo(client_ids)
+
+    return [GetMetadata(client_id, info) for client_id, info in iteritems(infos)]
+  else:
+    client_fds = aff4.FACTORY.MultiOpen(client_urns, mode="r", token=token)
+
+    return [
+        GetMetadataLegacy(client_fd, token=token) for client_fd in client_fds
+    ]
+
+
 def GetMetadataLegacy(client, token=None):
   """Builds ExportedMetadata object for a given client id.
 
@@ -2097,7 +2145,225 @@ def GetMetadataLegacy(client, token=None):
   return metadata
 
 
-def ConvertValuesWithMetadata(metadata_value_pairs, token=None, options=None):
+def _ConvertInWorker(args):
+  """Runs a converter in an ExportConversionPool worker process.
+
+  Args:
+    args: A tuple of the names of the modules defining the converter and the
+      value class, the converter class name, serialized ExportOptions, value
+      class name, a list of serialized ExportedMetadata and a list of
+      (metadata index, serialized value) tuples.
+
+  Returns:
+    A list of (class name, serialized value) tuples of converted values.
+  """
+  (modules, converter_name, serialized_options, value_cls_name,
+   serialized_metadata, serialized_items) = args
+
+  # The worker is a fresh interpreter, classes defined outside of this module
+  # are only registered once their module is imported.
+  for module in modules:
+    importlib.import_module(module)
+
+  options = ExportOptions.FromSerializedString(serialized_options)
+  converter = ExportConverter.classes[converter_name](options)
+  value_cls = rdfvalue.RDFValue.classes[value_cls_name]
+  metadata_objects = [
+      ExportedMetadata.FromSerializedString(m) for m in serialized_metadata
+  ]
+  metadata_value_pairs = [(metadata_objects[index],
+                           value_cls.FromSerializedString(value))
+                          for index, value in serialized_items]
+
+  return [(result.__class__.__name__, result.SerializeToString())
+          for result in converter.BatchConvert(metadata_value_pairs)]
+
+
+class ExportConversionPool(object):
+  """Runs multiprocessing-safe converters in a pool of worker processes.
+
+  Values are sent to the workers serialized, in chunks of chunk_size values,
+  and the converted values are returned in the original order. The workers
+  are spawned processes, so the pool can be created by a process that already
+  runs threads.
+  """
+
+  def __init__(self, num_processes, chunk_size=1000):
+    """Constructor.
+
+    Args:
+      num_processes: The number of worker processes to start.
+      chunk_size: The number of values sent to a worker at once.
+    """
+    self.chunk_size = chunk_size
+    self._idle_workers = queue.Queue()
+    for _ in range(num_processes):
+      self._idle_workers.put(spawned_process.SpawnedProcess())
+
+  def _SerializeChunk(self, converter, chunk):
+    """Serializes a homogeneous chunk of (metadata, value) pairs."""
+    serialized_metadata = []
+    metadata_indices = {}
+    serialized_items = []
+    for metadata, value in chunk:
+      # Values coming from the same client usually share metadata objects.
+      index = metadata_indices.get(id(metadata))
+      if index is None:
+        index = len(serialized_metadata)
+        metadata_indices[id(metadata)] = index
+        serialized_metadata.append(metadata.SerializeToString())
+      serialized_items.append((index, value.SerializeToString()))
+
+    _, first_value = chunk[0]
+    modules = (converter.__class__.__module__, first_value.__class__.__module__)
+    return (modules, converter.__class__.__name__,
+            converter.options.SerializeToString(),
+            first_value.__class__.__name__, serialized_metadata,
+            serialized_items)
+
+  def _CollectResults(self, worker):
+    """Returns the results of a worker's chunk and makes the worker idle."""
+    try:
+      return worker.Result()
+    except spawned_process.ProcessDiedError:
+      worker.Stop()
+      worker = spawned_process.SpawnedProcess()
+      raise
+    finally:
+      self._idle_workers.put(worker)
+
+  def BatchConvert(self, converter, metadata_value_pairs):
+    """Converts values with the given converter in the worker processes.
+
+    Args:
+      converter: An ExportConverter with multiprocessing_safe set.
+      metadata_value_pairs: A list of (ExportedMetadata, value) tuples. All the
+        values have to be of the same type.
+
+    Yields:
+      Converted values.
+
+    Raises:
+      ValueError: The converter is not multiprocessing safe.
+    """
+    if not converter.multiprocessing_safe:
+      raise ValueError("%s can't be run in a worker process." %
+                       converter.__class__.__name__)
+
+    metadata_value_pairs = list(metadata_value_pairs)
+    if not metadata_value_pairs:
+      return
+
+    # Classes generated in a worker process don't exist in this one, they have
+    # to be generated here before results can be deserialized.
+    if isinstance(converter, DataAgnosticExportConverter):
+      converter.GetFlatRDFClass(metadata_value_pairs[0][1])
+
+    # Workers busy with chunks of this call, oldest chunk first.
+    busy_workers = collections.deque()
+    try:
+      for chunk in collection.Batch(metadata_value_pairs, self.chunk_size):
+        worker = None
+        while worker is None:
+          try:
+            worker = self._idle_workers.get_nowait()
+          except queue.Empty:
+            # Only wait for other callers when we don't hold any workers
+            # ourselves, waiting for our oldest chunk frees a worker instead.
+            if not busy_workers:
+              worker = self._idle_workers.get()
+              break
+            results = self._CollectResults(busy_workers.popleft())
+            for value in self._DeserializeResults(results):
+              yield value
+
+        try:
+          worker.Submit(_ConvertInWorker,
+                        self._SerializeChunk(converter, chunk))
+        except spawned_process.ProcessDiedError:
+          worker.Stop()
+          self._idle_workers.put(spawned_process.SpawnedProcess())
+          raise
+        busy_workers.append(worker)
+
+      while busy_workers:
+        results = self._CollectResults(busy_workers.popleft())
+        for value in self._DeserializeResults(results):
+          yield value
+    finally:
+      # Results of an abandoned or failed call still have to be read before
+      # the workers can be used again.
+      while busy_workers:
+        try:
+          self._CollectResults(busy_workers.popleft())
+        except Exception:  # pylint: disable=broad-except
+          pass
+
+  def _DeserializeResults(self, results):
+    for cls_name, serialized in results:
+      yield rdfvalue.RDFValue.classes[cls_name].FromSerializedString(serialized)
+
+  def Stop(self):
+    """Stops the worker processes."""
+    while True:
+      try:
+        worker = self._idle_workers.get_nowait()
+      except queue.Empty:
+        break
+      worker.Stop()
+
+
+_conversion_pool = None
+_conversion_pool_lock = threading.Lock()
+
+
+def GetConversionPool():
+  """Returns the ExportConversionPool shared by this process.
+
+  The pool is started on first use with Export.conversion_processes worker
+  processes. It is safe to call this from any thread since the workers are
+  spawned, not forked.
+
+  Returns:
+    An ExportConversionPool or None if Export.conversion_processes is 0.
+  """
+  global _conversion_pool
+
+  num_processes = config.CONFIG["Export.conversion_processes"]
+  if not num_processes:
+    return None
+
+  with _conversion_pool_lock:
+    if _conversion_pool is None:
+      _conversion_pool = ExportConversionPool(num_processes)
+    return _conversion_pool
+
+
+def BatchConvert(converter, metadata_value_pairs, token=None,
+                 conversion_pool=None):
+  """Converts a batch of values, in worker processes if possible.
+
+  Args:
+    converter: An ExportConverter instance.
+    metadata_value_pairs: A list of (ExportedMetadata, value) tuples. All the
+      values have to be of the same type.
+    token: Security token.
+    conversion_pool: If set, an ExportConversionPool that will be used if the
+      converter is multiprocessing-safe.
+
+  Returns:
+    An iterable with the converted values.
+  """
+  if conversion_pool is not None and converter.multiprocessing_safe:
+    return conversion_pool.BatchConvert(converter, metadata_value_pairs)
+
+  return converter.BatchConvert(metadata_value_pairs, token=token)
+
+
+def ConvertValuesWithMetadata(metadata_value_pairs,
+                              token=None,
+                              options=None,
+                              conversion_pool=None):
   """Converts a set of RDFValues into a set of export-friendly RDFValues.
 
   Args:
@@ -2107,6 +2373,8 @@ def ConvertValuesWithMetadata(metadata_value_pairs, token=None, options=None):
     token: Security token.
     options: rdfvalue.ExportOptions instance that will be passed to
       ExportConverters.
+    conversion_pool: If set, an ExportConversionPool that will be used to run
+      multiprocessing-safe converters.
 
   Yields:
     Converted values. Converted values may be of different types.
@@ -2132,16 +2400,30 @@ def ConvertValuesWithMetadata(metadata_value_pairs, token=None, options=None):
           first_value)
       continue
 
-    converters = [cls(options) for cls in converters_classes]
+    converters = []
+    for cls in converters_classes:
+      if issubclass(cls, GrrMessageConverter):
+        converters.append(cls(options, conversion_pool=conversion_pool))
+      else:
+        converters.append(cls(options))
+
     for converter in converters:
-      for result in converter.BatchConvert(metadata_values_group, token=token):
+      for result in BatchConvert(
+          converter,
+          metadata_values_group,
+          token=token,
+          conversion_pool=conversion_pool):
         yield result
 
   if no_converter_found_error is not None:
     raise NoConverterFound(no_converter_found_error)
 
 
-def ConvertValues(default_metadata, values, token=None, options=None):
+def ConvertValues(default_metadata,
+                  values,
+                  token=None,
+                  options=None,
+                  conversion_pool=None):
   """Converts a set of RDFValues into a set of export-friendly RDFValues.
 
   Args:
@@ -2152,6 +2434,8 @@ def ConvertValues(default_metadata, values, token=None, options=None):
     token: Security token.
     options: rdfvalue.ExportOptions instance that will be passed to
       ExportConverters.
+    conversion_pool: If set, an ExportConversionPool that will be used to run
+      multiprocessing-safe converters.
 
   Returns:
     Converted values. Converted values may be of different types
@@ -2163,4 +2447,8 @@ def ConvertValues(default_metadata, values, token=None, options=None):
     NoConverterFound: in case no suitable converters were found for the values.
   """
   batch_data = [(default_metadata, obj) for obj in values]
-  return ConvertValuesWithMetadata(batch_data, token=token, options=options)
+  return ConvertValuesWithMetadata(
+      batch_data,
+      token=token,
+      options=options,
+      conversion_pool=conversion_pool)
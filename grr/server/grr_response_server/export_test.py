@@ -6,6 +6,9 @@ from __future__ import unicode_literals
 import json
 import os
 import socket
+import threading
+
+from builtins import range  # pylint: disable=redefined-builtin
 
 from grr_response_client.components.rekall_support import grr_rekall
 from grr_response_core.lib import flags
@@ -939,6 +942,42 @@ class ExportTest(ExportTestBase):
     self.assertItemsEqual(["DummyRDFValue2", "DummyRDFValue", "DummyRDFValue5"],
                           [x.__class__.__name__ for x in results])
 
+  def testGrrMessageConverterFetchesMetadataOncePerClient(self):
+    client_urn = rdf_client.ClientURN("C.0000000000000000")
+    fixture_test_lib.ClientFixture(client_urn, token=self.token)
+
+    def Batch(count):
+      result = []
+      for i in range(count):
+        msg = rdf_flows.GrrMessage(payload=DummyRDFValue4("some%d" % i))
+        msg.source = client_urn
+        result.append((self.metadata, msg))
+      return result
+
+    converter = export.GrrMessageConverter()
+    with test_lib.Instrument(export, "FetchMetadataForClients") as fetch:
+      first_results = converter.BatchConvert(Batch(5), token=self.token)
+      second_results = converter.BatchConvert(Batch(3), token=self.token)
+
+    self.assertEqual(fetch.call_count, 1)
+    self.assertEqual(len(first_results), 5)
+    self.assertEqual(len(second_results), 3)
+    self.assertEqual([r.client_urn for r in second_results], [client_urn] * 3)
+
+  def testGrrMessageConverterReusesConverterInstances(self):
+    client_urn = rdf_client.ClientURN("C.0000000000000000")
+    fixture_test_lib.ClientFixture(client_urn, token=self.token)
+    msg = rdf_flows.GrrMessage(payload=DummyRDFValue3("some"))
+    msg.source = client_urn
+
+    converter = export.GrrMessageConverter()
+    converter.BatchConvert([(self.metadata, msg)], token=self.token)
+    converters = converter.cached_converters[DummyRDFValue3]
+    converter.BatchConvert([(self.metadata, msg)], token=self.token)
+
+    self.assertEqual(len(converters), 2)
+    self.assertIs(converter.cached_converters[DummyRDFValue3], converters)
+
   def testDNSClientConfigurationToExportedDNSClientConfiguration(self):
     dns_servers = ["192.168.1.1", "8.8.8.8"]
     dns_suffixes = ["internal.company.com", "company.com"]
@@ -1352,6 +1391,106 @@ class DataAgnosticExportConverterTest(ExportTestBase):
 
     self.assertEqual(converted_value, deserialized)
 
+  def testBatchConvertReusesFlatClass(self):
+    values = [
+        export_test_lib.DataAgnosticConverterTestValue(int_value=i)
+        for i in range(3)
+    ]
+    converted_values = list(export.DataAgnosticExportConverter().BatchConvert(
+        [(export.ExportedMetadata(), v) for v in values]))
+
+    self.assertEqual([v.int_value for v in converted_values], [0, 1, 2])
+    self.assertEqual(len(set(v.__class__ for v in converted_values)), 1)
+
+
+class ExportConversionPoolTest(ExportTestBase):
+  """Tests for ExportConversionPool."""
+
+  def setUp(self):
+    super(ExportConversionPoolTest, self).setUp()
+    self.pool = export.ExportConversionPool(2, chunk_size=3)
+    self.addCleanup(self.pool.Stop)
+
+  def testConvertsValuesInOrder(self):
+    pairs = [(self.metadata, rdf_client.Process(pid=i, name="proc%d" % i))
+             for i in range(10)]
+
+    results = list(
+        self.pool.BatchConvert(export.ProcessToExportedProcessConverter(),
+                               pairs))
+
+    self.assertEqual([r.pid for r in results], list(range(10)))
+    self.assertEqual([r.name for r in results],
+                     ["proc%d" % i for i in range(10)])
+    for result in results:
+      self.assertIsInstance(result, export.ExportedProcess)
+      self.assertEqual(result.metadata.client_urn, self.client_id)
+
+  def testConvertsDataAgnosticValues(self):
+    pairs = [(self.metadata,
+              export_test_lib.DataAgnosticConverterTestValue(int_value=i))
+             for i in range(5)]
+
+    results = list(
+        self.pool.BatchConvert(export.DataAgnosticExportConverter(), pairs))
+
+    self.assertEqual([r.int_value for r in results], list(range(5)))
+
+  def testConvertValuesUsesPool(self):
+    msg = rdf_flows.GrrMessage(payload=rdf_client.Process(pid=42))
+    msg.source = self.client_id
+
+    with test_lib.Instrument(self.pool, "BatchConvert") as batch_convert:
+      results = list(
+          export.ConvertValues(
+              self.metadata, [msg],
+              token=self.token,
+              conversion_pool=self.pool))
+
+    # Processes, their network connections and their open files are exported
+    # by three different multiprocessing-safe converters.
+    self.assertEqual(batch_convert.call_count, 3)
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].pid, 42)
+
+  def testPoolIsUsableAfterAbandonedConversion(self):
+    pairs = [(self.metadata, rdf_client.Process(pid=i)) for i in range(10)]
+    converter = export.ProcessToExportedProcessConverter()
+
+    results = self.pool.BatchConvert(converter, pairs)
+    next(results)
+    results.close()
+
+    results = list(self.pool.BatchConvert(converter, pairs))
+    self.assertEqual([r.pid for r in results], list(range(10)))
+
+  def testConvertsValuesFromSeveralThreads(self):
+    converter = export.ProcessToExportedProcessConverter()
+    pids_by_thread = {}
+
+    def Convert(thread_index):
+      pairs = [(self.metadata, rdf_client.Process(pid=thread_index * 100 + i))
+               for i in range(10)]
+      pids_by_thread[thread_index] = [
+          r.pid for r in self.pool.BatchConvert(converter, pairs)
+      ]
+
+    threads = [threading.Thread(target=Convert, args=(i,)) for i in range(4)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    for thread_index in range(4):
+      self.assertEqual(pids_by_thread[thread_index],
+                       [thread_index * 100 + i for i in range(10)])
+
+  def testRaisesOnConvertersThatAreNotMultiprocessingSafe(self):
+    with self.assertRaises(ValueError):
+      list(
+          self.pool.BatchConvert(export.StatEntryToExportedFileConverter(),
+                                 [(self.metadata, rdf_client_fs.StatEntry())]))
+
 
 class DynamicRekallResponseConverterTest(ExportTestBase):
 
@@ -4,9 +4,11 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import abc
+import bisect
 import hashlib
 import io
 import os
+import threading
 
 from future.utils import iteritems
 from future.utils import with_metaclass
@@ -70,44 +72,124 @@ class CompositeExternalFileStore(ExternalFileStore):
 EXTERNAL_FILE_STORE = CompositeExternalFileStore()
 
 
-# TODO(user): this is a naive implementation as it reads one chunk
-# per REL_DB call. It has to be optimized.
 class BlobStream(object):
-  """File-like object for reading from blobs."""
+  """File-like object for reading from blobs.
+
+  Blobs are read from the blob store in batches of up to
+  Server.blob_stream_read_ahead blobs. While the caller consumes one batch, the
+  next one is fetched on a background thread. Recently read blobs are kept in a
+  small LRU cache.
+  """
 
   def __init__(self, blob_refs, hash_id):
     self._blob_refs = blob_refs
     self._hash_id = hash_id
 
     self._max_unbound_read = config.CONFIG["Server.max_unbound_read_size"]
+    self._read_ahead = max(1, config.CONFIG["Server.blob_stream_read_ahead"])
 
     self._offset = 0
     self._length = self._blob_refs[-1].offset + self._blob_refs[-1].size
 
-    self._current_ref = None
-    self._current_chunk = None
+    # Blob refs are sorted by offset, so the ref covering a given offset can be
+    # found with a binary search.
+    self._ref_offsets = [ref.offset for ref in self._blob_refs]
+
+    # The cache has to hold the batch that is being read and the one being
+    # fetched in the background.
+    self._chunks = utils.FastStore(
+        max_size=max(config.CONFIG["Server.blob_stream_cache_size"],
+                     2 * self._read_ahead))
+
+    # Index of the ref following the last batch that was fetched.
+    self._fetched_until = 0
+    self._prefetch_thread = None
+    self._prefetch_error = None
+
+  def _FindRefIndex(self):
+    """Returns the index of the ref covering the current offset or None."""
+    index = bisect.bisect_right(self._ref_offsets, self._offset) - 1
+    if index < 0:
+      return None
+
+    ref = self._blob_refs[index]
+    if self._offset >= ref.offset + ref.size:
+      return None
+
+    return index
+
+  def _ReadBlobs(self, start, end):
+    """Reads blobs of refs in range [start, end) into the chunk cache."""
+    refs = self._blob_refs[start:end]
+    blobs = data_store.BLOBS.ReadBlobs([ref.blob_id for ref in refs])
+    for index, ref in enumerate(refs, start):
+      self._chunks.Put(index, blobs[ref.blob_id])
+
+  def _Prefetch(self, start, end):
+    try:
+      self._ReadBlobs(start, end)
+    except Exception as e:  # pylint: disable=broad-except
+      # Reraised in the reading thread by _WaitForPrefetch.
+      self._prefetch_error = e
+
+  def _WaitForPrefetch(self):
+    """Waits for a running background fetch to finish."""
+    if self._prefetch_thread is None:
+      return
+
+    self._prefetch_thread.join()
+    self._prefetch_thread = None
+
+    if self._prefetch_error is not None:
+      error, self._prefetch_error = self._prefetch_error, None
+      raise error
+
+  def _MaybeStartPrefetch(self, index):
+    """Starts fetching the next batch if the current batch is being read."""
+    if self._prefetch_thread is not None and self._prefetch_thread.is_alive():
+      return
+
+    if self._fetched_until >= len(self._blob_refs):
+      return
+
+    # Only prefetch if the reads move towards the end of what was fetched, i.e.
+    # the file is read sequentially.
+    if index < self._fetched_until - self._read_ahead:
+      return
+
+    self._WaitForPrefetch()
+
+    start = self._fetched_until
+    end = min(start + self._read_ahead, len(self._blob_refs))
+    self._fetched_until = end
+    self._prefetch_thread = threading.Thread(
+        name="BlobStreamPrefetch", target=self._Prefetch, args=(start, end))
+    self._prefetch_thread.daemon = True
+    self._prefetch_thread.start()
 
   def _GetChunk(self):
     """Fetches a chunk corresponding to the current offset."""
 
-    found_ref = None
-    for ref in self._blob_refs:
-      if self._offset >= ref.offset and self._offset < (ref.offset + ref.size):
-        found_ref = ref
-        break
-
-    if not found_ref:
+    index = self._FindRefIndex()
+    if index is None:
       return None, None
 
-    # If self._current_ref == found_ref, then simply return previously found
-    # chunk. Otherwise, update self._current_chunk value.
-    if self._current_ref != found_ref:
-      self._current_ref = found_ref
+    try:
+      chunk = self._chunks.Get(index)
+    except KeyError:
+      # The chunk might be part of the batch that is currently being fetched.
+      self._WaitForPrefetch()
+      try:
+        chunk = self._chunks.Get(index)
+      except KeyError:
+        end = min(index + self._read_ahead, len(self._blob_refs))
+        self._ReadBlobs(index, end)
+        self._fetched_until = end
+        chunk = self._chunks.Get(index)
 
-      data = data_store.BLOBS.ReadBlobs([found_ref.blob_id])
-      self._current_chunk = data[found_ref.blob_id]
+    self._MaybeStartPrefetch(index)
 
-    return self._current_chunk, self._current_ref
+    return chunk, self._blob_refs[index]
 
   def Read(self, length=None):
     """Reads data."""
@@ -130,8 +212,9 @@ class BlobStream(object):
       if not part:
         break
 
+      part = part[:length - result.tell()]
       result.write(part)
-      self._offset += min(length, len(part))
+      self._offset += len(part)
 
     return result.getvalue()[:length]
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 from grr_response_core.lib import flags
 from grr_response_core.lib import rdfvalue
+from grr_response_core.lib import utils
 from grr_response_server import data_store
 from grr_response_server import db
 from grr_response_server import file_store
@@ -75,6 +76,49 @@ class BlobStreamTest(test_lib.GRRBaseTest):
       with self.assertRaises(file_store.OversizedRead):
         self.blob_stream.read()
 
+  def _ReadWithReadAhead(self, read_ahead, read_fn):
+    read_blobs_calls = []
+    read_blobs = data_store.BLOBS.ReadBlobs
+
+    def ReadBlobs(blob_ids):
+      read_blobs_calls.append(list(blob_ids))
+      return read_blobs(blob_ids)
+
+    with test_lib.ConfigOverrider({"Server.blob_stream_read_ahead": read_ahead}):
+      with utils.Stubber(data_store.BLOBS, "ReadBlobs", ReadBlobs):
+        blob_stream = file_store.BlobStream(self.blob_refs, None)
+        result = read_fn(blob_stream)
+        blob_stream._WaitForPrefetch()
+
+    return result, read_blobs_calls
+
+  def testReadsBlobsInBatches(self):
+    result, calls = self._ReadWithReadAhead(3, lambda fd: fd.read())
+    self.assertEqual(result, b"".join(self.blob_data))
+    self.assertEqual(calls, [
+        self.blob_ids[0:3], self.blob_ids[3:6], self.blob_ids[6:9],
+        self.blob_ids[9:10]
+    ])
+
+  def testReadsEveryBlobOnceWhenReadingInSmallParts(self):
+
+    def ReadInSmallParts(fd):
+      return b"".join(fd.read(3) for _ in range(self.blob_size * 10 // 3 + 1))
+
+    result, calls = self._ReadWithReadAhead(4, ReadInSmallParts)
+    self.assertEqual(result, b"".join(self.blob_data))
+    self.assertEqual(sum(calls, []), self.blob_ids)
+
+  def testReadsAfterSeekingIntoTheMiddle(self):
+
+    def SeekAndRead(fd):
+      fd.seek(self.blob_size * 7 + 5)
+      return fd.read(self.blob_size)
+
+    result, calls = self._ReadWithReadAhead(2, SeekAndRead)
+    self.assertEqual(result, b"3" * 5 + b"4" * 5)
+    self.assertEqual(calls[0], self.blob_ids[7:9])
+
 
 class AddFileWithUnknownHashTest(test_lib.GRRBaseTest):
   """Tests for AddFileWithUnknownHash."""
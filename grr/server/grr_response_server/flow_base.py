@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import logging
 import sys
+import time
 import traceback
 
 from future.utils import with_metaclass
@@ -506,12 +507,19 @@ class FlowBase(with_metaclass(registry.FlowRegistry, object)):
 
       stats_collector_instance.Get().IncrementCounter("grr_worker_states_run")
 
-      if method_name == "Start":
-        stats_collector_instance.Get().IncrementCounter(
-            "flow_starts", fields=[self.rdf_flow.flow_class_name])
-        method()
-      else:
-        method(responses)
+      start_time = time.time()
+      try:
+        if method_name == "Start":
+          stats_collector_instance.Get().IncrementCounter(
+              "flow_starts", fields=[self.rdf_flow.flow_class_name])
+          method()
+        else:
+          method(responses)
+      finally:
+        stats_collector_instance.Get().RecordEvent(
+            "flow_state_method_latency",
+            time.time() - start_time,
+            fields=[self.rdf_flow.flow_class_name, method_name])
 
       if self.replies_to_process:
         self._ProcessRepliesWithOutputPlugins(self.replies_to_process)
@@ -60,6 +60,7 @@ from __future__ import unicode_literals
 
 import logging
 import threading
+import time
 import traceback
 
 
@@ -560,12 +561,19 @@ class FlowRunner(object):
 
       stats_collector_instance.Get().IncrementCounter("grr_worker_states_run")
 
-      if method_name == "Start":
-        stats_collector_instance.Get().IncrementCounter(
-            "flow_starts", fields=[self.flow_obj.Name()])
-        method()
-      else:
-        method(responses)
+      start_time = time.time()
+      try:
+        if method_name == "Start":
+          stats_collector_instance.Get().IncrementCounter(
+              "flow_starts", fields=[self.flow_obj.Name()])
+          method()
+        else:
+          method(responses)
+      finally:
+        stats_collector_instance.Get().RecordEvent(
+            "flow_state_method_latency",
+            time.time() - start_time,
+            fields=[self.flow_obj.Name(), method_name])
 
       if self.sent_replies:
         self.ProcessRepliesWithOutputPlugins(self.sent_replies)
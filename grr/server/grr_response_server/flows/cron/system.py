@@ -24,6 +24,7 @@ from grr_response_server import data_store
 from grr_response_server import export_utils
 from grr_response_server import fleetspeak_connector
 from grr_response_server import fleetspeak_utils
+from grr_response_server import threadpool
 from grr_response_server.aff4_objects import aff4_grr
 from grr_response_server.aff4_objects import cronjobs as aff4_cronjobs
 from grr_response_server.aff4_objects import stats as aff4_stats
@@ -53,7 +54,7 @@ class _ActiveCounter(object):
     self.attribute = attribute
     self.categories = dict([(x, {}) for x in self.active_days])
 
-  def Add(self, category, label, age):
+  def Add(self, category, label, age, now=None):
     """Adds another instance of this category into the active_days counter.
 
     We automatically count the event towards all relevant active_days. For
@@ -65,8 +66,9 @@ class _ActiveCounter(object):
       category: The category name to account this instance against.
       label: Client label to which this should be applied.
       age: When this instance occurred.
+      now: The current time. If not set, rdfvalue.RDFDatetime.Now() is used.
     """
-    now = rdfvalue.RDFDatetime.Now()
+    now = now or rdfvalue.RDFDatetime.Now()
     category = utils.SmartUnicode(category)
 
     for active_time in self.active_days:
@@ -75,6 +77,14 @@ class _ActiveCounter(object):
         self.categories[active_time][label][
             category] = self.categories[active_time][label].get(category, 0) + 1
 
+  def Merge(self, other):
+    """Adds counts collected by another counter to this one."""
+    for active_time in self.active_days:
+      for label, counts in iteritems(other.categories[active_time]):
+        own_counts = self.categories[active_time].setdefault(label, {})
+        for category, count in iteritems(counts):
+          own_counts[category] = own_counts.get(category, 0) + count
+
   def Save(self, cron_flow):
     """Generate a histogram object and store in the specified attribute."""
     histograms = {}
@@ -128,8 +138,8 @@ def _GetLastContactFromFleetspeak(client_ids):
 CLIENT_READ_BATCH_SIZE = 50000
 
 
-def _IterateAllClients():
-  """Fetches client data from the relational db."""
+def _IterateAllClientBatches():
+  """Fetches client data from the relational db, one batch at a time."""
   all_client_ids = data_store.REL_DB.ReadAllClientIDs()
   for batch in collection.Batch(all_client_ids, CLIENT_READ_BATCH_SIZE):
     client_map = data_store.REL_DB.MultiReadClientFullInfo(batch)
@@ -140,7 +150,13 @@ def _IterateAllClients():
     last_contact_times = _GetLastContactFromFleetspeak(fs_client_ids)
     for cid, last_contact in iteritems(last_contact_times):
       client_map[cid].metadata.ping = last_contact
-    for client in itervalues(client_map):
+    yield list(itervalues(client_map))
+
+
+def _IterateAllClients():
+  """Fetches client data from the relational db."""
+  for batch in _IterateAllClientBatches():
+    for client in batch:
       yield client
 
 
@@ -166,77 +182,56 @@ def _IterateAllLegacyClients(token):
       yield last_contact, client
 
 
-class AbstractClientStatsCronJob(cronjobs.SystemCronJobBase):
-  """Base class for all stats processing cron jobs."""
-
-  CLIENT_STATS_URN = rdfvalue.RDFURN("aff4:/stats/ClientFleetStats")
-
-  def BeginProcessing(self):
-    pass
-
-  def ProcessClientFullInfo(self, client_full_info):
-    raise NotImplementedError()
-
-  def FinishProcessing(self):
-    pass
-
-  def _GetClientLabelsList(self, client):
-    """Get set of labels applied to this client."""
-    return set(["All"] + list(client.GetLabelsNames(owner="GRR")))
+def _GetClientLabelsList(client):
+  """Get set of labels applied to this client."""
+  return set(["All"] + list(client.GetLabelsNames(owner="GRR")))
 
-  def _StatsForLabel(self, label):
-    if label not in self.stats:
-      self.stats[label] = aff4.FACTORY.Create(
-          self.CLIENT_STATS_URN.Add(label),
-          aff4_stats.ClientFleetStats,
-          mode="w",
-          token=self.token)
-    return self.stats[label]
 
-  def Run(self):
-    """Retrieve all the clients for the AbstractClientStatsCollectors."""
-    try:
+class ClientStatsAggregator(object):
+  """Base class for fleet statistics computed over ClientFullInfo objects.
 
-      self.stats = {}
+  Aggregators only ever see a part of the fleet: every batch of clients gets
+  its own instance and the partial results are combined with Merge(), so
+  aggregators must not depend on the order in which clients are processed.
+  """
 
-      self.BeginProcessing()
+  def __init__(self, now):
+    """Constructor.
 
-      processed_count = 0
-      for client in _IterateAllClients():
-        self.ProcessClientFullInfo(client)
-        processed_count += 1
+    Args:
+      now: An RDFDatetime used as the current time by all batches of a run.
+    """
+    self.now = now
 
-        # This flow is not dead: we don't want to run out of lease time.
-        self.HeartBeat()
+  def ProcessClientFullInfo(self, client_full_info, labels):
+    """Accounts a single client.
 
-      self.FinishProcessing()
-      for fd in itervalues(self.stats):
-        fd.Close()
+    Args:
+      client_full_info: An rdf_objects.ClientFullInfo object.
+      labels: A set of labels the client's stats should be recorded under.
+    """
+    raise NotImplementedError()
 
-      logging.info("%s: processed %d clients.", self.__class__.__name__,
-                   processed_count)
-    except Exception as e:  # pylint: disable=broad-except
-      logging.exception("Error while calculating stats: %s", e)
-      raise
+  def Merge(self, other):
+    """Merges partial results of another instance of this aggregator."""
+    raise NotImplementedError()
 
+  def Save(self, cron_job):
+    """Writes the results using cron_job._StatsForLabel()."""
+    raise NotImplementedError()
 
-class GRRVersionBreakDownCronJob(AbstractClientStatsCronJob):
-  """Records relative ratios of GRR versions in 7 day actives."""
 
-  frequency = rdfvalue.Duration("4h")
-  lifetime = rdfvalue.Duration("4h")
+class GRRVersionAggregator(ClientStatsAggregator):
+  """Counts GRR versions in 1, 7, 14 and 30 day actives."""
 
-  def BeginProcessing(self):
+  def __init__(self, now):
+    super(GRRVersionAggregator, self).__init__(now)
     self.counter = _ActiveCounter(
         aff4_stats.ClientFleetStats.SchemaCls.GRRVERSION_HISTOGRAM)
 
-  def FinishProcessing(self):
-    self.counter.Save(self)
-
-  def ProcessClientFullInfo(self, client_full_info):
+  def ProcessClientFullInfo(self, client_full_info, labels):
     c_info = client_full_info.last_startup_info.client_info
     ping = client_full_info.metadata.ping
-    labels = self._GetClientLabelsList(client_full_info)
 
     if not (c_info and ping):
       return
@@ -247,28 +242,26 @@ class GRRVersionBreakDownCronJob(AbstractClientStatsCronJob):
     ])
 
     for label in labels:
-      self.counter.Add(category, label, ping)
+      self.counter.Add(category, label, ping, now=self.now)
 
+  def Merge(self, other):
+    self.counter.Merge(other.counter)
 
-class OSBreakDownCronJob(AbstractClientStatsCronJob):
-  """Records relative ratios of OS versions in 7 day actives."""
+  def Save(self, cron_job):
+    self.counter.Save(cron_job)
 
-  frequency = rdfvalue.Duration("1d")
-  lifetime = rdfvalue.Duration("20h")
 
-  def BeginProcessing(self):
+class OSBreakDownAggregator(ClientStatsAggregator):
+  """Counts OS types and releases in 1, 7, 14 and 30 day actives."""
+
+  def __init__(self, now):
+    super(OSBreakDownAggregator, self).__init__(now)
     self.counters = [
         _ActiveCounter(aff4_stats.ClientFleetStats.SchemaCls.OS_HISTOGRAM),
         _ActiveCounter(aff4_stats.ClientFleetStats.SchemaCls.RELEASE_HISTOGRAM),
     ]
 
-  def FinishProcessing(self):
-    # Write all the counter attributes.
-    for counter in self.counters:
-      counter.Save(self)
-
-  def ProcessClientFullInfo(self, client_full_info):
-    labels = self._GetClientLabelsList(client_full_info)
+  def ProcessClientFullInfo(self, client_full_info, labels):
     ping = client_full_info.metadata.ping
     system = client_full_info.last_snapshot.knowledge_base.os
     uname = client_full_info.last_snapshot.Uname()
@@ -278,60 +271,206 @@ class OSBreakDownCronJob(AbstractClientStatsCronJob):
 
     for label in labels:
       # Windows, Linux, Darwin
-      self.counters[0].Add(system, label, ping)
+      self.counters[0].Add(system, label, ping, now=self.now)
 
       # Windows-2008ServerR2-6.1.7601SP1, Linux-Ubuntu-12.04,
       # Darwin-OSX-10.9.3
-      self.counters[1].Add(uname, label, ping)
+      self.counters[1].Add(uname, label, ping, now=self.now)
 
+  def Merge(self, other):
+    for counter, other_counter in zip(self.counters, other.counters):
+      counter.Merge(other_counter)
 
-class LastAccessStatsCronJob(AbstractClientStatsCronJob):
-  """Calculates a histogram statistics of clients last contacted times."""
+  def Save(self, cron_job):
+    # Write all the counter attributes.
+    for counter in self.counters:
+      counter.Save(cron_job)
 
-  frequency = rdfvalue.Duration("1d")
-  lifetime = rdfvalue.Duration("20h")
+
+class LastAccessAggregator(ClientStatsAggregator):
+  """Computes a histogram of clients last contacted times."""
 
   # The number of clients fall into these bins (number of days ago)
   _bins = [1, 2, 3, 7, 14, 30, 60]
 
+  def __init__(self, now):
+    super(LastAccessAggregator, self).__init__(now)
+    self.bins = [long(x * 1e6 * 24 * 60 * 60) for x in self._bins]
+    self.values = {}
+
   def _ValuesForLabel(self, label):
     if label not in self.values:
-      self.values[label] = [0] * len(self._bins)
+      self.values[label] = [0] * len(self.bins)
     return self.values[label]
 
-  def BeginProcessing(self):
-    self._bins = [long(x * 1e6 * 24 * 60 * 60) for x in self._bins]
+  def ProcessClientFullInfo(self, client_full_info, labels):
+    ping = client_full_info.metadata.ping
 
-    self.values = {}
+    if not ping:
+      return
 
-  def FinishProcessing(self):
+    time_ago = self.now - ping
+    pos = bisect.bisect(self.bins, time_ago.microseconds)
+
+    for label in labels:
+      values = self._ValuesForLabel(label)
+      # If clients are older than the last bin forget them.
+      if pos < len(values):
+        values[pos] += 1
+
+  def Merge(self, other):
+    for label, other_values in iteritems(other.values):
+      values = self._ValuesForLabel(label)
+      for i, value in enumerate(other_values):
+        values[i] += value
+
+  def Save(self, cron_job):
     # Build and store the graph now. Day actives are cumulative.
     for label in self.values:
       cumulative_count = 0
       graph = aff4_stats.ClientFleetStats.SchemaCls.LAST_CONTACTED_HISTOGRAM()
-      for x, y in zip(self._bins, self.values[label]):
+      for x, y in zip(self.bins, self.values[label]):
         cumulative_count += y
         graph.Append(x_value=x, y_value=cumulative_count)
 
-      self._StatsForLabel(label).AddAttribute(graph)
+      # pylint: disable=protected-access
+      cron_job._StatsForLabel(label).AddAttribute(graph)
+      # pylint: enable=protected-access
 
-  def ProcessClientFullInfo(self, client_full_info):
-    labels = self._GetClientLabelsList(client_full_info)
-    ping = client_full_info.metadata.ping
 
-    if not ping:
+class AbstractClientStatsCronJob(cronjobs.SystemCronJobBase):
+  """Base class for all stats processing cron jobs.
+
+  The fleet is scanned once per run and every batch of clients is fed to all
+  the aggregators listed in `aggregators`. Batches are processed by a thread
+  pool, each one by its own set of aggregator instances; partial results are
+  merged and saved once all batches are done.
+  """
+
+  CLIENT_STATS_URN = rdfvalue.RDFURN("aff4:/stats/ClientFleetStats")
+
+  # A list of ClientStatsAggregator subclasses.
+  aggregators = []
+
+  PROCESSING_BATCH_SIZE = 5000
+  THREADPOOL_SIZE = 4
+
+  def _StatsForLabel(self, label):
+    if label not in self.stats:
+      self.stats[label] = aff4.FACTORY.Create(
+          self.CLIENT_STATS_URN.Add(label),
+          aff4_stats.ClientFleetStats,
+          mode="w",
+          token=self.token)
+    return self.stats[label]
+
+  def _ProcessBatch(self, batch, now, results):
+    """Runs a batch of clients through fresh instances of all aggregators."""
+    try:
+      partials = [cls(now) for cls in self.aggregators]
+      for client_full_info in batch:
+        labels = _GetClientLabelsList(client_full_info)
+        for aggregator in partials:
+          aggregator.ProcessClientFullInfo(client_full_info, labels)
+    except Exception as e:  # pylint: disable=broad-except
+      # Exceptions in thread pool tasks are only logged, so we pass them back
+      # to Run() instead.
+      results.append(e)
       return
 
-    now = rdfvalue.RDFDatetime.Now()
-    for label in labels:
-      time_ago = now - ping
-      pos = bisect.bisect(self._bins, time_ago.microseconds)
+    results.append(partials)
 
-      # If clients are older than the last bin forget them.
+  def Run(self):
+    """Retrieve all the clients for the AbstractClientStatsCollectors."""
+    try:
+
+      self.stats = {}
+
+      now = rdfvalue.RDFDatetime.Now()
+      results = []
+
+      pool = threadpool.ThreadPool.Factory(
+          "%s_pool" % self.__class__.__name__, self.THREADPOOL_SIZE)
+      pool.Start()
+      processed_count = 0
       try:
-        self._ValuesForLabel(label)[pos] += 1
-      except IndexError:
-        pass
+        for client_batch in _IterateAllClientBatches():
+          for batch in collection.Batch(client_batch,
+                                        self.PROCESSING_BATCH_SIZE):
+            # When all workers are busy the batch is processed inline, which
+            # keeps the number of clients in memory bounded.
+            pool.AddTask(
+                target=self._ProcessBatch,
+                args=(batch, now, results),
+                name="%s_batch" % self.__class__.__name__)
+            processed_count += len(batch)
+
+          # This flow is not dead: we don't want to run out of lease time.
+          self.HeartBeat()
+      finally:
+        pool.Stop(join_timeout=3600)
+
+      totals = [cls(now) for cls in self.aggregators]
+      for partials in results:
+        if isinstance(partials, Exception):
+          raise partials
+        for total, partial in zip(totals, partials):
+          total.Merge(partial)
+
+      for total in totals:
+        total.Save(self)
+      for fd in itervalues(self.stats):
+        fd.Close()
+
+      logging.info("%s: processed %d clients.", self.__class__.__name__,
+                   processed_count)
+    except Exception as e:  # pylint: disable=broad-except
+      logging.exception("Error while calculating stats: %s", e)
+      raise
+
+
+class GRRVersionBreakDownCronJob(AbstractClientStatsCronJob):
+  """Records relative ratios of GRR versions in 7 day actives."""
+
+  frequency = rdfvalue.Duration("4h")
+  lifetime = rdfvalue.Duration("4h")
+
+  aggregators = [GRRVersionAggregator]
+
+
+class OSBreakDownCronJob(AbstractClientStatsCronJob):
+  """Records relative ratios of OS versions in 7 day actives."""
+
+  frequency = rdfvalue.Duration("1d")
+  lifetime = rdfvalue.Duration("20h")
+
+  # Superseded by ClientFleetStatsCronJob, kept so that it can still be run
+  # on its own.
+  enabled = False
+
+  aggregators = [OSBreakDownAggregator]
+
+
+class LastAccessStatsCronJob(AbstractClientStatsCronJob):
+  """Calculates a histogram statistics of clients last contacted times."""
+
+  frequency = rdfvalue.Duration("1d")
+  lifetime = rdfvalue.Duration("20h")
+
+  # Superseded by ClientFleetStatsCronJob, kept so that it can still be run
+  # on its own.
+  enabled = False
+
+  aggregators = [LastAccessAggregator]
+
+
+class ClientFleetStatsCronJob(AbstractClientStatsCronJob):
+  """Computes the daily OS and last access fleet statistics in one scan."""
+
+  frequency = rdfvalue.Duration("1d")
+  lifetime = rdfvalue.Duration("20h")
+
+  aggregators = [OSBreakDownAggregator, LastAccessAggregator]
 
 
 class AbstractClientStatsCronFlow(aff4_cronjobs.SystemCronFlow):
@@ -295,6 +295,26 @@ class SystemCronJobTest(SystemCronTestMixin, test_lib.GRRBaseTest):
 
     self._CheckLastAccessStats()
 
+  def testClientFleetStats(self):
+    """Check that a single scan produces all the daily stats."""
+    run = rdf_cronjobs.CronJobRun()
+    job = rdf_cronjobs.CronJob()
+    system.ClientFleetStatsCronJob(run, job).Run()
+
+    self._CheckOSBreakdown()
+    self._CheckLastAccessStats()
+
+  def testClientFleetStatsMergesPartialResults(self):
+    """Check that results don't depend on how clients are batched."""
+    run = rdf_cronjobs.CronJobRun()
+    job = rdf_cronjobs.CronJob()
+    cron_job = system.ClientFleetStatsCronJob(run, job)
+    cron_job.PROCESSING_BATCH_SIZE = 3
+    cron_job.Run()
+
+    self._CheckOSBreakdown()
+    self._CheckLastAccessStats()
+
   def _RunPurgeClientStats(self):
     run = rdf_cronjobs.CronJobRun()
     job = rdf_cronjobs.CronJob()
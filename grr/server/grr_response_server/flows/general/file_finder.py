@@ -373,6 +373,18 @@ class ClientFileFinder(flow.GRRFlow):
       raise flow.FlowError(responses.status)
 
     self.state.files_found = len(responses)
+
+    action = self.args.action
+    if (action.action_type == rdf_file_finder.FileFinderAction.Action.DOWNLOAD
+        and action.download.dedup_chunks):
+      # The client only sent the digests of the file chunks. Files that still
+      # need chunk uploads are stored once all their chunks have arrived.
+      responses = self._FetchMissingChunks(responses)
+
+    self._StoreResponses(responses)
+
+  def _StoreResponses(self, responses):
+    """Writes the given FileFinderResults to the data store."""
     files_to_publish = []
     with data_store.DB.GetMutationPool() as pool:
       for response in responses:
@@ -392,6 +404,77 @@ class ClientFileFinder(flow.GRRFlow):
           "LegacyFileStore.AddFileToStore": files_to_publish
       })
 
+  def _FetchMissingChunks(self, responses):
+    """Asks the client for the file chunks that are not in the blob store.
+
+    Args:
+      responses: FileFinderResults whose transferred files only carry chunk
+        digests.
+
+    Returns:
+      A list of the FileFinderResults whose chunks are all present already.
+    """
+    blob_ids = set()
+    for response in responses:
+      for chunk in response.transferred_file.chunks:
+        blob_ids.add(rdf_objects.BlobID.FromBytes(chunk.digest))
+
+    existing_blobs = data_store.BLOBS.CheckBlobsExist(blob_ids)
+
+    complete = []
+    self.state.pending_files = {}
+    for index, response in enumerate(responses):
+      missing_chunks = [
+          chunk for chunk in response.transferred_file.chunks
+          if not existing_blobs[rdf_objects.BlobID.FromBytes(chunk.digest)]
+      ]
+      if not missing_chunks:
+        complete.append(response)
+        continue
+
+      self.state.pending_files[index] = dict(
+          response=response, missing_chunks=len(missing_chunks))
+      for chunk in missing_chunks:
+        self.CallClient(
+            server_stubs.TransferBuffer,
+            pathspec=response.stat_entry.pathspec,
+            offset=chunk.offset,
+            length=chunk.length,
+            next_state="StoreMissingChunk",
+            request_data=dict(index=index))
+
+    return complete
+
+  def StoreMissingChunk(self, responses):
+    """Stores a file once all of its missing chunks have been uploaded."""
+    index = responses.request_data["index"]
+    file_tracker = self.state.pending_files.get(index)
+    if file_tracker is None:
+      # An upload of another chunk of this file failed already.
+      return
+
+    response = file_tracker["response"]
+    if not responses.success:
+      self.Log("Failed to upload %s: %s", response.stat_entry.pathspec.path,
+               responses.status)
+      del self.state.pending_files[index]
+      self._StoreResponses(
+          [rdf_file_finder.FileFinderResult(stat_entry=response.stat_entry)])
+      return
+
+    # The file may have changed since the chunk was hashed, so the digest of
+    # the uploaded data is what the file refers to.
+    buffer_reference = responses.First()
+    for chunk in response.transferred_file.chunks:
+      if chunk.offset == buffer_reference.offset:
+        chunk.digest = buffer_reference.data
+        chunk.length = buffer_reference.length
+
+    file_tracker["missing_chunks"] -= 1
+    if file_tracker["missing_chunks"] == 0:
+      del self.state.pending_files[index]
+      self._StoreResponses([response])
+
   def _WriteFileContent(self, response, mutation_pool=None):
     urn = response.stat_entry.pathspec.AFF4Path(self.client_urn)
 
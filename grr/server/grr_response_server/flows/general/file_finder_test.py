@@ -901,6 +901,39 @@ class TestClientFileFinderFlow(flow_test_lib.FlowTestsBaseclass):
     ]
     self.assertItemsEqual(relpaths, [u"厨房/卫浴洁.txt"])
 
+  def testClientFileFinderDownloadWithChunkDeduplication(self):
+    data = b"".join(c * 10 for c in [b"a", b"b", b"c"])
+    file_path = os.path.join(self.temp_dir, "dedup.txt")
+    with io.open(file_path, "wb") as fd:
+      fd.write(data)
+
+    # The blob store already has the first chunk.
+    data_store.BLOBS.WriteBlobs(
+        {rdf_objects.BlobID.FromBlobData(data[:10]): data[:10]})
+
+    client_mock = action_mocks.ClientFileFinderClientMock()
+    action = rdf_file_finder.FileFinderAction.Download(
+        chunk_size=10, dedup_chunks=True)
+    session_id = flow_test_lib.TestFlowHelper(
+        file_finder.ClientFileFinder.__name__,
+        client_mock,
+        client_id=self.client_id,
+        paths=[file_path],
+        pathtype=rdf_paths.PathSpec.PathType.OS,
+        action=action,
+        token=self.token)
+
+    # Only the two chunks the server did not have are uploaded.
+    self.assertEqual(client_mock.action_counts["TransferBuffer"], 2)
+
+    results = list(flow.GRRFlow.ResultCollectionForFID(session_id))
+    self.assertEqual(len(results), 1)
+    self.assertEqual(len(results[0].transferred_file.chunks), 3)
+
+    urn = results[0].stat_entry.pathspec.AFF4Path(self.client_id)
+    fd = aff4.FACTORY.Open(urn, token=self.token)
+    self.assertEqual(fd.Read(100), data)
+
   def testPathInterpolation(self):
     self.client_id = self.SetupClient(0)
 
@@ -3,12 +3,18 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import collections
 import logging
+import threading
+import time
 
+from grr_response_core import config
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import registry
+from grr_response_core.lib import utils
 from grr_response_server import aff4
 from grr_response_server import data_store
+from grr_response_server import foreman_rules
 from grr_response_server import message_handlers
 
 
@@ -19,6 +25,139 @@ def GetForeman(token=None):
     return aff4.FACTORY.Open("aff4:/foreman", mode="rw", token=token)
 
 
+class ForemanRuleIndex(object):
+  """Selects the foreman rules that can match a given client.
+
+  A rule set that has to match all of its rules can only match clients which
+  run one of the operating systems of its OS rule or which carry one of the
+  labels its label rule requires. The index files such rule sets under these
+  OS names or labels, so a client is only checked against the rules filed
+  under its own OS and labels and the rules that can not be indexed. The
+  candidates are then evaluated as usual, the index never changes the outcome
+  of ForemanCondition.Evaluate.
+  """
+
+  OS_NAMES = ["Windows", "Linux", "Darwin"]
+
+  def __init__(self, rules):
+    self.rules = rules
+    self._by_os = collections.defaultdict(list)
+    self._by_label = collections.defaultdict(list)
+    self._unindexed = []
+
+    for rule in rules:
+      self._AddRule(rule)
+
+  def _AddRule(self, rule):
+    """Files a rule under the OS names or labels it requires."""
+    rule_set = rule.client_rule_set
+    if rule_set.match_mode != rule_set.MatchMode.MATCH_ALL:
+      self._unindexed.append(rule)
+      return
+
+    client_rule_type = foreman_rules.ForemanClientRule.Type
+    for client_rule in rule_set.rules:
+      if client_rule.rule_type == client_rule_type.OS:
+        os_rule = client_rule.os
+        enabled = [os_rule.os_windows, os_rule.os_linux, os_rule.os_darwin]
+        # A rule without any OS never matches and is not filed at all.
+        for os_name, os_enabled in zip(self.OS_NAMES, enabled):
+          if os_enabled:
+            self._by_os[os_name].append(rule)
+        return
+
+    label_match_mode = foreman_rules.ForemanLabelClientRule.MatchMode
+    for client_rule in rule_set.rules:
+      if client_rule.rule_type != client_rule_type.LABEL:
+        continue
+
+      label_rule = client_rule.label
+      if label_rule.match_mode == label_match_mode.MATCH_ANY:
+        # A rule without labels never matches and is not filed at all.
+        for label_name in label_rule.label_names:
+          self._by_label[label_name].append(rule)
+        return
+
+      if (label_rule.match_mode == label_match_mode.MATCH_ALL and
+          label_rule.label_names):
+        # Every required label will do, the client needs to have all of them.
+        self._by_label[label_rule.label_names[0]].append(rule)
+        return
+
+    self._unindexed.append(rule)
+
+  def GetCandidateRules(self, client_info):
+    """Returns the rules that may match a client.
+
+    Args:
+      client_info: A `db.ClientFullInfo` instance.
+
+    Returns:
+      A list of foreman_rules.ForemanCondition objects, a subset of the indexed
+      rules in their original order.
+    """
+    candidates = set(id(rule) for rule in self._unindexed)
+
+    client_os = ""
+    if client_info.last_snapshot:
+      client_os = utils.SmartStr(
+          client_info.last_snapshot.knowledge_base.os or "")
+    for os_name in self.OS_NAMES:
+      if client_os.startswith(os_name):
+        candidates.update(id(rule) for rule in self._by_os.get(os_name, []))
+
+    for label in client_info.labels:
+      candidates.update(id(rule) for rule in self._by_label.get(label.name, []))
+
+    return [rule for rule in self.rules if id(rule) in candidates]
+
+
+class ForemanRuleCache(object):
+  """Caches the foreman rules read from the relational database.
+
+  The cache is versioned: the database wrapper counts the modifications of the
+  foreman rules, so rules written or removed by this process are picked up
+  immediately. Modifications made by other processes are picked up once the
+  cached rules are older than Server.foreman_rule_cache_ttl.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._index = None
+    self._db = None
+    self._version = None
+    self._read_time = 0
+
+  def Flush(self):
+    with self._lock:
+      self._index = None
+
+  def GetIndex(self):
+    """Returns a ForemanRuleIndex of the current foreman rules."""
+    db = data_store.REL_DB
+    version = getattr(db, "foreman_rules_version", None)
+    ttl = config.CONFIG["Server.foreman_rule_cache_ttl"].seconds
+
+    with self._lock:
+      if (self._index is not None and self._db is db and
+          self._version == version and time.time() - self._read_time < ttl):
+        return self._index
+
+    read_time = time.time()
+    index = ForemanRuleIndex(db.ReadAllForemanRules())
+
+    with self._lock:
+      self._index = index
+      self._db = db
+      self._version = version
+      self._read_time = read_time
+
+    return index
+
+
+RULE_CACHE = ForemanRuleCache()
+
+
 # TODO(amoser): Now that Foreman rules are directly stored in the db,
 # consider removing this class altogether once the AFF4 Foreman has
 # been removed.
@@ -84,7 +223,8 @@ class Foreman(object):
     Returns:
       Number of assigned tasks.
     """
-    rules = data_store.REL_DB.ReadAllForemanRules()
+    rule_index = RULE_CACHE.GetIndex()
+    rules = rule_index.rules
     if not rules:
       return 0
 
@@ -98,7 +238,7 @@ class Foreman(object):
     # Update the latest checked rule on the client.
     self._SetLastForemanRunTime(client_id, latest_rule_creation_time)
 
-    relevant_rules = []
+    relevant_rules = False
     expired_rules = False
 
     now = rdfvalue.RDFDatetime.Now()
@@ -106,11 +246,8 @@ class Foreman(object):
     for rule in rules:
       if rule.expiration_time < now:
         expired_rules = True
-        continue
-      if rule.creation_time <= last_foreman_run:
-        continue
-
-      relevant_rules.append(rule)
+      elif rule.creation_time > last_foreman_run:
+        relevant_rules = True
 
     actions_count = 0
     if relevant_rules:
@@ -118,7 +255,12 @@ class Foreman(object):
       if client_data is None:
         return
 
-      for rule in relevant_rules:
+      for rule in rule_index.GetCandidateRules(client_data):
+        if rule.expiration_time < now:
+          continue
+        if rule.creation_time <= last_foreman_run:
+          continue
+
         if rule.Evaluate(client_data):
           actions_count += self._RunAction(rule, client_id)
 
@@ -134,10 +276,6 @@ class ForemanMessageHandler(message_handlers.MessageHandler):
   handler_name = "ForemanHandler"
 
   def ProcessMessages(self, msgs):
-    # TODO(amoser): The foreman reads the rules from the database for each
-    # client. In the old implementation we used to have a cache. If this is a
-    # performance hit, lets consider putting the cache back.
-
     foreman_obj = Foreman()
     for msg in msgs:
       foreman_obj.AssignTasksToClient(msg.client_id)
@@ -436,6 +436,86 @@ class RelationalForemanTests(db_test_lib.RelationalDBEnabledMixin,
       self.assertEqual(self.clients_started[3][1], u"C.1000000000000014")
       self.assertEqual("H:333333", self.clients_started[3][0].Basename())
 
+  def _MakeRule(self, hunt_id, client_rules):
+    now = rdfvalue.RDFDatetime.Now()
+    return foreman_rules.ForemanCondition(
+        creation_time=now,
+        expiration_time=now + rdfvalue.Duration("1h"),
+        description="Test rule",
+        hunt_name=standard.GenericHunt.__name__,
+        hunt_id=hunt_id,
+        client_rule_set=foreman_rules.ForemanClientRuleSet(rules=client_rules))
+
+  def testLabelSelection(self):
+    self.SetupTestClientObject(1, labels=[u"foo"])
+    self.SetupTestClientObject(2, labels=[u"bar"])
+    self.SetupTestClientObject(3, labels=[u"foo", u"bar"])
+
+    with utils.Stubber(implementation.GRRHunt, "StartClients",
+                       self.StartClients):
+      label_rule_cls = foreman_rules.ForemanLabelClientRule
+      data_store.REL_DB.WriteForemanRule(
+          self._MakeRule("H:111111", [
+              foreman_rules.ForemanClientRule(
+                  rule_type=foreman_rules.ForemanClientRule.Type.LABEL,
+                  label=label_rule_cls(
+                      label_names=[u"foo", u"bar"],
+                      match_mode=label_rule_cls.MatchMode.MATCH_ALL))
+          ]))
+      data_store.REL_DB.WriteForemanRule(
+          self._MakeRule("H:222222", [
+              foreman_rules.ForemanClientRule(
+                  rule_type=foreman_rules.ForemanClientRule.Type.LABEL,
+                  label=label_rule_cls(
+                      label_names=[u"foo"],
+                      match_mode=label_rule_cls.MatchMode.DOES_NOT_MATCH_ANY))
+          ]))
+
+      self.clients_started = []
+      foreman_obj = foreman.GetForeman()
+      foreman_obj.AssignTasksToClient(u"C.1000000000000001")
+      foreman_obj.AssignTasksToClient(u"C.1000000000000002")
+      foreman_obj.AssignTasksToClient(u"C.1000000000000003")
+
+      self.assertItemsEqual(
+          [(hunt_id.Basename(), client_id)
+           for hunt_id, client_id in self.clients_started],
+          [("H:222222", u"C.1000000000000002"),
+           ("H:111111", u"C.1000000000000003")])
+
+  def testRuleIndexSelectsCandidateRules(self):
+    client_rule_cls = foreman_rules.ForemanClientRule
+    windows_rule = self._MakeRule("H:111111", [
+        client_rule_cls(
+            rule_type=client_rule_cls.Type.OS,
+            os=foreman_rules.ForemanOsClientRule(os_windows=True))
+    ])
+    linux_rule = self._MakeRule("H:222222", [
+        client_rule_cls(
+            rule_type=client_rule_cls.Type.OS,
+            os=foreman_rules.ForemanOsClientRule(os_linux=True))
+    ])
+    regex_rule = self._MakeRule("H:333333", [
+        client_rule_cls(
+            rule_type=client_rule_cls.Type.REGEX,
+            regex=foreman_rules.ForemanRegexClientRule(
+                field="SYSTEM", attribute_regex="Linux"))
+    ])
+    index = foreman.ForemanRuleIndex([windows_rule, linux_rule, regex_rule])
+
+    self.SetupTestClientObject(1, system="Linux")
+    client_info = data_store.REL_DB.ReadClientFullInfo(u"C.1000000000000001")
+    self.assertEqual(
+        index.GetCandidateRules(client_info), [linux_rule, regex_rule])
+
+  def testRuleCacheIsInvalidatedWhenRulesChange(self):
+    rule = self._MakeRule("H:111111", [])
+    data_store.REL_DB.WriteForemanRule(rule)
+    self.assertEqual(len(foreman.RULE_CACHE.GetIndex().rules), 1)
+
+    data_store.REL_DB.RemoveForemanRule(hunt_id="H:111111")
+    self.assertEqual(foreman.RULE_CACHE.GetIndex().rules, [])
+
   def testRuleExpiration(self):
     with test_lib.FakeTime(1000):
       foreman_obj = foreman.GetForeman()
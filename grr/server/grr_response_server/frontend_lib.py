@@ -28,19 +28,41 @@ from grr_response_server import client_index
 from grr_response_server import data_migration
 from grr_response_server import data_store
 from grr_response_server import db
+from grr_response_server import decoding_pool
 from grr_response_server import events
 from grr_response_server import flow
 from grr_response_server import queue_manager
 from grr_response_server import rekall_profile_server
+from grr_response_server import shared_client_cache
 from grr_response_server.aff4_objects import aff4_grr
 from grr_response_server.rdfvalues import flow_objects as rdf_flow_objects
 from grr_response_server.rdfvalues import objects as rdf_objects
 
 
+def _GetSharedPublicKey(shared_cache, client_id):
+  """Returns a client's public key from the shared cache or None."""
+  if shared_cache is None:
+    return None
+
+  try:
+    pub_key = shared_cache.GetPublicKey(client_id)
+  except KeyError:
+    return None
+
+  stats_collector_instance.Get().IncrementCounter(
+      "grr_pub_key_cache", fields=["shared_hits"])
+  return pub_key
+
+
 class ServerCommunicator(communicator.Communicator):
   """A communicator which stores certificates using AFF4."""
 
-  def __init__(self, certificate, private_key, token=None):
+  def __init__(self,
+               certificate,
+               private_key,
+               token=None,
+               decoding_pool=None,
+               shared_cache=None):
     self.client_cache = utils.FastStore(1000)
     self.token = token
     super(ServerCommunicator, self).__init__(
@@ -48,6 +70,17 @@ class ServerCommunicator(communicator.Communicator):
     self.pub_key_cache = utils.FastStore(max_size=50000)
     # Our common name as an RDFURN.
     self.common_name = rdfvalue.RDFURN(self.certificate.GetCN())
+    self.decoding_pool = decoding_pool
+    self.shared_cache = shared_cache
+
+  def DecodeUncachedMessages(self, response_comms):
+    if self.decoding_pool is not None:
+      try:
+        return self.decoding_pool.Decode(response_comms)
+      except decoding_pool.PoolUnavailableError as e:
+        logging.warning("Decoding messages in process: %s", e)
+    return super(ServerCommunicator,
+                 self).DecodeUncachedMessages(response_comms)
 
   def _GetRemotePublicKey(self, common_name):
     try:
@@ -60,6 +93,11 @@ class ServerCommunicator(communicator.Communicator):
       stats_collector_instance.Get().IncrementCounter(
           "grr_pub_key_cache", fields=["misses"])
 
+    pub_key = _GetSharedPublicKey(self.shared_cache, common_name.Basename())
+    if pub_key is not None:
+      self.pub_key_cache.Put(str(common_name), pub_key)
+      return pub_key
+
     # Fetch the client's cert and extract the key.
     client = aff4.FACTORY.Create(
         common_name,
@@ -81,6 +119,8 @@ class ServerCommunicator(communicator.Communicator):
 
     pub_key = cert.GetPublicKey()
     self.pub_key_cache.Put(common_name, pub_key)
+    if self.shared_cache is not None:
+      self.shared_cache.PutPublicKey(common_name.Basename(), pub_key)
     return pub_key
 
   def VerifyMessageSignature(self, response_comms, packed_message_list, cipher,
@@ -167,6 +207,9 @@ class ServerCommunicator(communicator.Communicator):
                         remote_time, client_time)
 
       client.Flush()
+      if ping and self.shared_cache is not None:
+        self.shared_cache.PutPingMetadata(client_id.Basename(), clock, ping)
+
       if data_store.RelationalDBWriteEnabled():
         source_ip = response_comms.orig_request.source_ip
         if source_ip:
@@ -195,11 +238,26 @@ class ServerCommunicator(communicator.Communicator):
 class RelationalServerCommunicator(communicator.Communicator):
   """A communicator which stores certificates using the relational db."""
 
-  def __init__(self, certificate, private_key):
+  def __init__(self,
+               certificate,
+               private_key,
+               decoding_pool=None,
+               shared_cache=None):
     super(RelationalServerCommunicator, self).__init__(
         certificate=certificate, private_key=private_key)
     self.pub_key_cache = utils.FastStore(max_size=50000)
     self.common_name = self.certificate.GetCN()
+    self.decoding_pool = decoding_pool
+    self.shared_cache = shared_cache
+
+  def DecodeUncachedMessages(self, response_comms):
+    if self.decoding_pool is not None:
+      try:
+        return self.decoding_pool.Decode(response_comms)
+      except decoding_pool.PoolUnavailableError as e:
+        logging.warning("Decoding messages in process: %s", e)
+    return super(RelationalServerCommunicator,
+                 self).DecodeUncachedMessages(response_comms)
 
   def _GetRemotePublicKey(self, common_name):
     remote_client_id = common_name.Basename()
@@ -213,6 +271,11 @@ class RelationalServerCommunicator(communicator.Communicator):
       stats_collector_instance.Get().IncrementCounter(
           "grr_pub_key_cache", fields=["misses"])
 
+    pub_key = _GetSharedPublicKey(self.shared_cache, remote_client_id)
+    if pub_key is not None:
+      self.pub_key_cache.Put(remote_client_id, pub_key)
+      return pub_key
+
     try:
       md = data_store.REL_DB.ReadClientMetadata(remote_client_id)
     except db.UnknownClientError:
@@ -225,7 +288,9 @@ class RelationalServerCommunicator(communicator.Communicator):
       raise communicator.UnknownClientCert("Stored cert mismatch")
 
     pub_key = cert.GetPublicKey()
-    self.pub_key_cache.Put(common_name, pub_key)
+    self.pub_key_cache.Put(remote_client_id, pub_key)
+    if self.shared_cache is not None:
+      self.shared_cache.PutPublicKey(remote_client_id, pub_key)
     return pub_key
 
   def VerifyMessageSignature(self, response_comms, packed_message_list, cipher,
@@ -255,7 +320,7 @@ class RelationalServerCommunicator(communicator.Communicator):
 
     try:
       client_id = cipher.cipher_metadata.source.Basename()
-      metadata = data_store.REL_DB.ReadClientMetadata(client_id)
+      stored_client_time = self._GetStoredClientTime(client_id)
       client_time = packed_message_list.timestamp or rdfvalue.RDFDatetime(0)
 
       # This used to be a strict check here so absolutely no out of
@@ -267,9 +332,7 @@ class RelationalServerCommunicator(communicator.Communicator):
       # precaution. Given the behavior of those proxies, this seems
       # now excessive and we have changed the replay protection to
       # only trigger on messages that are more than one hour old.
-      if metadata and metadata.clock:
-        stored_client_time = metadata.clock
-
+      if stored_client_time:
         if client_time < stored_client_time - rdfvalue.Duration("1h"):
           logging.warning("Message desynchronized for %s: %s >= %s", client_id,
                           stored_client_time, client_time)
@@ -300,18 +363,35 @@ class RelationalServerCommunicator(communicator.Communicator):
       else:
         last_ip = None
 
+      ping = rdfvalue.RDFDatetime.Now()
       data_store.REL_DB.WriteClientMetadata(
           client_id,
           last_ip=last_ip,
           last_clock=client_time,
-          last_ping=rdfvalue.RDFDatetime.Now(),
+          last_ping=ping,
           fleetspeak_enabled=False)
+      if self.shared_cache is not None:
+        self.shared_cache.PutPingMetadata(client_id, client_time, ping)
 
     except communicator.UnknownClientCert:
       pass
 
     return rdf_flows.GrrMessage.AuthorizationState.AUTHENTICATED
 
+  def _GetStoredClientTime(self, client_id):
+    """Returns the last client clock we stored for the client, if any."""
+    if self.shared_cache is not None:
+      try:
+        last_clock, _ = self.shared_cache.GetPingMetadata(client_id)
+        return last_clock
+      except KeyError:
+        pass
+
+    metadata = data_store.REL_DB.ReadClientMetadata(client_id)
+    if metadata:
+      return metadata.clock
+    return None
+
 
 class FrontEndServer(object):
   """This is the front end server.
@@ -332,18 +412,48 @@ class FrontEndServer(object):
                private_key,
                max_queue_size=50,
                message_expiry_time=120,
-               max_retransmission_time=10):
+               max_retransmission_time=10,
+               decoding_processes=0):
     # Identify ourselves as the server.
     self.token = access_control.ACLToken(
         username="GRRFrontEnd", reason="Implied.")
     self.token.supervisor = True
 
+    # Messages with uncached ciphers are decoded in worker processes so the
+    # RSA and AES work of concurrent requests can run on all cores.
+    self.decoding_pool = None
+    if decoding_processes:
+      self.decoding_pool = decoding_pool.CommsDecodingPool(
+          private_key,
+          decoding_processes,
+          max_batch_size=config.CONFIG["Frontend.decoding_batch_size"],
+          timeout=config.CONFIG["Frontend.decoding_timeout"])
+
+    # Public keys and ping times are shared with the other frontend processes
+    # on this host and survive restarts.
+    self.shared_cache = None
+    if config.CONFIG["Frontend.shared_cache_path"]:
+      self.shared_cache = shared_client_cache.SharedClientCache(
+          config.CONFIG["Frontend.shared_cache_path"],
+          snapshot_path=config.CONFIG["Frontend.shared_cache_snapshot_path"],
+          snapshot_interval=config
+          .CONFIG["Frontend.shared_cache_snapshot_interval"],
+          flush_interval=config.CONFIG["Frontend.shared_cache_flush_interval"],
+          max_ping_age=config.CONFIG["Frontend.shared_cache_max_ping_age"])
+
     if data_store.RelationalDBReadEnabled():
       self._communicator = RelationalServerCommunicator(
-          certificate=certificate, private_key=private_key)
+          certificate=certificate,
+          private_key=private_key,
+          decoding_pool=self.decoding_pool,
+          shared_cache=self.shared_cache)
     else:
       self._communicator = ServerCommunicator(
-          certificate=certificate, private_key=private_key, token=self.token)
+          certificate=certificate,
+          private_key=private_key,
+          token=self.token,
+          decoding_pool=self.decoding_pool,
+          shared_cache=self.shared_cache)
 
     self.message_expiry_time = message_expiry_time
     self.max_retransmission_time = max_retransmission_time
@@ -369,6 +479,13 @@ class FrontEndServer(object):
         for flow_name in whitelist & available_wkf_set
     }
 
+  def Stop(self):
+    """Stops the decoding worker processes and flushes the shared cache."""
+    if self.decoding_pool is not None:
+      self.decoding_pool.Stop()
+    if self.shared_cache is not None:
+      self.shared_cache.Stop()
+
   @stats_utils.Counted("grr_frontendserver_handle_num")
   @stats_utils.Timed("grr_frontendserver_handle_time")
   def HandleMessageBundles(self, request_comms, response_comms):
@@ -5,6 +5,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 import array
+import functools
 import logging
 import pdb
 import time
@@ -32,6 +33,7 @@ from grr_response_core.lib.rdfvalues import protodict as rdf_protodict
 from grr_response_core.stats import stats_collector_instance
 from grr_response_server import aff4
 from grr_response_server import data_store
+from grr_response_server import decoding_pool
 from grr_response_server import fleetspeak_connector
 from grr_response_server import flow
 from grr_response_server import frontend_lib
@@ -828,6 +830,67 @@ class ClientCommsTest(test_lib.GRRBaseTest):
     self.assertEqual(len(list(self.ClientServerCommunicate())), 10)
 
 
+class PooledDecodingClientCommsTest(ClientCommsTest):
+  """Runs the communicator tests with messages decoded in worker processes."""
+
+  def _SetupCommunicator(self):
+    pool = decoding_pool.CommsDecodingPool(
+        self.server_private_key, num_processes=2)
+    self.addCleanup(pool.Stop)
+
+    self.server_communicator = frontend_lib.ServerCommunicator(
+        certificate=self.server_certificate,
+        private_key=self.server_private_key,
+        token=self.token,
+        decoding_pool=pool)
+
+  def testFallsBackToInProcessDecodingWhenPoolIsStopped(self):
+    self.server_communicator.decoding_pool.Stop()
+    self.ClientServerCommunicate()
+
+  def testFallsBackToInProcessDecodingOnTimeout(self):
+    pool = self.server_communicator.decoding_pool
+    pool.timeout = 0.1
+
+    # No worker ever picks up the messages.
+    with utils.Stubber(pool._queue, "put", lambda _: None):
+      self.ClientServerCommunicate()
+
+  def testMessagesBeingDecodedAreNotDecodedAgainOnTimeout(self):
+    pool = self.server_communicator.decoding_pool
+    pool.timeout = 0.1
+
+    def SlowCall(call, *args):
+      time.sleep(0.5)
+      return call(*args)
+
+    for worker in pool._workers:
+      worker.Call = functools.partial(SlowCall, worker.Call)
+
+    def FailingDecode(*_):
+      raise AssertionError("Messages were decoded in process.")
+
+    with utils.Stubber(communicator.Communicator, "DecodeUncachedMessages",
+                       FailingDecode):
+      self.ClientServerCommunicate()
+
+  def testWorkerIsRestartedWhenItDies(self):
+    pool = decoding_pool.CommsDecodingPool(
+        self.server_private_key, num_processes=1)
+    self.addCleanup(pool.Stop)
+    self.server_communicator.decoding_pool = pool
+
+    dead_worker = pool._workers[0]
+    dead_worker._process.kill()
+    dead_worker._process.wait()
+
+    # The messages are decoded in process while the worker restarts.
+    self.ClientServerCommunicate()
+
+    self.assertIsNot(pool._workers[0], dead_worker)
+    self.assertIsNone(pool._workers[0]._process.poll())
+
+
 class HTTPClientTests(test_lib.GRRBaseTest):
   """Test the http communicator."""
 
@@ -482,8 +482,13 @@ class ApiListHuntResultsHandler(api_call_handler_base.ApiCallHandler):
   def Handle(self, args, token=None):
     results_collection = implementation.GRRHunt.ResultCollectionForHID(
         args.hunt_id.ToURN())
-    items = api_call_handler_utils.FilterCollection(
-        results_collection, args.offset, args.count, args.filter)
+    if args.filter:
+      items = api_call_handler_utils.FilterCollection(
+          results_collection, args.offset, args.count, args.filter)
+    else:
+      # Seeks to the requested page through the collection's offset index, so
+      # deep pages are read without scanning the records before them.
+      items, _ = results_collection.ReadPage(args.offset, args.count or None)
     wrapped_items = [ApiHuntResult().InitFromGrrMessage(item) for item in items]
 
     return ApiListHuntResultsResult(
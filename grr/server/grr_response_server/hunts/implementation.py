@@ -572,41 +572,6 @@ class HuntRunner(object):
   def GetState(self):
     return self.context.state
 
-  def ProcessRepliesWithOutputPlugins(self, replies):
-    if not self.runner_args.output_plugins or not replies:
-      return
-    for output_plugin_state in self.context.output_plugins_states:
-      plugin_descriptor = output_plugin_state.plugin_descriptor
-      plugin_state = output_plugin_state.plugin_state
-      output_plugin = plugin_descriptor.GetPluginForState(plugin_state)
-
-      # Extend our lease if needed.
-      self.hunt_obj.HeartBeat()
-      try:
-        output_plugin.ProcessResponses(replies)
-        output_plugin.Flush()
-
-        log_item = output_plugin.OutputPluginBatchProcessingStatus(
-            plugin_descriptor=plugin_descriptor,
-            status="SUCCESS",
-            batch_size=len(replies))
-        # Cannot append to lists in AttributedDicts.
-        plugin_state["logs"] += [log_item]
-
-        self.Log("Plugin %s successfully processed %d flow replies.",
-                 plugin_descriptor, len(replies))
-      except Exception as e:  # pylint: disable=broad-except
-        error = output_plugin.OutputPluginBatchProcessingStatus(
-            plugin_descriptor=plugin_descriptor,
-            status="ERROR",
-            summary=utils.SmartStr(e),
-            batch_size=len(replies))
-        # Cannot append to lists in AttributedDicts.
-        plugin_state["errors"] += [error]
-
-        self.Log("Plugin %s failed to process %d replies due to: %s",
-                 plugin_descriptor, len(replies), e)
-
   def UpdateProtoResources(self, status):
     """Save cpu and network stats, check limits."""
     user_cpu = status.cpu_time_used.user_cpu_time
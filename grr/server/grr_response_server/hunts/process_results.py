@@ -5,11 +5,14 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import collections
 import logging
+import threading
 
 
 from future.utils import iteritems
 from future.utils import itervalues
+import queue
 
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import utils
@@ -44,13 +47,145 @@ class ResultsProcessingError(Exception):
     return "\n".join(messages)
 
 
+class _PendingBatch(object):
+  """A batch of result notifications that output plugins are working on."""
+
+  def __init__(self, notifications, num_plugins):
+    self.notifications = notifications
+    self._num_remaining = num_plugins
+    self._lock = threading.Lock()
+    self._done = threading.Event()
+    if not num_plugins:
+      self._done.set()
+
+  def PluginDone(self):
+    with self._lock:
+      self._num_remaining -= 1
+      if self._num_remaining <= 0:
+        self._done.set()
+
+  def IsDone(self):
+    return self._done.is_set()
+
+  def Wait(self, timeout):
+    """Waits for all the plugins to finish, returns True if they did."""
+    self._done.wait(timeout)
+    return self._done.is_set()
+
+
+class OutputPluginWorker(object):
+  """Runs a single hunt output plugin in a dedicated thread.
+
+  Batches are processed in the order they were added. Adding a batch blocks
+  while max_pending_batches batches are waiting to be processed, which
+  propagates backpressure from slow plugins to the results reader.
+  """
+
+  def __init__(self,
+               hunt_urn,
+               plugin_def,
+               plugin,
+               max_pending_batches=1,
+               log_fn=None):
+    self.hunt_urn = hunt_urn
+    self.plugin_def = plugin_def
+    self.plugin = plugin
+    self.exceptions = []
+    self._log_fn = log_fn
+    self._queue = queue.Queue(maxsize=max_pending_batches)
+    self._thread = threading.Thread(
+        name="OutputPluginWorker_%s" % plugin_def.plugin_name,
+        target=self._Run)
+    self._thread.daemon = True
+
+  def Start(self):
+    self._thread.start()
+
+  def AddBatch(self, results, pending_batch):
+    self._queue.put((results, pending_batch))
+
+  def Stop(self):
+    """Processes all the batches that were added and stops the thread."""
+    self._queue.put(None)
+    self._thread.join()
+
+  def _Run(self):
+    while True:
+      item = self._queue.get()
+      if item is None:
+        return
+
+      results, pending_batch = item
+      try:
+        self.ProcessBatch(results)
+      except Exception as e:  # pylint: disable=broad-except
+        # The worker has to keep draining the queue, otherwise AddBatch() and
+        # Stop() would block forever.
+        logging.exception(
+            "Unexpected error in output plugin worker: hunt %s, plugin %s",
+            self.hunt_urn, utils.SmartStr(self.plugin))
+        self.exceptions.append(e)
+      finally:
+        pending_batch.PluginDone()
+
+  def ProcessBatch(self, results):
+    """Runs the plugin on a batch of results and records the outcome."""
+    plugin_def = self.plugin_def
+    try:
+      self.plugin.ProcessResponses(results)
+      self.plugin.Flush()
+
+      plugin_status = output_plugin.OutputPluginBatchProcessingStatus(
+          plugin_descriptor=plugin_def,
+          status="SUCCESS",
+          batch_size=len(results))
+      stats_collector_instance.Get().IncrementCounter(
+          "hunt_results_ran_through_plugin",
+          delta=len(results),
+          fields=[plugin_def.plugin_name])
+
+    except Exception as e:  # pylint: disable=broad-except
+      logging.exception(
+          "Error processing hunt results: hunt %s, "
+          "plugin %s", self.hunt_urn, utils.SmartStr(self.plugin))
+      if self._log_fn:
+        self._log_fn("Error processing hunt results (hunt %s, "
+                     "plugin %s): %s" %
+                     (self.hunt_urn, utils.SmartStr(self.plugin), e))
+      stats_collector_instance.Get().IncrementCounter(
+          "hunt_output_plugin_errors", fields=[plugin_def.plugin_name])
+
+      plugin_status = output_plugin.OutputPluginBatchProcessingStatus(
+          plugin_descriptor=plugin_def,
+          status="ERROR",
+          summary=utils.SmartStr(e),
+          batch_size=len(results))
+      self.exceptions.append(e)
+
+    hunt_cls = implementation.GRRHunt
+    try:
+      with data_store.DB.GetMutationPool() as pool:
+        hunt_cls.PluginStatusCollectionForHID(self.hunt_urn).Add(
+            plugin_status, mutation_pool=pool)
+        if plugin_status.status == plugin_status.Status.ERROR:
+          hunt_cls.PluginErrorCollectionForHID(self.hunt_urn).Add(
+              plugin_status, mutation_pool=pool)
+    except Exception as e:  # pylint: disable=broad-except
+      logging.exception(
+          "Error writing output plugin status: hunt %s, plugin %s",
+          self.hunt_urn, utils.SmartStr(self.plugin))
+      self.exceptions.append(e)
+
+
 @cronjobs.DualDBSystemCronJob(
     legacy_name="ProcessHuntResultCollectionsCronFlow", stateful=False)
 class ProcessHuntResultCollectionsCronJob(object):
   """Periodic cron flow that processes hunt results.
 
   The ProcessHuntResultCollectionsCronFlow reads hunt results stored in
-  HuntResultCollections and feeds runs output plugins on them.
+  HuntResultCollections and feeds runs output plugins on them. Hunts only
+  write their results to the collections, so slow output plugins never hold
+  up hunt processing in the workers.
   """
 
   frequency = rdfvalue.Duration("5m")
@@ -58,6 +193,14 @@ class ProcessHuntResultCollectionsCronJob(object):
   allow_overruns = True
 
   BATCH_SIZE = 5000
+  # Maximum number of batches read from the results queue that haven't been
+  # processed by all the output plugins yet.
+  MAX_PENDING_BATCHES = 4
+  # How often (in seconds) to heartbeat while waiting for output plugins.
+  WAIT_INTERVAL = 10
+  # Number of hunts whose results are processed at the same time, so that slow
+  # output plugins of one hunt don't hold up the others.
+  MAX_CONCURRENT_HUNTS = 4
 
   def CheckIfRunningTooLong(self):
     """Return True if the cron job's time is expired."""
@@ -86,57 +229,53 @@ class ProcessHuntResultCollectionsCronJob(object):
       used_plugins.append((plugin_def, plugin_def.GetPluginForState(state)))
     return output_plugins, used_plugins
 
-  def RunPlugins(self, hunt_urn, plugins, results, exceptions_by_plugin):
-    """Runs given plugins on a given hunt."""
+  def _HeartBeat(self):
+    # The heartbeat is not thread safe and hunts are processed concurrently.
+    with self._lock:
+      self.HeartBeat()
 
-    for plugin_def, plugin in plugins:
-      try:
-        plugin.ProcessResponses(results)
-        plugin.Flush()
-
-        plugin_status = output_plugin.OutputPluginBatchProcessingStatus(
-            plugin_descriptor=plugin_def,
-            status="SUCCESS",
-            batch_size=len(results))
-        stats_collector_instance.Get().IncrementCounter(
-            "hunt_results_ran_through_plugin",
-            delta=len(results),
-            fields=[plugin_def.plugin_name])
+  def _Log(self, message, *args):
+    with self._lock:
+      self.Log(message, *args)
 
-      except Exception as e:  # pylint: disable=broad-except
-        logging.exception(
-            "Error processing hunt results: hunt %s, "
-            "plugin %s", hunt_urn, utils.SmartStr(plugin))
-        self.Log("Error processing hunt results (hunt %s, "
-                 "plugin %s): %s" % (hunt_urn, utils.SmartStr(plugin), e))
-        stats_collector_instance.Get().IncrementCounter(
-            "hunt_output_plugin_errors", fields=[plugin_def.plugin_name])
-
-        plugin_status = output_plugin.OutputPluginBatchProcessingStatus(
-            plugin_descriptor=plugin_def,
-            status="ERROR",
-            summary=utils.SmartStr(e),
-            batch_size=len(results))
-        exceptions_by_plugin.setdefault(plugin_def, []).append(e)
+  def _WaitForBatch(self, pending_batch, metadata_obj):
+    """Waits for all plugins to finish a batch, keeping the job alive."""
+    while not pending_batch.Wait(self.WAIT_INTERVAL):
+      metadata_obj.UpdateLease(600)
+      self._HeartBeat()
 
-      with data_store.DB.GetMutationPool() as pool:
-        implementation.GRRHunt.PluginStatusCollectionForHID(hunt_urn).Add(
-            plugin_status, mutation_pool=pool)
-        if plugin_status.status == plugin_status.Status.ERROR:
-          implementation.GRRHunt.PluginErrorCollectionForHID(hunt_urn).Add(
-              plugin_status, mutation_pool=pool)
+  def ClaimOneHunt(self):
+    """Claims the unprocessed results of one hunt.
 
-  def ProcessOneHunt(self, exceptions_by_hunt):
-    """Reads results for one hunt and process them."""
+    Returns:
+      A (hunt urn, notifications) tuple. The notifications are empty if there
+      are no results to process.
+    """
     hunt_results_urn, results = (
         hunts_results.HuntResultQueue.ClaimNotificationsForCollection(
             token=self.token, lease_time=self.lifetime))
     logging.debug("Found %d results for hunt %s", len(results),
                   hunt_results_urn)
     if not results:
-      return 0
+      return None, results
+
+    return rdfvalue.RDFURN(hunt_results_urn.Dirname()), results
 
-    hunt_urn = rdfvalue.RDFURN(hunt_results_urn.Dirname())
+  def ProcessHuntResults(self, hunt_urn, results, exceptions_by_hunt):
+    """Runs the output plugins of a hunt on the claimed results.
+
+    Every output plugin runs in its own worker thread. Batches are dispatched
+    to all of them and at most MAX_PENDING_BATCHES batches can be in flight,
+    so that a slow plugin throttles reading of results instead of buffering
+    them. Notifications of a batch are only deleted once every plugin has
+    processed it.
+
+    Args:
+      hunt_urn: The urn of the hunt.
+      results: The notifications claimed for the hunt.
+      exceptions_by_hunt: A dictionary to put plugin exceptions into, keyed by
+        the hunt urn.
+    """
     batch_size = self.BATCH_SIZE
     metadata_urn = hunt_urn.Add("ResultsMetadata")
     exceptions_by_plugin = {}
@@ -148,52 +287,143 @@ class ProcessHuntResultCollectionsCronJob(object):
         all_plugins, used_plugins = self.LoadPlugins(metadata_obj)
         num_processed = int(
             metadata_obj.Get(metadata_obj.Schema.NUM_PROCESSED_RESULTS))
-        for batch in collection.Batch(results, batch_size):
-          results = list(
-              collection_obj.MultiResolve(
-                  [r.value.ResultRecord() for r in batch]))
-          self.RunPlugins(hunt_urn, used_plugins, results, exceptions_by_plugin)
 
+        workers = [
+            OutputPluginWorker(
+                hunt_urn,
+                plugin_def,
+                plugin,
+                max_pending_batches=self.MAX_PENDING_BATCHES,
+                log_fn=self._Log) for plugin_def, plugin in used_plugins
+        ]
+        pending_batches = collections.deque()
+
+        def AckBatch(pending_batch):
           hunts_results.HuntResultQueue.DeleteNotifications(
-              batch, token=self.token)
-          num_processed += len(batch)
-          num_processed_for_hunt += len(batch)
-          self.HeartBeat()
+              pending_batch.notifications, token=self.token)
           metadata_obj.Set(
-              metadata_obj.Schema.NUM_PROCESSED_RESULTS(num_processed))
+              metadata_obj.Schema.NUM_PROCESSED_RESULTS(
+                  num_processed + num_processed_for_hunt))
           metadata_obj.UpdateLease(600)
-          if self.CheckIfRunningTooLong():
-            logging.warning("Run too long, stopping.")
-            break
+          self._HeartBeat()
+
+        for worker in workers:
+          worker.Start()
+        try:
+          for batch in collection.Batch(results, batch_size):
+            # Acknowledge finished batches and wait for the oldest one if too
+            # many are still in flight.
+            while pending_batches and (
+                pending_batches[0].IsDone() or
+                len(pending_batches) >= self.MAX_PENDING_BATCHES):
+              pending_batch = pending_batches.popleft()
+              self._WaitForBatch(pending_batch, metadata_obj)
+              num_processed_for_hunt += len(pending_batch.notifications)
+              AckBatch(pending_batch)
+
+            if self.CheckIfRunningTooLong():
+              logging.warning("Run too long, stopping.")
+              break
+
+            batch_results = list(
+                collection_obj.MultiResolve(
+                    [r.value.ResultRecord() for r in batch]))
+            pending_batch = _PendingBatch(batch, len(workers))
+            pending_batches.append(pending_batch)
+            for worker in workers:
+              worker.AddBatch(batch_results, pending_batch)
+        finally:
+          for worker in workers:
+            worker.Stop()
+
+        while pending_batches:
+          pending_batch = pending_batches.popleft()
+          num_processed_for_hunt += len(pending_batch.notifications)
+          AckBatch(pending_batch)
+
+        for worker in workers:
+          if worker.exceptions:
+            exceptions_by_plugin.setdefault(worker.plugin_def,
+                                            []).extend(worker.exceptions)
 
         metadata_obj.Set(metadata_obj.Schema.OUTPUT_PLUGINS(all_plugins))
         metadata_obj.Set(
-            metadata_obj.Schema.NUM_PROCESSED_RESULTS(num_processed))
+            metadata_obj.Schema.NUM_PROCESSED_RESULTS(num_processed +
+                                                      num_processed_for_hunt))
     except aff4.LockError:
       logging.warn(
           "ProcessHuntResultCollectionsCronFlow: "
           "Could not get lock on hunt metadata %s.", metadata_urn)
-      return 0
+      return
 
     if exceptions_by_plugin:
-      for plugin, exceptions in iteritems(exceptions_by_plugin):
-        exceptions_by_hunt.setdefault(hunt_urn, {}).setdefault(
-            plugin, []).extend(exceptions)
+      with self._lock:
+        for plugin, exceptions in iteritems(exceptions_by_plugin):
+          exceptions_by_hunt.setdefault(hunt_urn, {}).setdefault(
+              plugin, []).extend(exceptions)
 
     logging.debug("Processed %d results.", num_processed_for_hunt)
-    return len(results)
+
+  def _ProcessHuntResultsInThread(self, hunt_urn, results, exceptions_by_hunt,
+                                  errors, slots):
+    try:
+      self.ProcessHuntResults(hunt_urn, results, exceptions_by_hunt)
+    except Exception as e:  # pylint: disable=broad-except
+      logging.exception("Error processing results of hunt %s: %s", hunt_urn, e)
+      with self._lock:
+        errors.append(e)
+    finally:
+      slots.release()
+      self._hunt_done.set()
 
   def Run(self):
-    """Run this cron job."""
+    """Run this cron job.
+
+    Results are claimed one hunt at a time, but up to MAX_CONCURRENT_HUNTS
+    hunts are processed at the same time, each in its own thread, so that slow
+    output plugins of one hunt don't hold up the others.
+    """
     self.start_time = rdfvalue.RDFDatetime.Now()
 
     exceptions_by_hunt = {}
     self.max_running_time = self.lifetime * 0.6
+    self._lock = threading.RLock()
+    self._hunt_done = threading.Event()
 
-    while not self.CheckIfRunningTooLong():
-      count = self.ProcessOneHunt(exceptions_by_hunt)
-      if not count:
-        break
+    errors = []
+    slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_HUNTS)
+    threads_by_hunt = {}
+    try:
+      while not self.CheckIfRunningTooLong():
+        self._hunt_done.clear()
+        hunt_urn, results = self.ClaimOneHunt()
+        if not results:
+          if not any(t.is_alive() for t in itervalues(threads_by_hunt)):
+            break
+          # Hunts being processed may still receive new results.
+          self._hunt_done.wait(self.WAIT_INTERVAL)
+          continue
+
+        # Results of a hunt that is still being processed arrived after it was
+        # claimed. They are processed once the earlier results are done.
+        previous_thread = threads_by_hunt.get(hunt_urn)
+        if previous_thread is not None:
+          previous_thread.join()
+
+        slots.acquire()
+        thread = threading.Thread(
+            name="ProcessHuntResults_%s" % hunt_urn.Basename(),
+            target=self._ProcessHuntResultsInThread,
+            args=(hunt_urn, results, exceptions_by_hunt, errors, slots))
+        thread.daemon = True
+        thread.start()
+        threads_by_hunt[hunt_urn] = thread
+    finally:
+      for thread in itervalues(threads_by_hunt):
+        thread.join()
+
+    if errors:
+      raise errors[0]
 
     if exceptions_by_hunt:
       e = ResultsProcessingError()
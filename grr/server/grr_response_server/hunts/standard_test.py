@@ -7,6 +7,7 @@ import glob
 import logging
 import math
 import os
+import threading
 import time
 
 
@@ -549,6 +550,26 @@ class StandardHuntTest(notification_test_lib.NotificationTestMixin,
     # Check that call count hasn't changed.
     self.assertEqual(process_responses_mock.call_count, 1)
 
+  def testPluginStatusWriteFailureIsReported(self):
+    plugin_descriptor = rdf_output_plugin.OutputPluginDescriptor(
+        plugin_name="DummyHuntOutputPlugin")
+    hunt_urn = self.StartHunt(output_plugins=[plugin_descriptor])
+
+    self.AssignTasksToClients()
+    self.RunHunt(failrate=-1)
+
+    with mock.patch.object(
+        implementation.GRRHunt,
+        "PluginStatusCollectionForHID",
+        side_effect=RuntimeError("Status write failed.")):
+      with self.assertRaises(process_results.ResultsProcessingError) as context:
+        self.ProcessHuntOutputPlugins()
+
+    exceptions = context.exception.exceptions_by_hunt[hunt_urn][
+        plugin_descriptor]
+    self.assertEqual(len(exceptions), 1)
+    self.assertEqual(str(exceptions[0]), "Status write failed.")
+
   def testUpdatesStatsCounterOnSuccess(self):
     failing_plugin_descriptor = rdf_output_plugin.OutputPluginDescriptor(
         plugin_name="DummyHuntOutputPlugin")
@@ -663,9 +684,12 @@ class StandardHuntTest(notification_test_lib.NotificationTestMixin,
       # 165s gives 99s max run time. LongRunningDummyHuntOutputPlugin will set
       # the time to 100s on the first run, which will effectively mean that it's
       # running for too long.
+      # With a single pending batch the next one is only read after the
+      # plugin is done with the previous one.
       phrccf = process_results.ProcessHuntResultCollectionsCronFlow
       with utils.MultiStubber((phrccf, "lifetime", rdfvalue.Duration("165s")),
-                              (phrccf, "BATCH_SIZE", 1)):
+                              (phrccf, "BATCH_SIZE", 1),
+                              (phrccf, "MAX_PENDING_BATCHES", 1)):
         self.ProcessHuntOutputPlugins()
 
       # In normal conditions, there should be 10 results generated.
@@ -708,6 +732,63 @@ class StandardHuntTest(notification_test_lib.NotificationTestMixin,
       self.assertEqual(hunt_test_lib.LongRunningDummyHuntOutputPlugin.num_calls,
                        10)
 
+  def testOutputPluginsProcessAllBatchesWithPendingBatchesLimit(self):
+    plugin_descriptor = rdf_output_plugin.OutputPluginDescriptor(
+        plugin_name="DummyHuntOutputPlugin")
+    hunt_urn = self.StartHunt(output_plugins=[plugin_descriptor])
+
+    self.AssignTasksToClients()
+    self.RunHunt(failrate=-1)
+
+    phrccf = process_results.ProcessHuntResultCollectionsCronFlow
+    phrccj = process_results.ProcessHuntResultCollectionsCronJob
+    with utils.MultiStubber((phrccf, "BATCH_SIZE", 3),
+                            (phrccf, "MAX_PENDING_BATCHES", 2),
+                            (phrccj, "BATCH_SIZE", 3),
+                            (phrccj, "MAX_PENDING_BATCHES", 2)):
+      self.ProcessHuntOutputPlugins()
+
+    self.assertEqual(hunt_test_lib.DummyHuntOutputPlugin.num_calls, 4)
+    self.assertEqual(hunt_test_lib.DummyHuntOutputPlugin.num_responses, 10)
+
+    status_collection = implementation.GRRHunt.PluginStatusCollectionForHID(
+        hunt_urn)
+    self.assertEqual(
+        sorted(item.batch_size for item in status_collection), [1, 3, 3, 3])
+
+    # All the batches were acknowledged, nothing is processed again.
+    self.ProcessHuntOutputPlugins()
+    self.assertEqual(hunt_test_lib.DummyHuntOutputPlugin.num_calls, 4)
+
+  def testSlowOutputPluginDoesNotBlockOtherHunts(self):
+    for _ in range(2):
+      self.StartHunt(output_plugins=[
+          rdf_output_plugin.OutputPluginDescriptor(
+              plugin_name="DummyHuntOutputPlugin")
+      ])
+    self.AssignTasksToClients()
+    self.RunHunt(failrate=-1)
+
+    lock = threading.Lock()
+    other_hunt_processed = threading.Event()
+    blocked_calls = []
+
+    def ProcessResponsesStub(*_):
+      with lock:
+        is_first_call = not blocked_calls
+        blocked_calls.append(None)
+      if is_first_call:
+        # Blocks the first hunt until the other one has been processed.
+        self.assertTrue(other_hunt_processed.wait(10))
+      else:
+        other_hunt_processed.set()
+
+    with utils.Stubber(hunt_test_lib.DummyHuntOutputPlugin, "ProcessResponses",
+                       ProcessResponsesStub):
+      self.ProcessHuntOutputPlugins()
+
+    self.assertTrue(other_hunt_processed.is_set())
+
   def testHuntResultsArrivingWhileOldResultsAreProcessedAreHandled(self):
     self.StartHunt(output_plugins=[
         rdf_output_plugin.OutputPluginDescriptor(
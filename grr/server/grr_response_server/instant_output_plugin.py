@@ -14,8 +14,6 @@ from future.utils import with_metaclass
 from grr_response_core.lib import rdfvalue
 from grr_response_core.lib import registry
 from grr_response_core.lib.util import collection
-from grr_response_server import aff4
-from grr_response_server import data_store
 from grr_response_server import export
 
 
@@ -124,22 +122,8 @@ class InstantOutputPluginWithExportConversion(InstantOutputPlugin):
         metadata_to_fetch.add(urn)
 
     if metadata_to_fetch:
-      if data_store.RelationalDBReadEnabled():
-        client_ids = set(urn.Basename() for urn in metadata_to_fetch)
-        infos = data_store.REL_DB.MultiReadClientFullInfo(client_ids)
-
-        fetched_metadata = [
-            export.GetMetadata(client_id, info)
-            for client_id, info in infos.items()
-        ]
-      else:
-        client_fds = aff4.FACTORY.MultiOpen(
-            metadata_to_fetch, mode="r", token=self.token)
-
-        fetched_metadata = [
-            export.GetMetadataLegacy(client_fd, token=self.token)
-            for client_fd in client_fds
-        ]
+      fetched_metadata = export.FetchMetadataForClients(
+          metadata_to_fetch, token=self.token)
 
       for metadata in fetched_metadata:
         metadata.source_urn = self.source_urn
@@ -231,7 +215,8 @@ class InstantOutputPluginWithExportConversion(InstantOutputPlugin):
     """Generates converted values using given converter from given messages.
 
     Groups values in batches of BATCH_SIZE size and applies the converter
-    to each batch.
+    to each batch. Multiprocessing-safe converters run in the export conversion
+    pool if one is configured.
 
     Args:
       converter: ExportConverter instance.
@@ -243,12 +228,17 @@ class InstantOutputPluginWithExportConversion(InstantOutputPlugin):
     Raises:
       ValueError: if any of the GrrMessage objects doesn't have "source" set.
     """
+    conversion_pool = export.GetConversionPool()
     for batch in collection.Batch(grr_messages, self.BATCH_SIZE):
       metadata_items = self._GetMetadataForClients([gm.source for gm in batch])
-      batch_with_metadata = zip(metadata_items, [gm.payload for gm in batch])
-
-      for result in converter.BatchConvert(
-          batch_with_metadata, token=self.token):
+      batch_with_metadata = list(
+          zip(metadata_items, [gm.payload for gm in batch]))
+
+      for result in export.BatchConvert(
+          converter,
+          batch_with_metadata,
+          token=self.token,
+          conversion_pool=conversion_pool):
         yield result
 
   def ProcessValues(self, value_type, values_generator_fn):
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 from grr_response_core.lib import flags
 from grr_response_core.lib import rdfvalue
+from grr_response_core.lib import utils
 from grr_response_core.lib.rdfvalues import client as rdf_client
 from grr_response_core.lib.rdfvalues import flows as rdf_flows
 from grr_response_server import data_store
@@ -230,6 +231,24 @@ class InstantOutputPluginWithExportConversionTest(
         "Finish"
     ])  # pyformat: disable
 
+  def testRunsMultiprocessingSafeConvertersInConversionPool(self):
+    pool = export.ExportConversionPool(1)
+    self.addCleanup(pool.Stop)
+
+    with utils.MultiStubber((export, "GetConversionPool", lambda: pool),
+                            (TestConverter1, "multiprocessing_safe", True)):
+      with test_lib.Instrument(pool, "BatchConvert") as batch_convert:
+        lines = self.ProcessValuesToLines(
+            {DummySrcValue1: [DummySrcValue1("foo")]})
+
+    self.assertEqual(batch_convert.call_count, 1)
+    self.assertListEqual(lines, [
+        "Start",
+        "Original: DummySrcValue1",
+        "Exported value: exp-foo",
+        "Finish"
+    ])  # pyformat: disable
+
 
 def main(argv):
   test_lib.main(argv)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""Renders stats metrics in the OpenMetrics text exposition format.
+
+See https://github.com/OpenObservability/OpenMetrics for the format
+specification. The output can be scraped by Prometheus and compatible systems.
+"""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import re
+import threading
+
+
+from future.utils import iteritems
+
+from grr_response_core.lib import utils
+from grr_response_core.lib.rdfvalues import stats as rdf_stats
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_INVALID_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _SanitizeName(name):
+  """Makes a metric or label name conform to the OpenMetrics syntax."""
+  name = _INVALID_NAME_CHARS_RE.sub("_", name)
+  if name[:1].isdigit():
+    name = "_" + name
+  return name
+
+
+def _EscapeLabelValue(value):
+  return (utils.SmartUnicode(value).replace("\\", "\\\\").replace(
+      "\"", "\\\"").replace("\n", "\\n"))
+
+
+def _FormatNumber(value):
+  if isinstance(value, float):
+    if value == float("inf"):
+      return "+Inf"
+    if value == -float("inf"):
+      return "-Inf"
+    return repr(value)
+  return "%d" % value
+
+
+def _FormatLabels(label_pairs):
+  if not label_pairs:
+    return ""
+  return "{%s}" % ",".join("%s=\"%s\"" % (name, _EscapeLabelValue(value))
+                           for name, value in label_pairs)
+
+
+class OpenMetricsRenderer(object):
+  """Renders all metrics of a stats-collector as OpenMetrics text.
+
+  Rendered samples of every series are cached together with the value they
+  were rendered from. Series whose value didn't change since the previous
+  scrape are not formatted again, so that frequent scrapes mostly cost the
+  reading of the values.
+  """
+
+  def __init__(self):
+    # Maps (metric name, field values) tuples to (value key, text) tuples.
+    self._cache = {}
+    self._lock = threading.Lock()
+
+  def _ValueKey(self, metric_type, value):
+    """Returns a cheap to compare key that changes when the value changes."""
+    if metric_type == rdf_stats.MetricMetadata.MetricType.EVENT:
+      # Distributions only ever grow, so count and sum identify the heights.
+      return (value.count, value.sum)
+    return value
+
+  def _RenderSeries(self, name, metadata, label_pairs, value):
+    """Renders all the samples of a single series."""
+    metric_type = metadata.metric_type
+    if metric_type == rdf_stats.MetricMetadata.MetricType.COUNTER:
+      return "%s_total%s %s\n" % (name, _FormatLabels(label_pairs),
+                                  _FormatNumber(value))
+
+    if metric_type == rdf_stats.MetricMetadata.MetricType.EVENT:
+      lines = []
+      cumulative = 0
+      bins = list(value.bins)
+      heights = list(value.heights)
+      # Distribution bins are lower bounds, an OpenMetrics bucket includes
+      # everything up to its upper bound.
+      for upper_bound, height in zip(bins[1:], heights):
+        cumulative += height
+        lines.append("%s_bucket%s %d\n" % (name, _FormatLabels(
+            label_pairs + [("le", _FormatNumber(float(upper_bound)))]),
+                                           cumulative))
+      lines.append("%s_bucket%s %d\n" %
+                   (name, _FormatLabels(label_pairs + [("le", "+Inf")]),
+                    value.count))
+      lines.append("%s_count%s %d\n" % (name, _FormatLabels(label_pairs),
+                                        value.count))
+      lines.append("%s_sum%s %s\n" % (name, _FormatLabels(label_pairs),
+                                      _FormatNumber(float(value.sum))))
+      return "".join(lines)
+
+    if metadata.value_type == rdf_stats.MetricMetadata.ValueType.STR:
+      return "%s_info%s 1\n" % (name,
+                                _FormatLabels(label_pairs + [("value", value)]))
+
+    return "%s%s %s\n" % (name, _FormatLabels(label_pairs),
+                          _FormatNumber(value))
+
+  def _RenderMetric(self, collector, metric_name, metadata):
+    """Renders a metric family, reusing cached samples where possible."""
+    name = _SanitizeName(metric_name)
+    metric_type = metadata.metric_type
+    if metric_type == rdf_stats.MetricMetadata.MetricType.COUNTER:
+      family_type = "counter"
+    elif metric_type == rdf_stats.MetricMetadata.MetricType.EVENT:
+      family_type = "histogram"
+    elif metadata.value_type == rdf_stats.MetricMetadata.ValueType.STR:
+      family_type = "info"
+    else:
+      family_type = "gauge"
+
+    lines = ["# TYPE %s %s\n" % (name, family_type)]
+    if metadata.docstring:
+      lines.append("# HELP %s %s\n" % (name, metadata.docstring.replace(
+          "\\", "\\\\").replace("\n", "\\n")))
+
+    if metadata.fields_defs:
+      label_names = [
+          _SanitizeName(field_def.field_name)
+          for field_def in metadata.fields_defs
+      ]
+      fields_list = collector.GetMetricFields(metric_name)
+    else:
+      label_names = []
+      fields_list = [None]
+
+    for fields in fields_list:
+      value = collector.GetMetricValue(metric_name, fields=fields)
+      value_key = self._ValueKey(metric_type, value)
+      cache_key = (metric_name, tuple(fields or ()))
+
+      cached = self._cache.get(cache_key)
+      if cached is not None and cached[0] == value_key:
+        lines.append(cached[1])
+        continue
+
+      label_pairs = list(zip(label_names, fields or ()))
+      text = self._RenderSeries(name, metadata, label_pairs, value)
+      with self._lock:
+        self._cache[cache_key] = (value_key, text)
+      lines.append(text)
+
+    return "".join(lines)
+
+  def Render(self, collector):
+    """Renders all the metrics of the collector.
+
+    Args:
+      collector: A StatsCollector instance.
+
+    Yields:
+      Chunks of OpenMetrics text, one per metric family, terminated by the
+      "# EOF" marker.
+    """
+    for metric_name, metadata in sorted(
+        iteritems(collector.GetAllMetricsMetadata())):
+      yield self._RenderMetric(collector, metric_name, metadata)
+    yield "# EOF\n"
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Tests for the OpenMetrics renderer."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import mock
+
+from grr_response_core.lib import flags
+from grr_response_core.stats import default_stats_collector
+from grr_response_core.stats import stats_utils
+from grr_response_server import openmetrics
+from grr.test_lib import test_lib
+
+
+class OpenMetricsRendererTest(test_lib.GRRBaseTest):
+
+  def setUp(self):
+    super(OpenMetricsRendererTest, self).setUp()
+    self.collector = default_stats_collector.DefaultStatsCollector([
+        stats_utils.CreateCounterMetadata(
+            "requests", fields=[("method", str)], docstring="Requests."),
+        stats_utils.CreateGaugeMetadata("queue_depth", int),
+        stats_utils.CreateGaugeMetadata("version", str),
+        stats_utils.CreateEventMetadata("latency", bins=[0.5, 2.0]),
+    ])
+    self.renderer = openmetrics.OpenMetricsRenderer()
+
+  def Render(self):
+    return "".join(self.renderer.Render(self.collector))
+
+  def testRendersAllMetricTypes(self):
+    self.collector.IncrementCounter("requests", 3, fields=["GET"])
+    self.collector.IncrementCounter("requests", fields=["P\"O\\ST"])
+    self.collector.SetGaugeValue("queue_depth", 42)
+    self.collector.SetGaugeValue("version", "3.2.4")
+    self.collector.RecordEvent("latency", 0.25)
+    self.collector.RecordEvent("latency", 1.0)
+    self.collector.RecordEvent("latency", 5)
+
+    lines = self.Render().splitlines()
+
+    self.assertEqual(lines[-1], "# EOF")
+    self.assertIn("# TYPE requests counter", lines)
+    self.assertIn("# HELP requests Requests.", lines)
+    self.assertIn("requests_total{method=\"GET\"} 3", lines)
+    self.assertIn("requests_total{method=\"P\\\"O\\\\ST\"} 1", lines)
+    self.assertIn("# TYPE queue_depth gauge", lines)
+    self.assertIn("queue_depth 42", lines)
+    self.assertIn("# TYPE version info", lines)
+    self.assertIn("version_info{value=\"3.2.4\"} 1", lines)
+
+    self.assertIn("# TYPE latency histogram", lines)
+    histogram_lines = [l for l in lines if l.startswith("latency_")]
+    self.assertEqual(histogram_lines, [
+        "latency_bucket{le=\"0.5\"} 1",
+        "latency_bucket{le=\"2.0\"} 2",
+        "latency_bucket{le=\"+Inf\"} 3",
+        "latency_count 3",
+        "latency_sum 6.25",
+    ])
+
+  def testOnlyChangedSeriesAreRenderedAgain(self):
+    self.collector.IncrementCounter("requests", fields=["GET"])
+    self.collector.IncrementCounter("requests", fields=["POST"])
+    self.Render()
+
+    self.collector.IncrementCounter("requests", fields=["GET"])
+    with mock.patch.object(
+        self.renderer, "_RenderSeries",
+        wraps=self.renderer._RenderSeries) as render_series_mock:
+      output = self.Render()
+
+    rendered_fields = [c[0][2] for c in render_series_mock.call_args_list]
+    self.assertEqual(rendered_fields, [[("method", "GET")]])
+    self.assertIn("requests_total{method=\"GET\"} 2\n", output)
+    self.assertIn("requests_total{method=\"POST\"} 1\n", output)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
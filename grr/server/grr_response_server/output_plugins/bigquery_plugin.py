@@ -104,7 +104,8 @@ class BigQueryOutputPlugin(output_plugin.OutputPlugin):
           default_metadata,
           responses,
           token=self.token,
-          options=self.args.export_options)
+          options=self.args.export_options,
+          conversion_pool=export.GetConversionPool())
     else:
       converted_responses = responses
 
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+"""Plugins that export results as columnar Parquet or Arrow IPC files."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import itertools
+import os
+import zipfile
+
+
+import pyarrow
+from pyarrow import parquet
+import yaml
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib import utils
+from grr_response_core.lib.rdfvalues import structs as rdf_structs
+from grr_response_core.lib.util import collection
+from grr_response_server import instant_output_plugin
+
+
+class Rdf2ArrowAdapter(object):
+  """An adapter for converting RDF values to Arrow columns."""
+
+  class Converter(object):
+
+    def __init__(self, arrow_type, convert_fn):
+      self.arrow_type = arrow_type
+      self.convert_fn = convert_fn
+
+  DEFAULT_CONVERTER = Converter(pyarrow.string(), utils.SmartUnicode)
+
+  INT_CONVERTER = Converter(pyarrow.int64(), int)
+  UINT_CONVERTER = Converter(pyarrow.uint64(), int)
+  BOOL_CONVERTER = Converter(pyarrow.bool_(), bool)
+  FLOAT_CONVERTER = Converter(pyarrow.float64(), float)
+
+  # Converters for fields that have a semantic type annotation in their
+  # protobuf definition.
+  SEMANTIC_CONVERTERS = {
+      rdfvalue.RDFInteger:
+          INT_CONVERTER,
+      rdfvalue.RDFBool:
+          BOOL_CONVERTER,
+      rdfvalue.RDFDatetime:
+          Converter(
+              pyarrow.timestamp("us"), lambda x: x.AsMicrosecondsSinceEpoch()),
+      rdfvalue.RDFDatetimeSeconds:
+          Converter(
+              pyarrow.timestamp("us"),
+              lambda x: x.AsSecondsSinceEpoch() * 1000000),
+      rdfvalue.Duration:
+          Converter(pyarrow.int64(), lambda x: x.microseconds),
+  }
+
+  # Converters for fields that do not have a semantic type annotation in their
+  # protobuf definition.
+  NON_SEMANTIC_CONVERTERS = {
+      rdf_structs.ProtoUnsignedInteger: UINT_CONVERTER,
+      rdf_structs.ProtoSignedInteger: INT_CONVERTER,
+      rdf_structs.ProtoFixed32: UINT_CONVERTER,
+      rdf_structs.ProtoFixed64: UINT_CONVERTER,
+      rdf_structs.ProtoFloat: FLOAT_CONVERTER,
+      rdf_structs.ProtoDouble: FLOAT_CONVERTER,
+      rdf_structs.ProtoBoolean: BOOL_CONVERTER,
+      rdf_structs.ProtoBinary: Converter(pyarrow.binary(), bytes),
+  }
+
+  @staticmethod
+  def GetConverter(type_info):
+    if type_info.__class__ is rdf_structs.ProtoRDFValue:
+      return Rdf2ArrowAdapter.SEMANTIC_CONVERTERS.get(
+          type_info.type, Rdf2ArrowAdapter.DEFAULT_CONVERTER)
+    else:
+      return Rdf2ArrowAdapter.NON_SEMANTIC_CONVERTERS.get(
+          type_info.__class__, Rdf2ArrowAdapter.DEFAULT_CONVERTER)
+
+
+class Column(object):
+  """A single flattened field of an exported struct."""
+
+  def __init__(self, path, converter):
+    self.path = path
+    self.name = ".".join(path)
+    self.converter = converter
+
+
+class _ChunkSink(object):
+  """A write-only file object that hands out whatever was written to it.
+
+  Writers record absolute offsets (e.g. in the Parquet footer), so tell()
+  keeps counting even though the data is handed out and dropped.
+  """
+
+  closed = False
+
+  def __init__(self):
+    self._buf = io.BytesIO()
+    self._offset = 0
+
+  def write(self, data):  # pylint: disable=invalid-name
+    self._buf.write(data)
+    self._offset += len(data)
+
+  def tell(self):  # pylint: disable=invalid-name
+    return self._offset
+
+  def flush(self):  # pylint: disable=invalid-name
+    pass
+
+  def close(self):  # pylint: disable=invalid-name
+    self.closed = True
+
+  def Pop(self):
+    data = self._buf.getvalue()
+    self._buf = io.BytesIO()
+    return data
+
+
+class ParquetInstantOutputPlugin(
+    instant_output_plugin.InstantOutputPluginWithExportConversion):
+  """Instant output plugin that writes results as Parquet files."""
+
+  plugin_name = "parquet-zip"
+  friendly_name = "Parquet files (zipped)"
+  description = "Output ZIP archive containing Parquet files."
+  output_file_extension = ".zip"
+
+  file_extension = ".parquet"
+
+  # Every batch becomes one Parquet row group (or Arrow record batch).
+  ROW_BATCH = 65536
+
+  def __init__(self, *args, **kwargs):
+    super(ParquetInstantOutputPlugin, self).__init__(*args, **kwargs)
+    self.archive_generator = None  # Created in Start()
+    self.export_counts = {}
+
+  @property
+  def path_prefix(self):
+    prefix, _ = os.path.splitext(self.output_file_name)
+    return prefix
+
+  def Start(self):
+    # Parquet and Arrow data is already compressed column by column.
+    self.archive_generator = utils.StreamingZipGenerator(
+        compression=zipfile.ZIP_STORED)
+    self.export_counts = {}
+    return []
+
+  def _GetColumns(self, proto_struct_class, prefix=()):
+    """Returns a list of Column objects describing the flattened struct."""
+    columns = []
+    for type_info in proto_struct_class.type_infos:
+      path = prefix + (utils.SmartUnicode(type_info.name),)
+      if type_info.__class__ is rdf_structs.ProtoEmbedded:
+        columns.extend(self._GetColumns(type_info.type, prefix=path))
+      else:
+        columns.append(Column(path, Rdf2ArrowAdapter.GetConverter(type_info)))
+    return columns
+
+  def _GetArrowSchema(self, columns):
+    return pyarrow.schema(
+        [pyarrow.field(c.name, c.converter.arrow_type) for c in columns])
+
+  def _BuildArrays(self, columns, values):
+    """Builds one Arrow array per column from a batch of exported values.
+
+    Embedded structs are extracted once per batch and shared by all of their
+    columns. Unset fields, and fields of unset embedded structs, become nulls.
+
+    Args:
+      columns: A list of Column objects.
+      values: A list of exported values.
+
+    Returns:
+      A list of Arrow arrays, in the order of columns.
+    """
+    parents = {(): values}
+
+    def GetParents(path):
+      try:
+        return parents[path]
+      except KeyError:
+        name = path[-1]
+        result = [
+            v.Get(name) if v is not None and v.HasField(name) else None
+            for v in GetParents(path[:-1])
+        ]
+        parents[path] = result
+        return result
+
+    arrays = []
+    for column in columns:
+      name = column.path[-1]
+      convert_fn = column.converter.convert_fn
+      data = [
+          convert_fn(v.Get(name))
+          if v is not None and v.HasField(name) else None
+          for v in GetParents(column.path[:-1])
+      ]
+      arrays.append(
+          pyarrow.array(data, type=column.converter.arrow_type))
+    return arrays
+
+  def _CreateWriter(self, sink, schema):
+    return parquet.ParquetWriter(sink, schema)
+
+  def _WriteBatch(self, writer, batch):
+    writer.write_table(pyarrow.Table.from_batches([batch]))
+
+  def ProcessSingleTypeExportedValues(self, original_value_type,
+                                      exported_values):
+    first_value = next(exported_values, None)
+    if not first_value:
+      return
+
+    if not isinstance(first_value, rdf_structs.RDFProtoStruct):
+      raise ValueError("The %s plugin only supports export-protos" %
+                       self.friendly_name)
+
+    yield self.archive_generator.WriteFileHeader(
+        "%s/%s_from_%s%s" %
+        (self.path_prefix, first_value.__class__.__name__,
+         original_value_type.__name__, self.file_extension))
+
+    columns = self._GetColumns(first_value.__class__)
+    names = [c.name for c in columns]
+    sink = _ChunkSink()
+    writer = self._CreateWriter(sink, self._GetArrowSchema(columns))
+
+    counter = 0
+    for batch in collection.Batch(
+        itertools.chain([first_value], exported_values), self.ROW_BATCH):
+      counter += len(batch)
+      record_batch = pyarrow.RecordBatch.from_arrays(
+          self._BuildArrays(columns, batch), names)
+      self._WriteBatch(writer, record_batch)
+      yield self.archive_generator.WriteFileChunk(sink.Pop())
+
+    writer.close()
+    yield self.archive_generator.WriteFileChunk(sink.Pop())
+    yield self.archive_generator.WriteFileFooter()
+
+    counts_for_original_type = self.export_counts.setdefault(
+        original_value_type.__name__, dict())
+    counts_for_original_type[first_value.__class__.__name__] = counter
+
+  def Finish(self):
+    manifest = {"export_stats": self.export_counts}
+
+    header = self.path_prefix + "/MANIFEST"
+    yield self.archive_generator.WriteFileHeader(header.encode("utf-8"))
+    yield self.archive_generator.WriteFileChunk(yaml.safe_dump(manifest))
+    yield self.archive_generator.WriteFileFooter()
+    yield self.archive_generator.Close()
+
+
+class ArrowInstantOutputPlugin(ParquetInstantOutputPlugin):
+  """Instant output plugin that writes results as Arrow IPC streams."""
+
+  plugin_name = "arrow-zip"
+  friendly_name = "Arrow IPC streams (zipped)"
+  description = "Output ZIP archive containing Arrow IPC stream files."
+
+  file_extension = ".arrows"
+
+  def _CreateWriter(self, sink, schema):
+    return pyarrow.RecordBatchStreamWriter(sink, schema)
+
+  def _WriteBatch(self, writer, batch):
+    writer.write_batch(batch)
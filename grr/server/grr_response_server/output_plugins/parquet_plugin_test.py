@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- mode: python; encoding: utf-8 -*-
+"""Tests for the Parquet and Arrow instant output plugins."""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import datetime
+import io
+import os
+import unittest
+import zipfile
+
+
+from builtins import range  # pylint: disable=redefined-builtin
+import yaml
+
+from grr_response_core.lib import flags
+from grr_response_core.lib import type_info
+from grr_response_core.lib.rdfvalues import client as rdf_client
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_core.lib.rdfvalues import paths as rdf_paths
+from grr_response_core.lib.rdfvalues import structs as rdf_structs
+from grr_response_server.output_plugins import test_plugins
+from grr.test_lib import test_lib
+
+# pyarrow is an optional dependency, installed with the "parquet" extra.
+# pylint: disable=g-import-not-at-top
+try:
+  import pyarrow
+  from pyarrow import parquet
+  from grr_response_server.output_plugins import parquet_plugin
+except ImportError:
+  pyarrow = None
+  parquet_plugin = None
+# pylint: enable=g-import-not-at-top
+
+
+class TestEmbeddedStruct(rdf_structs.RDFProtoStruct):
+  """Custom struct for testing schema generation."""
+
+  type_description = type_info.TypeDescriptorSet(
+      rdf_structs.ProtoString(name="e_string_field", field_number=1),
+      rdf_structs.ProtoDouble(name="e_double_field", field_number=2))
+
+
+class ParquetTestStruct(rdf_structs.RDFProtoStruct):
+  """Custom struct for testing schema generation."""
+
+  type_description = type_info.TypeDescriptorSet(
+      rdf_structs.ProtoString(name="string_field", field_number=1),
+      rdf_structs.ProtoBinary(name="bytes_field", field_number=2),
+      rdf_structs.ProtoUnsignedInteger(name="uint_field", field_number=3),
+      rdf_structs.ProtoSignedInteger(name="int_field", field_number=4),
+      rdf_structs.ProtoBoolean(name="bool_field", field_number=5),
+      rdf_structs.ProtoRDFValue(
+          name="time_field", field_number=6, rdf_type="RDFDatetime"),
+      rdf_structs.ProtoRDFValue(
+          name="duration_field", field_number=7, rdf_type="Duration"),
+      rdf_structs.ProtoEmbedded(
+          name="embedded_field", field_number=8, nested=TestEmbeddedStruct))
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed.")
+class ParquetInstantOutputPluginTest(test_plugins.InstantOutputPluginTestBase):
+  """Tests the Parquet instant output plugin."""
+
+  plugin_cls = getattr(parquet_plugin, "ParquetInstantOutputPlugin", None)
+
+  STAT_ENTRY_RESPONSES = [
+      rdf_client_fs.StatEntry(
+          pathspec=rdf_paths.PathSpec(path="/foo/bar/%d" % i, pathtype="OS"),
+          st_mode=33184,  # octal = 100640 => u=rw,g=r,o= => -rw-r-----
+          st_ino=1063090,
+          st_nlink=1 + i,
+          st_size=0,
+          st_atime=1493596800,  # Midnight, 01.05.2017 UTC in seconds
+          st_mtime=1493683200) for i in range(10)
+  ]
+
+  def ProcessValuesToZip(self, values_by_cls):
+    fd_path = self.ProcessValues(values_by_cls)
+    file_basename, _ = os.path.splitext(os.path.basename(fd_path))
+    return zipfile.ZipFile(fd_path), file_basename
+
+  def ReadTable(self, data):
+    return parquet.read_table(io.BytesIO(data)).to_pydict()
+
+  def testColumnTypeInference(self):
+    columns = self.plugin._GetColumns(ParquetTestStruct)
+    self.assertEqual(
+        {c.name: c.converter.arrow_type for c in columns}, {
+            "string_field": pyarrow.string(),
+            "bytes_field": pyarrow.binary(),
+            "uint_field": pyarrow.uint64(),
+            "int_field": pyarrow.int64(),
+            "bool_field": pyarrow.bool_(),
+            "time_field": pyarrow.timestamp("us"),
+            "duration_field": pyarrow.int64(),
+            "embedded_field.e_string_field": pyarrow.string(),
+            "embedded_field.e_double_field": pyarrow.float64(),
+        })
+
+  def testBuildArraysUsesNullsForUnsetFields(self):
+    columns = self.plugin._GetColumns(ParquetTestStruct)
+    values = [
+        ParquetTestStruct(
+            string_field="foo",
+            uint_field=42,
+            embedded_field=TestEmbeddedStruct(e_double_field=0.5)),
+        ParquetTestStruct(int_field=-1),
+    ]
+
+    arrays = self.plugin._BuildArrays(columns, values)
+    result = {c.name: a.to_pylist() for c, a in zip(columns, arrays)}
+
+    self.assertEqual(result["string_field"], ["foo", None])
+    self.assertEqual(result["uint_field"], [42, None])
+    self.assertEqual(result["int_field"], [None, -1])
+    self.assertEqual(result["embedded_field.e_string_field"], [None, None])
+    self.assertEqual(result["embedded_field.e_double_field"], [0.5, None])
+
+  def testExportedFilenamesAndManifestForValuesOfSameType(self):
+    zip_fd, prefix = self.ProcessValuesToZip({
+        rdf_client_fs.StatEntry: self.STAT_ENTRY_RESPONSES
+    })
+    self.assertEqual(
+        set(zip_fd.namelist()),
+        {"%s/MANIFEST" % prefix,
+         "%s/ExportedFile_from_StatEntry.parquet" % prefix})
+    parsed_manifest = yaml.load(zip_fd.read("%s/MANIFEST" % prefix))
+    self.assertEqual(parsed_manifest,
+                     {"export_stats": {
+                         "StatEntry": {
+                             "ExportedFile": 10
+                         }
+                     }})
+
+  def testExportedRowsForValuesOfSameType(self):
+    zip_fd, prefix = self.ProcessValuesToZip({
+        rdf_client_fs.StatEntry: self.STAT_ENTRY_RESPONSES
+    })
+    table = self.ReadTable(
+        zip_fd.read("%s/ExportedFile_from_StatEntry.parquet" % prefix))
+
+    self.assertEqual(table["metadata.client_urn"],
+                     [str(self.client_id)] * 10)
+    self.assertEqual(table["metadata.source_urn"],
+                     [str(self.results_urn)] * 10)
+    self.assertEqual(
+        table["urn"],
+        [str(self.client_id.Add("/fs/os/foo/bar").Add(str(i)))
+         for i in range(10)])
+    self.assertEqual(table["st_mode"], ["-rw-r-----"] * 10)
+    self.assertEqual(table["st_nlink"], list(range(1, 11)))
+    self.assertEqual(table["st_atime"], [datetime.datetime(2017, 5, 1)] * 10)
+
+  def testWritesOneRowGroupPerBatch(self):
+    self.plugin.ROW_BATCH = 3
+    zip_fd, prefix = self.ProcessValuesToZip({
+        rdf_client_fs.StatEntry: self.STAT_ENTRY_RESPONSES
+    })
+    data = zip_fd.read("%s/ExportedFile_from_StatEntry.parquet" % prefix)
+
+    parquet_file = parquet.ParquetFile(io.BytesIO(data))
+    self.assertEqual(parquet_file.num_row_groups, 4)
+    self.assertEqual(
+        parquet_file.read().to_pydict()["st_nlink"], list(range(1, 11)))
+
+  def testExportedFilenamesAndManifestForValuesOfMultipleTypes(self):
+    zip_fd, prefix = self.ProcessValuesToZip({
+        rdf_client_fs.StatEntry: [
+            rdf_client_fs.StatEntry(
+                pathspec=rdf_paths.PathSpec(path="/foo/bar", pathtype="OS"))
+        ],
+        rdf_client.Process: [rdf_client.Process(pid=42)]
+    })
+    self.assertEqual(
+        set(zip_fd.namelist()), {
+            "%s/MANIFEST" % prefix,
+            "%s/ExportedFile_from_StatEntry.parquet" % prefix,
+            "%s/ExportedProcess_from_Process.parquet" % prefix
+        })
+
+    table = self.ReadTable(
+        zip_fd.read("%s/ExportedProcess_from_Process.parquet" % prefix))
+    self.assertEqual(table["pid"], [42])
+
+  def testHandlingOfNonAsciiCharacters(self):
+    zip_fd, prefix = self.ProcessValuesToZip({
+        rdf_client_fs.StatEntry: [
+            rdf_client_fs.StatEntry(
+                pathspec=rdf_paths.PathSpec(path="/中国新闻网新闻中", pathtype="OS"))
+        ]
+    })
+    table = self.ReadTable(
+        zip_fd.read("%s/ExportedFile_from_StatEntry.parquet" % prefix))
+
+    self.assertEqual(table["urn"],
+                     ["%s" % self.client_id.Add("/fs/os/中国新闻网新闻中")])
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed.")
+class ArrowInstantOutputPluginTest(test_plugins.InstantOutputPluginTestBase):
+  """Tests the Arrow IPC instant output plugin."""
+
+  plugin_cls = getattr(parquet_plugin, "ArrowInstantOutputPlugin", None)
+
+  def testExportedRows(self):
+    self.plugin.ROW_BATCH = 2
+    fd_path = self.ProcessValues({
+        rdf_client.Process: [rdf_client.Process(pid=i) for i in range(5)]
+    })
+    prefix, _ = os.path.splitext(os.path.basename(fd_path))
+    zip_fd = zipfile.ZipFile(fd_path)
+
+    data = zip_fd.read("%s/ExportedProcess_from_Process.arrows" % prefix)
+    reader = pyarrow.ipc.open_stream(pyarrow.py_buffer(data))
+    table = reader.read_all().to_pydict()
+
+    self.assertEqual(table["pid"], list(range(5)))
+    self.assertEqual(table["metadata.client_urn"], [str(self.client_id)] * 5)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
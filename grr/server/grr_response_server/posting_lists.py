@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+"""Compressed posting lists for keyword searches.
+
+A posting list is a sorted set of integer ids, every one of them carrying the
+timestamp of its last update. Ids are grouped into blocks which are stored as
+varint-encoded deltas, so a list costs a few bytes per entry and a search only
+decodes the blocks it actually lands in.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import bisect
+import struct
+
+from builtins import range  # pylint: disable=redefined-builtin
+from future.utils import iteritems
+
+from grr_response_core.lib import utils
+
+
+def _AppendVarint(buf, value):
+  while value >= 0x80:
+    buf.append((value & 0x7f) | 0x80)
+    value >>= 7
+  buf.append(value)
+
+
+def _ReadVarint(buf, pos):
+  result = 0
+  shift = 0
+  while True:
+    byte = buf[pos]
+    pos += 1
+    result |= (byte & 0x7f) << shift
+    if byte < 0x80:
+      return result, pos
+    shift += 7
+
+
+def _EncodeBlock(ids, timestamps):
+  """Encodes a block as id deltas followed by the timestamps."""
+  buf = bytearray()
+  prev = ids[0]
+  for value in ids[1:]:
+    _AppendVarint(buf, value - prev)
+    prev = value
+  for timestamp in timestamps:
+    _AppendVarint(buf, timestamp)
+  return buf
+
+
+def _DecodeBlock(first, count, buf):
+  """Decodes a block produced by _EncodeBlock."""
+  ids = [first]
+  pos = 0
+  value = first
+  for _ in range(count - 1):
+    delta, pos = _ReadVarint(buf, pos)
+    value += delta
+    ids.append(value)
+
+  timestamps = []
+  for _ in range(count):
+    timestamp, pos = _ReadVarint(buf, pos)
+    timestamps.append(timestamp)
+  return ids, timestamps
+
+
+class PostingList(object):
+  """A sorted set of integer ids with a timestamp for every id.
+
+  The first id of every block is kept uncompressed, which allows lookups to
+  gallop over whole blocks without decoding them.
+  """
+
+  BLOCK_SIZE = 128
+
+  def __init__(self):
+    self._firsts = []
+    self._counts = []
+    self._blocks = []
+    self._length = 0
+
+  def __len__(self):
+    return self._length
+
+  def _Decode(self, index):
+    return _DecodeBlock(self._firsts[index], self._counts[index],
+                        self._blocks[index])
+
+  def _Store(self, index, ids, timestamps):
+    """Replaces the block at index, splitting or dropping it as necessary."""
+    if not ids:
+      del self._firsts[index]
+      del self._counts[index]
+      del self._blocks[index]
+      return
+
+    if len(ids) > 2 * self.BLOCK_SIZE:
+      half = len(ids) // 2
+      self._Store(index, ids[:half], timestamps[:half])
+      self._firsts.insert(index + 1, ids[half])
+      self._counts.insert(index + 1, 0)
+      self._blocks.insert(index + 1, bytearray())
+      self._Store(index + 1, ids[half:], timestamps[half:])
+      return
+
+    self._firsts[index] = ids[0]
+    self._counts[index] = len(ids)
+    self._blocks[index] = _EncodeBlock(ids, timestamps)
+
+  def _FindBlock(self, value, lo=0):
+    """Finds the last block at or after lo which may contain value.
+
+    Blocks are skipped with an exponential search starting at lo, so walking
+    the list with increasing values costs O(log(distance)) per step.
+
+    Args:
+      value: An integer id.
+      lo: Index of the block to start the search from.
+
+    Returns:
+      The index of the block or lo - 1 if value precedes block lo.
+    """
+    firsts = self._firsts
+    n = len(firsts)
+    if lo >= n or firsts[lo] > value:
+      return lo - 1
+
+    step = 1
+    hi = lo + 1
+    while hi < n and firsts[hi] <= value:
+      lo = hi
+      hi += step
+      step *= 2
+    return bisect.bisect_right(firsts, value, lo, min(hi, n)) - 1
+
+  def Add(self, value, timestamp):
+    """Adds an id to the list or updates its timestamp."""
+    if not self._blocks:
+      self._firsts.append(value)
+      self._counts.append(1)
+      self._blocks.append(_EncodeBlock([value], [timestamp]))
+      self._length = 1
+      return
+
+    index = max(self._FindBlock(value), 0)
+    ids, timestamps = self._Decode(index)
+    pos = bisect.bisect_left(ids, value)
+    if pos < len(ids) and ids[pos] == value:
+      timestamps[pos] = timestamp
+    else:
+      ids.insert(pos, value)
+      timestamps.insert(pos, timestamp)
+      self._length += 1
+    self._Store(index, ids, timestamps)
+
+  def Remove(self, value):
+    """Removes an id from the list, returns True if it was present."""
+    index = self._FindBlock(value)
+    if index < 0:
+      return False
+
+    ids, timestamps = self._Decode(index)
+    pos = bisect.bisect_left(ids, value)
+    if pos == len(ids) or ids[pos] != value:
+      return False
+
+    del ids[pos]
+    del timestamps[pos]
+    self._length -= 1
+    self._Store(index, ids, timestamps)
+    return True
+
+  def Ids(self, min_timestamp=None):
+    """Returns all ids, optionally only ones updated at min_timestamp or later.
+
+    Args:
+      min_timestamp: If set, an integer timestamp to filter ids by.
+
+    Returns:
+      A sorted list of ids.
+    """
+    result = []
+    for index in range(len(self._blocks)):
+      ids, timestamps = self._Decode(index)
+      if min_timestamp is None:
+        result.extend(ids)
+      else:
+        result.extend(v for v, t in zip(ids, timestamps) if t >= min_timestamp)
+    return result
+
+  def Intersect(self, values, min_timestamp=None):
+    """Returns those of the given ids that are present in this list.
+
+    Args:
+      values: A sorted iterable of ids.
+      min_timestamp: If set, ids updated before this timestamp are treated as
+        absent.
+
+    Returns:
+      A sorted list of ids.
+    """
+    result = []
+    index = -1
+    ids = timestamps = None
+    for value in values:
+      found = self._FindBlock(value, max(index, 0))
+      if found < 0:
+        continue
+      if found != index:
+        index = found
+        ids, timestamps = self._Decode(index)
+
+      pos = bisect.bisect_left(ids, value)
+      if pos == len(ids) or ids[pos] != value:
+        continue
+      if min_timestamp is not None and timestamps[pos] < min_timestamp:
+        continue
+      result.append(value)
+    return result
+
+  def _Serialize(self, buf):
+    _AppendVarint(buf, len(self._blocks))
+    for first, count, block in zip(self._firsts, self._counts, self._blocks):
+      _AppendVarint(buf, first)
+      _AppendVarint(buf, count)
+      _AppendVarint(buf, len(block))
+      buf.extend(block)
+
+  @classmethod
+  def _Deserialize(cls, buf, pos):
+    result = cls()
+    num_blocks, pos = _ReadVarint(buf, pos)
+    for _ in range(num_blocks):
+      first, pos = _ReadVarint(buf, pos)
+      count, pos = _ReadVarint(buf, pos)
+      size, pos = _ReadVarint(buf, pos)
+      result._firsts.append(first)  # pylint: disable=protected-access
+      result._counts.append(count)  # pylint: disable=protected-access
+      result._blocks.append(buf[pos:pos + size])  # pylint: disable=protected-access
+      result._length += count  # pylint: disable=protected-access
+      pos += size
+    return result, pos
+
+
+class Error(Exception):
+  pass
+
+
+class SnapshotFormatError(Error):
+  """Raised when a snapshot can't be read."""
+
+
+class KeywordIndex(object):
+  """Maps keywords to posting lists of string ids.
+
+  String ids (e.g. client ids) are mapped to dense integers in the order they
+  are first seen, which keeps deltas, and therefore the posting lists, small.
+  The index is not thread safe, callers are expected to do their own locking.
+  """
+
+  _SNAPSHOT_MAGIC = b"GRRKWIDX"
+  _SNAPSHOT_VERSION = 1
+
+  def __init__(self):
+    self._postings = {}
+    self._ordinals = {}
+    self._names = []
+
+  def _Ordinal(self, name):
+    try:
+      return self._ordinals[name]
+    except KeyError:
+      ordinal = len(self._names)
+      self._ordinals[name] = ordinal
+      self._names.append(name)
+      return ordinal
+
+  def Add(self, name, keywords, timestamp):
+    """Associates the name with the keywords, as of the given timestamp.
+
+    Args:
+      name: A string id, e.g. a client id.
+      keywords: An iterable of keyword strings.
+      timestamp: An integer timestamp, e.g. microseconds since epoch.
+    """
+    ordinal = self._Ordinal(name)
+    for keyword in keywords:
+      self._postings.setdefault(keyword, PostingList()).Add(ordinal, timestamp)
+
+  def Remove(self, name, keyword):
+    """Removes the association of the name with the keyword."""
+    ordinal = self._ordinals.get(name)
+    postings = self._postings.get(keyword)
+    if ordinal is None or postings is None:
+      return
+
+    postings.Remove(ordinal)
+    if not postings:
+      del self._postings[keyword]
+
+  def Lookup(self, keyword, min_timestamp=None):
+    """Returns names associated with the keyword."""
+    postings = self._postings.get(keyword)
+    if postings is None:
+      return []
+    return [self._names[i] for i in postings.Ids(min_timestamp=min_timestamp)]
+
+  def LookupAll(self, keywords, min_timestamp=None):
+    """Returns names associated with all of the keywords.
+
+    Posting lists are intersected smallest first, so the cost of a query is
+    bounded by its most selective keyword.
+
+    Args:
+      keywords: An iterable of keyword strings.
+      min_timestamp: If set, associations older than this integer timestamp are
+        ignored.
+
+    Returns:
+      A list of names, in no particular order.
+    """
+    postings = []
+    for keyword in set(keywords):
+      posting_list = self._postings.get(keyword)
+      if posting_list is None:
+        return []
+      postings.append(posting_list)
+
+    if not postings:
+      return []
+
+    postings.sort(key=len)
+    candidates = postings[0].Ids(min_timestamp=min_timestamp)
+    for posting_list in postings[1:]:
+      if not candidates:
+        break
+      candidates = posting_list.Intersect(
+          candidates, min_timestamp=min_timestamp)
+
+    return [self._names[i] for i in candidates]
+
+  def WriteSnapshot(self, fd):
+    """Writes the whole index to a file-like object."""
+    buf = bytearray(self._SNAPSHOT_MAGIC)
+    _AppendVarint(buf, self._SNAPSHOT_VERSION)
+
+    _AppendVarint(buf, len(self._names))
+    for name in self._names:
+      encoded = utils.SmartStr(name)
+      _AppendVarint(buf, len(encoded))
+      buf.extend(encoded)
+
+    _AppendVarint(buf, len(self._postings))
+    for keyword, posting_list in iteritems(self._postings):
+      encoded = utils.SmartStr(keyword)
+      _AppendVarint(buf, len(encoded))
+      buf.extend(encoded)
+      posting_list._Serialize(buf)  # pylint: disable=protected-access
+
+    fd.write(struct.pack("<Q", len(buf)))
+    fd.write(bytes(buf))
+
+  @classmethod
+  def ReadSnapshot(cls, fd):
+    """Reads an index written by WriteSnapshot.
+
+    Args:
+      fd: A file-like object.
+
+    Returns:
+      A KeywordIndex instance.
+
+    Raises:
+      SnapshotFormatError: The snapshot is truncated or has an unknown format.
+    """
+    header = fd.read(8)
+    if len(header) != 8:
+      raise SnapshotFormatError("Truncated snapshot header.")
+    size, = struct.unpack("<Q", header)
+    buf = bytearray(fd.read(size))
+    if len(buf) != size:
+      raise SnapshotFormatError("Truncated snapshot.")
+
+    magic_len = len(cls._SNAPSHOT_MAGIC)
+    if bytes(buf[:magic_len]) != cls._SNAPSHOT_MAGIC:
+      raise SnapshotFormatError("Not a keyword index snapshot.")
+
+    try:
+      version, pos = _ReadVarint(buf, magic_len)
+      if version != cls._SNAPSHOT_VERSION:
+        raise SnapshotFormatError("Unsupported snapshot version: %d" % version)
+
+      result = cls()
+      num_names, pos = _ReadVarint(buf, pos)
+      for _ in range(num_names):
+        size, pos = _ReadVarint(buf, pos)
+        result._Ordinal(bytes(buf[pos:pos + size]).decode("utf-8"))
+        pos += size
+
+      num_keywords, pos = _ReadVarint(buf, pos)
+      for _ in range(num_keywords):
+        size, pos = _ReadVarint(buf, pos)
+        keyword = bytes(buf[pos:pos + size]).decode("utf-8")
+        pos += size
+        # pylint: disable=protected-access
+        result._postings[keyword], pos = PostingList._Deserialize(buf, pos)
+        # pylint: enable=protected-access
+    except IndexError:
+      raise SnapshotFormatError("Truncated snapshot.")
+
+    return result
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- mode: python; encoding: utf-8 -*-
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import random
+
+from absl.testing import absltest
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_server import posting_lists
+from grr.test_lib import test_lib
+
+
+class PostingListTest(absltest.TestCase):
+
+  def _Build(self, values, timestamp=1):
+    result = posting_lists.PostingList()
+    for value in values:
+      result.Add(value, timestamp)
+    return result
+
+  def testAddKeepsIdsSorted(self):
+    values = list(range(0, 10000, 3))
+    shuffled = list(values)
+    random.shuffle(shuffled)
+
+    postings = self._Build(shuffled)
+
+    self.assertLen(postings, len(values))
+    self.assertEqual(postings.Ids(), values)
+
+  def testAddUpdatesTimestamp(self):
+    postings = self._Build([1, 2, 3], timestamp=10)
+    postings.Add(2, 20)
+
+    self.assertLen(postings, 3)
+    self.assertEqual(postings.Ids(min_timestamp=15), [2])
+
+  def testRemove(self):
+    postings = self._Build(range(1000))
+
+    self.assertTrue(postings.Remove(500))
+    self.assertFalse(postings.Remove(500))
+    self.assertFalse(postings.Remove(5000))
+    for value in range(1000):
+      if value != 500:
+        postings.Remove(value)
+
+    self.assertEmpty(postings)
+    self.assertEqual(postings.Ids(), [])
+
+  def testIntersect(self):
+    postings = self._Build(range(0, 100000, 2))
+
+    self.assertEqual(
+        postings.Intersect([-1, 0, 1, 4, 99998, 99999, 100000]),
+        [0, 4, 99998])
+    self.assertEqual(postings.Intersect(list(range(1, 100000, 2))), [])
+
+  def testIntersectRespectsTimestamps(self):
+    postings = self._Build(range(10), timestamp=1)
+    postings.Add(4, 5)
+
+    self.assertEqual(postings.Intersect([3, 4, 5], min_timestamp=5), [4])
+
+
+class KeywordIndexTest(absltest.TestCase):
+
+  def setUp(self):
+    super(KeywordIndexTest, self).setUp()
+    self.index = posting_lists.KeywordIndex()
+    self.index.Add("C.0000000000000001", ["host:foo", "label:a", "."], 10)
+    self.index.Add("C.0000000000000002", ["host:bar", "label:a", "."], 10)
+    self.index.Add("C.0000000000000003", ["host:bar", "."], 20)
+
+  def testLookup(self):
+    self.assertItemsEqual(
+        self.index.Lookup("host:bar"),
+        ["C.0000000000000002", "C.0000000000000003"])
+    self.assertEqual(
+        self.index.Lookup("host:bar", min_timestamp=15), ["C.0000000000000003"])
+    self.assertEqual(self.index.Lookup("missing"), [])
+
+  def testLookupAll(self):
+    self.assertEqual(
+        self.index.LookupAll(["label:a", "host:bar"]), ["C.0000000000000002"])
+    self.assertEqual(
+        self.index.LookupAll([".", "host:bar"], min_timestamp=15),
+        ["C.0000000000000003"])
+    self.assertEqual(self.index.LookupAll(["label:a", "missing"]), [])
+    self.assertEqual(self.index.LookupAll([]), [])
+
+  def testRemove(self):
+    self.index.Remove("C.0000000000000002", "label:a")
+    self.index.Remove("C.0000000000000005", "label:a")
+
+    self.assertEqual(self.index.Lookup("label:a"), ["C.0000000000000001"])
+    self.assertEqual(self.index.LookupAll(["label:a", "host:bar"]), [])
+
+  def testSnapshotRoundTrip(self):
+    self.index.Add("C.0000000000000004", ["ಠ_ಠ"], 30)
+    for i in range(1000):
+      self.index.Add("C.%016x" % (i + 100), ["bulk"], i)
+
+    fd = io.BytesIO()
+    self.index.WriteSnapshot(fd)
+    fd.seek(0)
+    restored = posting_lists.KeywordIndex.ReadSnapshot(fd)
+
+    self.assertEqual(restored.Lookup("ಠ_ಠ"), ["C.0000000000000004"])
+    self.assertEqual(
+        restored.LookupAll(["label:a", "host:bar"]), ["C.0000000000000002"])
+    self.assertLen(restored.Lookup("bulk", min_timestamp=500), 500)
+
+    # Ids assigned after a restore must not collide with restored ones.
+    restored.Add("C.0000000000000009", ["host:foo"], 10)
+    self.assertItemsEqual(
+        restored.Lookup("host:foo"),
+        ["C.0000000000000001", "C.0000000000000009"])
+
+  def testSnapshotRejectsGarbage(self):
+    with self.assertRaises(posting_lists.SnapshotFormatError):
+      posting_lists.KeywordIndex.ReadSnapshot(io.BytesIO(b"\x00" * 4))
+
+    fd = io.BytesIO()
+    self.index.WriteSnapshot(fd)
+    with self.assertRaises(posting_lists.SnapshotFormatError):
+      posting_lists.KeywordIndex.ReadSnapshot(io.BytesIO(fd.getvalue()[:-3]))
+
+
+if __name__ == "__main__":
+  flags.StartMain(test_lib.main)
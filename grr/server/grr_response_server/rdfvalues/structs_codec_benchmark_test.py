@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""Compares the performance of the RDFStruct codec backends."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import client as rdf_client
+from grr_response_core.lib.rdfvalues import client_fs as rdf_client_fs
+from grr_response_core.lib.rdfvalues import client_network as rdf_client_network
+from grr_response_core.lib.rdfvalues import flows as rdf_flows
+from grr_response_core.lib.rdfvalues import paths as rdf_paths
+from grr_response_core.lib.rdfvalues import structs as rdf_structs
+from grr_response_server.rdfvalues import objects as rdf_objects
+from grr.test_lib import benchmark_test_lib
+from grr.test_lib import test_lib
+
+
+def _MakeStatEntry():
+  return rdf_client_fs.StatEntry(
+      pathspec=rdf_paths.PathSpec(
+          path="/usr/bin/foo", pathtype=rdf_paths.PathSpec.PathType.OS),
+      st_mode=33261,
+      st_ino=1063090,
+      st_dev=64512,
+      st_nlink=1,
+      st_uid=0,
+      st_gid=0,
+      st_size=12345,
+      st_atime=1336469177,
+      st_mtime=1336129892,
+      st_ctime=1336129892)
+
+
+def _MakeGrrMessage():
+  return rdf_flows.GrrMessage(
+      session_id="aff4:/flows/W:1234",
+      name="GetFileStat",
+      request_id=1,
+      response_id=2,
+      task_id=1234567890,
+      payload=_MakeStatEntry())
+
+
+def _MakeClientSnapshot():
+  client = rdf_objects.ClientSnapshot(client_id="C.0000000000000000")
+  client.os_release = "Ubuntu"
+  client.os_version = "14.4"
+  client.kernel = "4.0.0"
+  client.arch = "x86_64"
+  client.knowledge_base.fqdn = "host.example.com"
+  client.knowledge_base.os = "Linux"
+  client.knowledge_base.users = [
+      rdf_client.User(username="user%d" % i, full_name="User %d" % i)
+      for i in range(10)
+  ]
+  client.interfaces = [
+      rdf_client_network.Interface(
+          ifname="eth%d" % i,
+          mac_address=b"\x01\x02\x03\x04\x05\x06",
+          addresses=[
+              rdf_client_network.NetworkAddress(
+                  address_type="INET", packed_bytes=b"\x7f\x00\x00\x01")
+          ]) for i in range(4)
+  ]
+  client.startup_info.client_info = rdf_client.ClientInformation(
+      client_name="GRR", client_version=3000)
+  client.timestamp = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(1000)
+  return client
+
+
+class StructsCodecBenchmark(benchmark_test_lib.AverageMicroBenchmarks):
+  """Compares the python and compiled RDFStruct codec backends."""
+
+  REPEATS = 1000
+  units = "us"
+
+  SAMPLES = [
+      ("GrrMessage", rdf_flows.GrrMessage, _MakeGrrMessage),
+      ("StatEntry", rdf_client_fs.StatEntry, _MakeStatEntry),
+      ("ClientSnapshot", rdf_objects.ClientSnapshot, _MakeClientSnapshot),
+  ]
+
+  def setUp(self):
+    super(StructsCodecBenchmark, self).setUp()
+    self.addCleanup(rdf_structs.SetCodecBackend, "python")
+
+  def testDecode(self):
+    for name, cls, make_fn in self.SAMPLES:
+      data = make_fn().SerializeToString()
+
+      def Decode(cls=cls, data=data):
+        # Convert every field so nested structs are decoded too.
+        return len(cls.FromSerializedString(data).ToPrimitiveDict())
+
+      for backend in ["python", "compiled"]:
+        rdf_structs.SetCodecBackend(backend)
+        self.TimeIt(Decode, "Decode %s (%s)" % (name, backend))
+
+  def testEncode(self):
+    for name, _, make_fn in self.SAMPLES:
+      # Wire formats are not cached for values set from python, so every call
+      # encodes the whole struct.
+      value = make_fn()
+
+      for backend in ["python", "compiled"]:
+        rdf_structs.SetCodecBackend(backend)
+        self.TimeIt(lambda v=value: len(v.SerializeToString()),
+                    "Encode %s (%s)" % (name, backend))
+
+  def testBackendsProduceSameBytes(self):
+    for _, cls, make_fn in self.SAMPLES:
+      data = make_fn().SerializeToString()
+
+      for backend in ["python", "compiled"]:
+        rdf_structs.SetCodecBackend(backend)
+        value = cls.FromSerializedString(data)
+        value.ToPrimitiveDict()
+        self.assertEqual(value.SerializeToString(), data)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -20,6 +20,18 @@ from grr_response_core.lib.util import precondition
 from grr_response_server import data_store
 
 
+def _EncodeCursor(timestamp, suffix):
+  return "%016x.%06x" % (timestamp, suffix)
+
+
+def _DecodeCursor(cursor):
+  try:
+    timestamp, suffix = cursor.split(".")
+    return int(timestamp, 16), int(suffix, 16)
+  except (AttributeError, ValueError):
+    raise ValueError("Invalid collection cursor: %r" % (cursor,))
+
+
 class SequentialCollection(object):
   """A sequential collection of RDFValues.
 
@@ -31,6 +43,9 @@ class SequentialCollection(object):
   # The type which we store, subclasses must set this to a subclass of RDFValue.
   RDF_TYPE = None
 
+  # The number of records ScanPage returns by default.
+  PAGE_SIZE = 1000
+
   def __init__(self, collection_id):
     precondition.AssertType(collection_id, rdfvalue.RDFURN)
 
@@ -152,6 +167,64 @@ class SequentialCollection(object):
       else:
         yield (timestamp, item)
 
+  def _ScanRaw(self, after_timestamp=None, after_suffix=None,
+               max_records=None):
+    """Scans stored records without decoding them."""
+    return data_store.DB.CollectionScanRawItems(
+        self.collection_id,
+        after_timestamp=after_timestamp,
+        after_suffix=after_suffix,
+        limit=max_records)
+
+  def _DecodeRecord(self, serialized_value, timestamp):
+    rdf_value = self.RDF_TYPE.FromSerializedString(serialized_value)
+    rdf_value.age = timestamp
+    return rdf_value
+
+  def _DecodePage(self, raw_records, page_size):
+    """Decodes (serialized_value, timestamp, suffix) triples into a page."""
+    values = [
+        self._DecodeRecord(serialized_value, timestamp)
+        for serialized_value, timestamp, _ in raw_records
+    ]
+
+    next_cursor = None
+    if page_size is not None and len(raw_records) >= page_size:
+      _, timestamp, suffix = raw_records[-1]
+      next_cursor = _EncodeCursor(timestamp, suffix)
+    return values, next_cursor
+
+  def ScanPage(self, cursor=None, page_size=None):
+    """Reads a page of decoded records.
+
+    Args:
+      cursor: An opaque cursor returned by a previous call to ScanPage or
+        ReadPage. If None, the scan starts at the beginning of the collection.
+      page_size: The maximum number of records to return. Defaults to
+        PAGE_SIZE.
+
+    Returns:
+      A pair (values, next_cursor). values is a list of the stored rdf values
+      ordered by timestamp. next_cursor resumes the scan right after the last
+      returned value and is None once the collection is exhausted.
+
+    Raises:
+      ValueError: The cursor is malformed.
+    """
+    if page_size is None:
+      page_size = self.PAGE_SIZE
+
+    after_timestamp, after_suffix = None, None
+    if cursor is not None:
+      after_timestamp, after_suffix = _DecodeCursor(cursor)
+
+    raw_records = list(
+        self._ScanRaw(
+            after_timestamp=after_timestamp,
+            after_suffix=after_suffix,
+            max_records=page_size))
+    return self._DecodePage(raw_records, page_size)
+
   def MultiResolve(self, records):
     """Lookup multiple values by their record objects."""
     for value, timestamp in data_store.DB.CollectionReadItems(records):
@@ -160,8 +233,8 @@ class SequentialCollection(object):
       yield rdf_value
 
   def __iter__(self):
-    for _, item in self.Scan():
-      yield item
+    for serialized_value, timestamp, _ in self._ScanRaw():
+      yield self._DecodeRecord(serialized_value, timestamp)
 
   def Delete(self):
     pool = data_store.DB.GetMutationPool()
@@ -240,8 +313,14 @@ class IndexedSequentialCollection(SequentialCollection):
   Adds an index to SequentialCollection, making it efficient to find the number
   of records present, and to find a particular record number.
 
-  IMPLEMENTATION NOTE: The index is created lazily, and for records older than
-    INDEX_WRITE_DELAY.
+  Two indexes are kept. The sparse index has a point every INDEX_SPACING records
+  and is read into memory as a whole. The offset index has an entry for every
+  record and is only read one entry at a time, so ReadPage can seek to any
+  record it covers with a single lookup.
+
+  IMPLEMENTATION NOTE: Both indexes are created lazily, as scans pass records
+    older than INDEX_WRITE_DELAY. Record numbers are unknown when records are
+    written, so the background index updater extends them.
   """
 
   # How many records between index entries. Subclasses may change this.  The
@@ -265,6 +344,7 @@ class IndexedSequentialCollection(SequentialCollection):
   def __init__(self, *args, **kwargs):
     super(IndexedSequentialCollection, self).__init__(*args, **kwargs)
     self._index = None
+    self._offset_index_length = None
 
   def _ReadIndex(self):
     if self._index:
@@ -275,6 +355,8 @@ class IndexedSequentialCollection(SequentialCollection):
          suffix) in data_store.DB.CollectionReadIndex(self.collection_id):
       self._index[index] = (ts, suffix)
       self._max_indexed = max(index, self._max_indexed)
+    self._offset_index_length = (
+        data_store.DB.CollectionReadOffsetIndexLength(self.collection_id))
 
   def _MaybeWriteIndex(self, i, ts, mutation_pool):
     """Write index marker i."""
@@ -287,14 +369,35 @@ class IndexedSequentialCollection(SequentialCollection):
         self._index[i] = ts
         self._max_indexed = max(i, self._max_indexed)
 
-  def _IndexedScan(self, i, max_records=None):
-    """Scan records starting with index i."""
+  def _MaybeWriteOffsetIndex(self, i, ts, mutation_pool):
+    """Write the offset index entry of record i."""
+    # The offset index only ever grows at its end, so that its length tells
+    # which records have an entry.
+    if i == self._offset_index_length:
+      if ts[0] < (rdfvalue.RDFDatetime.Now() -
+                  self.INDEX_WRITE_DELAY).AsMicrosecondsSinceEpoch():
+        mutation_pool.CollectionAddOffsetIndex(self.collection_id, i, ts[0],
+                                               ts[1])
+        self._offset_index_length = i + 1
+
+  def _IndexedRawScan(self, i, max_records=None):
+    """Scan serialized records starting with index i.
+
+    Records before i that have to be skipped to reach it are never decoded.
+
+    Args:
+      i: The record number to start at.
+      max_records: The maximum number of records to return.
+
+    Yields:
+      Tuples (record_number, (timestamp, suffix), serialized_value).
+    """
     self._ReadIndex()
 
     # The record number that we will read next.
     idx = 0
     # The timestamp that we will start reading from.
-    start_ts = 0
+    start_ts = (0, 0)
     if i >= self._max_indexed:
       start_ts = max((0, 0), (self._index[self._max_indexed][0],
                               self._index[self._max_indexed][1] - 1))
@@ -311,15 +414,73 @@ class IndexedSequentialCollection(SequentialCollection):
     if max_records is not None:
       max_records += i - idx
 
+    offset_index_length = self._offset_index_length
     with data_store.DB.GetMutationPool() as mutation_pool:
-      for (ts, value) in self.Scan(
-          after_timestamp=start_ts,
-          max_records=max_records,
-          include_suffix=True):
-        self._MaybeWriteIndex(idx, ts, mutation_pool)
-        if idx >= i:
-          yield (idx, ts, value)
-        idx += 1
+      try:
+        for serialized_value, timestamp, suffix in self._ScanRaw(
+            after_timestamp=start_ts[0],
+            after_suffix=start_ts[1],
+            max_records=max_records):
+          ts = (timestamp, suffix)
+          self._MaybeWriteIndex(idx, ts, mutation_pool)
+          self._MaybeWriteOffsetIndex(idx, ts, mutation_pool)
+          if idx >= i:
+            yield (idx, ts, serialized_value)
+          idx += 1
+      finally:
+        # Callers may stop iterating early, the length has to be written
+        # together with the entries written so far.
+        if self._offset_index_length != offset_index_length:
+          mutation_pool.CollectionSetOffsetIndexLength(
+              self.collection_id, self._offset_index_length)
+
+  def _IndexedScan(self, i, max_records=None):
+    """Scan records starting with index i."""
+    for idx, ts, serialized_value in self._IndexedRawScan(
+        i, max_records=max_records):
+      yield (idx, ts, self._DecodeRecord(serialized_value, ts[0]))
+
+  def ReadPage(self, offset, count=None):
+    """Reads a page of decoded records starting at record number offset.
+
+    If the offset index covers offset, the page is read with a single index
+    lookup and a single scan of at most count records, no matter how deep the
+    offset is. Otherwise the sparse index is used to seek to offset and the
+    records in between are skipped without decoding them. Such a scan extends
+    the indexes, so later reads are cheaper.
+
+    Args:
+      offset: The record number of the first record to return.
+      count: The maximum number of records to return. Defaults to unlimited.
+
+    Returns:
+      A pair (values, next_cursor), see SequentialCollection.ScanPage.
+      next_cursor can be passed to ScanPage to read the following page without
+      consulting the index again.
+
+    Raises:
+      ValueError: offset or count are negative.
+    """
+    if offset < 0:
+      raise ValueError("Offset needs to be greater than or equal to zero")
+    if count is not None and count < 0:
+      raise ValueError("Count needs to be greater than or equal to zero")
+    if count == 0:
+      return [], None
+
+    ts = data_store.DB.CollectionReadOffsetIndex(self.collection_id, offset)
+    if ts is not None:
+      raw_records = list(
+          self._ScanRaw(
+              after_timestamp=ts[0], after_suffix=ts[1] - 1,
+              max_records=count))
+    else:
+      raw_records = [
+          (serialized_value, ts[0], ts[1])
+          for _, ts, serialized_value in self._IndexedRawScan(
+              offset, max_records=count)
+      ]
+    return self._DecodePage(raw_records, count)
 
   def GenerateItems(self, offset=0):
     for (_, _, value) in self._IndexedScan(offset):
@@ -336,7 +497,7 @@ class IndexedSequentialCollection(SequentialCollection):
   def CalculateLength(self):
     self._ReadIndex()
     highest_index = None
-    for (i, _, _) in self._IndexedScan(self._max_indexed):
+    for (i, _, _) in self._IndexedRawScan(self._max_indexed):
       highest_index = i
     if highest_index is None:
       return 0
@@ -347,7 +508,10 @@ class IndexedSequentialCollection(SequentialCollection):
 
   def UpdateIndex(self):
     self._ReadIndex()
-    for _ in self._IndexedScan(self._max_indexed):
+    # The offset index may lag behind the sparse one, e.g. for collections
+    # indexed before it existed.
+    for _ in self._IndexedRawScan(
+        min(self._max_indexed, self._offset_index_length)):
       pass
 
   @classmethod
@@ -397,6 +561,10 @@ class GeneralIndexedCollection(IndexedSequentialCollection):
                                         self).Scan(**kwargs):
       yield (timestamp, rdf_value.payload)
 
+  def _DecodeRecord(self, serialized_value, timestamp):
+    return super(GeneralIndexedCollection, self)._DecodeRecord(
+        serialized_value, timestamp).payload
+
 
 class GrrMessageCollection(IndexedSequentialCollection):
   """Sequential HuntResultCollection."""
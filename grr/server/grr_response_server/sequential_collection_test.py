@@ -98,6 +98,29 @@ class SequentialCollectionTest(aff4_test_lib.AFF4ObjectTest):
     for _ in collection.Scan():
       self.fail("Deleted and recreated SequentialCollection should be empty")
 
+  def testScanPage(self):
+    collection = self._TestCollection("aff4:/sequential_collection/testScanPage")
+    with data_store.DB.GetMutationPool() as pool:
+      for i in range(25):
+        collection.Add(rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+    values = []
+    cursor = None
+    while True:
+      page, cursor = collection.ScanPage(cursor=cursor, page_size=10)
+      self.assertLessEqual(len(page), 10)
+      values.extend(page)
+      if cursor is None:
+        break
+
+    self.assertEqual(values, list(range(25)))
+
+  def testScanPageRejectsInvalidCursor(self):
+    collection = self._TestCollection(
+        "aff4:/sequential_collection/testScanPageRejectsInvalidCursor")
+    with self.assertRaises(ValueError):
+      collection.ScanPage(cursor="not a cursor")
+
 
 class TestIndexedSequentialCollection(
     sequential_collection.IndexedSequentialCollection):
@@ -249,12 +272,137 @@ class IndexedSequentialCollectionTest(aff4_test_lib.AFF4ObjectTest):
             collection.Add(rdfvalue.RDFInteger(i), mutation_pool=pool))
 
     with test_lib.Instrument(sequential_collection.SequentialCollection,
-                             "Scan") as scan:
+                             "_ScanRaw") as scan:
       self.assertEqual(len(list(collection)), 100)
       # Listing should be done using a single scan but there is another one
       # for calculating the length.
       self.assertEqual(scan.call_count, 2)
 
+  def testReadPage(self):
+    spacing = 10
+    with utils.Stubber(sequential_collection.IndexedSequentialCollection,
+                       "INDEX_SPACING", spacing):
+      urn = "aff4:/sequential_collection/testReadPage"
+      collection = self._TestCollection(urn)
+      data_size = 5 * spacing
+      with data_store.DB.GetMutationPool() as pool:
+        for i in range(data_size):
+          collection.StaticAdd(
+              rdfvalue.RDFURN(urn), rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+      with test_lib.FakeTime(rdfvalue.RDFDatetime.Now() +
+                             rdfvalue.Duration("10m")):
+        collection.UpdateIndex()
+
+        collection = self._TestCollection(urn)
+        page, cursor = collection.ReadPage(23, 5)
+        self.assertEqual(page, list(range(23, 28)))
+
+        # The cursor continues right after the page.
+        page, cursor = collection.ScanPage(cursor=cursor, page_size=100)
+        self.assertEqual(page, list(range(28, data_size)))
+        self.assertIsNone(cursor)
+
+        page, cursor = collection.ReadPage(data_size - 2, 5)
+        self.assertEqual(page, [data_size - 2, data_size - 1])
+        self.assertIsNone(cursor)
+
+        page, cursor = collection.ReadPage(data_size + 10, 5)
+        self.assertEqual(page, [])
+        self.assertIsNone(cursor)
+
+  def testReadPageDoesNotDecodeSkippedRecords(self):
+    spacing = 10
+    with utils.Stubber(sequential_collection.IndexedSequentialCollection,
+                       "INDEX_SPACING", spacing):
+      urn = "aff4:/sequential_collection/testReadPageDoesNotDecode"
+      collection = self._TestCollection(urn)
+      with data_store.DB.GetMutationPool() as pool:
+        for i in range(3 * spacing):
+          collection.StaticAdd(
+              rdfvalue.RDFURN(urn), rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+      with test_lib.Instrument(sequential_collection.SequentialCollection,
+                               "_DecodeRecord") as decode:
+        page, _ = collection.ReadPage(2 * spacing + 5, 3)
+        self.assertEqual(page, [25, 26, 27])
+        self.assertEqual(decode.call_count, 3)
+
+  def testUpdateIndexWritesOffsetIndex(self):
+    urn = "aff4:/sequential_collection/testUpdateIndexWritesOffsetIndex"
+    collection = self._TestCollection(urn)
+    with data_store.DB.GetMutationPool() as pool:
+      for i in range(25):
+        collection.StaticAdd(
+            rdfvalue.RDFURN(urn), rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+    # It is too soon to index the records.
+    collection.UpdateIndex()
+    self.assertEqual(
+        data_store.DB.CollectionReadOffsetIndexLength(rdfvalue.RDFURN(urn)), 0)
+
+    with test_lib.FakeTime(rdfvalue.RDFDatetime.Now() +
+                           rdfvalue.Duration("10m")):
+      collection.UpdateIndex()
+
+    self.assertEqual(
+        data_store.DB.CollectionReadOffsetIndexLength(rdfvalue.RDFURN(urn)), 25)
+    records = list(collection._ScanRaw())
+    for i, (_, timestamp, suffix) in enumerate(records):
+      self.assertEqual(
+          data_store.DB.CollectionReadOffsetIndex(rdfvalue.RDFURN(urn), i),
+          (timestamp, suffix))
+    self.assertIsNone(
+        data_store.DB.CollectionReadOffsetIndex(rdfvalue.RDFURN(urn), 25))
+
+  def testReadPageSeeksThroughOffsetIndex(self):
+    spacing = 10
+    with utils.Stubber(sequential_collection.IndexedSequentialCollection,
+                       "INDEX_SPACING", spacing):
+      urn = "aff4:/sequential_collection/testReadPageSeeksThroughOffsetIndex"
+      collection = self._TestCollection(urn)
+      data_size = 5 * spacing
+      with data_store.DB.GetMutationPool() as pool:
+        for i in range(data_size):
+          collection.StaticAdd(
+              rdfvalue.RDFURN(urn), rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+      with test_lib.FakeTime(rdfvalue.RDFDatetime.Now() +
+                             rdfvalue.Duration("10m")):
+        collection.UpdateIndex()
+
+      collection = self._TestCollection(urn)
+      with test_lib.Instrument(sequential_collection.SequentialCollection,
+                               "_ScanRaw") as scan:
+        page, cursor = collection.ReadPage(3 * spacing + 7, 4)
+
+      self.assertEqual(page, list(range(3 * spacing + 7, 3 * spacing + 11)))
+      self.assertEqual(scan.call_count, 1)
+      self.assertEqual(scan.kwargs[0]["max_records"], 4)
+      # The sparse index was not needed.
+      self.assertIsNone(collection._index)
+
+      page, cursor = collection.ScanPage(cursor=cursor, page_size=100)
+      self.assertEqual(page, list(range(3 * spacing + 11, data_size)))
+
+  def testOffsetIndexIsDeletedWithCollection(self):
+    urn = "aff4:/sequential_collection/testOffsetIndexIsDeletedWithCollection"
+    collection = self._TestCollection(urn)
+    with data_store.DB.GetMutationPool() as pool:
+      for i in range(5):
+        collection.StaticAdd(
+            rdfvalue.RDFURN(urn), rdfvalue.RDFInteger(i), mutation_pool=pool)
+
+    with test_lib.FakeTime(rdfvalue.RDFDatetime.Now() +
+                           rdfvalue.Duration("10m")):
+      collection.UpdateIndex()
+    collection.Delete()
+
+    self.assertEqual(
+        data_store.DB.CollectionReadOffsetIndexLength(rdfvalue.RDFURN(urn)), 0)
+    self.assertIsNone(
+        data_store.DB.CollectionReadOffsetIndex(rdfvalue.RDFURN(urn), 0))
+
   def testAutoIndexing(self):
 
     indexing_done = threading.Event()
@@ -84,6 +84,8 @@ def GetMetadata():
       stats_utils.CreateCounterMetadata("grr_well_known_flow_requests"),
       stats_utils.CreateCounterMetadata("flow_starts", fields=[("flow", str)]),
       stats_utils.CreateCounterMetadata("flow_errors", fields=[("flow", str)]),
+      stats_utils.CreateEventMetadata(
+          "flow_state_method_latency", fields=[("flow", str), ("state", str)]),
       stats_utils.CreateCounterMetadata(
           "flow_completions", fields=[("flow", str)]),
       stats_utils.CreateCounterMetadata(
@@ -138,6 +140,9 @@ def GetMetadata():
           "frontend_inactive_request_count", fields=[("source", str)]),
       stats_utils.CreateEventMetadata(
           "frontend_request_latency", fields=[("source", str)]),
+      stats_utils.CreateGaugeMetadata("frontend_decoding_queue_depth", int),
+      stats_utils.CreateEventMetadata(
+          "frontend_decoding_latency", fields=[("stage", str)]),
       stats_utils.CreateEventMetadata("grr_frontendserver_handle_time"),
       stats_utils.CreateCounterMetadata("grr_frontendserver_handle_num"),
       stats_utils.CreateGaugeMetadata("grr_frontendserver_client_cache_size",
@@ -15,7 +15,8 @@ from grr_response_core.lib import registry
 from grr_response_core.lib.local import plugins
 # pylint: enable=unused-import
 from grr_response_core.lib.parsers import all as all_parsers
-from grr_response_core.stats import default_stats_collector
+from grr_response_core.lib.rdfvalues import structs as rdf_structs
+from grr_response_core.stats import sharded_stats_collector
 from grr_response_core.stats import stats_collector_instance
 from grr_response_server import server_logging
 from grr_response_server import server_metrics
@@ -67,9 +68,11 @@ def Init():
     syslog_logger.exception("Died during config initialization")
     raise
 
+  rdf_structs.SetCodecBackend(config.CONFIG["Server.rdf_struct_codec"])
+
   metric_metadata = server_metrics.GetMetadata()
   metric_metadata.extend(communicator.GetMetricMetadata())
-  stats_collector = default_stats_collector.DefaultStatsCollector(
+  stats_collector = sharded_stats_collector.ShardedStatsCollector(
       metric_metadata)
   stats_collector_instance.Set(stats_collector)
 
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+"""A client cache shared by all frontend processes on a host.
+
+Every frontend process keeps its own in-memory caches of client public keys.
+After a restart these caches are empty and every polling client causes a data
+store read, and several frontend processes on the same host all hold copies of
+the same keys.
+
+The SharedClientCache keeps client public keys and the last clock and ping
+times seen from each client in an SQLite database that all frontend processes
+on a host open. Placed on a memory backed file system (e.g. /dev/shm) lookups
+never touch the disk. The database is periodically copied to a snapshot file on
+persistent storage from which it is restored if it is missing, e.g. after the
+host was rebooted, so a restarted frontend does not have to fetch every key
+from the data store again.
+
+Ping times are written on every client poll, so they are buffered in memory and
+written to the database in batches by a background thread, which also writes
+the snapshots. The database and the snapshot hold client keys and are only
+readable by their owner.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+import os
+import shutil
+import threading
+
+import sqlite3
+
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import crypto as rdf_crypto
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+  client_id TEXT PRIMARY KEY,
+  public_key BLOB,
+  last_clock INTEGER,
+  last_ping INTEGER,
+  last_update INTEGER NOT NULL
+)
+"""
+
+
+def _CreatePrivateFile(path):
+  """Creates an empty file only its owner can access, unless it exists."""
+  fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+  os.close(fd)
+
+
+def _Now():
+  return rdfvalue.RDFDatetime.Now().AsSecondsSinceEpoch()
+
+
+class SharedClientCache(object):
+  """A host-wide cache of client public keys and ping metadata."""
+
+  def __init__(self,
+               path,
+               snapshot_path=None,
+               snapshot_interval=None,
+               max_size=1000000,
+               flush_interval=None,
+               max_ping_age=None):
+    """Constructor.
+
+    Args:
+      path: The path of the shared cache database.
+      snapshot_path: If given, the path of the snapshot file used to restore a
+        missing cache database.
+      snapshot_interval: An rdfvalue.Duration. If given together with
+        snapshot_path, the cache is written to the snapshot file this often.
+      max_size: When a snapshot is written, the least recently updated entries
+        above this number are removed from the cache.
+      flush_interval: An rdfvalue.Duration. If given, buffered ping times are
+        written to the database and due snapshots are taken this often by a
+        background thread. Otherwise this only happens on `Flush`.
+      max_ping_age: An rdfvalue.Duration. If given, ping metadata of clients
+        that were last seen longer ago than this is treated as missing, so
+        replay checks fall back to the data store instead of a stale clock.
+    """
+    self.path = path
+    self.snapshot_path = snapshot_path
+    self.snapshot_interval = snapshot_interval
+    self.max_size = max_size
+    self.flush_interval = flush_interval
+    self.max_ping_age = max_ping_age
+
+    self._local = threading.local()
+    self._snapshot_lock = threading.Lock()
+    self._last_snapshot_time = rdfvalue.RDFDatetime.Now()
+
+    # Maps client ids to (last_clock, last_ping) tuples not written yet.
+    self._pending_pings = {}
+    self._pending_lock = threading.Lock()
+
+    if snapshot_path and not os.path.exists(path):
+      self._RestoreSnapshot()
+
+    _CreatePrivateFile(path)
+    connection = self._GetConnection()
+    # WAL mode allows the frontend processes to read while one of them writes.
+    connection.execute("PRAGMA journal_mode=WAL")
+    with connection:
+      connection.execute(_SCHEMA)
+
+    self._stopped = threading.Event()
+    self._flush_thread = None
+    if flush_interval:
+      self._flush_thread = threading.Thread(
+          name="SharedClientCacheFlusher", target=self._FlushLoop)
+      self._flush_thread.daemon = True
+      self._flush_thread.start()
+
+  def _GetConnection(self):
+    """Returns the database connection for the current thread."""
+    connection = getattr(self._local, "connection", None)
+    if connection is None:
+      connection = sqlite3.connect(self.path, timeout=10)
+      self._local.connection = connection
+    return connection
+
+  def _RestoreSnapshot(self):
+    """Initializes the cache database from the snapshot, if there is one."""
+    if not os.path.exists(self.snapshot_path):
+      return
+
+    # Several frontends may start at the same time. The database is copied
+    # under a temporary name and only linked into place if no other process
+    # was faster.
+    tmp_path = "%s.%d.tmp" % (self.path, os.getpid())
+    try:
+      _CreatePrivateFile(tmp_path)
+      shutil.copyfile(self.snapshot_path, tmp_path)
+      os.link(tmp_path, self.path)
+      logging.info("Restored shared client cache %s from %s.", self.path,
+                   self.snapshot_path)
+    except (IOError, OSError) as e:
+      logging.warning("Unable to restore shared client cache from %s: %s",
+                      self.snapshot_path, e)
+    finally:
+      if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+
+  def WriteSnapshot(self):
+    """Writes the current cache contents to the snapshot file."""
+    if not self.snapshot_path:
+      return
+
+    with self._snapshot_lock:
+      connection = self._GetConnection()
+      with connection:
+        connection.execute(
+            "DELETE FROM clients WHERE client_id NOT IN ("
+            "SELECT client_id FROM clients "
+            "ORDER BY last_update DESC LIMIT ?)", (self.max_size,))
+
+      tmp_path = "%s.%d.tmp" % (self.snapshot_path, os.getpid())
+      if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+
+      _CreatePrivateFile(tmp_path)
+      snapshot = sqlite3.connect(tmp_path)
+      try:
+        with snapshot:
+          snapshot.execute(_SCHEMA)
+          snapshot.executemany(
+              "INSERT INTO clients VALUES (?, ?, ?, ?, ?)",
+              connection.execute("SELECT client_id, public_key, last_clock, "
+                                 "last_ping, last_update FROM clients"))
+      finally:
+        snapshot.close()
+
+      os.rename(tmp_path, self.snapshot_path)
+      self._last_snapshot_time = rdfvalue.RDFDatetime.Now()
+
+  def _MaybeWriteSnapshot(self):
+    if not self.snapshot_path or not self.snapshot_interval:
+      return
+
+    if (rdfvalue.RDFDatetime.Now() - self._last_snapshot_time <
+        self.snapshot_interval):
+      return
+
+    self.WriteSnapshot()
+
+  def _FlushLoop(self):
+    while not self._stopped.wait(self.flush_interval.seconds):
+      try:
+        self.Flush()
+        self._MaybeWriteSnapshot()
+      except (IOError, OSError, sqlite3.Error) as e:
+        logging.warning("Unable to flush shared client cache: %s", e)
+
+  def Flush(self):
+    """Writes the buffered ping times to the database."""
+    with self._pending_lock:
+      pings = self._pending_pings
+      self._pending_pings = {}
+
+    if not pings:
+      return
+
+    now = _Now()
+    connection = self._GetConnection()
+    with connection:
+      connection.executemany(
+          "INSERT OR IGNORE INTO clients (client_id, last_update) "
+          "VALUES (?, ?)", [(client_id, now) for client_id in pings])
+      connection.executemany(
+          "UPDATE clients SET last_clock = ?, last_ping = ?, last_update = ? "
+          "WHERE client_id = ?",
+          [(last_clock, last_ping, now, client_id)
+           for client_id, (last_clock, last_ping) in pings.items()])
+
+  def Stop(self):
+    """Stops the background thread and writes the buffered ping times."""
+    self._stopped.set()
+    if self._flush_thread is not None:
+      self._flush_thread.join()
+      self._flush_thread = None
+    self.Flush()
+
+  def _Upsert(self, client_id, **values):
+    """Updates the given columns of a client's row, creating it if needed."""
+    now = _Now()
+    connection = self._GetConnection()
+    with connection:
+      connection.execute(
+          "INSERT OR IGNORE INTO clients (client_id, last_update) "
+          "VALUES (?, ?)", (client_id, now))
+      assignments = ", ".join("%s = ?" % column for column in sorted(values))
+      connection.execute(
+          "UPDATE clients SET %s, last_update = ? WHERE client_id = ?" %
+          assignments,
+          [values[column] for column in sorted(values)] + [now, client_id])
+
+  def GetPublicKey(self, client_id):
+    """Returns the cached public key of a client.
+
+    Args:
+      client_id: The client id, e.g. "C.1234567890123456".
+
+    Returns:
+      An rdf_crypto.RSAPublicKey.
+
+    Raises:
+      KeyError: If the key of the client is not cached.
+    """
+    row = self._GetConnection().execute(
+        "SELECT public_key FROM clients WHERE client_id = ?",
+        (client_id,)).fetchone()
+    if row is None or row[0] is None:
+      raise KeyError(client_id)
+
+    return rdf_crypto.RSAPublicKey(bytes(row[0]))
+
+  def PutPublicKey(self, client_id, public_key):
+    self._Upsert(
+        client_id, public_key=sqlite3.Binary(public_key.SerializeToString()))
+
+  def GetPingMetadata(self, client_id):
+    """Returns the last clock and ping times cached for a client.
+
+    Args:
+      client_id: The client id, e.g. "C.1234567890123456".
+
+    Returns:
+      A tuple (last_clock, last_ping) of rdfvalue.RDFDatetime objects.
+
+    Raises:
+      KeyError: If no ping of the client is cached or the last cached ping is
+        older than `max_ping_age`.
+    """
+    with self._pending_lock:
+      row = self._pending_pings.get(client_id)
+
+    if row is None:
+      row = self._GetConnection().execute(
+          "SELECT last_clock, last_ping FROM clients WHERE client_id = ?",
+          (client_id,)).fetchone()
+    if row is None or row[1] is None:
+      raise KeyError(client_id)
+
+    last_clock, last_ping = row
+    if last_clock is not None:
+      last_clock = rdfvalue.RDFDatetime(last_clock)
+    last_ping = rdfvalue.RDFDatetime(last_ping)
+
+    if (self.max_ping_age and
+        last_ping < rdfvalue.RDFDatetime.Now() - self.max_ping_age):
+      raise KeyError(client_id)
+
+    return last_clock, last_ping
+
+  def PutPingMetadata(self, client_id, last_clock, last_ping):
+    """Buffers the ping times of a client until the next flush."""
+    with self._pending_lock:
+      self._pending_pings[client_id] = (
+          last_clock.AsMicrosecondsSinceEpoch() if last_clock else None,
+          last_ping.AsMicrosecondsSinceEpoch())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Tests for the shared frontend client cache."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import time
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_core.lib import rdfvalue
+from grr_response_core.lib.rdfvalues import crypto as rdf_crypto
+from grr_response_server import shared_client_cache
+from grr.test_lib import test_lib
+
+
+class SharedClientCacheTest(test_lib.GRRBaseTest):
+
+  def setUp(self):
+    super(SharedClientCacheTest, self).setUp()
+    self.path = os.path.join(self.temp_dir, "cache.sqlite")
+    self.snapshot_path = os.path.join(self.temp_dir, "snapshot.sqlite")
+    self.public_key = rdf_crypto.RSAPrivateKey.GenerateKey(
+        bits=1024).GetPublicKey()
+
+  def testPublicKeysAreSharedBetweenInstances(self):
+    cache = shared_client_cache.SharedClientCache(self.path)
+    with self.assertRaises(KeyError):
+      cache.GetPublicKey("C.1000000000000000")
+
+    cache.PutPublicKey("C.1000000000000000", self.public_key)
+
+    other_cache = shared_client_cache.SharedClientCache(self.path)
+    self.assertEqual(
+        other_cache.GetPublicKey("C.1000000000000000").SerializeToString(),
+        self.public_key.SerializeToString())
+
+  def testPingMetadata(self):
+    cache = shared_client_cache.SharedClientCache(self.path)
+    cache.PutPublicKey("C.1000000000000000", self.public_key)
+    # A cached key alone does not mean we have seen a ping.
+    with self.assertRaises(KeyError):
+      cache.GetPingMetadata("C.1000000000000000")
+
+    clock = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(1000)
+    ping = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(2000)
+    cache.PutPingMetadata("C.1000000000000000", clock, ping)
+
+    self.assertEqual(
+        cache.GetPingMetadata("C.1000000000000000"), (clock, ping))
+    # Updating the ping times keeps the public key.
+    self.assertEqual(
+        cache.GetPublicKey("C.1000000000000000").SerializeToString(),
+        self.public_key.SerializeToString())
+
+  def testPingMetadataIsSharedAfterFlush(self):
+    cache = shared_client_cache.SharedClientCache(self.path)
+    other_cache = shared_client_cache.SharedClientCache(self.path)
+
+    clock = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(1000)
+    ping = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(2000)
+    cache.PutPingMetadata("C.1000000000000000", clock, ping)
+    with self.assertRaises(KeyError):
+      other_cache.GetPingMetadata("C.1000000000000000")
+
+    cache.Flush()
+    self.assertEqual(
+        other_cache.GetPingMetadata("C.1000000000000000"), (clock, ping))
+
+  def testPingMetadataIsFlushedInBackground(self):
+    cache = shared_client_cache.SharedClientCache(
+        self.path, flush_interval=rdfvalue.Duration("1s"))
+    other_cache = shared_client_cache.SharedClientCache(self.path)
+    try:
+      clock = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(1000)
+      ping = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(2000)
+      cache.PutPingMetadata("C.1000000000000000", clock, ping)
+
+      for _ in range(50):
+        try:
+          other_cache.GetPingMetadata("C.1000000000000000")
+          break
+        except KeyError:
+          time.sleep(0.1)
+
+      self.assertEqual(
+          other_cache.GetPingMetadata("C.1000000000000000"), (clock, ping))
+    finally:
+      cache.Stop()
+
+  def testOldPingMetadataIsIgnored(self):
+    cache = shared_client_cache.SharedClientCache(
+        self.path, max_ping_age=rdfvalue.Duration("10m"))
+
+    clock = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(1000)
+    ping = rdfvalue.RDFDatetime.FromSecondsSinceEpoch(2000)
+    cache.PutPingMetadata("C.1000000000000000", clock, ping)
+
+    with test_lib.FakeTime(2000 + 9 * 60):
+      self.assertEqual(
+          cache.GetPingMetadata("C.1000000000000000"), (clock, ping))
+    with test_lib.FakeTime(2000 + 11 * 60):
+      with self.assertRaises(KeyError):
+        cache.GetPingMetadata("C.1000000000000000")
+
+  def testFilesAreOnlyAccessibleByOwner(self):
+    cache = shared_client_cache.SharedClientCache(
+        self.path, snapshot_path=self.snapshot_path)
+    cache.PutPublicKey("C.1000000000000000", self.public_key)
+    cache.WriteSnapshot()
+
+    self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+    self.assertEqual(os.stat(self.snapshot_path).st_mode & 0o777, 0o600)
+
+  def testMissingCacheIsRestoredFromSnapshot(self):
+    cache = shared_client_cache.SharedClientCache(
+        self.path, snapshot_path=self.snapshot_path)
+    cache.PutPublicKey("C.1000000000000000", self.public_key)
+    cache.WriteSnapshot()
+
+    # Simulate a reboot which wipes the memory backed file system.
+    for suffix in ["", "-wal", "-shm"]:
+      if os.path.exists(self.path + suffix):
+        os.unlink(self.path + suffix)
+
+    restored_cache = shared_client_cache.SharedClientCache(
+        self.path, snapshot_path=self.snapshot_path)
+    self.assertEqual(
+        restored_cache.GetPublicKey("C.1000000000000000").SerializeToString(),
+        self.public_key.SerializeToString())
+
+  def testSnapshotDropsLeastRecentlyUpdatedEntries(self):
+    cache = shared_client_cache.SharedClientCache(
+        self.path, snapshot_path=self.snapshot_path, max_size=1)
+
+    with test_lib.FakeTime(1000):
+      cache.PutPublicKey("C.1000000000000000", self.public_key)
+    with test_lib.FakeTime(2000):
+      cache.PutPublicKey("C.2000000000000000", self.public_key)
+    cache.WriteSnapshot()
+
+    with self.assertRaises(KeyError):
+      cache.GetPublicKey("C.1000000000000000")
+    cache.GetPublicKey("C.2000000000000000")
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Runs functions in Python processes started from a fresh interpreter.
+
+On Python 2 multiprocessing can only fork its worker processes. Forking a
+process that already runs threads is unsafe: the child inherits the locks those
+threads held at the time of the fork and deadlocks as soon as it takes one of
+them. A SpawnedProcess starts a new interpreter running this module instead and
+sends it the functions to call over a pipe.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import importlib
+import os
+import pickle
+import subprocess
+import sys
+
+
+class Error(Exception):
+  """Base class for spawned process errors."""
+
+
+class ProcessDiedError(Error):
+  """Raised when the process can't be talked to anymore."""
+
+
+class SpawnedProcess(object):
+  """A Python process that runs module level functions sent to it.
+
+  Calls are run one after another in the order they were submitted. Arguments
+  and results have to be picklable.
+  """
+
+  def __init__(self):
+    self._process = subprocess.Popen([sys.executable, "-m", __name__],
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     close_fds=True)
+
+  @property
+  def pid(self):
+    return self._process.pid
+
+  def Submit(self, fn, *args):
+    """Sends a call of fn(*args) to the process without waiting for it."""
+    try:
+      pickle.dump((fn.__module__, fn.__name__, args), self._process.stdin,
+                  pickle.HIGHEST_PROTOCOL)
+      self._process.stdin.flush()
+    except (EnvironmentError, ValueError) as e:
+      raise ProcessDiedError("Unable to send call to process %d: %s" %
+                             (self.pid, e))
+
+  def Result(self):
+    """Waits for the oldest submitted call and returns its result.
+
+    Returns:
+      The value returned by the function.
+
+    Raises:
+      ProcessDiedError: If the process exited.
+      Exception: Any exception raised by the function.
+    """
+    try:
+      error, result = pickle.load(self._process.stdout)
+    except (EnvironmentError, EOFError, ValueError,
+            pickle.UnpicklingError) as e:
+      raise ProcessDiedError("Unable to read result of process %d: %s" %
+                             (self.pid, e))
+
+    if error is not None:
+      raise error
+    return result
+
+  def Call(self, fn, *args):
+    """Runs fn(*args) in the process and returns the result."""
+    self.Submit(fn, *args)
+    return self.Result()
+
+  def Stop(self):
+    """Stops the process, calls still running are not waited for."""
+    try:
+      self._process.stdin.close()
+    except EnvironmentError:
+      pass
+    if self._process.poll() is None:
+      self._process.kill()
+    self._process.wait()
+    self._process.stdout.close()
+
+
+def _Main():
+  """Runs calls read from stdin until stdin is closed."""
+  # Results are written to the original stdout, anything else printed by the
+  # called functions goes to stderr.
+  input_file = os.fdopen(os.dup(0), "rb")
+  output_file = os.fdopen(os.dup(1), "wb")
+  os.dup2(2, 1)
+
+  while True:
+    try:
+      module_name, fn_name, args = pickle.load(input_file)
+    except EOFError:
+      return
+
+    try:
+      fn = getattr(importlib.import_module(module_name), fn_name)
+      response = (None, fn(*args))
+    except Exception as e:  # pylint: disable=broad-except
+      response = (e, None)
+
+    try:
+      data = pickle.dumps(response, pickle.HIGHEST_PROTOCOL)
+    except Exception as e:  # pylint: disable=broad-except
+      # Classes of this module are only known as __main__ here, so a builtin
+      # exception is sent instead.
+      data = pickle.dumps((RuntimeError("Unable to send result: %s" % e), None),
+                          pickle.HIGHEST_PROTOCOL)
+
+    output_file.write(data)
+    output_file.flush()
+
+
+if __name__ == "__main__":
+  _Main()
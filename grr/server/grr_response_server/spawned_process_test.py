@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Tests for the SpawnedProcess class."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+
+from grr_response_core.lib import flags
+from grr_response_server import spawned_process
+from grr.test_lib import test_lib
+
+
+def _Add(a, b):
+  return a + b
+
+
+def _Raise(message):
+  raise ValueError(message)
+
+
+def _Print():
+  print("Not a result.")
+  return os.getpid()
+
+
+class SpawnedProcessTest(test_lib.GRRBaseTest):
+  """Tests for the SpawnedProcess class."""
+
+  def setUp(self):
+    super(SpawnedProcessTest, self).setUp()
+    self.process = spawned_process.SpawnedProcess()
+    self.addCleanup(self.process.Stop)
+
+  def testRunsFunctionInOtherProcess(self):
+    self.assertEqual(self.process.Call(_Add, 1, 2), 3)
+    self.assertNotEqual(self.process.Call(os.getpid), os.getpid())
+
+  def testReturnsResultsInSubmissionOrder(self):
+    for i in range(5):
+      self.process.Submit(_Add, i, 1)
+    self.assertEqual([self.process.Result() for _ in range(5)], [1, 2, 3, 4, 5])
+
+  def testRaisesExceptionOfFunction(self):
+    with self.assertRaisesRegexp(ValueError, "Some error."):
+      self.process.Call(_Raise, "Some error.")
+
+    # The process keeps running after an error.
+    self.assertEqual(self.process.Call(_Add, 1, 2), 3)
+
+  def testOutputOfFunctionIsNotMistakenForResult(self):
+    self.assertEqual(self.process.Call(_Print), self.process.pid)
+
+  def testRaisesWhenProcessDied(self):
+    self.process._process.kill()
+    self.process._process.wait()
+
+    with self.assertRaises(spawned_process.ProcessDiedError):
+      self.process.Call(_Add, 1, 2)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -20,6 +20,7 @@ from grr_response_core.lib import registry
 from grr_response_core.lib import utils
 from grr_response_core.lib.rdfvalues import stats as rdf_stats
 from grr_response_core.stats import stats_collector_instance
+from grr_response_server import openmetrics
 
 
 def _JSONMetricValue(metric_info, value):
@@ -70,6 +71,10 @@ def BuildVarzJsonString():
   return encoder.encode(results)
 
 
+# Shared by all requests, so that unchanged series are rendered only once.
+_OPENMETRICS_RENDERER = openmetrics.OpenMetricsRenderer()
+
+
 class StatsServerHandler(http_server.BaseHTTPRequestHandler):
   """Default stats server implementation."""
 
@@ -80,6 +85,16 @@ class StatsServerHandler(http_server.BaseHTTPRequestHandler):
       self.end_headers()
 
       self.wfile.write(BuildVarzJsonString())
+    elif self.path == "/metrics":
+      self.send_response(200)
+      self.send_header("Content-type", openmetrics.CONTENT_TYPE)
+      self.end_headers()
+
+      # Metric families are written as soon as they are rendered, the
+      # response is terminated by closing the connection.
+      for chunk in _OPENMETRICS_RENDERER.Render(
+          stats_collector_instance.Get()):
+        self.wfile.write(chunk.encode("utf-8"))
     else:
       self.send_error(403, "Access forbidden: %s" % self.path)
 
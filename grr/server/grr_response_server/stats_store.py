@@ -323,12 +323,11 @@ class StatsStoreDataQuery(object):
   def _TimeSeriesFromData(self, data, attr=None):
     """Build time series from StatsStore data."""
 
-    series = timeseries.Timeseries()
-
+    points = []
     for value, timestamp in data:
       if attr:
         try:
-          series.Append(getattr(value, attr), timestamp)
+          points.append((getattr(value, attr), timestamp))
         except AttributeError:
           raise ValueError(
               "Can't find attribute %s in value %s." % (attr, value))
@@ -336,8 +335,10 @@ class StatsStoreDataQuery(object):
         if hasattr(value, "sum") or hasattr(value, "count"):
           raise ValueError(
               "Can't treat complext type as simple value: %s" % value)
-        series.Append(value, timestamp)
+        points.append((value, timestamp))
 
+    series = timeseries.Timeseries()
+    series.MultiAppend(points)
     return series
 
   @property
@@ -1,22 +1,50 @@
 #!/usr/bin/env python
 """Operations on a series of points, indexed by time.
+
+If NumPy is available, the points of numeric series are kept in arrays and the
+operations are vectorized. Otherwise a list based implementation is used.
 """
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
-import copy
+import numbers
 
 from builtins import range  # pylint: disable=redefined-builtin
 
 from grr_response_core.lib import rdfvalue
 
+# pylint: disable=g-import-not-at-top
+try:
+  import numpy as np
+except ImportError:
+  np = None
+# pylint: enable=g-import-not-at-top
+
 NORMALIZE_MODE_GAUGE = 1
 NORMALIZE_MODE_COUNTER = 2
 
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
+
+
+def _NormalizeTime(time):
+  """Normalize a time to be an int measured in microseconds."""
+  if time is None:
+    return None
+  if isinstance(time, rdfvalue.RDFDatetime):
+    return time.AsMicrosecondsSinceEpoch()
+  if isinstance(time, rdfvalue.Duration):
+    return time.microseconds
+  return int(time)
+
+
+class _ListTimeseries(object):
+  """Timeseries contains a sequence of points, each with a timestamp.
 
-class Timeseries(object):
-  """Timeseries contains a sequence of points, each with a timestamp."""
+  The points are stored as a list of [value, timestamp] lists. Used if NumPy is
+  not available.
+  """
 
   def __init__(self, initializer=None):
     """Create a timeseries with an optional initializer.
@@ -30,19 +58,11 @@ class Timeseries(object):
     if initializer is None:
       self.data = []
       return
-    if isinstance(initializer, Timeseries):
-      self.data = copy.deepcopy(initializer.data)
+    if isinstance(initializer, _ListTimeseries):
+      self.data = [list(p) for p in initializer.data]
       return
     raise RuntimeError("Unrecognized initializer.")
 
-  def _NormalizeTime(self, time):
-    """Normalize a time to be an int measured in microseconds."""
-    if isinstance(time, rdfvalue.RDFDatetime):
-      return time.AsMicrosecondsSinceEpoch()
-    if isinstance(time, rdfvalue.Duration):
-      return time.microseconds
-    return int(time)
-
   def Append(self, value, timestamp):
     """Adds value at timestamp.
 
@@ -56,7 +76,7 @@ class Timeseries(object):
       RuntimeError: If timestamp is smaller than the previous timstamp.
     """
 
-    timestamp = self._NormalizeTime(timestamp)
+    timestamp = _NormalizeTime(timestamp)
     if self.data and timestamp < self.data[-1][1]:
       raise RuntimeError("Next timestamp must be larger.")
     self.data.append([value, timestamp])
@@ -80,8 +100,8 @@ class Timeseries(object):
       stop_time: If set, timestamps at or past stop_time will be dropped.
     """
 
-    start_time = self._NormalizeTime(start_time)
-    stop_time = self._NormalizeTime(stop_time)
+    start_time = _NormalizeTime(start_time)
+    stop_time = _NormalizeTime(stop_time)
     self.data = [
         p for p in self.data
         if (start_time is None or p[1] >= start_time) and
@@ -121,9 +141,9 @@ class Timeseries(object):
       RuntimeError: In case the sequence timestamps are misordered.
 
     """
-    period = self._NormalizeTime(period)
-    start_time = self._NormalizeTime(start_time)
-    stop_time = self._NormalizeTime(stop_time)
+    period = _NormalizeTime(period)
+    start_time = _NormalizeTime(start_time)
+    stop_time = _NormalizeTime(stop_time)
     if not self.data:
       return
 
@@ -227,3 +247,381 @@ class Timeseries(object):
     # TODO(hanuszczak): Why do we return a floored division result instead of
     # the exact value?
     return sum(values) // len(values)
+
+
+def _ValuesToArrays(values):
+  """Converts a list of values into a values array and a missing values mask.
+
+  Args:
+    values: A list of values, None marking a missing one.
+
+  Returns:
+    A tuple with an array of the values (int64 if all the values are integers,
+    float64 otherwise) and a boolean array marking the missing ones, or None if
+    some values are not numbers that fit into these types.
+  """
+  present = [v for v in values if v is not None]
+  if all(isinstance(v, numbers.Integral) for v in present):
+    if any(v < _INT64_MIN or v > _INT64_MAX for v in present):
+      return None
+    dtype = np.int64
+  elif all(isinstance(v, numbers.Real) for v in present):
+    dtype = np.float64
+  else:
+    return None
+
+  missing = np.array([v is None for v in values], dtype=np.bool_)
+  values = np.array([0 if v is None else v for v in values], dtype=dtype)
+  return values, missing
+
+
+class _ArrayTimeseries(object):
+  """Timeseries contains a sequence of points, each with a timestamp.
+
+  Values and timestamps are stored in NumPy arrays, together with a mask of
+  missing values. Integer values are kept as int64, other numbers as float64.
+  Appended points are buffered in a list and only copied into the arrays when
+  the series is read or transformed. A series with values that are not numbers
+  falls back to a _ListTimeseries, to which all operations are delegated.
+  """
+
+  def __init__(self, initializer=None):
+    """Create a timeseries with an optional initializer.
+
+    Args:
+      initializer: An optional Timeseries to clone.
+
+    Raises:
+      RuntimeError: If initializer is not understood.
+    """
+    self._values = np.empty(0, dtype=np.int64)
+    self._missing = np.empty(0, dtype=np.bool_)
+    self._timestamps = np.empty(0, dtype=np.int64)
+    self._appended = []
+    self._list = None
+
+    if initializer is None:
+      return
+    if isinstance(initializer, _ArrayTimeseries):
+      # pylint: disable=protected-access
+      initializer._Consolidate()
+      if initializer._list is not None:
+        self._list = _ListTimeseries(initializer._list)
+        return
+      self._values = initializer._values.copy()
+      self._missing = initializer._missing.copy()
+      self._timestamps = initializer._timestamps.copy()
+      # pylint: enable=protected-access
+      return
+    raise RuntimeError("Unrecognized initializer.")
+
+  def _SwitchToList(self):
+    """Moves all the points into a _ListTimeseries."""
+    self._list = _ListTimeseries()
+    self._list.data = self._ArrayData()
+    self._list.data.extend([v, t] for v, t in self._appended)
+    self._values = self._values[:0]
+    self._missing = self._missing[:0]
+    self._timestamps = self._timestamps[:0]
+    self._appended = []
+
+  def _Extend(self, values, missing, timestamps):
+    self._values = np.concatenate([self._values, values])
+    self._missing = np.concatenate([self._missing, missing])
+    self._timestamps = np.concatenate([self._timestamps, timestamps])
+
+  def _Consolidate(self):
+    """Moves appended points into the arrays."""
+    if not self._appended:
+      return
+
+    arrays = _ValuesToArrays([v for v, _ in self._appended])
+    if arrays is None:
+      self._SwitchToList()
+      return
+
+    values, missing = arrays
+    timestamps = np.array([t for _, t in self._appended], dtype=np.int64)
+    self._Extend(values, missing, timestamps)
+    self._appended = []
+
+  def _ArrayData(self):
+    return [[None if m else v, t] for v, m, t in zip(
+        self._values.tolist(), self._missing.tolist(),
+        self._timestamps.tolist())]
+
+  @property
+  def data(self):
+    """The points of the series as a list of [value, timestamp] lists."""
+    self._Consolidate()
+    if self._list is not None:
+      return self._list.data
+    return self._ArrayData()
+
+  def _LastTimestamp(self):
+    if self._appended:
+      return self._appended[-1][1]
+    if self._timestamps.size:
+      return self._timestamps[-1]
+    return None
+
+  def Append(self, value, timestamp):
+    """Adds value at timestamp.
+
+    Values must be added in order of increasing timestamp.
+
+    Args:
+      value: An observed value.
+      timestamp: The timestamp at which value was observed.
+
+    Raises:
+      RuntimeError: If timestamp is smaller than the previous timstamp.
+    """
+    if self._list is not None:
+      self._list.Append(value, timestamp)
+      return
+
+    timestamp = _NormalizeTime(timestamp)
+    last_timestamp = self._LastTimestamp()
+    if last_timestamp is not None and timestamp < last_timestamp:
+      raise RuntimeError("Next timestamp must be larger.")
+    self._appended.append((value, timestamp))
+
+  def MultiAppend(self, value_timestamp_pairs):
+    """Adds multiple value<->timestamp pairs.
+
+    Args:
+      value_timestamp_pairs: Tuples of (value, timestamp).
+
+    Raises:
+      RuntimeError: If the timestamps are not increasing.
+    """
+    if self._list is not None:
+      self._list.MultiAppend(value_timestamp_pairs)
+      return
+
+    values = []
+    timestamps = []
+    for value, timestamp in value_timestamp_pairs:
+      values.append(value)
+      timestamps.append(_NormalizeTime(timestamp))
+    if not timestamps:
+      return
+
+    timestamps = np.array(timestamps, dtype=np.int64)
+    last_timestamp = self._LastTimestamp()
+    if ((last_timestamp is not None and timestamps[0] < last_timestamp) or
+        np.any(timestamps[1:] < timestamps[:-1])):
+      raise RuntimeError("Next timestamp must be larger.")
+
+    self._Consolidate()
+    arrays = None if self._list is not None else _ValuesToArrays(values)
+    if arrays is None:
+      if self._list is None:
+        self._SwitchToList()
+      self._list.MultiAppend(zip(values, timestamps.tolist()))
+      return
+
+    self._Extend(arrays[0], arrays[1], timestamps)
+
+  def FilterRange(self, start_time=None, stop_time=None):
+    """Filter the series to lie between start_time and stop_time.
+
+    Removes all values of the series which are outside of some time range.
+
+    Args:
+      start_time: If set, timestamps before start_time will be dropped.
+      stop_time: If set, timestamps at or past stop_time will be dropped.
+    """
+    self._Consolidate()
+    if self._list is not None:
+      self._list.FilterRange(start_time, stop_time)
+      return
+
+    start_time = _NormalizeTime(start_time)
+    stop_time = _NormalizeTime(stop_time)
+
+    # Timestamps are sorted, so the range can be found by binary search.
+    start = 0
+    stop = self._timestamps.size
+    if start_time is not None:
+      start = np.searchsorted(self._timestamps, start_time, side="left")
+    if stop_time is not None:
+      stop = np.searchsorted(self._timestamps, stop_time, side="left")
+
+    self._values = self._values[start:stop]
+    self._missing = self._missing[start:stop]
+    self._timestamps = self._timestamps[start:stop]
+
+  def Normalize(self, period, start_time, stop_time, mode=NORMALIZE_MODE_GAUGE):
+    """Normalize the series to have a fixed period over a fixed time range.
+
+    See _ListTimeseries.Normalize for a description of the modes.
+
+    Args:
+      period: The desired time between points. Should be an rdfvalue.Duration or
+        a count of microseconds.
+      start_time: The first timestamp will be at start_time. Should be an
+        rdfvalue.RDFDatetime or a count of microseconds since epoch.
+      stop_time: The last timestamp will be at stop_time - period. Should be an
+        rdfvalue.RDFDatetime or a count of microseconds since epoch.
+      mode: The type of normalization to perform. May be NORMALIZE_MODE_GAUGE or
+        NORMALIZE_MODE_COUNTER.
+
+    Raises:
+      RuntimeError: In case the sequence timestamps are misordered.
+    """
+    self._Consolidate()
+    if self._list is not None:
+      self._list.Normalize(period, start_time, stop_time, mode=mode)
+      return
+
+    period = _NormalizeTime(period)
+    start_time = _NormalizeTime(start_time)
+    stop_time = _NormalizeTime(stop_time)
+    if not self._timestamps.size:
+      return
+
+    self.FilterRange(start_time, stop_time)
+
+    num_buckets = len(range(0, stop_time - start_time, period))
+    buckets = (self._timestamps - start_time) // period
+    values = self._values
+
+    if mode == NORMALIZE_MODE_GAUGE:
+      present = ~self._missing
+      sums = np.bincount(
+          buckets[present], weights=values[present], minlength=num_buckets)
+      counts = np.bincount(buckets[present], minlength=num_buckets)
+      # Averages are floats, like the ones of the list based implementation.
+      normalized = np.zeros(num_buckets, dtype=np.float64)
+      np.divide(sums, counts, out=normalized, where=counts > 0)
+      missing = counts == 0
+    else:
+      present_values = values[~self._missing]
+      if np.any(present_values[1:] < present_values[:-1]):
+        raise RuntimeError("Next value must not be smaller.")
+
+      # The last value seen during or before every bucket.
+      last_indices = np.searchsorted(
+          buckets, np.arange(num_buckets), side="right") - 1
+      seen = last_indices >= 0
+      last_indices = np.maximum(last_indices, 0)
+      if values.size:
+        normalized = values[last_indices]
+        missing = ~seen | self._missing[last_indices]
+      else:
+        normalized = np.zeros(num_buckets, dtype=values.dtype)
+        missing = np.ones(num_buckets, dtype=np.bool_)
+
+    self._values = np.where(missing, 0, normalized).astype(normalized.dtype)
+    self._missing = missing
+    self._timestamps = start_time + np.arange(
+        num_buckets, dtype=np.int64) * period
+
+  def MakeIncreasing(self):
+    """Makes the time series increasing.
+
+    See _ListTimeseries.MakeIncreasing for the assumptions made.
+    """
+    self._Consolidate()
+    if self._list is not None:
+      self._list.MakeIncreasing()
+      return
+
+    if self._timestamps.size < 2:
+      return
+
+    previous = self._values[:-1]
+    # Assume that the counter was only reset once between two points.
+    resets = ((previous > self._values[1:]) & (previous != 0) &
+              ~self._missing[:-1] & ~self._missing[1:])
+    offsets = np.cumsum(np.where(resets, previous, 0))
+    self._values[1:] += np.where(self._missing[1:], 0, offsets).astype(
+        self._values.dtype)
+
+  def ToDeltas(self):
+    """Convert the sequence to the sequence of differences between points.
+
+    The value of each point v[i] is replaced by v[i+1] - v[i], except for the
+    last point which is dropped.
+    """
+    self._Consolidate()
+    if self._list is not None:
+      self._list.ToDeltas()
+      return
+
+    if self._timestamps.size < 2:
+      self._values = self._values[:0]
+      self._missing = self._missing[:0]
+      self._timestamps = self._timestamps[:0]
+      return
+
+    self._missing = self._missing[1:] | self._missing[:-1]
+    self._values = np.where(self._missing, 0,
+                            self._values[1:] - self._values[:-1])
+    self._timestamps = self._timestamps[:-1]
+
+  def Add(self, other):
+    """Add other to self pointwise.
+
+    Requires that both self and other are of the same length, and contain
+    identical timestamps. Typically this means that Normalize has been called
+    on both with identical time parameters.
+
+    Args:
+      other: The sequence to add to self.
+
+    Raises:
+      RuntimeError: other does not contain the same timestamps as self.
+    """
+    self._Consolidate()
+    # pylint: disable=protected-access
+    other._Consolidate()
+    if self._list is not None or other._list is not None:
+      if self._list is None:
+        self._SwitchToList()
+      self._list.Add(other)
+      return
+
+    other_values = other._values
+    other_missing = other._missing
+    other_timestamps = other._timestamps
+    # pylint: enable=protected-access
+
+    if self._timestamps.size != other_timestamps.size:
+      raise RuntimeError("Can only add series of identical lengths.")
+    if not np.array_equal(self._timestamps, other_timestamps):
+      raise RuntimeError("Timestamp mismatch.")
+
+    # Missing values are stored as zeros, so they count as zeros here.
+    self._values = self._values + other_values
+    self._missing = self._missing & other_missing
+
+  def Rescale(self, multiplier):
+    """Multiply pointwise by multiplier."""
+    self._Consolidate()
+    if self._list is not None:
+      self._list.Rescale(multiplier)
+      return
+
+    self._values = self._values * multiplier
+
+  def Mean(self):
+    """Return the arithmatic mean of all values."""
+    self._Consolidate()
+    if self._list is not None:
+      return self._list.Mean()
+
+    values = self._values[~self._missing]
+    if not values.size:
+      return None
+
+    # Floored like the list based implementation.
+    return (values.sum() // values.size).item()
+
+
+if np is None:
+  Timeseries = _ListTimeseries
+else:
+  Timeseries = _ArrayTimeseries
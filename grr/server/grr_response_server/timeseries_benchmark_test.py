@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Compares the performance of the Timeseries implementations."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import unittest
+
+from builtins import range  # pylint: disable=redefined-builtin
+
+from grr_response_core.lib import flags
+from grr_response_server import timeseries
+from grr.test_lib import benchmark_test_lib
+from grr.test_lib import test_lib
+
+# pylint: disable=protected-access
+_IMPLEMENTATIONS = [
+    ("list", timeseries._ListTimeseries),
+    ("array", timeseries._ArrayTimeseries),
+]
+# pylint: enable=protected-access
+
+# A week of samples taken every 10 seconds.
+_SAMPLE_INTERVAL = 10 * 1000000
+_NUM_SAMPLES = 7 * 24 * 60 * 6
+_NUM_PROCESSES = 10
+_PERIOD = 5 * 60 * 1000000
+
+
+def _MakeCounterSamples(process_index):
+  samples = []
+  value = 0
+  for i in range(_NUM_SAMPLES):
+    # Simulate a process restart every day.
+    if i % (24 * 60 * 6) == 0:
+      value = 0
+    value += (i + process_index) % 7
+    samples.append((value, i * _SAMPLE_INTERVAL))
+  return samples
+
+
+@unittest.skipIf(timeseries.np is None, "NumPy is not installed.")
+class TimeseriesBenchmark(benchmark_test_lib.AverageMicroBenchmarks):
+  """Compares the list and array based Timeseries implementations."""
+
+  REPEATS = 5
+
+  def setUp(self):
+    super(TimeseriesBenchmark, self).setUp()
+    self.samples = [_MakeCounterSamples(i) for i in range(_NUM_PROCESSES)]
+    self.stop_time = _NUM_SAMPLES * _SAMPLE_INTERVAL
+
+  def _MakeSeries(self, cls):
+    result = []
+    for samples in self.samples:
+      series = cls()
+      series.MultiAppend(samples)
+      result.append(series)
+    return result
+
+  def testBuild(self):
+    for name, cls in _IMPLEMENTATIONS:
+      self.TimeIt(
+          lambda cls=cls: len(self._MakeSeries(cls)),
+          "Build %d series (%s)" % (_NUM_PROCESSES, name))
+
+  def testCounterRate(self):
+    """Runs the query the stats API runs for counter metrics."""
+
+    def Query(cls):
+      all_series = self._MakeSeries(cls)
+      for series in all_series:
+        series.MakeIncreasing()
+        series.Normalize(
+            _PERIOD,
+            0,
+            self.stop_time,
+            mode=timeseries.NORMALIZE_MODE_COUNTER)
+
+      total = all_series[0]
+      for series in all_series[1:]:
+        total.Add(series)
+      total.ToDeltas()
+      total.Rescale(1 / _PERIOD)
+      return len(total.data)
+
+    for name, cls in _IMPLEMENTATIONS:
+      self.TimeIt(lambda cls=cls: Query(cls), "Counter rate query (%s)" % name)
+
+  def testGaugeMean(self):
+
+    def Query(cls):
+      series = self._MakeSeries(cls)[0]
+      series.FilterRange(self.stop_time // 2, self.stop_time)
+      series.Normalize(_PERIOD, self.stop_time // 2, self.stop_time)
+      return series.Mean()
+
+    for name, cls in _IMPLEMENTATIONS:
+      self.TimeIt(lambda cls=cls: Query(cls), "Gauge mean query (%s)" % name)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  flags.StartMain(main)
@@ -4,7 +4,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import unittest
+
 from builtins import range  # pylint: disable=redefined-builtin
+from past.builtins import long
 
 from grr_response_core.lib import flags
 from grr_response_server import timeseries
@@ -13,8 +16,11 @@ from grr.test_lib import test_lib
 
 class TimeseriesTest(test_lib.GRRBaseTest):
 
+  # pylint: disable=protected-access
+  timeseries_cls = timeseries._ListTimeseries
+
   def makeSeries(self):
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(1, 101):
       s.Append(i, (i + 5) * 10000)
     return s
@@ -37,7 +43,7 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertEqual([9.5, 100000], s.data[0])
     self.assertEqual([49.5, 500000], s.data[-1])
 
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(0, 1000):
       s.Append(0.5, i * 10)
     s.Normalize(200, 5000, 10000)
@@ -45,7 +51,7 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertListEqual(s.data[0], [0.5, 5000])
     self.assertListEqual(s.data[24], [0.5, 9800])
 
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(0, 1000):
       s.Append(i, i * 10)
     s.Normalize(200, 5000, 10000, mode=timeseries.NORMALIZE_MODE_COUNTER)
@@ -61,7 +67,7 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertEqual([1, 60000], s.data[0])
     self.assertEqual([1, 1040000], s.data[-1])
 
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(0, 1000):
       s.Append(i, i * 1e6)
     s.Normalize(
@@ -74,7 +80,7 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertListEqual(s.data[23], [20, int(960 * 1e6)])
 
   def testNormalizeFillsGapsWithNone(self):
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(21, 51):
       s.Append(i, (i + 5) * 10000)
     for i in range(81, 101):
@@ -87,7 +93,7 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertEqual([None, 1100000], s.data[-1])
 
   def testMakeIncreasing(self):
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     for i in range(0, 5):
       s.Append(i, i * 1000)
     for i in range(0, 5):
@@ -99,10 +105,10 @@ class TimeseriesTest(test_lib.GRRBaseTest):
     self.assertEqual([8, 10000], s.data[-1])
 
   def testAddRescale(self):
-    s1 = timeseries.Timeseries()
+    s1 = self.timeseries_cls()
     for i in range(0, 5):
       s1.Append(i, i * 1000)
-    s2 = timeseries.Timeseries()
+    s2 = self.timeseries_cls()
     for i in range(0, 5):
       s2.Append(2 * i, i * 1000)
     s1.Add(s2)
@@ -115,13 +121,82 @@ class TimeseriesTest(test_lib.GRRBaseTest):
       self.assertEqual(i, s1.data[i][0])
 
   def testMean(self):
-    s = timeseries.Timeseries()
+    s = self.timeseries_cls()
     self.assertEqual(None, s.Mean())
 
     s = self.makeSeries()
     self.assertEqual(100, len(s.data))
     self.assertEqual(50, s.Mean())
 
+  def testCopyIsIndependent(self):
+    s = self.makeSeries()
+    copy = self.timeseries_cls(s)
+    copy.Rescale(2)
+    copy.Append(1000, 2000000)
+
+    self.assertEqual(100, len(s.data))
+    self.assertEqual([100, 1050000], s.data[-1])
+    self.assertEqual(101, len(copy.data))
+    self.assertEqual([200, 1050000], copy.data[-2])
+
+  def testAddKeepsGapsPresentInBothSeries(self):
+    s1 = self.timeseries_cls()
+    s1.MultiAppend([(1, 0), (None, 1000), (None, 2000)])
+    s2 = self.timeseries_cls()
+    s2.MultiAppend([(2, 0), (3, 1000), (None, 2000)])
+    s1.Add(s2)
+    self.assertEqual([[3, 0], [3, 1000], [None, 2000]], s1.data)
+
+    with self.assertRaises(RuntimeError):
+      s1.Add(self.makeSeries())
+
+  def testStringValues(self):
+    s = self.timeseries_cls()
+    s.MultiAppend([("12.5%", 1000), ("13%", 2000)])
+    s.Append("14%", 3000)
+    self.assertEqual([["12.5%", 1000], ["13%", 2000], ["14%", 3000]], s.data)
+
+    s.FilterRange(2000, 3000)
+    self.assertEqual([["13%", 2000]], s.data)
+
+    copy = self.timeseries_cls(s)
+    copy.MultiAppend([(1, 4000)])
+    self.assertEqual([["13%", 2000], [1, 4000]], copy.data)
+    self.assertEqual([["13%", 2000]], s.data)
+
+  def testStringValuesAfterNumbers(self):
+    s = self.timeseries_cls()
+    s.MultiAppend([(1, 1000), (None, 2000)])
+    s.Append("foo", 3000)
+    self.assertEqual([[1, 1000], [None, 2000], ["foo", 3000]], s.data)
+
+  def testIntegerValuesStayIntegers(self):
+    s = self.makeSeries()
+    self.assertIsInstance(s.data[0][0], (int, long))
+    self.assertIsInstance(s.Mean(), (int, long))
+
+    s.ToDeltas()
+    self.assertIsInstance(s.data[0][0], (int, long))
+
+    s = self.makeSeries()
+    s.Normalize(
+        10 * 10000, 100000, 600000, mode=timeseries.NORMALIZE_MODE_COUNTER)
+    self.assertEqual([14, 100000], s.data[0])
+    self.assertIsInstance(s.data[0][0], (int, long))
+
+  def testFloatValuesStayFloats(self):
+    s = self.timeseries_cls()
+    s.MultiAppend([(0.5, 1000), (1.5, 2000)])
+    self.assertEqual([[0.5, 1000], [1.5, 2000]], s.data)
+    self.assertIsInstance(s.data[0][0], float)
+
+
+@unittest.skipIf(timeseries.np is None, "NumPy is not installed.")
+class ArrayTimeseriesTest(TimeseriesTest):
+
+  # pylint: disable=protected-access
+  timeseries_cls = timeseries._ArrayTimeseries
+
 
 def main(argv):
   test_lib.main(argv)
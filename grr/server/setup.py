@@ -163,6 +163,14 @@ setup_args = dict(
         # store support:
         # pip install grr-response[mysqldatastore]
         "mysqldatastore": ["mysqlclient==1.3.12"],
+        # This is an optional component. Install to back stats timeseries
+        # with NumPy arrays:
+        # pip install grr-response[timeseries]
+        "timeseries": ["numpy==1.16.6"],
+        # This is an optional component. Install to get Parquet and Arrow
+        # instant output plugins:
+        # pip install grr-response[parquet]
+        "parquet": ["pyarrow==0.11.1"],
     },
     data_files=data_files)
 
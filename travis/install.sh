@@ -44,7 +44,7 @@ pip install -e grr/client --progress-bar off
 pip install -e api_client/python --progress-bar off
 
 # Depends on grr-response-client
-pip install -e grr/server/[mysqldatastore] --progress-bar off
+pip install -e grr/server/[mysqldatastore,parquet,timeseries] --progress-bar off
 
 # Depends on grr-response-server and grr-api-client
 pip install -e grr/test --progress-bar off